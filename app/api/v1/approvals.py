@@ -676,9 +676,14 @@ async def get_request_delegations(
 async def get_approval_stats(
     current_user: Annotated[User, Depends(require_permission("approvals.view"))],
     service: Annotated[ApprovalService, Depends(get_approval_service)],
+    include_percentiles: bool = Query(
+        False, description="Include p50/p90/p99 approval time in seconds"
+    ),
 ) -> StandardResponse[dict]:
     """Get approval statistics."""
-    stats = service.get_approval_stats(current_user.tenant_id)
+    stats = service.get_approval_stats(
+        current_user.tenant_id, include_percentiles=include_percentiles
+    )
 
     return StandardResponse(
         data=stats,
@@ -861,7 +866,7 @@ async def check_user_can_approve(
 # Bulk operations endpoints
 @router.post(
     "/requests/bulk-approve",
-    response_model=StandardListResponse[ApprovalRequestResponse],
+    response_model=StandardResponse[list[ApprovalRequestResponse]],
     status_code=status.HTTP_200_OK,
     summary="Bulk approve requests",
     description="Approve multiple approval requests. Requires approvals.manage permission.",
@@ -876,10 +881,13 @@ async def bulk_approve_requests(
     comment: Annotated[
         str | None, Query(description="Optional comment for all approvals")
     ] = None,
-) -> StandardListResponse[ApprovalRequestResponse]:
-    """Bulk approve approval requests."""
+) -> StandardResponse[list[ApprovalRequestResponse]]:
+    """Bulk approve approval requests.
+
+    Requests that cannot be approved are listed in meta.errors.
+    """
     try:
-        approved_requests = service.bulk_approve_requests(
+        result = service.bulk_approve_requests(
             request_ids=request_ids,
             tenant_id=current_user.tenant_id,
             user_id=current_user.id,
@@ -888,14 +896,13 @@ async def bulk_approve_requests(
             user_agent=request.headers.get("user-agent"),
         )
 
-        return StandardListResponse(
-            data=[ApprovalRequestResponse.model_validate(r) for r in approved_requests],
-            meta=PaginationMeta(
-                total=len(approved_requests),
-                page=1,
-                page_size=len(approved_requests),
-                total_pages=1,
-            ),
+        return StandardResponse(
+            data=[ApprovalRequestResponse.model_validate(r) for r in result.requests],
+            meta={
+                "total": len(result.requests),
+                "failed": len(result.errors),
+                "errors": result.errors,
+            },
         )
     except Exception as e:
         raise APIException(
@@ -907,7 +914,7 @@ async def bulk_approve_requests(
 
 @router.post(
     "/requests/bulk-reject",
-    response_model=StandardListResponse[ApprovalRequestResponse],
+    response_model=StandardResponse[list[ApprovalRequestResponse]],
     status_code=status.HTTP_200_OK,
     summary="Bulk reject requests",
     description="Reject multiple approval requests. Requires approvals.manage permission.",
@@ -922,10 +929,13 @@ async def bulk_reject_requests(
     comment: Annotated[
         str | None, Query(description="Optional comment for all rejections")
     ] = None,
-) -> StandardListResponse[ApprovalRequestResponse]:
-    """Bulk reject approval requests."""
+) -> StandardResponse[list[ApprovalRequestResponse]]:
+    """Bulk reject approval requests.
+
+    Requests that cannot be rejected are listed in meta.errors.
+    """
     try:
-        rejected_requests = service.bulk_reject_requests(
+        result = service.bulk_reject_requests(
             request_ids=request_ids,
             tenant_id=current_user.tenant_id,
             user_id=current_user.id,
@@ -934,14 +944,13 @@ async def bulk_reject_requests(
             user_agent=request.headers.get("user-agent"),
         )
 
-        return StandardListResponse(
-            data=[ApprovalRequestResponse.model_validate(r) for r in rejected_requests],
-            meta=PaginationMeta(
-                total=len(rejected_requests),
-                page=1,
-                page_size=len(rejected_requests),
-                total_pages=1,
-            ),
+        return StandardResponse(
+            data=[ApprovalRequestResponse.model_validate(r) for r in result.requests],
+            meta={
+                "total": len(result.requests),
+                "failed": len(result.errors),
+                "errors": result.errors,
+            },
         )
     except Exception as e:
         raise APIException(
@@ -1,5 +1,6 @@
 """Authentication router for login, refresh, logout, and user info."""
 
+import json
 from datetime import UTC, datetime
 from typing import Annotated
 from uuid import UUID
@@ -50,7 +51,7 @@
     PermissionGrantRequest,
     RevokePermissionResponse,
 )
-from app.services.audit_service import AuditService
+from app.services.audit_service import AuditService, encode_cursor
 from app.services.auth_service import AuthService
 from app.services.permission_service import PermissionService
 
@@ -1372,6 +1373,15 @@ async def get_audit_logs(
     details_search: str | None = Query(
         None, description="Search in details JSON (partial match)"
     ),
+    details: str | None = Query(
+        None,
+        description='JSON object the details must contain (e.g. {"role": "admin"})',
+    ),
+    cursor: str | None = Query(
+        None,
+        description="meta.next_cursor of the previous page (keyset pagination, "
+        "no total count)",
+    ),
     page: int = Query(default=1, ge=1, description="Page number"),
     page_size: int = Query(default=20, ge=1, le=100, description="Page size"),
 ) -> AuditLogListResponse:
@@ -1391,30 +1401,70 @@ async def get_audit_logs(
         ip_address: Filter by IP address (partial match, optional).
         user_agent: Filter by user agent (partial match, optional).
         details_search: Search in details JSON (partial match, optional).
+        details: JSON object the details must contain (indexed, optional).
+        cursor: Cursor of the previous page; page is ignored (optional).
         page: Page number (default: 1).
         page_size: Page size (default: 20, max: 100).
 
     Returns:
         AuditLogListResponse with list of audit logs and pagination metadata.
+        meta.next_cursor continues after the last entry; with a cursor, the
+        meta has no total.
 
     Raises:
-        HTTPException: If user lacks permission.
+        HTTPException: If user lacks permission or details/cursor is invalid.
     """
+    details_filter = None
+    if details is not None:
+        try:
+            details_filter = json.loads(details)
+        except ValueError:
+            details_filter = None
+        if not isinstance(details_filter, dict):
+            raise_bad_request(
+                code="INVALID_DETAILS_FILTER",
+                message="details must be a JSON object",
+            )
+
     audit_service = AuditService(db)
-    skip = (page - 1) * page_size
+    filters = {
+        "user_id": user_id,
+        "action": action,
+        "resource_type": resource_type,
+        "date_from": date_from,
+        "date_to": date_to,
+        "ip_address": ip_address,
+        "user_agent": user_agent,
+        "details_search": details_search,
+        "details_filter": details_filter,
+    }
+
+    if cursor is not None:
+        try:
+            logs = audit_service.get_audit_logs_after(
+                tenant_id=current_user.tenant_id,
+                cursor=cursor,
+                limit=page_size,
+                **filters,
+            )
+        except ValueError:
+            raise_bad_request(code="INVALID_CURSOR", message="Invalid cursor")
+        return AuditLogListResponse(
+            data=logs,
+            meta={
+                "page_size": page_size,
+                "next_cursor": (
+                    encode_cursor(logs[-1]) if len(logs) == page_size else None
+                ),
+            },
+        )
 
+    skip = (page - 1) * page_size
     logs, total = audit_service.get_audit_logs(
         tenant_id=current_user.tenant_id,
-        user_id=user_id,
-        action=action,
-        resource_type=resource_type,
-        date_from=date_from,
-        date_to=date_to,
-        ip_address=ip_address,
-        user_agent=user_agent,
-        details_search=details_search,
         skip=skip,
         limit=page_size,
+        **filters,
     )
 
     return AuditLogListResponse(
@@ -1424,5 +1474,8 @@ async def get_audit_logs(
             "page": page,
             "page_size": page_size,
             "total_pages": (total + page_size - 1) // page_size if total > 0 else 0,
+            "next_cursor": (
+                encode_cursor(logs[-1]) if skip + len(logs) < total else None
+            ),
         },
     )
@@ -1,6 +1,6 @@
 """Calendar router for calendar and event management."""
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Annotated
 from uuid import UUID
 
@@ -8,14 +8,17 @@
 from sqlalchemy.orm import Session
 
 from app.core.auth.dependencies import require_permission
+from app.core.calendar.freebusy_service import FreeBusyService
 from app.core.calendar.resource_service import CalendarResourceService
 from app.core.calendar.service import CalendarService, ReminderService
+from app.core.config_file import get_settings
 from app.core.db.deps import get_db
 from app.core.exceptions import APIException
 from app.models.user import User
 from app.schemas.calendar import (
     CalendarCreate,
     CalendarEventCreate,
+    CalendarEventOccurrenceResponse,
     CalendarEventResponse,
     CalendarEventUpdate,
     CalendarResourceCreate,
@@ -29,6 +32,10 @@
     EventReminderResponse,
     EventResourceCreate,
     EventResourceResponse,
+    FreeBusyRequest,
+    FreeBusyResponse,
+    MeetingSlotRequest,
+    MeetingSlotResponse,
 )
 from app.schemas.common import StandardListResponse, StandardResponse
 
@@ -56,6 +63,30 @@ def get_resource_service(
     return CalendarResourceService(db)
 
 
+def get_freebusy_service(
+    db: Annotated[Session, Depends(get_db)],
+) -> FreeBusyService:
+    """Dependency to get FreeBusyService."""
+    return FreeBusyService(db)
+
+
+def _validate_window(start: datetime, end: datetime) -> None:
+    """Reject empty windows and windows longer than recurring events expand."""
+    if end <= start:
+        raise APIException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            code="INVALID_WINDOW",
+            message="Window end must be after its start",
+        )
+    max_days = get_settings().CALENDAR_OCCURRENCE_MAX_WINDOW_DAYS
+    if end - start > timedelta(days=max_days):
+        raise APIException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            code="WINDOW_TOO_LARGE",
+            message=f"Window cannot be longer than {max_days} days",
+        )
+
+
 # Calendar endpoints
 @router.post(
     "/calendars",
@@ -288,6 +319,104 @@ async def list_events(
     )
 
 
+@router.get(
+    "/occurrences",
+    response_model=StandardResponse[list[CalendarEventOccurrenceResponse]],
+    status_code=status.HTTP_200_OK,
+    summary="List event occurrences",
+    description="List event occurrences in a time window, with recurring events expanded. Requires calendar.events.view permission.",
+)
+async def list_occurrences(
+    current_user: Annotated[User, Depends(require_permission("calendar.events.view"))],
+    service: Annotated[CalendarService, Depends(get_calendar_service)],
+    start_date: datetime = Query(..., description="Window start"),
+    end_date: datetime = Query(..., description="Window end"),
+    calendar_id: UUID | None = Query(None, description="Filter by calendar ID"),
+) -> StandardResponse[list[CalendarEventOccurrenceResponse]]:
+    """List event occurrences in a time window (e.g., a month view)."""
+    _validate_window(start_date, end_date)
+
+    occurrences = service.get_occurrences(
+        tenant_id=current_user.tenant_id,
+        window_start=start_date,
+        window_end=end_date,
+        calendar_id=calendar_id,
+        user_id=None if calendar_id else current_user.id,
+    )
+
+    return StandardResponse(
+        data=[CalendarEventOccurrenceResponse.model_validate(o) for o in occurrences],
+        meta={"total": len(occurrences)},
+    )
+
+
+@router.post(
+    "/freebusy",
+    response_model=StandardResponse[FreeBusyResponse],
+    status_code=status.HTTP_200_OK,
+    summary="Get free/busy",
+    description="Get merged busy intervals of users and resources in a window. Requires calendar.events.view permission.",
+)
+async def get_free_busy(
+    request: FreeBusyRequest,
+    current_user: Annotated[User, Depends(require_permission("calendar.events.view"))],
+    service: Annotated[FreeBusyService, Depends(get_freebusy_service)],
+) -> StandardResponse[FreeBusyResponse]:
+    """Get busy intervals of users and resources."""
+    _validate_window(request.start_time, request.end_time)
+    users, resources = service.get_busy(
+        tenant_id=current_user.tenant_id,
+        window_start=request.start_time,
+        window_end=request.end_time,
+        user_ids=request.user_ids,
+        resource_ids=request.resource_ids,
+    )
+
+    def intervals(busy: dict) -> dict:
+        return {
+            owner_id: [{"start_time": start, "end_time": end} for start, end in items]
+            for owner_id, items in busy.items()
+        }
+
+    return StandardResponse(
+        data=FreeBusyResponse(users=intervals(users), resources=intervals(resources)),
+        message="Free/busy retrieved successfully",
+    )
+
+
+@router.post(
+    "/freebusy/slots",
+    response_model=StandardResponse[list[MeetingSlotResponse]],
+    status_code=status.HTTP_200_OK,
+    summary="Find meeting slots",
+    description="Find the first slots free for all participants, with the candidate resources free for each. Requires calendar.events.view permission.",
+)
+async def find_meeting_slots(
+    request: MeetingSlotRequest,
+    current_user: Annotated[User, Depends(require_permission("calendar.events.view"))],
+    service: Annotated[FreeBusyService, Depends(get_freebusy_service)],
+) -> StandardResponse[list[MeetingSlotResponse]]:
+    """Find common free slots for a meeting."""
+    _validate_window(request.start_time, request.end_time)
+    slots = service.find_meeting_slots(
+        tenant_id=current_user.tenant_id,
+        user_ids=request.user_ids,
+        window_start=request.start_time,
+        window_end=request.end_time,
+        duration=timedelta(minutes=request.duration_minutes),
+        limit=request.limit,
+        step=(
+            timedelta(minutes=request.step_minutes) if request.step_minutes else None
+        ),
+        resource_ids=request.resource_ids or None,
+    )
+
+    return StandardResponse(
+        data=[MeetingSlotResponse.model_validate(slot) for slot in slots],
+        meta={"total": len(slots)},
+    )
+
+
 @router.get(
     "/events/{event_id}",
     response_model=StandardResponse[CalendarEventResponse],
@@ -419,6 +548,9 @@ async def move_event(
     start_time: datetime = Query(..., description="New start time"),
     preserve_duration: bool = Query(True, description="Preserve event duration"),
     scope: str = Query("single", description="Scope: single or series"),
+    occurrence_start: datetime | None = Query(
+        None, description="Original start of the occurrence (recurring events)"
+    ),
 ) -> StandardResponse[CalendarEventResponse]:
     """Move an event to a new start time."""
     event = service.move_event(
@@ -427,6 +559,7 @@ async def move_event(
         new_start_time=start_time,
         preserve_duration=preserve_duration,
         scope=scope,
+        occurrence_start=occurrence_start,
     )
 
     if not event:
@@ -457,6 +590,9 @@ async def resize_event(
     service: Annotated[CalendarService, Depends(get_calendar_service)],
     end_time: datetime = Query(..., description="New end time"),
     scope: str = Query("single", description="Scope: single or series"),
+    occurrence_start: datetime | None = Query(
+        None, description="Original start of the occurrence (recurring events)"
+    ),
 ) -> StandardResponse[CalendarEventResponse]:
     """Resize an event by changing its end time."""
     event = service.resize_event(
@@ -464,6 +600,7 @@ async def resize_event(
         tenant_id=current_user.tenant_id,
         new_end_time=end_time,
         scope=scope,
+        occurrence_start=occurrence_start,
     )
 
     if not event:
@@ -71,21 +71,42 @@ async def list_comments(
     current_user: Annotated[User, Depends(require_permission("comments.view"))],
     service: Annotated[CommentService, Depends(get_comment_service)],
     include_deleted: bool = Query(False, description="Include deleted comments"),
+    search: str | None = Query(
+        None, description="Search in content (most relevant first)"
+    ),
     page: int = Query(default=1, ge=1, description="Page number"),
     page_size: int = Query(default=20, ge=1, le=100, description="Page size"),
 ) -> StandardListResponse[CommentResponse]:
     """List comments for an entity."""
     skip = (page - 1) * page_size
-    comments = service.get_comments_by_entity(
-        entity_type=entity_type,
-        entity_id=entity_id,
-        tenant_id=current_user.tenant_id,
-        include_deleted=include_deleted,
-        skip=skip,
-        limit=page_size,
-    )
+    if search:
+        comments = service.search_comments(
+            tenant_id=current_user.tenant_id,
+            query=search,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            include_deleted=include_deleted,
+            skip=skip,
+            limit=page_size,
+        )
+        total = service.count_search_comments(
+            tenant_id=current_user.tenant_id,
+            query=search,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            include_deleted=include_deleted,
+        )
+    else:
+        comments = service.get_comments_by_entity(
+            entity_type=entity_type,
+            entity_id=entity_id,
+            tenant_id=current_user.tenant_id,
+            include_deleted=include_deleted,
+            skip=skip,
+            limit=page_size,
+        )
+        total = len(comments)
 
-    total = len(comments)
     total_pages = (total + page_size - 1) // page_size if total > 0 else 0
 
     return StandardListResponse(
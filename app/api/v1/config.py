@@ -920,23 +920,23 @@ async def get_general_settings(
         StandardResponse with general settings.
     """
     config_service = ConfigService(db)
+    defaults = {
+        "general.timezone": "America/Mexico_City",
+        "general.date_format": "DD/MM/YYYY",
+        "general.time_format": "24h",
+        "general.currency": "MXN",
+        "general.language": "es",
+    }
+    values = config_service.get_many(
+        current_user.tenant_id, "system", defaults, defaults=defaults
+    )
 
     settings = GeneralSettingsResponse(
-        timezone=config_service.get(
-            current_user.tenant_id, "system", "general.timezone", "America/Mexico_City"
-        ),
-        date_format=config_service.get(
-            current_user.tenant_id, "system", "general.date_format", "DD/MM/YYYY"
-        ),
-        time_format=config_service.get(
-            current_user.tenant_id, "system", "general.time_format", "24h"
-        ),
-        currency=config_service.get(
-            current_user.tenant_id, "system", "general.currency", "MXN"
-        ),
-        language=config_service.get(
-            current_user.tenant_id, "system", "general.language", "es"
-        ),
+        timezone=values["general.timezone"],
+        date_format=values["general.date_format"],
+        time_format=values["general.time_format"],
+        currency=values["general.currency"],
+        language=values["general.language"],
     )
 
     return StandardResponse(
@@ -1207,7 +1207,10 @@ async def clear_cache(
         StandardResponse with success message
     """
     config_service = ConfigService(db)
-    config_service.clear_cache()
+    if module:
+        config_service.clear_cache(tenant_id=current_user.tenant_id, module=module)
+    else:
+        config_service.clear_cache()
 
     if module:
         message = f"Cache cleared for module '{module}'"
@@ -122,6 +122,9 @@ async def upload_file(
             permissions=permissions_data,
         )
         logger.info(f"File uploaded successfully: {uploaded_file.id}")
+    except APIException:
+        # e.g. STORAGE_QUOTA_EXCEEDED keeps its own status code
+        raise
     except Exception as e:
         logger.error(f"Error uploading file: {e}", exc_info=True)
         raise APIException(
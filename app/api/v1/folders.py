@@ -540,13 +540,12 @@ async def move_items(
     moved_files = []
     moved_folders = []
 
-    # Move files
+    # Move files (folder usage counters move with them)
     for file_id in move_data.file_ids:
-        # Update file's folder_id
-        file = file_service.repository.get_by_id(file_id, current_user.tenant_id)
+        file = file_service.repository.update(
+            file_id, current_user.tenant_id, {"folder_id": move_data.target_folder_id}
+        )
         if file:
-            file.folder_id = move_data.target_folder_id
-            service.db.commit()
             moved_files.append(str(file_id))
 
     # Move folders
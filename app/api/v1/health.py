@@ -87,6 +87,7 @@ async def metrics_summary():
         Métricas básicas del sistema
     """
     try:
+        from app.core.tasks.list_cache import get_task_list_cache
         from app.monitoring.task_metrics import get_task_metrics
 
         metrics = get_task_metrics()
@@ -94,6 +95,7 @@ async def metrics_summary():
         return {
             "status": "healthy",
             "prometheus_available": metrics.prometheus_available,
+            "task_list_cache": get_task_list_cache().get_stats(),
             "timestamp": datetime.utcnow().isoformat(),
         }
     except Exception as e:
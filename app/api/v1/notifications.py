@@ -15,6 +15,11 @@
 from app.core.db.deps import get_db
 from app.core.exceptions import APIException
 from app.core.notifications.service import NotificationService
+from app.core.notifications.template_cache import (
+    notify_notification_templates_changed,
+    precompile_notification_template,
+)
+from app.core.templates.compiler import get_template_compilation_cache
 from app.models.user import User
 from app.repositories.notification_repository import NotificationRepository
 from app.schemas.common import StandardListResponse, StandardResponse
@@ -71,6 +76,8 @@ async def create_template(
             "is_active": template_data.is_active,
         }
     )
+    notify_notification_templates_changed(current_user.tenant_id)
+    precompile_notification_template(template)
 
     return StandardResponse(
         data=NotificationTemplateResponse.model_validate(template),
@@ -178,6 +185,8 @@ async def update_template(
             code="NOTIFICATION_TEMPLATE_NOT_FOUND",
             message=f"Template with ID {template_id} not found",
         )
+    notify_notification_templates_changed(current_user.tenant_id)
+    precompile_notification_template(template)
 
     return StandardResponse(
         data=NotificationTemplateResponse.model_validate(template),
@@ -204,6 +213,8 @@ async def delete_template(
             code="NOTIFICATION_TEMPLATE_NOT_FOUND",
             message=f"Template with ID {template_id} not found",
         )
+    notify_notification_templates_changed(current_user.tenant_id)
+    get_template_compilation_cache().invalidate(template_id)
 
 
 @router.post(
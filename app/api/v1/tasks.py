@@ -171,38 +171,19 @@ async def list_my_tasks(
 ) -> StandardListResponse[TaskResponse]:
     """List tasks visible to current user."""
     skip = (page - 1) * page_size
-
-    # Usar cache wrapper si est� disponible
-    if hasattr(service.repository, "get_visible_tasks_cached"):
-        tasks = service.repository.get_visible_tasks_cached(
-            tenant_id=current_user.tenant_id,
-            user_id=current_user.id,
-            status=status,
-            priority=priority,
-            skip=skip,
-            limit=page_size,
-        )
-    else:
-        # Fallback al m�todo original
-        tasks = service.repository.get_visible_tasks(
-            tenant_id=current_user.tenant_id,
-            user_id=current_user.id,
-            status=status,
-            priority=priority,
-            skip=skip,
-            limit=page_size,
-        )
-    total = service.repository.count_visible_tasks(
+    tasks, total = service.list_visible_tasks(
         tenant_id=current_user.tenant_id,
         user_id=current_user.id,
         status=status,
         priority=priority,
+        skip=skip,
+        limit=page_size,
     )
 
     total_pages = (total + page_size - 1) // page_size if total > 0 else 0
 
     return StandardListResponse(
-        data=[TaskResponse.model_validate(t) for t in tasks],
+        data=tasks,
         meta=PaginationMeta(
             total=total,
             page=page,
@@ -235,37 +216,19 @@ async def get_tasks_dashboard(
 
     # Ejecutar todas las consultas en paralelo
     async def get_tasks_data():
-        # Usar cache wrapper si est� disponible
-        if hasattr(service.repository, "get_visible_tasks_cached"):
-            tasks = service.repository.get_visible_tasks_cached(
-                tenant_id=current_user.tenant_id,
-                user_id=current_user.id,
-                status=status,
-                priority=priority,
-                skip=skip,
-                limit=page_size,
-            )
-        else:
-            tasks = service.repository.get_visible_tasks(
-                tenant_id=current_user.tenant_id,
-                user_id=current_user.id,
-                status=status,
-                priority=priority,
-                skip=skip,
-                limit=page_size,
-            )
-
-        total = service.repository.count_visible_tasks(
+        tasks, total = service.list_visible_tasks(
             tenant_id=current_user.tenant_id,
             user_id=current_user.id,
             status=status,
             priority=priority,
+            skip=skip,
+            limit=page_size,
         )
 
         total_pages = (total + page_size - 1) // page_size if total > 0 else 0
 
         return {
-            "tasks": [TaskResponse.model_validate(t) for t in tasks],
+            "tasks": tasks,
             "pagination": {
                 "total": total,
                 "page": page,
@@ -288,24 +251,14 @@ async def get_settings_data():
 
     async def get_assignments_data():
         # Obtener IDs de las tareas para buscar asignaciones
-        if hasattr(service.repository, "get_visible_tasks_cached"):
-            tasks = service.repository.get_visible_tasks_cached(
-                tenant_id=current_user.tenant_id,
-                user_id=current_user.id,
-                status=status,
-                priority=priority,
-                skip=0,  # Obtener todas para asignaciones
-                limit=1000,
-            )
-        else:
-            tasks = service.repository.get_visible_tasks(
-                tenant_id=current_user.tenant_id,
-                user_id=current_user.id,
-                status=status,
-                priority=priority,
-                skip=0,
-                limit=1000,
-            )
+        tasks, _ = service.list_visible_tasks(
+            tenant_id=current_user.tenant_id,
+            user_id=current_user.id,
+            status=status,
+            priority=priority,
+            skip=0,  # Obtener todas para asignaciones
+            limit=1000,
+        )
 
         task_ids = [task.id for task in tasks]
 
@@ -504,7 +457,7 @@ async def create_assignment(
             message=f"Task with ID {task_id} not found",
         )
 
-    assignment = service.repository.create_assignment(
+    assignment = service.add_assignment(
         {
             "task_id": task_id,
             "tenant_id": current_user.tenant_id,
@@ -580,9 +533,7 @@ async def remove_assignment(
     service: Annotated[TaskService, Depends(get_task_service)],
 ) -> None:
     """Remove a task assignment."""
-    deleted = service.repository.delete_assignment(
-        assignment_id, current_user.tenant_id
-    )
+    deleted = service.remove_assignment(assignment_id, current_user.tenant_id)
     if not deleted:
         raise APIException(
             status_code=status.HTTP_404_NOT_FOUND,
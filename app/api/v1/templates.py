@@ -3,20 +3,24 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Path, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Path, Query, status
 from sqlalchemy.orm import Session
 
 from app.core.auth.dependencies import require_permission
+from app.core.config_file import get_settings
 from app.core.db.deps import get_db
 from app.core.exceptions import APIException
-from app.core.templates.service import TemplateService
+from app.core.templates.rendering import get_render_job_registry
+from app.core.templates.service import TemplateService, run_batch_render_job
 from app.models.user import User
 from app.schemas.common import StandardListResponse, StandardResponse
 from app.schemas.template import (
+    TemplateBatchRenderRequest,
     TemplateCategoryCreate,
     TemplateCategoryResponse,
     TemplateCategoryUpdate,
     TemplateCreate,
+    TemplateRenderJobResponse,
     TemplateRenderRequest,
     TemplateRenderResponse,
     TemplateResponse,
@@ -234,7 +238,7 @@ async def render_template(
 ) -> StandardResponse[TemplateRenderResponse]:
     """Render a template with variables."""
     try:
-        result = service.render_template(
+        result = await service.render_document(
             template_id=template_id,
             tenant_id=current_user.tenant_id,
             variables=render_request.variables,
@@ -253,6 +257,81 @@ async def render_template(
         )
 
 
+@router.post(
+    "/{template_id}/render-batch",
+    response_model=StandardResponse[TemplateRenderJobResponse],
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Render documents in batch",
+    description=(
+        "Render one PDF per row of a dataset in the background and store them "
+        "as a zip archive or as separate files. Poll the returned job for "
+        "progress. Requires templates.render permission."
+    ),
+)
+async def render_template_batch(
+    template_id: Annotated[UUID, Path(..., description="Template ID")],
+    current_user: Annotated[User, Depends(require_permission("templates.render"))],
+    service: Annotated[TemplateService, Depends(get_template_service)],
+    batch_request: TemplateBatchRenderRequest,
+    background_tasks: BackgroundTasks,
+) -> StandardResponse[TemplateRenderJobResponse]:
+    """Start a batch render job."""
+    max_rows = get_settings().TEMPLATES_RENDER_BATCH_MAX_ROWS
+    if len(batch_request.rows) > max_rows:
+        raise APIException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            code="BATCH_TOO_LARGE",
+            message=f"A batch can render at most {max_rows} documents",
+        )
+    if not service.get_template(template_id, current_user.tenant_id):
+        raise APIException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            code="TEMPLATE_NOT_FOUND",
+            message=f"Template with ID {template_id} not found",
+        )
+
+    job = get_render_job_registry().create(
+        tenant_id=current_user.tenant_id,
+        template_id=template_id,
+        total=len(batch_request.rows),
+        output=batch_request.output,
+    )
+    background_tasks.add_task(
+        run_batch_render_job, job, batch_request.rows, current_user.id
+    )
+
+    return StandardResponse(
+        data=TemplateRenderJobResponse.model_validate(job),
+        message="Batch render job started",
+    )
+
+
+@router.get(
+    "/render-jobs/{job_id}",
+    response_model=StandardResponse[TemplateRenderJobResponse],
+    status_code=status.HTTP_200_OK,
+    summary="Get batch render job",
+    description="Get the progress of a batch render job. Requires templates.render permission.",
+)
+async def get_render_job(
+    job_id: Annotated[UUID, Path(..., description="Render job ID")],
+    current_user: Annotated[User, Depends(require_permission("templates.render"))],
+) -> StandardResponse[TemplateRenderJobResponse]:
+    """Get batch render job progress."""
+    job = get_render_job_registry().get(job_id, current_user.tenant_id)
+    if not job:
+        raise APIException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            code="RENDER_JOB_NOT_FOUND",
+            message=f"Render job with ID {job_id} not found",
+        )
+
+    return StandardResponse(
+        data=TemplateRenderJobResponse.model_validate(job),
+        message="Render job retrieved successfully",
+    )
+
+
 # Template Category endpoints
 @router.post(
     "/categories",
@@ -76,6 +76,7 @@ def create_activity(
 
         safe_publish_event(
             event_publisher=self.event_publisher,
+            db=self.db,
             event_type="activity.created",
             entity_type="activity",
             entity_id=activity.id,
@@ -91,6 +92,7 @@ def create_activity(
                 },
             ),
         )
+        self.db.commit()
 
         logger.info(f"Activity created: {activity.id} ({activity_type})")
         return activity
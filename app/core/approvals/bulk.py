@@ -0,0 +1,281 @@
+"""Bulk approve and reject of approval requests in one transaction."""
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from functools import cache
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from app.core.approvals.compiled import (
+    CompiledFlow,
+    CompiledStep,
+    get_flow_compilation_cache,
+)
+from app.core.pubsub.models import EventMetadata
+from app.core.pubsub.outbox import enqueue_event
+from app.models.approval import (
+    ApprovalActionType,
+    ApprovalFlow,
+    ApprovalFlowType,
+    ApprovalRequest,
+    ApprovalStatus,
+    ApprovalStep,
+)
+
+if TYPE_CHECKING:
+    from app.core.approvals.service import ApprovalService
+
+logger = logging.getLogger(__name__)
+
+# Notification event of the approvals a request moved on to
+APPROVAL_PENDING_EVENT = "approval_request"
+
+
+@dataclass
+class BulkApprovalResult:
+    """Outcome of a bulk approve or reject."""
+
+    requests: list[ApprovalRequest] = field(default_factory=list)
+    errors: list[dict[str, str]] = field(default_factory=list)
+
+    def fail(self, request_id: UUID, error: str) -> None:
+        """Record a request that was not processed."""
+        self.errors.append({"request_id": str(request_id), "error": error})
+
+
+class BulkApprovalEngine:
+    """Apply one approval action to many requests with a fixed query count.
+
+    Requests (locked FOR UPDATE), flows, steps, prior approvals and the user's
+    roles are loaded in one query each; next states are computed in memory
+    with the same rules as FlowEngine.process_approval. Actions, request
+    updates, outbox events and notifications to the approvers of the steps
+    requests moved on to (one per approver) are written in one transaction.
+
+    A request that cannot be processed (missing, not pending, no current step,
+    or not approvable by the user) is reported in the result and does not
+    stop the others.
+    """
+
+    def __init__(self, service: "ApprovalService"):
+        """Initialize engine.
+
+        Args:
+            service: Approval service (repository, flow engine, notifications)
+        """
+        self.service = service
+        self.db = service.db
+        self.repository = service.repository
+        self.flow_engine = service.flow_engine
+
+    def run(
+        self,
+        action_type: str,
+        request_ids: list[UUID],
+        tenant_id: UUID,
+        user_id: UUID,
+        comment: str | None = None,
+        ip_address: str | None = None,
+        user_agent: str | None = None,
+    ) -> BulkApprovalResult:
+        """Approve or reject requests.
+
+        Args:
+            action_type: "approve" or "reject"
+            request_ids: Requests to act on (duplicates are ignored)
+            tenant_id: Tenant ID
+            user_id: Acting user
+            comment: Comment stored on every action
+            ip_address: Client IP stored on every action
+            user_agent: Client user agent stored on every action
+
+        Returns:
+            Processed requests (in input order) and per-request errors
+        """
+        if action_type not in (ApprovalActionType.APPROVE, ApprovalActionType.REJECT):
+            raise ValueError(f"Unsupported bulk action: {action_type}")
+        # Plain value, so messages read "approve" and not the enum's repr
+        action_type = ApprovalActionType(action_type).value
+
+        result = BulkApprovalResult()
+        request_ids = list(dict.fromkeys(request_ids))
+        requests = {
+            request.id: request
+            for request in self.repository.get_approval_requests_by_ids(
+                request_ids, tenant_id, for_update=True
+            )
+        }
+        flows, compiled = self._compile_flows(
+            {request.flow_id for request in requests.values()}, tenant_id
+        )
+        user_roles = self.flow_engine.get_user_roles(user_id)
+        approvers = (
+            self.repository.get_step_approvers_by_requests(list(requests), tenant_id)
+            if action_type == ApprovalActionType.APPROVE
+            else {}
+        )
+
+        now = datetime.now(UTC)
+        actions = []
+        processed = []
+        notify: dict[UUID, list[dict[str, Any]]] = defaultdict(list)
+        for request_id in request_ids:
+            request = requests.get(request_id)
+            if request is None:
+                result.fail(request_id, "Approval request not found")
+                continue
+            if request.status != ApprovalStatus.PENDING:
+                result.fail(request_id, f"Approval request is {request.status}")
+                continue
+            flow = compiled.get(request.flow_id)
+            if flow is None:
+                result.fail(request_id, "Approval flow not found")
+                continue
+            step = flow.step(request.current_step)
+            if step is None:
+                result.fail(request_id, "Current step not found")
+                continue
+            if not self.flow_engine.can_approve_step(
+                step, request, user_id, user_roles
+            ):
+                result.fail(request_id, f"User cannot {action_type} this request")
+                continue
+
+            actions.append(
+                {
+                    "tenant_id": tenant_id,
+                    "request_id": request.id,
+                    "action_type": action_type,
+                    "step_order": step.step_order,
+                    "comment": comment,
+                    "acted_by": user_id,
+                    "ip_address": ip_address,
+                    "user_agent": user_agent,
+                    "acted_at": now,
+                }
+            )
+            if action_type == ApprovalActionType.REJECT:
+                request.status = ApprovalStatus.REJECTED.value
+                request.completed_at = now
+            elif self._step_complete(flow, step, request, user_id, approvers):
+                next_step = self.flow_engine.get_next_step(
+                    request, flows[request.flow_id]
+                )
+                if next_step is None:
+                    request.status = ApprovalStatus.APPROVED.value
+                    request.completed_at = now
+                else:
+                    request.current_step = next_step.step_order
+                    for approver_id in self.service._get_step_approvers(
+                        next_step, request, tenant_id
+                    ):
+                        notify[approver_id].append(
+                            {
+                                "request_id": str(request.id),
+                                "title": request.title,
+                                "entity_type": request.entity_type,
+                                "entity_id": str(request.entity_id),
+                                "step_order": next_step.step_order,
+                            }
+                        )
+            processed.append(request)
+
+        if not processed:
+            # Release the row locks
+            self.db.commit()
+            return result
+
+        processed_ids = [request.id for request in processed]
+        try:
+            self.repository.create_approval_actions(actions, commit=False)
+            event_type = (
+                "approval.approved"
+                if action_type == ApprovalActionType.APPROVE
+                else "approval.rejected"
+            )
+            for request in processed:
+                enqueue_event(
+                    self.db,
+                    event_type=event_type,
+                    entity_type="approval_request",
+                    entity_id=request.id,
+                    tenant_id=tenant_id,
+                    user_id=user_id,
+                    metadata=EventMetadata(
+                        source="approval_service",
+                        version="1.0",
+                        additional_data={"request_title": request.title},
+                    ),
+                )
+            self._queue_notifications(tenant_id, notify)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        # Reload the committed rows in one query instead of one per request
+        self.repository.get_approval_requests_by_ids(processed_ids, tenant_id)
+        result.requests = processed
+        return result
+
+    def _compile_flows(
+        self, flow_ids: set[UUID], tenant_id: UUID
+    ) -> tuple[dict[UUID, ApprovalFlow], dict[UUID, CompiledFlow]]:
+        """Load and compile flows, loading the steps of uncached flows at once.
+
+        Returns:
+            Flows and compiled flows by flow ID
+        """
+        flows = self.repository.get_approval_flows_by_ids(list(flow_ids), tenant_id)
+
+        @cache
+        def steps_by_flow() -> dict[UUID, list[ApprovalStep]]:
+            grouped = defaultdict(list)
+            for step in self.repository.get_approval_steps_by_flows(
+                [flow.id for flow in flows], tenant_id
+            ):
+                grouped[step.flow_id].append(step)
+            return grouped
+
+        flow_cache = get_flow_compilation_cache()
+        return {flow.id: flow for flow in flows}, {
+            flow.id: flow_cache.get(flow, lambda flow=flow: steps_by_flow()[flow.id])
+            for flow in flows
+        }
+
+    def _step_complete(
+        self,
+        flow: CompiledFlow,
+        step: CompiledStep,
+        request: ApprovalRequest,
+        user_id: UUID,
+        approvers: dict[tuple[UUID, int], set[UUID]],
+    ) -> bool:
+        """Whether approving completes the request's current step."""
+        if flow.flow_type == ApprovalFlowType.SEQUENTIAL:
+            return True
+        if flow.flow_type == ApprovalFlowType.PARALLEL:
+            step_approvers = approvers.setdefault((request.id, step.step_order), set())
+            step_approvers.add(user_id)
+            return self.flow_engine.parallel_step_complete(step, len(step_approvers))
+        return False
+
+    def _queue_notifications(
+        self, tenant_id: UUID, notify: dict[UUID, list[dict[str, Any]]]
+    ) -> None:
+        """Queue one notification per approver listing their new requests."""
+        if not notify:
+            return
+        deliveries = [
+            (approver_id, "in-app", {"request_count": len(items), "requests": items})
+            for approver_id, items in notify.items()
+        ]
+        try:
+            with self.db.begin_nested():
+                self.service.notification_service.queue_batch(
+                    APPROVAL_PENDING_EVENT, tenant_id, deliveries, commit=False
+                )
+        except Exception as e:
+            logger.error(f"Failed to queue bulk approval notifications: {e}")
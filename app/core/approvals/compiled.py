@@ -0,0 +1,221 @@
+"""Compiled, immutable approval flows cached in process."""
+
+import logging
+import operator
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any
+from uuid import UUID
+
+from app.core.cache.lru import LRUCache
+from app.core.config_file import get_settings
+from app.models.approval import ApprovalFlow, ApprovalStep
+
+logger = logging.getLogger(__name__)
+
+# Skip condition operators ({"field": {"operator": "lt", "value": 1000}})
+OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "lt": operator.lt,
+    "lte": operator.le,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "eq": operator.eq,
+    "ne": operator.ne,
+}
+
+
+@dataclass(frozen=True)
+class SkipCondition:
+    """One pre-parsed skip condition of a step.
+
+    A step is skipped when any of its conditions holds. A comparison on a
+    field the request has no value for does not hold.
+    """
+
+    field: str
+    operator: str | None  # None: the value is in values
+    value: Any = None
+    values: tuple = ()
+
+    def holds(self, actual: Any) -> bool:
+        """Whether the condition holds for the request's value of field."""
+        if self.operator is None:
+            return actual in self.values
+        if actual is None:
+            return False
+        return OPERATORS[self.operator](actual, self.value)
+
+
+@dataclass(frozen=True)
+class CompiledStep:
+    """Read-only copy of an approval step, detached from the session."""
+
+    id: UUID
+    step_order: int
+    name: str
+    description: str | None
+    approver_type: str
+    approver_id: UUID | None
+    approver_roles: frozenset[str]
+    approver_rule: Mapping[str, Any] | None
+    require_all: bool
+    min_approvals: int | None
+    rejection_required: bool
+    skip_conditions: tuple[SkipCondition, ...]
+
+    @property
+    def approver_role(self) -> str | None:
+        """Role name of a role approver (as on ApprovalStep)."""
+        return next(iter(self.approver_roles), None)
+
+
+@dataclass(frozen=True)
+class CompiledFlow:
+    """Steps of a flow in order, with skip conditions parsed once."""
+
+    flow_id: UUID
+    tenant_id: UUID
+    flow_type: str
+    version: datetime | None
+    steps: tuple[CompiledStep, ...]
+    skip_conditions: Mapping[int, tuple[SkipCondition, ...]]
+
+    def step(self, step_order: int) -> CompiledStep | None:
+        """Get the step at an order."""
+        return next((s for s in self.steps if s.step_order == step_order), None)
+
+
+def parse_skip_conditions(conditions: Any) -> dict[int, tuple[SkipCondition, ...]]:
+    """Parse flow.conditions ({"step_2": {field: condition}}) by step order.
+
+    Entries that are not step conditions (e.g. the "rules" and "logic" keys)
+    and conditions in an unknown shape are ignored, as FlowEngine always did.
+    """
+    if not conditions or not isinstance(conditions, dict):
+        return {}
+
+    parsed = {}
+    for key, step_conditions in conditions.items():
+        suffix = key.removeprefix("step_")
+        if (
+            suffix == key
+            or not suffix.isdigit()
+            or str(int(suffix)) != suffix
+            or not isinstance(step_conditions, dict)
+        ):
+            continue
+        step_order = int(suffix)
+
+        items = []
+        for field, condition in step_conditions.items():
+            if isinstance(condition, dict) and "operator" in condition:
+                if condition["operator"] in OPERATORS:
+                    items.append(
+                        SkipCondition(
+                            field, condition["operator"], condition.get("value")
+                        )
+                    )
+            elif isinstance(condition, list):
+                items.append(SkipCondition(field, None, values=tuple(condition)))
+        if items:
+            parsed[step_order] = tuple(items)
+    return parsed
+
+
+def compile_flow(flow: ApprovalFlow, steps: Iterable[ApprovalStep]) -> CompiledFlow:
+    """Build the compiled representation of a flow and its steps."""
+    skip_conditions = parse_skip_conditions(flow.conditions)
+    compiled_steps = tuple(
+        CompiledStep(
+            id=step.id,
+            step_order=step.step_order,
+            name=step.name,
+            description=step.description,
+            approver_type=step.approver_type,
+            approver_id=step.approver_id,
+            approver_roles=(
+                frozenset([step.approver_role]) if step.approver_role else frozenset()
+            ),
+            approver_rule=(
+                MappingProxyType(dict(step.approver_rule))
+                if isinstance(step.approver_rule, dict)
+                else None
+            ),
+            require_all=bool(step.require_all),
+            min_approvals=step.min_approvals,
+            rejection_required=bool(step.rejection_required),
+            skip_conditions=skip_conditions.get(step.step_order, ()),
+        )
+        for step in sorted(steps, key=lambda s: s.step_order)
+    )
+    return CompiledFlow(
+        flow_id=flow.id,
+        tenant_id=flow.tenant_id,
+        flow_type=flow.flow_type,
+        version=flow.updated_at,
+        steps=compiled_steps,
+        skip_conditions=MappingProxyType(skip_conditions),
+    )
+
+
+class FlowCompilationCache(LRUCache[tuple[UUID, datetime | None], CompiledFlow]):
+    """LRU cache of compiled flows keyed by (flow id, flow updated_at).
+
+    Evaluating a request used to reload the flow's steps several times.
+    Editing a flow or any of its steps bumps the flow's updated_at (see
+    ApprovalRepository), so a cached entry is never served for an edited
+    flow, in this process or any other; edits in this process also drop the
+    old entry right away through invalidate().
+    """
+
+    def __init__(self, maxsize: int | None = None):
+        """Initialize cache.
+
+        Args:
+            maxsize: Maximum compiled flows (defaults to APPROVALS_FLOW_CACHE_SIZE)
+        """
+        super().__init__(maxsize or get_settings().APPROVALS_FLOW_CACHE_SIZE)
+
+    def get(
+        self,
+        flow: ApprovalFlow,
+        load_steps: Callable[[], Iterable[ApprovalStep]],
+    ) -> CompiledFlow:
+        """Get the compiled flow, compiling it on a miss.
+
+        Args:
+            flow: Approval flow
+            load_steps: Callable returning the flow's steps (called on a miss)
+
+        Returns:
+            Compiled flow
+        """
+        key = (flow.id, flow.updated_at)
+        compiled = self.lookup(key)
+        if compiled is not None:
+            return compiled
+
+        compiled = compile_flow(flow, load_steps())
+        if not compiled.steps:
+            # Flows are created before their steps; do not pin the empty one
+            return compiled
+        self.store(key, compiled)
+        return compiled
+
+    def invalidate(self, flow_id: UUID) -> None:
+        """Drop every compiled version of a flow."""
+        self.discard(lambda key: key[0] == flow_id)
+
+
+# Global cache instance
+_cache: FlowCompilationCache | None = None
+
+
+def get_flow_compilation_cache() -> FlowCompilationCache:
+    """Get global compiled flow cache."""
+    global _cache
+    if _cache is None:
+        _cache = FlowCompilationCache()
+    return _cache
@@ -1,12 +1,19 @@
 """Approval service for approval workflow management."""
 
 import logging
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
 from sqlalchemy.orm import Session
 
+from app.core.approvals.bulk import BulkApprovalEngine, BulkApprovalResult
+from app.core.approvals.compiled import (
+    CompiledFlow,
+    CompiledStep,
+    get_flow_compilation_cache,
+)
 from app.core.notifications.service import NotificationService
 from app.core.pubsub import EventPublisher, get_event_publisher
 from app.core.pubsub.event_helpers import safe_publish_event
@@ -14,6 +21,7 @@
 from app.core.tasks.service import TaskService
 from app.models.approval import (
     ApprovalAction,
+    ApprovalActionType,
     ApprovalDelegation,
     ApprovalFlow,
     ApprovalRequest,
@@ -27,6 +35,9 @@
 
 logger = logging.getLogger(__name__)
 
+# Approval time percentiles of get_approval_stats(include_percentiles=True)
+APPROVAL_TIME_PERCENTILES = {"p50": 0.5, "p90": 0.9, "p99": 0.99}
+
 
 class FlowEngine:
     """Engine for executing approval flows."""
@@ -36,20 +47,20 @@ def __init__(self, db: Session):
         self.db = db
         self.repository = ApprovalRepository(db)
 
+    def compiled(self, flow: ApprovalFlow) -> CompiledFlow:
+        """Get the compiled steps of a flow (loaded once per flow version)."""
+        return get_flow_compilation_cache().get(
+            flow,
+            lambda: self.repository.get_approval_steps_by_flow(flow.id, flow.tenant_id),
+        )
+
     def get_next_step(
         self, request: ApprovalRequest, flow: ApprovalFlow
-    ) -> ApprovalStep | None:
+    ) -> CompiledStep | None:
         """Get the next step in the approval flow, considering skip conditions."""
-        steps = self.repository.get_approval_steps_by_flow(flow.id, request.tenant_id)
-        if not steps:
-            return None
-
-        # Get current step
-        current_step_order = request.current_step
-
         # Find next step that doesn't have skip conditions met
-        for step in steps:
-            if step.step_order > current_step_order:
+        for step in self.compiled(flow).steps:
+            if step.step_order > request.current_step:
                 # Check if this step should be skipped
                 if self._should_skip_step(step, request, flow):
                     continue
@@ -58,54 +69,22 @@ def get_next_step(
         return None
 
     def _should_skip_step(
-        self, step: ApprovalStep, request: ApprovalRequest, flow: ApprovalFlow
+        self,
+        step: ApprovalStep | CompiledStep,
+        request: ApprovalRequest,
+        flow: ApprovalFlow,
     ) -> bool:
-        """Check if a step should be skipped based on conditions."""
-        # Check if conditions exist and is a dictionary (not None or SQLAlchemy MetaData)
-        if not flow.conditions or not isinstance(flow.conditions, dict):
-            return False
-
-        # Check step-specific conditions from flow.conditions
-        step_conditions = flow.conditions.get(f"step_{step.step_order}")
-        if not step_conditions:
-            return False
-
-        # Evaluate conditions
-        # Example conditions:
-        # - {"amount": {"operator": "lt", "value": 1000}} - Skip if amount < 1000
-        # - {"entity_type": ["product"]} - Skip if entity_type is "product"
+        """Check if a step should be skipped based on conditions.
 
-        for field, condition in step_conditions.items():
-            if isinstance(condition, dict) and "operator" in condition:
-                # Numeric comparison
-                operator = condition["operator"]
-                value = condition["value"]
-
-                # Get the actual value from request metadata or entity
-                actual_value = self._get_request_value(request, field)
-
-                if actual_value is None:
-                    continue
-
-                if operator == "lt" and actual_value < value:
-                    return True
-                elif operator == "lte" and actual_value <= value:
-                    return True
-                elif operator == "gt" and actual_value > value:
-                    return True
-                elif operator == "gte" and actual_value >= value:
-                    return True
-                elif operator == "eq" and actual_value == value:
-                    return True
-                elif operator == "ne" and actual_value != value:
-                    return True
-            elif isinstance(condition, list):
-                # Value in list check
-                actual_value = self._get_request_value(request, field)
-                if actual_value in condition:
-                    return True
-
-        return False
+        Conditions come from flow.conditions, keyed by step order:
+        - {"amount": {"operator": "lt", "value": 1000}} - Skip if amount < 1000
+        - {"entity_type": ["product"]} - Skip if entity_type is "product"
+        """
+        conditions = self.compiled(flow).skip_conditions.get(step.step_order, ())
+        return any(
+            condition.holds(self._get_request_value(request, condition.field))
+            for condition in conditions
+        )
 
     def _get_request_value(self, request: ApprovalRequest, field: str) -> any:
         """Get a value from the request for condition evaluation."""
@@ -129,13 +108,9 @@ def _get_request_value(self, request: ApprovalRequest, field: str) -> any:
 
     def get_current_step(
         self, request: ApprovalRequest, flow: ApprovalFlow
-    ) -> ApprovalStep | None:
+    ) -> CompiledStep | None:
         """Get the current step in the approval flow."""
-        steps = self.repository.get_approval_steps_by_flow(flow.id, request.tenant_id)
-        if not steps:
-            return None
-
-        return next((s for s in steps if s.step_order == request.current_step), None)
+        return self.compiled(flow).step(request.current_step)
 
     def can_approve(
         self, request: ApprovalRequest, user_id: UUID, flow: ApprovalFlow
@@ -149,9 +124,9 @@ def can_approve(
         if current_step.approver_type == "user":
             return current_step.approver_id == user_id
         elif current_step.approver_type == "role":
-            # Check if user has the role
+            # Check if user has one of the roles
             return self._check_user_has_role(
-                user_id, current_step.approver_role, request.tenant_id
+                user_id, current_step.approver_roles, request.tenant_id
             )
         elif current_step.approver_type == "dynamic":
             # Evaluate dynamic rule
@@ -160,20 +135,54 @@ def can_approve(
         return False
 
     def _check_user_has_role(
-        self, user_id: UUID, role_name: str, tenant_id: UUID
+        self, user_id: UUID, roles: str | Iterable[str], tenant_id: UUID
     ) -> bool:
-        """Check if a user has a specific role."""
+        """Check if a user has a specific role (or any of a set of roles)."""
         from app.models.user_role import UserRole
 
+        roles = [roles] if isinstance(roles, str) else list(roles)
+        if not roles:
+            return False
+
         user_role = (
             self.db.query(UserRole)
-            .filter(UserRole.user_id == user_id, UserRole.role == role_name)
+            .filter(UserRole.user_id == user_id, UserRole.role.in_(roles))
             .first()
         )
         return user_role is not None
 
+    def get_user_roles(self, user_id: UUID) -> frozenset[str]:
+        """Get the role names of a user (for checking many steps at once)."""
+        from app.models.user_role import UserRole
+
+        rows = self.db.query(UserRole.role).filter(UserRole.user_id == user_id).all()
+        return frozenset(role for (role,) in rows)
+
+    def can_approve_step(
+        self,
+        step: CompiledStep,
+        request: ApprovalRequest,
+        user_id: UUID,
+        user_roles: frozenset[str],
+    ) -> bool:
+        """Check if a user can approve a step, given the user's roles.
+
+        Same rules as can_approve, without queries, for bulk actions.
+        """
+        if step.approver_type == "user":
+            return step.approver_id == user_id
+        elif step.approver_type == "role":
+            return not step.approver_roles.isdisjoint(user_roles)
+        elif step.approver_type == "dynamic":
+            return self._evaluate_dynamic_rule(step, request, user_id)
+
+        return False
+
     def _evaluate_dynamic_rule(
-        self, step: ApprovalStep, request: ApprovalRequest, user_id: UUID
+        self,
+        step: ApprovalStep | CompiledStep,
+        request: ApprovalRequest,
+        user_id: UUID,
     ) -> bool:
         """Evaluate dynamic approver rule."""
         if not step.approver_rule:
@@ -284,31 +293,35 @@ def process_approval(
         return request
 
     def _check_parallel_approval_complete(
-        self, request: ApprovalRequest, flow: ApprovalFlow, step: ApprovalStep
+        self,
+        request: ApprovalRequest,
+        flow: ApprovalFlow,
+        step: ApprovalStep | CompiledStep,
     ) -> bool:
         """Check if parallel approval requirements are met for a step."""
-        # Get all actions for this step
-        step_actions = self.repository.get_approval_actions_by_request(
-            request.id, request.tenant_id
-        )
-        step_actions = [a for a in step_actions if a.step_order == step.step_order]
-
         # Count unique approvals (exclude rejections)
-        approvals = [a for a in step_actions if a.action_type == "approve"]
-        unique_approvers = set(a.acted_by for a in approvals if a.acted_by)
+        unique_approvers = self.repository.count_step_approvers(
+            request.id, request.tenant_id, step.step_order
+        )
+        return self.parallel_step_complete(step, unique_approvers)
 
+    @staticmethod
+    def parallel_step_complete(
+        step: ApprovalStep | CompiledStep, unique_approvers: int
+    ) -> bool:
+        """Check if a number of distinct approvers completes a parallel step."""
         # Check requirements
         if step.require_all:
             # Need all configured approvers
             # For now, assume we need at least one approval
             # TODO: Get list of configured approvers from step configuration
-            return len(unique_approvers) >= 1
+            return unique_approvers >= 1
         elif step.min_approvals:
             # Need minimum number of approvals
-            return len(unique_approvers) >= step.min_approvals
+            return unique_approvers >= step.min_approvals
         else:
             # Default: need at least one approval
-            return len(unique_approvers) >= 1
+            return unique_approvers >= 1
 
 
 class ApprovalService:
@@ -403,6 +416,7 @@ def update_approval_flow(
         flow_data["updated_by"] = user_id
 
         updated_flow = self.repository.update_approval_flow(flow, flow_data)
+        get_flow_compilation_cache().invalidate(flow_id)
         return updated_flow
 
     def delete_approval_flow(
@@ -434,6 +448,7 @@ def delete_approval_flow(
                 "is_active": False,
             },
         )
+        get_flow_compilation_cache().invalidate(flow_id)
 
     def add_approval_step(
         self,
@@ -444,7 +459,9 @@ def add_approval_step(
         """Add a step to an approval flow."""
         step_data["flow_id"] = flow_id
         step_data["tenant_id"] = tenant_id
-        return self.repository.create_approval_step(step_data)
+        step = self.repository.create_approval_step(step_data)
+        get_flow_compilation_cache().invalidate(flow_id)
+        return step
 
     def delete_all_flow_steps(
         self,
@@ -453,6 +470,7 @@ def delete_all_flow_steps(
     ) -> None:
         """Delete all steps for a given flow."""
         self.repository.delete_all_approval_steps(flow_id, tenant_id)
+        get_flow_compilation_cache().invalidate(flow_id)
 
     def get_approval_steps_by_flow(
         self,
@@ -489,6 +507,7 @@ def update_approval_step(
             raise ValueError("Cannot update step in flow with active requests")
 
         updated_step = self.repository.update_approval_step(step, step_data)
+        get_flow_compilation_cache().invalidate(flow_id)
         return updated_step
 
     def delete_approval_step(
@@ -517,6 +536,7 @@ def delete_approval_step(
             raise ValueError("Cannot delete step from flow with active requests")
 
         self.repository.delete_approval_step(step)
+        get_flow_compilation_cache().invalidate(flow_id)
 
     def create_approval_request(
         self,
@@ -568,6 +588,7 @@ def create_approval_request(
         # Publish event
         safe_publish_event(
             event_publisher=self.event_publisher,
+            db=self.db,
             event_type="approval.requested",
             entity_type="approval_request",
             entity_id=request.id,
@@ -583,6 +604,7 @@ def create_approval_request(
                 },
             ),
         )
+        self.db.commit()
 
         return request
 
@@ -595,10 +617,7 @@ def _create_approval_tasks(self, request: ApprovalRequest, tenant_id: UUID) -> N
         if not flow:
             return
 
-        steps = self.repository.get_approval_steps_by_flow(flow.id, tenant_id)
-        current_step = next(
-            (s for s in steps if s.step_order == request.current_step), None
-        )
+        current_step = self.flow_engine.get_current_step(request, flow)
 
         if not current_step:
             return
@@ -634,10 +653,7 @@ def _notify_approvers(self, request: ApprovalRequest, tenant_id: UUID) -> None:
         if not flow:
             return
 
-        steps = self.repository.get_approval_steps_by_flow(flow.id, tenant_id)
-        current_step = next(
-            (s for s in steps if s.step_order == request.current_step), None
-        )
+        current_step = self.flow_engine.get_current_step(request, flow)
 
         if not current_step:
             return
@@ -670,7 +686,10 @@ def _notify_approvers(self, request: ApprovalRequest, tenant_id: UUID) -> None:
                 )
 
     def _get_step_approvers(
-        self, step: ApprovalStep, request: ApprovalRequest, tenant_id: UUID
+        self,
+        step: ApprovalStep | CompiledStep,
+        request: ApprovalRequest,
+        tenant_id: UUID,
     ) -> list[UUID]:
         """Get list of approver IDs for a step."""
         approvers = []
@@ -769,6 +788,7 @@ def approve_request(
         # Publish event
         safe_publish_event(
             event_publisher=self.event_publisher,
+            db=self.db,
             event_type="approval.approved",
             entity_type="approval_request",
             entity_id=updated_request.id,
@@ -780,6 +800,7 @@ def approve_request(
                 additional_data={"request_title": updated_request.title},
             ),
         )
+        self.db.commit()
 
         return updated_request
 
@@ -837,6 +858,7 @@ def reject_request(
         # Publish event
         safe_publish_event(
             event_publisher=self.event_publisher,
+            db=self.db,
             event_type="approval.rejected",
             entity_type="approval_request",
             entity_id=updated_request.id,
@@ -848,6 +870,7 @@ def reject_request(
                 additional_data={"request_title": updated_request.title},
             ),
         )
+        self.db.commit()
 
         return updated_request
 
@@ -893,6 +916,7 @@ def delegate_approval(
         # Publish event
         safe_publish_event(
             event_publisher=self.event_publisher,
+            db=self.db,
             event_type="approval.delegated",
             entity_type="approval_request",
             entity_id=request_id,
@@ -907,6 +931,7 @@ def delegate_approval(
                 },
             ),
         )
+        self.db.commit()
 
         return delegation
 
@@ -943,6 +968,7 @@ def cancel_request(
         # Publish event
         safe_publish_event(
             event_publisher=self.event_publisher,
+            db=self.db,
             event_type="approval.cancelled",
             entity_type="approval_request",
             entity_id=updated_request.id,
@@ -954,6 +980,7 @@ def cancel_request(
                 additional_data={"request_title": updated_request.title},
             ),
         )
+        self.db.commit()
 
         return updated_request
 
@@ -971,53 +998,47 @@ def get_delegations(
     def get_approval_stats(
         self,
         tenant_id: UUID,
+        include_percentiles: bool = False,
     ) -> dict:
-        """Get approval statistics."""
-        # Get all requests for tenant
-        all_requests = self.repository.get_approval_requests(
-            tenant_id=tenant_id,
-            skip=0,
-            limit=10000,
-        )
+        """Get approval statistics.
 
-        # Count by status
-        status_counts = {}
-        for request in all_requests:
-            status = request.status.value
-            status_counts[status] = status_counts.get(status, 0) + 1
-
-        # Calculate average approval time
-        approved_requests = [
-            r
-            for r in all_requests
-            if r.status == ApprovalStatus.APPROVED and r.completed_at
-        ]
-        avg_approval_time = None
-        if approved_requests:
-            total_time = sum(
-                (r.completed_at - r.requested_at).total_seconds()
-                for r in approved_requests
-            )
-            avg_approval_time = total_time / len(approved_requests)
+        Args:
+            tenant_id: Tenant ID
+            include_percentiles: Add approval_time_percentiles (p50/p90/p99
+                seconds from request to approval)
 
-        # Get most used flows
-        flow_usage = {}
-        for request in all_requests:
-            flow_id = str(request.flow_id)
-            flow_usage[flow_id] = flow_usage.get(flow_id, 0) + 1
+        Returns:
+            Dict with total_requests, status_counts, avg_approval_time_seconds
+            and top_flows (the five flows with the most requests)
+        """
+        stats = self.repository.get_approval_stats(
+            tenant_id,
+            percentiles=(
+                tuple(APPROVAL_TIME_PERCENTILES.values()) if include_percentiles else ()
+            ),
+        )
 
         # Sort flows by usage
-        top_flows = sorted(flow_usage.items(), key=lambda x: x[1], reverse=True)[:5]
-
-        return {
-            "total_requests": len(all_requests),
-            "status_counts": status_counts,
-            "avg_approval_time_seconds": avg_approval_time,
+        top_flows = sorted(
+            stats["flow_counts"].items(), key=lambda x: (-x[1], str(x[0]))
+        )[:5]
+
+        result = {
+            "total_requests": stats["total_requests"],
+            "status_counts": stats["status_counts"],
+            "avg_approval_time_seconds": stats["avg_approval_time_seconds"],
             "top_flows": [
-                {"flow_id": flow_id, "request_count": count}
+                {"flow_id": str(flow_id), "request_count": count}
                 for flow_id, count in top_flows
             ],
         }
+        if include_percentiles:
+            percentiles = stats["approval_time_percentiles"]
+            result["approval_time_percentiles"] = {
+                name: percentiles[fraction]
+                for name, fraction in APPROVAL_TIME_PERCENTILES.items()
+            }
+        return result
 
     def get_request_timeline(
         self,
@@ -1353,63 +1374,30 @@ def bulk_approve_requests(
         comment: str | None = None,
         ip_address: str | None = None,
         user_agent: str | None = None,
-    ) -> list[ApprovalRequest]:
-        """Approve multiple approval requests."""
-        results = []
-        errors = []
-
-        for request_id in request_ids:
-            try:
-                request = self.repository.get_approval_request_by_id(
-                    request_id, tenant_id
-                )
-                if not request:
-                    errors.append(f"Request {request_id} not found")
-                    continue
-
-                # Get the flow for this request
-                flow = self.repository.get_approval_flow_by_id(
-                    request.flow_id, tenant_id
-                )
-                if not flow:
-                    errors.append(
-                        f"Flow {request.flow_id} not found for request {request_id}"
-                    )
-                    continue
-
-                if not self.flow_engine.can_approve(request, user_id, flow):
-                    errors.append(f"User cannot approve request {request_id}")
-                    continue
-
-                updated_request = self.flow_engine.process_approval(
-                    request, user_id, "approve", comment, ip_address, user_agent
-                )
-                results.append(updated_request)
+    ) -> BulkApprovalResult:
+        """Approve multiple approval requests in one transaction.
 
-                # Publish event
-                safe_publish_event(
-                    event_publisher=self.event_publisher,
-                    event_type="approval.approved",
-                    entity_type="approval_request",
-                    entity_id=updated_request.id,
-                    tenant_id=tenant_id,
-                    user_id=user_id,
-                    metadata=EventMetadata(
-                        source="approval_service",
-                        version="1.0",
-                        additional_data={"request_title": updated_request.title},
-                    ),
-                )
-            except Exception as e:
-                errors.append(f"Failed to approve request {request_id}: {str(e)}")
+        Returns:
+            Approved (or advanced) requests and per-request errors
+        """
+        result = BulkApprovalEngine(self).run(
+            ApprovalActionType.APPROVE,
+            request_ids,
+            tenant_id,
+            user_id,
+            comment,
+            ip_address,
+            user_agent,
+        )
 
-        if errors:
-            logger.warning(f"Bulk approve completed with errors: {errors}")
+        if result.errors:
+            logger.warning(f"Bulk approve completed with errors: {result.errors}")
 
         logger.info(
-            f"Bulk approve results: {len(results)} approved, {len(errors)} errors"
+            f"Bulk approve results: {len(result.requests)} approved, "
+            f"{len(result.errors)} errors"
         )
-        return results
+        return result
 
     def bulk_reject_requests(
         self,
@@ -1419,50 +1407,26 @@ def bulk_reject_requests(
         comment: str | None = None,
         ip_address: str | None = None,
         user_agent: str | None = None,
-    ) -> list[ApprovalRequest]:
-        """Reject multiple approval requests."""
-        results = []
-        errors = []
-
-        for request_id in request_ids:
-            try:
-                request = self.repository.get_approval_request_by_id(
-                    request_id, tenant_id
-                )
-                if not request:
-                    errors.append(f"Request {request_id} not found")
-                    continue
+    ) -> BulkApprovalResult:
+        """Reject multiple approval requests in one transaction.
 
-                if not self.flow_engine.can_approve(request, user_id):
-                    errors.append(f"User cannot reject request {request_id}")
-                    continue
-
-                updated_request = self.flow_engine.process_approval(
-                    request, user_id, "reject", comment, ip_address, user_agent
-                )
-                results.append(updated_request)
-
-                # Publish event
-                safe_publish_event(
-                    event_publisher=self.event_publisher,
-                    event_type="approval.rejected",
-                    entity_type="approval_request",
-                    entity_id=updated_request.id,
-                    tenant_id=tenant_id,
-                    user_id=user_id,
-                    metadata=EventMetadata(
-                        source="approval_service",
-                        version="1.0",
-                        additional_data={"request_title": updated_request.title},
-                    ),
-                )
-            except Exception as e:
-                errors.append(f"Failed to reject request {request_id}: {str(e)}")
+        Returns:
+            Rejected requests and per-request errors
+        """
+        result = BulkApprovalEngine(self).run(
+            ApprovalActionType.REJECT,
+            request_ids,
+            tenant_id,
+            user_id,
+            comment,
+            ip_address,
+            user_agent,
+        )
 
-        if errors:
-            logger.warning(f"Bulk reject completed with errors: {errors}")
+        if result.errors:
+            logger.warning(f"Bulk reject completed with errors: {result.errors}")
 
-        return results
+        return result
 
     def _validate_conditions_json(self, conditions: dict) -> None:
         """Validate that conditions JSON has valid structure.
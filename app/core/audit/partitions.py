@@ -0,0 +1,127 @@
+"""Monthly partition maintenance for the audit_logs table."""
+
+import logging
+import re
+from datetime import UTC, date, datetime
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+PARTITION_NAME = re.compile(r"^audit_logs_p(\d{4})_(\d{2})$")
+
+
+def month_start(value: date | datetime) -> date:
+    """First day of the (UTC) month of a date or datetime."""
+    if isinstance(value, datetime):
+        value = value.astimezone(UTC) if value.tzinfo else value
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    """First day of the month a number of months after (or before) month."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Name of the partition holding a month (audit_logs_pYYYY_MM)."""
+    return f"audit_logs_p{month.year:04d}_{month.month:02d}"
+
+
+class AuditPartitionManager:
+    """Creates upcoming monthly audit_logs partitions and drops expired ones.
+
+    Partitions cover UTC months. Rows outside every monthly partition land
+    in audit_logs_default, so creating partitions ahead of time keeps the
+    default partition empty.
+    """
+
+    def __init__(self, db: Session):
+        """Initialize manager with database session."""
+        self.db = db
+
+    def get_partitions(self) -> dict[date, str]:
+        """Get the monthly partitions by month."""
+        rows = self.db.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE parent.relname = 'audit_logs'"
+            )
+        ).scalars()
+        partitions = {}
+        for name in rows:
+            match = PARTITION_NAME.match(name)
+            if match:
+                partitions[date(int(match[1]), int(match[2]), 1)] = name
+        return partitions
+
+    def ensure_partitions(
+        self, months_ahead: int, today: date | None = None
+    ) -> list[str]:
+        """Create the partitions of the current month and the months ahead.
+
+        Args:
+            months_ahead: Number of months after the current one to create
+            today: Reference date (defaults to today, UTC)
+
+        Returns:
+            Names of the partitions created
+        """
+        current = month_start(today or datetime.now(UTC))
+        existing = self.get_partitions()
+        created = []
+        for offset in range(months_ahead + 1):
+            month = add_months(current, offset)
+            if month in existing:
+                continue
+            name = partition_name(month)
+            try:
+                self.db.execute(
+                    text(
+                        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF audit_logs "
+                        f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') "
+                        f"TO ('{add_months(month, 1).isoformat()} 00:00:00+00')"
+                    )
+                )
+                self.db.commit()
+                created.append(name)
+            except SQLAlchemyError as e:
+                # Fails when audit_logs_default already holds rows of the month
+                self.db.rollback()
+                logger.error(f"Failed to create audit partition {name}: {e}")
+        if created:
+            logger.info(f"Created audit log partitions: {', '.join(created)}")
+        return created
+
+    def drop_expired(
+        self, retention_months: int, today: date | None = None
+    ) -> list[str]:
+        """Drop partitions whose whole month is older than the retention.
+
+        Each partition is detached before it is dropped, so concurrent
+        readers and writers of other months are not blocked by the drop.
+
+        Args:
+            retention_months: Months to keep before the current one
+            today: Reference date (defaults to today, UTC)
+
+        Returns:
+            Names of the partitions dropped
+        """
+        cutoff = add_months(month_start(today or datetime.now(UTC)), -retention_months)
+        dropped = []
+        for month, name in sorted(self.get_partitions().items()):
+            if month >= cutoff:
+                break
+            self.db.execute(text(f"ALTER TABLE audit_logs DETACH PARTITION {name}"))
+            self.db.execute(text(f"DROP TABLE {name}"))
+            self.db.commit()
+            dropped.append(name)
+        if dropped:
+            logger.info(f"Dropped expired audit log partitions: {', '.join(dropped)}")
+        return dropped
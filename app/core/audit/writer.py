@@ -0,0 +1,418 @@
+"""Buffered audit log writer flushing batches from a background task."""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from uuid import UUID, uuid4
+
+from sqlalchemy.orm import Session
+
+from app.core.audit.partitions import AuditPartitionManager
+from app.core.config_file import get_settings
+from app.core.db.session import SessionLocal
+from app.models.audit_log import AuditLog
+from app.monitoring.audit_metrics import get_audit_metrics
+from app.repositories.audit_repository import AuditRepository
+
+logger = logging.getLogger(__name__)
+
+# Length limits of the audit_logs string columns; longer values are cut
+STRING_LIMITS = {
+    name: AuditLog.__table__.c[name].type.length
+    for name in ("action", "resource_type", "ip_address", "user_agent")
+}
+
+
+def _truncate(value: str | None, limit: int) -> str | None:
+    return value[:limit] if value is not None and len(value) > limit else value
+
+
+def _is_bad_row(error: Exception) -> bool:
+    """Whether a write failed on the data (SQLSTATE class 22 or 23).
+
+    Anything else (connection lost, database down) is worth retrying.
+    """
+    error = getattr(error, "orig", None) or error
+    code = getattr(error, "pgcode", None) or getattr(error, "sqlstate", None)
+    return bool(code) and code[:2] in ("22", "23")
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class AuditLogWriter:
+    """Buffers audit log entries and writes them with COPY in batches.
+
+    write() only appends to an in-process buffer (id and created_at are set
+    at call time), so audited requests do not wait on an INSERT and commit.
+    A background task flushes the buffer every flush_interval seconds, one
+    COPY and commit per batch. Entries that cannot be written (database
+    down, buffer over max_buffer) are appended to a local JSON-lines spill
+    file and replayed before the next successful flush, so they survive
+    restarts; only entries still in memory when the process dies are lost.
+    Each process spills to its own file (the configured path with its pid)
+    and takes over the files of processes that are gone when it starts.
+
+    String values are cut to their column lengths. When the database rejects
+    a batch over its data, the batch is retried row by row and the rows it
+    still rejects are moved to a dead-letter file next to the spill file,
+    so one bad entry cannot hold up the ones after it.
+    The same task keeps the monthly partitions of audit_logs ahead of time
+    and drops those past the retention.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        batch_size: int | None = None,
+        flush_interval: float | None = None,
+        max_buffer: int | None = None,
+        spill_path: str | None = None,
+    ):
+        """Initialize writer.
+
+        Args:
+            session_factory: Callable returning a new database session
+            batch_size: Entries written per COPY
+            flush_interval: Seconds between flushes
+            max_buffer: Entries kept in memory before spilling to disk
+            spill_path: JSON-lines file for entries not yet written
+                (default: AUDIT_WRITER_SPILL_PATH with the pid added)
+        """
+        settings = get_settings()
+        self.session_factory = session_factory
+        self.batch_size = batch_size or settings.AUDIT_WRITER_BATCH_SIZE
+        self.flush_interval = (
+            flush_interval
+            if flush_interval is not None
+            else settings.AUDIT_WRITER_FLUSH_INTERVAL
+        )
+        self.max_buffer = max_buffer or settings.AUDIT_WRITER_MAX_BUFFER
+        if spill_path:
+            self.spill_path = Path(spill_path)
+            self._spill_base = None
+        else:
+            self._spill_base = Path(settings.AUDIT_WRITER_SPILL_PATH)
+            self.spill_path = self._spill_base.with_name(
+                f"{self._spill_base.stem}.{os.getpid()}{self._spill_base.suffix}"
+            )
+        self.dead_letter_path = self.spill_path.with_name(
+            f"{self.spill_path.stem}.dead{self.spill_path.suffix}"
+        )
+        self.partitions_ahead = settings.AUDIT_PARTITIONS_AHEAD
+        self.retention_months = settings.AUDIT_RETENTION_MONTHS
+        self.maintenance_interval = settings.AUDIT_PARTITION_MAINTENANCE_INTERVAL
+        self.metrics = get_audit_metrics()
+        self._buffer: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+        # Serializes flushes (background task, stop) and spill file access
+        self._flush_lock = threading.Lock()
+        self._running = False
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the background flush task is running."""
+        return self._running
+
+    def write(
+        self,
+        user_id: UUID | None,
+        tenant_id: UUID,
+        action: str,
+        resource_type: str | None = None,
+        resource_id: UUID | None = None,
+        details: dict[str, Any] | None = None,
+        ip_address: str | None = None,
+        user_agent: str | None = None,
+    ) -> None:
+        """Buffer an audit log entry (same arguments as create_audit_log)."""
+        entry = {
+            "id": uuid4(),
+            "user_id": user_id,
+            "tenant_id": tenant_id,
+            "action": action,
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "details": details,
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+            "created_at": datetime.now(UTC),
+        }
+        for name, limit in STRING_LIMITS.items():
+            entry[name] = _truncate(entry[name], limit)
+        with self._lock:
+            self._buffer.append(entry)
+            overflow = None
+            if len(self._buffer) > self.max_buffer:
+                overflow, self._buffer = self._buffer, []
+        if overflow:
+            # The database cannot keep up; keep memory bounded
+            with self._flush_lock:
+                self._spill(overflow)
+
+    def pending(self) -> int:
+        """Number of entries waiting in memory."""
+        with self._lock:
+            return len(self._buffer)
+
+    def flush(self) -> int:
+        """Write spilled and buffered entries to the database.
+
+        Returns:
+            Number of entries written
+        """
+        with self._lock:
+            entries, self._buffer = self._buffer, []
+        with self._flush_lock:
+            pending = self._read_entries(self.spill_path) + entries
+            if not pending:
+                return 0
+            written = self._copy(pending)
+            if written < len(pending):
+                # Keep what is left (spilled entries first) for the next flush
+                self._spill(pending[written:], replace=True)
+            else:
+                self.spill_path.unlink(missing_ok=True)
+            return written
+
+    def _copy(self, entries: list[dict[str, Any]]) -> int:
+        """COPY entries in batches, one transaction per batch.
+
+        Returns:
+            Number of entries written or dead-lettered before the first batch
+            that failed for another reason than its data
+        """
+        done = 0
+        for start in range(0, len(entries), self.batch_size):
+            batch = entries[start : start + self.batch_size]
+            started = time.monotonic()
+            db = self.session_factory()
+            try:
+                AuditRepository(db).copy_audit_logs(batch)
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                logger.error(f"Failed to write {len(batch)} audit logs: {e}")
+                if not _is_bad_row(e) or not self._copy_rows(db, batch):
+                    return done
+                done += len(batch)
+                continue
+            finally:
+                db.close()
+            done += len(batch)
+            self.metrics.record_flush(len(batch), time.monotonic() - started)
+        return done
+
+    def _copy_rows(self, db: Session, batch: list[dict[str, Any]]) -> bool:
+        """Write a batch the database rejected one row at a time.
+
+        Each row gets its own savepoint; rows rejected for their data go to
+        the dead-letter file once the rest is committed.
+
+        Returns:
+            Whether the batch was written (bar its bad rows)
+        """
+        started = time.monotonic()
+        repository = AuditRepository(db)
+        rejected = []
+        try:
+            for entry in batch:
+                try:
+                    with db.begin_nested():
+                        repository.copy_audit_logs([entry])
+                except Exception as e:
+                    if not _is_bad_row(e):
+                        raise
+                    logger.error(f"Audit log {entry['id']} rejected: {e}")
+                    rejected.append(entry)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to write {len(batch)} audit logs row by row: {e}")
+            return False
+        self.metrics.record_flush(
+            len(batch) - len(rejected), time.monotonic() - started
+        )
+        self._dead_letter(rejected)
+        return True
+
+    def _dead_letter(self, entries: list[dict[str, Any]]) -> None:
+        """Append entries the database rejected to the dead-letter file."""
+        if not entries:
+            return
+        try:
+            self._append(self.dead_letter_path, entries)
+            self.metrics.record_dead_letter(len(entries))
+            logger.error(f"Moved {len(entries)} audit logs to {self.dead_letter_path}")
+        except OSError as e:
+            self.metrics.record_dropped(len(entries))
+            logger.error(f"Failed to dead-letter {len(entries)} audit logs: {e}")
+
+    def _spill(self, entries: list[dict[str, Any]], replace: bool = False) -> bool:
+        """Append entries to (or replace) the spill file.
+
+        The caller holds _flush_lock. A replacement is written to a temporary
+        file first, so a crash never leaves a half-written spill file.
+
+        Returns:
+            Whether the entries were written
+        """
+        if not entries and not replace:
+            return True
+        try:
+            if replace:
+                target = self.spill_path.with_suffix(".tmp")
+                target.unlink(missing_ok=True)
+                self._append(target, entries)
+                os.replace(target, self.spill_path)
+            else:
+                self._append(self.spill_path, entries)
+        except OSError as e:
+            self.metrics.record_dropped(len(entries))
+            logger.error(f"Failed to spill {len(entries)} audit logs, dropped: {e}")
+            return False
+        self.metrics.record_spill(len(entries))
+        logger.warning(f"Spilled {len(entries)} audit logs to {self.spill_path}")
+        return True
+
+    @staticmethod
+    def _append(path: Path, entries: list[dict[str, Any]]) -> None:
+        """Append entries to a JSON-lines file and fsync it."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as spill:
+            for entry in entries:
+                spill.write(json.dumps(entry, default=str) + "\n")
+            spill.flush()
+            os.fsync(spill.fileno())
+
+    @staticmethod
+    def _read_entries(path: Path) -> list[dict[str, Any]]:
+        """Read a JSON-lines file of entries (caller holds _flush_lock)."""
+        if not path.exists():
+            return []
+        entries = []
+        with path.open(encoding="utf-8") as spill:
+            for line in spill:
+                if line.strip():
+                    entries.append(json.loads(line))
+        return entries
+
+    def adopt_orphaned_spills(self) -> int:
+        """Move the spill files of processes that are gone into this one's.
+
+        Covers the shared file of earlier versions too. Each file is claimed
+        with an atomic rename, so two starting processes never both take it.
+
+        Returns:
+            Number of entries taken over
+        """
+        base = self._spill_base
+        if base is None or not base.parent.exists():
+            return 0
+        adopted = 0
+        with self._flush_lock:
+            # audit_spill.jsonl (shared) or audit_spill.<pid>.jsonl
+            pattern = re.compile(
+                rf"{re.escape(base.stem)}(?:\.(\d+))?{re.escape(base.suffix)}"
+            )
+            for path in sorted(base.parent.iterdir()):
+                match = pattern.fullmatch(path.name)
+                if not match:
+                    continue
+                if match[1] and (
+                    int(match[1]) == os.getpid() or _pid_alive(int(match[1]))
+                ):
+                    continue
+                claimed = path.with_name(f"{path.name}.{os.getpid()}.claimed")
+                try:
+                    os.rename(path, claimed)
+                except OSError:
+                    continue
+                entries = self._read_entries(claimed)
+                if self._spill(entries):
+                    claimed.unlink(missing_ok=True)
+                    adopted += len(entries)
+        return adopted
+
+    def maintain_partitions(self) -> None:
+        """Create upcoming partitions and drop expired ones."""
+        db = self.session_factory()
+        try:
+            manager = AuditPartitionManager(db)
+            manager.ensure_partitions(self.partitions_ahead)
+            if self.retention_months > 0:
+                manager.drop_expired(self.retention_months)
+        finally:
+            db.close()
+
+    async def run(self) -> None:
+        """Flush every flush_interval until stopped."""
+        self._running = True
+        logger.info("Audit log writer started")
+        try:
+            await asyncio.to_thread(self.adopt_orphaned_spills)
+        except Exception as e:
+            logger.error(f"Failed to take over orphaned audit spill files: {e}")
+        last_maintenance = None
+        while self._running:
+            now = time.monotonic()
+            if (
+                last_maintenance is None
+                or now - last_maintenance >= self.maintenance_interval
+            ):
+                last_maintenance = now
+                try:
+                    await asyncio.to_thread(self.maintain_partitions)
+                except Exception as e:
+                    logger.error(f"Audit partition maintenance failed: {e}")
+            try:
+                await asyncio.to_thread(self.flush)
+            except Exception as e:
+                logger.error(f"Audit log flush failed: {e}", exc_info=True)
+            self.metrics.set_buffered(self.pending())
+            await asyncio.sleep(self.flush_interval)
+
+    def start(self) -> asyncio.Task:
+        """Run the writer in a background task."""
+        if self._task is None or self._task.done():
+            self._running = True
+            self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def stop(self) -> None:
+        """Stop the background task and flush what is left."""
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await asyncio.to_thread(self.flush)
+        logger.info("Audit log writer stopped")
+
+
+# Global writer instance
+_writer: AuditLogWriter | None = None
+
+
+def get_audit_writer() -> AuditLogWriter:
+    """Get global audit log writer."""
+    global _writer
+    if _writer is None:
+        _writer = AuditLogWriter()
+    return _writer
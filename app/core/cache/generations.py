@@ -0,0 +1,111 @@
+"""Generation counters for O(1) invalidation of Redis cache entries."""
+
+import logging
+from collections.abc import Iterable
+
+from redis import Redis as SyncRedis
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+# Longer than any entry TTL, so a counter that expires (and restarts at 0)
+# cannot bring back an entry written under an old generation
+DEFAULT_GENERATION_TTL = 86400
+
+
+class CacheGenerations:
+    """Builds cache keys that embed the generation of each scope they depend on.
+
+    A scope is a string such as "tenant:{tenant_id}" or
+    "user:{tenant_id}:{user_id}". Invalidating a scope increments its counter,
+    so every key built from the old value stops being read; the orphaned
+    entries expire through their own TTL. Invalidation is a single INCR per
+    scope instead of a KEYS/SCAN over the keyspace.
+    """
+
+    def __init__(self, namespace: str, generation_ttl: int = DEFAULT_GENERATION_TTL):
+        """Initialize generations.
+
+        Args:
+            namespace: Prefix of the counter keys (e.g. "tasks")
+            generation_ttl: Seconds a counter lives after its last increment
+        """
+        self.namespace = namespace
+        self.generation_ttl = generation_ttl
+
+    def _counter_key(self, scope: str) -> str:
+        return f"{self.namespace}:gen:{scope}"
+
+    @staticmethod
+    def _with_generations(base: str, generations: list) -> str:
+        return f"{base}:g" + ".".join(str(int(g or 0)) for g in generations)
+
+    async def key(self, redis: Redis, base: str, scopes: Iterable[str]) -> str:
+        """Build the cache key of an entry depending on scopes.
+
+        Args:
+            redis: Redis client
+            base: Key identifying the entry
+            scopes: Scopes whose invalidation drops the entry
+
+        Returns:
+            Key with the current generation of each scope appended
+        """
+        scopes = list(scopes)
+        if not scopes:
+            return base
+        generations = await redis.mget([self._counter_key(scope) for scope in scopes])
+        return self._with_generations(base, generations)
+
+    def key_sync(self, redis: SyncRedis, base: str, scopes: Iterable[str]) -> str:
+        """Same as key() with a synchronous Redis client."""
+        scopes = list(scopes)
+        if not scopes:
+            return base
+        generations = redis.mget([self._counter_key(scope) for scope in scopes])
+        return self._with_generations(base, generations)
+
+    async def bump(self, redis: Redis, scopes: Iterable[str]) -> int:
+        """Invalidate scopes in one pipelined round trip.
+
+        Returns:
+            Number of scopes invalidated
+        """
+        scopes = set(scopes)
+        if not scopes:
+            return 0
+        async with redis.pipeline(transaction=False) as pipe:
+            for scope in scopes:
+                counter = self._counter_key(scope)
+                pipe.incr(counter)
+                pipe.expire(counter, self.generation_ttl)
+            await pipe.execute()
+        return len(scopes)
+
+    def bump_sync(self, redis: SyncRedis, scopes: Iterable[str]) -> int:
+        """Same as bump() with a synchronous Redis client."""
+        scopes = set(scopes)
+        if not scopes:
+            return 0
+        with redis.pipeline(transaction=False) as pipe:
+            for scope in scopes:
+                counter = self._counter_key(scope)
+                pipe.incr(counter)
+                pipe.expire(counter, self.generation_ttl)
+            pipe.execute()
+        return len(scopes)
+
+
+def tenant_scope(tenant_id: object) -> str:
+    """Scope of everything cached for a tenant."""
+    return f"tenant:{tenant_id}"
+
+
+def user_scope(tenant_id: object, user_id: object) -> str:
+    """Scope of entries computed for one user."""
+    return f"user:{tenant_id}:{user_id}"
+
+
+def task_scope(tenant_id: object, task_id: object) -> str:
+    """Scope of entries derived from one task."""
+    return f"task:{tenant_id}:{task_id}"
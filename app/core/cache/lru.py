@@ -0,0 +1,69 @@
+"""Thread-safe in-process LRU cache with hit and miss statistics."""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+
+class LRUCache[K, V]:
+    """LRU map shared by the threads of one process.
+
+    Subclasses build keys and values in their own get() and go through
+    lookup() and store(), which keep the recency order, evict beyond
+    maxsize and count hits and misses for get_stats().
+    """
+
+    def __init__(self, maxsize: int):
+        """Initialize cache.
+
+        Args:
+            maxsize: Maximum entries kept
+        """
+        self.maxsize = maxsize
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def lookup(self, key: K) -> V | None:
+        """Get an entry and mark it most recent, or None (counted as a miss)."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def store(self, key: K, value: V) -> None:
+        """Add or replace an entry, evicting the least recent beyond maxsize."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, predicate: Callable[[K], bool]) -> None:
+        """Drop every entry whose key matches predicate."""
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / total, 4) if total else 0.0,
+            }
@@ -1,29 +1,65 @@
 """Task cache service using Redis."""
 
+import hashlib
 import json
 from typing import Any
 from uuid import UUID
 
+from redis.asyncio import Redis
+
+from app.core.cache.generations import CacheGenerations, tenant_scope, user_scope
 from app.core.redis import get_redis_client
 
 
 class TaskCache:
-    """Cache para tareas usando Redis."""
+    """Cache para tareas usando Redis.
+
+    Las claves de listas y estadísticas incluyen la generación de su usuario
+    y tenant: invalidar incrementa un contador en lugar de buscar claves con
+    KEYS, que bloquea Redis mientras recorre todo el keyspace.
+    """
 
     def __init__(self):
-        """Inicializa el cache con cliente Redis."""
-        self.redis = get_redis_client()
+        """Inicializa el cache (el cliente Redis se obtiene al primer uso)."""
+        self._redis: Redis | None = None
         self.default_ttl = 300  # 5 minutos
+        self.generations = CacheGenerations("tasks")
+
+    async def _client(self) -> Redis:
+        if self._redis is None:
+            self._redis = await get_redis_client()
+        return self._redis
+
+    @staticmethod
+    def _user_tasks_scope(user_id: UUID) -> str:
+        return f"user_tasks:{user_id}"
+
+    async def _user_tasks_key(self, redis: Redis, user_id: UUID, filters: dict) -> str:
+        # hash() cambia entre procesos; sha256 da la misma clave en todos
+        filters_hash = hashlib.sha256(
+            json.dumps(filters, sort_keys=True, default=str).encode()
+        ).hexdigest()[:16]
+        return await self.generations.key(
+            redis,
+            f"tasks:user:{user_id}:{filters_hash}",
+            [self._user_tasks_scope(user_id)],
+        )
+
+    async def _stats_key(self, redis: Redis, tenant_id: UUID, user_id: UUID) -> str:
+        return await self.generations.key(
+            redis,
+            f"task_stats:{tenant_id}:{user_id}",
+            [tenant_scope(tenant_id), user_scope(tenant_id, user_id)],
+        )
 
     async def get_user_tasks(
         self, user_id: UUID, filters: dict | None = None
     ) -> list[dict] | None:
         """Obtiene tareas cacheadas de usuario."""
-        filters = filters or {}
-        cache_key = f"tasks:user:{user_id}:{hash(json.dumps(filters, sort_keys=True))}"
-
         try:
-            cached = await self.redis.get(cache_key)
+            redis = await self._client()
+            cache_key = await self._user_tasks_key(redis, user_id, filters or {})
+            cached = await redis.get(cache_key)
             if cached:
                 return json.loads(cached)
         except Exception:
@@ -39,27 +75,23 @@ async def set_user_tasks(
         if tasks is None:
             return
 
-        filters = filters or {}
-        cache_key = f"tasks:user:{user_id}:{hash(json.dumps(filters, sort_keys=True))}"
-
         try:
+            redis = await self._client()
+            cache_key = await self._user_tasks_key(redis, user_id, filters or {})
             # Serializar tareas
             tasks_data = [self._serialize_task(task) for task in tasks]
 
-            await self.redis.setex(cache_key, self.default_ttl, json.dumps(tasks_data))
+            await redis.setex(cache_key, self.default_ttl, json.dumps(tasks_data))
         except Exception:
             # Si falla el cache, continuar sin error
             pass
 
     async def invalidate_user_tasks(self, user_id: UUID):
         """Invalida cache de tareas de usuario."""
-        pattern = f"tasks:user:{user_id}:*"
-
         try:
-            keys = await self.redis.keys(pattern)
-
-            if keys:
-                await self.redis.delete(*keys)
+            await self.generations.bump(
+                await self._client(), [self._user_tasks_scope(user_id)]
+            )
         except Exception:
             # Si falla la invalidación, continuar sin error
             pass
@@ -69,7 +101,7 @@ async def get_task(self, task_id: UUID, tenant_id: UUID) -> dict | None:
         cache_key = f"task:{tenant_id}:{task_id}"
 
         try:
-            cached = await self.redis.get(cache_key)
+            cached = await (await self._client()).get(cache_key)
             if cached:
                 return json.loads(cached)
         except Exception:
@@ -86,7 +118,9 @@ async def set_task(self, task: Any, tenant_id: UUID):
 
         try:
             task_data = self._serialize_task(task)
-            await self.redis.setex(cache_key, self.default_ttl, json.dumps(task_data))
+            await (await self._client()).setex(
+                cache_key, self.default_ttl, json.dumps(task_data)
+            )
         except Exception:
             pass
 
@@ -95,16 +129,16 @@ async def invalidate_task(self, task_id: UUID, tenant_id: UUID):
         cache_key = f"task:{tenant_id}:{task_id}"
 
         try:
-            await self.redis.delete(cache_key)
+            await (await self._client()).delete(cache_key)
         except Exception:
             pass
 
     async def get_task_stats(self, tenant_id: UUID, user_id: UUID) -> dict | None:
         """Obtiene estadísticas cacheadas de tareas."""
-        cache_key = f"task_stats:{tenant_id}:{user_id}"
-
         try:
-            cached = await self.redis.get(cache_key)
+            redis = await self._client()
+            cache_key = await self._stats_key(redis, tenant_id, user_id)
+            cached = await redis.get(cache_key)
             if cached:
                 return json.loads(cached)
         except Exception:
@@ -114,31 +148,24 @@ async def get_task_stats(self, tenant_id: UUID, user_id: UUID) -> dict | None:
 
     async def set_task_stats(self, tenant_id: UUID, user_id: UUID, stats: dict):
         """Cachea estadísticas de tareas."""
-        cache_key = f"task_stats:{tenant_id}:{user_id}"
-
         try:
+            redis = await self._client()
+            cache_key = await self._stats_key(redis, tenant_id, user_id)
             # Stats se cachean por más tiempo (15 minutos)
-            await self.redis.setex(cache_key, 900, json.dumps(stats))
+            await redis.setex(cache_key, 900, json.dumps(stats))
         except Exception:
             pass
 
     async def invalidate_task_stats(self, tenant_id: UUID, user_id: UUID | None = None):
-        """Invalida cache de estadísticas."""
+        """Invalida cache de estadísticas (todas las del tenant sin user_id)."""
         if user_id:
-            cache_key = f"task_stats:{tenant_id}:{user_id}"
-            try:
-                await self.redis.delete(cache_key)
-            except Exception:
-                pass
+            scope = user_scope(tenant_id, user_id)
         else:
-            # Invalidar todas las stats del tenant
-            pattern = f"task_stats:{tenant_id}:*"
-            try:
-                keys = await self.redis.keys(pattern)
-                if keys:
-                    await self.redis.delete(*keys)
-            except Exception:
-                pass
+            scope = tenant_scope(tenant_id)
+        try:
+            await self.generations.bump(await self._client(), [scope])
+        except Exception:
+            pass
 
     def _serialize_task(self, task: Any) -> dict:
         """Serializa una tarea para cache."""
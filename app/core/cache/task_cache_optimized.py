@@ -1,7 +1,9 @@
 """Servicio de caché optimizado para tareas con Redis y estrategias avanzadas."""
 
+import hashlib
 import json
 import logging
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
@@ -9,6 +11,12 @@
 import redis.asyncio as redis
 from redis.asyncio import Redis
 
+from app.core.cache.generations import (
+    CacheGenerations,
+    task_scope,
+    tenant_scope,
+    user_scope,
+)
 from app.core.config_file import get_settings
 
 logger = logging.getLogger(__name__)
@@ -30,6 +38,9 @@ def __init__(self, redis_url: str | None = None) -> None:
             "sets": 0,
             "deletes": 0,
         }
+        # Las claves incluyen la generación de cada ámbito del que dependen;
+        # invalidar es incrementar un contador, sin recorrer el keyspace
+        self.generations = CacheGenerations("tasks")
 
     async def connect(self) -> None:
         """Conectar a Redis."""
@@ -118,15 +129,24 @@ async def delete(self, key: str) -> bool:
             logger.error(f"Error eliminando caché para key {key}: {e}")
             return False
 
-    async def delete_pattern(self, pattern: str) -> int:
-        """Eliminar claves que coincidan con patrón."""
+    async def delete_pattern(self, pattern: str, batch_size: int = 500) -> int:
+        """Eliminar claves que coincidan con patrón (solo mantenimiento).
+
+        Recorre el keyspace con SCAN y borra por lotes con UNLINK, sin
+        bloquear Redis como KEYS. La invalidación normal usa generaciones.
+        """
         try:
-            keys = await self.redis.keys(pattern)
-            if keys:
-                result = await self.redis.delete(*keys)
-                self.stats["deletes"] += result
-                return result
-            return 0
+            deleted = 0
+            batch: list[str] = []
+            async for key in self.redis.scan_iter(match=pattern, count=batch_size):
+                batch.append(key)
+                if len(batch) >= batch_size:
+                    deleted += await self.redis.unlink(*batch)
+                    batch.clear()
+            if batch:
+                deleted += await self.redis.unlink(*batch)
+            self.stats["deletes"] += deleted
+            return deleted
         except Exception as e:
             logger.error(f"Error eliminando patrón {pattern}: {e}")
             return 0
@@ -160,17 +180,63 @@ async def extend_ttl(self, key: str, additional_ttl: int) -> bool:
             return False
 
     # Métodos especializados para caché de tareas
+    async def _scoped_key(self, base: str, scopes: Iterable[str]) -> str | None:
+        """Construir la clave con las generaciones actuales de sus ámbitos."""
+        try:
+            return await self.generations.key(self.redis, base, scopes)
+        except Exception as e:
+            logger.error(f"Error obteniendo generaciones para key {base}: {e}")
+            return None
+
+    async def _get_scoped(self, base: str, scopes: Iterable[str]) -> Any | None:
+        key = await self._scoped_key(base, scopes)
+        if key is None:
+            self.stats["misses"] += 1
+            return None
+        return await self.get(key)
+
+    async def _set_scoped(
+        self, base: str, scopes: Iterable[str], value: Any, ttl: int
+    ) -> None:
+        key = await self._scoped_key(base, scopes)
+        if key is not None:
+            await self.set(key, value, ttl)
+
+    @staticmethod
+    def _filters_hash(filters: dict[str, Any]) -> str:
+        """Hash estable de los filtros (hash() cambia entre procesos)."""
+        filter_parts = [f"{k}:{v}" for k, v in sorted(filters.items()) if v is not None]
+        return hashlib.sha256("|".join(filter_parts).encode()).hexdigest()[:16]
+
+    @staticmethod
+    def _groups_key(group_ids: tuple) -> str:
+        return ",".join(sorted(str(gid) for gid in group_ids)) if group_ids else "none"
+
+    @staticmethod
+    def _task_list_scope(tenant_id: UUID) -> str:
+        return f"task_list:{tenant_id}"
+
+    @staticmethod
+    def _visibility_scope(tenant_id: UUID) -> str:
+        return f"visible_tasks:{tenant_id}"
+
     async def cache_task(
         self, task_id: UUID, tenant_id: UUID, task_data: dict, ttl: int = 300
     ) -> None:
         """Cachear una tarea individual."""
-        key = f"task:{task_id}:{tenant_id}"
-        await self.set(key, task_data, ttl)
+        await self._set_scoped(
+            f"task:{task_id}:{tenant_id}",
+            [tenant_scope(tenant_id), task_scope(tenant_id, task_id)],
+            task_data,
+            ttl,
+        )
 
     async def get_cached_task(self, task_id: UUID, tenant_id: UUID) -> dict | None:
         """Obtener tarea cachéada."""
-        key = f"task:{task_id}:{tenant_id}"
-        return await self.get(key)
+        return await self._get_scoped(
+            f"task:{task_id}:{tenant_id}",
+            [tenant_scope(tenant_id), task_scope(tenant_id, task_id)],
+        )
 
     async def cache_task_list(
         self,
@@ -180,16 +246,12 @@ async def cache_task_list(
         ttl: int = 120,
     ) -> None:
         """Cachear listado de tareas con filtros."""
-        # Crear clave basada en filtros
-        filter_parts = []
-        for k, v in sorted(filters.items()):
-            if v is not None:
-                filter_parts.append(f"{k}:{v}")
-
-        filter_hash = hash(tuple(filter_parts))
-        key = f"task_list:{tenant_id}:{filter_hash}"
-
-        await self.set(key, tasks, ttl)
+        await self._set_scoped(
+            f"task_list:{tenant_id}:{self._filters_hash(filters)}",
+            [tenant_scope(tenant_id), self._task_list_scope(tenant_id)],
+            tasks,
+            ttl,
+        )
 
     async def get_cached_task_list(
         self,
@@ -197,15 +259,10 @@ async def get_cached_task_list(
         filters: dict[str, Any],
     ) -> list[dict] | None:
         """Obtener listado de tareas cachéado."""
-        filter_parts = []
-        for k, v in sorted(filters.items()):
-            if v is not None:
-                filter_parts.append(f"{k}:{v}")
-
-        filter_hash = hash(tuple(filter_parts))
-        key = f"task_list:{tenant_id}:{filter_hash}"
-
-        result = await self.get(key)
+        result = await self._get_scoped(
+            f"task_list:{tenant_id}:{self._filters_hash(filters)}",
+            [tenant_scope(tenant_id), self._task_list_scope(tenant_id)],
+        )
         return result if isinstance(result, list) else None
 
     async def cache_user_visibility(
@@ -217,12 +274,16 @@ async def cache_user_visibility(
         ttl: int = 60,
     ) -> None:
         """Cachear tareas visibles para usuario."""
-        groups_str = (
-            ",".join(sorted(str(gid) for gid in group_ids)) if group_ids else "none"
+        await self._set_scoped(
+            f"visible_tasks:{tenant_id}:{user_id}:{self._groups_key(group_ids)}",
+            [
+                tenant_scope(tenant_id),
+                self._visibility_scope(tenant_id),
+                user_scope(tenant_id, user_id),
+            ],
+            tasks,
+            ttl,
         )
-        key = f"visible_tasks:{tenant_id}:{user_id}:{groups_str}"
-
-        await self.set(key, tasks, ttl)
 
     async def get_cached_user_visibility(
         self,
@@ -231,25 +292,29 @@ async def get_cached_user_visibility(
         group_ids: tuple,
     ) -> list[dict] | None:
         """Obtener tareas visibles cachéadas para usuario."""
-        groups_str = (
-            ",".join(sorted(str(gid) for gid in group_ids)) if group_ids else "none"
+        result = await self._get_scoped(
+            f"visible_tasks:{tenant_id}:{user_id}:{self._groups_key(group_ids)}",
+            [
+                tenant_scope(tenant_id),
+                self._visibility_scope(tenant_id),
+                user_scope(tenant_id, user_id),
+            ],
         )
-        key = f"visible_tasks:{tenant_id}:{user_id}:{groups_str}"
-
-        result = await self.get(key)
         return result if isinstance(result, list) else None
 
     async def cache_task_statistics(
         self, tenant_id: UUID, stats: dict, ttl: int = 600
     ) -> None:
         """Cachear estadísticas de tareas."""
-        key = f"task_stats:{tenant_id}"
-        await self.set(key, stats, ttl)
+        await self._set_scoped(
+            f"task_stats:{tenant_id}", [tenant_scope(tenant_id)], stats, ttl
+        )
 
     async def get_cached_task_statistics(self, tenant_id: UUID) -> dict | None:
         """Obtener estadísticas cachéadas."""
-        key = f"task_stats:{tenant_id}"
-        result = await self.get(key)
+        result = await self._get_scoped(
+            f"task_stats:{tenant_id}", [tenant_scope(tenant_id)]
+        )
         return result if isinstance(result, dict) else None
 
     async def cache_search_results(
@@ -260,8 +325,12 @@ async def cache_search_results(
         ttl: int = 180,
     ) -> None:
         """Cachear resultados de búsqueda."""
-        key = f"task_search:{tenant_id}:{query_hash}"
-        await self.set(key, results, ttl)
+        await self._set_scoped(
+            f"task_search:{tenant_id}:{query_hash}",
+            [tenant_scope(tenant_id)],
+            results,
+            ttl,
+        )
 
     async def get_cached_search_results(
         self,
@@ -269,46 +338,38 @@ async def get_cached_search_results(
         query_hash: str,
     ) -> list[dict] | None:
         """Obtener resultados de búsqueda cachéados."""
-        key = f"task_search:{tenant_id}:{query_hash}"
-        result = await self.get(key)
+        result = await self._get_scoped(
+            f"task_search:{tenant_id}:{query_hash}", [tenant_scope(tenant_id)]
+        )
         return result if isinstance(result, list) else None
 
+    async def invalidate_scopes(self, scopes: Iterable[str]) -> int:
+        """Invalidar ámbitos en un solo round trip (pipeline)."""
+        try:
+            return await self.generations.bump(self.redis, scopes)
+        except Exception as e:
+            logger.error(f"Error invalidando caché: {e}")
+            return 0
+
     async def invalidate_user_cache(self, tenant_id: UUID, user_id: UUID) -> None:
         """Invalidar todo el caché relacionado con un usuario."""
-        patterns = [
-            f"visible_tasks:{tenant_id}:{user_id}:*",
-            f"task_list:{tenant_id}:*",
-        ]
-
-        for pattern in patterns:
-            await self.delete_pattern(pattern)
+        await self.invalidate_scopes(
+            [user_scope(tenant_id, user_id), self._task_list_scope(tenant_id)]
+        )
 
     async def invalidate_task_cache(self, tenant_id: UUID, task_id: UUID) -> None:
         """Invalidar caché de una tarea específica."""
-        keys = [
-            f"task:{task_id}:{tenant_id}",
-            f"task_list:{tenant_id}:*",
-            f"visible_tasks:{tenant_id}:*",
-        ]
-
-        for key in keys:
-            if "*" in key:
-                await self.delete_pattern(key)
-            else:
-                await self.delete(key)
+        await self.invalidate_scopes(
+            [
+                task_scope(tenant_id, task_id),
+                self._task_list_scope(tenant_id),
+                self._visibility_scope(tenant_id),
+            ]
+        )
 
     async def invalidate_tenant_cache(self, tenant_id: UUID) -> None:
         """Invalidar todo el caché de un tenant."""
-        patterns = [
-            f"task:{tenant_id}:*",
-            f"task_list:{tenant_id}:*",
-            f"visible_tasks:{tenant_id}:*",
-            f"task_stats:{tenant_id}",
-            f"task_search:{tenant_id}:*",
-        ]
-
-        for pattern in patterns:
-            await self.delete_pattern(pattern)
+        await self.invalidate_scopes([tenant_scope(tenant_id)])
 
     # Métodos de mantenimiento y estadísticas
     async def get_stats(self) -> dict[str, Any]:
@@ -0,0 +1,276 @@
+"""Free/busy service for users and calendar resources.
+
+Busy time is loaded once per kind for a whole window (one query for users,
+one for resources), recurring events are expanded with the occurrence cache,
+and every participant ends up with a sorted list of merged busy intervals.
+Common free time is then found with a sweep over all lists at once, and each
+resource is checked per slot with a binary search, instead of one COUNT
+query per resource and slot.
+"""
+
+import heapq
+from bisect import bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+
+from app.core.calendar.recurrence import (
+    event_rule,
+    get_occurrence_cache,
+    is_recurring,
+)
+from app.models.calendar import CalendarEvent, CalendarResource
+from app.repositories.calendar_repository import CalendarRepository
+
+Interval = tuple[datetime, datetime]
+
+
+@dataclass(frozen=True)
+class MeetingSlot:
+    """Time slot free for all participants, with the resources free for it."""
+
+    start_time: datetime
+    end_time: datetime
+    resource_ids: tuple[UUID, ...] = ()
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> list[Interval]:
+    """Sort intervals and merge overlapping or touching ones."""
+    merged: list[Interval] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def free_intervals(
+    busy: Iterable[list[Interval]], window_start: datetime, window_end: datetime
+) -> list[Interval]:
+    """Get the time in a window that is free in every busy list.
+
+    Args:
+        busy: Sorted busy interval lists (one per participant)
+        window_start: Window start
+        window_end: Window end
+
+    Returns:
+        Sorted free intervals
+    """
+    free: list[Interval] = []
+    cursor = window_start
+    for start, end in heapq.merge(*busy):
+        if start >= window_end:
+            break
+        if start > cursor:
+            free.append((cursor, start))
+        cursor = max(cursor, end)
+    if cursor < window_end:
+        free.append((cursor, window_end))
+    return free
+
+
+def is_free(busy: list[Interval], start: datetime, end: datetime) -> bool:
+    """Whether [start, end) does not overlap a sorted, merged busy list."""
+    index = bisect_right(busy, start, key=lambda interval: interval[0])
+    # The interval starting at or before start must end by then; the next one
+    # must start at or after end
+    if index and busy[index - 1][1] > start:
+        return False
+    return index == len(busy) or busy[index][0] >= end
+
+
+def find_slots(
+    busy: Iterable[list[Interval]],
+    window_start: datetime,
+    window_end: datetime,
+    duration: timedelta,
+    limit: int,
+    step: timedelta | None = None,
+    resource_busy: dict[UUID, list[Interval]] | None = None,
+) -> list[MeetingSlot]:
+    """Find the first slots of a given length that are free for everybody.
+
+    Args:
+        busy: Sorted, merged busy lists of the participants
+        window_start: Window start
+        window_end: Window end
+        duration: Slot length
+        limit: Maximum number of slots
+        step: Slot start grid from window_start (defaults to back-to-back
+            slots from the start of each free interval)
+        resource_busy: Busy lists of candidate resources; when given, only
+            slots with at least one free resource are returned
+
+    Returns:
+        Slots in time order
+    """
+    slots: list[MeetingSlot] = []
+    for free_start, free_end in free_intervals(busy, window_start, window_end):
+        if step:
+            offset = -((window_start - free_start) // step)
+            start = window_start + offset * step
+        else:
+            start = free_start
+        while start + duration <= free_end:
+            end = start + duration
+            if resource_busy is None:
+                slots.append(MeetingSlot(start, end))
+            else:
+                rooms = tuple(
+                    resource_id
+                    for resource_id, intervals in resource_busy.items()
+                    if is_free(intervals, start, end)
+                )
+                if rooms:
+                    slots.append(MeetingSlot(start, end, rooms))
+            if len(slots) >= limit:
+                return slots
+            start += step or duration
+    return slots
+
+
+class FreeBusyService:
+    """Service answering free/busy and meeting slot queries."""
+
+    def __init__(self, db: Session) -> None:
+        """Initialize service with database session."""
+        self.db = db
+        self.repository = CalendarRepository(db)
+
+    def get_busy(
+        self,
+        tenant_id: UUID,
+        window_start: datetime,
+        window_end: datetime,
+        user_ids: list[UUID] | None = None,
+        resource_ids: list[UUID] | None = None,
+    ) -> tuple[dict[UUID, list[Interval]], dict[UUID, list[Interval]]]:
+        """Get merged busy intervals of users and resources in a window.
+
+        Args:
+            tenant_id: Tenant ID
+            window_start: Window start
+            window_end: Window end
+            user_ids: Users (organizer or attendee of the events)
+            resource_ids: Resources (rooms, equipment) booked by the events
+
+        Returns:
+            (busy intervals by user ID, busy intervals by resource ID), each
+            list sorted and merged; every requested ID is present
+        """
+        user_ids = list(user_ids or [])
+        resource_ids = list(resource_ids or [])
+        user_events = self.repository.get_user_busy_events(
+            tenant_id, user_ids, window_start, window_end
+        )
+        resource_events = self.repository.get_resource_busy_events(
+            tenant_id, resource_ids, window_start, window_end
+        )
+        masters = {
+            event.id: event
+            for _, event in user_events + resource_events
+            if is_recurring(event)
+        }
+        overridden = self.repository.get_overridden_starts(list(masters), window_end)
+
+        def busy(
+            rows: list[tuple[UUID, CalendarEvent]], ids: list[UUID]
+        ) -> dict[UUID, list[Interval]]:
+            intervals: dict[UUID, list[Interval]] = {id_: [] for id_ in ids}
+            for owner_id, event in rows:
+                intervals[owner_id].extend(
+                    self._event_intervals(
+                        event, window_start, window_end, overridden.get(event.id)
+                    )
+                )
+            return {
+                owner_id: merge_intervals(owner_intervals)
+                for owner_id, owner_intervals in intervals.items()
+            }
+
+        return busy(user_events, user_ids), busy(resource_events, resource_ids)
+
+    def find_meeting_slots(
+        self,
+        tenant_id: UUID,
+        user_ids: list[UUID],
+        window_start: datetime,
+        window_end: datetime,
+        duration: timedelta,
+        limit: int = 5,
+        step: timedelta | None = None,
+        resource_ids: list[UUID] | None = None,
+    ) -> list[MeetingSlot]:
+        """Find the first slots free for all users (and with a free resource).
+
+        Args:
+            tenant_id: Tenant ID
+            user_ids: Participants
+            window_start: Window start
+            window_end: Window end
+            duration: Meeting length
+            limit: Maximum number of slots
+            step: Slot start grid (e.g., 15 minutes)
+            resource_ids: Candidate resources; inactive ones and rooms with a
+                capacity below the number of participants are left out
+
+        Returns:
+            Slots in time order
+        """
+        candidates = None
+        if resource_ids:
+            candidates = list(
+                self.db.scalars(
+                    select(CalendarResource.id).where(
+                        CalendarResource.tenant_id == tenant_id,
+                        CalendarResource.id.in_(resource_ids),
+                        CalendarResource.is_active.is_(True),
+                        or_(
+                            CalendarResource.capacity.is_(None),
+                            CalendarResource.capacity >= len(user_ids),
+                        ),
+                    )
+                )
+            )
+            if not candidates:
+                return []
+
+        user_busy, resource_busy = self.get_busy(
+            tenant_id, window_start, window_end, user_ids, candidates
+        )
+        return find_slots(
+            user_busy.values(),
+            window_start,
+            window_end,
+            duration,
+            limit,
+            step,
+            resource_busy if candidates else None,
+        )
+
+    @staticmethod
+    def _event_intervals(
+        event: CalendarEvent,
+        window_start: datetime,
+        window_end: datetime,
+        overridden: set[datetime] | None,
+    ) -> list[Interval]:
+        if not is_recurring(event):
+            return [(event.start_time, event.end_time)]
+        try:
+            event_rule(event)
+        except ValueError:
+            return [(event.start_time, event.end_time)]
+        duration = event.end_time - event.start_time
+        return [
+            (start, start + duration)
+            for start in get_occurrence_cache().get(event, window_start, window_end)
+            if not overridden or start not in overridden
+        ]
@@ -0,0 +1,506 @@
+"""Server-side expansion of recurring calendar events.
+
+A recurring event is stored once (the master row), with an RFC 5545 RRULE in
+recurrence_rule or the simple recurrence_* fields. Occurrences are generated
+lazily, period by period, in the event's timezone (so a 09:00 meeting stays
+at 09:00 across DST changes):
+
+- Expansion starts at the first period that can reach the requested window,
+  so a window costs the same however old the series is (COUNT rules are
+  walked from the start, which COUNT keeps short)
+- recurrence_exdates remove occurrences; single-occurrence overrides are
+  separate rows (recurrence_master_id, recurrence_original_start) that the
+  caller swaps in
+- OccurrenceCache keeps the expanded starts per (event, window), keyed by the
+  values of the recurrence fields, so an edited series is simply expanded again
+
+Supported RRULE parts: FREQ (DAILY, WEEKLY, MONTHLY, YEARLY), INTERVAL,
+COUNT, UNTIL, BYDAY (with ordinals for MONTHLY/YEARLY), BYMONTHDAY, BYMONTH
+and WKST=MO.
+"""
+
+import calendar
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time, timedelta
+from typing import Any
+from uuid import UUID
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from app.core.cache.lru import LRUCache
+from app.core.config_file import get_settings
+from app.models.calendar import CalendarEvent, RecurrenceType
+
+FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY", "YEARLY")
+WEEKDAYS = {"MO": 0, "TU": 1, "WE": 2, "TH": 3, "FR": 4, "SA": 5, "SU": 6}
+
+SIMPLE_FREQUENCIES = {
+    RecurrenceType.DAILY.value: "DAILY",
+    RecurrenceType.WEEKLY.value: "WEEKLY",
+    RecurrenceType.MONTHLY.value: "MONTHLY",
+    RecurrenceType.YEARLY.value: "YEARLY",
+}
+
+# Consecutive periods without a date before a rule is treated as exhausted
+# (e.g. BYMONTHDAY=30;BYMONTH=2 never matches)
+MAX_EMPTY_PERIODS = 1000
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    """Parsed recurrence rule."""
+
+    freq: str
+    interval: int = 1
+    count: int | None = None
+    until: datetime | None = None  # Naive values are in the event's timezone
+    by_day: tuple[tuple[int | None, int], ...] = ()  # (ordinal, weekday)
+    by_month_day: tuple[int, ...] = ()
+    by_month: tuple[int, ...] = ()
+
+
+@dataclass(frozen=True)
+class EventOccurrence:
+    """One occurrence of an event inside a time window.
+
+    event is the master row for occurrences of a recurring event (then
+    recurrence_id is the occurrence's original start), or the row itself for
+    single events and overrides.
+    """
+
+    event: CalendarEvent
+    start_time: datetime
+    end_time: datetime
+    recurrence_id: datetime | None = None
+
+    @property
+    def master_event_id(self) -> UUID | None:
+        """ID of the recurring event this occurrence belongs to."""
+        if self.recurrence_id is not None and self.event.recurrence_master_id is None:
+            return self.event.id
+        return self.event.recurrence_master_id
+
+
+def parse_rrule(rule: str) -> RecurrenceRule:
+    """Parse an RFC 5545 RRULE value.
+
+    Args:
+        rule: RRULE string (e.g., 'FREQ=WEEKLY;BYDAY=MO,WE,FR'), optionally
+            prefixed with 'RRULE:'
+
+    Returns:
+        Parsed rule
+
+    Raises:
+        ValueError: If the rule is invalid or uses unsupported parts
+    """
+    rule = rule.strip()
+    if rule.upper().startswith("RRULE:"):
+        rule = rule[6:]
+    parts: dict[str, str] = {}
+    for part in filter(None, rule.split(";")):
+        key, sep, value = part.partition("=")
+        if not sep or not value:
+            raise ValueError(f"Invalid RRULE part: {part}")
+        parts[key.strip().upper()] = value.strip().upper()
+
+    freq = parts.pop("FREQ", None)
+    if freq not in FREQUENCIES:
+        raise ValueError(f"Unsupported RRULE FREQ: {freq}")
+    if parts.pop("WKST", "MO") != "MO":
+        raise ValueError("Only WKST=MO is supported")
+    if "COUNT" in parts and "UNTIL" in parts:
+        raise ValueError("RRULE cannot have both COUNT and UNTIL")
+
+    try:
+        interval = int(parts.pop("INTERVAL", "1"))
+        count = int(parts.pop("COUNT")) if "COUNT" in parts else None
+        until = _parse_until(parts.pop("UNTIL")) if "UNTIL" in parts else None
+        by_day = tuple(_parse_weekday(day) for day in _split(parts.pop("BYDAY", "")))
+        by_month_day = tuple(int(day) for day in _split(parts.pop("BYMONTHDAY", "")))
+        by_month = tuple(int(month) for month in _split(parts.pop("BYMONTH", "")))
+    except (KeyError, ValueError) as e:
+        raise ValueError(f"Invalid RRULE value: {e}") from e
+    if parts:
+        raise ValueError(f"Unsupported RRULE parts: {', '.join(sorted(parts))}")
+    if interval < 1 or (count is not None and count < 1):
+        raise ValueError("RRULE INTERVAL and COUNT must be positive")
+    if any(not 1 <= abs(day) <= 31 for day in by_month_day):
+        raise ValueError("RRULE BYMONTHDAY must be within 1..31 or -31..-1")
+    if any(not 1 <= month <= 12 for month in by_month):
+        raise ValueError("RRULE BYMONTH must be within 1..12")
+    if freq in ("DAILY", "WEEKLY") and any(ordinal for ordinal, _ in by_day):
+        raise ValueError(f"RRULE BYDAY ordinals are not allowed with FREQ={freq}")
+    return RecurrenceRule(
+        freq=freq,
+        interval=interval,
+        count=count,
+        until=until,
+        by_day=by_day,
+        by_month_day=by_month_day,
+        by_month=by_month,
+    )
+
+
+def _split(value: str) -> list[str]:
+    return [item for item in value.split(",") if item]
+
+
+def _parse_weekday(value: str) -> tuple[int | None, int]:
+    code = value[-2:]
+    if code not in WEEKDAYS:
+        raise ValueError(f"weekday {value}")
+    ordinal = int(value[:-2]) if value[:-2] else None
+    if ordinal is not None and not 1 <= abs(ordinal) <= 53:
+        raise ValueError(f"weekday {value}")
+    return ordinal, WEEKDAYS[code]
+
+
+def _parse_until(value: str) -> datetime:
+    if len(value) == 8:
+        # Date value: the whole day is included
+        return datetime.strptime(value, "%Y%m%d").replace(hour=23, minute=59, second=59)
+    if value.endswith("Z"):
+        return datetime.strptime(value, "%Y%m%dT%H%M%SZ").replace(tzinfo=UTC)
+    return datetime.strptime(value, "%Y%m%dT%H%M%S")
+
+
+def event_rule(event: CalendarEvent) -> RecurrenceRule | None:
+    """Get the recurrence rule of an event (None if it does not recur).
+
+    Raises:
+        ValueError: If recurrence_rule is invalid
+    """
+    if event.recurrence_rule:
+        return parse_rrule(event.recurrence_rule)
+    freq = SIMPLE_FREQUENCIES.get(event.recurrence_type or RecurrenceType.NONE.value)
+    if freq is None:
+        return None
+    by_day: tuple[tuple[int | None, int], ...] = ()
+    if event.recurrence_days_of_week and freq in ("DAILY", "WEEKLY"):
+        # ISO numbering: 1 = Monday ... 7 = Sunday (0 is accepted as Sunday)
+        by_day = tuple(
+            (None, (int(day) - 1) % 7)
+            for day in _split(event.recurrence_days_of_week.replace(" ", ""))
+        )
+    return RecurrenceRule(
+        freq=freq,
+        interval=max(event.recurrence_interval or 1, 1),
+        count=event.recurrence_count,
+        until=event.recurrence_end_date,
+        by_day=by_day,
+        by_month_day=(
+            (event.recurrence_day_of_month,)
+            if event.recurrence_day_of_month and freq in ("MONTHLY", "YEARLY")
+            else ()
+        ),
+        by_month=(
+            (event.recurrence_month_of_year,)
+            if event.recurrence_month_of_year and freq == "YEARLY"
+            else ()
+        ),
+    )
+
+
+def is_recurring(event: CalendarEvent) -> bool:
+    """Whether an event is the master of a recurring series."""
+    return bool(event.recurrence_rule) or (
+        (event.recurrence_type or RecurrenceType.NONE.value)
+        != RecurrenceType.NONE.value
+    )
+
+
+def event_zone(event: CalendarEvent) -> ZoneInfo:
+    """Timezone occurrences are generated in (UTC when unset or unknown)."""
+    if event.timezone:
+        try:
+            return ZoneInfo(event.timezone)
+        except (ZoneInfoNotFoundError, ValueError):
+            pass
+    return ZoneInfo("UTC")
+
+
+def iter_rule(
+    rule: RecurrenceRule,
+    dtstart: datetime,
+    zone: ZoneInfo,
+    after: datetime | None = None,
+) -> Iterator[datetime]:
+    """Yield occurrence starts of a rule in order, lazily.
+
+    Args:
+        rule: Recurrence rule
+        dtstart: Start of the first occurrence (timezone-aware)
+        zone: Timezone whose wall-clock time occurrences keep
+        after: Skip whole periods that end before this time (the caller still
+            filters occurrences); ignored for COUNT rules, counted from dtstart
+
+    Yields:
+        Occurrence starts in UTC, dtstart first
+    """
+    local_start = dtstart.astimezone(zone)
+    start_day = local_start.date()
+    wall_time = local_start.time().replace(tzinfo=None)
+    until = rule.until
+    if until is not None and until.tzinfo is None:
+        until = until.replace(tzinfo=zone)
+
+    # DTSTART is always the first occurrence (RFC 5545 3.8.5.3)
+    first = dtstart.astimezone(UTC)
+    if until is not None and first > until:
+        return
+    yield first
+    emitted = 1
+
+    period = 0
+    if after is not None and rule.count is None:
+        period = _first_period(rule, start_day, after.astimezone(zone).date())
+    empty = 0
+    while True:
+        try:
+            days = _period_dates(rule, start_day, period)
+        except (OverflowError, ValueError):
+            return  # Past the last representable date
+        empty = 0 if days else empty + 1
+        if empty > MAX_EMPTY_PERIODS:
+            return
+        for day in days:
+            if day <= start_day:
+                continue
+            start = _at(day, wall_time, zone)
+            if until is not None and start > until:
+                return
+            if rule.count is not None and emitted >= rule.count:
+                return
+            emitted += 1
+            yield start
+        period += 1
+
+
+def _at(day: date, wall_time: time, zone: ZoneInfo) -> datetime:
+    return datetime.combine(day, wall_time, tzinfo=zone).astimezone(UTC)
+
+
+def _first_period(rule: RecurrenceRule, start_day: date, target: date) -> int:
+    """Index of a period at or before the one containing target."""
+    if target <= start_day:
+        return 0
+    if rule.freq == "DAILY":
+        elapsed = (target - start_day).days
+    elif rule.freq == "WEEKLY":
+        elapsed = (_week_start(target) - _week_start(start_day)).days // 7
+    elif rule.freq == "MONTHLY":
+        elapsed = (target.year - start_day.year) * 12 + target.month - start_day.month
+    else:
+        elapsed = target.year - start_day.year
+    # One period of slack for occurrences spilling over from the previous one
+    return max(elapsed // rule.interval - 1, 0)
+
+
+def _week_start(day: date) -> date:
+    return day - timedelta(days=day.weekday())
+
+
+def _period_dates(rule: RecurrenceRule, start_day: date, period: int) -> list[date]:
+    """Dates of the occurrences of one period, in order."""
+    step = period * rule.interval
+    if rule.freq == "DAILY":
+        day = start_day + timedelta(days=step)
+        return [day] if _matches_day(rule, day) else []
+    if rule.freq == "WEEKLY":
+        monday = _week_start(start_day) + timedelta(weeks=step)
+        weekdays = sorted({weekday for _, weekday in rule.by_day}) or [
+            start_day.weekday()
+        ]
+        days = [monday + timedelta(days=weekday) for weekday in weekdays]
+        return [day for day in days if not rule.by_month or day.month in rule.by_month]
+    if rule.freq == "MONTHLY":
+        month_index = start_day.month - 1 + step
+        year, month = start_day.year + month_index // 12, month_index % 12 + 1
+        if rule.by_month and month not in rule.by_month:
+            return []
+        return _month_dates(rule, year, month, start_day.day)
+
+    year = start_day.year + step
+    if rule.by_day and not rule.by_month and not rule.by_month_day:
+        return _year_weekday_dates(rule, year)
+    # BYMONTHDAY without BYMONTH applies to every month of the year (RFC 5545)
+    months = rule.by_month or (
+        range(1, 13) if rule.by_month_day else (start_day.month,)
+    )
+    days: list[date] = []
+    for month in months:
+        days.extend(_month_dates(rule, year, month, start_day.day))
+    return days
+
+
+def _matches_day(rule: RecurrenceRule, day: date) -> bool:
+    if rule.by_month and day.month not in rule.by_month:
+        return False
+    if rule.by_month_day:
+        last = calendar.monthrange(day.year, day.month)[1]
+        month_days = {d if d > 0 else last + 1 + d for d in rule.by_month_day}
+        if day.day not in month_days:
+            return False
+    if rule.by_day and day.weekday() not in {weekday for _, weekday in rule.by_day}:
+        return False
+    return True
+
+
+def _month_dates(
+    rule: RecurrenceRule, year: int, month: int, default_day: int
+) -> list[date]:
+    last = calendar.monthrange(year, month)[1]
+    if rule.by_month_day:
+        days = {d if d > 0 else last + 1 + d for d in rule.by_month_day}
+        days = {d for d in days if 1 <= d <= last}
+        if rule.by_day:
+            weekdays = {weekday for _, weekday in rule.by_day}
+            days = {d for d in days if date(year, month, d).weekday() in weekdays}
+    elif rule.by_day:
+        days = set()
+        for ordinal, weekday in rule.by_day:
+            first = (weekday - date(year, month, 1).weekday()) % 7 + 1
+            matches = list(range(first, last + 1, 7))
+            days.update(_pick(matches, ordinal))
+    else:
+        # A month without that day (e.g. the 31st) has no occurrence
+        days = {default_day} if default_day <= last else set()
+    return [date(year, month, d) for d in sorted(days)]
+
+
+def _year_weekday_dates(rule: RecurrenceRule, year: int) -> list[date]:
+    jan_first = date(year, 1, 1)
+    year_days = 366 if calendar.isleap(year) else 365
+    days: set[date] = set()
+    for ordinal, weekday in rule.by_day:
+        first = (weekday - jan_first.weekday()) % 7
+        matches = [
+            jan_first + timedelta(days=offset) for offset in range(first, year_days, 7)
+        ]
+        days.update(_pick(matches, ordinal))
+    return sorted(days)
+
+
+def _pick(matches: list, ordinal: int | None) -> list:
+    if ordinal is None:
+        return matches
+    index = ordinal - 1 if ordinal > 0 else ordinal
+    return [matches[index]] if -len(matches) <= index < len(matches) else []
+
+
+def _excluded(event: CalendarEvent, zone: ZoneInfo) -> tuple[set, set]:
+    """Excluded occurrence starts (UTC) and whole excluded local dates."""
+    starts: set[datetime] = set()
+    days: set[date] = set()
+    for value in event.recurrence_exdates or []:
+        try:
+            parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            continue
+        if len(str(value)) == 10:
+            days.add(parsed.date())
+        else:
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=zone)
+            starts.add(parsed.astimezone(UTC))
+    return starts, days
+
+
+def iter_event_starts(
+    event: CalendarEvent, range_start: datetime, range_end: datetime
+) -> Iterator[datetime]:
+    """Yield starts of the occurrences of a recurring event that overlap a range.
+
+    Exdates are applied; overrides are not (see CalendarService). Occurrences
+    are generated lazily, so long ranges can be streamed.
+
+    Raises:
+        ValueError: If the event's recurrence rule is invalid
+    """
+    rule = event_rule(event)
+    zone = event_zone(event)
+    duration = event.end_time - event.start_time
+    excluded_starts, excluded_days = _excluded(event, zone)
+    if rule is None:
+        starts: Iterator[datetime] = iter([event.start_time.astimezone(UTC)])
+    else:
+        starts = iter_rule(rule, event.start_time, zone, after=range_start - duration)
+    for start in starts:
+        if start >= range_end:
+            return
+        if start + duration <= range_start:
+            continue
+        if start in excluded_starts or start.astimezone(zone).date() in excluded_days:
+            continue
+        yield start
+
+
+def is_occurrence(event: CalendarEvent, start: datetime) -> bool:
+    """Whether a recurring event has an occurrence starting at start."""
+    start = start.astimezone(UTC)
+    return start in iter_event_starts(event, start, start + timedelta(microseconds=1))
+
+
+def recurrence_version(event: CalendarEvent) -> tuple[Any, ...]:
+    """Values of the fields that determine an event's occurrences."""
+    return (
+        event.start_time,
+        event.end_time,
+        event.timezone,
+        event.recurrence_type,
+        event.recurrence_rule,
+        event.recurrence_interval,
+        event.recurrence_count,
+        event.recurrence_end_date,
+        event.recurrence_days_of_week,
+        event.recurrence_day_of_month,
+        event.recurrence_month_of_year,
+        tuple(event.recurrence_exdates or ()),
+    )
+
+
+class OccurrenceCache(LRUCache[tuple, tuple[datetime, ...]]):
+    """LRU cache of expanded occurrence starts per (event, window).
+
+    Keys include recurrence_version, so editing a series (its rule, times or
+    exdates) expands it again and the old entries age out. Overrides are not
+    cached: they are looked up per request and swapped in by the caller.
+    """
+
+    def __init__(self, maxsize: int | None = None):
+        """Initialize cache.
+
+        Args:
+            maxsize: Maximum cached windows (defaults to CALENDAR_OCCURRENCE_CACHE_SIZE)
+        """
+        super().__init__(maxsize or get_settings().CALENDAR_OCCURRENCE_CACHE_SIZE)
+
+    def get(
+        self, event: CalendarEvent, window_start: datetime, window_end: datetime
+    ) -> tuple[datetime, ...]:
+        """Get starts of the occurrences overlapping a window, expanding on a miss.
+
+        Raises:
+            ValueError: If the event's recurrence rule is invalid
+        """
+        key = (event.id, recurrence_version(event), window_start, window_end)
+        starts = self.lookup(key)
+        if starts is not None:
+            return starts
+
+        starts = tuple(iter_event_starts(event, window_start, window_end))
+        self.store(key, starts)
+        return starts
+
+
+# Global cache instance
+_cache: OccurrenceCache | None = None
+
+
+def get_occurrence_cache() -> OccurrenceCache:
+    """Get global occurrence cache."""
+    global _cache
+    if _cache is None:
+        _cache = OccurrenceCache()
+    return _cache
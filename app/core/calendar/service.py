@@ -1,12 +1,22 @@
 """Calendar service for calendar and event management."""
 
+import heapq
 import logging
+from collections.abc import Iterator
 from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID
 
 from sqlalchemy.orm import Session
 
+from app.core.calendar.recurrence import (
+    EventOccurrence,
+    event_rule,
+    get_occurrence_cache,
+    is_occurrence,
+    is_recurring,
+    iter_event_starts,
+)
 from app.core.exceptions import APIException
 from app.core.notifications.service import NotificationService
 from app.core.pubsub import EventPublisher, get_event_publisher
@@ -27,6 +37,29 @@
 logger = logging.getLogger(__name__)
 
 
+def _aware(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC."""
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
+
+
+def _as_occurrence(event: CalendarEvent) -> EventOccurrence:
+    return EventOccurrence(
+        event, event.start_time, event.end_time, event.recurrence_original_start
+    )
+
+
+def _series_occurrences(
+    master: CalendarEvent,
+    range_start: datetime,
+    range_end: datetime,
+    overridden: set[datetime],
+) -> Iterator[EventOccurrence]:
+    duration = master.end_time - master.start_time
+    for start in iter_event_starts(master, range_start, range_end):
+        if start not in overridden:
+            yield EventOccurrence(master, start, start + duration, start)
+
+
 class CalendarService:
     """Service for calendar management."""
 
@@ -72,6 +105,7 @@ def create_calendar(
         # Publish event
         safe_publish_event(
             event_publisher=self.event_publisher,
+            db=self.db,
             event_type="calendar.created",
             entity_type="calendar",
             entity_id=calendar.id,
@@ -83,6 +117,7 @@ def create_calendar(
                 additional_data={"calendar_name": calendar.name},
             ),
         )
+        self.db.commit()
 
         return calendar
 
@@ -116,6 +151,7 @@ def delete_calendar(self, calendar_id: UUID, tenant_id: UUID) -> bool:
 
         safe_publish_event(
             event_publisher=self.event_publisher,
+            db=self.db,
             event_type="calendar.deleted",
             entity_type="calendar",
             entity_id=calendar.id,
@@ -127,6 +163,7 @@ def delete_calendar(self, calendar_id: UUID, tenant_id: UUID) -> bool:
                 additional_data={"calendar_name": calendar.name},
             ),
         )
+        self.db.commit()
 
         return True
 
@@ -145,7 +182,16 @@ def create_event(
 
         Returns:
             Created CalendarEvent object
+
+        Raises:
+            APIException: If end_time <= start_time
         """
+        if event_data["end_time"] <= event_data["start_time"]:
+            raise APIException(
+                status_code=400,
+                code="INVALID_EVENT_DURATION",
+                message="end_time must be after start_time",
+            )
         event_data["tenant_id"] = tenant_id
         event_data["organizer_id"] = organizer_id
         event_data["status"] = event_data.get("status", EventStatus.SCHEDULED)
@@ -169,6 +215,7 @@ def create_event(
         # Publish event
         safe_publish_event(
             event_publisher=self.event_publisher,
+            db=self.db,
             event_type="calendar.event_created",
             entity_type="calendar_event",
             entity_id=event.id,
@@ -184,6 +231,7 @@ def create_event(
                 },
             ),
         )
+        self.db.commit()
 
         return event
 
@@ -214,10 +262,15 @@ def get_user_events(
         end_date: datetime | None = None,
         skip: int = 0,
         limit: int = 100,
+        after: tuple[datetime, UUID] | None = None,
     ) -> list[CalendarEvent]:
-        """Get events for a user (as organizer or attendee)."""
+        """Get events for a user (as organizer or attendee).
+
+        Pass the (start_time, id) of the last event of a page as after to
+        read the next page by keyset instead of offset.
+        """
         return self.repository.get_events_by_user(
-            user_id, tenant_id, start_date, end_date, skip, limit
+            user_id, tenant_id, start_date, end_date, skip, limit, after
         )
 
     def count_events_by_calendar(
@@ -245,6 +298,110 @@ def count_user_events(
             user_id, tenant_id, start_date, end_date
         )
 
+    def get_occurrences(
+        self,
+        tenant_id: UUID,
+        window_start: datetime,
+        window_end: datetime,
+        calendar_id: UUID | None = None,
+        user_id: UUID | None = None,
+    ) -> list[EventOccurrence]:
+        """Get all event occurrences overlapping a window, in start order.
+
+        Recurring events are expanded for the window (cached per event and
+        window); overridden occurrences are replaced by their override rows.
+
+        Args:
+            tenant_id: Tenant ID
+            window_start: Window start
+            window_end: Window end
+            calendar_id: Only events of this calendar
+            user_id: Only events the user organizes or attends
+
+        Returns:
+            List of occurrences
+        """
+        singles = self.db.scalars(
+            self.repository.single_events_in_window_query(
+                tenant_id, window_start, window_end, calendar_id, user_id
+            )
+        )
+        occurrences = [_as_occurrence(event) for event in singles]
+
+        masters = self._expandable(
+            self.repository.get_recurring_events_in_window(
+                tenant_id, window_start, window_end, calendar_id, user_id
+            )
+        )
+        overridden = self.repository.get_overridden_starts(
+            [master.id for master in masters], window_end
+        )
+        cache = get_occurrence_cache()
+        for master in masters:
+            duration = master.end_time - master.start_time
+            skip = overridden.get(master.id, set())
+            occurrences.extend(
+                EventOccurrence(master, start, start + duration, start)
+                for start in cache.get(master, window_start, window_end)
+                if start not in skip
+            )
+
+        occurrences.sort(key=lambda occurrence: occurrence.start_time)
+        return occurrences
+
+    def iter_occurrences(
+        self,
+        tenant_id: UUID,
+        range_start: datetime,
+        range_end: datetime,
+        calendar_id: UUID | None = None,
+        user_id: UUID | None = None,
+    ) -> Iterator[EventOccurrence]:
+        """Stream event occurrences over a long range, in start order.
+
+        Unlike get_occurrences nothing is cached or held in memory: single
+        events are read in batches and each recurring event is expanded
+        lazily, merged by start time.
+        """
+        singles = (
+            _as_occurrence(event)
+            for event in self.db.scalars(
+                self.repository.single_events_in_window_query(
+                    tenant_id, range_start, range_end, calendar_id, user_id
+                ),
+                execution_options={"yield_per": 500},
+            )
+        )
+        masters = self._expandable(
+            self.repository.get_recurring_events_in_window(
+                tenant_id, range_start, range_end, calendar_id, user_id
+            )
+        )
+        overridden = self.repository.get_overridden_starts(
+            [master.id for master in masters], range_end
+        )
+        series = [
+            _series_occurrences(
+                master, range_start, range_end, overridden.get(master.id, set())
+            )
+            for master in masters
+        ]
+        return heapq.merge(
+            singles, *series, key=lambda occurrence: occurrence.start_time
+        )
+
+    def _expandable(self, masters: list[CalendarEvent]) -> list[CalendarEvent]:
+        """Drop recurring events whose rule cannot be expanded."""
+        valid = []
+        for master in masters:
+            try:
+                event_rule(master)
+            except ValueError as e:
+                logger.warning(f"Skipping recurring event {master.id}: {e}")
+                continue
+            valid.append(master)
+        return valid
+
     def update_event(
         self, event_id: UUID, tenant_id: UUID, event_data: dict
     ) -> CalendarEvent | None:
@@ -272,6 +429,7 @@ def update_event(
         # Publish event
         safe_publish_event(
             event_publisher=self.event_publisher,
+            db=self.db,
             event_type="calendar.event_updated",
             entity_type="calendar_event",
             entity_id=updated_event.id,
@@ -283,6 +441,7 @@ def update_event(
                 additional_data={"event_title": updated_event.title},
             ),
         )
+        self.db.commit()
 
         return updated_event
 
@@ -293,6 +452,7 @@ def move_event(
         new_start_time: datetime,
         preserve_duration: bool = True,
         scope: str = "single",
+        occurrence_start: datetime | None = None,
     ) -> CalendarEvent | None:
         """Move an event to a new start time.
 
@@ -302,14 +462,30 @@ def move_event(
             new_start_time: New start time
             preserve_duration: Whether to preserve event duration
             scope: 'single' or 'series' (for recurring events)
+            occurrence_start: Original start of the occurrence to move, for
+                scope 'single' on a recurring event
 
         Returns:
-            Updated CalendarEvent or None if not found
+            Updated CalendarEvent (the occurrence override when moving one
+            occurrence) or None if not found
+
+        Raises:
+            APIException: If occurrence_start is not an occurrence of the event
         """
         event = self.repository.get_event_by_id(event_id, tenant_id)
         if not event:
             return None
 
+        if scope == "single" and occurrence_start and is_recurring(event):
+            occurrence_start = _aware(occurrence_start)
+            override, start, end = self._get_occurrence(event, occurrence_start)
+            new_end_time = (
+                new_start_time + (end - start) if preserve_duration else new_start_time
+            )
+            return self._save_occurrence(
+                event, occurrence_start, override, new_start_time, new_end_time
+            )
+
         # Calculate new end time
         if preserve_duration:
             duration = event.end_time - event.start_time
@@ -337,6 +513,7 @@ def resize_event(
         tenant_id: UUID,
         new_end_time: datetime,
         scope: str = "single",
+        occurrence_start: datetime | None = None,
     ) -> CalendarEvent | None:
         """Resize an event by changing its end time.
 
@@ -345,19 +522,32 @@ def resize_event(
             tenant_id: Tenant ID
             new_end_time: New end time
             scope: 'single' or 'series' (for recurring events)
+            occurrence_start: Original start of the occurrence to resize, for
+                scope 'single' on a recurring event
 
         Returns:
-            Updated CalendarEvent or None if not found
+            Updated CalendarEvent (the occurrence override when resizing one
+            occurrence) or None if not found
 
         Raises:
-            APIException: If new_end_time <= start_time or duration < 15 min
+            APIException: If new_end_time <= start_time or duration < 15 min,
+                or occurrence_start is not an occurrence of the event
         """
         event = self.repository.get_event_by_id(event_id, tenant_id)
         if not event:
             return None
 
+        override = None
+        start_time = event.start_time
+        single_occurrence = (
+            scope == "single" and occurrence_start and is_recurring(event)
+        )
+        if single_occurrence:
+            occurrence_start = _aware(occurrence_start)
+            override, start_time, _ = self._get_occurrence(event, occurrence_start)
+
         # Validate end_time > start_time
-        if new_end_time <= event.start_time:
+        if new_end_time <= start_time:
             raise APIException(
                 status_code=400,
                 code="INVALID_EVENT_DURATION",
@@ -365,13 +555,18 @@ def resize_event(
             )
 
         # Validate minimum duration (15 minutes)
-        if (new_end_time - event.start_time) < MIN_EVENT_DURATION:
+        if (new_end_time - start_time) < MIN_EVENT_DURATION:
             raise APIException(
                 status_code=400,
                 code="INVALID_EVENT_DURATION",
                 message="Minimum event duration is 15 minutes",
             )
 
+        if single_occurrence:
+            return self._save_occurrence(
+                event, occurrence_start, override, start_time, new_end_time
+            )
+
         # Update event
         event_data = {
             "end_time": new_end_time,
@@ -385,6 +580,98 @@ def resize_event(
 
         return updated_event
 
+    def _get_occurrence(
+        self, event: CalendarEvent, occurrence_start: datetime
+    ) -> tuple[CalendarEvent | None, datetime, datetime]:
+        """Get the override (if any), start and end of one occurrence.
+
+        Raises:
+            APIException: If occurrence_start is not an occurrence of the event
+        """
+        override = self.repository.get_occurrence_override(event.id, occurrence_start)
+        if override:
+            return override, override.start_time, override.end_time
+        try:
+            valid = is_occurrence(event, occurrence_start)
+        except ValueError:
+            valid = False
+        if not valid:
+            raise APIException(
+                status_code=400,
+                code="INVALID_OCCURRENCE",
+                message="occurrence_start is not an occurrence of this event",
+            )
+        return (
+            None,
+            occurrence_start,
+            occurrence_start + (event.end_time - event.start_time),
+        )
+
+    def _save_occurrence(
+        self,
+        event: CalendarEvent,
+        occurrence_start: datetime,
+        override: CalendarEvent | None,
+        start_time: datetime,
+        end_time: datetime,
+    ) -> CalendarEvent | None:
+        """Store new times of one occurrence as an override of the series."""
+        if override:
+            return self.update_event(
+                override.id,
+                event.tenant_id,
+                {"start_time": start_time, "end_time": end_time},
+            )
+        if end_time <= start_time:
+            raise APIException(
+                status_code=400,
+                code="INVALID_EVENT_DURATION",
+                message="end_time must be after start_time",
+            )
+
+        override = self.repository.create_event(
+            {
+                "tenant_id": event.tenant_id,
+                "calendar_id": event.calendar_id,
+                "title": event.title,
+                "description": event.description,
+                "location": event.location,
+                "start_time": start_time,
+                "end_time": end_time,
+                "timezone": event.timezone,
+                "all_day": event.all_day,
+                "status": event.status,
+                "organizer_id": event.organizer_id,
+                "source_type": event.source_type,
+                "source_id": event.source_id,
+                "meta_data": event.meta_data,
+                "recurrence_master_id": event.id,
+                "recurrence_original_start": occurrence_start,
+            }
+        )
+
+        safe_publish_event(
+            event_publisher=self.event_publisher,
+            db=self.db,
+            event_type="calendar.event_updated",
+            entity_type="calendar_event",
+            entity_id=event.id,
+            tenant_id=event.tenant_id,
+            user_id=event.organizer_id,
+            metadata=EventMetadata(
+                source="calendar_service",
+                version="1.0",
+                additional_data={
+                    "event_title": event.title,
+                    "occurrence_id": str(override.id),
+                    "recurrence_id": occurrence_start.isoformat(),
+                },
+            ),
+        )
+        self.db.commit()
+
+        return override
+
     def _sync_event_to_source(self, event: CalendarEvent) -> None:
         """Sync event changes back to source entity.
 
@@ -410,6 +697,7 @@ def cancel_event(self, event_id: UUID, tenant_id: UUID) -> CalendarEvent | None:
         # Publish event
         safe_publish_event(
             event_publisher=self.event_publisher,
+            db=self.db,
             event_type="calendar.event_cancelled",
             entity_type="calendar_event",
             entity_id=updated_event.id,
@@ -421,6 +709,7 @@ def cancel_event(self, event_id: UUID, tenant_id: UUID) -> CalendarEvent | None:
                 additional_data={"event_title": updated_event.title},
             ),
         )
+        self.db.commit()
 
         return updated_event
 
@@ -434,6 +723,7 @@ def delete_event(self, event_id: UUID, tenant_id: UUID) -> bool:
 
         safe_publish_event(
             event_publisher=self.event_publisher,
+            db=self.db,
             event_type="calendar.event_deleted",
             entity_type="calendar_event",
             entity_id=event_id,
@@ -445,6 +735,7 @@ def delete_event(self, event_id: UUID, tenant_id: UUID) -> bool:
                 additional_data={"event_title": event.title},
             ),
         )
+        self.db.commit()
 
         return True
 
@@ -678,6 +969,7 @@ async def send_reminder(self, reminder: EventReminder) -> bool:
             # Publish event
             safe_publish_event(
                 event_publisher=self.event_publisher,
+                db=self.db,
                 event_type="calendar.event_reminder_sent",
                 entity_type="calendar_event",
                 entity_id=event.id,
@@ -693,6 +985,7 @@ async def send_reminder(self, reminder: EventReminder) -> bool:
                     },
                 ),
             )
+            self.db.commit()
 
             return True
 
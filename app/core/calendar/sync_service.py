@@ -4,7 +4,7 @@
 
 from sqlalchemy.orm import Session
 
-from app.core.calendar.service import CalendarService
+from app.core.calendar.service import MIN_EVENT_DURATION, CalendarService
 from app.models.calendar import CalendarEvent
 from app.models.task import Task
 
@@ -62,7 +62,12 @@ def sync_task_to_event(
             "title": task.title,
             "description": task.description,
             "start_time": event_start,
-            "end_time": event_end or event_start,
+            # A task with a single date gets the shortest allowed event
+            "end_time": (
+                event_end
+                if event_end and event_end > event_start
+                else event_start + MIN_EVENT_DURATION
+            ),
             "all_day": bool(task.all_day),
             "status": self._map_task_status_to_event_status(task.status),
             "source_type": "task",
@@ -128,48 +128,27 @@ def create_comment(
                     }
                 )
 
-                # Send notification (async)
-                try:
-                    import asyncio
-
-                    try:
-                        loop = asyncio.get_running_loop()
-                    except RuntimeError:
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-
-                    if loop.is_running():
-                        asyncio.create_task(
-                            self.notification_service.send(
-                                event_type="comment.mentioned",
-                                recipient_id=mentioned_user_id,
-                                channels=["in-app", "email"],
-                                data={
-                                    "comment_id": str(comment.id),
-                                    "entity_type": comment.entity_type,
-                                    "entity_id": str(comment.entity_id),
-                                    "mentioned_by": str(user_id),
-                                },
-                                tenant_id=tenant_id,
-                            )
-                        )
-                    else:
-                        loop.run_until_complete(
-                            self.notification_service.send(
-                                event_type="comment.mentioned",
-                                recipient_id=mentioned_user_id,
-                                channels=["in-app", "email"],
-                                data={
-                                    "comment_id": str(comment.id),
-                                    "entity_type": comment.entity_type,
-                                    "entity_id": str(comment.entity_id),
-                                    "mentioned_by": str(user_id),
-                                },
-                                tenant_id=tenant_id,
-                            )
-                        )
-                except Exception as e:
-                    logger.error(f"Failed to send mention notification: {e}")
+                # Notified by NotificationEventConsumer once the event is relayed
+                from app.core.pubsub.event_helpers import safe_publish_event
+
+                safe_publish_event(
+                    event_publisher=self.event_publisher,
+                    db=self.db,
+                    event_type="comment.mentioned",
+                    entity_type="comment",
+                    entity_id=comment.id,
+                    tenant_id=tenant_id,
+                    user_id=user_id,
+                    metadata=EventMetadata(
+                        source="comment_service",
+                        version="1.0",
+                        additional_data={
+                            "mentioned_user_id": str(mentioned_user_id),
+                            "entity_type": comment.entity_type,
+                            "entity_id": str(comment.entity_id),
+                        },
+                    ),
+                )
 
         # Create activity
         try:
@@ -190,6 +169,7 @@ def create_comment(
 
         safe_publish_event(
             event_publisher=self.event_publisher,
+            db=self.db,
             event_type="comment.created",
             entity_type="comment",
             entity_id=comment.id,
@@ -205,6 +185,7 @@ def create_comment(
                 },
             ),
         )
+        self.db.commit()
 
         return comment
 
@@ -226,6 +207,37 @@ def get_comments_by_entity(
             entity_type, entity_id, tenant_id, include_deleted, skip, limit
         )
 
+    def search_comments(
+        self,
+        tenant_id: UUID,
+        query: str,
+        entity_type: str | None = None,
+        entity_id: UUID | None = None,
+        include_deleted: bool = False,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[Comment]:
+        """Search comments by content, most relevant first."""
+        return [
+            comment
+            for comment, _ in self.repository.search_comments(
+                tenant_id, query, entity_type, entity_id, include_deleted, skip, limit
+            )
+        ]
+
+    def count_search_comments(
+        self,
+        tenant_id: UUID,
+        query: str,
+        entity_type: str | None = None,
+        entity_id: UUID | None = None,
+        include_deleted: bool = False,
+    ) -> int:
+        """Count comments matching search text."""
+        return self.repository.count_search_comments(
+            tenant_id, query, entity_type, entity_id, include_deleted
+        )
+
     def get_comment_thread(
         self, parent_id: UUID, tenant_id: UUID, include_deleted: bool = False
     ) -> list[Comment]:
@@ -253,6 +265,7 @@ def update_comment(
 
         safe_publish_event(
             event_publisher=self.event_publisher,
+            db=self.db,
             event_type="comment.updated",
             entity_type="comment",
             entity_id=updated_comment.id,
@@ -267,6 +280,7 @@ def update_comment(
                 },
             ),
         )
+        self.db.commit()
 
         return updated_comment
 
@@ -283,6 +297,7 @@ def delete_comment(self, comment_id: UUID, tenant_id: UUID) -> bool:
 
         safe_publish_event(
             event_publisher=self.event_publisher,
+            db=self.db,
             event_type="comment.deleted",
             entity_type="comment",
             entity_id=comment.id,
@@ -297,6 +312,7 @@ def delete_comment(self, comment_id: UUID, tenant_id: UUID) -> bool:
                 },
             ),
         )
+        self.db.commit()
 
         return True
 
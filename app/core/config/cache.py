@@ -1,41 +1,66 @@
-"""Redis cache implementation for configuration module.
+"""Two-tier cache for configuration module.
 
-This module provides optional caching layer for configuration values
-to reduce database queries and improve performance.
+Configuration is cached per tenant and module as the module's full
+key/value map, so pages reading many keys cost one lookup.
 
 Cache Strategy:
-- Cache key pattern: "config:{tenant_id}:{module}:{key}"
-- TTL: 300 seconds (5 minutes) by default
-- Invalidation: On update/delete operations
+- L1: in-process map per (tenant_id, module), CONFIG_L1_CACHE_TTL seconds
+- L2: Redis, one JSON map per module version
+  "config:g{generation}:{tenant_id}:{module}:v{version}", TTL 300 seconds
+- Invalidation: writes bump the module's version key
+  ("config:{tenant_id}:{module}:version") so readers move to a new L2 entry
+  (the old one expires), and publish CONFIG_CHANGED so every worker drops
+  its L1 entry. clear_all bumps the global "config:generation" key.
 """
 
 import json
 import logging
+import threading
+import time
+from collections.abc import Callable
 from typing import Any
 from uuid import UUID
 
 import redis
 from redis.exceptions import ConnectionError, RedisError
 
-from app.core.config_file import Settings
+from app.core.config_file import Settings, get_settings
+from app.core.pubsub import topics
+from app.core.pubsub.invalidation import broadcast_invalidation
 
 logger = logging.getLogger(__name__)
 
+GENERATION_KEY = "config:generation"
+
 
 class ConfigCache:
-    """Redis cache for configuration values."""
+    """Two-tier (in-process + Redis) cache of module configuration maps."""
 
-    def __init__(self, enabled: bool = True, ttl: int = 300):
+    def __init__(self, enabled: bool = True, ttl: int = 300, l1_ttl: int | None = None):
         """Initialize config cache.
 
         Args:
             enabled: Whether caching is enabled (default: True)
-            ttl: Time-to-live for cached values in seconds (default: 300 = 5 minutes)
+            ttl: Time-to-live of Redis entries in seconds (default: 300 = 5 minutes)
+            l1_ttl: Time-to-live of in-process entries in seconds
+                (defaults to CONFIG_L1_CACHE_TTL)
         """
         self.enabled = enabled
         self.ttl = ttl
+        self.l1_ttl = (
+            l1_ttl if l1_ttl is not None else get_settings().CONFIG_L1_CACHE_TTL
+        )
         self._redis_client: redis.Redis | None = None
         self._connection_attempted = False
+        self._local: dict[tuple[UUID, str], tuple[dict[str, Any], float]] = {}
+        # Bumped on every local invalidation so a load that raced with a write
+        # does not store the map it read before the write
+        self._local_versions: dict[tuple[UUID, str], int] = {}
+        self._lock = threading.Lock()
+        self._l1_hits = 0
+        self._l1_misses = 0
+        self._l2_hits = 0
+        self._l2_misses = 0
 
         if self.enabled:
             self._initialize_redis()
@@ -61,150 +86,134 @@ def _initialize_redis(self) -> None:
         except (ConnectionError, RedisError) as e:
             logger.warning(
                 f"Config cache: Failed to connect to Redis: {e}. "
-                "Caching is disabled. Config will work without cache."
+                "Only the in-process cache is used."
             )
             self._redis_client = None
-            self.enabled = False
-
-    def _make_key(self, tenant_id: UUID, module: str, key: str) -> str:
-        """Generate cache key.
-
-        Args:
-            tenant_id: Tenant ID
-            module: Module name
-            key: Configuration key
-
-        Returns:
-            Cache key string
-        """
-        return f"config:{tenant_id}:{module}:{key}"
 
-    def _make_module_pattern(self, tenant_id: UUID, module: str) -> str:
-        """Generate cache key pattern for a module.
+    def _make_version_key(self, tenant_id: UUID, module: str) -> str:
+        """Generate the key holding a module's cache version."""
+        return f"config:{tenant_id}:{module}:version"
 
-        Args:
-            tenant_id: Tenant ID
-            module: Module name
-
-        Returns:
-            Cache key pattern for scanning
-        """
-        return f"config:{tenant_id}:{module}:*"
+    def _make_module_key(
+        self, tenant_id: UUID, module: str, generation: int, version: int
+    ) -> str:
+        """Generate the key of a module's configuration map at a version."""
+        return f"config:g{generation}:{tenant_id}:{module}:v{version}"
 
-    def get(self, tenant_id: UUID, module: str, key: str) -> Any | None:
-        """Get a cached configuration value.
+    def get_module(
+        self,
+        tenant_id: UUID,
+        module: str,
+        loader: Callable[[], dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Get a module's configuration map, loading it on a miss.
 
         Args:
             tenant_id: Tenant ID
             module: Module name
-            key: Configuration key
+            loader: Callable reading the module's map from the database
 
         Returns:
-            Cached value or None if not found/cache disabled
+            The cached map (shared: callers must not modify it)
         """
-        if not self.enabled or not self._redis_client:
-            return None
+        if not self.enabled:
+            return loader()
+
+        cache_key = (tenant_id, module)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._local.get(cache_key)
+            if entry and entry[1] > now:
+                self._l1_hits += 1
+                return entry[0]
+            self._l1_misses += 1
+            local_version = self._local_versions.get(cache_key, 0)
+
+        values = self._get_l2(tenant_id, module, loader)
+        with self._lock:
+            if self._local_versions.get(cache_key, 0) == local_version:
+                self._local[cache_key] = (values, now + self.l1_ttl)
+        return values
+
+    def _get_l2(
+        self,
+        tenant_id: UUID,
+        module: str,
+        loader: Callable[[], dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Read a module's map from Redis, loading and storing it on a miss."""
+        if not self._redis_client:
+            return loader()
 
         try:
-            cache_key = self._make_key(tenant_id, module, key)
-            cached_value = self._redis_client.get(cache_key)
-
+            generation, version = self._redis_client.mget(
+                GENERATION_KEY, self._make_version_key(tenant_id, module)
+            )
+            module_key = self._make_module_key(
+                tenant_id, module, int(generation or 0), int(version or 0)
+            )
+            cached_value = self._redis_client.get(module_key)
             if cached_value is not None:
-                # Deserialize JSON
-                return json.loads(cached_value)
-
-            return None
-        except (RedisError, json.JSONDecodeError) as e:
-            logger.warning(f"Config cache: Failed to get value: {e}")
-            return None
-
-    def set(
-        self, tenant_id: UUID, module: str, key: str, value: Any, ttl: int | None = None
-    ) -> bool:
-        """Set a configuration value in cache.
-
-        Args:
-            tenant_id: Tenant ID
-            module: Module name
-            key: Configuration key
-            value: Value to cache
-            ttl: Custom TTL in seconds (uses default if None)
-
-        Returns:
-            True if cached successfully, False otherwise
-        """
-        if not self.enabled or not self._redis_client:
-            return False
-
+                values = json.loads(cached_value)
+                with self._lock:
+                    self._l2_hits += 1
+                return values
+        except (RedisError, json.JSONDecodeError, ValueError) as e:
+            logger.warning(f"Config cache: Failed to get module: {e}")
+            return loader()
+
+        with self._lock:
+            self._l2_misses += 1
+        values = loader()
         try:
-            cache_key = self._make_key(tenant_id, module, key)
-            # Serialize to JSON
-            serialized_value = json.dumps(value)
-
-            # Set with TTL
-            self._redis_client.setex(cache_key, ttl or self.ttl, serialized_value)
-            return True
+            self._redis_client.setex(module_key, self.ttl, json.dumps(values))
         except (RedisError, TypeError, ValueError) as e:
-            logger.warning(f"Config cache: Failed to set value: {e}")
-            return False
+            logger.warning(f"Config cache: Failed to set module: {e}")
+        return values
 
-    def delete(self, tenant_id: UUID, module: str, key: str) -> bool:
-        """Delete a cached configuration value.
+    def invalidate_local(self, tenant_id: UUID | None, module: str | None) -> None:
+        """Drop in-process entries (all of them when tenant_id is None).
 
         Args:
             tenant_id: Tenant ID
-            module: Module name
-            key: Configuration key
-
-        Returns:
-            True if deleted successfully, False otherwise
+            module: Module name (None drops every module of the tenant)
         """
-        if not self.enabled or not self._redis_client:
-            return False
-
-        try:
-            cache_key = self._make_key(tenant_id, module, key)
-            self._redis_client.delete(cache_key)
-            return True
-        except RedisError as e:
-            logger.warning(f"Config cache: Failed to delete value: {e}")
-            return False
+        with self._lock:
+            if tenant_id is None:
+                keys = list(self._local_versions) + list(self._local)
+            else:
+                keys = [
+                    key
+                    for key in list(self._local_versions) + list(self._local)
+                    if key[0] == tenant_id and (module is None or key[1] == module)
+                ]
+                if module is not None:
+                    keys.append((tenant_id, module))
+            for key in set(keys):
+                self._local.pop(key, None)
+                self._local_versions[key] = self._local_versions.get(key, 0) + 1
 
     def invalidate_module(self, tenant_id: UUID, module: str) -> int:
-        """Invalidate all cached values for a module.
+        """Invalidate the cached configuration of a module in this process and Redis.
+
+        Other workers drop their in-process entry through notify_config_changed.
 
         Args:
             tenant_id: Tenant ID
             module: Module name
 
         Returns:
-            Number of keys deleted
+            Number of modules invalidated
         """
-        if not self.enabled or not self._redis_client:
-            return 0
+        self.invalidate_local(tenant_id, module)
+        if not self._redis_client:
+            return 1
 
         try:
-            pattern = self._make_module_pattern(tenant_id, module)
-
-            # Scan for keys matching pattern
-            keys_to_delete = []
-            cursor = 0
-            while True:
-                cursor, keys = self._redis_client.scan(
-                    cursor=cursor, match=pattern, count=100
-                )
-                keys_to_delete.extend(keys)
-                if cursor == 0:
-                    break
-
-            # Delete keys in batch
-            if keys_to_delete:
-                return self._redis_client.delete(*keys_to_delete)
-
-            return 0
+            self._redis_client.incr(self._make_version_key(tenant_id, module))
         except RedisError as e:
             logger.warning(f"Config cache: Failed to invalidate module: {e}")
-            return 0
+        return 1
 
     def clear_all(self) -> bool:
         """Clear all config cache entries.
@@ -215,26 +224,13 @@ def clear_all(self) -> bool:
         Returns:
             True if cleared successfully, False otherwise
         """
-        if not self.enabled or not self._redis_client:
-            return False
+        self.invalidate_local(None, None)
+        if not self._redis_client:
+            return True
 
         try:
-            # Scan for all config keys
-            keys_to_delete = []
-            cursor = 0
-            while True:
-                cursor, keys = self._redis_client.scan(
-                    cursor=cursor, match="config:*", count=1000
-                )
-                keys_to_delete.extend(keys)
-                if cursor == 0:
-                    break
-
-            # Delete in batch
-            if keys_to_delete:
-                self._redis_client.delete(*keys_to_delete)
-
-            logger.info(f"Config cache: Cleared {len(keys_to_delete)} entries")
+            self._redis_client.incr(GENERATION_KEY)
+            logger.info("Config cache: Cleared all entries")
             return True
         except RedisError as e:
             logger.error(f"Config cache: Failed to clear all: {e}")
@@ -246,38 +242,38 @@ def get_stats(self) -> dict[str, Any]:
         Returns:
             Dictionary with cache statistics
         """
-        if not self.enabled or not self._redis_client:
+        if not self.enabled:
             return {"enabled": False, "status": "disabled"}
 
-        try:
-            # Count total config keys
-            total_keys = 0
-            cursor = 0
-            while True:
-                cursor, keys = self._redis_client.scan(
-                    cursor=cursor, match="config:*", count=1000
-                )
-                total_keys += len(keys)
-                if cursor == 0:
-                    break
-
-            # Get Redis info
-            info = self._redis_client.info("memory")
-
-            return {
+        with self._lock:
+            lookups = self._l1_hits + self._l1_misses
+            stats: dict[str, Any] = {
                 "enabled": True,
-                "status": "connected",
-                "total_keys": total_keys,
+                "status": "connected" if self._redis_client else "local_only",
                 "ttl": self.ttl,
-                "memory_used": info.get("used_memory_human", "unknown"),
+                "l1_ttl": self.l1_ttl,
+                "l1_entries": len(self._local),
+                "l1_hits": self._l1_hits,
+                "l1_misses": self._l1_misses,
+                "l2_hits": self._l2_hits,
+                "l2_misses": self._l2_misses,
+                "hit_ratio": (
+                    round((self._l1_hits + self._l2_hits) / lookups, 4)
+                    if lookups
+                    else 0.0
+                ),
             }
+        if not self._redis_client:
+            return stats
+
+        try:
+            info = self._redis_client.info("memory")
+            stats["memory_used"] = info.get("used_memory_human", "unknown")
         except RedisError as e:
             logger.error(f"Config cache: Failed to get stats: {e}")
-            return {
-                "enabled": True,
-                "status": "error",
-                "error": str(e),
-            }
+            stats["status"] = "error"
+            stats["error"] = str(e)
+        return stats
 
 
 # Singleton instance
@@ -298,3 +294,32 @@ def get_config_cache(enabled: bool = True, ttl: int = 300) -> ConfigCache:
     if _cache_instance is None:
         _cache_instance = ConfigCache(enabled=enabled, ttl=ttl)
     return _cache_instance
+
+
+def notify_config_changed(tenant_id: UUID | None, module: str | None) -> None:
+    """Invalidate a module's cached configuration in every worker.
+
+    With tenant_id and module None the whole cache is cleared. Without a
+    running event loop (CLI, sync tests) other processes pick up the change
+    when their in-process entry expires.
+    """
+    cache = get_config_cache()
+    if tenant_id is None or module is None:
+        cache.clear_all()
+        tenant_id = module = None
+    else:
+        cache.invalidate_module(tenant_id, module)
+    broadcast_invalidation(
+        topics.CONFIG_CHANGED,
+        {"tenant_id": str(tenant_id) if tenant_id else None, "module": module},
+    )
+
+
+async def handle_config_changed(topic: str, payload: dict[str, Any]) -> None:
+    """RedisEventBus handler for CONFIG_CHANGED."""
+    try:
+        tenant_id = UUID(payload["tenant_id"]) if payload.get("tenant_id") else None
+    except (ValueError, TypeError):
+        logger.warning(f"Invalid {topic} payload: {payload}")
+        return
+    get_config_cache().invalidate_local(tenant_id, payload.get("module"))
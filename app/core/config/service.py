@@ -1,11 +1,13 @@
 """Config service for module configuration management."""
 
+import copy
+from collections.abc import Iterable
 from typing import Any
 from uuid import UUID
 
 from sqlalchemy.orm import Session
 
-from app.core.config.cache import get_config_cache
+from app.core.config.cache import get_config_cache, notify_config_changed
 from app.core.config.schema import config_schema
 from app.core.logging import create_audit_log_entry
 from app.repositories.config_repository import ConfigRepository
@@ -22,7 +24,7 @@ def __init__(
 
         Args:
             db: Database session
-            use_cache: Whether to use Redis cache (default: True)
+            use_cache: Whether to read through the config cache (default: True)
             use_versioning: Whether to track configuration versions (default: True)
         """
         self.repository = ConfigRepository(db)
@@ -45,30 +47,75 @@ def get(self, tenant_id: UUID, module: str, key: str, default: Any = None) -> An
         Returns:
             Configuration value or default
         """
-        # Try cache first
-        if self.cache:
-            cached_value = self.cache.get(tenant_id, module, key)
-            if cached_value is not None:
-                return cached_value
-
-        # Get from database
-        config = self.repository.get(tenant_id, module, key)
-        if config:
-            value = config.value
-            # Cache the value
-            if self.cache:
-                self.cache.set(tenant_id, module, key, value)
-            return value
-
-        # Try to get default from schema
-        schema_default = config_schema.get_default(module, key)
-        result = schema_default if schema_default is not None else default
+        if not self.cache:
+            config = self.repository.get(tenant_id, module, key)
+            if config:
+                return config.value
+            return self._default(module, key, default)
+
+        values = self._get_cached_module(tenant_id, module)
+        if key in values:
+            return copy.deepcopy(values[key])
+        return self._default(module, key, default)
+
+    def get_many(
+        self,
+        tenant_id: UUID,
+        module: str,
+        keys: Iterable[str],
+        defaults: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Get several configuration values of a module in one lookup.
+
+        Args:
+            tenant_id: Tenant ID
+            module: Module name
+            keys: Configuration keys
+            defaults: Default value per key if not found
 
-        # Cache default values too (with shorter TTL)
-        if result is not None and self.cache:
-            self.cache.set(tenant_id, module, key, result, ttl=60)
+        Returns:
+            Dictionary of key to value (or default)
+        """
+        defaults = defaults or {}
+        values = self._get_cached_module(tenant_id, module)
+        return {
+            key: (
+                copy.deepcopy(values[key])
+                if key in values
+                else self._default(module, key, defaults.get(key))
+            )
+            for key in keys
+        }
 
-        return result
+    def get_module(self, tenant_id: UUID, module: str) -> dict[str, Any]:
+        """Get all stored configuration values of a module (cached).
+
+        Args:
+            tenant_id: Tenant ID
+            module: Module name
+
+        Returns:
+            Dictionary of all configuration keys and values
+        """
+        return copy.deepcopy(self._get_cached_module(tenant_id, module))
+
+    def _get_cached_module(self, tenant_id: UUID, module: str) -> dict[str, Any]:
+        """Module configuration map, shared with the cache (do not modify)."""
+
+        def load() -> dict[str, Any]:
+            return {
+                config.key: config.value
+                for config in self.repository.get_all_by_module(tenant_id, module)
+            }
+
+        if not self.cache:
+            return load()
+        return self.cache.get_module(tenant_id, module, load)
+
+    def _default(self, module: str, key: str, default: Any) -> Any:
+        """Schema default of a key, falling back to the caller's default."""
+        schema_default = config_schema.get_default(module, key)
+        return schema_default if schema_default is not None else default
 
     def set(
         self,
@@ -79,6 +126,7 @@ def set(
         user_id: UUID | None = None,
         ip_address: str | None = None,
         user_agent: str | None = None,
+        invalidate_cache: bool = True,
     ) -> dict[str, Any]:
         """Set a configuration value with audit logging.
 
@@ -90,6 +138,8 @@ def set(
             user_id: User ID who made the change (for audit)
             ip_address: Client IP address (for audit)
             user_agent: Client user agent (for audit)
+            invalidate_cache: Invalidate the module's cached configuration
+                (callers writing several keys invalidate once at the end)
 
         Returns:
             Dictionary with configuration data
@@ -130,10 +180,6 @@ def set(
                 change_metadata=version_metadata if version_metadata else None,
             )
 
-        # Invalidate cache for this key
-        if self.cache:
-            self.cache.delete(tenant_id, module, key)
-
         # Audit log
         action = "config.updated" if is_update else "config.created"
         details = {
@@ -154,9 +200,9 @@ def set(
             user_agent=user_agent,
         )
 
-        # Cache the new value
-        if self.cache:
-            self.cache.set(tenant_id, module, key, value)
+        # Drop the module's cached configuration in every worker
+        if invalidate_cache:
+            notify_config_changed(tenant_id, module)
 
         return {
             "id": config.id,
@@ -176,11 +222,7 @@ def get_module_config(self, tenant_id: UUID, module: str) -> dict[str, Any]:
         Returns:
             Dictionary of all configuration keys and values
         """
-        configs = self.repository.get_all_by_module(tenant_id, module)
-        result = {}
-        for config in configs:
-            result[config.key] = config.value
-        return result
+        return self.get_module(tenant_id, module)
 
     def set_module_config(
         self,
@@ -213,7 +255,9 @@ def set_module_config(
                 user_id=user_id,
                 ip_address=ip_address,
                 user_agent=user_agent,
+                invalidate_cache=False,
             )
+        notify_config_changed(tenant_id, module)
         return self.get_module_config(tenant_id, module)
 
     def delete(
@@ -262,9 +306,8 @@ def delete(
         # Delete
         self.repository.delete(tenant_id, module, key)
 
-        # Invalidate cache
-        if self.cache:
-            self.cache.delete(tenant_id, module, key)
+        # Drop the module's cached configuration in every worker
+        notify_config_changed(tenant_id, module)
 
         # Audit log
         details = {
@@ -309,15 +352,13 @@ def clear_cache(
         Returns:
             Number of entries cleared
         """
-        if not self.cache:
-            return 0
-
         if module and tenant_id:
             # Clear specific module
-            return self.cache.invalidate_module(tenant_id, module)
+            notify_config_changed(tenant_id, module)
+            return 1
         elif not tenant_id and not module:
             # Clear all cache
-            self.cache.clear_all()
+            notify_config_changed(None, None)
             return -1  # Unknown count
         else:
             # Not supported combination
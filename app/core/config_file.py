@@ -106,6 +106,18 @@ def database_url(self) -> str:
     LOG_TO_DB: bool = True  # Always log to database
     LOG_FORMAT: str = "human"  # "human" for dev, "json" for prod
 
+    # Audit log writer (buffers audit entries and writes them with COPY)
+    AUDIT_WRITER_ENABLED: bool = True
+    AUDIT_WRITER_BATCH_SIZE: int = 5000  # Entries per COPY
+    AUDIT_WRITER_FLUSH_INTERVAL: float = 1.0  # Seconds between flushes
+    AUDIT_WRITER_MAX_BUFFER: int = 100000  # Entries in memory before spilling
+    # Outside ./storage, which is served as static files. Each process spills
+    # to its own file, with its pid before the suffix
+    AUDIT_WRITER_SPILL_PATH: str = "./var/audit_spill.jsonl"
+    AUDIT_PARTITIONS_AHEAD: int = 3  # Monthly partitions created in advance
+    AUDIT_RETENTION_MONTHS: int = 0  # Months kept before the current (0 = all)
+    AUDIT_PARTITION_MAINTENANCE_INTERVAL: float = 3600.0  # Seconds
+
     # SMTP Configuration
     SMTP_HOST: str = "localhost"
     SMTP_PORT: int = 587
@@ -114,6 +126,91 @@ def database_url(self) -> str:
     SMTP_FROM: str = "noreply@aiutox.com"
     SMTP_USE_TLS: bool = True
 
+    # Notification dispatcher (delivers PENDING notification_queue entries)
+    NOTIFICATIONS_DISPATCHER_ENABLED: bool = True
+    NOTIFICATIONS_DISPATCH_BATCH_SIZE: int = 200  # Entries claimed per batch
+    NOTIFICATIONS_DISPATCH_POLL_INTERVAL: float = 2.0  # Seconds when queue is empty
+    NOTIFICATIONS_SMTP_POOL_SIZE: int = 5  # Persistent SMTP sessions
+    NOTIFICATIONS_CHANNEL_CONCURRENCY: dict[str, int] = {
+        "email": 10,
+        "sms": 5,
+        "webhook": 20,
+        "in-app": 50,
+    }
+    # Deliveries per second by "channel" or "channel:provider"
+    NOTIFICATIONS_RATE_LIMITS: dict[str, float] = {
+        "email": 10.0,
+        "sms": 1.0,
+        "webhook": 20.0,
+    }
+    # Digest mode: notifications sent with coalesce=True are held this long
+    # (per-user "digest" preference overrides) and merged per event family
+    NOTIFICATIONS_DIGEST_WINDOW_SECONDS: int = 300
+    NOTIFICATIONS_COALESCE_CHANNELS: list[str] = ["email", "sms", "in-app"]
+    NOTIFICATIONS_TEMPLATE_CACHE_TTL: int = 300  # Seconds per cached tenant
+
+    # Reminder pump (queues due calendar event and task reminders)
+    REMINDERS_PUMP_ENABLED: bool = True
+    REMINDERS_BATCH_SIZE: int = 500  # Reminders of each kind claimed per batch
+    REMINDERS_POLL_INTERVAL: float = 15.0  # Seconds when nothing is due
+
+    # Webhook delivery (delivers PENDING webhook_deliveries entries)
+    WEBHOOKS_DISPATCHER_ENABLED: bool = True
+    WEBHOOKS_DISPATCH_BATCH_SIZE: int = 200  # Deliveries claimed per batch
+    WEBHOOKS_DISPATCH_POLL_INTERVAL: float = 2.0  # Seconds when queue is empty
+    WEBHOOKS_CONCURRENCY: int = 50  # Requests in flight
+    WEBHOOKS_MAX_CONNECTIONS: int = 100  # Shared HTTP pool size
+    WEBHOOKS_MAX_CONNECTIONS_PER_HOST: int = 10
+    WEBHOOKS_TIMEOUT: float = 10.0  # Seconds per request
+    WEBHOOKS_MAX_BACKOFF_SECONDS: int = 3600
+    WEBHOOKS_BREAKER_FAILURE_THRESHOLD: int = 5  # Failures opening a circuit
+    WEBHOOKS_BREAKER_RESET_SECONDS: float = 60.0  # Open time before a probe
+
+    # Event outbox relay (publishes event_outbox rows to Redis Streams)
+    EVENTS_OUTBOX_RELAY_ENABLED: bool = True
+    EVENTS_OUTBOX_BATCH_SIZE: int = 500  # Events per pipelined XADD batch
+    EVENTS_OUTBOX_POLL_INTERVAL: float = 0.5  # Seconds when the outbox is empty
+    EVENTS_OUTBOX_LAG_WARNING_SECONDS: float = 30.0  # Oldest pending event age
+
+    # Files garbage collection (permanent deletion of soft-deleted files)
+    FILES_GC_BATCH_SIZE: int = 500  # Files per keyset batch
+    FILES_GC_CONCURRENCY: int = 16  # Storage deletes in flight
+
+    # Recurring calendar event expansion (see OccurrenceCache)
+    CALENDAR_OCCURRENCE_CACHE_SIZE: int = 10000  # Cached (event, window) entries
+    CALENDAR_OCCURRENCE_MAX_WINDOW_DAYS: int = 366  # Longest window per request
+
+    # Compiled approval flows kept in memory (see FlowCompilationCache)
+    APPROVALS_FLOW_CACHE_SIZE: int = 1024
+
+    # Stock on hand projection of the move ledger (see StockBalanceService)
+    INVENTORY_ALLOW_NEGATIVE_STOCK: bool = False  # Moves may take stock below 0
+    INVENTORY_BULK_MOVES_MAX_LINES: int = 10000  # Lines per bulk stock move call
+
+    # Point-in-time stock valuation (see StockValuationService)
+    INVENTORY_VALUATION_WORKERS: int = 4  # Parallel product partitions (max 256)
+    INVENTORY_VALUATION_CHECKPOINT_LAG_SECONDS: int = 300  # Newest checkpoint age
+
+    # Compiled Jinja templates kept in memory (see TemplateCompilationCache)
+    TEMPLATES_COMPILE_CACHE_SIZE: int = 1024
+
+    # PDF rendering in worker processes (see DocumentRenderPool)
+    TEMPLATES_RENDER_WORKERS: int = 0  # 0 = one per CPU
+    TEMPLATES_RENDER_QUEUE_SIZE: int = 64  # Documents queued or rendering at once
+    TEMPLATES_RENDER_BATCH_MAX_ROWS: int = 5000  # Documents per batch job
+    TEMPLATES_RENDER_JOB_TTL: int = 3600  # Seconds a finished job stays pollable
+
+    # Module configuration cached in process (see ConfigCache)
+    CONFIG_L1_CACHE_TTL: int = 60  # Seconds; pub/sub drops entries on writes
+
+    # Visible task list pages and counts cached in Redis (see TaskListCache)
+    TASKS_LIST_CACHE_ENABLED: bool = True
+    TASKS_LIST_CACHE_TTL: int = 300  # Seconds; task writes invalidate earlier
+
+    # Files storage backends (cached per tenant, see StorageBackendRegistry)
+    FILES_STORAGE_BACKEND_TTL: int = 300  # Seconds before a cached backend is rebuilt
+    FILES_S3_MAX_POOL_CONNECTIONS: int = 50  # HTTP connections per S3 client
+
     model_config = ConfigDict(
         env_file=[".env", "../.env"],  # Try .env in current dir first, then parent dir
         env_file_encoding="utf-8",
@@ -0,0 +1,124 @@
+"""Process-wide registry of storage backends per tenant."""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+from uuid import UUID
+
+from app.core.config_file import get_settings
+from app.core.files.storage import BaseStorageBackend
+from app.core.pubsub import topics
+from app.core.pubsub.invalidation import broadcast_invalidation
+
+logger = logging.getLogger(__name__)
+
+
+class StorageBackendRegistry:
+    """Caches one storage backend per tenant for the lifetime of the process.
+
+    Building a backend reads the tenant's storage configuration and decrypts
+    S3 credentials; the cached instance also keeps its (pooled) S3 client, so
+    requests after the first one skip all of that. Entries are dropped when
+    the storage configuration changes (locally or in another worker via the
+    FILE_STORAGE_CONFIG_CHANGED topic) and expire after a TTL as a safety net.
+    """
+
+    def __init__(self, ttl_seconds: int | None = None):
+        """Initialize registry.
+
+        Args:
+            ttl_seconds: Entry lifetime (defaults to FILES_STORAGE_BACKEND_TTL)
+        """
+        self.ttl_seconds = (
+            ttl_seconds
+            if ttl_seconds is not None
+            else get_settings().FILES_STORAGE_BACKEND_TTL
+        )
+        self._backends: dict[UUID, tuple[BaseStorageBackend, float]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_create(
+        self, tenant_id: UUID, factory: Callable[[], BaseStorageBackend]
+    ) -> BaseStorageBackend:
+        """Get the cached backend for a tenant, building it on a miss.
+
+        Args:
+            tenant_id: Tenant ID
+            factory: Callable building the backend from configuration
+
+        Returns:
+            Storage backend instance
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._backends.get(tenant_id)
+            if entry and entry[1] > now:
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+
+        backend = factory()
+        with self._lock:
+            self._backends[tenant_id] = (backend, now + self.ttl_seconds)
+        return backend
+
+    def invalidate(self, tenant_id: UUID) -> None:
+        """Drop the cached backend for a tenant."""
+        with self._lock:
+            removed = self._backends.pop(tenant_id, None)
+        if removed:
+            logger.info(f"Storage backend cache invalidated for tenant {tenant_id}")
+
+    def clear(self) -> None:
+        """Drop all cached backends."""
+        with self._lock:
+            self._backends.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "tenants": len(self._backends),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / total, 4) if total else 0.0,
+            }
+
+
+# Global registry instance
+_registry: StorageBackendRegistry | None = None
+
+
+def get_storage_backend_registry() -> StorageBackendRegistry:
+    """Get global storage backend registry."""
+    global _registry
+    if _registry is None:
+        _registry = StorageBackendRegistry()
+    return _registry
+
+
+def notify_storage_config_changed(tenant_id: UUID) -> None:
+    """Invalidate the local backend and tell other workers to do the same.
+
+    Without a running event loop (CLI, sync tests) only the local entry is
+    dropped; other processes pick up the change when their entry expires.
+    """
+    get_storage_backend_registry().invalidate(tenant_id)
+    broadcast_invalidation(
+        topics.FILE_STORAGE_CONFIG_CHANGED, {"tenant_id": str(tenant_id)}
+    )
+
+
+async def handle_storage_config_changed(topic: str, payload: dict[str, Any]) -> None:
+    """RedisEventBus handler for FILE_STORAGE_CONFIG_CHANGED."""
+    try:
+        tenant_id = UUID(payload["tenant_id"])
+    except (KeyError, ValueError, TypeError):
+        logger.warning(f"Invalid {topic} payload: {payload}")
+        return
+    get_storage_backend_registry().invalidate(tenant_id)
@@ -0,0 +1,280 @@
+"""Garbage collector for permanently deleting soft-deleted files."""
+
+import asyncio
+import logging
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.core.config_file import get_settings
+from app.core.pubsub import EventPublisher
+from app.core.pubsub.models import EventMetadata
+from app.models.system_config import SystemConfig
+from app.monitoring.file_metrics import get_file_metrics
+from app.repositories.config_repository import ConfigRepository
+from app.repositories.file_repository import FileRepository
+
+logger = logging.getLogger(__name__)
+
+# Checkpoints live in system_configs under their own module so they never show
+# up in the user-facing "files" configuration.
+CHECKPOINT_MODULE = "files_gc"
+CHECKPOINT_KEY = "checkpoint"
+
+
+class DeletedFileCollector:
+    """Streams deleted files in keyset batches and removes them permanently.
+
+    Storage objects of a batch (files and all their versions) are deleted
+    concurrently through ``BaseStorageBackend.delete_many``, then the rows are
+    hard-deleted in bulk and the checkpoint is saved in the same transaction.
+    A crashed run resumes after the last committed batch.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        storage_backend,
+        event_publisher: EventPublisher,
+        repository: FileRepository | None = None,
+        batch_size: int | None = None,
+        concurrency: int | None = None,
+    ):
+        """Initialize collector.
+
+        Args:
+            db: Database session
+            storage_backend: Storage backend instance
+            event_publisher: EventPublisher instance
+            repository: FileRepository instance (created if not provided)
+            batch_size: Files per batch (defaults to FILES_GC_BATCH_SIZE)
+            concurrency: Storage deletes in flight (defaults to FILES_GC_CONCURRENCY)
+        """
+        settings = get_settings()
+        self.db = db
+        self.storage_backend = storage_backend
+        self.event_publisher = event_publisher
+        self.repository = repository or FileRepository(db)
+        self.config_repository = ConfigRepository(db)
+        self.batch_size = batch_size or settings.FILES_GC_BATCH_SIZE
+        self.concurrency = concurrency or settings.FILES_GC_CONCURRENCY
+        self.metrics = get_file_metrics()
+
+    async def run(self, tenant_id: UUID, retention_days: int) -> dict[str, Any]:
+        """Permanently delete files deleted more than retention_days ago.
+
+        Args:
+            tenant_id: Tenant ID
+            retention_days: Retention period in days
+
+        Returns:
+            Dict with cleanup statistics
+        """
+        started = time.monotonic()
+        checkpoint = self._load_checkpoint(tenant_id, retention_days)
+        if checkpoint:
+            cutoff_date = datetime.fromisoformat(checkpoint["cutoff_date"])
+            after_id = UUID(checkpoint["last_id"])
+            logger.info(
+                f"Resuming file cleanup for tenant {tenant_id} after file {after_id}"
+            )
+        else:
+            cutoff_date = datetime.now(UTC) - timedelta(days=retention_days)
+            after_id = None
+
+        files_deleted = 0
+        storage_freed = 0
+        objects_deleted = 0
+        batches = 0
+        errors: list[dict[str, str]] = []
+
+        while True:
+            batch = self.repository.get_deleted_files_batch(
+                tenant_id, cutoff_date, after_id, self.batch_size
+            )
+            if not batch:
+                break
+
+            batch_result = await self._collect_batch(
+                tenant_id, batch, retention_days, cutoff_date
+            )
+            after_id = batch[-1].id
+            batches += 1
+            files_deleted += batch_result["files_deleted"]
+            storage_freed += batch_result["storage_freed"]
+            objects_deleted += batch_result["objects_deleted"]
+            errors.extend(batch_result["errors"])
+
+            if len(batch) < self.batch_size:
+                break
+
+        self._clear_checkpoint(tenant_id)
+
+        duration = time.monotonic() - started
+        logger.info(
+            f"File cleanup finished for tenant {tenant_id}: {files_deleted} files, "
+            f"{objects_deleted} objects, {batches} batches in {duration:.2f}s"
+        )
+        return {
+            "files_count": files_deleted,
+            "storage_freed": storage_freed,
+            "objects_deleted": objects_deleted,
+            "batches": batches,
+            "resumed": checkpoint is not None,
+            "duration_seconds": round(duration, 3),
+            "files_per_second": (
+                round(files_deleted / duration, 2) if duration > 0 else 0.0
+            ),
+            "errors": errors,
+        }
+
+    async def _collect_batch(
+        self,
+        tenant_id: UUID,
+        batch: list,
+        retention_days: int,
+        cutoff_date: datetime,
+    ) -> dict[str, Any]:
+        """Delete storage objects and rows for one batch of files."""
+        batch_started = time.monotonic()
+        file_ids = [row.id for row in batch]
+        version_paths = self.repository.get_version_storage_paths(file_ids, tenant_id)
+
+        paths = {row.storage_path for row in batch}
+        for file_paths in version_paths.values():
+            paths.update(file_paths)
+        failed_paths = paths.intersection(
+            await self.storage_backend.delete_many(sorted(paths), self.concurrency)
+        )
+
+        errors = []
+        deletable = []
+        for row in batch:
+            if row.storage_path in failed_paths:
+                errors.append(
+                    {
+                        "file_id": str(row.id),
+                        "error": f"Failed to delete {row.storage_path} from storage",
+                    }
+                )
+                continue
+            for path in version_paths.get(row.id, []):
+                if path in failed_paths:
+                    logger.warning(f"Failed to delete version {path} of file {row.id}")
+            deletable.append(row)
+
+        try:
+            deleted_ids = set(
+                self.repository.hard_delete_files(
+                    [row.id for row in deletable], tenant_id
+                )
+            )
+            self._save_checkpoint(
+                tenant_id,
+                {
+                    "retention_days": retention_days,
+                    "cutoff_date": cutoff_date.isoformat(),
+                    "last_id": str(batch[-1].id),
+                },
+            )
+            self.db.commit()
+        except Exception as e:
+            logger.error(
+                f"Failed to delete file rows for tenant {tenant_id}: {e}", exc_info=True
+            )
+            self.db.rollback()
+            errors.extend(
+                {"file_id": str(row.id), "error": str(e)} for row in deletable
+            )
+            deleted_ids = set()
+
+        deleted = [row for row in deletable if row.id in deleted_ids]
+        await self._publish_deleted(tenant_id, deleted, retention_days)
+
+        result = {
+            "files_deleted": len(deleted),
+            "storage_freed": sum(row.size for row in deleted),
+            "objects_deleted": len(paths) - len(failed_paths),
+            "errors": errors,
+        }
+        self.metrics.record_gc_batch(
+            tenant_id,
+            files_deleted=result["files_deleted"],
+            objects_deleted=result["objects_deleted"],
+            bytes_freed=result["storage_freed"],
+            errors=len(errors),
+            duration_seconds=time.monotonic() - batch_started,
+        )
+        return result
+
+    async def _publish_deleted(
+        self, tenant_id: UUID, rows: list, retention_days: int
+    ) -> None:
+        """Publish file.permanently_deleted events concurrently."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _publish(row) -> None:
+            async with semaphore:
+                try:
+                    await self.event_publisher.publish(
+                        event_type="file.permanently_deleted",
+                        entity_type="file",
+                        entity_id=row.id,
+                        tenant_id=tenant_id,
+                        metadata=EventMetadata(
+                            source="file_service",
+                            version="1.0",
+                            additional_data={
+                                "filename": row.name,
+                                "retention_days": retention_days,
+                            },
+                        ),
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to publish file.permanently_deleted event for {row.id}: {e}",
+                        exc_info=True,
+                    )
+
+        await asyncio.gather(*(_publish(row) for row in rows))
+
+    def _load_checkpoint(
+        self, tenant_id: UUID, retention_days: int
+    ) -> dict[str, Any] | None:
+        """Load the checkpoint of an interrupted run with the same retention."""
+        config = self.config_repository.get(
+            tenant_id, CHECKPOINT_MODULE, CHECKPOINT_KEY
+        )
+        if not config or not config.value:
+            return None
+        if config.value.get("retention_days") != retention_days:
+            return None
+        return config.value
+
+    def _save_checkpoint(self, tenant_id: UUID, checkpoint: dict[str, Any]) -> None:
+        """Stage the checkpoint in the current transaction (caller commits)."""
+        config = self.config_repository.get(
+            tenant_id, CHECKPOINT_MODULE, CHECKPOINT_KEY
+        )
+        if config:
+            config.value = checkpoint
+        else:
+            self.db.add(
+                SystemConfig(
+                    tenant_id=tenant_id,
+                    module=CHECKPOINT_MODULE,
+                    key=CHECKPOINT_KEY,
+                    value=checkpoint,
+                )
+            )
+
+    def _clear_checkpoint(self, tenant_id: UUID) -> None:
+        """Remove the checkpoint once a run completes."""
+        try:
+            self.config_repository.delete(tenant_id, CHECKPOINT_MODULE, CHECKPOINT_KEY)
+        except Exception as e:
+            logger.warning(f"Failed to clear file cleanup checkpoint: {e}")
+            self.db.rollback()
@@ -5,18 +5,21 @@
 import mimetypes
 import os
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 from uuid import UUID
 
 from PIL import Image
 from sqlalchemy.orm import Session
 
+from app.core.files.backend_registry import get_storage_backend_registry
+from app.core.files.gc import DeletedFileCollector
 from app.core.files.storage import (
     HybridStorageBackend,
     LocalStorageBackend,
     S3StorageBackend,
 )
 from app.core.files.storage_config_service import StorageConfigService
+from app.core.files.usage import FileUsageService
 from app.core.pubsub import EventPublisher, get_event_publisher
 from app.core.pubsub.models import EventMetadata
 from app.core.security.encryption import decrypt_credentials
@@ -51,6 +54,7 @@ def __init__(
         self.event_publisher = event_publisher or get_event_publisher()
         self._storage_config_service = StorageConfigService(db)
         self._tag_service = TagService(db)
+        self._usage_service = FileUsageService(db)
 
         # Initialize storage backend
         if storage_backend is None:
@@ -62,8 +66,12 @@ def __init__(
                 use_s3 = os.getenv("USE_S3_STORAGE", "false").lower() == "true"
                 self.storage_backend = HybridStorageBackend(use_s3=use_s3)
             else:
-                # Read configuration from ConfigService
-                self.storage_backend = self._get_storage_backend_from_config(tenant_id)
+                # Reuse the tenant's cached backend; configuration is only read
+                # (and credentials decrypted) when the cache has no entry
+                self.storage_backend = get_storage_backend_registry().get_or_create(
+                    tenant_id,
+                    lambda: self._get_storage_backend_from_config(tenant_id),
+                )
         else:
             self.storage_backend = storage_backend
 
@@ -188,7 +196,11 @@ def reload_storage_backend(self, tenant_id: UUID):
         """
         try:
             new_backend = self._get_storage_backend_from_config(tenant_id)
-            self.storage_backend = new_backend
+            registry = get_storage_backend_registry()
+            registry.invalidate(tenant_id)
+            self.storage_backend = registry.get_or_create(
+                tenant_id, lambda: new_backend
+            )
             logger.info(f"Storage backend reloaded for tenant {tenant_id}")
             return True
         except Exception as e:
@@ -235,7 +247,7 @@ def _detect_mime_type(self, filename: str, content: bytes | None = None) -> str:
 
     async def upload_file(
         self,
-        file_content: bytes,
+        file_content: bytes | BinaryIO,
         filename: str,
         entity_type: str | None,
         entity_id: UUID | None,
@@ -249,7 +261,8 @@ async def upload_file(
         """Upload a file.
 
         Args:
-            file_content: File content as bytes
+            file_content: File content as bytes, or a seekable binary file
+                (copied to storage from its start without reading it whole)
             filename: Original filename
             entity_type: Entity type (e.g., 'product', 'order')
             entity_id: Entity ID
@@ -260,17 +273,35 @@ async def upload_file(
 
         Returns:
             Created File object
+
+        Raises:
+            APIException: If the upload would exceed the tenant storage quota
         """
+        if isinstance(file_content, bytes):
+            file_size = len(file_content)
+        else:
+            file_size = file_content.seek(0, os.SEEK_END)
+            file_content.seek(0)
+
+        # Quota check reads the tenant usage counter (no scan of the files table)
+        self._usage_service.check_quota(
+            tenant_id,
+            file_size,
+            self._storage_config_service.get_storage_quota(tenant_id),
+        )
+
         # Generate storage path
         storage_path = self._generate_storage_path(tenant_id, entity_type, filename)
 
         # Upload to storage
-        await self.storage_backend.upload(file_content, storage_path)
+        if isinstance(file_content, bytes):
+            await self.storage_backend.upload(file_content, storage_path)
+        else:
+            await self.storage_backend.upload_fileobj(file_content, storage_path)
 
         # Get file info
-        file_size = len(file_content)
         file_extension = self._get_file_extension(filename)
-        mime_type = self._detect_mime_type(filename, file_content)
+        mime_type = self._detect_mime_type(filename)
 
         # Determine storage backend type
         backend = self.storage_backend
@@ -515,12 +546,22 @@ async def create_file_version(
 
         Returns:
             Created FileVersion object
+
+        Raises:
+            APIException: If the version would exceed the tenant storage quota
         """
         # Get original file
         original_file = self.repository.get_by_id(file_id, tenant_id)
         if not original_file:
             raise FileNotFoundError(f"File {file_id} not found")
 
+        # Versions are stored alongside the file and count towards the quota
+        self._usage_service.check_quota(
+            tenant_id,
+            len(file_content),
+            self._storage_config_service.get_storage_quota(tenant_id),
+        )
+
         # Get next version number
         next_version = self.repository.get_latest_version_number(file_id) + 1
 
@@ -999,6 +1040,10 @@ async def cleanup_deleted_files(
     ) -> dict[str, Any]:
         """Clean up deleted files after retention period.
 
+        Files are processed in keyset batches by ``DeletedFileCollector``:
+        storage objects are deleted concurrently and rows in bulk, and an
+        interrupted run resumes from its last committed batch.
+
         Args:
             tenant_id: Tenant ID
             retention_days: Retention period in days (defaults to config)
@@ -1012,66 +1057,13 @@ async def cleanup_deleted_files(
             limits = self._storage_config_service.get_file_limits(tenant_id)
             retention_days = limits.get("retention_days", 30)  # Default 30 days
 
-        # Get files to cleanup
-        files_to_cleanup = self.repository.get_deleted_files_for_cleanup(
-            tenant_id, retention_days
+        collector = DeletedFileCollector(
+            self.db,
+            self.storage_backend,
+            self.event_publisher,
+            repository=self.repository,
         )
-
-        files_deleted = 0
-        storage_freed = 0
-        errors = []
-
-        for file in files_to_cleanup:
-            try:
-                # Delete physical file from storage
-                await self.storage_backend.delete(file.storage_path)
-
-                # Delete all versions
-                versions = self.repository.get_versions(file.id, tenant_id)
-                for version in versions:
-                    try:
-                        await self.storage_backend.delete(version.storage_path)
-                    except Exception as e:
-                        logger.warning(f"Failed to delete version {version.id}: {e}")
-
-                # Hard delete from database (CASCADE will handle related records)
-                self.db.delete(file)
-                self.db.commit()
-
-                files_deleted += 1
-                storage_freed += file.size
-
-                # Publish event
-                try:
-                    await self.event_publisher.publish(
-                        event_type="file.permanently_deleted",
-                        entity_type="file",
-                        entity_id=file.id,
-                        tenant_id=tenant_id,
-                        metadata=EventMetadata(
-                            source="file_service",
-                            version="1.0",
-                            additional_data={
-                                "filename": file.name,
-                                "retention_days": retention_days,
-                            },
-                        ),
-                    )
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to publish file.permanently_deleted event for {file.id}: {e}",
-                        exc_info=True,
-                    )
-            except Exception as e:
-                logger.error(f"Failed to cleanup file {file.id}: {e}", exc_info=True)
-                errors.append({"file_id": str(file.id), "error": str(e)})
-                self.db.rollback()
-
-        return {
-            "files_count": files_deleted,
-            "storage_freed": storage_freed,
-            "errors": errors,
-        }
+        return await collector.run(tenant_id, retention_days)
 
     async def restore_file(self, file_id: UUID, tenant_id: UUID, user_id: UUID) -> bool:
         """Restore a soft-deleted file.
@@ -1,9 +1,12 @@
 """Storage backends for file storage."""
 
+import asyncio
 import logging
 import os
+import shutil
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import BinaryIO
 
 from app.core.config_file import get_settings
 
@@ -26,6 +29,21 @@ async def upload(self, file_content: bytes, path: str) -> str:
         """
         pass
 
+    async def upload_fileobj(self, fileobj: BinaryIO, path: str) -> str:
+        """Upload the rest of a binary file object to storage.
+
+        The default implementation reads it into memory and calls ``upload``;
+        backends that can copy in chunks override it.
+
+        Args:
+            fileobj: File object positioned at the start of the content
+            path: Storage path/key
+
+        Returns:
+            Storage path/key where file was saved
+        """
+        return await self.upload(fileobj.read(), path)
+
     @abstractmethod
     async def download(self, path: str) -> bytes:
         """Download file content from storage.
@@ -50,6 +68,33 @@ async def delete(self, path: str) -> bool:
         """
         pass
 
+    async def delete_many(self, paths: list[str], concurrency: int = 16) -> list[str]:
+        """Delete several files from storage.
+
+        The default implementation calls ``delete`` concurrently, bounded by a
+        semaphore. Backends with a native multi-object delete override it.
+
+        Args:
+            paths: Storage paths/keys to delete
+            concurrency: Maximum number of deletes in flight
+
+        Returns:
+            Paths that could not be deleted (missing paths are not failures)
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _delete(path: str) -> str | None:
+            async with semaphore:
+                try:
+                    await self.delete(path)
+                    return None
+                except Exception as e:
+                    logger.warning(f"Error deleting file {path}: {e}")
+                    return path
+
+        results = await asyncio.gather(*(_delete(path) for path in paths))
+        return [path for path in results if path is not None]
+
     @abstractmethod
     async def exists(self, path: str) -> bool:
         """Check if file exists in storage.
@@ -105,6 +150,17 @@ async def upload(self, file_content: bytes, path: str) -> str:
         logger.info(f"File uploaded to local storage: {full_path}")
         return path
 
+    async def upload_fileobj(self, fileobj: BinaryIO, path: str) -> str:
+        """Copy a file object to local storage in chunks."""
+        full_path = self._get_full_path(path)
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(full_path, "wb") as f:
+            shutil.copyfileobj(fileobj, f)
+
+        logger.info(f"File uploaded to local storage: {full_path}")
+        return path
+
     async def download(self, path: str) -> bytes:
         """Download file from local storage."""
         full_path = self._get_full_path(path)
@@ -128,6 +184,25 @@ async def delete(self, path: str) -> bool:
             logger.error(f"Error deleting file {path}: {e}")
             return False
 
+    async def delete_many(self, paths: list[str], concurrency: int = 16) -> list[str]:
+        """Delete several files from local storage in a worker thread."""
+
+        def _delete_all() -> list[str]:
+            failed = []
+            for path in paths:
+                try:
+                    self._get_full_path(path).unlink(missing_ok=True)
+                except Exception as e:
+                    logger.error(f"Error deleting file {path}: {e}")
+                    failed.append(path)
+            return failed
+
+        failed = await asyncio.to_thread(_delete_all)
+        logger.info(
+            f"Deleted {len(paths) - len(failed)} files from local storage: {self.base_path}"
+        )
+        return failed
+
     async def exists(self, path: str) -> bool:
         """Check if file exists in local storage."""
         full_path = self._get_full_path(path)
@@ -143,6 +218,9 @@ async def get_url(self, path: str) -> str | None:
 class S3StorageBackend(BaseStorageBackend):
     """AWS S3 storage backend."""
 
+    # Maximum number of keys accepted by a single DeleteObjects request
+    DELETE_OBJECTS_MAX_KEYS = 1000
+
     def __init__(
         self,
         bucket_name: str | None = None,
@@ -174,12 +252,18 @@ def _get_client(self):
         if self._boto3_client is None:
             try:
                 import boto3
+                from botocore.config import Config
 
+                # Backends are cached per tenant, so the client and its
+                # connection pool are shared by concurrent requests.
                 self._boto3_client = boto3.client(
                     "s3",
                     aws_access_key_id=self.aws_access_key_id,
                     aws_secret_access_key=self.aws_secret_access_key,
                     region_name=self.region,
+                    config=Config(
+                        max_pool_connections=self.settings.FILES_S3_MAX_POOL_CONNECTIONS
+                    ),
                 )
             except ImportError:
                 raise ImportError(
@@ -200,6 +284,17 @@ def _upload():
         logger.info(f"File uploaded to S3: s3://{self.bucket_name}/{path}")
         return path
 
+    async def upload_fileobj(self, fileobj: BinaryIO, path: str) -> str:
+        """Upload a file object to S3 in parts."""
+        client = self._get_client()
+
+        def _upload():
+            client.upload_fileobj(fileobj, self.bucket_name, path)
+
+        await asyncio.to_thread(_upload)
+        logger.info(f"File uploaded to S3: s3://{self.bucket_name}/{path}")
+        return path
+
     async def download(self, path: str) -> bytes:
         """Download file from S3."""
         import asyncio
@@ -231,6 +326,43 @@ def _delete():
             logger.info(f"File deleted from S3: s3://{self.bucket_name}/{path}")
         return result
 
+    async def delete_many(self, paths: list[str], concurrency: int = 16) -> list[str]:
+        """Delete several files from S3 using multi-object DeleteObjects requests."""
+        client = self._get_client()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        def _delete_chunk(keys: list[str]) -> list[str]:
+            try:
+                response = client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+                )
+            except Exception as e:
+                logger.error(f"Error deleting {len(keys)} files from S3: {e}")
+                return keys
+            errors = response.get("Errors", [])
+            for error in errors:
+                logger.error(
+                    f"Error deleting file from S3 {error.get('Key')}: "
+                    f"{error.get('Code')} {error.get('Message')}"
+                )
+            return [error["Key"] for error in errors]
+
+        async def _delete(keys: list[str]) -> list[str]:
+            async with semaphore:
+                return await asyncio.to_thread(_delete_chunk, keys)
+
+        chunks = [
+            paths[i : i + self.DELETE_OBJECTS_MAX_KEYS]
+            for i in range(0, len(paths), self.DELETE_OBJECTS_MAX_KEYS)
+        ]
+        results = await asyncio.gather(*(_delete(chunk) for chunk in chunks))
+        failed = [key for chunk_failed in results for key in chunk_failed]
+        logger.info(
+            f"Deleted {len(paths) - len(failed)} files from S3: s3://{self.bucket_name}"
+        )
+        return failed
+
     async def exists(self, path: str) -> bool:
         """Check if file exists in S3."""
         import asyncio
@@ -274,6 +406,10 @@ async def upload(self, file_content: bytes, path: str) -> str:
         """Upload file using selected backend."""
         return await self.backend.upload(file_content, path)
 
+    async def upload_fileobj(self, fileobj: BinaryIO, path: str) -> str:
+        """Upload a file object using selected backend."""
+        return await self.backend.upload_fileobj(fileobj, path)
+
     async def download(self, path: str) -> bytes:
         """Download file using selected backend."""
         return await self.backend.download(path)
@@ -282,6 +418,10 @@ async def delete(self, path: str) -> bool:
         """Delete file using selected backend."""
         return await self.backend.delete(path)
 
+    async def delete_many(self, paths: list[str], concurrency: int = 16) -> list[str]:
+        """Delete several files using selected backend."""
+        return await self.backend.delete_many(paths, concurrency)
+
     async def exists(self, path: str) -> bool:
         """Check if file exists using selected backend."""
         return await self.backend.exists(path)
@@ -9,7 +9,9 @@
 
 from app.core.config.service import ConfigService
 from app.core.exceptions import APIException
+from app.core.files.backend_registry import notify_storage_config_changed
 from app.core.files.storage import S3StorageBackend
+from app.core.files.usage import FileUsageService
 from app.core.security.encryption import encrypt_credentials
 
 logger = logging.getLogger(__name__)
@@ -241,6 +243,9 @@ def update_storage_config(
                 user_agent=user_agent,
             )
 
+        # Drop cached backends (in this and other workers) built from the old config
+        notify_storage_config_changed(tenant_id)
+
         return self.get_storage_config(tenant_id)
 
     async def test_s3_connection(
@@ -308,51 +313,20 @@ def get_storage_stats(self, tenant_id: UUID) -> dict[str, Any]:
         """
         from sqlalchemy import distinct, func
 
-        from app.models.file import File, FilePermission, FileVersion
+        from app.models.file import FilePermission, FileUsageScope
         from app.models.folder import Folder, FolderPermission
 
-        # Calculate total space used
-        total_size = (
-            self.db.query(func.sum(File.size))
-            .filter(File.tenant_id == tenant_id, File.is_current)
-            .scalar()
-        ) or 0
-
-        # Count total files
-        total_files = (
-            self.db.query(File)
-            .filter(File.tenant_id == tenant_id, File.is_current)
-            .count()
-        )
-
-        # Count files by MIME type
-        mime_stats = (
-            self.db.query(File.mime_type, func.count(File.id).label("count"))
-            .filter(File.tenant_id == tenant_id, File.is_current)
-            .group_by(File.mime_type)
-            .all()
+        # Space, file and version totals come from precomputed counters
+        usage_service = FileUsageService(self.db)
+        usage = usage_service.get_usage(tenant_id)
+        total_size = usage["total_size"]
+        total_files = usage["file_count"]
+        total_versions = usage["version_count"]
+        mime_distribution = usage_service.get_distribution(
+            tenant_id, FileUsageScope.MIME_TYPE
         )
-
-        mime_distribution = {mime: count for mime, count in mime_stats}
-
-        # Count files by entity type
-        entity_stats = (
-            self.db.query(File.entity_type, func.count(File.id).label("count"))
-            .filter(File.tenant_id == tenant_id, File.is_current)
-            .filter(File.entity_type.isnot(None))
-            .group_by(File.entity_type)
-            .all()
-        )
-
-        entity_distribution = {
-            entity_type: count for entity_type, count in entity_stats
-        }
-
-        # Count total versions
-        total_versions = (
-            self.db.query(FileVersion)
-            .filter(FileVersion.tenant_id == tenant_id)
-            .count()
+        entity_distribution = usage_service.get_distribution(
+            tenant_id, FileUsageScope.ENTITY_TYPE
         )
 
         # Count total folders
@@ -479,8 +453,15 @@ def get_file_limits(self, tenant_id: UUID) -> dict[str, Any]:
             "retention_days": self.config_service.get(
                 tenant_id, self.module, "limits.retention_days", None
             ),
+            "storage_quota": self.get_storage_quota(tenant_id),
         }
 
+    def get_storage_quota(self, tenant_id: UUID) -> int | None:
+        """Get the tenant storage quota in bytes (None = unlimited)."""
+        return self.config_service.get(
+            tenant_id, self.module, "limits.storage_quota", None
+        )
+
     def update_file_limits(
         self,
         tenant_id: UUID,
@@ -620,6 +601,24 @@ def update_file_limits(
                 user_agent=user_agent,
             )
 
+        storage_quota = limits.get("storage_quota")
+        if storage_quota is not None:
+            if not isinstance(storage_quota, int) or storage_quota <= 0:
+                raise APIException(
+                    status_code=400,
+                    code="INVALID_STORAGE_QUOTA",
+                    message="Storage quota must be a positive integer",
+                )
+            self.config_service.set(
+                tenant_id=tenant_id,
+                module=self.module,
+                key="limits.storage_quota",
+                value=storage_quota,
+                user_id=user_id,
+                ip_address=ip_address,
+                user_agent=user_agent,
+            )
+
         return self.get_file_limits(tenant_id)
 
     def get_thumbnail_config(self, tenant_id: UUID) -> dict[str, Any]:
@@ -7,6 +7,7 @@
 from app.core.async_tasks import Task, register_task
 from app.core.db.deps import get_db
 from app.core.files.service import FileService
+from app.core.files.usage import FileUsageService
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +56,8 @@ async def execute(self, tenant_id: UUID, **kwargs) -> dict[str, Any]:
             return {
                 "files_deleted": result["files_count"],
                 "storage_freed": result["storage_freed"],
+                "objects_deleted": result.get("objects_deleted", 0),
+                "duration_seconds": result.get("duration_seconds", 0.0),
                 "errors": result.get("errors", []),
                 "tenant_id": str(tenant_id),
             }
@@ -66,3 +69,45 @@ async def execute(self, tenant_id: UUID, **kwargs) -> dict[str, Any]:
             raise
         finally:
             db.close()
+
+
+@register_task(
+    module="files",
+    name="reconcile_usage_counters",
+    schedule={"type": "interval", "hours": 24},  # Diario
+    description="Recalcula los contadores de uso de almacenamiento para corregir desviaciones",
+    enabled=True,
+)
+class ReconcileUsageCountersTask(Task):
+    """Task to recompute storage usage counters from the files table."""
+
+    async def execute(self, tenant_id: UUID, **kwargs) -> dict[str, Any]:
+        """Execute the reconciliation task.
+
+        Args:
+            tenant_id: Tenant ID
+            **kwargs: Additional parameters (unused)
+
+        Returns:
+            Dict with reconciliation statistics
+        """
+        db = next(get_db())
+
+        try:
+            result = FileUsageService(db).reconcile(tenant_id)
+
+            logger.info(
+                f"Usage counters reconciled for tenant {tenant_id}: "
+                f"{result['counters_corrected']} of "
+                f"{result['counters_checked']} corrected"
+            )
+
+            return {**result, "tenant_id": str(tenant_id)}
+        except Exception as e:
+            logger.error(
+                f"Error reconciling usage counters for tenant {tenant_id}: {e}",
+                exc_info=True,
+            )
+            raise
+        finally:
+            db.close()
@@ -0,0 +1,128 @@
+"""Storage usage counters service for the Files module."""
+
+import logging
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.core.exceptions import APIException
+from app.models.file import FileUsageScope
+from app.repositories.file_usage_repository import FileUsageRepository
+
+logger = logging.getLogger(__name__)
+
+
+class FileUsageService:
+    """Reads precomputed storage usage and keeps it consistent.
+
+    Counters are maintained by FileRepository on upload, version creation,
+    delete, restore and garbage collection. Reads are single-row lookups, so
+    stats and quota checks no longer scan the files table; reconcile()
+    recomputes them from scratch to correct drift.
+    """
+
+    def __init__(self, db: Session, repository: FileUsageRepository | None = None):
+        """Initialize service.
+
+        Args:
+            db: Database session
+            repository: FileUsageRepository instance (created if not provided)
+        """
+        self.db = db
+        self.repository = repository or FileUsageRepository(db)
+
+    def get_usage(
+        self,
+        tenant_id: UUID,
+        scope_type: FileUsageScope = FileUsageScope.TENANT,
+        scope_key: str = "",
+    ) -> dict[str, int]:
+        """Get usage for a tenant, folder, entity, entity type or MIME type.
+
+        Args:
+            tenant_id: Tenant ID
+            scope_type: Counter scope
+            scope_key: Scope key (folder ID, "<entity_type>:<entity_id>", ...)
+
+        Returns:
+            Dictionary with file_count, total_size and version_count
+        """
+        counter = self.repository.get_counter(tenant_id, scope_type, scope_key)
+        if not counter:
+            return {"file_count": 0, "total_size": 0, "version_count": 0}
+        return {
+            "file_count": counter.file_count,
+            "total_size": counter.total_size,
+            "version_count": counter.version_count,
+        }
+
+    def get_distribution(
+        self, tenant_id: UUID, scope_type: FileUsageScope
+    ) -> dict[str, int]:
+        """Get file counts per key for a scope type (e.g. per MIME type)."""
+        return self.repository.get_distribution(tenant_id, scope_type)
+
+    def check_quota(
+        self, tenant_id: UUID, additional_bytes: int, quota: int | None
+    ) -> None:
+        """Check that storing additional_bytes keeps the tenant within quota.
+
+        Args:
+            tenant_id: Tenant ID
+            additional_bytes: Size of the content about to be stored
+            quota: Storage quota in bytes (None = unlimited)
+
+        Raises:
+            APIException: If the quota would be exceeded
+        """
+        if quota is None:
+            return
+        used = self.get_usage(tenant_id)["total_size"]
+        if used + additional_bytes > quota:
+            raise APIException(
+                status_code=413,
+                code="STORAGE_QUOTA_EXCEEDED",
+                message=(
+                    f"Storage quota exceeded: {used + additional_bytes} bytes "
+                    f"would exceed the quota of {quota} bytes"
+                ),
+            )
+
+    def reconcile(self, tenant_id: UUID) -> dict[str, Any]:
+        """Recompute a tenant's counters from the files table.
+
+        The tenant counter row is locked first, so uploads and deletes that
+        run concurrently wait and apply their deltas on top of the result.
+
+        Args:
+            tenant_id: Tenant ID
+
+        Returns:
+            Dictionary with the number of counters checked and corrected
+        """
+        try:
+            self.repository.lock_tenant(tenant_id)
+            stored = self.repository.get_all_usage(tenant_id)
+            actual = self.repository.compute_usage(tenant_id)
+
+            corrected = {
+                key
+                for key in actual.keys() | stored.keys()
+                if actual.get(key, (0, 0, 0)) != stored.get(key, (0, 0, 0))
+            }
+            self.repository.replace_usage(tenant_id, actual)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        if corrected:
+            logger.warning(
+                f"Corrected {len(corrected)} drifted file usage counters "
+                f"for tenant {tenant_id}"
+            )
+        return {
+            "counters_checked": len(actual),
+            "counters_corrected": len(corrected),
+        }
@@ -287,6 +287,7 @@ def create_import_job(
 
         safe_publish_event(
             event_publisher=self.event_publisher,
+            db=self.db,
             event_type="import.started",
             entity_type="import_job",
             entity_id=job.id,
@@ -298,6 +299,7 @@ def create_import_job(
                 additional_data={"module": job.module, "file_name": job.file_name},
             ),
         )
+        self.db.commit()
 
         return job
 
@@ -0,0 +1,126 @@
+"""Circuit breakers for outbound webhook endpoints."""
+
+import logging
+import time
+from collections.abc import Callable
+
+from app.core.config_file import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """Stops calling an endpoint after repeated failures.
+
+    CLOSED: requests flow; consecutive failures are counted.
+    OPEN: requests are refused until reset_timeout has passed.
+    HALF_OPEN: a single probe request is let through; its outcome closes or
+    re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a probe
+            clock: Monotonic time source
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    def allow(self) -> bool:
+        """Check whether a request may be sent now."""
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN:
+            if self._clock() - self._opened_at < self.reset_timeout:
+                return False
+            self.state = self.HALF_OPEN
+            self._probe_in_flight = False
+        if self._probe_in_flight:
+            return False
+        self._probe_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        """Record a successful request."""
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> bool:
+        """Record a failed request.
+
+        Returns:
+            True if this failure opened the circuit
+        """
+        self.failures += 1
+        self._probe_in_flight = False
+        if self.state == self.HALF_OPEN or (
+            self.state == self.CLOSED and self.failures >= self.failure_threshold
+        ):
+            self.state = self.OPEN
+            self._opened_at = self._clock()
+            return True
+        return False
+
+    def retry_after(self) -> float:
+        """Seconds until the circuit lets a probe through (0 if not open)."""
+        if self.state != self.OPEN:
+            return 0.0
+        return max(self.reset_timeout - (self._clock() - self._opened_at), 0.0)
+
+
+class CircuitBreakerRegistry:
+    """One CircuitBreaker per endpoint, created on first use."""
+
+    def __init__(
+        self, failure_threshold: int | None = None, reset_timeout: float | None = None
+    ):
+        """Initialize registry.
+
+        Args:
+            failure_threshold: Failures opening a circuit (defaults to settings)
+            reset_timeout: Seconds a circuit stays open (defaults to settings)
+        """
+        settings = get_settings()
+        self.failure_threshold = (
+            failure_threshold or settings.WEBHOOKS_BREAKER_FAILURE_THRESHOLD
+        )
+        self.reset_timeout = (
+            reset_timeout
+            if reset_timeout is not None
+            else settings.WEBHOOKS_BREAKER_RESET_SECONDS
+        )
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, endpoint: str) -> CircuitBreaker:
+        """Get the breaker of an endpoint."""
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            self._breakers[endpoint] = breaker
+        return breaker
+
+    def open_endpoints(self) -> list[str]:
+        """Endpoints whose circuit is currently open."""
+        return [
+            endpoint
+            for endpoint, breaker in self._breakers.items()
+            if breaker.state == CircuitBreaker.OPEN
+        ]
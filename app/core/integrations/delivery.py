@@ -0,0 +1,351 @@
+"""Asynchronous dispatcher delivering queued webhook deliveries."""
+
+import asyncio
+import json
+import logging
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+import httpx
+from sqlalchemy.orm import Session
+
+from app.core.config_file import get_settings
+from app.core.db.session import SessionLocal
+from app.core.integrations.circuit_breaker import CircuitBreakerRegistry
+from app.core.integrations.webhook_client import (
+    WebhookSender,
+    build_webhook_headers,
+    get_webhook_sender,
+)
+from app.models.integration import Webhook, WebhookDelivery, WebhookStatus
+from app.monitoring.webhook_metrics import get_webhook_metrics
+from app.repositories.integration_repository import IntegrationRepository
+
+logger = logging.getLogger(__name__)
+
+# Client errors that are worth retrying (timeouts and rate limiting)
+RETRYABLE_CLIENT_ERRORS = {408, 425, 429}
+
+
+def compute_backoff(
+    attempt: int, base_delay: float, max_delay: float, jitter: bool = True
+) -> float:
+    """Exponential backoff with jitter.
+
+    The delay is drawn between half the base delay and the exponential value,
+    so receivers recovering from an outage are not hit by synchronized retries.
+
+    Args:
+        attempt: Retry number (1 for the first retry)
+        base_delay: Delay of the first retry in seconds
+        max_delay: Upper bound in seconds
+        jitter: Pick a random delay up to the exponential value
+
+    Returns:
+        Delay in seconds
+    """
+    delay = min(base_delay * (2 ** max(attempt - 1, 0)), max_delay)
+    return random.uniform(base_delay / 2, delay) if jitter else delay
+
+
+def get_batch_size(webhook: Webhook) -> int:
+    """Events per request for a webhook (1 unless the receiver opted in).
+
+    Receivers opt in with webhook metadata {"batching": {"enabled": true,
+    "max_events": 50}}.
+    """
+    batching = (webhook.extra_data or {}).get("batching") or {}
+    if not batching.get("enabled"):
+        return 1
+    return max(int(batching.get("max_events", 50)), 1)
+
+
+@dataclass
+class DeliveryOutcome:
+    """Result of one webhook request, shared by the deliveries it carried."""
+
+    success: bool
+    response_status: int | None = None
+    response_body: str | None = None
+    error: str | None = None
+    retryable: bool = True
+    deferred_seconds: float | None = None
+
+
+class WebhookDeliveryDispatcher:
+    """Delivers PENDING webhook deliveries.
+
+    Each batch is claimed with SELECT ... FOR UPDATE SKIP LOCKED, so several
+    dispatchers share the queue safely. Requests fan out concurrently over
+    the shared WebhookSender pool. Failed deliveries are rescheduled with
+    exponential backoff and jitter until the webhook's max_retries, and a
+    circuit breaker per endpoint defers deliveries to a failing receiver
+    instead of spending attempts on it. Receivers that opt in get several
+    events per request.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        sender: WebhookSender | None = None,
+        breakers: CircuitBreakerRegistry | None = None,
+        batch_size: int | None = None,
+        concurrency: int | None = None,
+        poll_interval: float | None = None,
+    ):
+        """Initialize dispatcher.
+
+        Args:
+            session_factory: Callable returning a new database session
+            sender: Webhook sender (shared global sender if not provided)
+            breakers: Circuit breakers per endpoint (created if not provided)
+            batch_size: Deliveries claimed per batch
+            concurrency: Requests in flight
+            poll_interval: Seconds to wait when the queue is empty
+        """
+        settings = get_settings()
+        self.session_factory = session_factory
+        self.sender = sender or get_webhook_sender()
+        self.breakers = breakers or CircuitBreakerRegistry()
+        self.batch_size = batch_size or settings.WEBHOOKS_DISPATCH_BATCH_SIZE
+        self.concurrency = concurrency or settings.WEBHOOKS_CONCURRENCY
+        self.poll_interval = (
+            poll_interval
+            if poll_interval is not None
+            else settings.WEBHOOKS_DISPATCH_POLL_INTERVAL
+        )
+        self.max_backoff = settings.WEBHOOKS_MAX_BACKOFF_SECONDS
+        self.metrics = get_webhook_metrics()
+        self._running = False
+        self._task: asyncio.Task | None = None
+
+    async def dispatch_batch(self) -> dict[str, int]:
+        """Claim and deliver one batch of due webhook deliveries.
+
+        Returns:
+            Dict with the number of deliveries claimed, sent, rescheduled
+            for retry, failed and deferred by open circuits
+        """
+        started = time.monotonic()
+        result = {"claimed": 0, "sent": 0, "retry": 0, "failed": 0, "deferred": 0}
+        db = self.session_factory()
+        try:
+            repository = IntegrationRepository(db)
+            deliveries = repository.claim_due_deliveries(
+                self.batch_size, datetime.now(UTC)
+            )
+            if not deliveries:
+                db.rollback()
+                return result
+            result["claimed"] = len(deliveries)
+
+            webhooks = repository.get_webhooks_by_ids(
+                list({delivery.webhook_id for delivery in deliveries})
+            )
+            requests: list[tuple[Webhook | None, list[WebhookDelivery]]] = []
+            by_webhook: dict[UUID, list[WebhookDelivery]] = {}
+            for delivery in deliveries:
+                by_webhook.setdefault(delivery.webhook_id, []).append(delivery)
+            for webhook_id, webhook_deliveries in by_webhook.items():
+                webhook = webhooks.get(webhook_id)
+                size = get_batch_size(webhook) if webhook else 1
+                for i in range(0, len(webhook_deliveries), size):
+                    requests.append((webhook, webhook_deliveries[i : i + size]))
+
+            semaphore = asyncio.Semaphore(self.concurrency)
+            outcomes = await asyncio.gather(
+                *(
+                    self._deliver(webhook, request_deliveries, semaphore)
+                    for webhook, request_deliveries in requests
+                )
+            )
+
+            now = datetime.now(UTC)
+            for (webhook, request_deliveries), outcome in zip(
+                requests, outcomes, strict=True
+            ):
+                for delivery in request_deliveries:
+                    status = self._apply(delivery, webhook, outcome, now)
+                    result[status] += 1
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        for outcome in ("sent", "retry", "failed", "deferred"):
+            if result[outcome]:
+                self.metrics.record_outcome(outcome, result[outcome])
+        duration = time.monotonic() - started
+        self.metrics.record_batch(duration)
+        logger.info(
+            f"Dispatched {result['claimed']} webhook deliveries "
+            f"({result['sent']} sent, {result['retry']} to retry, "
+            f"{result['failed']} failed, {result['deferred']} deferred) "
+            f"in {duration:.2f}s"
+        )
+        return result
+
+    async def _deliver(
+        self,
+        webhook: Webhook | None,
+        deliveries: list[WebhookDelivery],
+        semaphore: asyncio.Semaphore,
+    ) -> DeliveryOutcome:
+        """Send one request carrying one delivery (or a batch of them)."""
+        if webhook is None or not webhook.enabled:
+            return DeliveryOutcome(
+                success=False, error="Webhook deleted or disabled", retryable=False
+            )
+
+        if len(deliveries) == 1 and get_batch_size(webhook) == 1:
+            body = deliveries[0].payload
+        else:
+            body = {
+                "events": [
+                    {
+                        "id": str(delivery.id),
+                        "event_type": delivery.event_type,
+                        "payload": delivery.payload,
+                    }
+                    for delivery in deliveries
+                ]
+            }
+        content = json.dumps(body)
+        headers = build_webhook_headers(content, webhook.headers, webhook.secret)
+
+        breaker = self.breakers.get(webhook.url)
+        async with semaphore:
+            # Checked once a slot is free so requests queued behind failures
+            # see a circuit opened meanwhile
+            if not breaker.allow():
+                return DeliveryOutcome(
+                    success=False, deferred_seconds=max(breaker.retry_after(), 1.0)
+                )
+            started = time.monotonic()
+            try:
+                response = await self.sender.send(
+                    webhook.url, content, headers=headers, method=webhook.method
+                )
+            except httpx.HTTPError as e:
+                if breaker.record_failure():
+                    self._circuit_opened(webhook)
+                return DeliveryOutcome(
+                    success=False, error=f"{type(e).__name__}: {e}"[:500]
+                )
+            finally:
+                self.metrics.record_request(time.monotonic() - started)
+
+        if response.is_success:
+            breaker.record_success()
+            return DeliveryOutcome(
+                success=True,
+                response_status=response.status_code,
+                response_body=response.text[:1000],
+            )
+
+        server_side = (
+            response.status_code >= 500
+            or response.status_code in RETRYABLE_CLIENT_ERRORS
+        )
+        if not server_side:
+            # The receiver answered; it rejected this payload
+            breaker.record_success()
+        elif breaker.record_failure():
+            self._circuit_opened(webhook)
+        return DeliveryOutcome(
+            success=False,
+            response_status=response.status_code,
+            response_body=response.text[:1000],
+            error=f"HTTP {response.status_code}: {response.text[:500]}",
+            retryable=server_side,
+        )
+
+    def _circuit_opened(self, webhook: Webhook) -> None:
+        logger.warning(f"Circuit opened for webhook {webhook.id} ({webhook.url})")
+        self.metrics.record_circuit_opened()
+
+    def _apply(
+        self,
+        delivery: WebhookDelivery,
+        webhook: Webhook | None,
+        outcome: DeliveryOutcome,
+        now: datetime,
+    ) -> str:
+        """Write a request outcome to a delivery and return its outcome label."""
+        if outcome.deferred_seconds is not None:
+            # Circuit open: no attempt was made, so no retry is spent
+            delivery.next_retry_at = now + timedelta(seconds=outcome.deferred_seconds)
+            return "deferred"
+
+        delivery.response_status = outcome.response_status
+        delivery.response_body = outcome.response_body
+        if outcome.success:
+            delivery.status = WebhookStatus.SENT.value
+            delivery.sent_at = now
+            delivery.error_message = None
+            delivery.next_retry_at = None
+            return "sent"
+
+        delivery.error_message = outcome.error
+        if (
+            outcome.retryable
+            and webhook is not None
+            and delivery.retry_count < webhook.max_retries
+        ):
+            delivery.retry_count += 1
+            delay = compute_backoff(
+                delivery.retry_count, webhook.retry_delay, self.max_backoff
+            )
+            delivery.next_retry_at = now + timedelta(seconds=delay)
+            return "retry"
+
+        delivery.status = WebhookStatus.FAILED.value
+        delivery.next_retry_at = None
+        return "failed"
+
+    async def run(self) -> None:
+        """Dispatch batches until stopped, sleeping while the queue is empty."""
+        self._running = True
+        logger.info("Webhook dispatcher started")
+        while self._running:
+            try:
+                result = await self.dispatch_batch()
+            except Exception as e:
+                logger.error(f"Webhook dispatch batch failed: {e}", exc_info=True)
+                result = {"claimed": 0}
+            if result["claimed"] < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+        logger.info("Webhook dispatcher stopped")
+
+    def start(self) -> asyncio.Task:
+        """Run the dispatcher in a background task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def stop(self) -> None:
+        """Stop the dispatcher and close pooled connections."""
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.sender.aclose()
+
+
+# Global dispatcher instance
+_dispatcher: WebhookDeliveryDispatcher | None = None
+
+
+def get_webhook_dispatcher() -> WebhookDeliveryDispatcher:
+    """Get global webhook delivery dispatcher."""
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = WebhookDeliveryDispatcher()
+    return _dispatcher
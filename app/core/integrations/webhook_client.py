@@ -0,0 +1,131 @@
+"""Shared, pooled HTTP client for outbound webhooks."""
+
+import asyncio
+import hashlib
+import hmac
+import logging
+from urllib.parse import urlparse
+
+import httpx
+
+from app.core.config_file import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+def sign_payload(payload: str, secret: str) -> str:
+    """Generate the HMAC-SHA256 signature of a webhook payload."""
+    return hmac.new(secret.encode(), payload.encode(), hashlib.sha256).hexdigest()
+
+
+def build_webhook_headers(
+    payload: str, headers: dict[str, str] | None, secret: str | None
+) -> dict[str, str]:
+    """Build request headers (content type and optional signature)."""
+    request_headers = dict(headers or {})
+    request_headers.setdefault("Content-Type", "application/json")
+    if secret:
+        request_headers["X-Webhook-Signature"] = (
+            f"sha256={sign_payload(payload, secret)}"
+        )
+    return request_headers
+
+
+class WebhookSender:
+    """Sends webhook requests over one shared, keep-alive connection pool.
+
+    A single httpx.AsyncClient is reused for every delivery, so repeated
+    calls to the same receiver skip TCP and TLS setup. httpx only bounds the
+    pool as a whole, so requests are additionally limited per host to keep
+    one receiver from taking every connection.
+    """
+
+    def __init__(
+        self,
+        max_connections: int | None = None,
+        max_connections_per_host: int | None = None,
+        timeout: float | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """Initialize sender.
+
+        Args:
+            max_connections: Pool size across all hosts
+            max_connections_per_host: Requests in flight per host
+            timeout: Request timeout in seconds
+            transport: Custom httpx transport (tests)
+        """
+        settings = get_settings()
+        self.max_connections = max_connections or settings.WEBHOOKS_MAX_CONNECTIONS
+        self.max_connections_per_host = (
+            max_connections_per_host or settings.WEBHOOKS_MAX_CONNECTIONS_PER_HOST
+        )
+        self.timeout = timeout or settings.WEBHOOKS_TIMEOUT
+        self.transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # Pooled connections belong to the loop that opened them; callers
+        # using asyncio.run() get a fresh client per loop
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                transport=self.transport,
+            )
+            self._loop = loop
+            self._host_slots = {}
+        return self._client
+
+    async def send(
+        self,
+        url: str,
+        content: str,
+        headers: dict[str, str] | None = None,
+        method: str = "POST",
+        timeout: float | None = None,
+    ) -> httpx.Response:
+        """Send a webhook request.
+
+        Raises:
+            httpx.HTTPError: On connection errors and timeouts
+        """
+        client = self._get_client()
+        host = urlparse(url).netloc
+        slots = self._host_slots.get(host)
+        if slots is None:
+            slots = asyncio.Semaphore(self.max_connections_per_host)
+            self._host_slots[host] = slots
+        async with slots:
+            return await client.request(
+                method,
+                url,
+                content=content,
+                headers=headers,
+                timeout=timeout if timeout is not None else self.timeout,
+            )
+
+    async def aclose(self) -> None:
+        """Close the pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._loop = None
+
+
+# Global sender instance
+_sender: WebhookSender | None = None
+
+
+def get_webhook_sender() -> WebhookSender:
+    """Get global webhook sender."""
+    global _sender
+    if _sender is None:
+        _sender = WebhookSender()
+    return _sender
@@ -1,18 +1,14 @@
 """Webhook handler for processing webhooks."""
 
-import hashlib
-import hmac
-import json
 import logging
-from datetime import UTC
 from typing import Any
 from uuid import UUID
 
-import httpx
 from sqlalchemy.orm import Session
 
+from app.core.integrations.webhook_client import sign_payload
 from app.core.pubsub import EventPublisher, get_event_publisher
-from app.models.integration import Webhook, WebhookDelivery, WebhookStatus
+from app.models.integration import WebhookDelivery, WebhookStatus
 from app.repositories.integration_repository import IntegrationRepository
 
 logger = logging.getLogger(__name__)
@@ -42,7 +38,7 @@ def _generate_signature(self, payload: str, secret: str) -> str:
         Returns:
             HMAC signature
         """
-        return hmac.new(secret.encode(), payload.encode(), hashlib.sha256).hexdigest()
+        return sign_payload(payload, secret)
 
     async def trigger_webhook(
         self,
@@ -51,7 +47,10 @@ async def trigger_webhook(
         payload: dict[str, Any],
         user_id: UUID | None = None,
     ) -> list[WebhookDelivery]:
-        """Trigger webhooks for an event type.
+        """Queue deliveries for the webhooks subscribed to an event type.
+
+        Deliveries are stored as PENDING and sent by WebhookDeliveryDispatcher,
+        so slow or failing receivers never block the caller.
 
         Args:
             tenant_id: Tenant ID
@@ -60,102 +59,43 @@ async def trigger_webhook(
             user_id: User ID who triggered the event (optional)
 
         Returns:
-            List of WebhookDelivery objects
+            List of queued WebhookDelivery objects
         """
         # Get all enabled webhooks for this event type
         webhooks = self.repository.get_webhooks_by_event(
             tenant_id, event_type, enabled_only=True
         )
 
-        deliveries = []
-        for webhook in webhooks:
-            delivery = await self._deliver_webhook(webhook, payload)
-            deliveries.append(delivery)
-
-        return deliveries
-
-    async def _deliver_webhook(
-        self, webhook: Webhook, payload: dict[str, Any]
-    ) -> WebhookDelivery:
-        """Deliver a webhook.
-
-        Args:
-            webhook: Webhook configuration
-            payload: Webhook payload
-
-        Returns:
-            WebhookDelivery object
-        """
-        # Create delivery record
-        delivery = self.repository.create_delivery(
-            {
-                "webhook_id": webhook.id,
-                "tenant_id": webhook.tenant_id,
-                "status": WebhookStatus.PENDING,
-                "event_type": webhook.event_type,
-                "payload": payload,
-            }
-        )
-
-        try:
-            # Prepare headers
-            headers = webhook.headers or {}
-            headers.setdefault("Content-Type", "application/json")
-
-            # Generate signature if secret is provided
-            payload_json = json.dumps(payload)
-            if webhook.secret:
-                signature = self._generate_signature(payload_json, webhook.secret)
-                headers["X-Webhook-Signature"] = f"sha256={signature}"
-
-            # Send webhook
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.request(
-                    method=webhook.method,
-                    url=webhook.url,
-                    headers=headers,
-                    content=payload_json,
-                )
-
-            # Update delivery status
-            delivery.status = (
-                WebhookStatus.SENT if response.is_success else WebhookStatus.FAILED
-            )
-            delivery.response_status = response.status_code
-            delivery.response_body = response.text[:1000]  # Limit response body size
-
-            if not response.is_success:
-                delivery.error_message = (
-                    f"HTTP {response.status_code}: {response.text[:500]}"
-                )
-
-            from datetime import datetime
-
-            delivery.sent_at = datetime.now(UTC)
-
-        except Exception as e:
-            logger.error(f"Failed to deliver webhook {webhook.id}: {e}")
-            delivery.status = WebhookStatus.FAILED
-            delivery.error_message = str(e)[:500]
-
-        # Update delivery
-        self.repository.update_delivery(
-            delivery.id, webhook.tenant_id, {"status": delivery.status}
+        deliveries = self.repository.create_deliveries(
+            [
+                {
+                    "webhook_id": webhook.id,
+                    "tenant_id": webhook.tenant_id,
+                    "status": WebhookStatus.PENDING.value,
+                    "event_type": webhook.event_type,
+                    "payload": payload,
+                }
+                for webhook in webhooks
+            ]
         )
-
-        return delivery
+        if deliveries:
+            logger.info(f"Queued {len(deliveries)} webhook deliveries for {event_type}")
+        return deliveries
 
     async def retry_failed_deliveries(self, tenant_id: UUID) -> int:
         """Retry failed webhook deliveries.
 
+        Failed deliveries go back to the queue for one more attempt by the
+        dispatcher.
+
         Args:
             tenant_id: Tenant ID
 
         Returns:
             Number of deliveries retried
         """
-        # Get failed deliveries that haven't exceeded max retries
-        # This would require additional repository methods
-        # For now, return 0 as placeholder
-        logger.info(f"Retrying failed webhook deliveries for tenant {tenant_id}")
-        return 0
+        count = self.repository.requeue_failed_deliveries(tenant_id)
+        logger.info(
+            f"Requeued {count} failed webhook deliveries for tenant {tenant_id}"
+        )
+        return count
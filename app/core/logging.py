@@ -223,7 +223,9 @@ def create_audit_log_entry(
     Create an audit log entry in the database.
 
     This function should be called after successful operations to persist
-    audit information for compliance and security.
+    audit information for compliance and security. While the buffered
+    AuditLogWriter runs (started with the app), the entry is only buffered
+    and written by its next flush; otherwise it is inserted right away.
 
     Args:
         db: Database session.
@@ -240,6 +242,22 @@ def create_audit_log_entry(
         return
 
     try:
+        from app.core.audit.writer import get_audit_writer
+
+        writer = get_audit_writer()
+        if writer.running:
+            writer.write(
+                user_id=user_id,
+                tenant_id=tenant_id,
+                action=action,
+                resource_type=resource_type,
+                resource_id=resource_id,
+                details=details,
+                ip_address=ip_address,
+                user_agent=user_agent,
+            )
+            return
+
         from app.repositories.audit_repository import AuditRepository
 
         audit_repo = AuditRepository(db)
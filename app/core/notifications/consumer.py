@@ -15,7 +15,13 @@
 
 
 class NotificationEventConsumer:
-    """Consumer for events that trigger notifications."""
+    """Consumer for events that trigger notifications.
+
+    Notifications are only enqueued here (PENDING); NotificationDispatcher
+    delivers them in batches outside the event callback. Task activity and
+    deadline notifications are sent with coalesce=True so bursts reach the
+    recipient as a single digest.
+    """
 
     def __init__(self, db: Session, consumer: EventConsumer | None = None):
         """Initialize notification event consumer.
@@ -101,6 +107,9 @@ async def _handle_event(self, event: Event) -> None:
             elif event_type == "task.completed":
                 await self._handle_task_completed(event)
                 return
+            elif event_type == "comment.mentioned":
+                await self._handle_comment_mentioned(event)
+                return
 
             # Determine which users should receive notifications for this event
             # For now, we'll use a simple rule: notify the user who triggered the event
@@ -133,10 +142,11 @@ async def _handle_event(self, event: Event) -> None:
                 channels=channels,
                 data=self._extract_notification_data(event),
                 tenant_id=event.tenant_id,
+                deliver=False,
             )
 
             logger.info(
-                f"Notification sent for event {event_type} to user {recipient_id}"
+                f"Notification queued for event {event_type} to user {recipient_id}"
             )
 
         except Exception as e:
@@ -162,6 +172,7 @@ async def _handle_task_assigned(self, event: Event) -> None:
                 "due_date": metadata.get("due_date"),
             },
             tenant_id=event.tenant_id,
+            deliver=False,
         )
         logger.info(f"Sent task.assigned notification to {assigned_to_id}")
 
@@ -186,6 +197,8 @@ async def _handle_task_status_changed(self, event: Event) -> None:
                     "changed_by_id": metadata.get("changed_by_id"),
                 },
                 tenant_id=event.tenant_id,
+                deliver=False,
+                coalesce=True,
             )
         logger.info("Sent task.status_changed notification")
 
@@ -202,18 +215,18 @@ async def _handle_task_due_soon(self, event: Event) -> None:
         if created_by_id and created_by_id != assigned_to_id:
             recipients.append(UUID(created_by_id))
 
-        for recipient_id in recipients:
-            await self.notification_service.send(
-                event_type="task.due_soon",
-                recipient_id=recipient_id,
-                channels=["in-app", "email"],
-                data={
-                    "task_title": metadata.get("task_title", "Sin título"),
-                    "due_date": metadata.get("due_date"),
-                    "window": metadata.get("window", "soon"),
-                },
-                tenant_id=event.tenant_id,
-            )
+        await self.notification_service.send_many(
+            event_type="task.due_soon",
+            recipient_ids=recipients,
+            channels=["in-app", "email"],
+            data={
+                "task_title": metadata.get("task_title", "Sin título"),
+                "due_date": metadata.get("due_date"),
+                "window": metadata.get("window", "soon"),
+            },
+            tenant_id=event.tenant_id,
+            coalesce=True,
+        )
         logger.info(f"Sent task.due_soon notification ({metadata.get('window')})")
 
     async def _handle_task_overdue(self, event: Event) -> None:
@@ -229,18 +242,18 @@ async def _handle_task_overdue(self, event: Event) -> None:
         if created_by_id and created_by_id != assigned_to_id:
             recipients.append(UUID(created_by_id))
 
-        for recipient_id in recipients:
-            await self.notification_service.send(
-                event_type="task.overdue",
-                recipient_id=recipient_id,
-                channels=["in-app", "email"],
-                data={
-                    "task_title": metadata.get("task_title", "Sin título"),
-                    "due_date": metadata.get("due_date"),
-                    "days_overdue": metadata.get("days_overdue", 0),
-                },
-                tenant_id=event.tenant_id,
-            )
+        await self.notification_service.send_many(
+            event_type="task.overdue",
+            recipient_ids=recipients,
+            channels=["in-app", "email"],
+            data={
+                "task_title": metadata.get("task_title", "Sin título"),
+                "due_date": metadata.get("due_date"),
+                "days_overdue": metadata.get("days_overdue", 0),
+            },
+            tenant_id=event.tenant_id,
+            coalesce=True,
+        )
         logger.info("Sent task.overdue notification")
 
     async def _handle_task_created(self, event: Event) -> None:
@@ -258,6 +271,7 @@ async def _handle_task_created(self, event: Event) -> None:
                     "task_title": metadata.get("title", "Sin título"),
                 },
                 tenant_id=event.tenant_id,
+                deliver=False,
             )
             logger.info("Sent task.created notification")
 
@@ -275,9 +289,33 @@ async def _handle_task_completed(self, event: Event) -> None:
                     "task_title": metadata.get("task_title", "Sin título"),
                 },
                 tenant_id=event.tenant_id,
+                deliver=False,
             )
             logger.info("Sent task.completed notification")
 
+    async def _handle_comment_mentioned(self, event: Event) -> None:
+        """Handle comment.mentioned event."""
+        metadata = event.metadata.additional_data if event.metadata else {}
+        mentioned_user_id = metadata.get("mentioned_user_id")
+
+        if not mentioned_user_id:
+            return
+
+        await self.notification_service.send(
+            event_type="comment.mentioned",
+            recipient_id=UUID(mentioned_user_id),
+            channels=["in-app", "email"],
+            data={
+                "comment_id": str(event.entity_id),
+                "entity_type": metadata.get("entity_type"),
+                "entity_id": metadata.get("entity_id"),
+                "mentioned_by": str(event.user_id) if event.user_id else None,
+            },
+            tenant_id=event.tenant_id,
+            deliver=False,
+        )
+        logger.info("Sent comment.mentioned notification")
+
     def _extract_notification_data(self, event: Event) -> dict[str, Any]:
         """Extract data from event for notification template rendering.
 
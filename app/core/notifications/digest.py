@@ -0,0 +1,187 @@
+"""Coalescing of notification storms into digest notifications."""
+
+import logging
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+from jinja2 import TemplateError
+from jinja2.sandbox import SandboxedEnvironment
+from sqlalchemy.orm import Session
+
+from app.core.db.session import SessionLocal
+from app.core.notifications.service import render_template
+from app.models.notification import NotificationQueue, NotificationStatus
+from app.monitoring.notification_metrics import get_notification_metrics
+from app.repositories.notification_repository import NotificationRepository
+
+logger = logging.getLogger(__name__)
+
+# Event types coalesced together; other event types form their own family
+EVENT_FAMILIES = {
+    "task.status_changed": "task.activity",
+    "task.due_soon": "task.deadlines",
+    "task.overdue": "task.deadlines",
+}
+
+FAMILY_TITLES = {
+    "task.activity": "Cambios en tus tareas",
+    "task.deadlines": "Vencimientos de tareas",
+}
+
+# Compiled once; digest data comes from queue entries, so render sandboxed
+_digest_env = SandboxedEnvironment(
+    autoescape=False, trim_blocks=True, lstrip_blocks=True
+)
+DIGEST_SUBJECT = _digest_env.from_string("{{ title }} ({{ count }})")
+DIGEST_BODY = _digest_env.from_string("""{{ title }}: {{ count }} notificaciones
+
+{% for item in items %}
+- {{ item.summary }}
+{% endfor %}
+""")
+
+
+def event_family(event_type: str) -> str:
+    """Get the coalescing family of an event type."""
+    return EVENT_FAMILIES.get(event_type, event_type)
+
+
+def render_digest(digest: dict[str, Any]) -> tuple[str, str]:
+    """Render the subject and body of a digest queue entry."""
+    return DIGEST_SUBJECT.render(**digest), DIGEST_BODY.render(**digest)
+
+
+class NotificationCoalescer:
+    """Collapses notifications held in a digest window into one entry.
+
+    NotificationService.send(coalesce=True) stores entries as COALESCING with
+    deliver_after set to the end of the recipient's digest window. Once the
+    window of a (recipient, channel, event family) group has passed, its
+    entries are replaced by a single PENDING digest entry (or released as-is
+    when there is only one) for NotificationDispatcher to deliver.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal):
+        """Initialize coalescer.
+
+        Args:
+            session_factory: Callable returning a new database session
+        """
+        self.session_factory = session_factory
+        self.metrics = get_notification_metrics()
+
+    def flush_due(self, now: datetime | None = None) -> dict[str, int]:
+        """Turn groups whose digest window has passed into deliverable entries.
+
+        Args:
+            now: Reference time (defaults to now)
+
+        Returns:
+            Dict with the number of groups, coalesced entries, digests created
+            and entries released without a digest
+        """
+        now = now or datetime.now(UTC)
+        result = {"groups": 0, "coalesced": 0, "digests": 0, "released": 0}
+        per_channel: dict[str, tuple[int, int]] = {}
+
+        db = self.session_factory()
+        try:
+            repository = NotificationRepository(db)
+            for key, event_types in self._due_groups(repository, now).items():
+                tenant_id, recipient_id, channel, family = key
+                entries = repository.lock_coalescing_entries(
+                    tenant_id, recipient_id, channel, event_types
+                )
+                if not entries:
+                    continue
+                result["groups"] += 1
+                if len(entries) == 1:
+                    entries[0].status = NotificationStatus.PENDING
+                    result["released"] += 1
+                else:
+                    db.add(self._build_digest(repository, entries, family))
+                    for entry in entries:
+                        entry.status = NotificationStatus.COALESCED
+                    result["coalesced"] += len(entries)
+                    result["digests"] += 1
+                originals, deliveries = per_channel.get(channel, (0, 0))
+                per_channel[channel] = (originals + len(entries), deliveries + 1)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        for channel, (originals, deliveries) in per_channel.items():
+            self.metrics.record_coalescing(channel, originals, deliveries)
+        if result["digests"]:
+            logger.info(
+                f"Coalesced {result['coalesced']} notifications into "
+                f"{result['digests']} digests"
+            )
+        return result
+
+    def _due_groups(
+        self, repository: NotificationRepository, now: datetime
+    ) -> dict[tuple[UUID, UUID, str, str], list[str]]:
+        """Get groups whose earliest entry is due, with their event types."""
+        groups: dict[tuple[UUID, UUID, str, str], list[str]] = {}
+        due: set[tuple[UUID, UUID, str, str]] = set()
+        for (
+            tenant_id,
+            recipient_id,
+            channel,
+            event_type,
+            deliver_after,
+        ) in repository.get_coalescing_groups():
+            key = (tenant_id, recipient_id, channel, event_family(event_type))
+            groups.setdefault(key, []).append(event_type)
+            if deliver_after is None or deliver_after <= now:
+                due.add(key)
+        return {key: groups[key] for key in due}
+
+    def _build_digest(
+        self,
+        repository: NotificationRepository,
+        entries: list[NotificationQueue],
+        family: str,
+    ) -> NotificationQueue:
+        """Build the digest entry replacing a group of entries."""
+        templates = repository.get_templates_by_ids(
+            list({entry.template_id for entry in entries if entry.template_id})
+        )
+        items = []
+        for entry in entries:
+            template = templates.get(entry.template_id)
+            text = (template.subject or template.body) if template else entry.event_type
+            try:
+                summary = render_template(text, entry.data or {})
+            except TemplateError:
+                summary = entry.event_type
+            items.append(
+                {
+                    "event_type": entry.event_type,
+                    "summary": summary,
+                    "created_at": entry.created_at.isoformat(),
+                }
+            )
+        first = entries[0]
+        return NotificationQueue(
+            event_type=f"digest.{family}",
+            recipient_id=first.recipient_id,
+            tenant_id=first.tenant_id,
+            channel=first.channel,
+            template_id=None,
+            data={
+                "digest": {
+                    "family": family,
+                    "title": FAMILY_TITLES.get(family, family),
+                    "count": len(entries),
+                    "items": items,
+                }
+            },
+            status=NotificationStatus.PENDING,
+        )
@@ -0,0 +1,324 @@
+"""Asynchronous dispatcher delivering queued notifications in batches."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+from urllib.parse import urlparse
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.core.config_file import get_settings
+from app.core.db.session import SessionLocal
+from app.core.notifications.digest import NotificationCoalescer, render_digest
+from app.core.notifications.rate_limit import ChannelRateLimiter
+from app.core.notifications.service import NotificationService, render_template
+from app.core.notifications.smtp_pool import SMTPConnectionPool, build_email_message
+from app.core.pubsub import EventPublisher, get_event_publisher
+from app.models.notification import NotificationQueue, NotificationTemplate
+from app.models.user import User
+from app.monitoring.notification_metrics import get_notification_metrics
+from app.repositories.notification_repository import NotificationRepository
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationDispatcher:
+    """Delivers PENDING notification queue entries.
+
+    Each batch is claimed with SELECT ... FOR UPDATE SKIP LOCKED, so several
+    dispatchers (one per worker) share the queue safely. Entries are grouped
+    by channel and delivered by async workers with per-channel concurrency
+    limits and token-bucket rate limits per channel and provider. Email goes
+    through a pool of persistent SMTP sessions. Templates and recipients are
+    loaded once per batch and statuses are written back with two bulk
+    UPDATEs in the transaction that holds the row locks. Before each batch
+    the NotificationCoalescer turns expired digest windows into entries.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        event_publisher: EventPublisher | None = None,
+        smtp_pool: SMTPConnectionPool | None = None,
+        rate_limiter: ChannelRateLimiter | None = None,
+        batch_size: int | None = None,
+        channel_concurrency: dict[str, int] | None = None,
+        poll_interval: float | None = None,
+        coalescer: NotificationCoalescer | None = None,
+    ):
+        """Initialize dispatcher.
+
+        Args:
+            session_factory: Callable returning a new database session
+            event_publisher: EventPublisher instance (created if not provided)
+            smtp_pool: SMTP connection pool (created from settings if not provided)
+            rate_limiter: Channel rate limiter (created from settings if not provided)
+            batch_size: Entries claimed per batch
+            channel_concurrency: Deliveries in flight per channel
+            poll_interval: Seconds to wait when the queue is empty
+            coalescer: Digest coalescer flushed before each batch
+        """
+        settings = get_settings()
+        self.session_factory = session_factory
+        self.event_publisher = event_publisher or get_event_publisher()
+        self.smtp_pool = smtp_pool or SMTPConnectionPool.from_settings()
+        self.rate_limiter = rate_limiter or ChannelRateLimiter(
+            settings.NOTIFICATIONS_RATE_LIMITS
+        )
+        self.batch_size = batch_size or settings.NOTIFICATIONS_DISPATCH_BATCH_SIZE
+        self.channel_concurrency = (
+            channel_concurrency or settings.NOTIFICATIONS_CHANNEL_CONCURRENCY
+        )
+        self.poll_interval = (
+            poll_interval
+            if poll_interval is not None
+            else settings.NOTIFICATIONS_DISPATCH_POLL_INTERVAL
+        )
+        self.coalescer = coalescer or NotificationCoalescer(session_factory)
+        self.smtp_from = settings.SMTP_FROM
+        # Same rule as NotificationService._send_email: no real SMTP server
+        # configured means emails are skipped (and the entry marked sent)
+        self.smtp_enabled = smtp_pool is not None or (
+            bool(settings.SMTP_HOST) and settings.SMTP_HOST != "localhost"
+        )
+        self.metrics = get_notification_metrics()
+        self._running = False
+        self._task: asyncio.Task | None = None
+
+    async def dispatch_batch(self) -> dict[str, Any]:
+        """Claim and deliver one batch of pending notifications.
+
+        Returns:
+            Dict with the number of entries claimed, sent and failed
+        """
+        started = time.monotonic()
+        db = self.session_factory()
+        try:
+            repository = NotificationRepository(db)
+            entries = repository.claim_pending_batch(self.batch_size)
+            if not entries:
+                db.rollback()
+                return {"claimed": 0, "sent": 0, "failed": 0}
+
+            templates = repository.get_templates_by_ids(
+                list({entry.template_id for entry in entries if entry.template_id})
+            )
+            emails = self._load_emails(db, entries)
+            # SMS and webhook delivery reuse NotificationService's senders
+            channel_service = NotificationService(db, self.event_publisher)
+
+            by_channel: dict[str, list[NotificationQueue]] = {}
+            for entry in entries:
+                by_channel.setdefault(entry.channel, []).append(entry)
+
+            failed: dict[UUID, str] = {}
+            await asyncio.gather(
+                *(
+                    self._deliver_channel(
+                        channel,
+                        channel_entries,
+                        templates,
+                        emails,
+                        channel_service,
+                        failed,
+                    )
+                    for channel, channel_entries in by_channel.items()
+                )
+            )
+
+            sent_at = datetime.now(UTC)
+            sent_ids = [entry.id for entry in entries if entry.id not in failed]
+            repository.update_statuses(sent_ids, failed, sent_at)
+            # Detach the entries so they stay readable after commit for
+            # metrics and events
+            db.expunge_all()
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        for entry in entries:
+            status = "failed" if entry.id in failed else "sent"
+            age = (sent_at - entry.created_at).total_seconds()
+            self.metrics.record_delivery(entry.channel, status, max(age, 0.0))
+        duration = time.monotonic() - started
+        self.metrics.record_batch(len(entries), duration)
+        await self._publish_results(entries, failed)
+
+        logger.info(
+            f"Dispatched {len(entries)} notifications "
+            f"({len(sent_ids)} sent, {len(failed)} failed) in {duration:.2f}s"
+        )
+        return {"claimed": len(entries), "sent": len(sent_ids), "failed": len(failed)}
+
+    def _load_emails(
+        self, db: Session, entries: list[NotificationQueue]
+    ) -> dict[UUID, str]:
+        """Load recipient emails for the batch in one query."""
+        recipient_ids = {
+            entry.recipient_id for entry in entries if entry.channel == "email"
+        }
+        if not recipient_ids:
+            return {}
+        rows = db.query(User.id, User.email).filter(User.id.in_(recipient_ids)).all()
+        return {user_id: email for user_id, email in rows if email}
+
+    async def _deliver_channel(
+        self,
+        channel: str,
+        entries: list[NotificationQueue],
+        templates: dict[UUID, NotificationTemplate],
+        emails: dict[UUID, str],
+        channel_service: NotificationService,
+        failed: dict[UUID, str],
+    ) -> None:
+        """Deliver one channel's entries with bounded concurrency."""
+        semaphore = asyncio.Semaphore(self.channel_concurrency.get(channel, 10))
+
+        async def _deliver(entry: NotificationQueue) -> None:
+            async with semaphore:
+                try:
+                    await self._deliver(
+                        entry, templates.get(entry.template_id), emails, channel_service
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to deliver notification {entry.id}: {e}")
+                    failed[entry.id] = str(e)
+
+        await asyncio.gather(*(_deliver(entry) for entry in entries))
+
+    async def _deliver(
+        self,
+        entry: NotificationQueue,
+        template: NotificationTemplate | None,
+        emails: dict[UUID, str],
+        channel_service: NotificationService,
+    ) -> None:
+        """Render and send a single notification."""
+        data = entry.data or {}
+        if entry.template_id is None and "digest" in data:
+            subject, body = render_digest(data["digest"])
+        elif template is None:
+            raise ValueError(f"Template {entry.template_id} not found")
+        else:
+            body = render_template(template.body, data)
+            subject = (
+                render_template(template.subject, data) if template.subject else None
+            )
+
+        if entry.channel == "in-app":
+            # In-app notifications are read from the queue itself
+            return
+        if entry.channel == "email":
+            email = emails.get(entry.recipient_id)
+            if not email:
+                raise ValueError(f"User {entry.recipient_id} not found or has no email")
+            if not self.smtp_enabled:
+                logger.warning(f"SMTP not configured, skipping email to {email}")
+                return
+            await self._acquire(entry.channel, "smtp")
+            await self.smtp_pool.send(
+                build_email_message(self.smtp_from, email, subject, body)
+            )
+        elif entry.channel == "sms":
+            await self._acquire(entry.channel, "sms")
+            await channel_service._send_sms(entry.recipient_id, body)
+        elif entry.channel == "webhook":
+            url = data.get("webhook_url")
+            await self._acquire(entry.channel, urlparse(url).hostname if url else None)
+            await channel_service._send_webhook(url, {"body": body})
+        else:
+            raise ValueError(f"Unsupported channel: {entry.channel}")
+
+    async def _acquire(self, channel: str, provider: str | None) -> None:
+        waited = await self.rate_limiter.acquire(channel, provider)
+        self.metrics.record_rate_limit_wait(channel, waited)
+
+    async def _publish_results(
+        self,
+        entries: list[NotificationQueue],
+        failed: dict[UUID, str],
+    ) -> None:
+        """Publish notification.sent / notification.failed events concurrently."""
+
+        async def _publish(entry: NotificationQueue) -> None:
+            if entry.id in failed:
+                event_type = "notification.failed"
+                metadata = {
+                    "channel": entry.channel,
+                    "event_type": entry.event_type,
+                    "error": failed[entry.id],
+                }
+            else:
+                event_type = "notification.sent"
+                metadata = {
+                    "channel": entry.channel,
+                    "event_type": entry.event_type,
+                    "template_id": str(entry.template_id),
+                }
+            try:
+                await self.event_publisher.publish(
+                    event_type=event_type,
+                    entity_type="notification",
+                    entity_id=entry.id,
+                    tenant_id=entry.tenant_id,
+                    user_id=entry.recipient_id,
+                    metadata=metadata,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to publish {event_type} for {entry.id}: {e}")
+
+        await asyncio.gather(*(_publish(entry) for entry in entries))
+
+    async def run(self) -> None:
+        """Dispatch batches until stopped, sleeping while the queue is empty."""
+        self._running = True
+        logger.info("Notification dispatcher started")
+        while self._running:
+            try:
+                # Release digest windows that have passed into the queue
+                self.coalescer.flush_due()
+            except Exception as e:
+                logger.error(f"Notification coalescing failed: {e}", exc_info=True)
+            try:
+                result = await self.dispatch_batch()
+            except Exception as e:
+                logger.error(f"Notification dispatch batch failed: {e}", exc_info=True)
+                result = {"claimed": 0}
+            if result["claimed"] < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+        await self.smtp_pool.close()
+        logger.info("Notification dispatcher stopped")
+
+    def start(self) -> asyncio.Task:
+        """Run the dispatcher in a background task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def stop(self) -> None:
+        """Stop the dispatcher after the current batch."""
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.smtp_pool.close()
+
+
+# Global dispatcher instance
+_dispatcher: NotificationDispatcher | None = None
+
+
+def get_notification_dispatcher() -> NotificationDispatcher:
+    """Get global notification dispatcher."""
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = NotificationDispatcher()
+    return _dispatcher
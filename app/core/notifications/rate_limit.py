@@ -0,0 +1,96 @@
+"""Token-bucket rate limits for notification delivery channels."""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Async token bucket allowing `rate` acquisitions per second.
+
+    Up to `capacity` tokens accumulate while idle, so short bursts go out
+    immediately and sustained traffic is smoothed to the configured rate.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        """Initialize bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens (defaults to rate, at least 1)
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be greater than 0")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """Wait until `tokens` are available and take them.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+                waited += delay
+                await asyncio.sleep(delay)
+
+
+class ChannelRateLimiter:
+    """Token buckets per (channel, provider), created on first use.
+
+    Limits are configured per second, keyed by "channel:provider" or just
+    "channel" (e.g. {"email": 10, "sms:twilio": 1}). Channels without a
+    configured limit are not throttled.
+    """
+
+    def __init__(self, limits: dict[str, float]):
+        """Initialize limiter.
+
+        Args:
+            limits: Rate per second by "channel:provider" or "channel"
+        """
+        self.limits = limits
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def get_bucket(
+        self, channel: str, provider: str | None = None
+    ) -> TokenBucket | None:
+        """Get the bucket for a channel and provider (None = unlimited)."""
+        bucket_key = f"{channel}:{provider}" if provider else channel
+        rate = self.limits.get(bucket_key)
+        if rate is None:
+            rate = self.limits.get(channel)
+        if rate is None:
+            return None
+        # Providers without their own limit get a separate bucket at the channel rate
+        bucket = self._buckets.get(bucket_key)
+        if bucket is None:
+            bucket = self._buckets[bucket_key] = TokenBucket(rate)
+        return bucket
+
+    async def acquire(self, channel: str, provider: str | None = None) -> float:
+        """Wait for a delivery slot on a channel and provider.
+
+        Returns:
+            Seconds spent waiting
+        """
+        bucket = self.get_bucket(channel, provider)
+        if bucket is None:
+            return 0.0
+        return await bucket.acquire()
@@ -0,0 +1,304 @@
+"""Background pump queuing notifications for due calendar and task reminders."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.core.config_file import get_settings
+from app.core.db.session import SessionLocal
+from app.core.notifications.service import NotificationService
+from app.core.pubsub.models import EventMetadata
+from app.core.pubsub.outbox import enqueue_event
+from app.models.calendar import (
+    AttendeeStatus,
+    CalendarEvent,
+    EventReminder,
+    EventStatus,
+)
+from app.models.task import Task, TaskReminder, TaskStatusEnum
+from app.monitoring.notification_metrics import get_notification_metrics
+from app.repositories.calendar_repository import CalendarRepository
+from app.repositories.task_repository import TaskRepository
+
+logger = logging.getLogger(__name__)
+
+# Notification channel per reminder type; push reminders are not delivered yet
+# and are only marked sent
+REMINDER_CHANNELS = {"email": "email", "in_app": "in-app", "sms": "sms"}
+
+CLOSED_TASK_STATUSES = {TaskStatusEnum.DONE.value, TaskStatusEnum.CANCELLED.value}
+
+# (tenant ID, notification event type) -> (recipient ID, channel, data)
+Deliveries = dict[tuple[UUID, str], list[tuple[UUID, str, dict[str, Any]]]]
+
+
+def event_recipients(event: CalendarEvent) -> list[UUID]:
+    """Organizer and attendees (with an account) who have not declined."""
+    recipients = [event.organizer_id] if event.organizer_id else []
+    recipients.extend(
+        attendee.user_id
+        for attendee in event.attendees
+        if attendee.user_id and attendee.status != AttendeeStatus.DECLINED
+    )
+    return list(dict.fromkeys(recipients))
+
+
+def task_recipients(task: Task) -> list[UUID]:
+    """Assigned users of a task, or its creator if nobody is assigned."""
+    recipients = [task.assigned_to_id] if task.assigned_to_id else []
+    recipients.extend(
+        assignment.assigned_to_id
+        for assignment in task.assignments
+        if assignment.assigned_to_id
+    )
+    if not recipients and task.created_by_id:
+        recipients.append(task.created_by_id)
+    return list(dict.fromkeys(recipients))
+
+
+class ReminderPump:
+    """Turns due reminders of all tenants into notification queue entries.
+
+    Each batch claims due calendar event reminders and task reminders with
+    SELECT ... FOR UPDATE SKIP LOCKED, so several pumps (one per worker) share
+    the work without sending a reminder twice. Events and tasks come with the
+    claim query and their recipients with one more query per kind. Deliveries
+    are grouped per tenant and event type, so preferences and templates are
+    resolved once per group for all recipients, and the queue entries, the
+    reminder_sent outbox events and the bulk UPDATE marking the reminders
+    sent are committed in the transaction that holds the row locks.
+    NotificationDispatcher delivers the entries.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        batch_size: int | None = None,
+        poll_interval: float | None = None,
+    ):
+        """Initialize pump.
+
+        Args:
+            session_factory: Callable returning a new database session
+            batch_size: Reminders of each kind claimed per batch
+            poll_interval: Seconds to wait when nothing is due
+        """
+        settings = get_settings()
+        self.session_factory = session_factory
+        self.batch_size = batch_size or settings.REMINDERS_BATCH_SIZE
+        self.poll_interval = (
+            poll_interval
+            if poll_interval is not None
+            else settings.REMINDERS_POLL_INTERVAL
+        )
+        self.metrics = get_notification_metrics()
+        self._running = False
+        self._task: asyncio.Task | None = None
+
+    def process_batch(self) -> dict[str, int]:
+        """Claim and queue one batch of due reminders.
+
+        Reminders of cancelled or finished events and of closed tasks are
+        marked sent without a notification ("expired").
+
+        Returns:
+            Dict with the number of reminders claimed, sent and expired, and
+            of notification entries queued
+        """
+        started = time.monotonic()
+        db = self.session_factory()
+        try:
+            now = datetime.now(UTC)
+            calendar_repository = CalendarRepository(db)
+            task_repository = TaskRepository(db)
+            event_reminders = calendar_repository.claim_due_reminders(
+                now, self.batch_size
+            )
+            task_reminders = task_repository.claim_due_reminders(now, self.batch_size)
+            if not event_reminders and not task_reminders:
+                db.rollback()
+                return {"claimed": 0, "sent": 0, "expired": 0, "queued": 0}
+
+            deliveries: Deliveries = {}
+            sent: list[tuple[str, datetime]] = []
+            expired: list[str] = []
+            for reminder in event_reminders:
+                due_at = self._add_event_reminder(db, reminder, now, deliveries)
+                if due_at is None:
+                    expired.append("calendar")
+                else:
+                    sent.append(("calendar", due_at))
+            for reminder in task_reminders:
+                if self._add_task_reminder(db, reminder, deliveries):
+                    sent.append(("task", reminder.reminder_time))
+                else:
+                    expired.append("task")
+
+            notification_service = NotificationService(db)
+            queued = sum(
+                len(
+                    notification_service.queue_batch(
+                        event_type, tenant_id, items, commit=False
+                    )
+                )
+                for (tenant_id, event_type), items in deliveries.items()
+            )
+            sent_at = datetime.now(UTC)
+            calendar_repository.mark_reminders_sent(
+                [reminder.id for reminder in event_reminders], sent_at
+            )
+            task_repository.mark_reminders_sent(
+                [reminder.id for reminder in task_reminders], sent_at
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        for kind, due_at in sent:
+            self.metrics.record_reminder(
+                kind, "sent", max((sent_at - due_at).total_seconds(), 0.0)
+            )
+        for kind in expired:
+            self.metrics.record_reminder(kind, "expired")
+        duration = time.monotonic() - started
+        self.metrics.record_reminder_batch(duration)
+
+        claimed = len(event_reminders) + len(task_reminders)
+        logger.info(
+            f"Processed {claimed} reminders ({len(sent)} sent, {len(expired)} "
+            f"expired, {queued} notifications queued) in {duration:.2f}s"
+        )
+        return {
+            "claimed": claimed,
+            "sent": len(sent),
+            "expired": len(expired),
+            "queued": queued,
+        }
+
+    @staticmethod
+    def _add_event_reminder(
+        db: Session, reminder: EventReminder, now: datetime, deliveries: Deliveries
+    ) -> datetime | None:
+        """Add an event reminder's deliveries; returns its due time (None if expired)."""
+        event = reminder.event
+        if event.status == EventStatus.CANCELLED or event.end_time <= now:
+            return None
+
+        channel = REMINDER_CHANNELS.get(reminder.reminder_type)
+        if channel:
+            data = {
+                "event_title": event.title,
+                "event_start": event.start_time.isoformat(),
+                "event_location": event.location,
+                "minutes_before": reminder.minutes_before,
+            }
+            deliveries.setdefault(
+                (reminder.tenant_id, "calendar.event_reminder"), []
+            ).extend(
+                (recipient_id, channel, data)
+                for recipient_id in event_recipients(event)
+            )
+        enqueue_event(
+            db,
+            event_type="calendar.event_reminder_sent",
+            entity_type="calendar_event",
+            entity_id=event.id,
+            tenant_id=reminder.tenant_id,
+            user_id=event.organizer_id,
+            metadata=EventMetadata(
+                source="reminder_pump",
+                version="1.0",
+                additional_data={
+                    "event_title": event.title,
+                    "reminder_type": reminder.reminder_type,
+                    "minutes_before": reminder.minutes_before,
+                },
+            ),
+        )
+        return event.start_time - timedelta(minutes=reminder.minutes_before)
+
+    @staticmethod
+    def _add_task_reminder(
+        db: Session, reminder: TaskReminder, deliveries: Deliveries
+    ) -> bool:
+        """Add a task reminder's deliveries; returns False if it expired."""
+        task = reminder.task
+        if task.status in CLOSED_TASK_STATUSES:
+            return False
+
+        channel = REMINDER_CHANNELS.get(reminder.reminder_type)
+        if channel:
+            data = {
+                "task_title": task.title,
+                "due_date": task.due_date.isoformat() if task.due_date else None,
+                "message": reminder.message,
+            }
+            deliveries.setdefault((reminder.tenant_id, "task.reminder"), []).extend(
+                (recipient_id, channel, data) for recipient_id in task_recipients(task)
+            )
+        enqueue_event(
+            db,
+            event_type="task.reminder_sent",
+            entity_type="task",
+            entity_id=task.id,
+            tenant_id=reminder.tenant_id,
+            user_id=task.assigned_to_id or task.created_by_id,
+            metadata=EventMetadata(
+                source="reminder_pump",
+                version="1.0",
+                additional_data={
+                    "task_title": task.title,
+                    "reminder_type": reminder.reminder_type,
+                },
+            ),
+        )
+        return True
+
+    async def run(self) -> None:
+        """Process batches until stopped, sleeping while nothing is due."""
+        self._running = True
+        logger.info("Reminder pump started")
+        while self._running:
+            try:
+                result = await asyncio.to_thread(self.process_batch)
+            except Exception as e:
+                logger.error(f"Reminder batch failed: {e}", exc_info=True)
+                result = {"claimed": 0}
+            if result["claimed"] < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+        logger.info("Reminder pump stopped")
+
+    def start(self) -> asyncio.Task:
+        """Run the pump in a background task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def stop(self) -> None:
+        """Stop the pump after the current batch."""
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+# Global pump instance
+_pump: ReminderPump | None = None
+
+
+def get_reminder_pump() -> ReminderPump:
+    """Get global reminder pump."""
+    global _pump
+    if _pump is None:
+        _pump = ReminderPump()
+    return _pump
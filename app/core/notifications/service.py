@@ -1,14 +1,17 @@
 """Notification service for sending notifications."""
 
 import logging
-from datetime import UTC
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID
 
 from sqlalchemy.orm import Session
 
+from app.core.config_file import get_settings
+from app.core.notifications.template_cache import get_notification_template_cache
 from app.core.preferences.service import PreferencesService
 from app.core.pubsub import EventPublisher, get_event_publisher
+from app.core.templates.compiler import NOTIFICATION, get_template_compilation_cache
 from app.models.notification import (
     NotificationQueue,
     NotificationStatus,
@@ -19,6 +22,36 @@
 logger = logging.getLogger(__name__)
 
 
+def render_template(template: str, data: dict[str, Any]) -> str:
+    """Render template with variables.
+
+    The template is compiled once (sandboxed Jinja2) and reused from the shared
+    TemplateCompilationCache. Placeholders without data are left untouched.
+
+    Args:
+        template: Template string with {{variables}}
+        data: Data dictionary
+
+    Returns:
+        Rendered template
+
+    Raises:
+        jinja2.TemplateError: If the template is invalid
+    """
+    cache = get_template_compilation_cache()
+    return cache.get(template, flavor=NOTIFICATION).render(data)
+
+
+def _digest_window(prefs: dict[str, Any], default_window: int) -> timedelta | None:
+    """Get the digest window from a digest preference (None if disabled)."""
+    if not prefs.get("enabled", True):
+        return None
+    window_seconds = prefs.get("window_seconds", default_window)
+    if not window_seconds or window_seconds <= 0:
+        return None
+    return timedelta(seconds=window_seconds)
+
+
 class NotificationService:
     """Service for managing notifications."""
 
@@ -36,6 +69,8 @@ async def send(
         channels: list[str],
         data: dict[str, Any] | None = None,
         tenant_id: UUID | None = None,
+        deliver: bool = True,
+        coalesce: bool = False,
     ) -> list[dict[str, Any]]:
         """Send a notification.
 
@@ -45,6 +80,11 @@ async def send(
             channels: List of channels ('email', 'sms', 'webhook', 'in-app')
             data: Event data for template rendering
             tenant_id: Tenant ID (optional, will be fetched from user if not provided)
+            deliver: Deliver inline; the entries are written as SENDING so
+                NotificationDispatcher never claims them. When False they
+                stay PENDING and are delivered by NotificationDispatcher
+            coalesce: Hold entries on coalescing channels for the recipient's
+                digest window so NotificationCoalescer can merge them
 
         Returns:
             List of notification queue records
@@ -79,6 +119,10 @@ async def send(
             )
             return []
 
+        digest_window = (
+            self._get_digest_window(recipient_id, tenant_id) if coalesce else None
+        )
+
         # Get template for each channel
         notifications = []
         for channel in channels_to_use:
@@ -89,26 +133,35 @@ async def send(
                 )
                 continue
 
-            # Create notification queue entry
-            queue_entry = self.repository.create_queue_entry(
-                {
-                    "event_type": event_type,
-                    "recipient_id": recipient_id,
-                    "tenant_id": tenant_id,
-                    "channel": channel,
-                    "template_id": template.id,
-                    "data": data,
-                    "status": NotificationStatus.PENDING,
-                }
+            entry_data = {
+                "event_type": event_type,
+                "recipient_id": recipient_id,
+                "tenant_id": tenant_id,
+                "channel": channel,
+                "template_id": template.id,
+                "data": data,
+                "status": NotificationStatus.PENDING,
+            }
+            held = digest_window is not None and channel in (
+                get_settings().NOTIFICATIONS_COALESCE_CHANNELS
             )
+            if held:
+                entry_data["status"] = NotificationStatus.COALESCING
+                entry_data["deliver_after"] = datetime.now(UTC) + digest_window
+            elif deliver:
+                entry_data["status"] = NotificationStatus.SENDING
+
+            # Create notification queue entry
+            queue_entry = self.repository.create_queue_entry(entry_data)
             notifications.append(queue_entry)
 
+            if not deliver or held:
+                continue
+
             # Send notification (async processing)
             try:
                 await self._send_notification(queue_entry, template, data or {})
                 queue_entry.status = NotificationStatus.SENT
-                from datetime import datetime
-
                 queue_entry.sent_at = datetime.now(UTC)
                 self.db.commit()
 
@@ -157,6 +210,215 @@ async def send(
             for n in notifications
         ]
 
+    async def send_many(
+        self,
+        event_type: str,
+        recipient_ids: list[UUID],
+        channels: list[str],
+        data: dict[str, Any] | None = None,
+        tenant_id: UUID | None = None,
+        coalesce: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Queue a notification for several recipients.
+
+        Preferences are resolved for all recipients at once and templates come
+        from the tenant's compiled template cache, so the fan-out costs a fixed
+        number of queries plus one bulk insert. Entries are left PENDING (or
+        COALESCING) for NotificationDispatcher to deliver.
+
+        Args:
+            event_type: Event type that triggered the notification
+            recipient_ids: User IDs to send the notification to
+            channels: List of channels ('email', 'sms', 'webhook', 'in-app')
+            data: Event data for template rendering
+            tenant_id: Tenant ID
+            coalesce: Hold entries on coalescing channels for each recipient's
+                digest window (see send)
+
+        Returns:
+            List of notification queue records
+        """
+        if not tenant_id:
+            raise ValueError("tenant_id is required")
+
+        recipient_ids = list(dict.fromkeys(recipient_ids))
+        if not recipient_ids:
+            return []
+        notification_prefs = self.preferences_service.resolve_preferences(
+            recipient_ids,
+            tenant_id,
+            "notification",
+            event_type,
+            default={"enabled": True, "channels": ["in-app"]},
+        )
+        digest_windows = (
+            self._get_digest_windows(recipient_ids, tenant_id) if coalesce else {}
+        )
+
+        templates = self._get_cached_templates(tenant_id, event_type, channels)
+
+        coalesce_channels = get_settings().NOTIFICATIONS_COALESCE_CHANNELS
+        now = datetime.now(UTC)
+        entries_data = []
+        for recipient_id in recipient_ids:
+            prefs = notification_prefs[recipient_id]
+            if not prefs.get("enabled", True):
+                continue
+            preferred_channels = prefs.get("channels", ["in-app"])
+            digest_window = digest_windows.get(recipient_id)
+            for channel, template in templates.items():
+                if channel not in preferred_channels:
+                    continue
+                entry_data = {
+                    "event_type": event_type,
+                    "recipient_id": recipient_id,
+                    "tenant_id": tenant_id,
+                    "channel": channel,
+                    "template_id": template.id,
+                    "data": data,
+                    "status": NotificationStatus.PENDING,
+                }
+                if digest_window is not None and channel in coalesce_channels:
+                    entry_data["status"] = NotificationStatus.COALESCING
+                    entry_data["deliver_after"] = now + digest_window
+                entries_data.append(entry_data)
+
+        notifications = self.repository.create_queue_entries(entries_data)
+        logger.info(
+            f"Queued {len(notifications)} {event_type} notifications "
+            f"for {len(recipient_ids)} recipients"
+        )
+        return [
+            {
+                "id": n.id,
+                "recipient_id": n.recipient_id,
+                "event_type": n.event_type,
+                "channel": n.channel,
+                "status": n.status,
+            }
+            for n in notifications
+        ]
+
+    def queue_batch(
+        self,
+        event_type: str,
+        tenant_id: UUID,
+        deliveries: list[tuple[UUID, str, dict[str, Any]]],
+        commit: bool = True,
+    ) -> list[NotificationQueue]:
+        """Queue notifications that each carry their own recipient and data.
+
+        Like send_many, but for fan-outs where every notification has its own
+        data (e.g., one per reminder). Preferences are resolved once for all
+        recipients and templates come from the compiled template cache, so the
+        batch costs a fixed number of queries plus one bulk insert. Entries are
+        left PENDING for NotificationDispatcher to deliver.
+
+        Args:
+            event_type: Event type that triggered the notifications
+            tenant_id: Tenant ID
+            deliveries: (recipient ID, channel, template data) tuples
+            commit: Commit the entries; False keeps them in the caller's
+                transaction
+
+        Returns:
+            Queued entries (deliveries the recipient opted out of are dropped)
+        """
+        if not deliveries:
+            return []
+        recipient_ids = list(dict.fromkeys(recipient for recipient, _, _ in deliveries))
+        notification_prefs = self.preferences_service.resolve_preferences(
+            recipient_ids,
+            tenant_id,
+            "notification",
+            event_type,
+            default={"enabled": True, "channels": ["in-app"]},
+        )
+        templates = self._get_cached_templates(
+            tenant_id, event_type, list(dict.fromkeys(c for _, c, _ in deliveries))
+        )
+
+        entries_data = []
+        for recipient_id, channel, data in deliveries:
+            prefs = notification_prefs[recipient_id]
+            template = templates.get(channel)
+            if (
+                template is None
+                or not prefs.get("enabled", True)
+                or channel not in prefs.get("channels", ["in-app"])
+            ):
+                continue
+            entries_data.append(
+                {
+                    "event_type": event_type,
+                    "recipient_id": recipient_id,
+                    "tenant_id": tenant_id,
+                    "channel": channel,
+                    "template_id": template.id,
+                    "data": data,
+                    "status": NotificationStatus.PENDING,
+                }
+            )
+
+        notifications = self.repository.create_queue_entries(entries_data, commit)
+        logger.info(
+            f"Queued {len(notifications)} of {len(deliveries)} {event_type} "
+            f"notifications for {len(recipient_ids)} recipients"
+        )
+        return notifications
+
+    def _get_cached_templates(
+        self, tenant_id: UUID, event_type: str, channels: list[str]
+    ) -> dict[str, NotificationTemplate]:
+        """Get the active template per channel from the tenant's template cache."""
+        template_cache = get_notification_template_cache()
+        templates = {}
+        for channel in channels:
+            template = template_cache.get(
+                tenant_id,
+                event_type,
+                channel,
+                lambda: self.repository.get_active_templates(tenant_id),
+            )
+            if template is None:
+                logger.warning(
+                    f"No template found for event_type={event_type}, channel={channel}"
+                )
+                continue
+            templates[channel] = template
+        return templates
+
+    def _get_digest_window(
+        self, recipient_id: UUID, tenant_id: UUID
+    ) -> timedelta | None:
+        """Get the recipient's digest window, or None if digests are disabled."""
+        default_window = get_settings().NOTIFICATIONS_DIGEST_WINDOW_SECONDS
+        digest_prefs = self.preferences_service.get_preference(
+            user_id=recipient_id,
+            tenant_id=tenant_id,
+            preference_type="notification",
+            key="digest",
+            default={"enabled": True, "window_seconds": default_window},
+        )
+        return _digest_window(digest_prefs, default_window)
+
+    def _get_digest_windows(
+        self, recipient_ids: list[UUID], tenant_id: UUID
+    ) -> dict[UUID, timedelta | None]:
+        """Get the digest window of several recipients (None if disabled)."""
+        default_window = get_settings().NOTIFICATIONS_DIGEST_WINDOW_SECONDS
+        digest_prefs = self.preferences_service.resolve_preferences(
+            recipient_ids,
+            tenant_id,
+            "notification",
+            "digest",
+            default={"enabled": True, "window_seconds": default_window},
+        )
+        return {
+            recipient_id: _digest_window(prefs, default_window)
+            for recipient_id, prefs in digest_prefs.items()
+        }
+
     async def _send_notification(
         self,
         queue_entry: NotificationQueue,
@@ -192,19 +454,8 @@ async def _send_notification(
             raise ValueError(f"Unsupported channel: {template.channel}")
 
     def _render_template(self, template: str, data: dict[str, Any]) -> str:
-        """Render template with variables.
-
-        Args:
-            template: Template string with {{variables}}
-            data: Data dictionary
-
-        Returns:
-            Rendered template
-        """
-        result = template
-        for key, value in data.items():
-            result = result.replace(f"{{{{{key}}}}}", str(value))
-        return result
+        """Render template with variables (see render_template)."""
+        return render_template(template, data)
 
     async def _send_email(
         self, recipient_id: UUID, subject: str | None, body: str
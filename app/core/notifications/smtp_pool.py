@@ -0,0 +1,140 @@
+"""Pooled, persistent SMTP connections for notification delivery."""
+
+import asyncio
+import logging
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+import aiosmtplib
+
+from app.core.config_file import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Errors after which a connection is discarded and the send retried once
+RECONNECT_ERRORS = (
+    aiosmtplib.SMTPServerDisconnected,
+    aiosmtplib.SMTPConnectError,
+    ConnectionError,
+)
+
+
+def build_email_message(
+    from_address: str, to_address: str, subject: str | None, body: str
+) -> MIMEMultipart:
+    """Build a notification email (HTML if the body looks like HTML)."""
+    message = MIMEMultipart("alternative")
+    message["From"] = from_address
+    message["To"] = to_address
+    if subject:
+        message["Subject"] = subject
+    message.attach(MIMEText(body, "html" if "<html>" in body.lower() else "plain"))
+    return message
+
+
+class SMTPConnectionPool:
+    """Keeps up to `size` authenticated SMTP sessions open and reuses them.
+
+    Opening a connection (TCP, TLS handshake, EHLO, AUTH) costs several round
+    trips; reusing sessions makes each message a single MAIL/RCPT/DATA
+    exchange. Connections dropped by the server are reopened transparently.
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: str | None = None,
+        password: str | None = None,
+        use_tls: bool = False,
+        size: int = 5,
+        timeout: float = 30.0,
+    ):
+        """Initialize pool.
+
+        Args:
+            hostname: SMTP server hostname
+            port: SMTP server port
+            username: SMTP username (optional)
+            password: SMTP password (optional)
+            use_tls: Connect using implicit TLS
+            size: Maximum open connections
+            timeout: Connection and command timeout in seconds
+        """
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.size = size
+        self.timeout = timeout
+        self._idle: list[aiosmtplib.SMTP] = []
+        self._slots = asyncio.Semaphore(size)
+        self.connections_opened = 0
+
+    @classmethod
+    def from_settings(cls, size: int | None = None) -> "SMTPConnectionPool":
+        """Create a pool from the SMTP_* settings."""
+        settings = get_settings()
+        return cls(
+            hostname=settings.SMTP_HOST,
+            port=settings.SMTP_PORT,
+            username=settings.SMTP_USER or None,
+            password=settings.SMTP_PASSWORD or None,
+            use_tls=settings.SMTP_USE_TLS,
+            size=size or settings.NOTIFICATIONS_SMTP_POOL_SIZE,
+        )
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        client = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            use_tls=self.use_tls,
+            timeout=self.timeout,
+        )
+        await client.connect()
+        self.connections_opened += 1
+        return client
+
+    async def _discard(self, client: aiosmtplib.SMTP) -> None:
+        try:
+            if client.is_connected:
+                await client.quit()
+        except Exception:
+            client.close()
+
+    async def send(self, message: MIMEMultipart) -> None:
+        """Send a message over a pooled connection.
+
+        Raises:
+            aiosmtplib.SMTPException: If the server rejects the message
+        """
+        async with self._slots:
+            client = self._idle.pop() if self._idle else None
+            try:
+                if client is None or not client.is_connected:
+                    client = await self._connect()
+                try:
+                    await client.send_message(message)
+                except RECONNECT_ERRORS as e:
+                    logger.info(f"SMTP connection lost ({e}), reconnecting")
+                    await self._discard(client)
+                    client = await self._connect()
+                    await client.send_message(message)
+            except RECONNECT_ERRORS:
+                if client is not None:
+                    await self._discard(client)
+                client = None
+                raise
+            finally:
+                # Rejected recipients/messages leave the session usable
+                if client is not None and client.is_connected:
+                    self._idle.append(client)
+
+    async def close(self) -> None:
+        """Close all idle connections."""
+        idle, self._idle = self._idle, []
+        for client in idle:
+            await self._discard(client)
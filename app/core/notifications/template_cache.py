@@ -0,0 +1,195 @@
+"""Process-wide cache of compiled notification templates per tenant."""
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from jinja2 import Template, TemplateError
+
+from app.core.config_file import get_settings
+from app.core.pubsub import topics
+from app.core.pubsub.invalidation import broadcast_invalidation
+from app.core.templates.compiler import NOTIFICATION, get_template_compilation_cache
+from app.models.notification import NotificationTemplate
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """Detached copy of a NotificationTemplate with compiled subject and body."""
+
+    id: UUID
+    event_type: str
+    channel: str
+    subject: Template | None
+    body: Template
+
+    @classmethod
+    def from_model(cls, template: NotificationTemplate) -> "CompiledTemplate":
+        """Compile a template model through the shared compilation cache.
+
+        Raises:
+            jinja2.TemplateError: If the subject or body is not a valid template
+        """
+        cache = get_template_compilation_cache()
+        return cls(
+            id=template.id,
+            event_type=template.event_type,
+            channel=template.channel,
+            subject=(
+                cache.get(template.subject, template.id, NOTIFICATION)
+                if template.subject
+                else None
+            ),
+            body=cache.get(template.body, template.id, NOTIFICATION),
+        )
+
+    def render_subject(self, data: dict[str, Any]) -> str | None:
+        """Render the subject, if the template has one."""
+        return self.subject.render(data) if self.subject else None
+
+    def render_body(self, data: dict[str, Any]) -> str:
+        """Render the body."""
+        return self.body.render(data)
+
+
+class NotificationTemplateCache:
+    """Caches each tenant's active notification templates, compiled.
+
+    A miss loads all of the tenant's active templates in one query, so a
+    fan-out to many recipients and channels resolves every template from
+    memory. Entries are dropped when a template is created, updated or
+    deleted (locally or in another worker via the
+    NOTIFICATION_TEMPLATES_CHANGED topic) and expire after a TTL as a
+    safety net.
+    """
+
+    def __init__(self, ttl_seconds: int | None = None):
+        """Initialize cache.
+
+        Args:
+            ttl_seconds: Entry lifetime (defaults to NOTIFICATIONS_TEMPLATE_CACHE_TTL)
+        """
+        self.ttl_seconds = (
+            ttl_seconds
+            if ttl_seconds is not None
+            else get_settings().NOTIFICATIONS_TEMPLATE_CACHE_TTL
+        )
+        self._templates: dict[
+            UUID, tuple[dict[tuple[str, str], CompiledTemplate], float]
+        ] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(
+        self,
+        tenant_id: UUID,
+        event_type: str,
+        channel: str,
+        loader: Callable[[], Iterable[NotificationTemplate]],
+    ) -> CompiledTemplate | None:
+        """Get the active template for an event type and channel.
+
+        Args:
+            tenant_id: Tenant ID
+            event_type: Event type
+            channel: Notification channel
+            loader: Callable returning the tenant's active templates on a miss
+
+        Returns:
+            Compiled template, or None if the tenant has no active template
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._templates.get(tenant_id)
+            if entry and entry[1] > now:
+                self._hits += 1
+                return entry[0].get((event_type, channel))
+            self._misses += 1
+
+        templates: dict[tuple[str, str], CompiledTemplate] = {}
+        for template in loader():
+            key = (template.event_type, template.channel)
+            if key in templates:
+                continue
+            try:
+                templates[key] = CompiledTemplate.from_model(template)
+            except TemplateError as e:
+                logger.warning(f"Notification template {template.id} is invalid: {e}")
+        with self._lock:
+            self._templates[tenant_id] = (templates, now + self.ttl_seconds)
+        return templates.get((event_type, channel))
+
+    def invalidate(self, tenant_id: UUID) -> None:
+        """Drop the cached templates of a tenant."""
+        with self._lock:
+            removed = self._templates.pop(tenant_id, None)
+        if removed:
+            logger.info(f"Notification template cache invalidated for {tenant_id}")
+
+    def clear(self) -> None:
+        """Drop all cached templates."""
+        with self._lock:
+            self._templates.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "tenants": len(self._templates),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / total, 4) if total else 0.0,
+            }
+
+
+# Global cache instance
+_cache: NotificationTemplateCache | None = None
+
+
+def get_notification_template_cache() -> NotificationTemplateCache:
+    """Get global notification template cache."""
+    global _cache
+    if _cache is None:
+        _cache = NotificationTemplateCache()
+    return _cache
+
+
+def precompile_notification_template(template: NotificationTemplate) -> None:
+    """Compile a saved template so its first delivery skips compilation."""
+    get_template_compilation_cache().invalidate(template.id)
+    try:
+        CompiledTemplate.from_model(template)
+    except TemplateError as e:
+        logger.warning(f"Notification template {template.id} is invalid: {e}")
+
+
+def notify_notification_templates_changed(tenant_id: UUID) -> None:
+    """Invalidate the local templates and tell other workers to do the same.
+
+    Without a running event loop only the local entry is dropped; other
+    processes pick up the change when their entry expires.
+    """
+    get_notification_template_cache().invalidate(tenant_id)
+    broadcast_invalidation(
+        topics.NOTIFICATION_TEMPLATES_CHANGED, {"tenant_id": str(tenant_id)}
+    )
+
+
+async def handle_notification_templates_changed(
+    topic: str, payload: dict[str, Any]
+) -> None:
+    """RedisEventBus handler for NOTIFICATION_TEMPLATES_CHANGED."""
+    try:
+        tenant_id = UUID(payload["tenant_id"])
+    except (KeyError, ValueError, TypeError):
+        logger.warning(f"Invalid {topic} payload: {payload}")
+        return
+    get_notification_template_cache().invalidate(tenant_id)
@@ -40,27 +40,64 @@ def get_preference(
         Returns:
             Preference value with inheritance applied
         """
+        return self.resolve_preferences(
+            [user_id], tenant_id, preference_type, key, default
+        )[user_id]
+
+    def resolve_preferences(
+        self,
+        user_ids: list[UUID],
+        tenant_id: UUID,
+        preference_type: str,
+        key: str,
+        default: Any = None,
+    ) -> dict[UUID, Any]:
+        """Resolve a preference for several users (org -> role -> user).
+
+        Loads each inheritance level for all users with one query per level,
+        so fanning a notification out to N recipients costs three queries
+        instead of a lookup per recipient.
+
+        Args:
+            user_ids: User IDs
+            tenant_id: Tenant ID
+            preference_type: Preference type (e.g., 'basic', 'notification')
+            key: Preference key
+            default: Default value if not found
+
+        Returns:
+            Dictionary mapping each user ID to its preference value
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        if not user_ids:
+            return {}
+
         # Get preferences from all levels
         org_pref = self.repository.get_org_preference(tenant_id, preference_type, key)
-        user_pref = self.repository.get_user_preference(
-            user_id, tenant_id, preference_type, key
-        )
-
-        # Get role preferences (need to get user's roles first)
-        # For now, we'll get all role preferences for the tenant
-        # TODO: Filter by user's actual roles when role system is more integrated
-        role_prefs_dict = {}
-        # This is a simplified version - in production, get user's roles and merge their preferences
+        role_values: dict[UUID, Any] = {}
+        for user_id, value in self.repository.get_role_preferences_for_users(
+            user_ids, tenant_id, preference_type, key
+        ):
+            # Most recent role preference wins when a user has several roles
+            role_values[user_id] = value
+        user_values = {
+            pref.user_id: pref.value
+            for pref in self.repository.get_user_preferences_for_users(
+                user_ids, tenant_id, preference_type, key
+            )
+        }
 
         # Build dictionaries for merging
         org_dict = {key: org_pref.value} if org_pref else {}
-        role_dict = role_prefs_dict
-        user_dict = {key: user_pref.value} if user_pref else {}
-
-        # Merge with inheritance
-        merged = merge_preferences(org_dict, role_dict, user_dict)
-
-        return merged.get(key, default)
+        resolved = {}
+        for user_id in user_ids:
+            role_dict = {key: role_values[user_id]} if user_id in role_values else {}
+            user_dict = {key: user_values[user_id]} if user_id in user_values else {}
+
+            # Merge with inheritance
+            merged = merge_preferences(org_dict, role_dict, user_dict)
+            resolved[user_id] = merged.get(key, default)
+        return resolved
 
     def get_all_preferences(
         self, user_id: UUID, tenant_id: UUID, preference_type: str | None = None
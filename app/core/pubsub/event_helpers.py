@@ -4,8 +4,19 @@
 import logging
 from typing import Any
 
+from sqlalchemy.orm import Session
+
 logger = logging.getLogger(__name__)
 
+# Keeps background publishes referenced until they finish, so they are not
+# garbage-collected mid-flight
+_background_publishes: set[asyncio.Task] = set()
+
+
+def _track(task: asyncio.Task) -> None:
+    _background_publishes.add(task)
+    task.add_done_callback(_background_publishes.discard)
+
 
 def safe_publish_event(
     event_publisher: Any,
@@ -15,12 +26,19 @@ def safe_publish_event(
     tenant_id: Any,
     user_id: Any | None = None,
     metadata: Any | None = None,
+    db: Session | None = None,
 ) -> None:
     """
     Safely publish an event, handling both sync and async contexts.
 
-    This function attempts to publish an event in a way that works in both
-    synchronous (tests, CLI) and asynchronous (FastAPI endpoints) contexts.
+    With a database session the event goes through the transactional outbox:
+    it is added to event_outbox under a savepoint and committed by the
+    caller's next commit, and OutboxRelay publishes it. The session is never
+    committed or rolled back here; a failed insert only undoes the savepoint.
+    The request does not wait on Redis and the event survives a crash.
+
+    Without a session, the event is published to Redis directly, in a
+    background task when an event loop is running.
 
     Args:
         event_publisher: EventPublisher instance.
@@ -30,13 +48,33 @@ def safe_publish_event(
         tenant_id: Tenant ID.
         user_id: Optional user ID.
         metadata: Optional event metadata.
+        db: Optional database session; routes the event through the outbox
+            (the caller commits it).
     """
+    if db is not None:
+        from app.core.pubsub.outbox import enqueue_event
+
+        try:
+            with db.begin_nested():
+                enqueue_event(
+                    db,
+                    event_type=event_type,
+                    entity_type=entity_type,
+                    entity_id=entity_id,
+                    tenant_id=tenant_id,
+                    user_id=user_id,
+                    metadata=metadata,
+                )
+        except Exception as e:
+            logger.error(f"Failed to store {event_type} event in outbox: {e}")
+        return
+
     try:
         # Try to get the current event loop
         try:
             loop = asyncio.get_running_loop()
             # Loop is running, schedule as task
-            asyncio.create_task(
+            task = asyncio.create_task(
                 event_publisher.publish(
                     event_type=event_type,
                     entity_type=entity_type,
@@ -46,6 +84,7 @@ def safe_publish_event(
                     metadata=metadata,
                 )
             )
+            _track(task)
         except RuntimeError:
             # No running loop, try to get or create one
             try:
@@ -59,7 +98,7 @@ def safe_publish_event(
 
                 if loop.is_running():
                     # Loop is running, use create_task
-                    asyncio.create_task(
+                    task = asyncio.create_task(
                         event_publisher.publish(
                             event_type=event_type,
                             entity_type=entity_type,
@@ -69,6 +108,7 @@ def safe_publish_event(
                             metadata=metadata,
                         )
                     )
+                    _track(task)
                 else:
                     # Loop exists but not running, run until complete
                     loop.run_until_complete(
@@ -0,0 +1,42 @@
+"""Cross-worker invalidation of in-process caches over RedisEventBus.
+
+A process that changes cached data drops its own entries and calls
+broadcast_invalidation with the cache's topic; the other workers subscribe
+a handler to that topic (see app.main) that drops theirs.
+"""
+
+import asyncio
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Keep references to in-flight publish tasks so they are not garbage-collected
+_pending_publishes: set[asyncio.Task] = set()
+
+
+async def _publish(topic: str, payload: dict[str, Any]) -> None:
+    """Publish an invalidation, logging instead of raising on failure."""
+    from app.core.pubsub import get_redis_event_bus
+
+    try:
+        event_bus = await get_redis_event_bus()
+        await event_bus.publish(topic, payload)
+    except Exception as e:
+        logger.warning(f"Failed to publish {topic} {payload}: {e}")
+
+
+def broadcast_invalidation(topic: str, payload: dict[str, Any]) -> None:
+    """Tell the other workers to drop their entries for payload.
+
+    Publishing is scheduled on the running event loop. Without one (CLI,
+    sync tests) nothing is sent; other processes pick up the change when
+    their entries expire.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    task = loop.create_task(_publish(topic, payload))
+    _pending_publishes.add(task)
+    task.add_done_callback(_pending_publishes.discard)
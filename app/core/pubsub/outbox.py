@@ -0,0 +1,236 @@
+"""Transactional outbox for domain events.
+
+Services append events to the event_outbox table in the transaction of the
+change they describe (enqueue_event), so an event is stored if and only if
+the change is committed and requests never wait on Redis. OutboxRelay drains
+the table in the background:
+
+- Batches of pending events are read in id order and published with one
+  pipelined XADD round trip, then deleted in the same transaction
+- A transaction-scoped advisory lock lets a single relay drain at a time
+  (any number may run), so events reach their streams in id order
+- Delivery is at-least-once: if the relay stops between XADD and commit,
+  the batch is published again, so consumers deduplicate on event_id
+- Lag stays bounded: full batches are relayed back to back, and the age of
+  the oldest pending event is exported and logged past a threshold
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+from redis.exceptions import RedisError
+from sqlalchemy.orm import Session
+
+from app.core.config_file import get_settings
+from app.core.db.session import SessionLocal
+from app.core.pubsub.client import RedisStreamsClient
+from app.core.pubsub.errors import PubSubError
+from app.core.pubsub.models import Event, EventMetadata
+from app.core.pubsub.publisher import determine_stream
+from app.models.event_outbox import EventOutbox
+from app.monitoring.outbox_metrics import get_outbox_metrics
+from app.repositories.event_outbox_repository import EventOutboxRepository
+
+logger = logging.getLogger(__name__)
+
+# Upper bound of the wait between batches while Redis keeps failing
+MAX_FAILURE_BACKOFF = 30.0
+
+
+def enqueue_event(
+    db: Session,
+    event_type: str,
+    entity_type: str,
+    entity_id: UUID,
+    tenant_id: UUID,
+    user_id: UUID | None = None,
+    metadata: EventMetadata | dict[str, Any] | None = None,
+) -> EventOutbox:
+    """Append an event to the outbox without committing.
+
+    The event is published by OutboxRelay once the caller's transaction
+    commits, and dropped with it on rollback.
+
+    Args:
+        db: Database session of the change the event describes
+        event_type: Event type in format '<module>.<action>'
+        entity_type: Type of entity (e.g., 'product')
+        entity_id: ID of the entity
+        tenant_id: Tenant ID
+        user_id: User ID (optional)
+        metadata: Event metadata (optional)
+
+    Returns:
+        Outbox entry
+
+    Raises:
+        ValidationError: If the event data is invalid
+    """
+    event = Event(
+        event_type=event_type,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        tenant_id=tenant_id,
+        user_id=user_id,
+        metadata=metadata or EventMetadata(source="unknown", version="1.0"),
+    )
+    return EventOutboxRepository(db).add(
+        {
+            "event_id": event.event_id,
+            "event_type": event_type,
+            "tenant_id": tenant_id,
+            "stream": determine_stream(event_type),
+            "fields": event.to_redis_dict(),
+        }
+    )
+
+
+class OutboxRelay:
+    """Publishes outbox events to Redis Streams in ordered batches."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        client: RedisStreamsClient | None = None,
+        batch_size: int | None = None,
+        poll_interval: float | None = None,
+        lag_warning_seconds: float | None = None,
+    ):
+        """Initialize relay.
+
+        Args:
+            session_factory: Callable returning a new database session
+            client: Redis Streams client (connected from REDIS_URL if not provided)
+            batch_size: Events published per batch
+            poll_interval: Seconds to wait when the outbox is empty
+            lag_warning_seconds: Oldest pending event age that logs a warning
+        """
+        settings = get_settings()
+        self.session_factory = session_factory
+        self.client = client or RedisStreamsClient(
+            redis_url=settings.REDIS_URL, password=settings.REDIS_PASSWORD
+        )
+        self.batch_size = batch_size or settings.EVENTS_OUTBOX_BATCH_SIZE
+        self.poll_interval = (
+            poll_interval
+            if poll_interval is not None
+            else settings.EVENTS_OUTBOX_POLL_INTERVAL
+        )
+        self.lag_warning_seconds = (
+            lag_warning_seconds
+            if lag_warning_seconds is not None
+            else settings.EVENTS_OUTBOX_LAG_WARNING_SECONDS
+        )
+        self.metrics = get_outbox_metrics()
+        self._running = False
+        self._task: asyncio.Task | None = None
+
+    async def relay_batch(self) -> dict[str, int]:
+        """Publish one batch of pending events.
+
+        Returns:
+            Dict with the number of events claimed, published and failed
+        """
+        started = time.monotonic()
+        result = {"claimed": 0, "published": 0, "failed": 0}
+        db = self.session_factory()
+        try:
+            repository = EventOutboxRepository(db)
+            if not repository.try_lock_relay():
+                # Another relay is draining the outbox
+                db.rollback()
+                return result
+            entries = repository.get_pending(self.batch_size)
+            if not entries:
+                db.rollback()
+                self.metrics.record_lag(0.0)
+                return result
+            result["claimed"] = len(entries)
+            self._record_lag(entries[0].created_at)
+
+            ids = [entry.id for entry in entries]
+            try:
+                async with self.client.connection() as redis_client:
+                    async with redis_client.pipeline(transaction=False) as pipe:
+                        for entry in entries:
+                            pipe.xadd(entry.stream, entry.fields)
+                        await pipe.execute()
+            except (PubSubError, RedisError) as e:
+                logger.warning(f"Failed to relay {len(ids)} outbox events: {e}")
+                repository.record_failure(ids, str(e))
+                result["failed"] = len(ids)
+            else:
+                repository.delete_published(ids)
+                result["published"] = len(ids)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        for outcome in ("published", "failed"):
+            if result[outcome]:
+                self.metrics.record_events(outcome, result[outcome])
+        self.metrics.record_batch(time.monotonic() - started)
+        return result
+
+    def _record_lag(self, oldest_created_at: datetime) -> None:
+        lag = (datetime.now(UTC) - oldest_created_at).total_seconds()
+        self.metrics.record_lag(lag)
+        if lag > self.lag_warning_seconds:
+            logger.warning(f"Event outbox lag is {lag:.1f}s")
+
+    async def run(self) -> None:
+        """Relay batches until stopped, sleeping while the outbox is empty."""
+        self._running = True
+        failures = 0
+        logger.info("Event outbox relay started")
+        while self._running:
+            try:
+                result = await self.relay_batch()
+            except Exception as e:
+                logger.error(f"Event outbox relay batch failed: {e}", exc_info=True)
+                result = {"claimed": 0, "failed": 1}
+            if result["failed"]:
+                failures += 1
+                await asyncio.sleep(
+                    min(self.poll_interval * 2**failures, MAX_FAILURE_BACKOFF)
+                )
+                continue
+            failures = 0
+            if result["claimed"] < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+        logger.info("Event outbox relay stopped")
+
+    def start(self) -> asyncio.Task:
+        """Run the relay in a background task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def stop(self) -> None:
+        """Stop the relay and close its Redis connection."""
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.client.close()
+
+
+# Global relay instance
+_relay: OutboxRelay | None = None
+
+
+def get_outbox_relay() -> OutboxRelay:
+    """Get global event outbox relay."""
+    global _relay
+    if _relay is None:
+        _relay = OutboxRelay()
+    return _relay
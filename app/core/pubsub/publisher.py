@@ -11,6 +11,23 @@
 logger = logging.getLogger(__name__)
 
 
+def determine_stream(event_type: str) -> str:
+    """Determine which stream to use based on event type.
+
+    Args:
+        event_type: Event type (e.g., 'product.created', 'system.error')
+
+    Returns:
+        Stream name ('events:domain' or 'events:technical')
+    """
+    settings = get_settings()
+    # Technical events: system.*, integration.*, audit.*, notification.*
+    technical_prefixes = ["system.", "integration.", "audit.", "notification."]
+    if any(event_type.startswith(prefix) for prefix in technical_prefixes):
+        return settings.REDIS_STREAM_TECHNICAL
+    return settings.REDIS_STREAM_DOMAIN
+
+
 class EventPublisher:
     """Publisher for events to Redis Streams."""
 
@@ -24,19 +41,8 @@ def __init__(self, client: RedisStreamsClient):
         self.settings = get_settings()
 
     def _determine_stream(self, event_type: str) -> str:
-        """Determine which stream to use based on event type.
-
-        Args:
-            event_type: Event type (e.g., 'product.created', 'system.error')
-
-        Returns:
-            Stream name ('events:domain' or 'events:technical')
-        """
-        # Technical events: system.*, integration.*, audit.*, notification.*
-        technical_prefixes = ["system.", "integration.", "audit.", "notification."]
-        if any(event_type.startswith(prefix) for prefix in technical_prefixes):
-            return self.settings.REDIS_STREAM_TECHNICAL
-        return self.settings.REDIS_STREAM_DOMAIN
+        """Determine which stream to use based on event type."""
+        return determine_stream(event_type)
 
     async def publish(
         self,
@@ -69,6 +69,7 @@
 NOTIFICATION_SEND = "notifications.send"
 NOTIFICATION_READ = "notifications.read"
 NOTIFICATION_DELETED = "notifications.deleted"
+NOTIFICATION_TEMPLATES_CHANGED = "notifications.templates_changed"
 
 # ============================================
 # FILES
@@ -76,6 +77,12 @@
 FILE_UPLOADED = "files.uploaded"
 FILE_SHARED = "files.shared"
 FILE_DELETED = "files.deleted"
+FILE_STORAGE_CONFIG_CHANGED = "files.storage_config_changed"
+
+# ============================================
+# CONFIG
+# ============================================
+CONFIG_CHANGED = "config.changed"
 
 # ============================================
 # TEAMS
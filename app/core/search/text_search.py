@@ -0,0 +1,97 @@
+"""Indexed text search shared by the repositories of searchable tables.
+
+Searchable tables carry a stored generated tsvector column (search_vector)
+with a GIN index, plus GIN trigram (pg_trgm) indexes on the text columns a
+substring search runs over. A search matches rows whose vector matches the
+query words or whose text contains the query, so results are a superset of
+the previous ILIKE '%q%' search, and both predicates can use an index.
+"""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import REAL, ColumnElement, cast, func, literal, or_, tuple_
+from sqlalchemy.orm import Query
+
+# Text search configuration of every search_vector column (no stemming or
+# stop words, as content is multilingual)
+SEARCH_CONFIG = "simple"
+
+# Keyset position of a ranked result: (rank, created_at, id) of the last row
+SearchCursor = tuple[float, datetime, UUID]
+
+
+class TextSearch:
+    """Full-text and substring search over the columns of one table.
+
+    Results are ordered by ts_rank_cd of the vector match (substring-only
+    matches rank 0), then newest first, and can be paged by keyset with the
+    (rank, created_at, id) of the last row of the previous page.
+    """
+
+    def __init__(
+        self,
+        vector: ColumnElement,
+        *substring_columns: ColumnElement,
+        created_at: ColumnElement,
+        id_column: ColumnElement,
+    ):
+        """Initialize search.
+
+        Args:
+            vector: Generated tsvector column (GIN indexed)
+            substring_columns: Text expressions with a trigram index
+            created_at: Tie-breaking timestamp column
+            id_column: Primary key column (last tie-breaker)
+        """
+        self.vector = vector
+        self.substring_columns = substring_columns
+        self.created_at = created_at
+        self.id_column = id_column
+
+    @staticmethod
+    def tsquery(query_text: str) -> ColumnElement:
+        """Parse user input as web search syntax (never a syntax error)."""
+        return func.websearch_to_tsquery(SEARCH_CONFIG, query_text)
+
+    def matches(self, query_text: str) -> ColumnElement:
+        """Condition for rows matching the query words or containing the text."""
+        pattern = f"%{query_text}%"
+        return or_(
+            self.vector.op("@@")(self.tsquery(query_text)),
+            *(column.ilike(pattern) for column in self.substring_columns),
+        )
+
+    def rank(self, query_text: str) -> ColumnElement:
+        """Relevance of a row for the query (0 for substring-only matches)."""
+        return func.ts_rank_cd(self.vector, self.tsquery(query_text))
+
+    def ranked(
+        self,
+        query: Query,
+        query_text: str,
+        after: SearchCursor | None = None,
+    ) -> Query:
+        """Filter a query to matching rows, ranked, returning (row, rank).
+
+        Args:
+            query: Query over the searched entity
+            query_text: Search text
+            after: Cursor of the last row of the previous page (optional)
+
+        Returns:
+            Ordered query yielding (row, rank) tuples
+        """
+        rank = self.rank(query_text)
+        query = query.filter(self.matches(query_text)).add_columns(rank)
+        if after is not None:
+            after_rank, after_created_at, after_id = after
+            # ts_rank_cd returns real; compare as real so the rank read back
+            # from the previous page equals the stored one exactly
+            query = query.filter(
+                tuple_(rank, self.created_at, self.id_column)
+                < tuple_(cast(literal(after_rank), REAL), after_created_at, after_id)
+            )
+        return query.order_by(
+            rank.desc(), self.created_at.desc(), self.id_column.desc()
+        )
@@ -109,17 +109,6 @@ async def bulk_update_status(
                         updated_task, old_status, new_status, user_id
                     )
 
-                    # Invalidate cache
-                    await self.cache_invalidation.invalidate_on_status_change(
-                        tenant_id,
-                        task.id,
-                        old_status,
-                        new_status,
-                        user_id,
-                        task.assigned_to_id,
-                        task.created_by_id,
-                    )
-
                 except Exception as e:
                     logger.error(f"Failed to update task {task.id}: {e}")
                     operation.errors.append({"task_id": str(task.id), "error": str(e)})
@@ -133,7 +122,7 @@ async def bulk_update_status(
                     affected_users.add(task.created_by_id)
 
             await self.cache_invalidation.invalidate_on_bulk_operations(
-                tenant_id, list(affected_users)
+                tenant_id, list(affected_users), [task.id for task in tasks]
             )
 
         except Exception as e:
@@ -153,11 +142,14 @@ async def bulk_assign(
         try:
             # Get tasks
             tasks = self.repository.get_tasks_by_ids(tenant_id, task_ids)
+            previous_assignees: set[UUID] = set()
 
             # Assign each task
             for task in tasks:
                 try:
                     old_assigned_to_id = task.assigned_to_id
+                    if old_assigned_to_id:
+                        previous_assignees.add(old_assigned_to_id)
 
                     # Update task
                     updated_task = self.repository.update_task(
@@ -181,22 +173,12 @@ async def bulk_assign(
                         updated_task, assigned_to_id, user_id
                     )
 
-                    # Invalidate cache
-                    await self.cache_invalidation.invalidate_on_task_assign(
-                        tenant_id,
-                        task.id,
-                        old_assigned_to_id,
-                        assigned_to_id,
-                        user_id,
-                        task.created_by_id,
-                    )
-
                 except Exception as e:
                     logger.error(f"Failed to assign task {task.id}: {e}")
                     operation.errors.append({"task_id": str(task.id), "error": str(e)})
 
             # Invalidate bulk cache
-            affected_users = {user_id, assigned_to_id}
+            affected_users = {user_id, assigned_to_id} | previous_assignees
             for task in tasks:
                 if task.created_by_id:
                     affected_users.add(task.created_by_id)
@@ -204,7 +186,7 @@ async def bulk_assign(
                     affected_users.add(task.assigned_to_id)
 
             await self.cache_invalidation.invalidate_on_bulk_operations(
-                tenant_id, list(affected_users)
+                tenant_id, list(affected_users), [task.id for task in tasks]
             )
 
         except Exception as e:
@@ -254,16 +236,6 @@ async def bulk_update_priority(
                         }
                     )
 
-                    # Invalidate cache
-                    await self.cache_invalidation.invalidate_on_task_update(
-                        tenant_id,
-                        task.id,
-                        task.assigned_to_id,
-                        task.assigned_to_id,
-                        task.created_by_id,
-                        user_id,
-                    )
-
                 except Exception as e:
                     logger.error(f"Failed to update priority for task {task.id}: {e}")
                     operation.errors.append({"task_id": str(task.id), "error": str(e)})
@@ -277,7 +249,7 @@ async def bulk_update_priority(
                     affected_users.add(task.created_by_id)
 
             await self.cache_invalidation.invalidate_on_bulk_operations(
-                tenant_id, list(affected_users)
+                tenant_id, list(affected_users), [task.id for task in tasks]
             )
 
         except Exception as e:
@@ -308,15 +280,6 @@ async def bulk_delete(
                         {"task_id": str(task.id), "title": task.title, "success": True}
                     )
 
-                    # Invalidate cache
-                    await self.cache_invalidation.invalidate_on_task_delete(
-                        tenant_id,
-                        task.id,
-                        task.assigned_to_id,
-                        task.created_by_id,
-                        user_id,
-                    )
-
                 except Exception as e:
                     logger.error(f"Failed to delete task {task.id}: {e}")
                     operation.errors.append({"task_id": str(task.id), "error": str(e)})
@@ -330,7 +293,7 @@ async def bulk_delete(
                     affected_users.add(task.created_by_id)
 
             await self.cache_invalidation.invalidate_on_bulk_operations(
-                tenant_id, list(affected_users)
+                tenant_id, list(affected_users), [task.id for task in tasks]
             )
 
         except Exception as e:
@@ -382,16 +345,6 @@ async def bulk_update_due_date(
                         }
                     )
 
-                    # Invalidate cache
-                    await self.cache_invalidation.invalidate_on_task_update(
-                        tenant_id,
-                        task.id,
-                        task.assigned_to_id,
-                        task.assigned_to_id,
-                        task.created_by_id,
-                        user_id,
-                    )
-
                 except Exception as e:
                     logger.error(f"Failed to update due date for task {task.id}: {e}")
                     operation.errors.append({"task_id": str(task.id), "error": str(e)})
@@ -405,7 +358,7 @@ async def bulk_update_due_date(
                     affected_users.add(task.created_by_id)
 
             await self.cache_invalidation.invalidate_on_bulk_operations(
-                tenant_id, list(affected_users)
+                tenant_id, list(affected_users), [task.id for task in tasks]
             )
 
         except Exception as e:
@@ -17,12 +17,11 @@ async def invalidate_on_task_create(
     ) -> None:
         """Invalidate cache when a task is created."""
         try:
-            # Invalidate creator's cache
-            await self.cache_service.invalidate_user_cache(tenant_id, created_by_id)
-
-            # Invalidate any user who might see this task in their visible tasks
-            # This is a broad invalidation - in production, you might want to be more specific
-            await self.cache_service.invalidate_task_cache(tenant_id)
+            # Any user might see this task in their visible tasks, so the
+            # whole tenant is invalidated (a single counter increment)
+            await self.cache_service.invalidate(
+                tenant_id, user_ids=[created_by_id], tenant_wide=True
+            )
         except Exception as e:
             # Log error but don't fail the operation
             print(f"Cache invalidation failed on task create: {e}")
@@ -47,12 +46,10 @@ async def invalidate_on_task_update(
             if new_assigned_to_id:
                 users_to_invalidate.add(new_assigned_to_id)
 
-            # Invalidate cache for each user
-            for user_id in users_to_invalidate:
-                await self.cache_service.invalidate_user_cache(tenant_id, user_id)
-
-            # Invalidate specific task cache
-            await self.cache_service.invalidate_task_cache(tenant_id, task_id)
+            # Invalidate the users and the task in one round trip
+            await self.cache_service.invalidate(
+                tenant_id, user_ids=users_to_invalidate, task_ids=[task_id]
+            )
 
         except Exception as e:
             print(f"Cache invalidation failed on task update: {e}")
@@ -73,12 +70,10 @@ async def invalidate_on_task_delete(
             if assigned_to_id:
                 users_to_invalidate.add(assigned_to_id)
 
-            # Invalidate cache for each user
-            for user_id in users_to_invalidate:
-                await self.cache_service.invalidate_user_cache(tenant_id, user_id)
-
-            # Invalidate specific task cache
-            await self.cache_service.invalidate_task_cache(tenant_id, task_id)
+            # Invalidate the users and the task in one round trip
+            await self.cache_service.invalidate(
+                tenant_id, user_ids=users_to_invalidate, task_ids=[task_id]
+            )
 
         except Exception as e:
             print(f"Cache invalidation failed on task delete: {e}")
@@ -100,12 +95,10 @@ async def invalidate_on_task_assign(
             if old_assigned_to_id:
                 users_to_invalidate.add(old_assigned_to_id)
 
-            # Invalidate cache for each user
-            for user_id in users_to_invalidate:
-                await self.cache_service.invalidate_user_cache(tenant_id, user_id)
-
-            # Invalidate specific task cache
-            await self.cache_service.invalidate_task_cache(tenant_id, task_id)
+            # Invalidate the users and the task in one round trip
+            await self.cache_service.invalidate(
+                tenant_id, user_ids=users_to_invalidate, task_ids=[task_id]
+            )
 
         except Exception as e:
             print(f"Cache invalidation failed on task assign: {e}")
@@ -128,15 +121,14 @@ async def invalidate_on_status_change(
             if assigned_to_id:
                 users_to_invalidate.add(assigned_to_id)
 
-            # Invalidate cache for each user
-            for user_id in users_to_invalidate:
-                await self.cache_service.invalidate_user_cache(tenant_id, user_id)
-
-            # Invalidate specific task cache
-            await self.cache_service.invalidate_task_cache(tenant_id, task_id)
-
-            # Invalidate agenda cache since status changes affect calendar views
-            await self.cache_service.invalidate_task_cache(tenant_id)
+            # Invalidate the users, the task and (since status changes affect
+            # calendar views) the tenant's agendas in one round trip
+            await self.cache_service.invalidate(
+                tenant_id,
+                user_ids=users_to_invalidate,
+                task_ids=[task_id],
+                tenant_wide=True,
+            )
 
         except Exception as e:
             print(f"Cache invalidation failed on status change: {e}")
@@ -157,27 +149,29 @@ async def invalidate_on_checklist_update(
             if assigned_to_id:
                 users_to_invalidate.add(assigned_to_id)
 
-            # Invalidate cache for each user
-            for user_id in users_to_invalidate:
-                await self.cache_service.invalidate_user_cache(tenant_id, user_id)
-
-            # Invalidate specific task cache
-            await self.cache_service.invalidate_task_cache(tenant_id, task_id)
+            # Invalidate the users and the task in one round trip
+            await self.cache_service.invalidate(
+                tenant_id, user_ids=users_to_invalidate, task_ids=[task_id]
+            )
 
         except Exception as e:
             print(f"Cache invalidation failed on checklist update: {e}")
 
     async def invalidate_on_bulk_operations(
-        self, tenant_id: UUID, user_ids: list[UUID]
+        self,
+        tenant_id: UUID,
+        user_ids: list[UUID],
+        task_ids: list[UUID] | None = None,
     ) -> None:
         """Invalidate cache when bulk operations are performed."""
         try:
-            # Invalidate cache for all affected users
-            for user_id in user_ids:
-                await self.cache_service.invalidate_user_cache(tenant_id, user_id)
-
-            # Invalidate all task cache for the tenant
-            await self.cache_service.invalidate_task_cache(tenant_id)
+            # Invalidate all affected users, tasks and the tenant in one round trip
+            await self.cache_service.invalidate(
+                tenant_id,
+                user_ids=user_ids,
+                task_ids=task_ids or (),
+                tenant_wide=True,
+            )
 
         except Exception as e:
             print(f"Cache invalidation failed on bulk operations: {e}")
@@ -185,11 +179,10 @@ async def invalidate_on_bulk_operations(
     async def invalidate_on_agenda_update(self, tenant_id: UUID, user_id: UUID) -> None:
         """Invalidate cache when agenda is updated."""
         try:
-            # Invalidate user's agenda cache
-            await self.cache_service.invalidate_user_cache(tenant_id, user_id)
-
-            # Invalidate calendar sources cache
-            await self.cache_service.invalidate_task_cache(tenant_id)
+            # Invalidate user's agenda and the tenant's calendar sources
+            await self.cache_service.invalidate(
+                tenant_id, user_ids=[user_id], tenant_wide=True
+            )
 
         except Exception as e:
             print(f"Cache invalidation failed on agenda update: {e}")
@@ -1,12 +1,24 @@
-"""Task cache service for Redis caching of task operations."""
+"""Task cache service for Redis caching of task operations.
+
+Keys embed the generation of the tenant and user they were computed for
+(see CacheGenerations), so invalidation increments a counter instead of
+searching the keyspace for matching keys.
+"""
 
 import json
+from collections.abc import Iterable
 from typing import Any
 from uuid import UUID
 
 import redis.asyncio as redis
 
-from app.core.config import get_settings
+from app.core.cache.generations import (
+    CacheGenerations,
+    task_scope,
+    tenant_scope,
+    user_scope,
+)
+from app.core.config_file import get_settings
 from app.schemas.task import TaskResponse
 
 
@@ -18,6 +30,7 @@ def __init__(self):
         self.settings = get_settings()
         self.redis_client: redis.Redis | None = None
         self.default_ttl = 300  # 5 minutes
+        self.generations = CacheGenerations("tasks")
 
     async def connect(self) -> None:
         """Connect to Redis."""
@@ -48,6 +61,20 @@ def _make_key(self, *parts: str | UUID) -> str:
         """Create a cache key from parts."""
         return ":".join(str(part) for part in parts)
 
+    async def _make_user_key(
+        self, tenant_id: UUID, user_id: UUID, *parts: str | UUID
+    ) -> str:
+        """Create the key of an entry computed for a user.
+
+        The key carries the current tenant and user generations, so it is
+        dropped by invalidate_user_cache and tenant-wide invalidation.
+        """
+        return await self.generations.key(
+            self.redis_client,
+            self._make_key(*parts),
+            [tenant_scope(tenant_id), user_scope(tenant_id, user_id)],
+        )
+
     async def get_visible_tasks(
         self,
         tenant_id: UUID,
@@ -75,9 +102,8 @@ async def get_visible_tasks(
         if priority:
             key_parts.append(f"priority:{priority}")
 
-        cache_key = self._make_key(*key_parts)
-
         try:
+            cache_key = await self._make_user_key(tenant_id, user_id, *key_parts)
             cached_data = await self.redis_client.get(cache_key)
             if cached_data:
                 # Parse cached JSON
@@ -118,9 +144,8 @@ async def set_visible_tasks(
         if priority:
             key_parts.append(f"priority:{priority}")
 
-        cache_key = self._make_key(*key_parts)
-
         try:
+            cache_key = await self._make_user_key(tenant_id, user_id, *key_parts)
             # Serialize tasks to JSON
             tasks_data = [task.model_dump() for task in tasks]
             cached_json = json.dumps(tasks_data, default=str)
@@ -155,9 +180,8 @@ async def get_agenda(
         if end_date:
             key_parts.append(f"end:{end_date}")
 
-        cache_key = self._make_key(*key_parts)
-
         try:
+            cache_key = await self._make_user_key(tenant_id, user_id, *key_parts)
             cached_data = await self.redis_client.get(cache_key)
             if cached_data:
                 return json.loads(cached_data)
@@ -190,9 +214,8 @@ async def set_agenda(
         if end_date:
             key_parts.append(f"end:{end_date}")
 
-        cache_key = self._make_key(*key_parts)
-
         try:
+            cache_key = await self._make_user_key(tenant_id, user_id, *key_parts)
             cached_json = json.dumps(agenda_data, default=str)
             await self.redis_client.setex(
                 cache_key, ttl or self.default_ttl, cached_json
@@ -209,11 +232,10 @@ async def get_calendar_sources(
         if not await self.is_available():
             return None
 
-        cache_key = self._make_key(
-            "tasks", "calendar_sources", str(tenant_id), str(user_id)
-        )
-
         try:
+            cache_key = await self._make_user_key(
+                tenant_id, user_id, "tasks", "calendar_sources", tenant_id, user_id
+            )
             cached_data = await self.redis_client.get(cache_key)
             if cached_data:
                 return json.loads(cached_data)
@@ -233,11 +255,10 @@ async def set_calendar_sources(
         if not await self.is_available():
             return
 
-        cache_key = self._make_key(
-            "tasks", "calendar_sources", str(tenant_id), str(user_id)
-        )
-
         try:
+            cache_key = await self._make_user_key(
+                tenant_id, user_id, "tasks", "calendar_sources", tenant_id, user_id
+            )
             cached_json = json.dumps(sources_data, default=str)
             await self.redis_client.setex(
                 cache_key, ttl or 3600, cached_json  # 1 hour for calendar sources
@@ -251,18 +272,7 @@ async def invalidate_user_cache(
         user_id: UUID,
     ) -> None:
         """Invalidate all cache entries for a specific user."""
-        if not await self.is_available():
-            return
-
-        try:
-            # Find all keys for this user
-            pattern = self._make_key("tasks", "*", str(tenant_id), str(user_id), "*")
-            keys = await self.redis_client.keys(pattern)
-
-            if keys:
-                await self.redis_client.delete(*keys)
-        except Exception as e:
-            print(f"Cache invalidation error: {e}")
+        await self.invalidate(tenant_id, user_ids=[user_id])
 
     async def invalidate_task_cache(
         self,
@@ -270,25 +280,41 @@ async def invalidate_task_cache(
         task_id: UUID | None = None,
     ) -> None:
         """Invalidate cache entries related to a task or all tasks in tenant."""
-        if not await self.is_available():
-            return
+        if task_id:
+            await self.invalidate(tenant_id, task_ids=[task_id])
+        else:
+            await self.invalidate(tenant_id, tenant_wide=True)
+
+    async def invalidate(
+        self,
+        tenant_id: UUID,
+        user_ids: Iterable[UUID] = (),
+        task_ids: Iterable[UUID] = (),
+        tenant_wide: bool = False,
+    ) -> int:
+        """Invalidate users, tasks and/or the whole tenant in one round trip.
+
+        Args:
+            tenant_id: Tenant ID
+            user_ids: Users whose cached entries are dropped
+            task_ids: Tasks whose derived entries are dropped
+            tenant_wide: Drop every task cache entry of the tenant
+
+        Returns:
+            Number of scopes invalidated
+        """
+        scopes = [user_scope(tenant_id, user_id) for user_id in user_ids if user_id]
+        scopes += [task_scope(tenant_id, task_id) for task_id in task_ids if task_id]
+        if tenant_wide:
+            scopes.append(tenant_scope(tenant_id))
+        if not scopes or not await self.is_available():
+            return 0
 
         try:
-            if task_id:
-                # Invalidate specific task cache (if implemented)
-                pattern = self._make_key(
-                    "tasks", "*", str(tenant_id), "*", f"*{task_id}*"
-                )
-            else:
-                # Invalidate all task cache for tenant
-                pattern = self._make_key("tasks", "*", str(tenant_id), "*")
-
-            keys = await self.redis_client.keys(pattern)
-
-            if keys:
-                await self.redis_client.delete(*keys)
+            return await self.generations.bump(self.redis_client, scopes)
         except Exception as e:
             print(f"Cache invalidation error: {e}")
+            return 0
 
     async def get_cache_stats(self) -> dict[str, Any]:
         """Get Redis cache statistics."""
@@ -152,6 +152,7 @@ def add_comment(
             # Contexto normal, usar safe_publish_event
             safe_publish_event(
                 event_publisher=self.event_publisher,
+                db=self.db,
                 event_type="task.comment_added",
                 entity_type="task",
                 entity_id=task_id,
@@ -167,12 +168,14 @@ def add_comment(
                     },
                 ),
             )
+            self.db.commit()
 
         # Si hay menciones, publicar eventos de notificación
         if mentions:
             for mentioned_user_id in mentions:
                 safe_publish_event(
                     event_publisher=self.event_publisher,
+                    db=self.db,
                     event_type="task.user_mentioned",
                     entity_type="task",
                     entity_id=task_id,
@@ -188,6 +191,7 @@ def add_comment(
                         },
                     ),
                 )
+            self.db.commit()
 
         logger.info(f"Comment {comment.id} added to task {task_id}")
 
@@ -271,6 +275,7 @@ def update_comment(
             # Contexto normal, usar safe_publish_event
             safe_publish_event(
                 event_publisher=self.event_publisher,
+                db=self.db,
                 event_type="task.comment_updated",
                 entity_type="task",
                 entity_id=task_id,
@@ -285,6 +290,7 @@ def update_comment(
                     },
                 ),
             )
+            self.db.commit()
 
         logger.info(f"Comment {comment.id} updated in task {task_id}")
 
@@ -371,6 +377,7 @@ def delete_comment(
             # Contexto normal, usar safe_publish_event
             safe_publish_event(
                 event_publisher=self.event_publisher,
+                db=self.db,
                 event_type="task.comment_deleted",
                 entity_type="task",
                 entity_id=task_id,
@@ -385,6 +392,7 @@ def delete_comment(
                     },
                 ),
             )
+            self.db.commit()
 
         logger.info(f"Comment {comment.id} deleted from task {task_id}")
 
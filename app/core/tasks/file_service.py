@@ -185,6 +185,7 @@ def attach_file(
 
         safe_publish_event(
             event_publisher=self.event_publisher,
+            db=self.db,
             event_type="task.file_attached",
             entity_type="task",
             entity_id=task_id,
@@ -202,6 +203,7 @@ def attach_file(
                 },
             ),
         )
+        self.db.commit()
 
         logger.info(f"File {file_id} attached to task {task_id}")
 
@@ -227,6 +229,7 @@ def detach_file(
         """
         from app.models.file import File
         from app.models.task import Task
+        from app.repositories.file_usage_repository import FileUsageRepository
 
         logger.debug(
             "Detaching file from task: task_id=%s, tenant_id=%s, user_id=%s, file_id=%s",
@@ -289,6 +292,8 @@ def detach_file(
         if not file_record:
             logger.debug("File record not found for soft delete")
         elif file_record.deleted_at is None:
+            if file_record.is_current:
+                FileUsageRepository(self.db).apply_file_delta(file_record, -1)
             file_record.is_current = False
             file_record.deleted_at = datetime.now(UTC)
             logger.debug("File soft delete applied")
@@ -306,6 +311,7 @@ def detach_file(
 
         safe_publish_event(
             event_publisher=self.event_publisher,
+            db=self.db,
             event_type="task.file_removed",
             entity_type="task",
             entity_id=task_id,
@@ -320,6 +326,7 @@ def detach_file(
                 },
             ),
         )
+        self.db.commit()
 
         logger.info(f"File {file_id} detached from task {task_id}")
 
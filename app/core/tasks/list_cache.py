@@ -0,0 +1,244 @@
+"""Read-through Redis cache of the task lists visible to each user.
+
+Listing a user's visible tasks is a join through the task_visibility
+projection plus a separate count; pages and counts are cached as TaskResponse
+DTOs serialized by pydantic-core (compact JSON, no ORM objects).
+
+Cache Strategy:
+- Keys: "tasks:list:{tenant_id}:{user_id}:{status}:{priority}:{skip}:{limit}"
+  and "tasks:count:{tenant_id}:{user_id}:{status}:{priority}", suffixed with
+  the tenant and user generations (see CacheGenerations, namespace "tasks",
+  shared with TaskCacheService so its invalidations apply here too)
+- Invalidation: task writes bump the generation of every user who can see
+  the task; entries written under the old generation expire through the TTL
+- Single-flight: concurrent misses on the same key in a process wait for one
+  database load instead of all running the query
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future
+from typing import Any, TypeVar
+from uuid import UUID
+
+import redis
+from pydantic import TypeAdapter
+from redis.exceptions import RedisError
+
+from app.core.cache.generations import CacheGenerations, tenant_scope, user_scope
+from app.core.config_file import get_settings
+from app.monitoring.task_metrics import get_task_metrics
+from app.schemas.task import TaskResponse
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_PAGE = TypeAdapter(list[TaskResponse])
+_COUNT = TypeAdapter(int)
+
+# Seconds before a failed Redis connection is retried
+RECONNECT_INTERVAL = 30.0
+
+
+class TaskListCache:
+    """Read-through cache of visible task pages and counts (sync Redis client)."""
+
+    def __init__(
+        self,
+        enabled: bool | None = None,
+        ttl: int | None = None,
+        redis_client: redis.Redis | None = None,
+    ):
+        """Initialize cache.
+
+        Args:
+            enabled: Whether caching is enabled (defaults to TASKS_LIST_CACHE_ENABLED)
+            ttl: Time-to-live of entries in seconds (defaults to TASKS_LIST_CACHE_TTL)
+            redis_client: Redis client (connected from REDIS_URL on first use)
+        """
+        settings = get_settings()
+        self.enabled = settings.TASKS_LIST_CACHE_ENABLED if enabled is None else enabled
+        self.ttl = ttl or settings.TASKS_LIST_CACHE_TTL
+        self.generations = CacheGenerations("tasks")
+        self._redis_client = redis_client
+        self._next_connect_at = 0.0
+        self._inflight: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._errors = 0
+
+    def _get_client(self) -> redis.Redis | None:
+        """Get the Redis client, connecting (at most every RECONNECT_INTERVAL)."""
+        if self._redis_client is not None or not self.enabled:
+            return self._redis_client
+
+        now = time.monotonic()
+        if now < self._next_connect_at:
+            return None
+        self._next_connect_at = now + RECONNECT_INTERVAL
+        try:
+            settings = get_settings()
+            client = redis.from_url(
+                settings.REDIS_URL,
+                password=settings.REDIS_PASSWORD if settings.REDIS_PASSWORD else None,
+                socket_connect_timeout=2,
+                socket_timeout=2,
+            )
+            client.ping()
+            self._redis_client = client
+            logger.info("Task list cache: Redis connected successfully")
+        except RedisError as e:
+            logger.warning(f"Task list cache: Failed to connect to Redis: {e}")
+        return self._redis_client
+
+    def get_page(
+        self,
+        tenant_id: UUID,
+        user_id: UUID,
+        status: str | None,
+        priority: str | None,
+        skip: int,
+        limit: int,
+        loader: Callable[[], list[TaskResponse]],
+    ) -> list[TaskResponse]:
+        """Get a page of a user's visible tasks, loading it on a miss."""
+        base = (
+            f"tasks:list:{tenant_id}:{user_id}:{status or '*'}:{priority or '*'}"
+            f":{skip}:{limit}"
+        )
+        return self._read_through(base, tenant_id, user_id, loader, _PAGE)
+
+    def get_count(
+        self,
+        tenant_id: UUID,
+        user_id: UUID,
+        status: str | None,
+        priority: str | None,
+        loader: Callable[[], int],
+    ) -> int:
+        """Get the number of a user's visible tasks, loading it on a miss."""
+        base = f"tasks:count:{tenant_id}:{user_id}:{status or '*'}:{priority or '*'}"
+        return self._read_through(base, tenant_id, user_id, loader, _COUNT)
+
+    def _read_through(
+        self,
+        base: str,
+        tenant_id: UUID,
+        user_id: UUID,
+        loader: Callable[[], T],
+        adapter: TypeAdapter,
+    ) -> T:
+        client = self._get_client()
+        if client is None:
+            return loader()
+
+        try:
+            key = self.generations.key_sync(
+                client, base, [tenant_scope(tenant_id), user_scope(tenant_id, user_id)]
+            )
+            cached = client.get(key)
+            if cached is not None:
+                value = adapter.validate_json(cached)
+                self._record("hit")
+                return value
+        except (RedisError, ValueError) as e:
+            logger.warning(f"Task list cache: Failed to get {base}: {e}")
+            self._record("error")
+            return loader()
+
+        # Single-flight: the first miss loads, concurrent misses wait for it.
+        # The key carries the generations, so a load started before an
+        # invalidation is never shared with requests made after it.
+        with self._lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = Future()
+        if not leader:
+            self._record("coalesced")
+            return flight.result()
+
+        self._record("miss")
+        try:
+            value = loader()
+            flight.set_result(value)
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+        try:
+            client.setex(key, self.ttl, adapter.dump_json(value))
+        except RedisError as e:
+            logger.warning(f"Task list cache: Failed to set {base}: {e}")
+        return value
+
+    def _record(self, result: str) -> None:
+        with self._lock:
+            if result == "hit":
+                self._hits += 1
+            elif result == "miss":
+                self._misses += 1
+            elif result == "coalesced":
+                self._coalesced += 1
+            else:
+                self._errors += 1
+        get_task_metrics().record_list_cache_lookup(result)
+
+    def invalidate(
+        self,
+        tenant_id: UUID,
+        user_ids: Iterable[UUID | None] = (),
+        tenant_wide: bool = False,
+    ) -> int:
+        """Drop the cached lists of users (or of the whole tenant) in one round trip.
+
+        Returns:
+            Number of scopes invalidated
+        """
+        scopes = [user_scope(tenant_id, user_id) for user_id in user_ids if user_id]
+        if tenant_wide:
+            scopes = [tenant_scope(tenant_id)]
+        client = self._get_client()
+        if client is None or not scopes:
+            return 0
+
+        try:
+            return self.generations.bump_sync(client, scopes)
+        except RedisError as e:
+            logger.warning(f"Task list cache: Failed to invalidate {tenant_id}: {e}")
+            return 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self._hits + self._misses + self._coalesced
+            return {
+                "enabled": self.enabled,
+                "connected": self._redis_client is not None,
+                "ttl": self.ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "coalesced": self._coalesced,
+                "errors": self._errors,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+# Global cache instance
+_cache: TaskListCache | None = None
+
+
+def get_task_list_cache() -> TaskListCache:
+    """Get global task list cache."""
+    global _cache
+    if _cache is None:
+        _cache = TaskListCache()
+    return _cache
@@ -0,0 +1,49 @@
+"""Async maintenance tasks for the Tasks module."""
+
+import logging
+from typing import Any
+from uuid import UUID
+
+from app.core.async_tasks import Task, register_task
+from app.core.db.deps import get_db
+from app.core.tasks.service import TaskService
+
+logger = logging.getLogger(__name__)
+
+
+@register_task(
+    module="tasks",
+    name="rebuild_task_visibility",
+    schedule={"type": "interval", "hours": 24},  # Diario
+    description="Recalcula la proyección de visibilidad de tareas para corregir desviaciones",
+    enabled=True,
+)
+class RebuildTaskVisibilityTask(Task):
+    """Task to rebuild the task_visibility projection from its source tables."""
+
+    async def execute(self, tenant_id: UUID, **kwargs) -> dict[str, Any]:
+        """Execute the rebuild task.
+
+        Args:
+            tenant_id: Tenant ID
+            **kwargs: Additional parameters (unused)
+
+        Returns:
+            Dict with rebuild statistics
+        """
+        db = next(get_db())
+
+        try:
+            rows = TaskService(db).rebuild_visibility(tenant_id)
+
+            logger.info(f"Task visibility rebuilt for tenant {tenant_id}: {rows} rows")
+
+            return {"tenant_id": str(tenant_id), "rows": rows}
+        except Exception as e:
+            logger.error(
+                f"Error rebuilding task visibility for tenant {tenant_id}: {e}",
+                exc_info=True,
+            )
+            raise
+        finally:
+            db.close()
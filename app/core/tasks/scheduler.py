@@ -104,12 +104,14 @@ async def check_due_soon_tasks(self) -> None:
                     # Check if notification was already sent for this window
                     if self._should_send_notification(task, window_name):
                         await self._publish_due_soon_event(
-                            task, event_publisher, window_name
+                            task, event_publisher, window_name, db
                         )
                         logger.info(
                             f"Published due_soon event for task {task.id} ({window_name})"
                         )
 
+            # Events and the notifications_sent marks commit together
+            db.commit()
             logger.info(f"Checked {len(time_windows)} time windows for due soon tasks")
         except Exception as e:
             logger.error(f"Error checking due soon tasks: {e}", exc_info=True)
@@ -139,8 +141,9 @@ async def check_overdue_tasks(self) -> None:
 
             for task in overdue_tasks:
                 # Publish overdue event
-                await self._publish_overdue_event(task, event_publisher)
+                await self._publish_overdue_event(task, event_publisher, db)
                 logger.info(f"Published overdue event for task {task.id}")
+            db.commit()
 
             logger.info(f"Checked {len(overdue_tasks)} overdue tasks")
         except Exception as e:
@@ -186,10 +189,10 @@ def _should_send_notification(self, task: Task, window_name: str) -> bool:
             True if notification should be sent
         """
         # Check metadata for already sent notifications
-        if not task.metadata:
+        if not task.task_metadata:
             return True
 
-        notifications_sent = task.metadata.get("notifications_sent", {})
+        notifications_sent = task.task_metadata.get("notifications_sent", {})
         last_sent = notifications_sent.get(f"due_soon_{window_name}")
 
         if not last_sent:
@@ -199,19 +202,21 @@ def _should_send_notification(self, task: Task, window_name: str) -> bool:
         return False
 
     async def _publish_due_soon_event(
-        self, task: Task, event_publisher, window_name: str
+        self, task: Task, event_publisher, window_name: str, db: Session
     ) -> None:
-        """Publish task.due_soon event.
+        """Store a task.due_soon event in the outbox (the caller commits).
 
         Args:
             task: Task that is due soon
             event_publisher: Event publisher instance
             window_name: Time window name
+            db: Session the event and the notification mark are added to
         """
         from app.core.pubsub.event_helpers import safe_publish_event
 
         safe_publish_event(
             event_publisher=event_publisher,
+            db=db,
             event_type="task.due_soon",
             entity_type="task",
             entity_id=task.id,
@@ -234,22 +239,22 @@ async def _publish_due_soon_event(
         )
 
         # Update task metadata to mark notification as sent
-        if not task.metadata:
-            task.metadata = {}
-        if "notifications_sent" not in task.metadata:
-            task.metadata["notifications_sent"] = {}
-
-        task.metadata["notifications_sent"][f"due_soon_{window_name}"] = datetime.now(
-            UTC
-        ).isoformat()
-        task.metadata = dict(task.metadata)  # Force SQLAlchemy to detect change
-
-    async def _publish_overdue_event(self, task: Task, event_publisher) -> None:
-        """Publish task.overdue event.
+        metadata = dict(task.task_metadata or {})
+        metadata["notifications_sent"] = {
+            **metadata.get("notifications_sent", {}),
+            f"due_soon_{window_name}": datetime.now(UTC).isoformat(),
+        }
+        task.task_metadata = metadata  # New dict so SQLAlchemy detects the change
+
+    async def _publish_overdue_event(
+        self, task: Task, event_publisher, db: Session
+    ) -> None:
+        """Store a task.overdue event in the outbox (the caller commits).
 
         Args:
             task: Overdue task
             event_publisher: Event publisher instance
+            db: Session the event is added to
         """
         from app.core.pubsub.event_helpers import safe_publish_event
 
@@ -257,6 +262,7 @@ async def _publish_overdue_event(self, task: Task, event_publisher) -> None:
 
         safe_publish_event(
             event_publisher=event_publisher,
+            db=db,
             event_type="task.overdue",
             entity_type="task",
             entity_id=task.id,
@@ -1,5 +1,6 @@
 """Task service for business logic."""
 
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
@@ -12,12 +13,14 @@
 from app.core.pubsub.event_helpers import safe_publish_event
 from app.core.pubsub.models import EventMetadata
 from app.core.tasks.audit_integration import get_task_audit_service
+from app.core.tasks.list_cache import get_task_list_cache
 from app.core.tasks.notification_service import get_task_notification_service
 from app.core.tasks.state_machine import TaskStateMachine, TaskTransitionError
 from app.core.tasks.templates import get_task_template_service
 from app.core.tasks.webhooks import get_task_webhook_service
-from app.models.task import Task, TaskPriority, TaskStatusEnum
+from app.models.task import Task, TaskAssignment, TaskPriority, TaskStatusEnum
 from app.repositories.task_repository import TaskRepository
+from app.schemas.task import TaskResponse
 
 logger = get_logger(__name__)
 
@@ -39,6 +42,7 @@ def __init__(
         self.webhook_service = get_task_webhook_service(db)
         self.template_service = get_task_template_service(db)
         self.cache = get_task_cache()
+        self.task_lists = get_task_list_cache()
 
     async def create_task(
         self,
@@ -126,6 +130,7 @@ async def create_task(
         # Publish event
         safe_publish_event(
             event_publisher=self.event_publisher,
+            db=self.db,
             event_type="task.created",
             entity_type="task",
             entity_id=task.id,
@@ -145,6 +150,7 @@ async def create_task(
         if assigned_to_id:
             safe_publish_event(
                 event_publisher=self.event_publisher,
+                db=self.db,
                 event_type="task.assigned",
                 entity_type="task",
                 entity_id=task.id,
@@ -162,6 +168,9 @@ async def create_task(
                     },
                 ),
             )
+        self.db.commit()
+
+        self.invalidate_visible_tasks(tenant_id, [created_by_id, assigned_to_id])
 
         logger.info(f"Task created: {task.id} ({title})")
 
@@ -196,6 +205,76 @@ async def create_task(
 
         return task
 
+    def list_visible_tasks(
+        self,
+        tenant_id: UUID,
+        user_id: UUID,
+        status: str | None = None,
+        priority: str | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[TaskResponse], int]:
+        """Get a page of the tasks visible to a user and their total.
+
+        Pages and counts are read through TaskListCache; task writes
+        invalidate them for every user who can see the task.
+
+        Returns:
+            Tuple of (tasks in the page, total visible tasks)
+        """
+        tasks = self.task_lists.get_page(
+            tenant_id,
+            user_id,
+            status,
+            priority,
+            skip,
+            limit,
+            lambda: [
+                TaskResponse.model_validate(task)
+                for task in self.repository.get_visible_tasks(
+                    tenant_id, user_id, status, priority, skip, limit
+                )
+            ],
+        )
+        total = self.task_lists.get_count(
+            tenant_id,
+            user_id,
+            status,
+            priority,
+            lambda: self.repository.count_visible_tasks(
+                tenant_id, user_id, status, priority
+            ),
+        )
+        return tasks, total
+
+    def invalidate_visible_tasks(
+        self, tenant_id: UUID, user_ids: Iterable[UUID | None]
+    ) -> None:
+        """Drop the cached task lists of users after a change they can see."""
+        self.task_lists.invalidate(tenant_id, user_ids)
+
+    def rebuild_visibility(self, tenant_id: UUID) -> int:
+        """Recompute the task visibility projection of a tenant.
+
+        Corrects drift from writes that bypassed the repositories (raw SQL,
+        cascading deletes of teams).
+
+        Returns:
+            Number of visibility rows written
+        """
+        rows = self.repository.visibility.rebuild_tenant(tenant_id)
+        self.db.commit()
+        self.task_lists.invalidate(tenant_id, tenant_wide=True)
+        return rows
+
+    def _task_viewer_ids(self, task: Task) -> set[UUID | None]:
+        """IDs of the users whose visible task lists include a task."""
+        viewer_ids = {task.created_by_id, task.assigned_to_id}
+        viewer_ids.update(
+            self.repository.visibility.get_viewer_ids(task.tenant_id, task.id)
+        )
+        return viewer_ids
+
     def get_task(self, task_id: UUID, tenant_id: UUID) -> Task | None:
         """Get a task by ID with checklist items loaded.
 
@@ -398,6 +477,8 @@ def _coerce_status(value: TaskStatusEnum | str) -> TaskStatusEnum:
                 logger.error(f"TaskTransitionError details: {type(e).__name__}: {e}")
                 raise ValueError(str(e))
 
+        # Users seeing the task before the change (e.g. a previous assignee)
+        viewer_ids = self._task_viewer_ids(current_task)
         task = self.repository.update_task(task_id, tenant_id, task_data)
         if task:
             # TODO: Temporarily commented out event publishing to debug timeout
@@ -411,6 +492,7 @@ def _coerce_status(value: TaskStatusEnum | str) -> TaskStatusEnum:
 
             safe_publish_event(
                 event_publisher=self.event_publisher,
+                db=self.db,
                 event_type="task.updated",
                 entity_type="task",
                 entity_id=task.id,
@@ -422,6 +504,10 @@ def _coerce_status(value: TaskStatusEnum | str) -> TaskStatusEnum:
                     additional_data=additional_data,
                 ),
             )
+            self.db.commit()
+            self.invalidate_visible_tasks(
+                tenant_id, viewer_ids | self._task_viewer_ids(task)
+            )
 
             # If status changed to DONE, set completed_at
             if (
@@ -457,6 +543,8 @@ async def delete_task(self, task_id: UUID, tenant_id: UUID, user_id: UUID) -> bo
         Returns:
             True if deleted successfully, False otherwise
         """
+        task = self.repository.get_task_by_id(task_id, tenant_id)
+        viewer_ids = self._task_viewer_ids(task) if task else set()
         deleted = self.repository.delete_task(task_id, tenant_id)
         if deleted:
             # Publish event
@@ -464,6 +552,7 @@ async def delete_task(self, task_id: UUID, tenant_id: UUID, user_id: UUID) -> bo
 
             safe_publish_event(
                 event_publisher=self.event_publisher,
+                db=self.db,
                 event_type="task.deleted",
                 entity_type="task",
                 entity_id=task_id,
@@ -475,6 +564,8 @@ async def delete_task(self, task_id: UUID, tenant_id: UUID, user_id: UUID) -> bo
                     additional_data={},
                 ),
             )
+            self.db.commit()
+            self.invalidate_visible_tasks(tenant_id, viewer_ids)
 
             # Trigger webhooks for task.deleted event
             await self._trigger_webhooks(
@@ -489,6 +580,47 @@ async def delete_task(self, task_id: UUID, tenant_id: UUID, user_id: UUID) -> bo
 
         return deleted
 
+    # Assignment operations
+    def add_assignment(self, assignment_data: dict) -> TaskAssignment:
+        """Assign a user or group to a task.
+
+        Args:
+            assignment_data: Assignment fields (task_id, tenant_id, assigned_to_id, ...)
+
+        Returns:
+            Created TaskAssignment object
+        """
+        assignment = self.repository.create_assignment(assignment_data)
+        # Team assignments are visible to every member of the team
+        self.invalidate_visible_tasks(
+            assignment.tenant_id,
+            self.repository.visibility.get_viewer_ids(
+                assignment.tenant_id, assignment.task_id
+            ),
+        )
+        return assignment
+
+    def remove_assignment(self, assignment_id: UUID, tenant_id: UUID) -> bool:
+        """Remove an assignment from a task.
+
+        Args:
+            assignment_id: Assignment ID
+            tenant_id: Tenant ID
+
+        Returns:
+            True if deleted successfully, False otherwise
+        """
+        assignment = self.repository.get_assignment_by_id(assignment_id, tenant_id)
+        if not assignment:
+            return False
+        viewer_ids = self.repository.visibility.get_viewer_ids(
+            tenant_id, assignment.task_id
+        )
+        deleted = self.repository.delete_assignment(assignment_id, tenant_id)
+        if deleted:
+            self.invalidate_visible_tasks(tenant_id, viewer_ids)
+        return deleted
+
     # Checklist operations
     def add_checklist_item(
         self, task_id: UUID, tenant_id: UUID, title: str, order: int = 0
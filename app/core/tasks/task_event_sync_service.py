@@ -89,6 +89,7 @@ async def sync_task_to_calendar(
 
         safe_publish_event(
             event_publisher=self.event_publisher,
+            db=self.db,
             event_type="task.calendar_synced",
             entity_type="task",
             entity_id=task_id,
@@ -105,6 +106,7 @@ async def sync_task_to_calendar(
                 },
             ),
         )
+        self.db.commit()
 
         logger.info(f"Task {task_id} synced to calendar {calendar_provider}")
 
@@ -157,6 +159,7 @@ async def unsync_task_from_calendar(
 
         safe_publish_event(
             event_publisher=self.event_publisher,
+            db=self.db,
             event_type="task.calendar_unsynced",
             entity_type="task",
             entity_id=task_id,
@@ -170,6 +173,7 @@ async def unsync_task_from_calendar(
                 },
             ),
         )
+        self.db.commit()
 
         logger.info(f"Task {task_id} unsynced from calendar")
         return True
@@ -213,6 +217,7 @@ async def update_calendar_event(
 
         safe_publish_event(
             event_publisher=self.event_publisher,
+            db=self.db,
             event_type="task.calendar_updated",
             entity_type="task",
             entity_id=task_id,
@@ -228,6 +233,7 @@ async def update_calendar_event(
                 },
             ),
         )
+        self.db.commit()
 
         logger.info(f"Calendar event updated for task {task_id}")
 
@@ -1,8 +1,15 @@
 """Webhooks system for Tasks module integrations."""
 
+import asyncio
+import json
 from datetime import datetime
 from uuid import UUID
 
+from app.core.integrations.circuit_breaker import CircuitBreakerRegistry
+from app.core.integrations.webhook_client import (
+    build_webhook_headers,
+    get_webhook_sender,
+)
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -72,6 +79,7 @@ def __init__(self, db):
         """Initialize webhook service."""
         self.db = db
         self._webhooks = {}  # TODO: Replace with database storage
+        self.breakers = CircuitBreakerRegistry()
 
     def create_webhook(
         self,
@@ -161,13 +169,11 @@ async def trigger_webhooks(
         self, event: str, data: dict, tenant_id: UUID
     ) -> list[dict]:
         """Trigger webhooks for an event."""
-        results = []
         webhooks = self.get_webhooks(tenant_id, event=event, is_active=True)
 
-        for webhook in webhooks:
+        async def _trigger(webhook: TaskWebhook) -> dict:
             try:
                 result = await self._send_webhook(webhook, event, data)
-                results.append(result)
 
                 # Update stats
                 if result["success"]:
@@ -176,24 +182,22 @@ async def trigger_webhooks(
                     webhook.failure_count += 1
 
                 webhook.last_triggered = datetime.utcnow()
+                return result
 
             except Exception as e:
                 logger.error(f"Failed to trigger webhook {webhook.id}: {e}")
-                results.append(
-                    {
-                        "webhook_id": str(webhook.id),
-                        "success": False,
-                        "error": str(e),
-                        "status_code": None,
-                    }
-                )
+                return {
+                    "webhook_id": str(webhook.id),
+                    "success": False,
+                    "error": str(e),
+                    "status_code": None,
+                }
 
-        return results
+        # Receivers are called concurrently over the shared connection pool
+        return list(await asyncio.gather(*(_trigger(webhook) for webhook in webhooks)))
 
     async def _send_webhook(self, webhook: TaskWebhook, event: str, data: dict) -> dict:
         """Send webhook payload."""
-        import httpx
-
         # Prepare payload
         payload = {
             "event": event,
@@ -201,45 +205,28 @@ async def _send_webhook(self, webhook: TaskWebhook, event: str, data: dict) -> d
             "timestamp": datetime.utcnow().isoformat(),
             "webhook_id": str(webhook.id),
         }
+        content = json.dumps(payload)
 
-        # Add signature if secret is provided
-        headers = webhook.headers.copy()
-        if webhook.secret:
-            import hashlib
-            import hmac
-
-            signature = hmac.new(
-                webhook.secret.encode(), str(payload).encode(), hashlib.sha256
-            ).hexdigest()
-            headers["X-Webhook-Signature"] = f"sha256={signature}"
-
-        # Add content type
+        # Signature covers the exact body sent
+        headers = build_webhook_headers(content, webhook.headers, webhook.secret)
         headers["Content-Type"] = "application/json"
 
-        try:
-            async with httpx.AsyncClient(timeout=webhook.timeout) as client:
-                response = await client.post(webhook.url, json=payload, headers=headers)
-
-                if response.status_code >= 200 and response.status_code < 300:
-                    logger.info(f"Webhook {webhook.id} delivered successfully")
-                    return {
-                        "webhook_id": str(webhook.id),
-                        "success": True,
-                        "status_code": response.status_code,
-                        "response": response.text,
-                    }
-                else:
-                    logger.warning(
-                        f"Webhook {webhook.id} failed with status {response.status_code}"
-                    )
-                    return {
-                        "webhook_id": str(webhook.id),
-                        "success": False,
-                        "status_code": response.status_code,
-                        "response": response.text,
-                    }
+        breaker = self.breakers.get(webhook.url)
+        if not breaker.allow():
+            logger.warning(f"Webhook {webhook.id} skipped: circuit open")
+            return {
+                "webhook_id": str(webhook.id),
+                "success": False,
+                "error": "Circuit open after repeated failures",
+                "status_code": None,
+            }
 
+        try:
+            response = await get_webhook_sender().send(
+                webhook.url, content, headers=headers, timeout=webhook.timeout
+            )
         except Exception as e:
+            breaker.record_failure()
             logger.error(f"Webhook {webhook.id} failed: {e}")
             return {
                 "webhook_id": str(webhook.id),
@@ -248,6 +235,29 @@ async def _send_webhook(self, webhook: TaskWebhook, event: str, data: dict) -> d
                 "status_code": None,
             }
 
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+
+        if response.status_code >= 200 and response.status_code < 300:
+            logger.info(f"Webhook {webhook.id} delivered successfully")
+            return {
+                "webhook_id": str(webhook.id),
+                "success": True,
+                "status_code": response.status_code,
+                "response": response.text,
+            }
+        logger.warning(
+            f"Webhook {webhook.id} failed with status {response.status_code}"
+        )
+        return {
+            "webhook_id": str(webhook.id),
+            "success": False,
+            "status_code": response.status_code,
+            "response": response.text,
+        }
+
     def get_webhook_stats(self, webhook_id: UUID, tenant_id: UUID) -> dict | None:
         """Get webhook statistics."""
         webhook = self.get_webhook(webhook_id, tenant_id)
@@ -284,8 +294,6 @@ def test_webhook(self, webhook_id: UUID, tenant_id: UUID) -> dict:
         }
 
         # Trigger test event
-        import asyncio
-
         results = asyncio.run(
             self.trigger_webhooks("webhook.test", sample_data, tenant_id)
         )
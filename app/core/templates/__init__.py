@@ -1,5 +1,16 @@
 """Templates module for document and notification template management."""
 
+from app.core.templates.rendering import (
+    DocumentRenderPool,
+    get_document_render_pool,
+    get_render_job_registry,
+)
 from app.core.templates.service import TemplateRenderer, TemplateService
 
-__all__ = ["TemplateService", "TemplateRenderer"]
+__all__ = [
+    "TemplateService",
+    "TemplateRenderer",
+    "DocumentRenderPool",
+    "get_document_render_pool",
+    "get_render_job_registry",
+]
@@ -0,0 +1,312 @@
+"""Process pool rendering PDF documents off the event loop."""
+
+import asyncio
+import io
+import logging
+import multiprocessing
+import os
+import re
+import threading
+from collections.abc import AsyncIterator, Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from html import unescape
+from typing import Any
+from uuid import UUID, uuid4
+
+from app.core.config_file import get_settings
+from app.core.templates.compiler import get_template_compilation_cache
+
+logger = logging.getLogger(__name__)
+
+
+def html_to_pdf(html_content: str) -> bytes:
+    """Convert rendered HTML to a PDF document.
+
+    Simplified conversion: tags are stripped and the text laid out as a
+    paragraph (in production use weasyprint or similar).
+
+    Raises:
+        ValueError: If reportlab is not installed
+    """
+    try:
+        from reportlab.lib.pagesizes import letter
+        from reportlab.lib.styles import getSampleStyleSheet
+        from reportlab.platypus import Paragraph, SimpleDocTemplate
+    except ImportError:
+        logger.error("reportlab not installed, cannot render PDF")
+        raise ValueError("PDF rendering requires reportlab package")
+
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter)
+    styles = getSampleStyleSheet()
+    text_content = re.sub(r"<[^>]+>", "", html_content)
+    doc.build([Paragraph(unescape(text_content), styles["Normal"])])
+    return buffer.getvalue()
+
+
+def render_pdf_document(
+    template_content: str,
+    variables: dict[str, Any],
+    template_id: UUID | None = None,
+) -> bytes:
+    """Render a document template to PDF in the current process.
+
+    Runs in pool workers; each worker keeps its own compilation cache, so a
+    batch compiles its template once per worker.
+    """
+    template = get_template_compilation_cache().get(template_content, template_id)
+    return html_to_pdf(template.render(**variables))
+
+
+class RenderJobStatus:
+    """Batch render job statuses."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass
+class RenderJob:
+    """Progress of a batch render job."""
+
+    tenant_id: UUID
+    template_id: UUID
+    total: int
+    output: str = "zip"
+    id: UUID = field(default_factory=uuid4)
+    status: str = RenderJobStatus.PENDING
+    completed: int = 0
+    failed: int = 0
+    errors: list[dict[str, Any]] = field(default_factory=list)
+    file_ids: list[UUID] = field(default_factory=list)
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    finished_at: datetime | None = None
+
+    @property
+    def progress(self) -> float:
+        """Share of documents processed (0 to 1)."""
+        if not self.total:
+            return 1.0
+        return round((self.completed + self.failed) / self.total, 4)
+
+    def finish(self, status: str) -> None:
+        """Mark the job as finished."""
+        self.status = status
+        self.finished_at = datetime.now(UTC)
+
+
+class DocumentRenderPool:
+    """Renders documents in a pool of worker processes.
+
+    PDF generation is CPU-bound and holds the GIL, so rendering in the
+    request coroutine stalls every other request on the worker. Jobs are
+    sent to a ProcessPoolExecutor instead, which also renders batches in
+    parallel across cores. The executor's own queue is unbounded, so at most
+    max_pending jobs are handed to it at a time; further callers wait.
+    """
+
+    def __init__(self, max_workers: int | None = None, max_pending: int | None = None):
+        """Initialize pool.
+
+        Args:
+            max_workers: Worker processes (defaults to TEMPLATES_RENDER_WORKERS,
+                or one per CPU)
+            max_pending: Jobs queued or running at once (defaults to
+                TEMPLATES_RENDER_QUEUE_SIZE)
+        """
+        settings = get_settings()
+        self.max_workers = (
+            max_workers or settings.TEMPLATES_RENDER_WORKERS or os.cpu_count() or 1
+        )
+        self.max_pending = max_pending or settings.TEMPLATES_RENDER_QUEUE_SIZE
+        self._executor: ProcessPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        self._slots: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                # Forking a process that runs an event loop and database pools
+                # is unsafe; workers start from a clean interpreter instead
+                methods = multiprocessing.get_all_start_methods()
+                context = multiprocessing.get_context(
+                    "forkserver" if "forkserver" in methods else "spawn"
+                )
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=context
+                )
+                logger.info(
+                    f"Document render pool started with {self.max_workers} workers"
+                )
+            return self._executor
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_pending)
+            self._loop = loop
+        return self._slots
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run a picklable function in a worker process.
+
+        Waits for a free slot when max_pending jobs are already in the pool.
+        """
+        async with self._get_slots():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+
+    async def render_pdf(
+        self,
+        template_content: str,
+        variables: dict[str, Any],
+        template_id: UUID | None = None,
+    ) -> bytes:
+        """Render a document template to PDF in a worker process.
+
+        Raises:
+            ValueError: If rendering fails
+        """
+        try:
+            return await self.run(
+                render_pdf_document, template_content, variables, template_id
+            )
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to render PDF: {e}")
+            raise ValueError(f"Failed to render PDF: {e}") from e
+
+    async def render_many(
+        self,
+        template_content: str,
+        rows: Iterable[dict[str, Any]],
+        template_id: UUID | None = None,
+    ) -> AsyncIterator[tuple[int, bytes | Exception]]:
+        """Render one PDF per row, yielding results as they complete.
+
+        At most max_pending documents are in flight, so results can be
+        streamed to storage without holding the whole batch in memory.
+
+        Yields:
+            (row index, PDF bytes or the exception raised rendering the row)
+        """
+
+        async def render(index: int, variables: dict[str, Any]):
+            try:
+                return index, await self.run(
+                    render_pdf_document, template_content, variables, template_id
+                )
+            except Exception as e:
+                return index, e
+
+        remaining = iter(enumerate(rows))
+        pending: set[asyncio.Task] = set()
+
+        def fill() -> None:
+            for index, variables in remaining:
+                pending.add(asyncio.create_task(render(index, variables)))
+                if len(pending) >= self.max_pending:
+                    return
+
+        fill()
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    pending.discard(task)
+                    yield task.result()
+                fill()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes, dropping queued jobs."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait, cancel_futures=True)
+                self._executor = None
+
+
+class RenderJobRegistry:
+    """Batch render jobs of this process, kept for progress polling.
+
+    Jobs run in the API process that accepted them; finished jobs are
+    dropped after TEMPLATES_RENDER_JOB_TTL seconds.
+    """
+
+    def __init__(self, ttl_seconds: int | None = None):
+        """Initialize registry.
+
+        Args:
+            ttl_seconds: Seconds a finished job is kept (defaults to settings)
+        """
+        self.ttl_seconds = ttl_seconds or get_settings().TEMPLATES_RENDER_JOB_TTL
+        self._jobs: dict[UUID, RenderJob] = {}
+        self._lock = threading.Lock()
+
+    def create(
+        self, tenant_id: UUID, template_id: UUID, total: int, output: str = "zip"
+    ) -> RenderJob:
+        """Register a new job."""
+        job = RenderJob(
+            tenant_id=tenant_id, template_id=template_id, total=total, output=output
+        )
+        with self._lock:
+            self._purge()
+            self._jobs[job.id] = job
+        return job
+
+    def get(self, job_id: UUID, tenant_id: UUID) -> RenderJob | None:
+        """Get a tenant's job."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None or job.tenant_id != tenant_id:
+            return None
+        return job
+
+    def _purge(self) -> None:
+        now = datetime.now(UTC)
+        expired = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.finished_at
+            and (now - job.finished_at).total_seconds() > self.ttl_seconds
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+
+# Global instances
+_pool: DocumentRenderPool | None = None
+_jobs: RenderJobRegistry | None = None
+
+
+def get_document_render_pool() -> DocumentRenderPool:
+    """Get global document render pool."""
+    global _pool
+    if _pool is None:
+        _pool = DocumentRenderPool()
+    return _pool
+
+
+def get_render_job_registry() -> RenderJobRegistry:
+    """Get global batch render job registry."""
+    global _jobs
+    if _jobs is None:
+        _jobs = RenderJobRegistry()
+    return _jobs
+
+
+def shutdown_document_render_pool() -> None:
+    """Stop the global pool's worker processes, if it was started."""
+    if _pool is not None:
+        _pool.shutdown()
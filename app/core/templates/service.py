@@ -1,31 +1,65 @@
 """Template service for document and notification template management."""
 
-import io
+import base64
 import logging
+import tempfile
+import zipfile
 from typing import Any
 from uuid import UUID
 
-from jinja2 import Environment, TemplateError
+from jinja2 import TemplateError
 from sqlalchemy.orm import Session
 
 from app.core.files.service import FileService
 from app.core.pubsub import EventPublisher, get_event_publisher
 from app.core.pubsub.models import EventMetadata
+from app.core.templates.compiler import get_template_compilation_cache
+from app.core.templates.rendering import (
+    DocumentRenderPool,
+    RenderJob,
+    RenderJobStatus,
+    get_document_render_pool,
+    html_to_pdf,
+)
 from app.models.template import Template, TemplateCategory, TemplateVersion
 from app.repositories.template_repository import TemplateRepository
 
 logger = logging.getLogger(__name__)
 
+# Batch archives larger than this are spooled to a temporary file on disk
+BATCH_ARCHIVE_SPOOL_BYTES = 8 * 1024 * 1024
+
 
 class TemplateRenderer:
     """Service for rendering templates with variables."""
 
     def __init__(self):
         """Initialize template renderer."""
-        self.jinja_env = Environment(autoescape=True)
+        self.cache = get_template_compilation_cache()
+
+    def precompile(self, template_content: str, template_id: UUID) -> bool:
+        """Compile a stored template ahead of its first render.
+
+        Args:
+            template_content: Template content (Jinja2 syntax)
+            template_id: Template ID
+
+        Returns:
+            True if the template compiled
+        """
+        try:
+            self.cache.get(template_content, template_id)
+            return True
+        except TemplateError as e:
+            logger.warning(f"Template {template_id} does not compile: {e}")
+            return False
 
     def render(
-        self, template_content: str, variables: dict[str, Any], format: str = "html"
+        self,
+        template_content: str,
+        variables: dict[str, Any],
+        format: str = "html",
+        template_id: UUID | None = None,
     ) -> str:
         """Render a template with variables.
 
@@ -33,6 +67,7 @@ def render(
             template_content: Template content (Jinja2 syntax)
             variables: Variables to render template with
             format: Output format (html, text, etc.)
+            template_id: ID of the stored template, if any
 
         Returns:
             Rendered template content
@@ -41,7 +76,7 @@ def render(
             ValueError: If template rendering fails
         """
         try:
-            template = self.jinja_env.from_string(template_content)
+            template = self.cache.get(template_content, template_id)
             rendered = template.render(**variables)
             return rendered
         except TemplateError as e:
@@ -51,12 +86,18 @@ def render(
             logger.error(f"Unexpected error rendering template: {e}")
             raise ValueError(f"Failed to render template: {e}") from e
 
-    def render_pdf(self, template_content: str, variables: dict[str, Any]) -> bytes:
+    def render_pdf(
+        self,
+        template_content: str,
+        variables: dict[str, Any],
+        template_id: UUID | None = None,
+    ) -> bytes:
         """Render a template to PDF format.
 
         Args:
             template_content: Template content
             variables: Variables to render template with
+            template_id: ID of the stored template, if any
 
         Returns:
             PDF content as bytes
@@ -65,33 +106,12 @@ def render_pdf(self, template_content: str, variables: dict[str, Any]) -> bytes:
             ValueError: If PDF rendering fails
         """
         try:
-            from reportlab.lib.pagesizes import letter
-            from reportlab.lib.styles import getSampleStyleSheet
-            from reportlab.platypus import Paragraph, SimpleDocTemplate
-
-            # First render HTML content
-            html_content = self.render(template_content, variables, format="html")
-
-            # Convert HTML to PDF (simplified - in production use weasyprint or similar)
-            buffer = io.BytesIO()
-            doc = SimpleDocTemplate(buffer, pagesize=letter)
-            styles = getSampleStyleSheet()
-            elements = []
-
-            # Simple conversion (in production, use proper HTML to PDF converter)
-            import re
-            from html import unescape
-
-            # Remove HTML tags and create paragraphs
-            text_content = re.sub(r"<[^>]+>", "", html_content)
-            elements.append(Paragraph(unescape(text_content), styles["Normal"]))
-
-            doc.build(elements)
-            return buffer.getvalue()
-
-        except ImportError:
-            logger.error("reportlab not installed, cannot render PDF")
-            raise ValueError("PDF rendering requires reportlab package")
+            html_content = self.render(
+                template_content, variables, format="html", template_id=template_id
+            )
+            return html_to_pdf(html_content)
+        except ValueError:
+            raise
         except Exception as e:
             logger.error(f"Failed to render PDF: {e}")
             raise ValueError(f"Failed to render PDF: {e}") from e
@@ -105,6 +125,7 @@ def __init__(
         db: Session,
         file_service: FileService | None = None,
         event_publisher: EventPublisher | None = None,
+        render_pool: DocumentRenderPool | None = None,
     ):
         """Initialize template service.
 
@@ -112,12 +133,14 @@ def __init__(
             db: Database session
             file_service: FileService instance (for storing rendered templates)
             event_publisher: EventPublisher instance
+            render_pool: Process pool rendering PDFs (shared global pool if not provided)
         """
         self.db = db
         self.repository = TemplateRepository(db)
         self.renderer = TemplateRenderer()
         self.file_service = file_service or FileService(db)
         self.event_publisher = event_publisher or get_event_publisher()
+        self.render_pool = render_pool or get_document_render_pool()
 
     def create_template(
         self,
@@ -143,12 +166,14 @@ def create_template(
                 "created_by": user_id,
             }
         )
+        self.renderer.precompile(template.content, template.id)
 
         # Publish event
         from app.core.pubsub.event_helpers import safe_publish_event
 
         safe_publish_event(
             event_publisher=self.event_publisher,
+            db=self.db,
             event_type="template.created",
             entity_type="template",
             entity_id=template.id,
@@ -163,6 +188,7 @@ def create_template(
                 },
             ),
         )
+        self.db.commit()
 
         return template
 
@@ -226,12 +252,15 @@ def update_template(
                     "created_by": template_data.get("updated_by"),
                 }
             )
+            self.renderer.cache.invalidate(template_id)
+            self.renderer.precompile(updated_template.content, template_id)
 
         # Publish event
         from app.core.pubsub.event_helpers import safe_publish_event
 
         safe_publish_event(
             event_publisher=self.event_publisher,
+            db=self.db,
             event_type="template.updated",
             entity_type="template",
             entity_id=updated_template.id,
@@ -243,6 +272,7 @@ def update_template(
                 additional_data={"template_name": updated_template.name},
             ),
         )
+        self.db.commit()
 
         return updated_template
 
@@ -256,6 +286,7 @@ def delete_template(self, template_id: UUID, tenant_id: UUID) -> bool:
             raise ValueError("Cannot delete system template")
 
         self.repository.delete_template(template)
+        self.renderer.cache.invalidate(template_id)
         return True
 
     def render_template(
@@ -276,36 +307,172 @@ def render_template(
         Returns:
             Dictionary with rendered_content, format, and variables_used
         """
-        template = self.repository.get_template_by_id(template_id, tenant_id)
-        if not template:
-            raise ValueError("Template not found")
-
-        current_version = self.repository.get_current_version(template_id, tenant_id)
-        if not current_version:
-            raise ValueError("Template has no current version")
-
+        template, current_version = self._get_current_version(template_id, tenant_id)
         output_format = format or template.template_format
 
         # Render based on format
         if output_format == "pdf":
-            rendered_content = self.renderer.render_pdf(
-                current_version.content, variables
+            # For PDF, return bytes as a base64 string
+            rendered_content = base64.b64encode(
+                self.renderer.render_pdf(
+                    current_version.content, variables, template_id=template.id
+                )
+            ).decode("utf-8")
+        else:
+            rendered_content = self.renderer.render(
+                current_version.content,
+                variables,
+                format=output_format,
+                template_id=template.id,
             )
-            # For PDF, return bytes (would need to be handled differently in API)
-            # For now, return as base64 string
-            import base64
 
-            rendered_content = base64.b64encode(rendered_content).decode("utf-8")
+        self._publish_rendered(template, tenant_id, output_format)
+        return {
+            "rendered_content": rendered_content,
+            "format": output_format,
+            "variables_used": variables,
+        }
+
+    async def render_document(
+        self,
+        template_id: UUID,
+        tenant_id: UUID,
+        variables: dict[str, Any],
+        format: str | None = None,
+    ) -> dict[str, Any]:
+        """Render a template like render_template, with PDFs built in the render pool.
+
+        Returns:
+            Dictionary with rendered_content, format, and variables_used
+        """
+        template, current_version = self._get_current_version(template_id, tenant_id)
+        output_format = format or template.template_format
+
+        if output_format == "pdf":
+            pdf = await self.render_pool.render_pdf(
+                current_version.content, variables, template_id=template.id
+            )
+            rendered_content = base64.b64encode(pdf).decode("utf-8")
         else:
             rendered_content = self.renderer.render(
-                current_version.content, variables, format=output_format
+                current_version.content,
+                variables,
+                format=output_format,
+                template_id=template.id,
             )
 
-        # Publish event
+        self._publish_rendered(template, tenant_id, output_format)
+        return {
+            "rendered_content": rendered_content,
+            "format": output_format,
+            "variables_used": variables,
+        }
+
+    async def render_batch(
+        self,
+        job: RenderJob,
+        rows: list[dict[str, Any]],
+        user_id: UUID,
+    ) -> RenderJob:
+        """Render one PDF per row of a dataset and store the results.
+
+        Documents are rendered in the render pool and streamed to storage as
+        they complete: as a single zip archive (output "zip", built in a
+        temporary file that spills to disk beyond BATCH_ARCHIVE_SPOOL_BYTES)
+        or as one file per document (output "files"). Progress is recorded on the job; rows
+        that fail to render are reported in job.errors.
+
+        Args:
+            job: Job created in the render job registry
+            rows: Variables of each document
+            user_id: User storing the files
+
+        Returns:
+            The finished job
+        """
+        job.status = RenderJobStatus.RUNNING
+        try:
+            template, current_version = self._get_current_version(
+                job.template_id, job.tenant_id
+            )
+            with tempfile.SpooledTemporaryFile(
+                max_size=BATCH_ARCHIVE_SPOOL_BYTES
+            ) as archive_file:
+                with zipfile.ZipFile(
+                    archive_file, "w", zipfile.ZIP_DEFLATED
+                ) as archive:
+                    async for index, result in self.render_pool.render_many(
+                        current_version.content, rows, template_id=template.id
+                    ):
+                        if isinstance(result, Exception):
+                            job.failed += 1
+                            job.errors.append({"row": index + 1, "error": str(result)})
+                            continue
+                        filename = f"{template.name}-{index + 1:05d}.pdf"
+                        if job.output == "zip":
+                            archive.writestr(filename, result)
+                        else:
+                            stored = await self.file_service.upload_file(
+                                file_content=result,
+                                filename=filename,
+                                entity_type="template",
+                                entity_id=template.id,
+                                tenant_id=job.tenant_id,
+                                user_id=user_id,
+                            )
+                            job.file_ids.append(stored.id)
+                        job.completed += 1
+
+                if job.output == "zip" and job.completed:
+                    archive_file.seek(0)
+                    stored = await self.file_service.upload_file(
+                        file_content=archive_file,
+                        filename=f"{template.name}-batch.zip",
+                        entity_type="template",
+                        entity_id=template.id,
+                        tenant_id=job.tenant_id,
+                        user_id=user_id,
+                        description=f"{job.completed} documents rendered from {template.name}",
+                    )
+                    job.file_ids.append(stored.id)
+        except Exception as e:
+            logger.error(f"Batch render job {job.id} failed: {e}", exc_info=True)
+            job.errors.append({"row": None, "error": str(e)})
+            job.finish(RenderJobStatus.FAILED)
+            return job
+
+        logger.info(
+            f"Batch render job {job.id}: {job.completed} rendered, {job.failed} failed"
+        )
+        job.finish(RenderJobStatus.COMPLETED)
+        self._publish_rendered(template, job.tenant_id, "pdf")
+        return job
+
+    def _get_current_version(
+        self, template_id: UUID, tenant_id: UUID
+    ) -> tuple[Template, TemplateVersion]:
+        """Get a template and its current version.
+
+        Raises:
+            ValueError: If the template or its current version is missing
+        """
+        template = self.repository.get_template_by_id(template_id, tenant_id)
+        if not template:
+            raise ValueError("Template not found")
+
+        current_version = self.repository.get_current_version(template_id, tenant_id)
+        if not current_version:
+            raise ValueError("Template has no current version")
+        return template, current_version
+
+    def _publish_rendered(
+        self, template: Template, tenant_id: UUID, output_format: str
+    ) -> None:
         from app.core.pubsub.event_helpers import safe_publish_event
 
         safe_publish_event(
             event_publisher=self.event_publisher,
+            db=self.db,
             event_type="template.rendered",
             entity_type="template",
             entity_id=template.id,
@@ -320,12 +487,7 @@ def render_template(
                 },
             ),
         )
-
-        return {
-            "rendered_content": rendered_content,
-            "format": output_format,
-            "variables_used": variables,
-        }
+        self.db.commit()
 
     def get_template_versions(
         self, template_id: UUID, tenant_id: UUID
@@ -371,3 +533,19 @@ def delete_template_category(self, category_id: UUID, tenant_id: UUID) -> bool:
 
         self.repository.delete_template_category(category)
         return True
+
+
+async def run_batch_render_job(
+    job: RenderJob, rows: list[dict[str, Any]], user_id: UUID
+) -> RenderJob:
+    """Run a batch render job with its own database session.
+
+    Used by background tasks that outlive the request that created the job.
+    """
+    from app.core.db.session import SessionLocal
+
+    db = SessionLocal()
+    try:
+        return await TemplateService(db).render_batch(job, rows, user_id)
+    finally:
+        db.close()
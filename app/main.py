@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
@@ -21,6 +22,7 @@
 from app.core.exceptions import APIException
 from app.core.files import tasks as files_tasks  # noqa: F401
 from app.core.module_registry import ModuleRegistry, set_module_registry
+from app.core.tasks import maintenance as tasks_maintenance  # noqa: F401
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -28,12 +30,19 @@
 # Global variables for async services
 async_task_service: AsyncTaskService | None = None
 task_scheduler = None
+event_bus_task: asyncio.Task | None = None
+notification_dispatcher = None
+webhook_dispatcher = None
+outbox_relay = None
+reminder_pump = None
+audit_writer = None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifecycle events."""
-    global async_task_service
+    global async_task_service, event_bus_task, notification_dispatcher
+    global webhook_dispatcher, outbox_relay, reminder_pump, audit_writer
 
     # Startup
     try:
@@ -79,9 +88,140 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to discover webhook events: {e}", exc_info=True)
 
+    # Listen for cross-worker invalidations (e.g. cached storage backends)
+    try:
+        from app.core.config.cache import handle_config_changed
+        from app.core.files.backend_registry import handle_storage_config_changed
+        from app.core.notifications.template_cache import (
+            handle_notification_templates_changed,
+        )
+        from app.core.pubsub import get_redis_event_bus, topics
+
+        event_bus = await get_redis_event_bus()
+        await event_bus.subscribe(
+            topics.FILE_STORAGE_CONFIG_CHANGED, handle_storage_config_changed
+        )
+        await event_bus.subscribe(
+            topics.NOTIFICATION_TEMPLATES_CHANGED,
+            handle_notification_templates_changed,
+        )
+        await event_bus.subscribe(topics.CONFIG_CHANGED, handle_config_changed)
+        event_bus_task = asyncio.create_task(event_bus.start_subscriber())
+        logger.info("RedisEventBus subscriber started")
+    except Exception as e:
+        logger.error(f"Failed to start RedisEventBus subscriber: {e}", exc_info=True)
+
+    # Deliver queued notifications in the background
+    if settings.NOTIFICATIONS_DISPATCHER_ENABLED:
+        try:
+            from app.core.notifications.dispatcher import get_notification_dispatcher
+
+            notification_dispatcher = get_notification_dispatcher()
+            notification_dispatcher.start()
+            logger.info("Notification dispatcher started")
+        except Exception as e:
+            logger.error(f"Failed to start notification dispatcher: {e}", exc_info=True)
+
+    # Deliver queued webhooks in the background
+    if settings.WEBHOOKS_DISPATCHER_ENABLED:
+        try:
+            from app.core.integrations.delivery import get_webhook_dispatcher
+
+            webhook_dispatcher = get_webhook_dispatcher()
+            webhook_dispatcher.start()
+            logger.info("Webhook dispatcher started")
+        except Exception as e:
+            logger.error(f"Failed to start webhook dispatcher: {e}", exc_info=True)
+
+    # Publish events stored in the outbox to Redis Streams
+    if settings.EVENTS_OUTBOX_RELAY_ENABLED:
+        try:
+            from app.core.pubsub.outbox import get_outbox_relay
+
+            outbox_relay = get_outbox_relay()
+            outbox_relay.start()
+            logger.info("Event outbox relay started")
+        except Exception as e:
+            logger.error(f"Failed to start event outbox relay: {e}", exc_info=True)
+
+    # Queue notifications for due calendar and task reminders
+    if settings.REMINDERS_PUMP_ENABLED:
+        try:
+            from app.core.notifications.reminders import get_reminder_pump
+
+            reminder_pump = get_reminder_pump()
+            reminder_pump.start()
+            logger.info("Reminder pump started")
+        except Exception as e:
+            logger.error(f"Failed to start reminder pump: {e}", exc_info=True)
+
+    # Buffer audit log entries and write them in batches
+    if settings.LOG_TO_DB and settings.AUDIT_WRITER_ENABLED:
+        try:
+            from app.core.audit.writer import get_audit_writer
+
+            audit_writer = get_audit_writer()
+            audit_writer.start()
+            logger.info("Audit log writer started")
+        except Exception as e:
+            logger.error(f"Failed to start audit log writer: {e}", exc_info=True)
+
     yield
 
     # Shutdown
+    if audit_writer:
+        try:
+            await audit_writer.stop()
+            logger.info("Audit log writer stopped")
+        except Exception as e:
+            logger.error(f"Error stopping audit log writer: {e}", exc_info=True)
+
+    if reminder_pump:
+        try:
+            await reminder_pump.stop()
+            logger.info("Reminder pump stopped")
+        except Exception as e:
+            logger.error(f"Error stopping reminder pump: {e}", exc_info=True)
+
+    if notification_dispatcher:
+        try:
+            await notification_dispatcher.stop()
+            logger.info("Notification dispatcher stopped")
+        except Exception as e:
+            logger.error(f"Error stopping notification dispatcher: {e}", exc_info=True)
+
+    if webhook_dispatcher:
+        try:
+            await webhook_dispatcher.stop()
+            logger.info("Webhook dispatcher stopped")
+        except Exception as e:
+            logger.error(f"Error stopping webhook dispatcher: {e}", exc_info=True)
+
+    if outbox_relay:
+        try:
+            await outbox_relay.stop()
+            logger.info("Event outbox relay stopped")
+        except Exception as e:
+            logger.error(f"Error stopping event outbox relay: {e}", exc_info=True)
+
+    try:
+        from app.core.templates.rendering import shutdown_document_render_pool
+
+        shutdown_document_render_pool()
+    except Exception as e:
+        logger.error(f"Error stopping document render pool: {e}", exc_info=True)
+
+    if event_bus_task:
+        try:
+            from app.core.pubsub import get_redis_event_bus
+
+            await (await get_redis_event_bus()).stop_subscriber()
+            event_bus_task.cancel()
+            await asyncio.gather(event_bus_task, return_exceptions=True)
+            logger.info("RedisEventBus subscriber stopped")
+        except Exception as e:
+            logger.error(f"Error stopping RedisEventBus subscriber: {e}", exc_info=True)
+
     # Stop TaskScheduler
     if task_scheduler:
         try:
@@ -6,7 +6,8 @@
 from app.models.contact import Contact
 from app.models.contact_method import ContactMethod
 from app.models.delegated_permission import DelegatedPermission
-from app.models.file import File, FilePermission, FileVersion
+from app.models.event_outbox import EventOutbox
+from app.models.file import File, FilePermission, FileUsageCounter, FileVersion
 from app.models.folder import Folder
 from app.models.gamification import (
     Badge,
@@ -43,6 +44,7 @@
 from app.models.task import (
     Task,
     TaskChecklistItem,
+    TaskVisibility,
     Workflow,
     WorkflowExecution,
     WorkflowStep,
@@ -66,8 +68,10 @@
     "Dashboard",
     "DashboardWidget",
     "DelegatedPermission",
+    "EventOutbox",
     "File",
     "FilePermission",
+    "FileUsageCounter",
     "FileVersion",
     "Folder",
     "Integration",
@@ -96,6 +100,7 @@
     "TagCategory",
     "Task",
     "TaskChecklistItem",
+    "TaskVisibility",
     "Team",
     "TeamMember",
     "Tenant",
@@ -4,9 +4,10 @@
 from enum import Enum
 from uuid import uuid4
 
-from sqlalchemy import Column, ForeignKey, Index, String, Text
-from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP
+from sqlalchemy import Column, Computed, ForeignKey, Index, String, Text
+from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP, TSVECTOR
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import deferred
 
 from app.core.db.session import Base
 
@@ -50,6 +51,16 @@ class Activity(Base):
     )  # comment, call, email, etc.
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
+    # Full-text search (see app.core.search.text_search); not loaded by default
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                "to_tsvector('simple', title || ' ' || coalesce(description, ''))",
+                persisted=True,
+            ),
+        )
+    )
 
     # User who created the activity
     user_id = Column(
@@ -82,6 +93,19 @@ class Activity(Base):
         Index("idx_activities_entity", "entity_type", "entity_id"),
         Index("idx_activities_tenant_entity", "tenant_id", "entity_type", "entity_id"),
         Index("idx_activities_created", "tenant_id", "created_at"),
+        Index("idx_activities_search", "search_vector", postgresql_using="gin"),
+        Index(
+            "idx_activities_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_activities_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
     )
 
     def __repr__(self) -> str:
@@ -3,16 +3,20 @@
 from datetime import UTC, datetime
 from uuid import uuid4
 
-from sqlalchemy import Column, ForeignKey, Index, String
-from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP
+from sqlalchemy import Column, Computed, ForeignKey, Index, String, cast
+from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP, TSVECTOR
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 
 from app.core.db.session import Base
 
 
 class AuditLog(Base):
-    """AuditLog model for tracking security and audit events."""
+    """AuditLog model for tracking security and audit events.
+
+    The table is range-partitioned by month on created_at (see
+    app.core.audit.partitions), so the primary key includes created_at.
+    """
 
     __tablename__ = "audit_logs"
 
@@ -27,13 +31,11 @@ class AuditLog(Base):
     tenant_id = Column(
         PG_UUID(as_uuid=True),
         nullable=False,
-        index=True,
         comment="Tenant ID for multi-tenancy isolation",
     )
     action = Column(
         String(100),
         nullable=False,
-        index=True,
         comment="Action type (e.g., 'grant_permission', 'create_user')",
     )
     resource_type = Column(
@@ -48,23 +50,50 @@ class AuditLog(Base):
         comment="ID of the resource affected",
     )
     details = Column(JSONB, nullable=True, comment="Additional details as JSON")
+    # Full-text search over the string values of details; not loaded by default
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                "jsonb_to_tsvector('simple', coalesce(details, '{}'), '[\"string\"]')",
+                persisted=True,
+            ),
+        )
+    )
     ip_address = Column(
         String(45), nullable=True, comment="Client IP address (supports IPv6)"
     )
     user_agent = Column(String(500), nullable=True, comment="Client user agent string")
     created_at = Column(
         TIMESTAMP(timezone=True),
+        primary_key=True,
         default=lambda: datetime.now(UTC),
         nullable=False,
-        index=True,
     )
 
     # Relationships
     user = relationship("User", foreign_keys=[user_id])
 
     __table_args__ = (
-        Index("idx_audit_logs_tenant_created", "tenant_id", "created_at"),
+        # Keyset pagination: (created_at, id) descending within a tenant
+        Index("idx_audit_logs_tenant_created", "tenant_id", "created_at", "id"),
         Index("idx_audit_logs_action_created", "action", "created_at"),
+        # details @> '{...}' and jsonpath searches
+        Index(
+            "idx_audit_logs_details",
+            "details",
+            postgresql_using="gin",
+            postgresql_ops={"details": "jsonb_path_ops"},
+        ),
+        Index("idx_audit_logs_search", "search_vector", postgresql_using="gin"),
+        # Substring search over the JSON text (details_search)
+        Index(
+            "idx_audit_logs_details_trgm",
+            cast(details, String).label("details_text"),
+            postgresql_using="gin",
+            postgresql_ops={"details_text": "gin_trgm_ops"},
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
     def __repr__(self) -> str:
@@ -7,13 +7,15 @@
 from sqlalchemy import (
     Boolean,
     Column,
+    Computed,
     ForeignKey,
     Index,
     Integer,
     String,
     Text,
+    text,
 )
-from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP
+from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP, TSTZRANGE
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import relationship
 
@@ -164,6 +166,10 @@ class CalendarEvent(Base):
     end_time = Column(TIMESTAMP(timezone=True), nullable=False, index=True)
     timezone = Column(String(50), nullable=True)  # e.g., "America/New_York"
     all_day = Column(Boolean, default=False, nullable=False)
+    # [start_time, end_time) for overlap queries on the GiST index
+    time_range = Column(
+        TSTZRANGE, Computed("tstzrange(start_time, end_time, '[)')", persisted=True)
+    )
 
     # Status
     status = Column(
@@ -189,6 +195,15 @@ class CalendarEvent(Base):
     )  # RRULE string (e.g., "FREQ=WEEKLY;BYDAY=MO,WE,FR")
     recurrence_exdates = Column(JSONB, nullable=True)  # Array of exception dates
 
+    # Single-occurrence override of a recurring event (RFC 5545 RECURRENCE-ID):
+    # replaces the occurrence of the master that starts at the original start
+    recurrence_master_id = Column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("calendar_events.id", ondelete="CASCADE"),
+        nullable=True,
+    )
+    recurrence_original_start = Column(TIMESTAMP(timezone=True), nullable=True)
+
     # Unified source (for event aggregation)
     source_type = Column(
         String(50), nullable=True, index=True
@@ -242,9 +257,27 @@ class CalendarEvent(Base):
     __table_args__ = (
         Index("idx_events_calendar_time", "calendar_id", "start_time"),
         Index("idx_events_tenant_time", "tenant_id", "start_time", "end_time"),
+        Index(
+            "idx_events_organizer_time", "tenant_id", "organizer_id", "start_time", "id"
+        ),
         Index("idx_events_status", "tenant_id", "status"),
         Index("idx_events_source", "source_type", "source_id"),
         Index("idx_events_external", "provider", "external_id"),
+        Index("idx_events_time_range", "time_range", postgresql_using="gist"),
+        Index(
+            "idx_events_recurring_time",
+            "tenant_id",
+            "start_time",
+            postgresql_where=text(
+                "recurrence_type <> 'none' OR recurrence_rule IS NOT NULL"
+            ),
+        ),
+        Index(
+            "idx_events_recurrence_override",
+            "recurrence_master_id",
+            "recurrence_original_start",
+            unique=True,
+        ),
     )
 
     def __repr__(self) -> str:
@@ -307,6 +340,7 @@ class EventAttendee(Base):
 
     __table_args__ = (
         Index("idx_attendees_event_user", "event_id", "user_id"),
+        Index("idx_attendees_user_event", "user_id", "event_id"),
         Index("idx_attendees_status", "event_id", "status"),
     )
 
@@ -351,7 +385,11 @@ class EventReminder(Base):
     # Relationships
     event = relationship("CalendarEvent", back_populates="reminders")
 
-    __table_args__ = (Index("idx_reminders_event_sent", "event_id", "is_sent"),)
+    __table_args__ = (
+        Index("idx_reminders_event_sent", "event_id", "is_sent"),
+        # Unsent reminders of all tenants (ReminderPump)
+        Index("idx_reminders_unsent", "event_id", postgresql_where=text("NOT is_sent")),
+    )
 
     def __repr__(self) -> str:
         return f"<EventReminder(id={self.id}, event_id={self.event_id}, minutes={self.minutes_before})>"
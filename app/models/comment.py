@@ -3,10 +3,10 @@
 from datetime import UTC, datetime
 from uuid import uuid4
 
-from sqlalchemy import Boolean, Column, ForeignKey, Index, String, Text
-from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP
+from sqlalchemy import Boolean, Column, Computed, ForeignKey, Index, String, Text
+from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP, TSVECTOR
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 
 from app.core.db.session import Base
 
@@ -32,6 +32,10 @@ class Comment(Base):
 
     # Comment information
     content = Column(Text, nullable=False)
+    # Full-text search (see app.core.search.text_search); not loaded by default
+    search_vector = deferred(
+        Column(TSVECTOR, Computed("to_tsvector('simple', content)", persisted=True))
+    )
     parent_id = Column(
         PG_UUID(as_uuid=True),
         ForeignKey("comments.id", ondelete="CASCADE"),
@@ -85,6 +89,13 @@ class Comment(Base):
         Index("idx_comments_entity", "entity_type", "entity_id"),
         Index("idx_comments_tenant_entity", "tenant_id", "entity_type", "entity_id"),
         Index("idx_comments_parent", "parent_id", "created_at"),
+        Index("idx_comments_search", "search_vector", postgresql_using="gin"),
+        Index(
+            "idx_comments_content_trgm",
+            "content",
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"},
+        ),
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,38 @@
+"""Event outbox model for events pending publication to Redis Streams."""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import BigInteger, Column, Identity, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+
+from app.core.db.session import Base
+
+
+class EventOutbox(Base):
+    """Event written in the transaction of the change it describes.
+
+    OutboxRelay publishes pending rows to their stream in id order and
+    deletes them once Redis has accepted them.
+    """
+
+    __tablename__ = "event_outbox"
+
+    id = Column(BigInteger, Identity(always=False), primary_key=True)
+    event_id = Column(PG_UUID(as_uuid=True), nullable=False, unique=True)
+    event_type = Column(String(100), nullable=False)
+    tenant_id = Column(PG_UUID(as_uuid=True), nullable=False)
+    stream = Column(String(100), nullable=False)
+    fields = Column(JSONB, nullable=False)  # Event.to_redis_dict()
+
+    # Relay bookkeeping
+    attempts = Column(Integer, default=0, nullable=False)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(
+        TIMESTAMP(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<EventOutbox(id={self.id}, event_type={self.event_type})>"
@@ -4,7 +4,17 @@
 from enum import Enum
 from uuid import uuid4
 
-from sqlalchemy import Boolean, Column, ForeignKey, Index, Integer, String, Text
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import relationship
@@ -34,6 +44,16 @@ class FileEntityType(str, Enum):
     # Add more as needed
 
 
+class FileUsageScope(str, Enum):
+    """Scopes for which storage usage counters are maintained."""
+
+    TENANT = "tenant"
+    FOLDER = "folder"
+    ENTITY = "entity"  # key: "<entity_type>:<entity_id>"
+    ENTITY_TYPE = "entity_type"
+    MIME_TYPE = "mime_type"
+
+
 class File(Base):
     """File model for storing file information."""
 
@@ -229,3 +249,50 @@ class FilePermission(Base):
 
     def __repr__(self) -> str:
         return f"<FilePermission(id={self.id}, file_id={self.file_id}, target={self.target_type}:{self.target_id})>"
+
+
+class FileUsageCounter(Base):
+    """Precomputed storage usage for a tenant scope.
+
+    Counters are updated in the same transaction as the file rows they
+    describe, so stats and quota checks read one row instead of scanning the
+    files table. A periodic reconciliation job corrects any drift.
+    """
+
+    __tablename__ = "file_usage_counters"
+
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
+    tenant_id = Column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    # Scope (tenant-wide counters use an empty key)
+    scope_type = Column(String(20), nullable=False)
+    scope_key = Column(String(100), nullable=False, default="")
+
+    # Current (not deleted) files and their size in bytes
+    file_count = Column(BigInteger, nullable=False, default=0)
+    total_size = Column(BigInteger, nullable=False, default=0)
+    # Stored versions (only tracked for the tenant scope)
+    version_count = Column(BigInteger, nullable=False, default=0)
+
+    updated_at = Column(
+        TIMESTAMP(timezone=True),
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "tenant_id",
+            "scope_type",
+            "scope_key",
+            name="uq_file_usage_counters_scope",
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return f"<FileUsageCounter(tenant_id={self.tenant_id}, scope={self.scope_type}:{self.scope_key}, files={self.file_count})>"
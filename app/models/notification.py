@@ -15,8 +15,11 @@ class NotificationStatus(str, Enum):
     """Status of notification in queue."""
 
     PENDING = "pending"
+    SENDING = "sending"  # Delivered inline by NotificationService.send
     SENT = "sent"
     FAILED = "failed"
+    COALESCING = "coalescing"  # Held in a digest window
+    COALESCED = "coalesced"  # Delivered as part of a digest entry
 
 
 class NotificationTemplate(Base):
@@ -90,6 +93,8 @@ class NotificationQueue(Base):
         String(20), nullable=False, default=NotificationStatus.PENDING, index=True
     )
     sent_at = Column(TIMESTAMP(timezone=True), nullable=True)
+    # End of the digest window for COALESCING entries
+    deliver_after = Column(TIMESTAMP(timezone=True), nullable=True)
     error_message = Column(Text, nullable=True)
     created_at = Column(
         TIMESTAMP(timezone=True),
@@ -101,4 +106,5 @@ class NotificationQueue(Base):
     __table_args__ = (
         Index("idx_notification_queue_status", "status"),
         Index("idx_notification_queue_created", "created_at"),
+        Index("idx_notification_queue_status_deliver", "status", "deliver_after"),
     )
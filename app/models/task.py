@@ -13,6 +13,7 @@
     Integer,
     String,
     Text,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
@@ -332,6 +333,64 @@ def __repr__(self) -> str:
         return f"<TaskAssignment(id={self.id}, task_id={self.task_id}, assigned_to_id={self.assigned_to_id})>"
 
 
+class TaskVisibilityReason(str, Enum):
+    """Why a user can see a task, strongest reason first."""
+
+    CREATOR = "creator"
+    ASSIGNEE = "assignee"  # Legacy Task.assigned_to_id
+    ASSIGNMENT = "assignment"  # TaskAssignment to the user
+    TEAM = "team"  # TaskAssignment to a team the user belongs to
+
+
+class TaskVisibility(Base):
+    """Projection of the users who can see each task.
+
+    One row per (user, task) pair, maintained by TaskVisibilityRepository
+    whenever tasks, assignments or team memberships change. The task columns
+    used to filter and sort lists are copied here so a user's visible tasks
+    are read from a single index range.
+    """
+
+    __tablename__ = "task_visibility"
+
+    tenant_id = Column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    user_id = Column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    task_id = Column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("tasks.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    reason = Column(String(20), nullable=False)
+
+    # Copied from the task
+    task_created_at = Column(TIMESTAMP(timezone=True), nullable=False)
+    status = Column(String(20), nullable=False)
+    priority = Column(String(20), nullable=False)
+
+    __table_args__ = (
+        Index(
+            "idx_task_visibility_user_created",
+            "tenant_id",
+            "user_id",
+            task_created_at.desc(),
+            task_id.desc(),
+        ),
+        Index("idx_task_visibility_user_status", "tenant_id", "user_id", "status"),
+        Index("idx_task_visibility_task", "task_id"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<TaskVisibility(user_id={self.user_id}, task_id={self.task_id}, reason={self.reason})>"
+
+
 class Workflow(Base):
     """Workflow model for configurable workflows."""
 
@@ -552,6 +611,12 @@ class TaskReminder(Base):
         Index("idx_task_reminders_task", "task_id", "reminder_time"),
         Index("idx_task_reminders_tenant", "tenant_id", "reminder_time"),
         Index("idx_task_reminders_pending", "tenant_id", "sent", "reminder_time"),
+        # Due reminders of all tenants (ReminderPump)
+        Index(
+            "idx_task_reminders_due",
+            "reminder_time",
+            postgresql_where=text("NOT sent"),
+        ),
     )
 
     def __repr__(self) -> str:
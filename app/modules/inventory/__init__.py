@@ -6,7 +6,14 @@
 from app.core.config.service import ConfigService
 from app.core.module_interface import ModuleInterface, ModuleNavigationItem
 from app.modules.inventory.api import router
-from app.modules.inventory.models.inventory import Location, StockMove, Warehouse
+from app.modules.inventory.models.inventory import (
+    Location,
+    StockBalance,
+    StockMove,
+    StockValuationCheckpoint,
+    StockValuationPosition,
+    Warehouse,
+)
 from app.modules.inventory.permissions import (
     INVENTORY_MANAGE,
     INVENTORY_VIEW,
@@ -39,7 +46,14 @@ def get_router(self) -> APIRouter | None:
         return router
 
     def get_models(self) -> list:
-        return [Warehouse, Location, StockMove]
+        return [
+            Warehouse,
+            Location,
+            StockMove,
+            StockBalance,
+            StockValuationCheckpoint,
+            StockValuationPosition,
+        ]
 
     def get_dependencies(self) -> list[str]:
         return ["auth", "users", "products", "pubsub"]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Annotated
+from datetime import UTC, datetime
+from typing import Annotated, Literal
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Path, Query, status
@@ -10,16 +11,24 @@
 from app.core.db.deps import get_db
 from app.models.user import User
 from app.modules.inventory.schemas.inventory import (
+    CostOfSalesReport,
     LocationCreate,
     LocationResponse,
     LocationUpdate,
+    StockBalanceResponse,
+    StockMoveBulkCreate,
     StockMoveCreate,
     StockMoveResponse,
+    StockValuationCheckpointCreate,
+    StockValuationCheckpointResponse,
+    StockValuationReport,
     WarehouseCreate,
     WarehouseResponse,
+    WarehouseStockResponse,
     WarehouseUpdate,
 )
 from app.modules.inventory.services.inventory_service import InventoryService
+from app.modules.inventory.services.valuation_service import StockValuationService
 from app.schemas.common import PaginationMeta, StandardListResponse, StandardResponse
 
 router = APIRouter()
@@ -29,6 +38,12 @@ def get_inventory_service(db: Annotated[Session, Depends(get_db)]) -> InventoryS
     return InventoryService(db)
 
 
+def get_valuation_service(
+    db: Annotated[Session, Depends(get_db)],
+) -> StockValuationService:
+    return StockValuationService(db)
+
+
 @router.get(
     "/warehouses",
     response_model=StandardListResponse[WarehouseResponse],
@@ -269,3 +284,217 @@ async def create_stock_move(
         data=payload.model_dump(),
     )
     return StandardResponse(data=StockMoveResponse.model_validate(move))
+
+
+# Plain def: a bulk import is long and blocking, so it runs in the threadpool
+@router.post(
+    "/stock-moves/bulk",
+    response_model=StandardResponse[list[StockMoveResponse]],
+    status_code=status.HTTP_200_OK,
+    summary="Bulk create stock moves",
+    description=(
+        "Import many stock moves in one transaction. In per_line mode invalid "
+        "lines are listed in meta.errors and the rest are imported. "
+        "Requires inventory.adjust_stock permission."
+    ),
+)
+def bulk_create_stock_moves(
+    payload: StockMoveBulkCreate,
+    current_user: Annotated[
+        User, Depends(require_permission("inventory.adjust_stock"))
+    ],
+    service: Annotated[InventoryService, Depends(get_inventory_service)],
+) -> StandardResponse[list[StockMoveResponse]]:
+    result = service.create_stock_moves(
+        tenant_id=current_user.tenant_id,
+        user_id=current_user.id,
+        lines=[move.model_dump() for move in payload.moves],
+        mode=payload.mode,
+    )
+    return StandardResponse(
+        data=[StockMoveResponse.model_validate(m) for m in result.moves],
+        meta={
+            "total": len(result.moves),
+            "failed": len(result.errors),
+            "errors": result.errors,
+        },
+    )
+
+
+@router.get(
+    "/stock-balances",
+    response_model=StandardListResponse[StockBalanceResponse],
+    status_code=status.HTTP_200_OK,
+    summary="List stock balances",
+    description=(
+        "List stock on hand per product and location. "
+        "Requires inventory.view permission."
+    ),
+)
+async def list_stock_balances(
+    current_user: Annotated[User, Depends(require_permission("inventory.view"))],
+    service: Annotated[InventoryService, Depends(get_inventory_service)],
+    product_id: UUID | None = Query(default=None),
+    warehouse_id: UUID | None = Query(default=None),
+    location_id: UUID | None = Query(default=None),
+    page: int = Query(default=1, ge=1),
+    page_size: int = Query(default=20, ge=1, le=100),
+) -> StandardListResponse[StockBalanceResponse]:
+    skip = (page - 1) * page_size
+    balances = service.balances.list_balances(
+        current_user.tenant_id,
+        product_id=product_id,
+        warehouse_id=warehouse_id,
+        location_id=location_id,
+        skip=skip,
+        limit=page_size,
+    )
+    total = len(balances)
+    total_pages = (total + page_size - 1) // page_size if total > 0 else 0
+    return StandardListResponse(
+        data=[StockBalanceResponse.model_validate(b) for b in balances],
+        meta=PaginationMeta(
+            total=total, page=page, page_size=page_size, total_pages=total_pages
+        ),
+    )
+
+
+@router.get(
+    "/stock-balances/by-warehouse",
+    response_model=StandardListResponse[WarehouseStockResponse],
+    status_code=status.HTTP_200_OK,
+    summary="Stock per warehouse",
+    description=(
+        "Stock on hand summed per warehouse and product. "
+        "Requires inventory.view permission."
+    ),
+)
+async def list_warehouse_stock(
+    current_user: Annotated[User, Depends(require_permission("inventory.view"))],
+    service: Annotated[InventoryService, Depends(get_inventory_service)],
+    warehouse_id: UUID | None = Query(default=None),
+    product_id: UUID | None = Query(default=None),
+    page: int = Query(default=1, ge=1),
+    page_size: int = Query(default=20, ge=1, le=100),
+) -> StandardListResponse[WarehouseStockResponse]:
+    skip = (page - 1) * page_size
+    rows = service.balances.get_warehouse_stock(
+        current_user.tenant_id,
+        warehouse_id=warehouse_id,
+        product_id=product_id,
+        skip=skip,
+        limit=page_size,
+    )
+    total = len(rows)
+    total_pages = (total + page_size - 1) // page_size if total > 0 else 0
+    return StandardListResponse(
+        data=[WarehouseStockResponse.model_validate(row) for row in rows],
+        meta=PaginationMeta(
+            total=total, page=page, page_size=page_size, total_pages=total_pages
+        ),
+    )
+
+
+# Valuation replays are long and blocking, so these endpoints are plain def and
+# run in FastAPI's threadpool instead of on the event loop.
+@router.get(
+    "/valuation",
+    response_model=StandardResponse[StockValuationReport],
+    status_code=status.HTTP_200_OK,
+    summary="Stock valuation as of a date",
+    description=(
+        "Stock, value and cumulative cost of goods sold per product and "
+        "location at a point in time. Requires inventory.view permission."
+    ),
+)
+def get_stock_valuation(
+    current_user: Annotated[User, Depends(require_permission("inventory.view"))],
+    service: Annotated[StockValuationService, Depends(get_valuation_service)],
+    as_of: datetime | None = Query(default=None),
+    method: Literal["fifo", "average"] = Query(default="fifo"),
+    product_id: UUID | None = Query(default=None),
+    warehouse_id: UUID | None = Query(default=None),
+) -> StandardResponse[StockValuationReport]:
+    report = service.valuation_as_of(
+        current_user.tenant_id,
+        as_of or datetime.now(UTC),
+        method,
+        product_id=product_id,
+        warehouse_id=warehouse_id,
+    )
+    return StandardResponse(data=StockValuationReport.model_validate(report))
+
+
+@router.get(
+    "/valuation/cost-of-sales",
+    response_model=StandardResponse[CostOfSalesReport],
+    status_code=status.HTTP_200_OK,
+    summary="Cost of goods sold for a period",
+    description=(
+        "Cost of goods sold per product between two dates. "
+        "Requires inventory.view permission."
+    ),
+)
+def get_cost_of_sales(
+    current_user: Annotated[User, Depends(require_permission("inventory.view"))],
+    service: Annotated[StockValuationService, Depends(get_valuation_service)],
+    date_from: datetime = Query(...),
+    date_to: datetime = Query(...),
+    method: Literal["fifo", "average"] = Query(default="fifo"),
+    product_id: UUID | None = Query(default=None),
+) -> StandardResponse[CostOfSalesReport]:
+    report = service.cost_of_sales(
+        current_user.tenant_id, date_from, date_to, method, product_id=product_id
+    )
+    return StandardResponse(data=CostOfSalesReport.model_validate(report))
+
+
+@router.get(
+    "/valuation/checkpoints",
+    response_model=StandardListResponse[StockValuationCheckpointResponse],
+    status_code=status.HTTP_200_OK,
+    summary="List valuation checkpoints",
+    description="List valuation checkpoints. Requires inventory.view permission.",
+)
+async def list_valuation_checkpoints(
+    current_user: Annotated[User, Depends(require_permission("inventory.view"))],
+    service: Annotated[StockValuationService, Depends(get_valuation_service)],
+    method: Literal["fifo", "average"] | None = Query(default=None),
+    page: int = Query(default=1, ge=1),
+    page_size: int = Query(default=20, ge=1, le=100),
+) -> StandardListResponse[StockValuationCheckpointResponse]:
+    skip = (page - 1) * page_size
+    checkpoints = service.list_checkpoints(
+        current_user.tenant_id, method=method, skip=skip, limit=page_size
+    )
+    total = len(checkpoints)
+    total_pages = (total + page_size - 1) // page_size if total > 0 else 0
+    return StandardListResponse(
+        data=[StockValuationCheckpointResponse.model_validate(c) for c in checkpoints],
+        meta=PaginationMeta(
+            total=total, page=page, page_size=page_size, total_pages=total_pages
+        ),
+    )
+
+
+@router.post(
+    "/valuation/checkpoints",
+    response_model=StandardResponse[StockValuationCheckpointResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary="Create valuation checkpoint",
+    description=(
+        "Snapshot the stock valuation so later reports replay fewer moves. "
+        "Requires inventory.edit permission."
+    ),
+)
+def create_valuation_checkpoint(
+    payload: StockValuationCheckpointCreate,
+    current_user: Annotated[User, Depends(require_permission("inventory.edit"))],
+    service: Annotated[StockValuationService, Depends(get_valuation_service)],
+) -> StandardResponse[StockValuationCheckpointResponse]:
+    checkpoint = service.create_checkpoint(
+        current_user.tenant_id, payload.method, as_of=payload.as_of
+    )
+    return StandardResponse(
+        data=StockValuationCheckpointResponse.model_validate(checkpoint)
+    )
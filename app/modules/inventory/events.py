@@ -4,8 +4,10 @@
 
 INVENTORY_STOCK_LOW = "inventory.stock_low"
 INVENTORY_MOVEMENT_CREATED = "inventory.movement.created"
+INVENTORY_MOVEMENTS_CREATED = "inventory.movements.created"
 
 PUBLISHED_EVENTS = [
     INVENTORY_STOCK_LOW,
     INVENTORY_MOVEMENT_CREATED,
+    INVENTORY_MOVEMENTS_CREATED,
 ]
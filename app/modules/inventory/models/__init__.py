@@ -1,3 +1,17 @@
-from app.modules.inventory.models.inventory import Location, StockMove, Warehouse
+from app.modules.inventory.models.inventory import (
+    Location,
+    StockBalance,
+    StockMove,
+    StockValuationCheckpoint,
+    StockValuationPosition,
+    Warehouse,
+)
 
-__all__ = ["Warehouse", "Location", "StockMove"]
+__all__ = [
+    "Warehouse",
+    "Location",
+    "StockMove",
+    "StockBalance",
+    "StockValuationCheckpoint",
+    "StockValuationPosition",
+]
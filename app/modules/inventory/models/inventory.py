@@ -8,12 +8,13 @@
     Column,
     ForeignKey,
     Index,
+    Integer,
     Numeric,
     String,
     Text,
     UniqueConstraint,
 )
-from sqlalchemy.dialects.postgresql import TIMESTAMP
+from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import relationship
 
@@ -155,3 +156,146 @@ class StockMove(Base):
         CheckConstraint("quantity <> 0", name="ck_stock_moves_quantity_nonzero"),
         Index("idx_stock_moves_tenant_created_at", "tenant_id", "created_at"),
     )
+
+
+class StockBalance(Base):
+    """On-hand projection of the stock move ledger per product and location.
+
+    Rows are updated in the transaction of each stock move (see
+    StockBalanceService); value is the stock at moving-average cost.
+    """
+
+    __tablename__ = "stock_balances"
+
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
+    tenant_id = Column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    product_id = Column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("products.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    location_id = Column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("locations.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    # Denormalized from the location for per-warehouse rollups
+    warehouse_id = Column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("warehouses.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    quantity = Column(Numeric(18, 6), nullable=False, default=0)
+    reserved = Column(Numeric(18, 6), nullable=False, default=0)
+    value = Column(Numeric(18, 6), nullable=False, default=0)
+
+    updated_at = Column(
+        TIMESTAMP(timezone=True),
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "tenant_id",
+            "product_id",
+            "location_id",
+            name="uq_stock_balances_tenant_product_location",
+        ),
+        Index(
+            "idx_stock_balances_tenant_warehouse_product",
+            "tenant_id",
+            "warehouse_id",
+            "product_id",
+        ),
+        CheckConstraint("reserved >= 0", name="ck_stock_balances_reserved"),
+    )
+
+
+class StockValuationCheckpoint(Base):
+    """Snapshot of a tenant's stock valuation at a point in time.
+
+    As-of valuations start from the latest checkpoint at or before the
+    requested date and replay only the moves after it.
+    """
+
+    __tablename__ = "stock_valuation_checkpoints"
+
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
+    tenant_id = Column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    method = Column(String(20), nullable=False)  # fifo, average
+    as_of = Column(TIMESTAMP(timezone=True), nullable=False)
+    # Moves replayed since the previous checkpoint
+    move_count = Column(Integer, nullable=False, default=0)
+
+    created_at = Column(
+        TIMESTAMP(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "tenant_id",
+            "method",
+            "as_of",
+            name="uq_stock_valuation_checkpoints_tenant_method_as_of",
+        ),
+    )
+
+
+class StockValuationPosition(Base):
+    """Stock and value of a product at a location in a valuation checkpoint."""
+
+    __tablename__ = "stock_valuation_positions"
+
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
+    tenant_id = Column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    checkpoint_id = Column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("stock_valuation_checkpoints.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    product_id = Column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("products.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    location_id = Column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("locations.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    quantity = Column(Numeric(18, 6), nullable=False, default=0)
+    value = Column(Numeric(18, 6), nullable=False, default=0)
+    # Cumulative cost of goods sold from this location up to the checkpoint
+    cogs = Column(Numeric(18, 6), nullable=False, default=0)
+    # FIFO cost layers, oldest first: [[quantity, unit_cost], ...]
+    layers = Column(JSONB, nullable=True)
+    # FIFO cost of the last receipt; prices issues made with no stock on hand
+    last_cost = Column(Numeric(18, 6), nullable=True)
+
+    __table_args__ = (
+        Index(
+            "idx_stock_valuation_positions_checkpoint_product",
+            "checkpoint_id",
+            "product_id",
+        ),
+    )
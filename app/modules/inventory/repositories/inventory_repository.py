@@ -1,10 +1,39 @@
 from __future__ import annotations
 
-from uuid import UUID
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from uuid import UUID, uuid4
 
+from sqlalchemy import Row, column, delete, func, insert, select, table, tuple_
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
-from app.modules.inventory.models.inventory import Location, StockMove, Warehouse
+from app.modules.inventory.models.inventory import (
+    Location,
+    StockBalance,
+    StockMove,
+    StockValuationCheckpoint,
+    StockValuationPosition,
+    Warehouse,
+)
+
+# Advisory lock class for a tenant's stock balances (second key: tenant hash)
+BALANCES_LOCK_KEY = 0x73746F6B  # "stok"
+
+
+def _in_partition(product_id_column, partition: tuple[int, int]):
+    """Whether a product falls in partition (index, count), by its UUID's last byte."""
+    index, count = partition
+    return func.get_byte(func.uuid_send(product_id_column), 15) % count == index
+
+
+# Products belong to the products module; only their ids are read here
+_products = table(
+    "products",
+    column("id", PG_UUID(as_uuid=True)),
+    column("tenant_id", PG_UUID(as_uuid=True)),
+)
 
 
 class InventoryRepository:
@@ -90,13 +119,27 @@ def delete_location(self, location: Location) -> None:
         self.db.commit()
 
     # Stock moves
-    def create_stock_move(self, data: dict) -> StockMove:
+    def create_stock_move(self, data: dict, commit: bool = True) -> StockMove:
         move = StockMove(**data)
         self.db.add(move)
+        if not commit:
+            self.db.flush()
+            return move
         self.db.commit()
         self.db.refresh(move)
         return move
 
+    def create_stock_moves(self, moves: list[StockMove]) -> None:
+        """Insert moves with multi-row INSERTs, without committing.
+
+        The moves stay transient (with their IDs and timestamps already set),
+        so they can be returned without reloading them.
+        """
+        columns = [column.key for column in StockMove.__table__.columns]
+        rows = [{key: getattr(move, key) for key in columns} for move in moves]
+        for start in range(0, len(rows), 1000):
+            self.db.execute(insert(StockMove), rows[start : start + 1000])
+
     def list_stock_moves(
         self,
         tenant_id: UUID,
@@ -110,3 +153,279 @@ def list_stock_moves(
         return (
             query.order_by(StockMove.created_at.desc()).offset(skip).limit(limit).all()
         )
+
+    def iter_stock_moves(
+        self,
+        tenant_id: UUID,
+        after: datetime | None = None,
+        until: datetime | None = None,
+        product_id: UUID | None = None,
+        partition: tuple[int, int] | None = None,
+        batch_size: int = 10000,
+    ) -> Iterator[Row]:
+        """Stream the tenant's moves in ledger order for replaying.
+
+        Args:
+            tenant_id: Tenant ID
+            after: Only moves created after this time
+            until: Only moves created at or before this time
+            product_id: Only moves of this product
+            partition: (index, count) to only stream one of count product
+                partitions
+
+        Yields:
+            (product_id, from_location_id, to_location_id, quantity,
+            unit_cost) rows
+        """
+        query = select(
+            StockMove.product_id,
+            StockMove.from_location_id,
+            StockMove.to_location_id,
+            StockMove.quantity,
+            StockMove.unit_cost,
+        ).where(StockMove.tenant_id == tenant_id)
+        if after is not None:
+            query = query.where(StockMove.created_at > after)
+        if until is not None:
+            query = query.where(StockMove.created_at <= until)
+        if product_id:
+            query = query.where(StockMove.product_id == product_id)
+        if partition:
+            query = query.where(_in_partition(StockMove.product_id, partition))
+        return self.db.execute(
+            query.order_by(StockMove.created_at, StockMove.id).execution_options(
+                stream_results=True, yield_per=batch_size
+            )
+        )
+
+    def get_location_warehouses(
+        self, tenant_id: UUID, location_ids: Iterable[UUID] | None = None
+    ) -> dict[UUID, UUID]:
+        """Warehouse of each location (all of the tenant's if no IDs are given)."""
+        query = select(Location.id, Location.warehouse_id).where(
+            Location.tenant_id == tenant_id
+        )
+        if location_ids is not None:
+            query = query.where(Location.id.in_(list(location_ids)))
+        return dict(self.db.execute(query).all())
+
+    def get_product_ids(
+        self, tenant_id: UUID, product_ids: Iterable[UUID]
+    ) -> set[UUID]:
+        """Which of the given products exist in the tenant."""
+        return set(
+            self.db.scalars(
+                select(_products.c.id).where(
+                    _products.c.tenant_id == tenant_id,
+                    _products.c.id.in_(list(product_ids)),
+                )
+            )
+        )
+
+    # Stock balances
+    def get_stock_balance(
+        self, tenant_id: UUID, product_id: UUID, location_id: UUID
+    ) -> StockBalance | None:
+        return self.db.scalar(
+            select(StockBalance).where(
+                StockBalance.tenant_id == tenant_id,
+                StockBalance.product_id == product_id,
+                StockBalance.location_id == location_id,
+            )
+        )
+
+    def lock_tenant_balances(self, tenant_id: UUID, exclusive: bool = False) -> None:
+        """Take the tenant's balances lock until the transaction ends.
+
+        Moves take it shared, so they only wait for a rebuild (which takes
+        it exclusive) and not for each other.
+        """
+        lock = (
+            func.pg_advisory_xact_lock
+            if exclusive
+            else func.pg_advisory_xact_lock_shared
+        )
+        self.db.execute(select(lock(BALANCES_LOCK_KEY, func.hashtext(str(tenant_id)))))
+
+    def lock_stock_balances(
+        self, tenant_id: UUID, keys: dict[tuple[UUID, UUID], UUID]
+    ) -> dict[tuple[UUID, UUID], StockBalance]:
+        """Create missing balance rows and lock all of them FOR UPDATE.
+
+        Args:
+            tenant_id: Tenant ID
+            keys: Warehouse ID by (product_id, location_id)
+
+        Rows are inserted and locked in key order so that concurrent moves
+        over the same products cannot deadlock.
+        """
+        ordered = sorted(keys, key=lambda key: (str(key[0]), str(key[1])))
+        self.db.execute(
+            pg_insert(StockBalance)
+            .values(
+                [
+                    {
+                        "id": uuid4(),
+                        "tenant_id": tenant_id,
+                        "product_id": product_id,
+                        "location_id": location_id,
+                        "warehouse_id": keys[(product_id, location_id)],
+                        "quantity": 0,
+                        "reserved": 0,
+                        "value": 0,
+                    }
+                    for product_id, location_id in ordered
+                ]
+            )
+            .on_conflict_do_nothing(
+                constraint="uq_stock_balances_tenant_product_location"
+            )
+        )
+        balances = self.db.scalars(
+            select(StockBalance)
+            .where(
+                StockBalance.tenant_id == tenant_id,
+                tuple_(StockBalance.product_id, StockBalance.location_id).in_(ordered),
+            )
+            .order_by(StockBalance.product_id, StockBalance.location_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        return {
+            (balance.product_id, balance.location_id): balance for balance in balances
+        }
+
+    def list_stock_balances(
+        self,
+        tenant_id: UUID,
+        product_id: UUID | None = None,
+        warehouse_id: UUID | None = None,
+        location_id: UUID | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[StockBalance]:
+        query = select(StockBalance).where(StockBalance.tenant_id == tenant_id)
+        if product_id:
+            query = query.where(StockBalance.product_id == product_id)
+        if warehouse_id:
+            query = query.where(StockBalance.warehouse_id == warehouse_id)
+        if location_id:
+            query = query.where(StockBalance.location_id == location_id)
+        return list(
+            self.db.scalars(
+                query.order_by(StockBalance.product_id, StockBalance.location_id)
+                .offset(skip)
+                .limit(limit)
+            )
+        )
+
+    def get_warehouse_stock(
+        self,
+        tenant_id: UUID,
+        warehouse_id: UUID | None = None,
+        product_id: UUID | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[dict]:
+        """Balances summed per warehouse and product."""
+        query = select(
+            StockBalance.warehouse_id,
+            StockBalance.product_id,
+            func.sum(StockBalance.quantity).label("quantity"),
+            func.sum(StockBalance.reserved).label("reserved"),
+            func.sum(StockBalance.value).label("value"),
+        ).where(StockBalance.tenant_id == tenant_id)
+        if warehouse_id:
+            query = query.where(StockBalance.warehouse_id == warehouse_id)
+        if product_id:
+            query = query.where(StockBalance.product_id == product_id)
+        rows = self.db.execute(
+            query.group_by(StockBalance.warehouse_id, StockBalance.product_id)
+            .order_by(StockBalance.warehouse_id, StockBalance.product_id)
+            .offset(skip)
+            .limit(limit)
+        )
+        return [dict(row._mapping) for row in rows]
+
+    def replace_stock_balances(self, tenant_id: UUID, rows: list[dict]) -> None:
+        """Swap the tenant's balances for the given rows in one transaction."""
+        self.db.execute(delete(StockBalance).where(StockBalance.tenant_id == tenant_id))
+        for start in range(0, len(rows), 5000):
+            self.db.execute(insert(StockBalance), rows[start : start + 5000])
+        self.db.commit()
+
+    # Valuation checkpoints
+    def get_latest_valuation_checkpoint(
+        self, tenant_id: UUID, method: str, as_of: datetime
+    ) -> StockValuationCheckpoint | None:
+        """Latest checkpoint taken at or before as_of."""
+        return self.db.scalar(
+            select(StockValuationCheckpoint)
+            .where(
+                StockValuationCheckpoint.tenant_id == tenant_id,
+                StockValuationCheckpoint.method == method,
+                StockValuationCheckpoint.as_of <= as_of,
+            )
+            .order_by(StockValuationCheckpoint.as_of.desc())
+            .limit(1)
+        )
+
+    def list_valuation_checkpoints(
+        self,
+        tenant_id: UUID,
+        method: str | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[StockValuationCheckpoint]:
+        query = select(StockValuationCheckpoint).where(
+            StockValuationCheckpoint.tenant_id == tenant_id
+        )
+        if method:
+            query = query.where(StockValuationCheckpoint.method == method)
+        return list(
+            self.db.scalars(
+                query.order_by(StockValuationCheckpoint.as_of.desc())
+                .offset(skip)
+                .limit(limit)
+            )
+        )
+
+    def get_valuation_positions(
+        self,
+        checkpoint_id: UUID,
+        product_id: UUID | None = None,
+        partition: tuple[int, int] | None = None,
+    ) -> list[Row]:
+        query = select(
+            StockValuationPosition.product_id,
+            StockValuationPosition.location_id,
+            StockValuationPosition.quantity,
+            StockValuationPosition.value,
+            StockValuationPosition.cogs,
+            StockValuationPosition.layers,
+            StockValuationPosition.last_cost,
+        ).where(StockValuationPosition.checkpoint_id == checkpoint_id)
+        if product_id:
+            query = query.where(StockValuationPosition.product_id == product_id)
+        if partition:
+            query = query.where(
+                _in_partition(StockValuationPosition.product_id, partition)
+            )
+        return list(self.db.execute(query))
+
+    def create_valuation_checkpoint(
+        self, data: dict, positions: list[dict]
+    ) -> StockValuationCheckpoint:
+        """Insert a checkpoint and its positions in one transaction."""
+        checkpoint = StockValuationCheckpoint(**data)
+        self.db.add(checkpoint)
+        self.db.flush()
+        rows = [
+            {"id": uuid4(), "checkpoint_id": checkpoint.id, **position}
+            for position in positions
+        ]
+        for start in range(0, len(rows), 5000):
+            self.db.execute(insert(StockValuationPosition), rows[start : start + 5000])
+        self.db.commit()
+        self.db.refresh(checkpoint)
+        return checkpoint
@@ -1,11 +1,20 @@
 from app.modules.inventory.schemas.inventory import (
+    CostOfSalesLine,
+    CostOfSalesReport,
     LocationCreate,
     LocationResponse,
     LocationUpdate,
+    StockBalanceResponse,
+    StockMoveBulkCreate,
     StockMoveCreate,
     StockMoveResponse,
+    StockValuationCheckpointCreate,
+    StockValuationCheckpointResponse,
+    StockValuationLine,
+    StockValuationReport,
     WarehouseCreate,
     WarehouseResponse,
+    WarehouseStockResponse,
     WarehouseUpdate,
 )
 
@@ -17,5 +26,14 @@
     "LocationUpdate",
     "LocationResponse",
     "StockMoveCreate",
+    "StockMoveBulkCreate",
     "StockMoveResponse",
+    "StockBalanceResponse",
+    "WarehouseStockResponse",
+    "StockValuationLine",
+    "StockValuationReport",
+    "CostOfSalesLine",
+    "CostOfSalesReport",
+    "StockValuationCheckpointCreate",
+    "StockValuationCheckpointResponse",
 ]
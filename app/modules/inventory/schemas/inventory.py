@@ -2,6 +2,7 @@
 
 from datetime import datetime
 from decimal import Decimal
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -68,6 +69,11 @@ class StockMoveCreate(BaseModel):
     reference: str | None = Field(None, max_length=255)
 
 
+class StockMoveBulkCreate(BaseModel):
+    moves: list[StockMoveCreate] = Field(..., min_length=1)
+    mode: Literal["all_or_nothing", "per_line"] = "all_or_nothing"
+
+
 class StockMoveResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -82,3 +88,74 @@ class StockMoveResponse(BaseModel):
     reference: str | None
     created_by: UUID | None
     created_at: datetime
+
+
+class StockBalanceResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    tenant_id: UUID
+    product_id: UUID
+    location_id: UUID
+    warehouse_id: UUID
+    quantity: Decimal
+    reserved: Decimal
+    value: Decimal
+    updated_at: datetime
+
+
+class WarehouseStockResponse(BaseModel):
+    warehouse_id: UUID
+    product_id: UUID
+    quantity: Decimal
+    reserved: Decimal
+    value: Decimal
+
+
+class StockValuationLine(BaseModel):
+    product_id: UUID
+    location_id: UUID
+    warehouse_id: UUID | None
+    quantity: Decimal
+    value: Decimal
+    unit_cost: Decimal | None
+    cogs: Decimal
+
+
+class StockValuationReport(BaseModel):
+    as_of: datetime
+    method: str
+    checkpoint_as_of: datetime | None
+    replayed_moves: int
+    total_value: Decimal
+    total_cogs: Decimal
+    lines: list[StockValuationLine]
+
+
+class CostOfSalesLine(BaseModel):
+    product_id: UUID
+    cogs: Decimal
+
+
+class CostOfSalesReport(BaseModel):
+    date_from: datetime
+    date_to: datetime
+    method: str
+    total_cogs: Decimal
+    lines: list[CostOfSalesLine]
+
+
+class StockValuationCheckpointCreate(BaseModel):
+    method: Literal["fifo", "average"] = "fifo"
+    as_of: datetime | None = None
+
+
+class StockValuationCheckpointResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    tenant_id: UUID
+    method: str
+    as_of: datetime
+    move_count: int
+    created_at: datetime
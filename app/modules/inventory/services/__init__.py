@@ -1,3 +1,5 @@
 from app.modules.inventory.services.inventory_service import InventoryService
+from app.modules.inventory.services.stock_balance_service import StockBalanceService
+from app.modules.inventory.services.valuation_service import StockValuationService
 
-__all__ = ["InventoryService"]
+__all__ = ["InventoryService", "StockBalanceService", "StockValuationService"]
@@ -0,0 +1,241 @@
+"""Stock costing arithmetic shared by the balance projection and valuation.
+
+A move takes stock out of its source at the source's cost and puts it into
+its destination at the move's unit cost when given, else at the cost it left
+the source with, else at the destination's current unit cost. Stock leaving
+without a destination (sales, scrap) is booked to cost of goods sold.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+from decimal import Decimal
+from uuid import UUID
+
+from app.modules.inventory.models.inventory import StockMove
+
+FIFO = "fifo"
+AVERAGE = "average"
+VALUATION_METHODS = (FIFO, AVERAGE)
+
+# Scale of the Numeric(18, 6) quantity and value columns
+SCALE = Decimal("0.000001")
+
+ZERO = Decimal(0)
+
+# (quantity, unit cost)
+Layer = tuple[Decimal, Decimal]
+
+
+def direction(move: StockMove) -> tuple[UUID | None, UUID | None, Decimal]:
+    """Source, destination and positive quantity of a move.
+
+    A negative quantity moves stock from to_location back to from_location.
+    """
+    quantity = Decimal(move.quantity)
+    if quantity < 0:
+        return move.to_location_id, move.from_location_id, -quantity
+    return move.from_location_id, move.to_location_id, quantity
+
+
+def receipt_cost(move: StockMove) -> Decimal | None:
+    """Unit cost a move brings stock in at, if it sets one."""
+    if move.unit_cost is not None and move.quantity > 0:
+        return Decimal(move.unit_cost)
+    return None
+
+
+def issue_at_average(position, quantity: Decimal) -> Decimal:
+    """Take quantity out at average cost and return the value taken."""
+    if position.quantity <= 0:
+        taken = ZERO
+    elif quantity >= position.quantity:
+        taken = position.value
+    else:
+        taken = (position.value * quantity / position.quantity).quantize(SCALE)
+    position.quantity -= quantity
+    position.value -= taken
+    return taken
+
+
+def receive_at_average(position, quantity: Decimal, value: Decimal | None) -> None:
+    """Put quantity in; without a value it comes in at the average cost."""
+    if value is None:
+        value = (
+            (position.value * quantity / position.quantity).quantize(SCALE)
+            if position.quantity > 0
+            else ZERO
+        )
+    position.quantity += quantity
+    position.value += value
+
+
+def post_at_average(move: StockMove, source, destination) -> None:
+    """Post a move to average-cost positions (either may be None)."""
+    quantity = abs(Decimal(move.quantity))
+    taken = issue_at_average(source, quantity) if source is not None else None
+    if destination is not None:
+        unit_cost = receipt_cost(move)
+        value = (
+            (unit_cost * quantity).quantize(SCALE) if unit_cost is not None else taken
+        )
+        receive_at_average(destination, quantity, value)
+
+
+class AveragePosition:
+    """Stock of a product at a location at moving-average cost."""
+
+    __slots__ = ("quantity", "value", "cogs")
+
+    def __init__(
+        self, quantity=ZERO, value=ZERO, cogs=ZERO, layers=None, last_cost=None
+    ):
+        self.quantity = Decimal(quantity)
+        self.value = Decimal(value)
+        self.cogs = Decimal(cogs)
+
+    @property
+    def layers(self) -> list[Layer]:
+        return []
+
+    @property
+    def last_cost(self) -> Decimal | None:
+        return None
+
+    def issue(self, quantity: Decimal) -> tuple[Decimal, list[Layer] | None]:
+        return issue_at_average(self, quantity), None
+
+    def receive(
+        self, quantity: Decimal, value: Decimal | None, layers: list[Layer] | None
+    ) -> None:
+        receive_at_average(self, quantity, value)
+
+
+class FifoPosition:
+    """Stock of a product at a location as first-in first-out cost layers.
+
+    Issuing more than is on hand leaves a negative layer at the last known
+    cost. Later receipts fill it first and book the difference to their
+    actual cost as cost of goods sold.
+    """
+
+    __slots__ = ("quantity", "value", "cogs", "_layers", "_last_cost")
+
+    def __init__(
+        self, quantity=ZERO, value=ZERO, cogs=ZERO, layers=None, last_cost=None
+    ):
+        self.quantity = Decimal(quantity)
+        self.value = Decimal(value)
+        self.cogs = Decimal(cogs)
+        self._layers = deque(
+            [Decimal(q), Decimal(c)] for q, c in (layers or ())
+        )  # [quantity, unit cost], oldest first
+        if last_cost is not None:
+            self._last_cost = Decimal(last_cost)
+        else:
+            self._last_cost = self._layers[-1][1] if self._layers else ZERO
+
+    @property
+    def layers(self) -> list[Layer]:
+        return [(q, c) for q, c in self._layers]
+
+    @property
+    def last_cost(self) -> Decimal | None:
+        return self._last_cost or None
+
+    def issue(self, quantity: Decimal) -> tuple[Decimal, list[Layer]]:
+        taken: list[Layer] = []
+        remaining = quantity
+        while remaining > 0 and self._layers and self._layers[0][0] > 0:
+            layer = self._layers[0]
+            used = min(layer[0], remaining)
+            taken.append((used, layer[1]))
+            layer[0] -= used
+            remaining -= used
+            if layer[0] == 0:
+                self._layers.popleft()
+        if remaining > 0:
+            cost = taken[-1][1] if taken else self._last_cost
+            taken.append((remaining, cost))
+            if self._layers and self._layers[0][0] < 0:
+                self._layers[0][0] -= remaining
+            else:
+                self._layers.appendleft([-remaining, cost])
+        value = sum((q * c for q, c in taken), ZERO).quantize(SCALE)
+        self.quantity -= quantity
+        self.value -= value
+        return value, taken
+
+    def receive(
+        self, quantity: Decimal, value: Decimal | None, layers: list[Layer] | None
+    ) -> None:
+        if layers is None:
+            if value is None:
+                unit_cost = (
+                    self.value / self.quantity if self.quantity > 0 else self._last_cost
+                )
+            else:
+                unit_cost = value / quantity
+            layers = [(quantity, unit_cost)]
+        for layer_quantity, unit_cost in layers:
+            if self._layers and self._layers[0][0] < 0:
+                shortfall = self._layers[0]
+                filled = min(layer_quantity, -shortfall[0])
+                self.cogs += (filled * (unit_cost - shortfall[1])).quantize(SCALE)
+                self.value += (filled * shortfall[1]).quantize(SCALE)
+                shortfall[0] += filled
+                layer_quantity -= filled
+                if shortfall[0] == 0:
+                    self._layers.popleft()
+            if layer_quantity > 0:
+                self._layers.append([layer_quantity, unit_cost])
+                self.value += (layer_quantity * unit_cost).quantize(SCALE)
+            self._last_cost = unit_cost
+        self.quantity += quantity
+
+
+POSITIONS = {FIFO: FifoPosition, AVERAGE: AveragePosition}
+
+
+def post(move: StockMove, source, destination) -> None:
+    """Post a move to FIFO or average positions (either may be None)."""
+    quantity = abs(Decimal(move.quantity))
+    value, layers = source.issue(quantity) if source is not None else (None, None)
+    if destination is None:
+        if source is not None:
+            source.cogs += value
+        return
+    unit_cost = receipt_cost(move)
+    if unit_cost is not None:
+        value, layers = (unit_cost * quantity).quantize(SCALE), [(quantity, unit_cost)]
+    destination.receive(quantity, value, layers)
+
+
+def replay(
+    moves: Iterable[StockMove],
+    positions: dict[tuple[UUID, UUID], AveragePosition | FifoPosition],
+    method: str,
+) -> None:
+    """Post moves, in ledger order, to positions keyed by (product, location).
+
+    Missing positions are created. Sides of a move without a location are
+    skipped; deleting a location nulls it on its moves.
+    """
+    factory = POSITIONS[method]
+
+    def position(product_id: UUID, location_id: UUID | None):
+        if location_id is None:
+            return None
+        key = (product_id, location_id)
+        if key not in positions:
+            positions[key] = factory()
+        return positions[key]
+
+    for move in moves:
+        source, destination, _ = direction(move)
+        post(
+            move,
+            position(move.product_id, source),
+            position(move.product_id, destination),
+        )
@@ -1,15 +1,41 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
-from uuid import UUID
+from uuid import UUID, uuid4
 
+from app.core.config_file import get_settings
 from app.core.exceptions import raise_bad_request, raise_not_found
+from app.core.pubsub.models import EventMetadata
+from app.core.pubsub.outbox import enqueue_event
+from app.modules.inventory.events import INVENTORY_MOVEMENTS_CREATED
+from app.modules.inventory.models.inventory import StockMove
 from app.modules.inventory.repositories.inventory_repository import InventoryRepository
+from app.modules.inventory.services.stock_balance_service import StockBalanceService
+
+# Bulk stock move error modes
+ALL_OR_NOTHING = "all_or_nothing"
+PER_LINE = "per_line"
+
+
+@dataclass
+class BulkStockMoveResult:
+    """Outcome of a bulk stock move import."""
+
+    moves: list[StockMove] = field(default_factory=list)
+    errors: list[dict] = field(default_factory=list)
+
+    def fail(self, line: int, code: str, message: str) -> None:
+        """Record a line (0-based) that was not imported."""
+        self.errors.append({"line": line, "code": code, "message": message})
 
 
 class InventoryService:
     def __init__(self, db):
+        self.db = db
         self.repository = InventoryRepository(db)
+        self.balances = StockBalanceService(db)
 
     # Warehouses
     def create_warehouse(self, tenant_id: UUID, data: dict):
@@ -90,9 +116,149 @@ def create_stock_move(self, tenant_id: UUID, user_id: UUID, data: dict):
         if qty == 0:
             raise_bad_request("INVALID_STOCK_MOVE", "Quantity must be non-zero")
 
-        return self.repository.create_stock_move(
-            {**data, "tenant_id": tenant_id, "created_by": user_id}
+        # The move and its balance updates commit together
+        try:
+            move = self.repository.create_stock_move(
+                {**data, "tenant_id": tenant_id, "created_by": user_id}, commit=False
+            )
+            self.balances.apply_moves(tenant_id, [move])
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        self.db.refresh(move)
+        return move
+
+    def create_stock_moves(
+        self,
+        tenant_id: UUID,
+        user_id: UUID,
+        lines: list[dict],
+        mode: str = ALL_OR_NOTHING,
+    ) -> BulkStockMoveResult:
+        """Import many stock moves in one transaction.
+
+        Locations and products of all lines are checked with one query each,
+        balances are updated in the same pass as the multi-row insert, and
+        one inventory.movements.created event covers the whole batch.
+
+        In ALL_OR_NOTHING mode any invalid line (unknown location or
+        product, zero quantity, not enough stock) fails the whole import
+        with a 400 listing every bad line. In PER_LINE mode the valid lines
+        are imported and the others returned as errors.
+        """
+        max_lines = get_settings().INVENTORY_BULK_MOVES_MAX_LINES
+        if len(lines) > max_lines:
+            raise_bad_request(
+                "TOO_MANY_STOCK_MOVES",
+                f"A bulk import takes at most {max_lines} lines",
+            )
+
+        warehouses = self.repository.get_location_warehouses(
+            tenant_id,
+            {
+                location_id
+                for data in lines
+                for location_id in (
+                    data.get("from_location_id"),
+                    data.get("to_location_id"),
+                )
+                if location_id
+            },
         )
+        products = self.repository.get_product_ids(
+            tenant_id, {data["product_id"] for data in lines}
+        )
+
+        result = BulkStockMoveResult()
+        candidates: list[tuple[int, StockMove]] = []
+        now = datetime.now(UTC)
+        for line, data in enumerate(lines):
+            location_ids = [
+                data.get(key)
+                for key in ("from_location_id", "to_location_id")
+                if data.get(key)
+            ]
+            if not location_ids:
+                result.fail(
+                    line,
+                    "INVALID_STOCK_MOVE",
+                    "Stock move requires at least one of from_location_id or "
+                    "to_location_id",
+                )
+            elif data.get("quantity") == 0:
+                result.fail(line, "INVALID_STOCK_MOVE", "Quantity must be non-zero")
+            elif data["product_id"] not in products:
+                result.fail(line, "PRODUCT_NOT_FOUND", "Product not found")
+            elif any(location_id not in warehouses for location_id in location_ids):
+                result.fail(line, "LOCATION_NOT_FOUND", "Location not found")
+            else:
+                # Microsecond steps keep the ledger order of the lines
+                candidates.append(
+                    (
+                        line,
+                        StockMove(
+                            **data,
+                            id=uuid4(),
+                            tenant_id=tenant_id,
+                            created_by=user_id,
+                            created_at=now + timedelta(microseconds=len(candidates)),
+                        ),
+                    )
+                )
+
+        try:
+            refused = self.balances.apply_moves(
+                tenant_id,
+                [move for _, move in candidates],
+                warehouses=warehouses,
+                partial=True,
+            )
+            for index in refused:
+                result.fail(
+                    candidates[index][0],
+                    "INSUFFICIENT_STOCK",
+                    "Not enough stock available at the source location",
+                )
+            refused = set(refused)
+            result.moves = [
+                move
+                for index, (_, move) in enumerate(candidates)
+                if index not in refused
+            ]
+            result.errors.sort(key=lambda error: error["line"])
+            if result.errors and mode == ALL_OR_NOTHING:
+                raise_bad_request(
+                    "INVALID_STOCK_MOVES",
+                    f"{len(result.errors)} of {len(lines)} stock move lines are "
+                    "invalid; nothing was imported",
+                    details={"errors": result.errors},
+                )
+            if result.moves:
+                self.repository.create_stock_moves(result.moves)
+                batch_id = uuid4()
+                enqueue_event(
+                    self.db,
+                    event_type=INVENTORY_MOVEMENTS_CREATED,
+                    entity_type="stock_move_batch",
+                    entity_id=batch_id,
+                    tenant_id=tenant_id,
+                    user_id=user_id,
+                    metadata=EventMetadata(
+                        source="inventory_service",
+                        version="1.0",
+                        additional_data={
+                            "batch_id": str(batch_id),
+                            "count": len(result.moves),
+                            "move_ids": [str(move.id) for move in result.moves],
+                        },
+                    ),
+                )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return result
 
     def list_stock_moves(
         self,
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+from app.core.config_file import get_settings
+from app.core.exceptions import raise_bad_request, raise_conflict, raise_not_found
+from app.modules.inventory.models.inventory import StockBalance, StockMove
+from app.modules.inventory.repositories.inventory_repository import InventoryRepository
+from app.modules.inventory.services.costing import (
+    AVERAGE,
+    AveragePosition,
+    direction,
+    post_at_average,
+    replay,
+)
+
+
+class StockBalanceService:
+    """Stock on hand per product and location, projected from the move ledger.
+
+    apply_moves updates the balances touched by new moves in the caller's
+    transaction, so a move and its effect on stock commit (or roll back)
+    together. rebuild recomputes a tenant's balances from the full ledger,
+    holding the tenant's balances lock exclusively so no move or reservation
+    lands between its ledger read and the swap.
+    """
+
+    def __init__(self, db):
+        self.repository = InventoryRepository(db)
+
+    def apply_moves(
+        self,
+        tenant_id: UUID,
+        moves: Iterable[StockMove],
+        warehouses: dict[UUID, UUID] | None = None,
+        partial: bool = False,
+    ) -> list[int]:
+        """Apply moves, in order, to their balances without committing.
+
+        The balance rows are locked until the caller commits. Unless
+        INVENTORY_ALLOW_NEGATIVE_STOCK is set, a move that takes more than
+        the available (on hand minus reserved) quantity out of a location
+        raises a 409 INSUFFICIENT_STOCK error; the caller must roll back.
+
+        Args:
+            tenant_id: Tenant ID
+            moves: Moves in ledger order
+            warehouses: Warehouse by location ID, if already loaded
+            partial: Skip moves short of stock instead of raising
+
+        Returns:
+            Indexes of the moves skipped for lack of stock
+        """
+        moves = list(moves)
+        location_ids = {
+            location_id
+            for move in moves
+            for location_id in (move.from_location_id, move.to_location_id)
+            if location_id
+        }
+        if not location_ids:
+            return []
+        if warehouses is None:
+            warehouses = self.repository.get_location_warehouses(
+                tenant_id, location_ids
+            )
+        self.repository.lock_tenant_balances(tenant_id)
+        balances = self.repository.lock_stock_balances(
+            tenant_id,
+            {
+                (move.product_id, location_id): warehouses[location_id]
+                for move in moves
+                for location_id in (move.from_location_id, move.to_location_id)
+                if location_id
+            },
+        )
+
+        guard = not get_settings().INVENTORY_ALLOW_NEGATIVE_STOCK
+        refused = []
+        for index, move in enumerate(moves):
+            source, destination, quantity = direction(move)
+            source_balance = balances[(move.product_id, source)] if source else None
+            if guard and source_balance is not None:
+                available = source_balance.quantity - source_balance.reserved
+                if quantity > available:
+                    if partial:
+                        refused.append(index)
+                        continue
+                    raise_conflict(
+                        "INSUFFICIENT_STOCK",
+                        "Not enough stock available at the source location",
+                        details={
+                            "product_id": str(move.product_id),
+                            "location_id": str(source),
+                            "available": str(available),
+                            "requested": str(quantity),
+                        },
+                    )
+            post_at_average(
+                move,
+                source_balance,
+                balances[(move.product_id, destination)] if destination else None,
+            )
+        return refused
+
+    def get_on_hand(
+        self, tenant_id: UUID, product_id: UUID, location_id: UUID
+    ) -> StockBalance | None:
+        return self.repository.get_stock_balance(
+            tenant_id=tenant_id, product_id=product_id, location_id=location_id
+        )
+
+    def list_balances(
+        self,
+        tenant_id: UUID,
+        product_id: UUID | None = None,
+        warehouse_id: UUID | None = None,
+        location_id: UUID | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[StockBalance]:
+        return self.repository.list_stock_balances(
+            tenant_id=tenant_id,
+            product_id=product_id,
+            warehouse_id=warehouse_id,
+            location_id=location_id,
+            skip=skip,
+            limit=limit,
+        )
+
+    def get_warehouse_stock(
+        self,
+        tenant_id: UUID,
+        warehouse_id: UUID | None = None,
+        product_id: UUID | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[dict]:
+        return self.repository.get_warehouse_stock(
+            tenant_id=tenant_id,
+            warehouse_id=warehouse_id,
+            product_id=product_id,
+            skip=skip,
+            limit=limit,
+        )
+
+    def reserve(
+        self,
+        tenant_id: UUID,
+        product_id: UUID,
+        location_id: UUID,
+        quantity: Decimal,
+    ) -> StockBalance:
+        """Reserve (or with a negative quantity, release) available stock."""
+        warehouses = self.repository.get_location_warehouses(tenant_id, [location_id])
+        if location_id not in warehouses:
+            raise_not_found("Location", str(location_id))
+        key = (product_id, location_id)
+        self.repository.lock_tenant_balances(tenant_id)
+        balance = self.repository.lock_stock_balances(
+            tenant_id, {key: warehouses[location_id]}
+        )[key]
+        available = balance.quantity - balance.reserved
+        if quantity > available:
+            self.repository.db.rollback()
+            raise_conflict(
+                "INSUFFICIENT_STOCK",
+                "Not enough stock available to reserve",
+                details={"available": str(available), "requested": str(quantity)},
+            )
+        if balance.reserved + quantity < 0:
+            self.repository.db.rollback()
+            raise_bad_request(
+                "INVALID_RESERVATION", "Cannot release more than is reserved"
+            )
+        balance.reserved += quantity
+        self.repository.db.commit()
+        self.repository.db.refresh(balance)
+        return balance
+
+    def rebuild(self, tenant_id: UUID) -> int:
+        """Recompute the tenant's balances from its whole move ledger.
+
+        Moves are replayed in (created_at, id) order with the same costing
+        as apply_moves, without the negative stock guard. Reservations are
+        kept. Positions at locations that no longer exist (deleted while the
+        ledger was read) are dropped. Returns the number of balance rows
+        written.
+        """
+        self.repository.lock_tenant_balances(tenant_id, exclusive=True)
+        warehouses = self.repository.get_location_warehouses(tenant_id)
+        reserved = {
+            (balance.product_id, balance.location_id): balance.reserved
+            for balance in self.repository.list_stock_balances(tenant_id, limit=None)
+            if balance.reserved
+        }
+        positions: dict[tuple[UUID, UUID], AveragePosition] = {
+            key: AveragePosition() for key in reserved
+        }
+        replay(self.repository.iter_stock_moves(tenant_id), positions, AVERAGE)
+
+        rows = [
+            {
+                "id": uuid4(),
+                "tenant_id": tenant_id,
+                "product_id": product_id,
+                "location_id": location_id,
+                "warehouse_id": warehouses[location_id],
+                "quantity": position.quantity,
+                "reserved": reserved.get((product_id, location_id), 0),
+                "value": position.value,
+            }
+            for (product_id, location_id), position in positions.items()
+            if location_id in warehouses
+        ]
+        self.repository.replace_stock_balances(tenant_id, rows)
+        return len(rows)
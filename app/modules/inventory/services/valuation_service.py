@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from functools import cache
+from threading import BoundedSemaphore
+from uuid import UUID
+
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config_file import get_settings
+from app.core.exceptions import raise_bad_request
+from app.modules.inventory.models.inventory import StockValuationCheckpoint
+from app.modules.inventory.repositories.inventory_repository import InventoryRepository
+from app.modules.inventory.services.costing import (
+    POSITIONS,
+    SCALE,
+    VALUATION_METHODS,
+    ZERO,
+    replay,
+)
+
+Positions = dict[tuple[UUID, UUID], object]
+
+
+def _aware(moment: datetime) -> datetime:
+    """Read naive datetimes as UTC."""
+    return moment if moment.tzinfo else moment.replace(tzinfo=UTC)
+
+
+@cache
+def _partition_slots(size: int) -> BoundedSemaphore:
+    """Process-wide partition sessions, shared by concurrent reports."""
+    return BoundedSemaphore(size)
+
+
+def _replay_partition(
+    repository: InventoryRepository,
+    tenant_id: UUID,
+    method: str,
+    checkpoint: tuple[UUID, datetime] | None,
+    until: datetime,
+    product_id: UUID | None = None,
+    partition: tuple[int, int] | None = None,
+) -> tuple[Positions, int]:
+    """Positions of one product partition at until, and the moves replayed."""
+    factory = POSITIONS[method]
+    positions: Positions = {}
+    after = None
+    if checkpoint:
+        checkpoint_id, after = checkpoint
+        for row in repository.get_valuation_positions(
+            checkpoint_id, product_id=product_id, partition=partition
+        ):
+            positions[(row.product_id, row.location_id)] = factory(
+                row.quantity, row.value, row.cogs, row.layers, row.last_cost
+            )
+
+    replayed = 0
+
+    def counted(moves):
+        nonlocal replayed
+        for move in moves:
+            replayed += 1
+            yield move
+
+    replay(
+        counted(
+            repository.iter_stock_moves(
+                tenant_id,
+                after=after,
+                until=until,
+                product_id=product_id,
+                partition=partition,
+            )
+        ),
+        positions,
+        method,
+    )
+    return positions, replayed
+
+
+class StockValuationService:
+    """Point-in-time stock quantity, value and cost of goods sold.
+
+    The move ledger is replayed in (created_at, id) order with FIFO cost
+    layers or at moving-average cost (see costing). Replays start from the
+    latest valuation checkpoint at or before the requested date, and without
+    a product filter run in INVENTORY_VALUATION_WORKERS parallel product
+    partitions, each on its own session (so they only see committed moves).
+    At most INVENTORY_VALUATION_WORKERS partition sessions are open in the
+    process at a time; partitions of concurrent reports wait for a free one.
+
+    Checkpoints assume moves are not backdated: a move created before the
+    latest checkpoint after it was taken is not reflected in later reports
+    until checkpoints from that point are deleted and taken again.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self.repository = InventoryRepository(db)
+
+    def valuation_as_of(
+        self,
+        tenant_id: UUID,
+        as_of: datetime,
+        method: str,
+        product_id: UUID | None = None,
+        warehouse_id: UUID | None = None,
+    ) -> dict:
+        """Stock and value per product and location at as_of.
+
+        Cost of goods sold is cumulative up to as_of; the difference between
+        two dates is the cost of goods sold in between (see cost_of_sales).
+        """
+        as_of = _aware(as_of)
+        positions, checkpoint, replayed = self._replay(
+            tenant_id, method, as_of, product_id
+        )
+        warehouses = self.repository.get_location_warehouses(tenant_id)
+        lines = []
+        for (line_product_id, location_id), position in positions.items():
+            location_warehouse_id = warehouses.get(location_id)
+            if warehouse_id and location_warehouse_id != warehouse_id:
+                continue
+            if not (position.quantity or position.value or position.cogs):
+                continue
+            lines.append(
+                {
+                    "product_id": line_product_id,
+                    "location_id": location_id,
+                    "warehouse_id": location_warehouse_id,
+                    "quantity": position.quantity,
+                    "value": position.value,
+                    "unit_cost": (
+                        (position.value / position.quantity).quantize(SCALE)
+                        if position.quantity > 0
+                        else None
+                    ),
+                    "cogs": position.cogs,
+                }
+            )
+        lines.sort(key=lambda line: (str(line["product_id"]), str(line["location_id"])))
+        return {
+            "as_of": as_of,
+            "method": method,
+            "checkpoint_as_of": checkpoint.as_of if checkpoint else None,
+            "replayed_moves": replayed,
+            "total_value": sum((line["value"] for line in lines), ZERO),
+            "total_cogs": sum((line["cogs"] for line in lines), ZERO),
+            "lines": lines,
+        }
+
+    def cost_of_sales(
+        self,
+        tenant_id: UUID,
+        date_from: datetime,
+        date_to: datetime,
+        method: str,
+        product_id: UUID | None = None,
+    ) -> dict:
+        """Cost of goods sold per product between date_from and date_to."""
+        date_from, date_to = _aware(date_from), _aware(date_to)
+        if date_from > date_to:
+            raise_bad_request(
+                "INVALID_DATE_RANGE", "date_from must not be after date_to"
+            )
+        cogs: dict[UUID, Decimal] = defaultdict(lambda: ZERO)
+        for moment, sign in ((date_to, 1), (date_from, -1)):
+            positions, _, _ = self._replay(tenant_id, method, moment, product_id)
+            for (line_product_id, _), position in positions.items():
+                cogs[line_product_id] += sign * position.cogs
+        lines = [
+            {"product_id": line_product_id, "cogs": amount}
+            for line_product_id, amount in sorted(
+                cogs.items(), key=lambda item: str(item[0])
+            )
+            if amount
+        ]
+        return {
+            "date_from": date_from,
+            "date_to": date_to,
+            "method": method,
+            "total_cogs": sum((line["cogs"] for line in lines), ZERO),
+            "lines": lines,
+        }
+
+    def create_checkpoint(
+        self, tenant_id: UUID, method: str, as_of: datetime | None = None
+    ) -> StockValuationCheckpoint:
+        """Snapshot the valuation at as_of (default: as late as allowed).
+
+        Only moves after the previous checkpoint are replayed. as_of must be
+        at least INVENTORY_VALUATION_CHECKPOINT_LAG_SECONDS in the past, so
+        moves still being committed are not left out.
+        """
+        latest = datetime.now(UTC) - timedelta(
+            seconds=get_settings().INVENTORY_VALUATION_CHECKPOINT_LAG_SECONDS
+        )
+        as_of = _aware(as_of) if as_of else latest
+        if as_of > latest:
+            raise_bad_request(
+                "INVALID_CHECKPOINT",
+                "Checkpoints can only be taken for moves that are already settled",
+                details={"latest_as_of": latest.isoformat()},
+            )
+        positions, previous, replayed = self._replay(tenant_id, method, as_of)
+        if previous and previous.as_of == as_of:
+            return previous
+
+        rows = [
+            {
+                "tenant_id": tenant_id,
+                "product_id": product_id,
+                "location_id": location_id,
+                "quantity": position.quantity,
+                "value": position.value,
+                "cogs": position.cogs,
+                "layers": [[str(q), str(c)] for q, c in position.layers] or None,
+                "last_cost": position.last_cost,
+            }
+            for (product_id, location_id), position in positions.items()
+            # An emptied FIFO position still prices later issues at last_cost
+            if position.quantity
+            or position.value
+            or position.cogs
+            or position.last_cost
+        ]
+        return self.repository.create_valuation_checkpoint(
+            {
+                "tenant_id": tenant_id,
+                "method": method,
+                "as_of": as_of,
+                "move_count": replayed,
+            },
+            rows,
+        )
+
+    def list_checkpoints(
+        self,
+        tenant_id: UUID,
+        method: str | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[StockValuationCheckpoint]:
+        return self.repository.list_valuation_checkpoints(
+            tenant_id=tenant_id, method=method, skip=skip, limit=limit
+        )
+
+    def _replay(
+        self,
+        tenant_id: UUID,
+        method: str,
+        until: datetime,
+        product_id: UUID | None = None,
+    ) -> tuple[Positions, StockValuationCheckpoint | None, int]:
+        """Positions at until, the checkpoint they start from and moves replayed."""
+        if method not in VALUATION_METHODS:
+            raise_bad_request(
+                "INVALID_VALUATION_METHOD",
+                f"Valuation method must be one of {', '.join(VALUATION_METHODS)}",
+            )
+        checkpoint = self.repository.get_latest_valuation_checkpoint(
+            tenant_id, method, until
+        )
+        start = (checkpoint.id, checkpoint.as_of) if checkpoint else None
+        workers = get_settings().INVENTORY_VALUATION_WORKERS
+        if product_id or workers <= 1:
+            positions, replayed = _replay_partition(
+                self.repository, tenant_id, method, start, until, product_id
+            )
+            return positions, checkpoint, replayed
+
+        session_factory = sessionmaker(bind=self.db.get_bind())
+        slots = _partition_slots(workers)
+
+        def run(index: int) -> tuple[Positions, int]:
+            with slots, session_factory() as session:
+                return _replay_partition(
+                    InventoryRepository(session),
+                    tenant_id,
+                    method,
+                    start,
+                    until,
+                    partition=(index, workers),
+                )
+
+        positions: Positions = {}
+        replayed = 0
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for partition_positions, partition_replayed in pool.map(
+                run, range(workers)
+            ):
+                positions.update(partition_positions)
+                replayed += partition_replayed
+        return positions, checkpoint, replayed
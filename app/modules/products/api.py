@@ -3,7 +3,7 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Query, Request, status
+from fastapi import APIRouter, Depends, Query, Request, status
 from sqlalchemy.orm import Session
 
 from app.core.auth.dependencies import require_permission
@@ -16,7 +16,6 @@
 )
 from app.core.logging import get_client_info
 from app.core.pubsub import EventPublisher, get_event_publisher
-from app.core.pubsub.models import EventMetadata
 from app.models.user import User
 from app.modules.products.repositories.product_repository import CategoryRepository
 from app.modules.products.schemas.product import (
@@ -669,7 +668,6 @@ async def get_product(
 async def create_product(
     product_data: ProductCreate,
     request: Request,
-    background_tasks: BackgroundTasks,
     current_user: Annotated[User, Depends(require_permission("products.create"))],
     db: Annotated[Session, Depends(get_db)],
     event_publisher: Annotated[EventPublisher, Depends(get_event_publisher)] = None,
@@ -683,7 +681,6 @@ async def create_product(
         product_data: Product creation data.
         current_user: Current authenticated user (must have products.create).
         db: Database session.
-        background_tasks: FastAPI background tasks.
         event_publisher: Event publisher instance.
 
     Returns:
@@ -707,31 +704,6 @@ async def create_product(
             user_agent=user_agent,
         )
 
-        # Publish event in background
-        if event_publisher:
-            # product["id"] is already a UUID object, not a string
-            product_id = (
-                product["id"]
-                if isinstance(product["id"], UUID)
-                else UUID(str(product["id"]))
-            )
-            background_tasks.add_task(
-                event_publisher.publish,
-                event_type="product.created",
-                entity_type="product",
-                entity_id=product_id,
-                tenant_id=current_user.tenant_id,
-                user_id=current_user.id,
-                metadata=EventMetadata(
-                    source="product_service",
-                    version="1.0",
-                    additional_data={
-                        "product_name": product.get("name"),
-                        "sku": product.get("sku"),
-                    },
-                ),
-            )
-
         return StandardResponse(data=product)
     except ValueError as e:
         error_msg = str(e)
@@ -802,7 +774,6 @@ async def update_product(
     product_id: str,
     product_data: ProductUpdate,
     request: Request,
-    background_tasks: BackgroundTasks,
     current_user: Annotated[User, Depends(require_permission("products.edit"))],
     db: Annotated[Session, Depends(get_db)],
     event_publisher: Annotated[EventPublisher, Depends(get_event_publisher)] = None,
@@ -817,7 +788,6 @@ async def update_product(
         product_data: Product update data.
         current_user: Current authenticated user (must have products.edit).
         db: Database session.
-        background_tasks: FastAPI background tasks.
         event_publisher: Event publisher instance.
 
     Returns:
@@ -842,25 +812,6 @@ async def update_product(
         if not updated_product:
             raise_not_found("Product", product_id)
 
-        # Publish event in background
-        if event_publisher:
-            background_tasks.add_task(
-                event_publisher.publish,
-                event_type="product.updated",
-                entity_type="product",
-                entity_id=product_uuid,
-                tenant_id=current_user.tenant_id,
-                user_id=current_user.id,
-                metadata=EventMetadata(
-                    source="product_service",
-                    version="1.0",
-                    additional_data={
-                        "product_name": updated_product.get("name"),
-                        "sku": updated_product.get("sku"),
-                    },
-                ),
-            )
-
         return StandardResponse(data=updated_product)
     except ValueError as e:
         error_msg = str(e)
@@ -916,7 +867,6 @@ async def update_product(
 async def delete_product(
     product_id: str,
     request: Request,
-    background_tasks: BackgroundTasks,
     current_user: Annotated[User, Depends(require_permission("products.delete"))],
     db: Annotated[Session, Depends(get_db)],
     event_publisher: Annotated[EventPublisher, Depends(get_event_publisher)] = None,
@@ -930,7 +880,6 @@ async def delete_product(
         product_id: Product UUID.
         current_user: Current authenticated user (must have products.delete).
         db: Database session.
-        background_tasks: FastAPI background tasks.
         event_publisher: Event publisher instance.
 
     Returns:
@@ -941,10 +890,7 @@ async def delete_product(
     except ValueError:
         raise_bad_request(code="INVALID_UUID", message="Invalid product ID format")
 
-    # Get product info before deletion for event
     product_service = ProductService(db, event_publisher=event_publisher)
-    product = product_service.get_product(product_uuid, current_user.tenant_id)
-
     ip_address, user_agent = get_client_info(request)
     success = product_service.delete_product(
         product_uuid,
@@ -956,25 +902,6 @@ async def delete_product(
     if not success:
         raise_not_found("Product", product_id)
 
-    # Publish event in background
-    if event_publisher and product:
-        background_tasks.add_task(
-            event_publisher.publish,
-            event_type="product.deleted",
-            entity_type="product",
-            entity_id=product_uuid,
-            tenant_id=current_user.tenant_id,
-            user_id=current_user.id,
-            metadata=EventMetadata(
-                source="product_service",
-                version="1.0",
-                additional_data={
-                    "product_name": product.get("name"),
-                    "sku": product.get("sku"),
-                },
-            ),
-        )
-
     return StandardResponse(data={"message": "Product deleted successfully"})
 
 
@@ -8,6 +8,13 @@
 
 from app.core.logging import create_audit_log_entry
 from app.core.pubsub import EventPublisher, get_event_publisher
+from app.core.pubsub.event_helpers import safe_publish_event
+from app.core.pubsub.models import EventMetadata
+from app.modules.products.events import (
+    PRODUCT_CREATED,
+    PRODUCT_DELETED,
+    PRODUCT_UPDATED,
+)
 from app.modules.products.models.product import Product
 from app.modules.products.repositories.product_repository import (
     CategoryRepository,
@@ -85,6 +92,26 @@ def __init__(self, db: Session, event_publisher: EventPublisher | None = None):
         self.barcode_repo = ProductBarcodeRepository(db)
         self.event_publisher = event_publisher or get_event_publisher()
 
+    def _publish_product_event(
+        self, event_type: str, product: Product, user_id: UUID | None
+    ) -> None:
+        """Store a product event in the outbox; OutboxRelay publishes it."""
+        safe_publish_event(
+            event_publisher=self.event_publisher,
+            db=self.db,
+            event_type=event_type,
+            entity_type="product",
+            entity_id=product.id,
+            tenant_id=product.tenant_id,
+            user_id=user_id,
+            metadata=EventMetadata(
+                source="product_service",
+                version="1.0",
+                additional_data={"product_name": product.name, "sku": product.sku},
+            ),
+        )
+        self.db.commit()
+
     # Validation methods
     @staticmethod
     def _validate_sku(sku: str) -> None:
@@ -223,19 +250,7 @@ def create_product(
                 user_agent=user_agent,
             )
 
-        # Publish event (fire and forget)
-        try:
-            # Note: This is a synchronous method, so we can't await.
-            # The event publisher will handle async execution internally.
-            # For now, we'll log that the event should be published.
-            # In a production environment, you might want to use a background task queue.
-            logger.info(
-                f"Product created: {product.id}, event should be published via background task"
-            )
-            # TODO: Implement proper async event publishing via background task
-        except Exception as e:
-            logger.error(f"Failed to prepare product.created event: {e}")
-            # Don't fail the operation if event publishing fails
+        self._publish_product_event(PRODUCT_CREATED, product, created_by)
 
         return self._product_to_dict(product)
 
@@ -379,15 +394,7 @@ def update_product(
                 user_agent=user_agent,
             )
 
-        # Publish event (fire and forget)
-        try:
-            logger.info(
-                f"Product updated: {product_id}, event should be published via background task"
-            )
-            # TODO: Implement proper async event publishing via background task
-        except Exception as e:
-            logger.error(f"Failed to prepare product.updated event: {e}")
-            # Don't fail the operation if event publishing fails
+        self._publish_product_event(PRODUCT_UPDATED, updated_product, updated_by)
 
         return self._product_to_dict(updated_product)
 
@@ -430,15 +437,7 @@ def delete_product(
                 user_agent=user_agent,
             )
 
-        # Publish event (fire and forget)
-        try:
-            logger.info(
-                f"Product deleted: {product_id}, event should be published via background task"
-            )
-            # TODO: Implement proper async event publishing via background task
-        except Exception as e:
-            logger.error(f"Failed to prepare product.deleted event: {e}")
-            # Don't fail the operation if event publishing fails
+        self._publish_product_event(PRODUCT_DELETED, product, deleted_by)
 
         return True
 
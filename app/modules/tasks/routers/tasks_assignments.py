@@ -53,7 +53,7 @@ async def create_assignment(
             message=f"Task with ID {task_id} not found",
         )
 
-    assignment = service.repository.create_assignment(
+    assignment = service.add_assignment(
         {
             "task_id": task_id,
             "tenant_id": current_user.tenant_id,
@@ -129,9 +129,7 @@ async def remove_assignment(
             message=f"Task with ID {task_id} not found",
         )
 
-    deleted = service.repository.delete_assignment(
-        assignment_id, current_user.tenant_id
-    )
+    deleted = service.remove_assignment(assignment_id, current_user.tenant_id)
     if not deleted:
         raise APIException(
             status_code=status.HTTP_404_NOT_FOUND,
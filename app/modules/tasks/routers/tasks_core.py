@@ -158,7 +158,7 @@ async def list_my_tasks(
 ) -> StandardListResponse[TaskResponse]:
     """List tasks visible to current user."""
     skip = (page - 1) * page_size
-    tasks = service.repository.get_visible_tasks(
+    tasks, total = service.list_visible_tasks(
         tenant_id=current_user.tenant_id,
         user_id=current_user.id,
         status=status,
@@ -166,17 +166,11 @@ async def list_my_tasks(
         skip=skip,
         limit=page_size,
     )
-    total = service.repository.count_visible_tasks(
-        tenant_id=current_user.tenant_id,
-        user_id=current_user.id,
-        status=status,
-        priority=priority,
-    )
 
     total_pages = (total + page_size - 1) // page_size if total > 0 else 0
 
     return StandardListResponse(
-        data=[TaskResponse.model_validate(t) for t in tasks],
+        data=tasks,
         meta=PaginationMeta(
             total=total,
             page=page,
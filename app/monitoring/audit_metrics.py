@@ -0,0 +1,126 @@
+"""Metrics for the buffered audit log writer."""
+
+try:
+    from prometheus_client import Counter, Gauge, Histogram
+
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+    # Fallback when Prometheus is not available
+    class Counter:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def labels(self, *args, **kwargs):
+            return self
+
+        def inc(self, *args, **kwargs):
+            pass
+
+    class Gauge:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def labels(self, *args, **kwargs):
+            return self
+
+        def set(self, *args, **kwargs):
+            pass
+
+    class Histogram:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def labels(self, *args, **kwargs):
+            return self
+
+        def observe(self, *args, **kwargs):
+            pass
+
+
+audit_logs_written_total = Counter(
+    "audit_logs_written_total",
+    "Audit log entries written by the buffered writer",
+)
+
+audit_flush_duration = Histogram(
+    "audit_flush_duration_seconds",
+    "Duration of one audit log COPY batch",
+)
+
+audit_logs_spilled_total = Counter(
+    "audit_logs_spilled_total",
+    "Audit log entries written to the local spill file",
+)
+
+audit_logs_dropped_total = Counter(
+    "audit_logs_dropped_total",
+    "Audit log entries lost because the spill file could not be written",
+)
+
+audit_logs_dead_lettered_total = Counter(
+    "audit_logs_dead_lettered_total",
+    "Audit log entries the database rejected, moved to the dead-letter file",
+)
+
+audit_logs_buffered = Gauge(
+    "audit_logs_buffered",
+    "Audit log entries waiting in memory",
+)
+
+
+class AuditMetrics:
+    """Metrics collector for the audit log writer."""
+
+    def __init__(self):
+        """Initialize the metrics collector."""
+        self.prometheus_available = PROMETHEUS_AVAILABLE
+
+    def record_flush(self, entries: int, duration_seconds: float) -> None:
+        """Record one COPY batch."""
+        if not self.prometheus_available:
+            return
+
+        audit_logs_written_total.inc(entries)
+        audit_flush_duration.observe(duration_seconds)
+
+    def record_spill(self, entries: int) -> None:
+        """Record entries written to the spill file."""
+        if not self.prometheus_available:
+            return
+
+        audit_logs_spilled_total.inc(entries)
+
+    def record_dropped(self, entries: int) -> None:
+        """Record entries that could be neither written nor spilled."""
+        if not self.prometheus_available:
+            return
+
+        audit_logs_dropped_total.inc(entries)
+
+    def record_dead_letter(self, entries: int) -> None:
+        """Record entries the database rejected."""
+        if not self.prometheus_available:
+            return
+
+        audit_logs_dead_lettered_total.inc(entries)
+
+    def set_buffered(self, entries: int) -> None:
+        """Set the number of entries waiting in memory."""
+        if not self.prometheus_available:
+            return
+
+        audit_logs_buffered.set(entries)
+
+
+# Singleton
+_audit_metrics = None
+
+
+def get_audit_metrics() -> AuditMetrics:
+    """Get the singleton metrics instance."""
+    global _audit_metrics
+    if _audit_metrics is None:
+        _audit_metrics = AuditMetrics()
+    return _audit_metrics
@@ -0,0 +1,102 @@
+"""Metrics for the Files module (deleted-file garbage collection)."""
+
+from uuid import UUID
+
+try:
+    from prometheus_client import Counter, Histogram
+
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+    # Fallback when Prometheus is not available
+    class Counter:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def labels(self, *args, **kwargs):
+            return self
+
+        def inc(self, *args, **kwargs):
+            pass
+
+    class Histogram:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def labels(self, *args, **kwargs):
+            return self
+
+        def observe(self, *args, **kwargs):
+            pass
+
+
+files_gc_files_deleted_total = Counter(
+    "files_gc_files_deleted_total",
+    "Total files permanently deleted by the garbage collector",
+    ["tenant_id"],
+)
+
+files_gc_objects_deleted_total = Counter(
+    "files_gc_objects_deleted_total",
+    "Total storage objects (files and versions) deleted by the garbage collector",
+    ["tenant_id"],
+)
+
+files_gc_bytes_freed_total = Counter(
+    "files_gc_bytes_freed_total",
+    "Total bytes freed by the garbage collector",
+    ["tenant_id"],
+)
+
+files_gc_errors_total = Counter(
+    "files_gc_errors_total",
+    "Total files the garbage collector failed to delete",
+    ["tenant_id"],
+)
+
+files_gc_batch_duration = Histogram(
+    "files_gc_batch_duration_seconds",
+    "Duration of a garbage collector batch",
+    ["tenant_id"],
+)
+
+
+class FileMetrics:
+    """Metrics collector for the Files module."""
+
+    def __init__(self):
+        """Initialize the metrics collector."""
+        self.prometheus_available = PROMETHEUS_AVAILABLE
+
+    def record_gc_batch(
+        self,
+        tenant_id: UUID,
+        files_deleted: int,
+        objects_deleted: int,
+        bytes_freed: int,
+        errors: int,
+        duration_seconds: float,
+    ):
+        """Record the outcome of a garbage collector batch."""
+        if not self.prometheus_available:
+            return
+
+        tenant = str(tenant_id)
+        files_gc_files_deleted_total.labels(tenant_id=tenant).inc(files_deleted)
+        files_gc_objects_deleted_total.labels(tenant_id=tenant).inc(objects_deleted)
+        files_gc_bytes_freed_total.labels(tenant_id=tenant).inc(bytes_freed)
+        files_gc_errors_total.labels(tenant_id=tenant).inc(errors)
+        files_gc_batch_duration.labels(tenant_id=tenant).observe(duration_seconds)
+
+
+# Singleton
+_file_metrics = None
+
+
+def get_file_metrics() -> FileMetrics:
+    """Get the singleton metrics instance."""
+    global _file_metrics
+    if _file_metrics is None:
+        _file_metrics = FileMetrics()
+    return _file_metrics
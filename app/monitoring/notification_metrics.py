@@ -0,0 +1,180 @@
+"""Metrics for the Notifications module (queue dispatcher, reminder pump)."""
+
+try:
+    from prometheus_client import Counter, Gauge, Histogram
+
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+    # Fallback when Prometheus is not available
+    class Counter:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def labels(self, *args, **kwargs):
+            return self
+
+        def inc(self, *args, **kwargs):
+            pass
+
+    class Gauge:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def labels(self, *args, **kwargs):
+            return self
+
+        def set(self, *args, **kwargs):
+            pass
+
+    class Histogram:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def labels(self, *args, **kwargs):
+            return self
+
+        def observe(self, *args, **kwargs):
+            pass
+
+
+notifications_dispatched_total = Counter(
+    "notifications_dispatched_total",
+    "Total notifications processed by the dispatcher",
+    ["channel", "status"],
+)
+
+notification_queue_age = Histogram(
+    "notification_queue_age_seconds",
+    "Time a notification spent in the queue before delivery",
+    ["channel"],
+    buckets=(0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 300, 900, 3600),
+)
+
+notification_rate_limit_wait = Histogram(
+    "notification_rate_limit_wait_seconds",
+    "Time spent waiting for a channel rate limit token",
+    ["channel"],
+)
+
+notifications_dispatch_throughput = Gauge(
+    "notifications_dispatch_throughput",
+    "Notifications delivered per second in the last dispatcher batch",
+)
+
+notification_dispatch_batch_duration = Histogram(
+    "notification_dispatch_batch_duration_seconds",
+    "Duration of a dispatcher batch",
+)
+
+notifications_coalesced_total = Counter(
+    "notifications_coalesced_total",
+    "Notifications held in a digest window and released by the coalescer",
+    ["channel"],
+)
+
+notification_digest_deliveries_total = Counter(
+    "notification_digest_deliveries_total",
+    "Entries handed to the dispatcher by the coalescer (digests and singles)",
+    ["channel"],
+)
+
+notification_coalescing_reduction = Gauge(
+    "notification_coalescing_reduction_factor",
+    "Notifications per delivery in the last coalescer flush",
+    ["channel"],
+)
+
+reminders_processed_total = Counter(
+    "reminders_processed_total",
+    "Due reminders processed by the reminder pump",
+    ["kind", "status"],
+)
+
+reminder_latency = Histogram(
+    "reminder_latency_seconds",
+    "Time from a reminder being due to its notifications being queued",
+    ["kind"],
+    buckets=(0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 900, 3600),
+)
+
+reminder_batch_duration = Histogram(
+    "reminder_batch_duration_seconds",
+    "Duration of a reminder pump batch",
+)
+
+
+class NotificationMetrics:
+    """Metrics collector for the Notifications module."""
+
+    def __init__(self):
+        """Initialize the metrics collector."""
+        self.prometheus_available = PROMETHEUS_AVAILABLE
+
+    def record_delivery(
+        self, channel: str, status: str, queue_age_seconds: float
+    ) -> None:
+        """Record the outcome of one notification delivery."""
+        if not self.prometheus_available:
+            return
+
+        notifications_dispatched_total.labels(channel=channel, status=status).inc()
+        notification_queue_age.labels(channel=channel).observe(queue_age_seconds)
+
+    def record_rate_limit_wait(self, channel: str, wait_seconds: float) -> None:
+        """Record time spent waiting on a channel rate limit."""
+        if not self.prometheus_available or wait_seconds <= 0:
+            return
+
+        notification_rate_limit_wait.labels(channel=channel).observe(wait_seconds)
+
+    def record_batch(self, notifications: int, duration_seconds: float) -> None:
+        """Record a dispatcher batch."""
+        if not self.prometheus_available:
+            return
+
+        notification_dispatch_batch_duration.observe(duration_seconds)
+        if duration_seconds > 0:
+            notifications_dispatch_throughput.set(notifications / duration_seconds)
+
+    def record_coalescing(self, channel: str, originals: int, deliveries: int) -> None:
+        """Record a coalescer flush for one channel."""
+        if not self.prometheus_available or deliveries <= 0:
+            return
+
+        notifications_coalesced_total.labels(channel=channel).inc(originals)
+        notification_digest_deliveries_total.labels(channel=channel).inc(deliveries)
+        notification_coalescing_reduction.labels(channel=channel).set(
+            originals / deliveries
+        )
+
+    def record_reminder(
+        self, kind: str, status: str, latency_seconds: float | None = None
+    ) -> None:
+        """Record one reminder processed by the reminder pump."""
+        if not self.prometheus_available:
+            return
+
+        reminders_processed_total.labels(kind=kind, status=status).inc()
+        if latency_seconds is not None:
+            reminder_latency.labels(kind=kind).observe(latency_seconds)
+
+    def record_reminder_batch(self, duration_seconds: float) -> None:
+        """Record a reminder pump batch."""
+        if not self.prometheus_available:
+            return
+
+        reminder_batch_duration.observe(duration_seconds)
+
+
+# Singleton
+_notification_metrics = None
+
+
+def get_notification_metrics() -> NotificationMetrics:
+    """Get the singleton metrics instance."""
+    global _notification_metrics
+    if _notification_metrics is None:
+        _notification_metrics = NotificationMetrics()
+    return _notification_metrics
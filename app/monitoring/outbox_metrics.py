@@ -0,0 +1,95 @@
+"""Metrics for the event outbox relay."""
+
+try:
+    from prometheus_client import Counter, Gauge, Histogram
+
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+    # Fallback when Prometheus is not available
+    class Counter:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def labels(self, *args, **kwargs):
+            return self
+
+        def inc(self, *args, **kwargs):
+            pass
+
+    class Gauge:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def set(self, *args, **kwargs):
+            pass
+
+    class Histogram:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def labels(self, *args, **kwargs):
+            return self
+
+        def observe(self, *args, **kwargs):
+            pass
+
+
+event_outbox_events_total = Counter(
+    "event_outbox_events_total",
+    "Outbox events processed by the relay",
+    ["outcome"],  # published, failed
+)
+
+event_outbox_lag_seconds = Gauge(
+    "event_outbox_lag_seconds",
+    "Age of the oldest event waiting in the outbox",
+)
+
+event_outbox_batch_duration = Histogram(
+    "event_outbox_batch_duration_seconds",
+    "Duration of an outbox relay batch",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+
+
+class OutboxMetrics:
+    """Metrics collector for the event outbox relay."""
+
+    def __init__(self):
+        """Initialize the metrics collector."""
+        self.prometheus_available = PROMETHEUS_AVAILABLE
+
+    def record_events(self, outcome: str, events: int = 1) -> None:
+        """Record relayed events."""
+        if not self.prometheus_available:
+            return
+
+        event_outbox_events_total.labels(outcome=outcome).inc(events)
+
+    def record_lag(self, lag_seconds: float) -> None:
+        """Record the age of the oldest pending event."""
+        if not self.prometheus_available:
+            return
+
+        event_outbox_lag_seconds.set(lag_seconds)
+
+    def record_batch(self, duration_seconds: float) -> None:
+        """Record a relay batch."""
+        if not self.prometheus_available:
+            return
+
+        event_outbox_batch_duration.observe(duration_seconds)
+
+
+# Singleton
+_outbox_metrics = None
+
+
+def get_outbox_metrics() -> OutboxMetrics:
+    """Get the singleton metrics instance."""
+    global _outbox_metrics
+    if _outbox_metrics is None:
+        _outbox_metrics = OutboxMetrics()
+    return _outbox_metrics
@@ -71,6 +71,12 @@ def set(self, *args, **kwargs):
     "task_overdue_total", "Total de tareas vencidas", ["tenant_id"]
 )
 
+task_list_cache_lookups_total = Counter(
+    "task_list_cache_lookups_total",
+    "Consultas al caché de listados de tareas visibles",
+    ["result"],  # hit, miss, coalesced, error
+)
+
 
 class TaskMetrics:
     """Colector de métricas de negocio para Tasks."""
@@ -142,6 +148,13 @@ def record_task_creation_duration(self, tenant_id: UUID, duration_seconds: float
             duration_seconds
         )
 
+    def record_list_cache_lookup(self, result: str):
+        """Registra una consulta al caché de listados de tareas."""
+        if not self.prometheus_available:
+            return
+
+        task_list_cache_lookups_total.labels(result=result).inc()
+
 
 # Singleton
 _task_metrics = None
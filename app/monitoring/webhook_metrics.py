@@ -0,0 +1,100 @@
+"""Metrics for outbound webhook delivery."""
+
+try:
+    from prometheus_client import Counter, Histogram
+
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+    # Fallback when Prometheus is not available
+    class Counter:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def labels(self, *args, **kwargs):
+            return self
+
+        def inc(self, *args, **kwargs):
+            pass
+
+    class Histogram:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def labels(self, *args, **kwargs):
+            return self
+
+        def observe(self, *args, **kwargs):
+            pass
+
+
+webhook_deliveries_total = Counter(
+    "webhook_deliveries_total",
+    "Webhook deliveries processed by the dispatcher",
+    ["outcome"],  # sent, retry, failed, deferred
+)
+
+webhook_request_duration = Histogram(
+    "webhook_request_duration_seconds",
+    "Duration of outbound webhook requests",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+
+webhook_circuit_opened_total = Counter(
+    "webhook_circuit_opened_total",
+    "Times a webhook endpoint circuit breaker opened",
+)
+
+webhook_dispatch_batch_duration = Histogram(
+    "webhook_dispatch_batch_duration_seconds",
+    "Duration of a webhook dispatcher batch",
+)
+
+
+class WebhookMetrics:
+    """Metrics collector for webhook delivery."""
+
+    def __init__(self):
+        """Initialize the metrics collector."""
+        self.prometheus_available = PROMETHEUS_AVAILABLE
+
+    def record_outcome(self, outcome: str, deliveries: int = 1) -> None:
+        """Record the outcome of deliveries."""
+        if not self.prometheus_available:
+            return
+
+        webhook_deliveries_total.labels(outcome=outcome).inc(deliveries)
+
+    def record_request(self, duration_seconds: float) -> None:
+        """Record an outbound webhook request."""
+        if not self.prometheus_available:
+            return
+
+        webhook_request_duration.observe(duration_seconds)
+
+    def record_circuit_opened(self) -> None:
+        """Record a circuit breaker opening."""
+        if not self.prometheus_available:
+            return
+
+        webhook_circuit_opened_total.inc()
+
+    def record_batch(self, duration_seconds: float) -> None:
+        """Record a dispatcher batch."""
+        if not self.prometheus_available:
+            return
+
+        webhook_dispatch_batch_duration.observe(duration_seconds)
+
+
+# Singleton
+_webhook_metrics = None
+
+
+def get_webhook_metrics() -> WebhookMetrics:
+    """Get the singleton metrics instance."""
+    global _webhook_metrics
+    if _webhook_metrics is None:
+        _webhook_metrics = WebhookMetrics()
+    return _webhook_metrics
@@ -4,8 +4,17 @@
 
 from sqlalchemy.orm import Session
 
+from app.core.search.text_search import SearchCursor, TextSearch
 from app.models.activity import Activity
 
+ACTIVITY_SEARCH = TextSearch(
+    Activity.search_vector,
+    Activity.title,
+    Activity.description,
+    created_at=Activity.created_at,
+    id_column=Activity.id,
+)
+
 
 class ActivityRepository:
     """Repository for activity data access."""
@@ -109,22 +118,36 @@ def search(
         skip: int = 0,
         limit: int = 100,
     ) -> list[Activity]:
-        """Search activities by text."""
-        query = (
-            self.db.query(Activity)
-            .filter(Activity.tenant_id == tenant_id)
-            .filter(
-                (Activity.title.ilike(f"%{query_text}%"))
-                | (Activity.description.ilike(f"%{query_text}%"))
+        """Search activities by text, most relevant first."""
+        return [
+            activity
+            for activity, _ in self.search_ranked(
+                tenant_id, query_text, entity_type, activity_type, skip, limit
             )
-        )
+        ]
+
+    def search_ranked(
+        self,
+        tenant_id: UUID,
+        query_text: str,
+        entity_type: str | None = None,
+        activity_type: str | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        after: SearchCursor | None = None,
+    ) -> list[tuple[Activity, float]]:
+        """Search activities by text, returning (activity, rank) pairs.
+
+        Pass the (rank, created_at, id) of the last result as after to read
+        the next page by keyset instead of offset.
+        """
+        query = self.db.query(Activity).filter(Activity.tenant_id == tenant_id)
         if entity_type:
             query = query.filter(Activity.entity_type == entity_type)
         if activity_type:
             query = query.filter(Activity.activity_type == activity_type)
-        return (
-            query.order_by(Activity.created_at.desc()).offset(skip).limit(limit).all()
-        )
+        query = ACTIVITY_SEARCH.ranked(query, query_text, after)
+        return [tuple(row) for row in query.offset(skip).limit(limit).all()]
 
     def count_search(
         self,
@@ -139,10 +162,7 @@ def count_search(
         query = (
             self.db.query(func.count(Activity.id))
             .filter(Activity.tenant_id == tenant_id)
-            .filter(
-                (Activity.title.ilike(f"%{query_text}%"))
-                | (Activity.description.ilike(f"%{query_text}%"))
-            )
+            .filter(ACTIVITY_SEARCH.matches(query_text))
         )
         if entity_type:
             query = query.filter(Activity.entity_type == entity_type)
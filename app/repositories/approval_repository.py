@@ -1,7 +1,10 @@
 """Approval repository for data access operations."""
 
+from collections.abc import Sequence
+from datetime import UTC, datetime
 from uuid import UUID
 
+from sqlalchemy import Float, and_, case, cast, func, tuple_
 from sqlalchemy.orm import Session
 
 from app.models.approval import (
@@ -9,6 +12,7 @@
     ApprovalDelegation,
     ApprovalFlow,
     ApprovalRequest,
+    ApprovalStatus,
     ApprovalStep,
 )
 
@@ -82,11 +86,23 @@ def delete_approval_flow(self, flow: ApprovalFlow) -> None:
         self.db.delete(flow)
         self.db.commit()
 
+    def _touch_approval_flow(self, flow_id: UUID) -> None:
+        """Bump a flow's updated_at, the version of its compiled steps.
+
+        Step edits do not change the flow row itself; bumping it keeps
+        FlowCompilationCache entries keyed on (id, updated_at) fresh in every
+        process.
+        """
+        self.db.query(ApprovalFlow).filter(ApprovalFlow.id == flow_id).update(
+            {ApprovalFlow.updated_at: datetime.now(UTC)}, synchronize_session=False
+        )
+
     # Approval Step methods
     def create_approval_step(self, step_data: dict) -> ApprovalStep:
         """Create a new approval step."""
         step = ApprovalStep(**step_data)
         self.db.add(step)
+        self._touch_approval_flow(step.flow_id)
         self.db.commit()
         self.db.refresh(step)
         return step
@@ -101,6 +117,38 @@ def get_approval_step_by_id(
             .first()
         )
 
+    def get_approval_flows_by_ids(
+        self, flow_ids: list[UUID], tenant_id: UUID
+    ) -> list[ApprovalFlow]:
+        """Get approval flows by IDs, excluding soft-deleted flows."""
+        if not flow_ids:
+            return []
+        return (
+            self.db.query(ApprovalFlow)
+            .filter(
+                ApprovalFlow.id.in_(flow_ids),
+                ApprovalFlow.tenant_id == tenant_id,
+                ApprovalFlow.deleted_at.is_(None),
+            )
+            .all()
+        )
+
+    def get_approval_steps_by_flows(
+        self, flow_ids: list[UUID], tenant_id: UUID
+    ) -> list[ApprovalStep]:
+        """Get the approval steps of several flows, in step order."""
+        if not flow_ids:
+            return []
+        return (
+            self.db.query(ApprovalStep)
+            .filter(
+                ApprovalStep.flow_id.in_(flow_ids),
+                ApprovalStep.tenant_id == tenant_id,
+            )
+            .order_by(ApprovalStep.flow_id, ApprovalStep.step_order.asc())
+            .all()
+        )
+
     def get_approval_steps_by_flow(
         self, flow_id: UUID, tenant_id: UUID
     ) -> list[ApprovalStep]:
@@ -118,6 +166,7 @@ def update_approval_step(self, step: ApprovalStep, step_data: dict) -> ApprovalS
         """Update approval step."""
         for key, value in step_data.items():
             setattr(step, key, value)
+        self._touch_approval_flow(step.flow_id)
         self.db.commit()
         self.db.refresh(step)
         return step
@@ -125,6 +174,7 @@ def update_approval_step(self, step: ApprovalStep, step_data: dict) -> ApprovalS
     def delete_approval_step(self, step: ApprovalStep) -> None:
         """Delete approval step."""
         self.db.delete(step)
+        self._touch_approval_flow(step.flow_id)
         self.db.commit()
 
     def delete_all_approval_steps(self, flow_id: UUID, tenant_id: UUID) -> None:
@@ -132,6 +182,7 @@ def delete_all_approval_steps(self, flow_id: UUID, tenant_id: UUID) -> None:
         self.db.query(ApprovalStep).filter(
             ApprovalStep.flow_id == flow_id, ApprovalStep.tenant_id == tenant_id
         ).delete()
+        self._touch_approval_flow(flow_id)
         self.db.commit()
 
     # Approval Request methods
@@ -155,6 +206,29 @@ def get_approval_request_by_id(
             .first()
         )
 
+    def get_approval_requests_by_ids(
+        self, request_ids: list[UUID], tenant_id: UUID, for_update: bool = False
+    ) -> list[ApprovalRequest]:
+        """Get approval requests by IDs.
+
+        Args:
+            request_ids: Request IDs
+            tenant_id: Tenant ID
+            for_update: Lock the rows until the transaction ends
+
+        Returns:
+            Requests found (in no particular order)
+        """
+        if not request_ids:
+            return []
+        query = self.db.query(ApprovalRequest).filter(
+            ApprovalRequest.id.in_(request_ids),
+            ApprovalRequest.tenant_id == tenant_id,
+        )
+        if for_update:
+            query = query.with_for_update()
+        return query.all()
+
     def get_approval_requests(
         self,
         tenant_id: UUID,
@@ -227,6 +301,68 @@ def get_approval_actions_by_request(
             .all()
         )
 
+    def count_step_approvers(
+        self, request_id: UUID, tenant_id: UUID, step_order: int
+    ) -> int:
+        """Count distinct users who approved a step of a request."""
+        return (
+            self.db.query(func.count(ApprovalAction.acted_by.distinct()))
+            .filter(
+                ApprovalAction.request_id == request_id,
+                ApprovalAction.tenant_id == tenant_id,
+                ApprovalAction.step_order == step_order,
+                ApprovalAction.action_type == "approve",
+            )
+            .scalar()
+        )
+
+    def get_step_approvers_by_requests(
+        self, request_ids: list[UUID], tenant_id: UUID
+    ) -> dict[tuple[UUID, int], set[UUID]]:
+        """Get the distinct users who approved each step of several requests.
+
+        Returns:
+            {(request_id, step_order): approver IDs}
+        """
+        approvers: dict[tuple[UUID, int], set[UUID]] = {}
+        if not request_ids:
+            return approvers
+        rows = (
+            self.db.query(
+                ApprovalAction.request_id,
+                ApprovalAction.step_order,
+                ApprovalAction.acted_by,
+            )
+            .filter(
+                ApprovalAction.request_id.in_(request_ids),
+                ApprovalAction.tenant_id == tenant_id,
+                ApprovalAction.action_type == "approve",
+                ApprovalAction.acted_by.is_not(None),
+            )
+            .distinct()
+            .all()
+        )
+        for request_id, step_order, acted_by in rows:
+            approvers.setdefault((request_id, step_order), set()).add(acted_by)
+        return approvers
+
+    def create_approval_actions(
+        self, actions_data: list[dict], commit: bool = True
+    ) -> list[ApprovalAction]:
+        """Create several approval actions in one transaction.
+
+        With commit=False the actions are only flushed, so they are written
+        (or rolled back) together with the caller's other changes.
+        """
+        actions = [ApprovalAction(**data) for data in actions_data]
+        if actions:
+            self.db.add_all(actions)
+            if commit:
+                self.db.commit()
+            else:
+                self.db.flush()
+        return actions
+
     # Approval Delegation methods
     def create_approval_delegation(self, delegation_data: dict) -> ApprovalDelegation:
         """Create a new approval delegation."""
@@ -274,3 +410,83 @@ def delete_approval_delegation(self, delegation: ApprovalDelegation) -> None:
         """Delete approval delegation."""
         self.db.delete(delegation)
         self.db.commit()
+
+    # Statistics
+    def get_approval_stats(
+        self, tenant_id: UUID, percentiles: Sequence[float] = ()
+    ) -> dict:
+        """Get approval request statistics of a tenant in one grouped query.
+
+        GROUPING SETS ((status), (flow_id), ()) returns the count per status,
+        the count per flow and the tenant total (with the approval time
+        aggregates) in one pass over the tenant's requests.
+
+        Args:
+            tenant_id: Tenant ID
+            percentiles: Fractions (0-1) of approval time to compute with
+                percentile_cont (optional)
+
+        Returns:
+            Dict with total_requests, status_counts, avg_approval_time_seconds,
+            flow_counts ({flow_id: count}) and approval_time_percentiles
+            ({fraction: seconds}, only for the requested percentiles)
+        """
+        approval_seconds = case(
+            (
+                and_(
+                    ApprovalRequest.status == ApprovalStatus.APPROVED.value,
+                    ApprovalRequest.completed_at.is_not(None),
+                ),
+                cast(
+                    func.extract(
+                        "epoch",
+                        ApprovalRequest.completed_at - ApprovalRequest.requested_at,
+                    ),
+                    Float,
+                ),
+            )
+        )
+        rows = (
+            self.db.query(
+                ApprovalRequest.status,
+                ApprovalRequest.flow_id,
+                func.grouping(ApprovalRequest.status, ApprovalRequest.flow_id),
+                func.count(),
+                func.avg(approval_seconds),
+                *(
+                    func.percentile_cont(fraction).within_group(approval_seconds)
+                    for fraction in percentiles
+                ),
+            )
+            .filter(ApprovalRequest.tenant_id == tenant_id)
+            .group_by(
+                func.grouping_sets(
+                    tuple_(ApprovalRequest.status),
+                    tuple_(ApprovalRequest.flow_id),
+                    tuple_(),
+                )
+            )
+            .all()
+        )
+
+        stats = {
+            "total_requests": 0,
+            "status_counts": {},
+            "avg_approval_time_seconds": None,
+            "flow_counts": {},
+            "approval_time_percentiles": {},
+        }
+        for status, flow_id, grouping, count, avg_seconds, *values in rows:
+            # grouping() sets bit 1 for status and bit 0 for flow_id when the
+            # column is not part of the row's grouping set
+            if grouping == 1:
+                stats["status_counts"][status] = count
+            elif grouping == 2:
+                stats["flow_counts"][flow_id] = count
+            else:
+                stats["total_requests"] = count
+                stats["avg_approval_time_seconds"] = avg_seconds
+                stats["approval_time_percentiles"] = dict(
+                    zip(percentiles, values, strict=True)
+                )
+        return stats
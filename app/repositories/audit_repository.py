@@ -1,13 +1,39 @@
 """Audit log repository for data access operations."""
 
+import csv
+import io
+import json
 from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import String, cast, tuple_
+from sqlalchemy.orm import Query, Session
 
+from app.core.search.text_search import TextSearch
 from app.models.audit_log import AuditLog
 
+# Columns written by copy_audit_logs, in COPY order
+COPY_COLUMNS = (
+    "id",
+    "user_id",
+    "tenant_id",
+    "action",
+    "resource_type",
+    "resource_id",
+    "details",
+    "ip_address",
+    "user_agent",
+    "created_at",
+)
+
+AUDIT_SEARCH = TextSearch(
+    AuditLog.search_vector,
+    cast(AuditLog.details, String),
+    created_at=AuditLog.created_at,
+    id_column=AuditLog.id,
+)
+
 
 class AuditRepository:
     """Repository for audit log data access."""
@@ -58,6 +84,91 @@ def create_audit_log(
         self.db.refresh(audit_log)
         return audit_log
 
+    def copy_audit_logs(self, entries: list[dict[str, Any]]) -> int:
+        """Write audit log entries with one COPY (the caller commits).
+
+        COPY streams all rows in one round trip and PostgreSQL routes them to
+        their monthly partitions. Entries need every column of COPY_COLUMNS
+        except the optional ones, which default to None.
+
+        Args:
+            entries: Audit log column values, with id and created_at set
+
+        Returns:
+            Number of rows written
+        """
+        if not entries:
+            return 0
+        buffer = io.StringIO()
+        # Strings (UUIDs, timestamps, JSON) are quoted, so an unquoted empty
+        # field is NULL and a quoted one an empty string
+        writer = csv.writer(buffer, quoting=csv.QUOTE_NONNUMERIC)
+        for entry in entries:
+            row = []
+            for column in COPY_COLUMNS:
+                value = entry.get(column)
+                if value is None:
+                    row.append(None)
+                elif column == "details":
+                    row.append(json.dumps(value, default=str))
+                elif isinstance(value, datetime):
+                    row.append(value.isoformat())
+                else:
+                    row.append(str(value))
+            writer.writerow(row)
+        buffer.seek(0)
+
+        cursor = self.db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY audit_logs ({', '.join(COPY_COLUMNS)}) "
+                "FROM STDIN WITH (FORMAT csv)",
+                buffer,
+            )
+        finally:
+            cursor.close()
+        return len(entries)
+
+    def _filtered(
+        self,
+        tenant_id: UUID,
+        user_id: UUID | None = None,
+        action: str | None = None,
+        resource_type: str | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        ip_address: str | None = None,
+        user_agent: str | None = None,
+        details_search: str | None = None,
+        details_filter: dict[str, Any] | None = None,
+    ) -> Query:
+        """Audit logs of a tenant matching the filters (unordered)."""
+        query = self.db.query(AuditLog).filter(AuditLog.tenant_id == tenant_id)
+
+        # Apply filters
+        if user_id is not None:
+            query = query.filter(AuditLog.user_id == user_id)
+        if action is not None:
+            query = query.filter(AuditLog.action == action)
+        if resource_type is not None:
+            query = query.filter(AuditLog.resource_type == resource_type)
+        if date_from is not None:
+            query = query.filter(AuditLog.created_at >= date_from)
+        if date_to is not None:
+            query = query.filter(AuditLog.created_at <= date_to)
+        if ip_address is not None:
+            query = query.filter(AuditLog.ip_address.ilike(f"%{ip_address}%"))
+        if user_agent is not None:
+            query = query.filter(AuditLog.user_agent.ilike(f"%{user_agent}%"))
+        if details_search is not None:
+            # Words of the details string values, or a substring of the JSON
+            # text (both indexed, see AUDIT_SEARCH)
+            query = query.filter(AUDIT_SEARCH.matches(details_search))
+        if details_filter:
+            # details @> filter, served by the GIN jsonb_path_ops index
+            query = query.filter(AuditLog.details.contains(details_filter))
+        return query
+
     def get_audit_logs(
         self,
         tenant_id: UUID,
@@ -71,6 +182,7 @@ def get_audit_logs(
         details_search: str | None = None,
         skip: int = 0,
         limit: int = 100,
+        details_filter: dict[str, Any] | None = None,
     ) -> tuple[list[AuditLog], int]:
         """
         Get audit logs with filters and pagination.
@@ -87,45 +199,71 @@ def get_audit_logs(
             details_search: Search in details JSON (partial match, optional).
             skip: Number of records to skip.
             limit: Maximum number of records to return.
+            details_filter: JSON object the details must contain (optional).
 
         Returns:
             Tuple of (list of AuditLog instances, total count).
         """
-        from sqlalchemy import String, cast
-
-        query = self.db.query(AuditLog).filter(AuditLog.tenant_id == tenant_id)
-
-        # Apply filters
-        if user_id is not None:
-            query = query.filter(AuditLog.user_id == user_id)
-        if action is not None:
-            query = query.filter(AuditLog.action == action)
-        if resource_type is not None:
-            query = query.filter(AuditLog.resource_type == resource_type)
-        if date_from is not None:
-            query = query.filter(AuditLog.created_at >= date_from)
-        if date_to is not None:
-            query = query.filter(AuditLog.created_at <= date_to)
-        if ip_address is not None:
-            query = query.filter(AuditLog.ip_address.ilike(f"%{ip_address}%"))
-        if user_agent is not None:
-            query = query.filter(AuditLog.user_agent.ilike(f"%{user_agent}%"))
-        if details_search is not None:
-            # Search in details JSON by casting to text and using ilike
-            query = query.filter(
-                cast(AuditLog.details, String).ilike(f"%{details_search}%")
-            )
+        query = self._filtered(
+            tenant_id,
+            user_id,
+            action,
+            resource_type,
+            date_from,
+            date_to,
+            ip_address,
+            user_agent,
+            details_search,
+            details_filter,
+        )
 
         # Get total count before pagination
         total = query.count()
 
         # Apply pagination and ordering
         logs = (
-            query.order_by(AuditLog.created_at.desc()).offset(skip).limit(limit).all()
+            query.order_by(AuditLog.created_at.desc(), AuditLog.id.desc())
+            .offset(skip)
+            .limit(limit)
+            .all()
         )
 
         return logs, total
 
+    def get_audit_logs_after(
+        self,
+        tenant_id: UUID,
+        after: tuple[datetime, UUID] | None = None,
+        limit: int = 100,
+        **filters: Any,
+    ) -> list[AuditLog]:
+        """
+        Get a page of audit logs by keyset, newest first.
+
+        Reads continue below the (created_at, id) of the last entry of the
+        previous page, so deep pages cost the same as the first one and no
+        COUNT is run.
+
+        Args:
+            tenant_id: Tenant ID (required for multi-tenancy).
+            after: (created_at, id) of the last entry of the previous page.
+            limit: Maximum number of records to return.
+            **filters: Filters of get_audit_logs.
+
+        Returns:
+            List of AuditLog instances.
+        """
+        query = self._filtered(tenant_id, **filters)
+        if after is not None:
+            query = query.filter(
+                tuple_(AuditLog.created_at, AuditLog.id) < tuple_(*after)
+            )
+        return (
+            query.order_by(AuditLog.created_at.desc(), AuditLog.id.desc())
+            .limit(limit)
+            .all()
+        )
+
     def get_audit_logs_by_user(
         self,
         user_id: UUID,
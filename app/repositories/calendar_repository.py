@@ -1,15 +1,46 @@
 """Calendar repository for data access operations."""
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    Subquery,
+    and_,
+    exists,
+    func,
+    or_,
+    select,
+    tuple_,
+    union,
+    update,
+)
+from sqlalchemy.orm import Session, contains_eager
 
 from app.models.calendar import (
+    AttendeeStatus,
     Calendar,
     CalendarEvent,
     EventAttendee,
     EventReminder,
+    EventResource,
+    EventStatus,
+    RecurrenceType,
+)
+
+# Rows that are masters of a recurring series (matches idx_events_recurring_time)
+IS_RECURRING = or_(
+    CalendarEvent.recurrence_type != RecurrenceType.NONE.value,
+    CalendarEvent.recurrence_rule.isnot(None),
+)
+
+# Longest lead time of an event reminder (see CalendarService.add_reminder)
+REMINDER_MAX_MINUTES_BEFORE = 10080
+
+# When an event reminder is due
+REMINDER_DUE_AT = CalendarEvent.start_time - func.make_interval(
+    0, 0, 0, 0, 0, EventReminder.minutes_before
 )
 
 
@@ -131,8 +162,6 @@ def count_events_by_calendar(
         status: str | None = None,
     ) -> int:
         """Count events by calendar with optional date range and status filter."""
-        from sqlalchemy import func
-
         query = self.db.query(func.count(CalendarEvent.id)).filter(
             CalendarEvent.calendar_id == calendar_id,
             CalendarEvent.tenant_id == tenant_id,
@@ -147,6 +176,47 @@ def count_events_by_calendar(
 
         return query.scalar() or 0
 
+    def _user_event_keys(
+        self,
+        user_id: UUID,
+        tenant_id: UUID,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        after: tuple[datetime, UUID] | None = None,
+        limit: int | None = None,
+    ) -> Subquery:
+        """(start_time, id) of events where user is organizer or attendee.
+
+        Each UNION branch is an index range scan (organizer time index and
+        attendee user index); UNION removes events reached through both. With
+        a limit, each branch stops after its first rows in calendar order.
+        """
+
+        def branch(query: Select) -> Select:
+            query = query.where(CalendarEvent.tenant_id == tenant_id)
+            if start_date:
+                query = query.where(CalendarEvent.start_time >= start_date)
+            if end_date:
+                query = query.where(CalendarEvent.end_time <= end_date)
+            if after is not None:
+                query = query.where(
+                    tuple_(CalendarEvent.start_time, CalendarEvent.id) > tuple_(*after)
+                )
+            if limit is not None:
+                query = query.order_by(
+                    CalendarEvent.start_time, CalendarEvent.id
+                ).limit(limit)
+            return query
+
+        keys = (CalendarEvent.start_time, CalendarEvent.id)
+        organizer = branch(select(*keys).where(CalendarEvent.organizer_id == user_id))
+        attendee = branch(
+            select(*keys)
+            .join(EventAttendee, EventAttendee.event_id == CalendarEvent.id)
+            .where(EventAttendee.user_id == user_id)
+        )
+        return union(organizer, attendee).subquery("user_events")
+
     def get_events_by_user(
         self,
         user_id: UUID,
@@ -155,50 +225,35 @@ def get_events_by_user(
         end_date: datetime | None = None,
         skip: int = 0,
         limit: int = 100,
+        after: tuple[datetime, UUID] | None = None,
     ) -> list[CalendarEvent]:
-        """Get events where user is organizer or attendee."""
-        # Get events where user is organizer
-        organizer_query = self.db.query(CalendarEvent).filter(
-            CalendarEvent.organizer_id == user_id,
-            CalendarEvent.tenant_id == tenant_id,
+        """Get events where user is organizer or attendee, in calendar order.
+
+        Args:
+            user_id: User ID
+            tenant_id: Tenant ID
+            start_date: Only events starting at or after this time
+            end_date: Only events ending at or before this time
+            skip: Pagination offset
+            limit: Pagination limit
+            after: Keyset cursor, the (start_time, id) of the last event of the
+                previous page; when given, skip is usually 0
+
+        Returns:
+            List of events
+        """
+        keys = self._user_event_keys(
+            user_id, tenant_id, start_date, end_date, after, limit=skip + limit
         )
-
-        # Get events where user is attendee
-        attendee_query = (
+        return (
             self.db.query(CalendarEvent)
-            .join(EventAttendee)
-            .filter(
-                EventAttendee.user_id == user_id,
-                CalendarEvent.tenant_id == tenant_id,
-            )
+            .join(keys, keys.c.id == CalendarEvent.id)
+            .order_by(keys.c.start_time, keys.c.id)
+            .offset(skip)
+            .limit(limit)
+            .all()
         )
 
-        # Combine queries
-        if start_date:
-            organizer_query = organizer_query.filter(
-                CalendarEvent.start_time >= start_date
-            )
-            attendee_query = attendee_query.filter(
-                CalendarEvent.start_time >= start_date
-            )
-        if end_date:
-            organizer_query = organizer_query.filter(CalendarEvent.end_time <= end_date)
-            attendee_query = attendee_query.filter(CalendarEvent.end_time <= end_date)
-
-        # Get results and combine
-        organizer_events = organizer_query.all()
-        attendee_events = attendee_query.all()
-
-        # Combine and deduplicate
-        all_events = {event.id: event for event in organizer_events + attendee_events}
-        events_list = list(all_events.values())
-
-        # Sort by start_time
-        events_list.sort(key=lambda e: e.start_time)
-
-        # Apply pagination
-        return events_list[skip : skip + limit]
-
     def count_events_by_user(
         self,
         user_id: UUID,
@@ -206,45 +261,215 @@ def count_events_by_user(
         start_date: datetime | None = None,
         end_date: datetime | None = None,
     ) -> int:
-        """Count events where user is organizer or attendee."""
-        from sqlalchemy import func
+        """Count events where user is organizer or attendee, each once."""
+        keys = self._user_event_keys(user_id, tenant_id, start_date, end_date)
+        return self.db.scalar(select(func.count()).select_from(keys)) or 0
 
-        # Count events where user is organizer
-        organizer_query = self.db.query(func.count(CalendarEvent.id)).filter(
-            CalendarEvent.organizer_id == user_id,
-            CalendarEvent.tenant_id == tenant_id,
-        )
+    def _window_query(
+        self,
+        tenant_id: UUID,
+        calendar_id: UUID | None = None,
+        user_id: UUID | None = None,
+    ) -> Select:
+        query = select(CalendarEvent).where(CalendarEvent.tenant_id == tenant_id)
+        if calendar_id:
+            query = query.where(CalendarEvent.calendar_id == calendar_id)
+        if user_id:
+            # Overrides share the attendees of their recurring event
+            query = query.where(
+                or_(
+                    CalendarEvent.organizer_id == user_id,
+                    exists().where(
+                        EventAttendee.user_id == user_id,
+                        or_(
+                            EventAttendee.event_id == CalendarEvent.id,
+                            EventAttendee.event_id
+                            == CalendarEvent.recurrence_master_id,
+                        ),
+                    ),
+                )
+            )
+        return query
 
-        # Count events where user is attendee
-        attendee_query = (
-            self.db.query(func.count(CalendarEvent.id.distinct()))
-            .join(EventAttendee)
-            .filter(
-                EventAttendee.user_id == user_id,
-                CalendarEvent.tenant_id == tenant_id,
+    def single_events_in_window_query(
+        self,
+        tenant_id: UUID,
+        window_start: datetime,
+        window_end: datetime,
+        calendar_id: UUID | None = None,
+        user_id: UUID | None = None,
+    ) -> Select:
+        """Query for non-recurring events (and overrides) overlapping a window.
+
+        Ordered by start_time, so it can be streamed with yield_per.
+        """
+        return (
+            self._window_query(tenant_id, calendar_id, user_id)
+            .where(
+                ~IS_RECURRING,
+                CalendarEvent.start_time < window_end,
+                CalendarEvent.end_time > window_start,
             )
+            .order_by(CalendarEvent.start_time, CalendarEvent.id)
         )
 
-        # Apply date filters
-        if start_date:
-            organizer_query = organizer_query.filter(
-                CalendarEvent.start_time >= start_date
+    def get_recurring_events_in_window(
+        self,
+        tenant_id: UUID,
+        window_start: datetime,
+        window_end: datetime,
+        calendar_id: UUID | None = None,
+        user_id: UUID | None = None,
+    ) -> list[CalendarEvent]:
+        """Get recurring events whose series may have occurrences in a window.
+
+        Series ending before the window (by recurrence_end_date) are left out;
+        COUNT-bounded series are filtered out during expansion.
+        """
+        query = self._window_query(tenant_id, calendar_id, user_id).where(
+            IS_RECURRING,
+            CalendarEvent.start_time < window_end,
+            or_(
+                CalendarEvent.recurrence_end_date.is_(None),
+                CalendarEvent.recurrence_end_date >= window_start,
+            ),
+        )
+        return list(self.db.scalars(query))
+
+    def get_overridden_starts(
+        self, master_ids: list[UUID], before: datetime
+    ) -> dict[UUID, set[datetime]]:
+        """Get original starts of overridden occurrences, by recurring event ID.
+
+        Args:
+            master_ids: Recurring event IDs
+            before: Only occurrences originally starting before this time
+        """
+        if not master_ids:
+            return {}
+        rows = self.db.execute(
+            select(
+                CalendarEvent.recurrence_master_id,
+                CalendarEvent.recurrence_original_start,
+            ).where(
+                CalendarEvent.recurrence_master_id.in_(master_ids),
+                CalendarEvent.recurrence_original_start < before,
             )
-            attendee_query = attendee_query.filter(
-                CalendarEvent.start_time >= start_date
+        )
+        overridden: dict[UUID, set[datetime]] = {}
+        for master_id, original_start in rows:
+            overridden.setdefault(master_id, set()).add(original_start)
+        return overridden
+
+    def get_occurrence_override(
+        self, master_id: UUID, original_start: datetime
+    ) -> CalendarEvent | None:
+        """Get the override of one occurrence of a recurring event."""
+        return self.db.scalar(
+            select(CalendarEvent).where(
+                CalendarEvent.recurrence_master_id == master_id,
+                CalendarEvent.recurrence_original_start == original_start,
             )
-        if end_date:
-            organizer_query = organizer_query.filter(CalendarEvent.end_time <= end_date)
-            attendee_query = attendee_query.filter(CalendarEvent.end_time <= end_date)
+        )
+
+    def _busy_in_window(
+        self, window_start: datetime, window_end: datetime
+    ) -> ColumnElement[bool]:
+        """Events that can take time in a window.
+
+        Single events must overlap the window (GiST index on time_range;
+        zero-length events never overlap); recurring series must still run.
+        """
+        return and_(
+            CalendarEvent.status != EventStatus.CANCELLED.value,
+            or_(
+                and_(
+                    ~IS_RECURRING,
+                    CalendarEvent.time_range.op("&&")(
+                        func.tstzrange(window_start, window_end, "[)")
+                    ),
+                ),
+                and_(
+                    IS_RECURRING,
+                    CalendarEvent.start_time < window_end,
+                    or_(
+                        CalendarEvent.recurrence_end_date.is_(None),
+                        CalendarEvent.recurrence_end_date >= window_start,
+                    ),
+                ),
+            ),
+        )
 
-        # Get counts
-        organizer_count = organizer_query.scalar() or 0
-        attendee_count = attendee_query.scalar() or 0
+    def get_user_busy_events(
+        self,
+        tenant_id: UUID,
+        user_ids: list[UUID],
+        window_start: datetime,
+        window_end: datetime,
+    ) -> list[tuple[UUID, CalendarEvent]]:
+        """Get (user_id, event) pairs of events that make users busy in a window.
+
+        Users are busy for events they organize or attend (unless declined),
+        including overrides of recurring events they attend.
+        """
+        if not user_ids:
+            return []
+        participants = union(
+            select(
+                CalendarEvent.id.label("event_id"),
+                CalendarEvent.organizer_id.label("user_id"),
+            ).where(
+                CalendarEvent.tenant_id == tenant_id,
+                CalendarEvent.organizer_id.in_(user_ids),
+            ),
+            select(EventAttendee.event_id, EventAttendee.user_id).where(
+                EventAttendee.tenant_id == tenant_id,
+                EventAttendee.user_id.in_(user_ids),
+                EventAttendee.status != AttendeeStatus.DECLINED.value,
+            ),
+        ).subquery("participants")
+        query = (
+            select(participants.c.user_id, CalendarEvent)
+            .join(
+                CalendarEvent,
+                or_(
+                    CalendarEvent.id == participants.c.event_id,
+                    CalendarEvent.recurrence_master_id == participants.c.event_id,
+                ),
+            )
+            .where(
+                CalendarEvent.tenant_id == tenant_id,
+                self._busy_in_window(window_start, window_end),
+            )
+        )
+        return list(self.db.execute(query).tuples())
 
-        # Note: This may count some events twice if user is both organizer and attendee
-        # For accurate count, we'd need to use a UNION query, but this is simpler
-        # and the difference is usually negligible
-        return organizer_count + attendee_count
+    def get_resource_busy_events(
+        self,
+        tenant_id: UUID,
+        resource_ids: list[UUID],
+        window_start: datetime,
+        window_end: datetime,
+    ) -> list[tuple[UUID, CalendarEvent]]:
+        """Get (resource_id, event) pairs of events booking resources in a window."""
+        if not resource_ids:
+            return []
+        query = (
+            select(EventResource.resource_id, CalendarEvent)
+            .join(
+                CalendarEvent,
+                or_(
+                    CalendarEvent.id == EventResource.event_id,
+                    CalendarEvent.recurrence_master_id == EventResource.event_id,
+                ),
+            )
+            .where(
+                EventResource.tenant_id == tenant_id,
+                EventResource.resource_id.in_(resource_ids),
+                self._busy_in_window(window_start, window_end),
+            )
+        )
+        return list(self.db.execute(query).tuples())
 
     def update_event(self, event: CalendarEvent, event_data: dict) -> CalendarEvent:
         """Update event."""
@@ -349,13 +574,53 @@ def get_pending_reminders(
             .join(CalendarEvent)
             .filter(
                 EventReminder.tenant_id == tenant_id,
-                not EventReminder.is_sent,
-                CalendarEvent.start_time <= before_time,
+                EventReminder.is_sent.is_(False),
+                REMINDER_DUE_AT <= before_time,
                 CalendarEvent.status != "cancelled",
             )
             .all()
         )
 
+    def claim_due_reminders(self, now: datetime, limit: int) -> list[EventReminder]:
+        """Lock a batch of due, unsent reminders of all tenants, earliest first.
+
+        Uses SELECT ... FOR UPDATE OF event_reminders SKIP LOCKED so several
+        workers share the reminders; events are loaded in the same query and
+        their attendees with one more. Reminders of cancelled events are
+        included so the caller can retire them. The rows stay locked until
+        the caller commits or rolls back.
+        """
+        horizon = now + timedelta(minutes=REMINDER_MAX_MINUTES_BEFORE)
+        return list(
+            self.db.scalars(
+                select(EventReminder)
+                .join(EventReminder.event)
+                .where(
+                    EventReminder.is_sent.is_(False),
+                    CalendarEvent.start_time <= horizon,
+                    REMINDER_DUE_AT <= now,
+                )
+                .order_by(REMINDER_DUE_AT)
+                .limit(limit)
+                .with_for_update(of=EventReminder, skip_locked=True)
+                .options(
+                    contains_eager(EventReminder.event).selectinload(
+                        CalendarEvent.attendees
+                    )
+                )
+            )
+        )
+
+    def mark_reminders_sent(self, reminder_ids: list[UUID], sent_at: datetime) -> None:
+        """Mark reminders sent in bulk (the caller commits)."""
+        if reminder_ids:
+            self.db.execute(
+                update(EventReminder)
+                .where(EventReminder.id.in_(reminder_ids))
+                .values(is_sent=True, sent_at=sent_at)
+                .execution_options(synchronize_session=False)
+            )
+
     def update_reminder(
         self, reminder: EventReminder, reminder_data: dict
     ) -> EventReminder:
@@ -4,8 +4,16 @@
 
 from sqlalchemy.orm import Session
 
+from app.core.search.text_search import SearchCursor, TextSearch
 from app.models.comment import Comment, CommentAttachment, CommentMention
 
+COMMENT_SEARCH = TextSearch(
+    Comment.search_vector,
+    Comment.content,
+    created_at=Comment.created_at,
+    id_column=Comment.id,
+)
+
 
 class CommentRepository:
     """Repository for comment data access."""
@@ -65,6 +73,66 @@ def get_comment_thread(
 
         return query.order_by(Comment.created_at.asc()).all()
 
+    def _search_filtered(
+        self,
+        query,
+        tenant_id: UUID,
+        entity_type: str | None,
+        entity_id: UUID | None,
+        include_deleted: bool,
+    ):
+        """Restrict a comment query to a tenant and optional entity."""
+        query = query.filter(Comment.tenant_id == tenant_id)
+        if entity_type:
+            query = query.filter(Comment.entity_type == entity_type)
+        if entity_id:
+            query = query.filter(Comment.entity_id == entity_id)
+        if not include_deleted:
+            query = query.filter(Comment.is_deleted.is_(False))
+        return query
+
+    def search_comments(
+        self,
+        tenant_id: UUID,
+        query_text: str,
+        entity_type: str | None = None,
+        entity_id: UUID | None = None,
+        include_deleted: bool = False,
+        skip: int = 0,
+        limit: int = 100,
+        after: SearchCursor | None = None,
+    ) -> list[tuple[Comment, float]]:
+        """Search comments by content, returning (comment, rank) pairs.
+
+        Results are most relevant first. Pass the (rank, created_at, id) of
+        the last result as after to read the next page by keyset.
+        """
+        query = self._search_filtered(
+            self.db.query(Comment), tenant_id, entity_type, entity_id, include_deleted
+        )
+        query = COMMENT_SEARCH.ranked(query, query_text, after)
+        return [tuple(row) for row in query.offset(skip).limit(limit).all()]
+
+    def count_search_comments(
+        self,
+        tenant_id: UUID,
+        query_text: str,
+        entity_type: str | None = None,
+        entity_id: UUID | None = None,
+        include_deleted: bool = False,
+    ) -> int:
+        """Count comments matching search text."""
+        from sqlalchemy import func
+
+        query = self._search_filtered(
+            self.db.query(func.count(Comment.id)),
+            tenant_id,
+            entity_type,
+            entity_id,
+            include_deleted,
+        )
+        return query.filter(COMMENT_SEARCH.matches(query_text)).scalar() or 0
+
     def update_comment(self, comment: Comment, comment_data: dict) -> Comment:
         """Update comment."""
         for key, value in comment_data.items():
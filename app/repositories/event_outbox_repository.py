@@ -0,0 +1,69 @@
+"""Event outbox repository for data access operations."""
+
+from datetime import datetime
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.orm import Session
+
+from app.models.event_outbox import EventOutbox
+
+# Advisory lock held by the relay draining the outbox, so a single relay
+# publishes at a time and events reach their streams in id order
+RELAY_LOCK_KEY = 0x6F7574626F78  # "outbox"
+
+
+class EventOutboxRepository:
+    """Repository for the event outbox.
+
+    Write methods never commit: events are appended in the transaction of
+    the change they describe, and the relay commits its own batches.
+    """
+
+    def __init__(self, db: Session):
+        """Initialize repository with database session."""
+        self.db = db
+
+    def add(self, entry_data: dict) -> EventOutbox:
+        """Append an event to the outbox."""
+        entry = EventOutbox(**entry_data)
+        self.db.add(entry)
+        return entry
+
+    def try_lock_relay(self) -> bool:
+        """Take the relay lock until the transaction ends, if no relay holds it."""
+        return bool(
+            self.db.scalar(select(func.pg_try_advisory_xact_lock(RELAY_LOCK_KEY)))
+        )
+
+    def get_pending(self, limit: int) -> list[EventOutbox]:
+        """Get the oldest pending events, in id order."""
+        return list(
+            self.db.scalars(select(EventOutbox).order_by(EventOutbox.id).limit(limit))
+        )
+
+    def delete_published(self, ids: list[int]) -> None:
+        """Delete events that were published."""
+        self.db.execute(
+            delete(EventOutbox)
+            .where(EventOutbox.id.in_(ids))
+            .execution_options(synchronize_session=False)
+        )
+
+    def record_failure(self, ids: list[int], error: str) -> None:
+        """Count a failed publication attempt on events."""
+        self.db.execute(
+            update(EventOutbox)
+            .where(EventOutbox.id.in_(ids))
+            .values(attempts=EventOutbox.attempts + 1, last_error=error[:1000])
+            .execution_options(synchronize_session=False)
+        )
+
+    def get_oldest_created_at(self) -> datetime | None:
+        """Get the creation time of the oldest pending event."""
+        return self.db.scalar(
+            select(EventOutbox.created_at).order_by(EventOutbox.id).limit(1)
+        )
+
+    def count_pending(self) -> int:
+        """Count pending events."""
+        return self.db.scalar(select(func.count()).select_from(EventOutbox)) or 0
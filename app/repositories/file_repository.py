@@ -1,11 +1,14 @@
 """File repository for data access operations."""
 
+from datetime import datetime
 from uuid import UUID
 
+from sqlalchemy import delete, func
 from sqlalchemy.orm import Session
 
 from app.models.file import File, FilePermission, FileVersion
 from app.models.tag import EntityTag
+from app.repositories.file_usage_repository import USAGE_FIELDS, FileUsageRepository
 
 
 class FileRepository:
@@ -14,6 +17,7 @@ class FileRepository:
     def __init__(self, db: Session):
         """Initialize repository with database session."""
         self.db = db
+        self.usage = FileUsageRepository(db)
 
     # File operations
     def create(self, file_data: dict) -> File:
@@ -34,6 +38,9 @@ def create(self, file_data: dict) -> File:
             self.db.flush()
             logger.debug(f"File flushed to DB: {file.id}")
 
+            if file.is_current and file.deleted_at is None:
+                self.usage.apply_file_delta(file, 1)
+
             self.db.commit()
             logger.info(
                 f"File committed successfully in DB: {file.id} (name: {file_data.get('name', 'unknown')})"
@@ -244,12 +251,21 @@ def count_all(
         return query.scalar() or 0
 
     def update(self, file_id: UUID, tenant_id: UUID, file_data: dict) -> File | None:
-        """Update a file."""
+        """Update a file, moving its usage to new scopes (e.g. another folder)."""
         file = self.get_by_id(file_id, tenant_id)
         if not file:
             return None
+        rescoped = any(
+            getattr(file, key) != value
+            for key, value in file_data.items()
+            if key in USAGE_FIELDS
+        )
+        if rescoped:
+            self.usage.apply_file_delta(file, -1)
         for key, value in file_data.items():
             setattr(file, key, value)
+        if rescoped:
+            self.usage.apply_file_delta(file, 1)
         self.db.commit()
         self.db.refresh(file)
         return file
@@ -263,6 +279,7 @@ def delete(self, file_id: UUID, tenant_id: UUID) -> bool:
             return False
         file.is_current = False
         file.deleted_at = datetime.now(UTC)
+        self.usage.apply_file_delta(file, -1)
         self.db.commit()
         return True
 
@@ -271,6 +288,11 @@ def create_version(self, version_data: dict) -> FileVersion:
         """Create a new file version."""
         version = FileVersion(**version_data)
         self.db.add(version)
+        self.usage.apply_version_delta(
+            version.tenant_id,
+            1,
+            (version.size or 0) if version.version_number > 1 else 0,
+        )
         self.db.commit()
         self.db.refresh(version)
         return version
@@ -373,6 +395,7 @@ def restore(self, file_id: UUID, tenant_id: UUID) -> bool:
             return False  # Already restored or never deleted
         file.is_current = True
         file.deleted_at = None
+        self.usage.apply_file_delta(file, 1)
         self.db.commit()
         return True
 
@@ -392,3 +415,84 @@ def get_deleted_files_for_cleanup(
             )
             .all()
         )
+
+    def get_deleted_files_batch(
+        self,
+        tenant_id: UUID,
+        cutoff_date: datetime,
+        after_id: UUID | None = None,
+        limit: int = 500,
+    ) -> list:
+        """Get a keyset-paginated batch of files deleted before cutoff_date.
+
+        Only the columns needed for cleanup are loaded, ordered by ID so the
+        next batch can continue from the last ID of the previous one.
+        """
+        query = self.db.query(File.id, File.name, File.size, File.storage_path).filter(
+            File.tenant_id == tenant_id,
+            File.deleted_at.isnot(None),
+            File.deleted_at < cutoff_date,
+        )
+        if after_id is not None:
+            query = query.filter(File.id > after_id)
+        return query.order_by(File.id).limit(limit).all()
+
+    def get_version_storage_paths(
+        self, file_ids: list[UUID], tenant_id: UUID
+    ) -> dict[UUID, list[str]]:
+        """Get storage paths of all versions for several files in one query."""
+        paths: dict[UUID, list[str]] = {}
+        if not file_ids:
+            return paths
+        rows = (
+            self.db.query(FileVersion.file_id, FileVersion.storage_path)
+            .filter(
+                FileVersion.file_id.in_(file_ids),
+                FileVersion.tenant_id == tenant_id,
+            )
+            .all()
+        )
+        for file_id, storage_path in rows:
+            paths.setdefault(file_id, []).append(storage_path)
+        return paths
+
+    def hard_delete_files(self, file_ids: list[UUID], tenant_id: UUID) -> list[UUID]:
+        """Hard delete soft-deleted files in bulk (versions and permissions cascade).
+
+        Files restored in the meantime are skipped. The caller commits.
+
+        Returns:
+            IDs of the deleted files
+        """
+        if not file_ids:
+            return []
+        # Versions go away with the rows; soft-deleted files were already
+        # removed from the file counters when they were deleted
+        version_count, version_size = (
+            self.db.query(
+                func.count(FileVersion.id),
+                func.coalesce(
+                    func.sum(FileVersion.size).filter(FileVersion.version_number > 1),
+                    0,
+                ),
+            )
+            .join(File, File.id == FileVersion.file_id)
+            .filter(
+                File.id.in_(file_ids),
+                File.tenant_id == tenant_id,
+                File.deleted_at.isnot(None),
+            )
+            .one()
+        )
+        self.usage.apply_version_delta(tenant_id, -version_count, -int(version_size))
+        result = self.db.execute(
+            delete(File)
+            .where(
+                File.id.in_(file_ids),
+                File.tenant_id == tenant_id,
+                File.deleted_at.isnot(None),
+            )
+            .returning(File.id)
+            .execution_options(synchronize_session=False)
+        )
+        return list(result.scalars())
@@ -0,0 +1,254 @@
+"""File usage counter repository for data access operations."""
+
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
+
+from sqlalchemy import delete, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.file import File, FileUsageCounter, FileUsageScope, FileVersion
+
+# (scope_type, scope_key) -> (file_count, total_size, version_count)
+UsageKey = tuple[str, str]
+UsageValues = tuple[int, int, int]
+
+TENANT_KEY: UsageKey = (FileUsageScope.TENANT.value, "")
+
+# Rows per multi-row INSERT ... ON CONFLICT statement
+UPSERT_CHUNK_SIZE = 1000
+
+
+# File columns that decide a file's scopes or the size it adds to them
+USAGE_FIELDS = frozenset({"size", "mime_type", "entity_type", "entity_id", "folder_id"})
+
+
+def file_usage_keys(file: File) -> list[UsageKey]:
+    """Get the counter scopes a file contributes to."""
+    keys = [TENANT_KEY, (FileUsageScope.MIME_TYPE.value, file.mime_type)]
+    if file.entity_type:
+        keys.append((FileUsageScope.ENTITY_TYPE.value, file.entity_type))
+        if file.entity_id:
+            keys.append(
+                (FileUsageScope.ENTITY.value, f"{file.entity_type}:{file.entity_id}")
+            )
+    if file.folder_id:
+        keys.append((FileUsageScope.FOLDER.value, str(file.folder_id)))
+    return keys
+
+
+class FileUsageRepository:
+    """Repository for file usage counters.
+
+    Write methods never commit: they are meant to run inside the transaction
+    that changes the file rows, so counters and files commit together.
+    """
+
+    def __init__(self, db: Session):
+        """Initialize repository with database session."""
+        self.db = db
+
+    def apply_file_delta(self, file: File, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) a current file from its scopes."""
+        delta = (sign, sign * (file.size or 0), 0)
+        self.apply_deltas(file.tenant_id, dict.fromkeys(file_usage_keys(file), delta))
+
+    def apply_version_delta(self, tenant_id: UUID, count: int, size: int = 0) -> None:
+        """Add or remove stored versions (and their extra bytes) from the tenant.
+
+        size only covers versions after the first: version 1 shares the
+        file's storage, which the file's own size already counts.
+        """
+        if count or size:
+            self.apply_deltas(tenant_id, {TENANT_KEY: (0, size, count)})
+
+    def apply_deltas(
+        self, tenant_id: UUID, deltas: dict[UsageKey, UsageValues]
+    ) -> None:
+        """Increment counters with a single INSERT ... ON CONFLICT DO UPDATE.
+
+        The tenant row is always written first so concurrent writers (and the
+        reconciliation job, which locks it) take row locks in the same order.
+        """
+        self._upsert(tenant_id, deltas, increment=True)
+
+    def get_counter(
+        self,
+        tenant_id: UUID,
+        scope_type: FileUsageScope = FileUsageScope.TENANT,
+        scope_key: str = "",
+    ) -> FileUsageCounter | None:
+        """Get one counter by its unique key."""
+        return (
+            self.db.query(FileUsageCounter)
+            .filter(
+                FileUsageCounter.tenant_id == tenant_id,
+                FileUsageCounter.scope_type == scope_type.value,
+                FileUsageCounter.scope_key == scope_key,
+            )
+            .first()
+        )
+
+    def get_distribution(
+        self, tenant_id: UUID, scope_type: FileUsageScope
+    ) -> dict[str, int]:
+        """Get file counts per key for a scope type, skipping empty counters."""
+        rows = (
+            self.db.query(FileUsageCounter.scope_key, FileUsageCounter.file_count)
+            .filter(
+                FileUsageCounter.tenant_id == tenant_id,
+                FileUsageCounter.scope_type == scope_type.value,
+                FileUsageCounter.file_count > 0,
+            )
+            .all()
+        )
+        return {scope_key: file_count for scope_key, file_count in rows}
+
+    def get_all_usage(self, tenant_id: UUID) -> dict[UsageKey, UsageValues]:
+        """Get all counters of a tenant."""
+        rows = (
+            self.db.query(
+                FileUsageCounter.scope_type,
+                FileUsageCounter.scope_key,
+                FileUsageCounter.file_count,
+                FileUsageCounter.total_size,
+                FileUsageCounter.version_count,
+            )
+            .filter(FileUsageCounter.tenant_id == tenant_id)
+            .all()
+        )
+        return {
+            (scope_type, scope_key): (file_count, total_size, version_count)
+            for scope_type, scope_key, file_count, total_size, version_count in rows
+        }
+
+    def compute_usage(self, tenant_id: UUID) -> dict[UsageKey, UsageValues]:
+        """Recompute all counters of a tenant from the files table."""
+        current = (
+            File.tenant_id == tenant_id,
+            File.is_current,
+            File.deleted_at.is_(None),
+        )
+        size = func.coalesce(func.sum(File.size), 0)
+        usage: dict[UsageKey, UsageValues] = {}
+
+        file_count, total_size = (
+            self.db.query(func.count(File.id), size).filter(*current).one()
+        )
+        version_count, version_size = (
+            self.db.query(
+                func.count(FileVersion.id),
+                func.coalesce(
+                    func.sum(FileVersion.size).filter(FileVersion.version_number > 1),
+                    0,
+                ),
+            )
+            .filter(FileVersion.tenant_id == tenant_id)
+            .one()
+        )
+        usage[TENANT_KEY] = (
+            file_count,
+            int(total_size) + int(version_size),
+            version_count,
+        )
+
+        grouped = [
+            (FileUsageScope.MIME_TYPE, (File.mime_type,), ()),
+            (
+                FileUsageScope.ENTITY_TYPE,
+                (File.entity_type,),
+                (File.entity_type.isnot(None),),
+            ),
+            (
+                FileUsageScope.ENTITY,
+                (File.entity_type, File.entity_id),
+                (File.entity_type.isnot(None), File.entity_id.isnot(None)),
+            ),
+            (FileUsageScope.FOLDER, (File.folder_id,), (File.folder_id.isnot(None),)),
+        ]
+        for scope_type, columns, filters in grouped:
+            rows = (
+                self.db.query(*columns, func.count(File.id), size)
+                .filter(*current, *filters)
+                .group_by(*columns)
+                .all()
+            )
+            for row in rows:
+                *key_parts, count, scope_size = row
+                scope_key = ":".join(str(part) for part in key_parts)
+                usage[(scope_type.value, scope_key)] = (count, int(scope_size), 0)
+        return usage
+
+    def lock_tenant(self, tenant_id: UUID) -> None:
+        """Lock the tenant counter row (creating it) until the transaction ends.
+
+        Every write touches the tenant row first, so holding this lock keeps
+        writers out while the counters are being recomputed.
+        """
+        self.apply_deltas(tenant_id, {TENANT_KEY: (0, 0, 0)})
+
+    def replace_usage(
+        self, tenant_id: UUID, usage: dict[UsageKey, UsageValues]
+    ) -> None:
+        """Overwrite a tenant's counters and drop counters no longer in use."""
+        now = self._upsert(tenant_id, usage, increment=False)
+        self.db.execute(
+            delete(FileUsageCounter)
+            .where(
+                FileUsageCounter.tenant_id == tenant_id,
+                FileUsageCounter.scope_type != FileUsageScope.TENANT.value,
+                FileUsageCounter.updated_at < now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    def _upsert(
+        self,
+        tenant_id: UUID,
+        values: dict[UsageKey, UsageValues],
+        increment: bool,
+    ) -> datetime:
+        """Upsert counter rows in chunks, tenant row first.
+
+        Args:
+            tenant_id: Tenant ID
+            values: Counter values per scope
+            increment: Add values to existing counters instead of replacing them
+
+        Returns:
+            The updated_at timestamp written to every row
+        """
+        now = datetime.now(UTC)
+        keys = sorted(values, key=lambda key: (key != TENANT_KEY, key))
+        rows = [
+            {
+                "id": uuid4(),
+                "tenant_id": tenant_id,
+                "scope_type": key[0],
+                "scope_key": key[1],
+                "file_count": values[key][0],
+                "total_size": values[key][1],
+                "version_count": values[key][2],
+                "updated_at": now,
+            }
+            for key in keys
+        ]
+        for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+            stmt = insert(FileUsageCounter).values(
+                rows[start : start + UPSERT_CHUNK_SIZE]
+            )
+            counters = ("file_count", "total_size", "version_count")
+            if increment:
+                set_ = {
+                    name: getattr(FileUsageCounter, name) + stmt.excluded[name]
+                    for name in counters
+                }
+            else:
+                set_ = {name: stmt.excluded[name] for name in counters}
+            set_["updated_at"] = stmt.excluded.updated_at
+            self.db.execute(
+                stmt.on_conflict_do_update(
+                    constraint="uq_file_usage_counters_scope", set_=set_
+                )
+            )
+        return now
@@ -1,8 +1,10 @@
 """Integration repository for data access operations."""
 
+from datetime import datetime
 from typing import Any
 from uuid import UUID
 
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
 from app.models.integration import (
@@ -204,3 +206,96 @@ def update_delivery(
         self.db.commit()
         self.db.refresh(delivery)
         return delivery
+
+    def create_deliveries(self, items: list[dict[str, Any]]) -> list[WebhookDelivery]:
+        """Create several webhook delivery records in one transaction.
+
+        Args:
+            items: Delivery data dictionaries (see create_delivery)
+
+        Returns:
+            List of WebhookDelivery objects
+        """
+        deliveries = [
+            WebhookDelivery(
+                webhook_id=data["webhook_id"],
+                tenant_id=data["tenant_id"],
+                status=data.get("status", WebhookStatus.PENDING.value),
+                event_type=data["event_type"],
+                payload=data["payload"],
+            )
+            for data in items
+        ]
+        if deliveries:
+            self.db.add_all(deliveries)
+            self.db.commit()
+        return deliveries
+
+    def claim_due_deliveries(self, limit: int, now: datetime) -> list[WebhookDelivery]:
+        """Lock a batch of pending deliveries that are due, oldest first.
+
+        Uses SELECT ... FOR UPDATE SKIP LOCKED so several dispatchers can work
+        the queue concurrently. The rows stay locked until the caller commits
+        or rolls back.
+
+        Args:
+            limit: Maximum number of deliveries
+            now: Reference time for next_retry_at
+
+        Returns:
+            List of locked WebhookDelivery objects
+        """
+        return (
+            self.db.query(WebhookDelivery)
+            .filter(
+                WebhookDelivery.status == WebhookStatus.PENDING.value,
+                or_(
+                    WebhookDelivery.next_retry_at.is_(None),
+                    WebhookDelivery.next_retry_at <= now,
+                ),
+            )
+            .order_by(WebhookDelivery.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+
+    def get_webhooks_by_ids(self, webhook_ids: list[UUID]) -> dict[UUID, Webhook]:
+        """Get webhooks by ID in one query.
+
+        Args:
+            webhook_ids: Webhook IDs
+
+        Returns:
+            Dictionary mapping webhook ID to Webhook
+        """
+        if not webhook_ids:
+            return {}
+        webhooks = self.db.query(Webhook).filter(Webhook.id.in_(webhook_ids)).all()
+        return {webhook.id: webhook for webhook in webhooks}
+
+    def requeue_failed_deliveries(self, tenant_id: UUID) -> int:
+        """Move a tenant's failed deliveries back to the queue.
+
+        Args:
+            tenant_id: Tenant ID
+
+        Returns:
+            Number of deliveries requeued
+        """
+        count = (
+            self.db.query(WebhookDelivery)
+            .filter(
+                WebhookDelivery.tenant_id == tenant_id,
+                WebhookDelivery.status == WebhookStatus.FAILED.value,
+            )
+            .update(
+                {
+                    WebhookDelivery.status: WebhookStatus.PENDING.value,
+                    WebhookDelivery.next_retry_at: None,
+                },
+                synchronize_session=False,
+            )
+        )
+        self.db.commit()
+        return count
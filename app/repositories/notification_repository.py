@@ -1,10 +1,16 @@
 """Notification repository for data access operations."""
 
+from datetime import datetime
 from uuid import UUID
 
+from sqlalchemy import case, func, update
 from sqlalchemy.orm import Session
 
-from app.models.notification import NotificationQueue, NotificationTemplate
+from app.models.notification import (
+    NotificationQueue,
+    NotificationStatus,
+    NotificationTemplate,
+)
 
 
 class NotificationRepository:
@@ -38,6 +44,17 @@ def get_template(
             .first()
         )
 
+    def get_active_templates(self, tenant_id: UUID) -> list[NotificationTemplate]:
+        """Get all active templates for a tenant."""
+        return (
+            self.db.query(NotificationTemplate)
+            .filter(
+                NotificationTemplate.tenant_id == tenant_id,
+                NotificationTemplate.is_active,
+            )
+            .all()
+        )
+
     def get_all_templates(
         self, tenant_id: UUID, event_type: str | None = None
     ) -> list[NotificationTemplate]:
@@ -105,6 +122,23 @@ def create_queue_entry(self, queue_data: dict) -> NotificationQueue:
         self.db.refresh(queue_entry)
         return queue_entry
 
+    def create_queue_entries(
+        self, entries_data: list[dict], commit: bool = True
+    ) -> list[NotificationQueue]:
+        """Create several queue entries in one transaction.
+
+        With commit=False the entries are only flushed, so they are written
+        (or rolled back) together with the caller's other changes.
+        """
+        entries = [NotificationQueue(**data) for data in entries_data]
+        if entries:
+            self.db.add_all(entries)
+            if commit:
+                self.db.commit()
+            else:
+                self.db.flush()
+        return entries
+
     def get_queue_entries(
         self,
         tenant_id: UUID,
@@ -149,6 +183,115 @@ def get_queue_entry_by_id(
             .first()
         )
 
+    def claim_pending_batch(
+        self, limit: int = 200, channels: list[str] | None = None
+    ) -> list[NotificationQueue]:
+        """Lock a batch of pending queue entries, oldest first.
+
+        Uses SELECT ... FOR UPDATE SKIP LOCKED so several dispatchers can work
+        the queue concurrently without picking the same entries. The rows stay
+        locked until the caller commits or rolls back.
+        """
+        query = self.db.query(NotificationQueue).filter(
+            NotificationQueue.status == NotificationStatus.PENDING
+        )
+        if channels:
+            query = query.filter(NotificationQueue.channel.in_(channels))
+        return (
+            query.order_by(NotificationQueue.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+
+    def get_coalescing_groups(self) -> list[tuple]:
+        """Get coalescing entries grouped by recipient, channel and event type.
+
+        Returns:
+            Rows of (tenant_id, recipient_id, channel, event_type, deliver_after)
+            where deliver_after is the earliest in the group
+        """
+        return (
+            self.db.query(
+                NotificationQueue.tenant_id,
+                NotificationQueue.recipient_id,
+                NotificationQueue.channel,
+                NotificationQueue.event_type,
+                func.min(NotificationQueue.deliver_after),
+            )
+            .filter(NotificationQueue.status == NotificationStatus.COALESCING)
+            .group_by(
+                NotificationQueue.tenant_id,
+                NotificationQueue.recipient_id,
+                NotificationQueue.channel,
+                NotificationQueue.event_type,
+            )
+            .all()
+        )
+
+    def lock_coalescing_entries(
+        self,
+        tenant_id: UUID,
+        recipient_id: UUID,
+        channel: str,
+        event_types: list[str],
+    ) -> list[NotificationQueue]:
+        """Lock a recipient's coalescing entries, oldest first.
+
+        Entries locked by another coalescer are skipped.
+        """
+        return (
+            self.db.query(NotificationQueue)
+            .filter(
+                NotificationQueue.tenant_id == tenant_id,
+                NotificationQueue.recipient_id == recipient_id,
+                NotificationQueue.channel == channel,
+                NotificationQueue.event_type.in_(event_types),
+                NotificationQueue.status == NotificationStatus.COALESCING,
+            )
+            .order_by(NotificationQueue.created_at)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+
+    def get_templates_by_ids(
+        self, template_ids: list[UUID]
+    ) -> dict[UUID, NotificationTemplate]:
+        """Get several templates in one query."""
+        if not template_ids:
+            return {}
+        templates = (
+            self.db.query(NotificationTemplate)
+            .filter(NotificationTemplate.id.in_(template_ids))
+            .all()
+        )
+        return {template.id: template for template in templates}
+
+    def update_statuses(
+        self,
+        sent_ids: list[UUID],
+        failed: dict[UUID, str],
+        sent_at: datetime,
+    ) -> None:
+        """Mark queue entries sent or failed in bulk (the caller commits)."""
+        if sent_ids:
+            self.db.execute(
+                update(NotificationQueue)
+                .where(NotificationQueue.id.in_(sent_ids))
+                .values(status=NotificationStatus.SENT, sent_at=sent_at)
+                .execution_options(synchronize_session=False)
+            )
+        if failed:
+            self.db.execute(
+                update(NotificationQueue)
+                .where(NotificationQueue.id.in_(list(failed)))
+                .values(
+                    status=NotificationStatus.FAILED,
+                    error_message=case(failed, value=NotificationQueue.id),
+                )
+                .execution_options(synchronize_session=False)
+            )
+
     def get_unread_notifications(
         self,
         tenant_id: UUID,
@@ -165,15 +308,18 @@ def get_unread_notifications(
             limit: Maximum number of notifications to return
 
         Returns:
-            List of NotificationQueue entries with status 'pending' or 'sent'
+            List of NotificationQueue entries with status 'pending', 'sending'
+            or 'sent'
         """
-        from app.models.notification import NotificationStatus
-
         query = self.db.query(NotificationQueue).filter(
             NotificationQueue.tenant_id == tenant_id,
             NotificationQueue.recipient_id == user_id,
             NotificationQueue.status.in_(
-                [NotificationStatus.PENDING, NotificationStatus.SENT]
+                [
+                    NotificationStatus.PENDING,
+                    NotificationStatus.SENDING,
+                    NotificationStatus.SENT,
+                ]
             ),
         )
 
@@ -5,6 +5,7 @@
 
 from sqlalchemy.orm import Session
 
+from app.models.module_role import ModuleRole
 from app.models.preference import (
     Dashboard,
     OrgPreference,
@@ -82,6 +83,23 @@ def delete_user_preference(
         self.db.commit()
         return True
 
+    def get_user_preferences_for_users(
+        self, user_ids: list[UUID], tenant_id: UUID, preference_type: str, key: str
+    ) -> list[UserPreference]:
+        """Get one user preference for several users."""
+        if not user_ids:
+            return []
+        return (
+            self.db.query(UserPreference)
+            .filter(
+                UserPreference.user_id.in_(user_ids),
+                UserPreference.tenant_id == tenant_id,
+                UserPreference.preference_type == preference_type,
+                UserPreference.key == key,
+            )
+            .all()
+        )
+
     # OrgPreference operations
     def get_org_preference(
         self, tenant_id: UUID, preference_type: str, key: str
@@ -157,6 +175,29 @@ def get_all_role_preferences(
             query = query.filter(RolePreference.preference_type == preference_type)
         return query.all()
 
+    def get_role_preferences_for_users(
+        self, user_ids: list[UUID], tenant_id: UUID, preference_type: str, key: str
+    ) -> list[tuple[UUID, Any]]:
+        """Get one role preference for the roles of several users.
+
+        Returns:
+            (user_id, value) rows, oldest preference first
+        """
+        if not user_ids:
+            return []
+        return (
+            self.db.query(ModuleRole.user_id, RolePreference.value)
+            .join(ModuleRole, RolePreference.role_id == ModuleRole.id)
+            .filter(
+                ModuleRole.user_id.in_(user_ids),
+                RolePreference.tenant_id == tenant_id,
+                RolePreference.preference_type == preference_type,
+                RolePreference.key == key,
+            )
+            .order_by(RolePreference.created_at)
+            .all()
+        )
+
     def create_or_update_role_preference(
         self, role_id: UUID, tenant_id: UUID, preference_type: str, key: str, value: Any
     ) -> RolePreference:
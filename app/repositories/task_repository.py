@@ -1,12 +1,11 @@
 """Task repository for data access operations."""
 
-import json
 import logging
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import or_
-from sqlalchemy.orm import Session
+from sqlalchemy import func, or_, select, tuple_, update
+from sqlalchemy.orm import Session, contains_eager
 
 from app.models.task import (
     Task,
@@ -14,10 +13,15 @@
     TaskChecklistItem,
     TaskRecurrence,
     TaskReminder,
+    TaskVisibility,
     Workflow,
     WorkflowExecution,
     WorkflowStep,
 )
+from app.repositories.task_visibility_repository import (
+    PROJECTED_FIELDS,
+    TaskVisibilityRepository,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -28,12 +32,15 @@ class TaskRepository:
     def __init__(self, db: Session):
         """Initialize repository with database session."""
         self.db = db
+        self.visibility = TaskVisibilityRepository(db)
 
     # Task operations
     def create_task(self, task_data: dict) -> Task:
         """Create a new task."""
         task = Task(**task_data)
         self.db.add(task)
+        self.db.flush()
+        self.visibility.refresh_tasks(task.tenant_id, [task.id])
         self.db.commit()
         self.db.refresh(task)
         return task
@@ -167,6 +174,9 @@ def update_task(
             return None
         for key, value in task_data.items():
             setattr(task, key, value)
+        if PROJECTED_FIELDS.intersection(task_data):
+            self.db.flush()
+            self.visibility.refresh_tasks(tenant_id, [task_id])
         self.db.commit()
         self.db.refresh(task)
         return task
@@ -253,6 +263,8 @@ def create_assignment(
 
         assignment = TaskAssignment(**assignment_data_with_audit)
         self.db.add(assignment)
+        self.db.flush()
+        self.visibility.refresh_tasks(assignment.tenant_id, [assignment.task_id])
         self.db.commit()
         self.db.refresh(assignment)
         return assignment
@@ -304,6 +316,8 @@ def delete_assignment(self, assignment_id: UUID, tenant_id: UUID) -> bool:
         if not assignment:
             return False
         self.db.delete(assignment)
+        self.db.flush()
+        self.visibility.refresh_tasks(tenant_id, [assignment.task_id])
         self.db.commit()
         return True
 
@@ -328,6 +342,8 @@ def update_assignment(
         for key, value in assignment_data_with_audit.items():
             setattr(assignment, key, value)
 
+        self.db.flush()
+        self.visibility.refresh_tasks(tenant_id, [assignment.task_id])
         self.db.commit()
         self.db.refresh(assignment)
         return assignment
@@ -357,192 +373,45 @@ def get_visible_tasks(
         priority: str | None = None,
         skip: int = 0,
         limit: int = 100,
+        after: tuple[datetime, UUID] | None = None,
     ) -> list[Task]:
-        """Get tasks visible to a user according to visibility rules - Optimized version with cache."""
-        from sqlalchemy import and_, or_
-        from sqlalchemy.orm import aliased
+        """Get tasks visible to a user, newest first.
 
-        # Cache disabled temporarily to avoid asyncio issues
-        # TODO: Fix async cache implementation
+        Reads the task_visibility projection (creator, assignee, assignments
+        and team memberships), so the page is one index range scan joined to
+        tasks. Callers listing pages should go through
+        TaskService.list_visible_tasks, which caches pages and counts.
 
-        # Use LEFT JOIN instead of subqueries for better performance
-        task_assignment = aliased(TaskAssignment)
+        Args:
+            tenant_id: Tenant ID
+            user_id: User ID
+            status: Optional status filter
+            priority: Optional priority filter
+            skip: Pagination offset
+            limit: Pagination limit
+            after: Keyset cursor, the (created_at, id) of the last task of the
+                previous page; when given, skip is usually 0
 
-        # Optimized query with LEFT JOIN and DISTINCT
+        Returns:
+            List of visible tasks
+        """
         query = (
             self.db.query(Task)
-            .filter(Task.tenant_id == tenant_id)
-            .outerjoin(
-                task_assignment,
-                and_(
-                    task_assignment.task_id == Task.id,
-                    task_assignment.tenant_id == tenant_id,
-                    task_assignment.assigned_to_id == user_id,
-                ),
-            )
-            .filter(
-                or_(
-                    Task.created_by_id == user_id,  # Created by user
-                    Task.assigned_to_id == user_id,  # Legacy direct assignment
-                    task_assignment.id.isnot(None),  # Modern assignment via LEFT JOIN
-                    # TODO: Add group assignments when groups module is available
-                )
-            )
-            .distinct()  # Remove duplicates from LEFT JOIN
+            .join(TaskVisibility, TaskVisibility.task_id == Task.id)
+            .filter(*self._visibility_filters(tenant_id, user_id, status, priority))
         )
-
-        # Apply filters
-        if status:
-            query = query.filter(Task.status == status)
-        if priority:
-            query = query.filter(Task.priority == priority)
-
-        # Execute query and cache results
-        tasks = query.order_by(Task.created_at.desc()).offset(skip).limit(limit).all()
-
-        # Cache disabled temporarily to avoid asyncio issues
-        # TODO: Fix async cache implementation
-        # try:
-        #     from app.core.tasks.cache_service import task_cache_service
-        #     from app.schemas.task import TaskResponse
-        #
-        #     # Convert to TaskResponse for caching
-        #     task_responses = [TaskResponse.model_validate(task) for task in tasks]
-        #
-        #     loop = asyncio.new_event_loop()
-        #     asyncio.set_event_loop(loop)
-        #     try:
-        #         loop.run_until_complete(
-        #             task_cache_service.set_visible_tasks(
-        #                 tenant_id, user_id, task_responses, status, priority, skip, limit
-        #             )
-        #         )
-        #     finally:
-        #         loop.close()
-        # except Exception:
-        #     # Cache failed, but query succeeded
-        #     pass
-
-        return tasks
-
-    def get_visible_tasks_cached(
-        self,
-        tenant_id: UUID,
-        user_id: UUID,
-        status: str | None = None,
-        priority: str | None = None,
-        skip: int = 0,
-        limit: int = 100,
-    ) -> list[Task]:
-        """Get visible tasks with caching support - Safe wrapper around get_visible_tasks."""
-        import os
-
-        # Feature flag para activar/desactivar cache
-        enable_cache = os.getenv("ENABLE_TASKS_CACHE", "false").lower() == "true"
-
-        if not enable_cache:
-            # Cache desactivado, usar método original
-            return self.get_visible_tasks(
-                tenant_id=tenant_id,
-                user_id=user_id,
-                status=status,
-                priority=priority,
-                skip=skip,
-                limit=limit,
+        if after is not None:
+            query = query.filter(
+                tuple_(TaskVisibility.task_created_at, TaskVisibility.task_id)
+                < tuple_(*after)
             )
-
-        # Generar cache key único
-        cache_key = f"visible_tasks:{tenant_id}:{user_id}:{status or 'all'}:{priority or 'all'}:{skip}:{limit}"
-
-        try:
-            # Intentar obtener desde Redis cache
-            from app.core.cache.redis_client import get_redis_client
-
-            redis_client = get_redis_client()
-
-            cached_data = redis_client.get(cache_key)
-            if cached_data:
-                # Deserializar y convertir a Task objects
-                cached_tasks = json.loads(cached_data)
-                tasks = [self._dict_to_task(task_dict) for task_dict in cached_tasks]
-                logger.debug(f"Cache hit for {cache_key}: {len(tasks)} tasks")
-                return tasks
-
-        except Exception as e:
-            # Error al leer cache, continuar con query normal
-            logger.warning(f"Cache read failed for {cache_key}: {e}")
-
-        # Ejecutar query normal
-        start_time = datetime.now()
-        tasks = self.get_visible_tasks(
-            tenant_id=tenant_id,
-            user_id=user_id,
-            status=status,
-            priority=priority,
-            skip=skip,
-            limit=limit,
-        )
-        query_time = (datetime.now() - start_time).total_seconds()
-
-        # Guardar en cache si la query tomó más de 100ms
-        if query_time > 0.1:
-            try:
-                # Serializar tasks para cache
-                tasks_data = [self._task_to_dict(task) for task in tasks]
-                redis_client.setex(cache_key, 300, json.dumps(tasks_data))  # 5 min TTL
-                logger.debug(
-                    f"Cached {cache_key}: {len(tasks)} tasks (query took {query_time:.2f}s)"
-                )
-            except Exception as e:
-                # Error al guardar cache, no es crítico
-                logger.warning(f"Cache write failed for {cache_key}: {e}")
-
-        return tasks
-
-    def _task_to_dict(self, task: Task) -> dict:
-        """Convert Task model to dict for caching."""
-        return {
-            "id": str(task.id),
-            "tenant_id": str(task.tenant_id),
-            "title": task.title,
-            "description": task.description,
-            "status": task.status,
-            "priority": task.priority,
-            "assigned_to_id": str(task.assigned_to_id) if task.assigned_to_id else None,
-            "due_date": task.due_date.isoformat() if task.due_date else None,
-            "created_by_id": str(task.created_by_id),
-            "completed_at": (
-                task.completed_at.isoformat() if task.completed_at else None
-            ),
-            "created_at": task.created_at.isoformat(),
-            "updated_at": task.updated_at.isoformat(),
-        }
-
-    def _dict_to_task(self, data: dict) -> Task:
-        """Convert dict back to Task model."""
-        from datetime import datetime
-
-        return Task(
-            id=UUID(data["id"]),
-            tenant_id=UUID(data["tenant_id"]),
-            title=data["title"],
-            description=data["description"],
-            status=data["status"],
-            priority=data["priority"],
-            assigned_to_id=(
-                UUID(data["assigned_to_id"]) if data["assigned_to_id"] else None
-            ),
-            due_date=(
-                datetime.fromisoformat(data["due_date"]) if data["due_date"] else None
-            ),
-            created_by_id=UUID(data["created_by_id"]),
-            completed_at=(
-                datetime.fromisoformat(data["completed_at"])
-                if data["completed_at"]
-                else None
-            ),
-            created_at=datetime.fromisoformat(data["created_at"]),
-            updated_at=datetime.fromisoformat(data["updated_at"]),
+        return (
+            query.order_by(
+                TaskVisibility.task_created_at.desc(), TaskVisibility.task_id.desc()
+            )
+            .offset(skip)
+            .limit(limit)
+            .all()
         )
 
     def count_visible_tasks(
@@ -552,43 +421,32 @@ def count_visible_tasks(
         status: str | None = None,
         priority: str | None = None,
     ) -> int:
-        """Count tasks visible to a user according to visibility rules - Optimized version."""
-        from sqlalchemy import and_, or_
-        from sqlalchemy.orm import aliased
-
-        # Use LEFT JOIN instead of subqueries for better performance (consistent with get_visible_tasks)
-        task_assignment = aliased(TaskAssignment)
-
-        # Optimized query with LEFT JOIN and DISTINCT
-        query = (
-            self.db.query(Task)
-            .filter(Task.tenant_id == tenant_id)
-            .outerjoin(
-                task_assignment,
-                and_(
-                    task_assignment.task_id == Task.id,
-                    task_assignment.tenant_id == tenant_id,
-                    task_assignment.assigned_to_id == user_id,
-                ),
-            )
-            .filter(
-                or_(
-                    Task.created_by_id == user_id,  # Created by user
-                    Task.assigned_to_id == user_id,  # Legacy direct assignment
-                    task_assignment.id.isnot(None),  # Modern assignment via LEFT JOIN
-                    # TODO: Add group assignments when groups module is available
-                )
+        """Count tasks visible to a user (index-only count over the projection)."""
+        return (
+            self.db.scalar(
+                select(func.count())
+                .select_from(TaskVisibility)
+                .where(*self._visibility_filters(tenant_id, user_id, status, priority))
             )
-            .distinct()  # Remove duplicates from LEFT JOIN
+            or 0
         )
 
-        # Apply filters
+    @staticmethod
+    def _visibility_filters(
+        tenant_id: UUID,
+        user_id: UUID,
+        status: str | None,
+        priority: str | None,
+    ) -> list:
+        filters = [
+            TaskVisibility.tenant_id == tenant_id,
+            TaskVisibility.user_id == user_id,
+        ]
         if status:
-            query = query.filter(Task.status == status)
+            filters.append(TaskVisibility.status == status)
         if priority:
-            query = query.filter(Task.priority == priority)
-
-        return query.count()
+            filters.append(TaskVisibility.priority == priority)
+        return filters
 
     # Reminder operations
     def create_reminder(
@@ -718,6 +576,38 @@ def get_pending_reminders(
 
         return query.order_by(TaskReminder.reminder_time).all()
 
+    def claim_due_reminders(self, now: datetime, limit: int) -> list[TaskReminder]:
+        """Lock a batch of due, unsent reminders of all tenants, earliest first.
+
+        Uses SELECT ... FOR UPDATE OF task_reminders SKIP LOCKED so several
+        workers share the reminders; tasks are loaded in the same query and
+        their assignments with one more. The rows stay locked until the
+        caller commits or rolls back.
+        """
+        return list(
+            self.db.scalars(
+                select(TaskReminder)
+                .join(TaskReminder.task)
+                .where(TaskReminder.sent.is_(False), TaskReminder.reminder_time <= now)
+                .order_by(TaskReminder.reminder_time)
+                .limit(limit)
+                .with_for_update(of=TaskReminder, skip_locked=True)
+                .options(
+                    contains_eager(TaskReminder.task).selectinload(Task.assignments)
+                )
+            )
+        )
+
+    def mark_reminders_sent(self, reminder_ids: list[UUID], sent_at: datetime) -> None:
+        """Mark reminders sent in bulk (the caller commits)."""
+        if reminder_ids:
+            self.db.execute(
+                update(TaskReminder)
+                .where(TaskReminder.id.in_(reminder_ids))
+                .values(sent=True, sent_at=sent_at)
+                .execution_options(synchronize_session=False)
+            )
+
     # Recurrence operations
     def create_recurrence(
         self,
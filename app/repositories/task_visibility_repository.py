@@ -0,0 +1,204 @@
+"""Task visibility projection repository for data access operations."""
+
+from collections.abc import Iterable
+from uuid import UUID
+
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    and_,
+    delete,
+    insert,
+    literal,
+    select,
+    union_all,
+)
+from sqlalchemy.orm import Session
+
+from app.models.task import (
+    Task,
+    TaskAssignment,
+    TaskVisibility,
+    TaskVisibilityReason,
+)
+from app.models.team import TeamMember
+
+# Rank of each reason; the strongest (lowest) one is stored per pair
+REASON_RANKS = {reason: rank for rank, reason in enumerate(TaskVisibilityReason)}
+
+# Task columns copied into the projection
+PROJECTED_FIELDS = frozenset(
+    {"created_by_id", "assigned_to_id", "created_at", "status", "priority"}
+)
+
+
+class TaskVisibilityRepository:
+    """Repository for the task_visibility projection.
+
+    Write methods never commit: they are meant to run inside the transaction
+    that changes tasks, assignments or team members, so the projection and
+    its sources commit together. Every write recomputes the affected rows
+    from the source tables with a single INSERT ... SELECT.
+    """
+
+    def __init__(self, db: Session):
+        """Initialize repository with database session."""
+        self.db = db
+
+    def refresh_tasks(self, tenant_id: UUID, task_ids: Iterable[UUID]) -> None:
+        """Recompute the viewers of tasks."""
+        task_ids = list(set(task_ids))
+        if not task_ids:
+            return
+        self._replace(tenant_id, TaskVisibility.task_id.in_(task_ids), task_ids)
+
+    def refresh_team(
+        self, tenant_id: UUID, team_id: UUID, user_id: UUID | None = None
+    ) -> None:
+        """Recompute the tasks assigned to a team, for one member or all of them."""
+        task_ids = select(TaskAssignment.task_id).where(
+            TaskAssignment.tenant_id == tenant_id,
+            TaskAssignment.assigned_to_group_id == team_id,
+        )
+        condition = TaskVisibility.task_id.in_(task_ids)
+        if user_id is not None:
+            condition = and_(condition, TaskVisibility.user_id == user_id)
+        self._replace(tenant_id, condition, task_ids, user_id)
+
+    def rebuild_tenant(self, tenant_id: UUID) -> int:
+        """Recompute the whole projection of a tenant.
+
+        Returns:
+            Number of visibility rows written
+        """
+        return self._replace(tenant_id, None)
+
+    def get_viewer_ids(self, tenant_id: UUID, task_id: UUID) -> list[UUID]:
+        """Get the IDs of the users who can see a task."""
+        return list(
+            self.db.scalars(
+                select(TaskVisibility.user_id).where(
+                    TaskVisibility.tenant_id == tenant_id,
+                    TaskVisibility.task_id == task_id,
+                )
+            )
+        )
+
+    def _replace(
+        self,
+        tenant_id: UUID,
+        condition: ColumnElement[bool] | None,
+        task_ids: Iterable[UUID] | Select | None = None,
+        user_id: UUID | None = None,
+    ) -> int:
+        """Delete projection rows matching condition and recompute them.
+
+        Args:
+            tenant_id: Tenant ID
+            condition: Rows to replace (None for the whole tenant)
+            task_ids: Tasks to recompute (None for all tasks of the tenant)
+            user_id: Only recompute rows of this user
+
+        Returns:
+            Number of visibility rows written
+        """
+        stmt = delete(TaskVisibility).where(TaskVisibility.tenant_id == tenant_id)
+        if condition is not None:
+            stmt = stmt.where(condition)
+        self.db.execute(stmt.execution_options(synchronize_session=False))
+
+        viewers = self.viewers_select(tenant_id, task_ids, user_id)
+        result = self.db.execute(
+            insert(TaskVisibility).from_select(
+                [
+                    "tenant_id",
+                    "user_id",
+                    "task_id",
+                    "reason",
+                    "task_created_at",
+                    "status",
+                    "priority",
+                ],
+                viewers,
+            )
+        )
+        return result.rowcount
+
+    @staticmethod
+    def viewers_select(
+        tenant_id: UUID,
+        task_ids: Iterable[UUID] | Select | None = None,
+        user_id: UUID | None = None,
+    ) -> Select:
+        """Build the SELECT computing projection rows from the source tables.
+
+        Each source yields (user, task) pairs with the rank of its reason;
+        DISTINCT ON keeps the strongest reason per pair.
+        """
+
+        def source(
+            user_column, reason: TaskVisibilityReason, *joins, where=()
+        ) -> Select:
+            query = select(
+                Task.tenant_id,
+                user_column.label("user_id"),
+                Task.id.label("task_id"),
+                literal(reason.value).label("reason"),
+                literal(REASON_RANKS[reason]).label("rank"),
+                Task.created_at.label("task_created_at"),
+                Task.status,
+                Task.priority,
+            ).select_from(Task)
+            for target, on in joins:
+                query = query.join(target, on)
+            query = query.where(
+                Task.tenant_id == tenant_id, user_column.isnot(None), *where
+            )
+            if task_ids is not None:
+                query = query.where(Task.id.in_(task_ids))
+            if user_id is not None:
+                query = query.where(user_column == user_id)
+            return query
+
+        assignment_join = (
+            TaskAssignment,
+            and_(
+                TaskAssignment.task_id == Task.id,
+                TaskAssignment.tenant_id == Task.tenant_id,
+            ),
+        )
+        sources = union_all(
+            source(Task.created_by_id, TaskVisibilityReason.CREATOR),
+            source(Task.assigned_to_id, TaskVisibilityReason.ASSIGNEE),
+            source(
+                TaskAssignment.assigned_to_id,
+                TaskVisibilityReason.ASSIGNMENT,
+                assignment_join,
+            ),
+            source(
+                TeamMember.user_id,
+                TaskVisibilityReason.TEAM,
+                assignment_join,
+                (
+                    TeamMember,
+                    and_(
+                        TeamMember.team_id == TaskAssignment.assigned_to_group_id,
+                        TeamMember.tenant_id == Task.tenant_id,
+                    ),
+                ),
+            ),
+        ).subquery("sources")
+
+        return (
+            select(
+                sources.c.tenant_id,
+                sources.c.user_id,
+                sources.c.task_id,
+                sources.c.reason,
+                sources.c.task_created_at,
+                sources.c.status,
+                sources.c.priority,
+            )
+            .distinct(sources.c.task_id, sources.c.user_id)
+            .order_by(sources.c.task_id, sources.c.user_id, sources.c.rank)
+        )
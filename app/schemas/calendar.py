@@ -123,7 +123,12 @@ class CalendarEventBase(BaseModel):
 class CalendarEventCreate(CalendarEventBase):
     """Schema for creating a calendar event."""
 
-    pass
+    @model_validator(mode="after")
+    def validate_time_range(self):
+        """Events need a positive duration (time_range is [start, end))."""
+        if self.end_time <= self.start_time:
+            raise ValueError("end_time must be after start_time")
+        return self
 
 
 class CalendarEventUpdate(BaseModel):
@@ -172,6 +177,16 @@ class CalendarEventUpdate(BaseModel):
 
     metadata: dict[str, Any] | None = Field(None, description="Additional metadata")
 
+    @model_validator(mode="after")
+    def validate_time_range(self):
+        """When both times are given, end_time must be after start_time.
+
+        Updates that change only one of them are checked by the service.
+        """
+        if self.start_time and self.end_time and self.end_time <= self.start_time:
+            raise ValueError("end_time must be after start_time")
+        return self
+
 
 class CalendarEventResponse(CalendarEventBase):
     """Schema for calendar event response."""
@@ -179,6 +194,12 @@ class CalendarEventResponse(CalendarEventBase):
     id: UUID
     tenant_id: UUID
     organizer_id: UUID | None
+    recurrence_master_id: UUID | None = Field(
+        None, description="Recurring event this event overrides one occurrence of"
+    )
+    recurrence_original_start: datetime | None = Field(
+        None, description="Original start of the overridden occurrence"
+    )
     created_at: datetime
     updated_at: datetime
     metadata: dict[str, Any] | None = Field(
@@ -188,6 +209,24 @@ class CalendarEventResponse(CalendarEventBase):
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
 
+class CalendarEventOccurrenceResponse(BaseModel):
+    """Schema for one occurrence of an event within a time window."""
+
+    start_time: datetime = Field(..., description="Occurrence start time")
+    end_time: datetime = Field(..., description="Occurrence end time")
+    recurrence_id: datetime | None = Field(
+        None, description="Original start of the occurrence (recurring events)"
+    )
+    master_event_id: UUID | None = Field(
+        None, description="Recurring event the occurrence belongs to"
+    )
+    event: CalendarEventResponse = Field(
+        ..., description="Event row (the recurring event or its override)"
+    )
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 # Attendee schemas
 class EventAttendeeBase(BaseModel):
     """Base schema for event attendee."""
@@ -351,3 +390,65 @@ class EventResourceResponse(BaseModel):
     created_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+# Free/busy schemas
+class FreeBusyRequest(BaseModel):
+    """Schema for a free/busy query."""
+
+    start_time: datetime = Field(..., description="Window start")
+    end_time: datetime = Field(..., description="Window end")
+    user_ids: list[UUID] = Field(
+        default_factory=list, description="Users to check", max_length=200
+    )
+    resource_ids: list[UUID] = Field(
+        default_factory=list, description="Resources to check", max_length=500
+    )
+
+
+class BusyInterval(BaseModel):
+    """Schema for a busy time interval."""
+
+    start_time: datetime = Field(..., description="Busy from")
+    end_time: datetime = Field(..., description="Busy until")
+
+
+class FreeBusyResponse(BaseModel):
+    """Schema for free/busy response (merged busy intervals per ID)."""
+
+    users: dict[UUID, list[BusyInterval]] = Field(
+        ..., description="Busy intervals by user ID"
+    )
+    resources: dict[UUID, list[BusyInterval]] = Field(
+        ..., description="Busy intervals by resource ID"
+    )
+
+
+class MeetingSlotRequest(FreeBusyRequest):
+    """Schema for finding common free slots."""
+
+    user_ids: list[UUID] = Field(
+        ..., description="Participants", min_length=1, max_length=200
+    )
+    resource_ids: list[UUID] = Field(
+        default_factory=list,
+        description="Candidate resources (e.g., rooms); one must be free",
+        max_length=500,
+    )
+    duration_minutes: int = Field(..., description="Slot length", ge=5, le=1440)
+    step_minutes: int | None = Field(
+        None, description="Slot start grid in minutes", ge=5, le=1440
+    )
+    limit: int = Field(5, description="Maximum number of slots", ge=1, le=50)
+
+
+class MeetingSlotResponse(BaseModel):
+    """Schema for a common free slot."""
+
+    start_time: datetime = Field(..., description="Slot start")
+    end_time: datetime = Field(..., description="Slot end")
+    resource_ids: list[UUID] = Field(
+        default_factory=list, description="Candidate resources free for the slot"
+    )
+
+    model_config = ConfigDict(from_attributes=True)
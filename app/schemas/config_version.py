@@ -44,8 +44,21 @@ class CacheStatsResponse(BaseModel):
     """Response schema for cache statistics."""
 
     enabled: bool = Field(..., description="Whether cache is enabled")
-    status: str = Field(..., description="Cache status: connected, disabled, error")
+    status: str = Field(
+        ..., description="Cache status: connected, local_only, disabled, error"
+    )
     total_keys: int | None = Field(None, description="Total number of cached keys")
-    ttl: int | None = Field(None, description="TTL in seconds")
+    ttl: int | None = Field(None, description="Redis (L2) TTL in seconds")
+    l1_ttl: int | None = Field(None, description="In-process (L1) TTL in seconds")
+    l1_entries: int | None = Field(
+        None, description="Module configurations cached in this process"
+    )
+    l1_hits: int | None = Field(None, description="Lookups served in process")
+    l1_misses: int | None = Field(None, description="Lookups missing in process")
+    l2_hits: int | None = Field(None, description="L1 misses served by Redis")
+    l2_misses: int | None = Field(None, description="Lookups loaded from database")
+    hit_ratio: float | None = Field(
+        None, description="Share of lookups served from cache (L1 or L2)"
+    )
     memory_used: str | None = Field(None, description="Memory used by cache")
     error: str | None = Field(None, description="Error message if status is error")
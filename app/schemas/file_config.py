@@ -127,6 +127,9 @@ class FileLimitsResponse(BaseModel):
     retention_days: int | None = Field(
         None, description="File retention period in days (None = no limit)"
     )
+    storage_quota: int | None = Field(
+        None, description="Tenant storage quota in bytes (None = unlimited)"
+    )
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -145,6 +148,9 @@ class FileLimitsUpdate(BaseModel):
     retention_days: int | None = Field(
         None, description="File retention period in days (None = no limit)"
     )
+    storage_quota: int | None = Field(
+        None, description="Tenant storage quota in bytes (None = unlimited)"
+    )
 
 
 class ThumbnailConfigResponse(BaseModel):
@@ -1,7 +1,7 @@
 """Template schemas for API requests and responses."""
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -118,6 +118,38 @@ class TemplateRenderResponse(BaseModel):
     )
 
 
+class TemplateBatchRenderRequest(BaseModel):
+    """Schema for rendering one PDF per row of a dataset."""
+
+    rows: list[dict[str, Any]] = Field(
+        ..., min_length=1, description="Variables of each document"
+    )
+    output: Literal["zip", "files"] = Field(
+        "zip", description="Store a single zip archive or one file per document"
+    )
+
+
+class TemplateRenderJobResponse(BaseModel):
+    """Schema for batch render job progress."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    template_id: UUID
+    status: str = Field(..., description="pending, running, completed or failed")
+    output: str
+    total: int = Field(..., description="Documents to render")
+    completed: int = Field(..., description="Documents rendered")
+    failed: int = Field(..., description="Documents that failed to render")
+    progress: float = Field(..., description="Share of documents processed (0-1)")
+    errors: list[dict[str, Any]] = Field(default_factory=list)
+    file_ids: list[UUID] = Field(
+        default_factory=list, description="Stored zip archive or documents"
+    )
+    created_at: datetime
+    finished_at: datetime | None = None
+
+
 # Template Category schemas
 class TemplateCategoryBase(BaseModel):
     """Base schema for template category."""
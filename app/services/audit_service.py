@@ -1,6 +1,8 @@
 """Audit service for querying audit logs."""
 
+import base64
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
 from sqlalchemy.orm import Session
@@ -9,6 +11,25 @@
 from app.schemas.audit import AuditLogResponse
 
 
+def encode_cursor(log: AuditLogResponse) -> str:
+    """Encode the keyset position (created_at, id) of an audit log entry."""
+    raw = f"{log.created_at.isoformat()}|{log.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a cursor returned by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        created_at, log_id = base64.urlsafe_b64decode(cursor).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(log_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid audit log cursor: {cursor}") from e
+
+
 class AuditService:
     """Service for querying audit logs."""
 
@@ -29,6 +50,7 @@ def get_audit_logs(
         details_search: str | None = None,
         skip: int = 0,
         limit: int = 100,
+        details_filter: dict[str, Any] | None = None,
     ) -> tuple[list[AuditLogResponse], int]:
         """
         Get audit logs with filters and pagination.
@@ -45,6 +67,7 @@ def get_audit_logs(
             details_search: Search in details JSON (partial match, optional).
             skip: Number of records to skip.
             limit: Maximum number of records to return.
+            details_filter: JSON object the details must contain (optional).
 
         Returns:
             Tuple of (list of AuditLogResponse, total count).
@@ -61,9 +84,38 @@ def get_audit_logs(
             details_search=details_search,
             skip=skip,
             limit=limit,
+            details_filter=details_filter,
         )
 
         # Convert to response schemas
         log_responses = [AuditLogResponse.model_validate(log) for log in logs]
 
         return log_responses, total
+
+    def get_audit_logs_after(
+        self,
+        tenant_id: UUID,
+        cursor: str | None = None,
+        limit: int = 100,
+        **filters: Any,
+    ) -> list[AuditLogResponse]:
+        """
+        Get a page of audit logs after a cursor, without a total count.
+
+        Args:
+            tenant_id: Tenant ID (required for multi-tenancy).
+            cursor: Cursor of the last entry of the previous page (optional).
+            limit: Maximum number of records to return.
+            **filters: Filters of get_audit_logs.
+
+        Returns:
+            List of AuditLogResponse.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        after = decode_cursor(cursor) if cursor else None
+        logs = self.repository.get_audit_logs_after(
+            tenant_id=tenant_id, after=after, limit=limit, **filters
+        )
+        return [AuditLogResponse.model_validate(log) for log in logs]
@@ -5,7 +5,9 @@
 
 from sqlalchemy.orm import Session
 
+from app.core.tasks.list_cache import get_task_list_cache
 from app.models.team import Team, TeamMember
+from app.repositories.task_visibility_repository import TaskVisibilityRepository
 
 logger = logging.getLogger(__name__)
 
@@ -242,8 +244,12 @@ def add_team_member(
         )
 
         self.db.add(member)
+        self.db.flush()
+        # Tasks assigned to the team become visible to the new member
+        TaskVisibilityRepository(self.db).refresh_team(tenant_id, team_id, user_id)
         self.db.commit()
         self.db.refresh(member)
+        get_task_list_cache().invalidate(tenant_id, [user_id])
 
         logger.info(f"Added user {user_id} to team {team_id}")
         return member
@@ -274,7 +280,10 @@ def remove_team_member(self, tenant_id: UUID, team_id: UUID, user_id: UUID) -> b
             return False
 
         self.db.delete(member)
+        self.db.flush()
+        TaskVisibilityRepository(self.db).refresh_team(tenant_id, team_id, user_id)
         self.db.commit()
+        get_task_list_cache().invalidate(tenant_id, [user_id])
 
         logger.info(f"Removed user {user_id} from team {team_id}")
         return True
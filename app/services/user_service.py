@@ -20,6 +20,7 @@ class UserService:
 
     def __init__(self, db: Session, event_publisher: EventPublisher | None = None):
         """Initialize service with database session."""
+        self.db = db
         self.repository = UserRepository(db)
         if event_publisher is not None:
             self.event_publisher = event_publisher
@@ -88,6 +89,7 @@ def create_user(
 
         safe_publish_event(
             event_publisher=self.event_publisher,
+            db=self.db,
             event_type="user.created",
             entity_type="user",
             entity_id=user.id,
@@ -102,6 +104,7 @@ def create_user(
                 },
             ),
         )
+        self.db.commit()
 
         return {
             "id": user.id,
@@ -230,6 +233,7 @@ def update_user(
 
         safe_publish_event(
             event_publisher=self.event_publisher,
+            db=self.db,
             event_type="user.updated",
             entity_type="user",
             entity_id=updated_user.id,
@@ -244,6 +248,7 @@ def update_user(
                 },
             ),
         )
+        self.db.commit()
 
         return {
             "id": updated_user.id,
@@ -332,6 +337,7 @@ def deactivate_user(
 
         safe_publish_event(
             event_publisher=self.event_publisher,
+            db=self.db,
             event_type="user.updated",
             entity_type="user",
             entity_id=user_id,
@@ -346,6 +352,7 @@ def deactivate_user(
                 },
             ),
         )
+        self.db.commit()
 
         return True
 
@@ -399,6 +406,7 @@ def delete_user(
         # Hard delete with cascade (handled by SQLAlchemy relationships)
         safe_publish_event(
             event_publisher=self.event_publisher,
+            db=self.db,
             event_type="user.deleted",
             entity_type="user",
             entity_id=user_id,
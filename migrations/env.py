@@ -31,7 +31,10 @@
 # Import inventory models from modules
 from app.modules.inventory.models.inventory import (  # noqa: F401
     Location,
+    StockBalance,
     StockMove,
+    StockValuationCheckpoint,
+    StockValuationPosition,
     Warehouse,
 )
 
@@ -0,0 +1,60 @@
+"""add_calendar_event_overrides
+
+Add single-occurrence overrides of recurring events (recurrence_master_id,
+recurrence_original_start) and a partial index on recurring events so a
+window query reads the series masters without scanning single events.
+
+Revision ID: 2026_10_18_calendar_overrides
+Revises: 2026_10_18_calendar_user_idx
+Create Date: 2026-10-18 14:00:00.000000+00:00
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "2026_10_18_calendar_overrides"
+down_revision: str | None = "2026_10_18_calendar_user_idx"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "calendar_events",
+        sa.Column(
+            "recurrence_master_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("calendar_events.id", ondelete="CASCADE"),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        "calendar_events",
+        sa.Column(
+            "recurrence_original_start",
+            postgresql.TIMESTAMP(timezone=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "idx_events_recurrence_override",
+        "calendar_events",
+        ["recurrence_master_id", "recurrence_original_start"],
+        unique=True,
+    )
+    op.create_index(
+        "idx_events_recurring_time",
+        "calendar_events",
+        ["tenant_id", "start_time"],
+        postgresql_where=sa.text(
+            "recurrence_type <> 'none' OR recurrence_rule IS NOT NULL"
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_events_recurring_time", table_name="calendar_events")
+    op.drop_index("idx_events_recurrence_override", table_name="calendar_events")
+    op.drop_column("calendar_events", "recurrence_original_start")
+    op.drop_column("calendar_events", "recurrence_master_id")
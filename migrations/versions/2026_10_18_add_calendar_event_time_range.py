@@ -0,0 +1,48 @@
+"""add_calendar_event_time_range
+
+Add a stored tstzrange(start_time, end_time) column to calendar_events with a
+GiST index, so free/busy queries find events overlapping a window with an
+index scan instead of a range scan over every earlier start_time.
+
+Adding a stored generated column rewrites calendar_events. tstzrange rejects
+an upper bound before the lower one, so events ending before they start are
+first clamped to end at their start (an empty range).
+
+Revision ID: 2026_10_18_calendar_time_range
+Revises: 2026_10_18_calendar_overrides
+Create Date: 2026-10-18 15:00:00.000000+00:00
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "2026_10_18_calendar_time_range"
+down_revision: str | None = "2026_10_18_calendar_overrides"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "UPDATE calendar_events SET end_time = start_time WHERE end_time < start_time"
+    )
+    op.add_column(
+        "calendar_events",
+        sa.Column(
+            "time_range",
+            postgresql.TSTZRANGE(),
+            sa.Computed("tstzrange(start_time, end_time, '[)')", persisted=True),
+        ),
+    )
+    op.create_index(
+        "idx_events_time_range",
+        "calendar_events",
+        ["time_range"],
+        postgresql_using="gist",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_events_time_range", table_name="calendar_events")
+    op.drop_column("calendar_events", "time_range")
@@ -0,0 +1,36 @@
+"""add_calendar_user_event_indexes
+
+Add indexes behind user calendar listings: organizer events in time order
+per tenant and attendee rows by user, so each branch of the organizer /
+attendee UNION is an index range scan.
+
+Revision ID: 2026_10_18_calendar_user_idx
+Revises: 2026_10_18_event_outbox
+Create Date: 2026-10-18 13:00:00.000000+00:00
+"""
+
+from alembic import op
+
+revision: str = "2026_10_18_calendar_user_idx"
+down_revision: str | None = "2026_10_18_event_outbox"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_events_organizer_time",
+        "calendar_events",
+        ["tenant_id", "organizer_id", "start_time", "id"],
+    )
+    op.create_index(
+        "idx_attendees_user_event",
+        "event_attendees",
+        ["user_id", "event_id"],
+    )
+    op.execute("ANALYZE calendar_events, event_attendees")
+
+
+def downgrade() -> None:
+    op.drop_index("idx_attendees_user_event", table_name="event_attendees")
+    op.drop_index("idx_events_organizer_time", table_name="calendar_events")
@@ -0,0 +1,48 @@
+"""add_event_outbox_table
+
+Add event_outbox table holding domain events written in the transaction of
+the change they describe until OutboxRelay publishes them to Redis Streams.
+
+Revision ID: 2026_10_18_event_outbox
+Revises: 2026_10_18_task_visibility
+Create Date: 2026-10-18 12:00:00.000000+00:00
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "2026_10_18_event_outbox"
+down_revision: str | None = "2026_10_18_task_visibility"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "event_outbox",
+        sa.Column(
+            "id",
+            sa.BigInteger(),
+            sa.Identity(always=False),
+            primary_key=True,
+        ),
+        sa.Column("event_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("event_type", sa.String(length=100), nullable=False),
+        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("stream", sa.String(length=100), nullable=False),
+        sa.Column("fields", postgresql.JSONB(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            postgresql.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.UniqueConstraint("event_id", name="uq_event_outbox_event_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("event_outbox")
@@ -0,0 +1,93 @@
+"""add_file_usage_counters_table
+
+Add file_usage_counters table with precomputed storage usage per tenant,
+folder, entity, entity type and MIME type, backfilled from existing files.
+
+Revision ID: 2026_10_18_file_usage_counters
+Revises: 2026_02_21_time_entries
+Create Date: 2026-10-18 09:00:00.000000+00:00
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "2026_10_18_file_usage_counters"
+down_revision: str | None = "2026_02_21_time_entries"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+# Only current (not deleted) files count towards usage
+CURRENT_FILES = "is_current AND deleted_at IS NULL"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "file_usage_counters",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "tenant_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("tenants.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("scope_type", sa.String(20), nullable=False),
+        sa.Column("scope_key", sa.String(100), nullable=False, server_default=""),
+        sa.Column("file_count", sa.BigInteger, nullable=False, server_default="0"),
+        sa.Column("total_size", sa.BigInteger, nullable=False, server_default="0"),
+        sa.Column("version_count", sa.BigInteger, nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.UniqueConstraint(
+            "tenant_id",
+            "scope_type",
+            "scope_key",
+            name="uq_file_usage_counters_scope",
+        ),
+    )
+
+    # Backfill: one aggregate pass per scope type
+    op.execute(f"""
+        INSERT INTO file_usage_counters
+            (id, tenant_id, scope_type, scope_key, file_count, total_size, version_count)
+        SELECT gen_random_uuid(), t.id, 'tenant', '',
+               COALESCE(f.file_count, 0), COALESCE(f.total_size, 0),
+               COALESCE(v.version_count, 0)
+        FROM tenants t
+        LEFT JOIN (
+            SELECT tenant_id, COUNT(*) AS file_count, SUM(size) AS total_size
+            FROM files WHERE {CURRENT_FILES} GROUP BY tenant_id
+        ) f ON f.tenant_id = t.id
+        LEFT JOIN (
+            SELECT tenant_id, COUNT(*) AS version_count
+            FROM file_versions GROUP BY tenant_id
+        ) v ON v.tenant_id = t.id
+        WHERE f.tenant_id IS NOT NULL OR v.tenant_id IS NOT NULL
+        """)
+    for scope_type, key_expr, filters in (
+        ("mime_type", "mime_type", ""),
+        ("entity_type", "entity_type", "AND entity_type IS NOT NULL"),
+        (
+            "entity",
+            "entity_type || ':' || entity_id::text",
+            "AND entity_type IS NOT NULL AND entity_id IS NOT NULL",
+        ),
+        ("folder", "folder_id::text", "AND folder_id IS NOT NULL"),
+    ):
+        op.execute(f"""
+            INSERT INTO file_usage_counters
+                (id, tenant_id, scope_type, scope_key, file_count, total_size)
+            SELECT gen_random_uuid(), tenant_id, '{scope_type}', {key_expr},
+                   COUNT(*), SUM(size)
+            FROM files
+            WHERE {CURRENT_FILES} {filters}
+            GROUP BY tenant_id, {key_expr}
+            """)
+
+
+def downgrade() -> None:
+    op.drop_table("file_usage_counters")
@@ -0,0 +1,36 @@
+"""add_notification_queue_deliver_after
+
+Add deliver_after to notification_queue for digest windows of coalesced
+notifications.
+
+Revision ID: 2026_10_18_notif_deliver_after
+Revises: 2026_10_18_file_usage_counters
+Create Date: 2026-10-18 10:00:00.000000+00:00
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "2026_10_18_notif_deliver_after"
+down_revision: str | None = "2026_10_18_file_usage_counters"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "notification_queue",
+        sa.Column("deliver_after", sa.TIMESTAMP(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "idx_notification_queue_status_deliver",
+        "notification_queue",
+        ["status", "deliver_after"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_notification_queue_status_deliver", table_name="notification_queue"
+    )
+    op.drop_column("notification_queue", "deliver_after")
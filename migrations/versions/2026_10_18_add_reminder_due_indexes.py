@@ -0,0 +1,38 @@
+"""add_reminder_due_indexes
+
+Add partial indexes over unsent calendar event reminders and task reminders,
+so the reminder pump finds due reminders of all tenants without scanning the
+sent ones (the existing pending indexes lead with tenant_id).
+
+Revision ID: 2026_10_18_reminder_due_indexes
+Revises: 2026_10_18_calendar_time_range
+Create Date: 2026-10-18 16:00:00.000000+00:00
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "2026_10_18_reminder_due_indexes"
+down_revision: str | None = "2026_10_18_calendar_time_range"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_reminders_unsent",
+        "event_reminders",
+        ["event_id"],
+        postgresql_where=sa.text("NOT is_sent"),
+    )
+    op.create_index(
+        "idx_task_reminders_due",
+        "task_reminders",
+        ["reminder_time"],
+        postgresql_where=sa.text("NOT sent"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_task_reminders_due", table_name="task_reminders")
+    op.drop_index("idx_reminders_unsent", table_name="event_reminders")
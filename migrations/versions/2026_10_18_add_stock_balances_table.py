@@ -0,0 +1,85 @@
+"""add_stock_balances_table
+
+Add stock_balances, the on-hand projection of stock_moves per (tenant,
+product, location): quantity, reserved quantity and value at moving-average
+cost. Stock moves update it in their own transaction.
+
+The table is created empty; populate it from existing moves with
+`aiutox inventory:rebuild-balances` after upgrading.
+
+Revision ID: 2026_10_18_stock_balances
+Revises: 2026_10_18_text_search
+Create Date: 2026-10-18 19:00:00.000000+00:00
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "2026_10_18_stock_balances"
+down_revision: str | None = "2026_10_18_text_search"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "stock_balances",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("product_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("location_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("warehouse_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "quantity",
+            sa.Numeric(precision=18, scale=6),
+            nullable=False,
+            server_default="0",
+        ),
+        sa.Column(
+            "reserved",
+            sa.Numeric(precision=18, scale=6),
+            nullable=False,
+            server_default="0",
+        ),
+        sa.Column(
+            "value",
+            sa.Numeric(precision=18, scale=6),
+            nullable=False,
+            server_default="0",
+        ),
+        sa.Column(
+            "updated_at",
+            postgresql.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["product_id"], ["products.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["location_id"], ["locations.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(
+            ["warehouse_id"], ["warehouses.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "tenant_id",
+            "product_id",
+            "location_id",
+            name="uq_stock_balances_tenant_product_location",
+        ),
+        sa.CheckConstraint("reserved >= 0", name="ck_stock_balances_reserved"),
+    )
+    op.create_index("ix_stock_balances_location_id", "stock_balances", ["location_id"])
+    op.create_index(
+        "idx_stock_balances_tenant_warehouse_product",
+        "stock_balances",
+        ["tenant_id", "warehouse_id", "product_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_stock_balances_tenant_warehouse_product", table_name="stock_balances"
+    )
+    op.drop_index("ix_stock_balances_location_id", table_name="stock_balances")
+    op.drop_table("stock_balances")
@@ -0,0 +1,94 @@
+"""add_stock_valuation_checkpoints
+
+Add stock_valuation_checkpoints and stock_valuation_positions: periodic
+snapshots of FIFO or moving-average stock valuation, so as-of reports only
+replay the stock moves after the latest checkpoint.
+
+Revision ID: 2026_10_18_stock_valuation
+Revises: 2026_10_18_stock_balances
+Create Date: 2026-10-18 20:00:00.000000+00:00
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "2026_10_18_stock_valuation"
+down_revision: str | None = "2026_10_18_stock_balances"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "stock_valuation_checkpoints",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("method", sa.String(length=20), nullable=False),
+        sa.Column("as_of", postgresql.TIMESTAMP(timezone=True), nullable=False),
+        sa.Column("move_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "created_at",
+            postgresql.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "tenant_id",
+            "method",
+            "as_of",
+            name="uq_stock_valuation_checkpoints_tenant_method_as_of",
+        ),
+    )
+    op.create_table(
+        "stock_valuation_positions",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("checkpoint_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("product_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("location_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "quantity",
+            sa.Numeric(precision=18, scale=6),
+            nullable=False,
+            server_default="0",
+        ),
+        sa.Column(
+            "value",
+            sa.Numeric(precision=18, scale=6),
+            nullable=False,
+            server_default="0",
+        ),
+        sa.Column(
+            "cogs",
+            sa.Numeric(precision=18, scale=6),
+            nullable=False,
+            server_default="0",
+        ),
+        sa.Column("layers", postgresql.JSONB(), nullable=True),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(
+            ["checkpoint_id"],
+            ["stock_valuation_checkpoints.id"],
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(["product_id"], ["products.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["location_id"], ["locations.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "idx_stock_valuation_positions_checkpoint_product",
+        "stock_valuation_positions",
+        ["checkpoint_id", "product_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_stock_valuation_positions_checkpoint_product",
+        table_name="stock_valuation_positions",
+    )
+    op.drop_table("stock_valuation_positions")
+    op.drop_table("stock_valuation_checkpoints")
@@ -0,0 +1,31 @@
+"""add_stock_valuation_last_cost
+
+Add stock_valuation_positions.last_cost: the FIFO cost of the last receipt,
+which prices issues made with no stock on hand. Without it a replay from a
+checkpoint could differ from a full replay, so existing FIFO checkpoints are
+deleted; they are taken again by the next checkpoint run.
+
+Revision ID: 2026_10_18_valuation_last_cost
+Revises: 2026_10_18_stock_valuation
+Create Date: 2026-10-18 22:00:00.000000+00:00
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "2026_10_18_valuation_last_cost"
+down_revision: str | None = "2026_10_18_stock_valuation"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "stock_valuation_positions",
+        sa.Column("last_cost", sa.Numeric(precision=18, scale=6), nullable=True),
+    )
+    op.execute("DELETE FROM stock_valuation_checkpoints WHERE method = 'fifo'")
+
+
+def downgrade() -> None:
+    op.drop_column("stock_valuation_positions", "last_cost")
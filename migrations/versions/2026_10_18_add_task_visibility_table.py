@@ -0,0 +1,96 @@
+"""add_task_visibility_table
+
+Add task_visibility projection with one row per user who can see a task
+(creator, assignee, assignment or team member), backfilled from existing
+tasks, assignments and team memberships.
+
+Revision ID: 2026_10_18_task_visibility
+Revises: 2026_10_18_notif_deliver_after
+Create Date: 2026-10-18 11:00:00.000000+00:00
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "2026_10_18_task_visibility"
+down_revision: str | None = "2026_10_18_notif_deliver_after"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "task_visibility",
+        sa.Column(
+            "tenant_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("tenants.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "task_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("tasks.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("reason", sa.String(20), nullable=False),
+        sa.Column("task_created_at", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("priority", sa.String(20), nullable=False),
+    )
+
+    # Backfill before the secondary indexes are built; DISTINCT ON keeps the
+    # strongest reason (creator < assignee < assignment < team) per pair
+    op.execute("""
+        INSERT INTO task_visibility
+            (tenant_id, user_id, task_id, reason, task_created_at, status, priority)
+        SELECT DISTINCT ON (s.task_id, s.user_id)
+               s.tenant_id, s.user_id, s.task_id, s.reason,
+               t.created_at, t.status, t.priority
+        FROM (
+            SELECT tenant_id, created_by_id AS user_id, id AS task_id,
+                   'creator' AS reason, 0 AS rank
+            FROM tasks WHERE created_by_id IS NOT NULL
+            UNION ALL
+            SELECT tenant_id, assigned_to_id, id, 'assignee', 1
+            FROM tasks WHERE assigned_to_id IS NOT NULL
+            UNION ALL
+            SELECT tenant_id, assigned_to_id, task_id, 'assignment', 2
+            FROM task_assignments WHERE assigned_to_id IS NOT NULL
+            UNION ALL
+            SELECT a.tenant_id, m.user_id, a.task_id, 'team', 3
+            FROM task_assignments a
+            JOIN team_members m
+              ON m.team_id = a.assigned_to_group_id AND m.tenant_id = a.tenant_id
+        ) s
+        JOIN tasks t ON t.id = s.task_id AND t.tenant_id = s.tenant_id
+        ORDER BY s.task_id, s.user_id, s.rank
+        """)
+
+    op.create_index(
+        "idx_task_visibility_user_created",
+        "task_visibility",
+        [
+            "tenant_id",
+            "user_id",
+            sa.text("task_created_at DESC"),
+            sa.text("task_id DESC"),
+        ],
+    )
+    op.create_index(
+        "idx_task_visibility_user_status",
+        "task_visibility",
+        ["tenant_id", "user_id", "status"],
+    )
+    op.create_index("idx_task_visibility_task", "task_visibility", ["task_id"])
+
+
+def downgrade() -> None:
+    op.drop_table("task_visibility")
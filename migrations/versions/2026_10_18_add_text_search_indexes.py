@@ -0,0 +1,99 @@
+"""add_text_search_indexes
+
+Add stored generated tsvector columns (search_vector) with GIN indexes to
+activities, comments and audit_logs, and GIN trigram indexes on the text
+searched by substring (activity title and description, comment content,
+audit log details as text), so searches use an index instead of scanning
+every row of the tenant.
+
+Requires the pg_trgm extension. Adding a stored generated column rewrites
+each table.
+
+Revision ID: 2026_10_18_text_search
+Revises: 2026_10_18_audit_partitions
+Create Date: 2026-10-18 18:00:00.000000+00:00
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "2026_10_18_text_search"
+down_revision: str | None = "2026_10_18_audit_partitions"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+SEARCH_VECTORS = {
+    "activities": "to_tsvector('simple', title || ' ' || coalesce(description, ''))",
+    "comments": "to_tsvector('simple', content)",
+    "audit_logs": (
+        "jsonb_to_tsvector('simple', coalesce(details, '{}'), '[\"string\"]')"
+    ),
+}
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for table, expression in SEARCH_VECTORS.items():
+        op.add_column(
+            table,
+            sa.Column(
+                "search_vector",
+                postgresql.TSVECTOR(),
+                sa.Computed(expression, persisted=True),
+            ),
+        )
+    op.create_index(
+        "idx_activities_search",
+        "activities",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "idx_comments_search", "comments", ["search_vector"], postgresql_using="gin"
+    )
+    op.create_index(
+        "idx_audit_logs_search",
+        "audit_logs",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+
+    op.create_index(
+        "idx_activities_title_trgm",
+        "activities",
+        ["title"],
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "idx_activities_description_trgm",
+        "activities",
+        ["description"],
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "idx_comments_content_trgm",
+        "comments",
+        ["content"],
+        postgresql_using="gin",
+        postgresql_ops={"content": "gin_trgm_ops"},
+    )
+    op.execute(
+        "CREATE INDEX idx_audit_logs_details_trgm ON audit_logs "
+        "USING gin (CAST(details AS VARCHAR) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_audit_logs_details_trgm", table_name="audit_logs")
+    op.drop_index("idx_comments_content_trgm", table_name="comments")
+    op.drop_index("idx_activities_description_trgm", table_name="activities")
+    op.drop_index("idx_activities_title_trgm", table_name="activities")
+    op.drop_index("idx_audit_logs_search", table_name="audit_logs")
+    op.drop_index("idx_comments_search", table_name="comments")
+    op.drop_index("idx_activities_search", table_name="activities")
+    for table in SEARCH_VECTORS:
+        op.drop_column(table, "search_vector")
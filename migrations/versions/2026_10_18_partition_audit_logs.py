@@ -0,0 +1,208 @@
+"""partition_audit_logs
+
+Rebuild audit_logs as a table range-partitioned by month on created_at, with
+one partition per month from the oldest entry to three months ahead and a
+DEFAULT partition as a safety net. Old months can then be dropped whole
+instead of deleted row by row, and date filtered reads only scan the
+matching months.
+
+The primary key becomes (id, created_at), as PostgreSQL requires the
+partition key in unique constraints. Single-column indexes that duplicate a
+composite index are not recreated; (tenant_id, created_at, id) serves keyset
+pagination and a GIN jsonb_path_ops index serves details containment
+searches.
+
+Existing rows are copied into the new table, which takes a while (and locks
+audit writes) on large installations.
+
+Revision ID: 2026_10_18_audit_partitions
+Revises: 2026_10_18_reminder_due_indexes
+Create Date: 2026-10-18 17:00:00.000000+00:00
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "2026_10_18_audit_partitions"
+down_revision: str | None = "2026_10_18_reminder_due_indexes"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+COLUMNS = (
+    "id, user_id, tenant_id, action, resource_type, resource_id, details, "
+    "ip_address, user_agent, created_at"
+)
+
+OLD_INDEXES = (
+    "ix_audit_logs_user_id",
+    "ix_audit_logs_tenant_id",
+    "ix_audit_logs_action",
+    "ix_audit_logs_resource_type",
+    "ix_audit_logs_created_at",
+    "idx_audit_logs_tenant_created",
+    "idx_audit_logs_action_created",
+)
+
+
+def _columns() -> list[sa.Column]:
+    return [
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="SET NULL"),
+            nullable=True,
+            comment="User who performed the action (null for system actions)",
+        ),
+        sa.Column(
+            "tenant_id",
+            postgresql.UUID(as_uuid=True),
+            nullable=False,
+            comment="Tenant ID for multi-tenancy isolation",
+        ),
+        sa.Column(
+            "action",
+            sa.String(length=100),
+            nullable=False,
+            comment="Action type (e.g., 'grant_permission', 'create_user')",
+        ),
+        sa.Column(
+            "resource_type",
+            sa.String(length=50),
+            nullable=True,
+            comment="Type of resource affected (e.g., 'user', 'permission', 'role')",
+        ),
+        sa.Column(
+            "resource_id",
+            postgresql.UUID(as_uuid=True),
+            nullable=True,
+            comment="ID of the resource affected",
+        ),
+        sa.Column(
+            "details",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+            comment="Additional details as JSON",
+        ),
+        sa.Column(
+            "ip_address",
+            sa.String(length=45),
+            nullable=True,
+            comment="Client IP address (supports IPv6)",
+        ),
+        sa.Column(
+            "user_agent",
+            sa.String(length=500),
+            nullable=True,
+            comment="Client user agent string",
+        ),
+        sa.Column(
+            "created_at",
+            postgresql.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+    ]
+
+
+def upgrade() -> None:
+    op.rename_table("audit_logs", "audit_logs_unpartitioned")
+    op.execute(
+        "ALTER TABLE audit_logs_unpartitioned "
+        "RENAME CONSTRAINT audit_logs_pkey TO audit_logs_unpartitioned_pkey"
+    )
+    for index in OLD_INDEXES:
+        op.drop_index(index, table_name="audit_logs_unpartitioned")
+
+    op.create_table(
+        "audit_logs",
+        *_columns(),
+        sa.PrimaryKeyConstraint("id", "created_at"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    op.create_index("ix_audit_logs_user_id", "audit_logs", ["user_id"])
+    op.create_index("ix_audit_logs_resource_type", "audit_logs", ["resource_type"])
+    op.create_index(
+        "idx_audit_logs_tenant_created",
+        "audit_logs",
+        ["tenant_id", "created_at", "id"],
+    )
+    op.create_index(
+        "idx_audit_logs_action_created", "audit_logs", ["action", "created_at"]
+    )
+    op.create_index(
+        "idx_audit_logs_details",
+        "audit_logs",
+        ["details"],
+        postgresql_using="gin",
+        postgresql_ops={"details": "jsonb_path_ops"},
+    )
+
+    op.execute("CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT")
+    # Monthly partitions (UTC months) from the oldest entry to 3 months ahead
+    op.execute("""
+        DO $$
+        DECLARE
+            month_start date := date_trunc(
+                'month',
+                coalesce(
+                    (SELECT min(created_at) FROM audit_logs_unpartitioned), now()
+                ) AT TIME ZONE 'UTC'
+            )::date;
+            last_month date := (
+                date_trunc('month', now() AT TIME ZONE 'UTC') + interval '3 months'
+            )::date;
+        BEGIN
+            WHILE month_start <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF audit_logs '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    'audit_logs_p' || to_char(month_start, 'YYYY_MM'),
+                    month_start || ' 00:00:00+00',
+                    (month_start + interval '1 month')::date || ' 00:00:00+00'
+                );
+                month_start := (month_start + interval '1 month')::date;
+            END LOOP;
+        END $$;
+        """)
+    op.execute(
+        f"INSERT INTO audit_logs ({COLUMNS}) "
+        f"SELECT {COLUMNS} FROM audit_logs_unpartitioned"
+    )
+    op.drop_table("audit_logs_unpartitioned")
+
+
+def downgrade() -> None:
+    op.rename_table("audit_logs", "audit_logs_partitioned")
+    op.execute(
+        "ALTER TABLE audit_logs_partitioned "
+        "RENAME CONSTRAINT audit_logs_pkey TO audit_logs_partitioned_pkey"
+    )
+    for index in (
+        "ix_audit_logs_user_id",
+        "ix_audit_logs_resource_type",
+        "idx_audit_logs_tenant_created",
+        "idx_audit_logs_action_created",
+        "idx_audit_logs_details",
+    ):
+        op.drop_index(index, table_name="audit_logs_partitioned")
+
+    op.create_table("audit_logs", *_columns(), sa.PrimaryKeyConstraint("id"))
+    op.execute(
+        f"INSERT INTO audit_logs ({COLUMNS}) "
+        f"SELECT {COLUMNS} FROM audit_logs_partitioned"
+    )
+    op.execute("DROP TABLE audit_logs_partitioned CASCADE")
+
+    op.create_index("ix_audit_logs_user_id", "audit_logs", ["user_id"])
+    op.create_index("ix_audit_logs_tenant_id", "audit_logs", ["tenant_id"])
+    op.create_index("ix_audit_logs_action", "audit_logs", ["action"])
+    op.create_index("ix_audit_logs_resource_type", "audit_logs", ["resource_type"])
+    op.create_index("ix_audit_logs_created_at", "audit_logs", ["created_at"])
+    op.create_index(
+        "idx_audit_logs_tenant_created", "audit_logs", ["tenant_id", "created_at"]
+    )
+    op.create_index(
+        "idx_audit_logs_action_created", "audit_logs", ["action", "created_at"]
+    )
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+from uuid import UUID
+
 import typer
 from sqlalchemy import create_engine, text
 
 from app.core.config_file import get_settings
+from app.core.db.session import SessionLocal
 from app.core.migrations.manager import MigrationManager
 from app.core.migrations.reporter import MigrationReporter
 from app.core.migrations.verifier import MigrationVerifier
 from app.core.seeders.manager import SeederManager
+from app.modules.inventory.models.inventory import StockMove
+from app.modules.inventory.services.costing import VALUATION_METHODS
+from app.modules.inventory.services.stock_balance_service import StockBalanceService
+from app.modules.inventory.services.valuation_service import StockValuationService
 
 app = typer.Typer(help="AiutoX unified backend CLI")
 migrate_app = typer.Typer(help="Migration commands")
@@ -239,6 +246,67 @@ def db_check() -> None:
     typer.echo("Database and Redis check: OK")
 
 
+@app.command("inventory:rebuild-balances")
+def inventory_rebuild_balances(
+    tenant_id: str | None = typer.Option(None, "--tenant"),
+) -> None:
+    """Rebuild stock balances from the stock move ledger (one or all tenants)."""
+    try:
+        tenant_ids = [UUID(tenant_id)] if tenant_id else None
+    except ValueError:
+        _exit_with_error(f"Invalid tenant ID: {tenant_id}")
+
+    db = SessionLocal()
+    try:
+        if tenant_ids is None:
+            tenant_ids = [
+                row[0] for row in db.query(StockMove.tenant_id).distinct().all()
+            ]
+        service = StockBalanceService(db)
+        for tenant in tenant_ids:
+            count = service.rebuild(tenant)
+            typer.echo(f"Tenant {tenant}: {count} stock balances rebuilt")
+    except Exception as exc:  # pragma: no cover - depends on database state
+        db.rollback()
+        _exit_with_error(f"Stock balance rebuild failed: {exc}")
+    finally:
+        db.close()
+
+
+@app.command("inventory:valuation-checkpoint")
+def inventory_valuation_checkpoint(
+    tenant_id: str | None = typer.Option(None, "--tenant"),
+    method: str | None = typer.Option(None, "--method", help="fifo or average"),
+) -> None:
+    """Snapshot stock valuation checkpoints (run periodically, e.g. nightly)."""
+    if method and method not in VALUATION_METHODS:
+        _exit_with_error(f"Invalid valuation method: {method}")
+    try:
+        tenant_ids = [UUID(tenant_id)] if tenant_id else None
+    except ValueError:
+        _exit_with_error(f"Invalid tenant ID: {tenant_id}")
+
+    db = SessionLocal()
+    try:
+        if tenant_ids is None:
+            tenant_ids = [
+                row[0] for row in db.query(StockMove.tenant_id).distinct().all()
+            ]
+        service = StockValuationService(db)
+        for tenant in tenant_ids:
+            for tenant_method in [method] if method else VALUATION_METHODS:
+                checkpoint = service.create_checkpoint(tenant, tenant_method)
+                typer.echo(
+                    f"Tenant {tenant}: {tenant_method} checkpoint at "
+                    f"{checkpoint.as_of.isoformat()} ({checkpoint.move_count} moves)"
+                )
+    except Exception as exc:  # pragma: no cover - depends on database state
+        db.rollback()
+        _exit_with_error(f"Valuation checkpoint failed: {exc}")
+    finally:
+        db.close()
+
+
 def main() -> None:
     """CLI entrypoint for `uv run aiutox`."""
     app()
@@ -1,6 +1,8 @@
 """Helper functions for tests."""
 
+import asyncio
 import json
+import statistics
 from collections.abc import Iterable
 from datetime import UTC, datetime
 from typing import Any
@@ -9,6 +11,7 @@
 from sqlalchemy.orm import Session
 
 from app.core.auth import hash_password
+from app.models.event_outbox import EventOutbox
 from app.models.module_role import ModuleRole
 from app.models.task import Task
 from app.models.tenant import Tenant
@@ -158,6 +161,16 @@ def create_task(
     return task
 
 
+def get_outbox_events(
+    db_session: Session, tenant_id: UUID, event_type: str | None = None
+) -> list[EventOutbox]:
+    """Get events stored in the outbox for a tenant, oldest first."""
+    query = db_session.query(EventOutbox).filter(EventOutbox.tenant_id == tenant_id)
+    if event_type:
+        query = query.filter(EventOutbox.event_type == event_type)
+    return query.order_by(EventOutbox.id).all()
+
+
 def parse_sse_events(lines: Iterable[str]) -> list[dict[str, Any]]:
     """Parse SSE lines into a list of event payloads."""
     events: list[dict[str, Any]] = []
@@ -184,3 +197,66 @@ def parse_sse_events(lines: Iterable[str]) -> list[dict[str, Any]]:
         events.append(current)
 
     return events
+
+
+class LocalHTTPServer:
+    """Minimal in-process HTTP/1.1 server standing in for webhook receivers.
+
+    Connections are kept alive between requests. Responses default to 200;
+    `statuses` maps a request path to the status code to answer with.
+    """
+
+    def __init__(self, delay: float = 0.0, statuses: dict[str, int] | None = None):
+        self.delay = delay
+        self.statuses = statuses or {}
+        self.requests: list[dict[str, Any]] = []
+        self.connections = 0
+        self._server = None
+        self.port = 0
+
+    def url(self, path: str = "/hook") -> str:
+        return f"http://127.0.0.1:{self.port}{path}"
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer) -> None:
+        self.connections += 1
+        try:
+            while request_line := await reader.readline():
+                method, path, _ = request_line.decode().split(" ", 2)
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b""):
+                    name, value = line.decode().split(":", 1)
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                self.requests.append(
+                    {
+                        "method": method,
+                        "path": path,
+                        "headers": headers,
+                        "body": json.loads(body) if body else None,
+                    }
+                )
+                if self.delay:
+                    await asyncio.sleep(self.delay)
+                status = self.statuses.get(path, 200)
+                writer.write(
+                    f"HTTP/1.1 {status} X\r\nContent-Length: 2\r\n"
+                    f"Connection: keep-alive\r\n\r\nok".encode()
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+def p99_ms(latencies: list[float]) -> float:
+    """99th percentile of latencies in seconds, in milliseconds."""
+    return statistics.quantiles(latencies, n=100)[98] * 1000
@@ -7,6 +7,7 @@
 from app.core.tasks.scheduler import TaskScheduler
 from app.core.tasks.service import TaskService
 from app.models.task import TaskStatusEnum
+from tests.helpers import get_outbox_events
 
 
 @pytest.mark.asyncio
@@ -31,12 +32,10 @@ async def test_task_assignment_notification_flow(
         assert task.id is not None
         assert task.assigned_to_id == test_user.id
 
-        # Verificar que se publicó evento task.created
-        assert mock_event_publisher.publish.called
-
-        # Verificar que se publicó evento task.assigned
-        calls = mock_event_publisher.publish.call_args_list
-        event_types = [call[1]["event_type"] for call in calls]
+        # Verificar que se guardaron en el outbox task.created y task.assigned
+        event_types = [
+            e.event_type for e in get_outbox_events(db_session, test_tenant.id)
+        ]
 
         assert "task.created" in event_types
         assert "task.assigned" in event_types
@@ -55,8 +54,6 @@ async def test_task_status_change_notification_flow(
             status=TaskStatusEnum.TODO,
         )
 
-        mock_event_publisher.publish.reset_mock()
-
         # Cambiar estado
         updated_task = service.update_task(
             task_id=task.id,
@@ -67,10 +64,10 @@ async def test_task_status_change_notification_flow(
 
         assert updated_task.status == TaskStatusEnum.IN_PROGRESS
 
-        # Verificar que se publicó evento task.updated
-        assert mock_event_publisher.publish.called
-        calls = mock_event_publisher.publish.call_args_list
-        event_types = [call[1]["event_type"] for call in calls]
+        # Verificar que se guardó en el outbox el evento task.updated
+        event_types = [
+            e.event_type for e in get_outbox_events(db_session, test_tenant.id)
+        ]
 
         assert "task.updated" in event_types
 
@@ -148,8 +145,8 @@ async def test_task_from_template_with_notifications(
         assert task.title == "Reunión de equipo"
         assert task.assigned_to_id == test_user.id
 
-        # Verificar que se publicaron eventos
-        assert mock_event_publisher.publish.called
+        # Verificar que se guardaron eventos en el outbox
+        assert get_outbox_events(db_session, test_tenant.id)
 
         # Verificar checklist items
         checklist = service.get_checklist_items(task.id, test_tenant.id)
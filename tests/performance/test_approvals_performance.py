@@ -0,0 +1,192 @@
+"""Performance tests for approval statistics and flow evaluation.
+
+Requires PostgreSQL. The number of approval requests is set with
+APPROVAL_STATS_BENCH_ROWS (default 100,000 requests) and the size of a bulk
+approval with APPROVAL_BULK_BENCH_SIZE (default 500 requests).
+"""
+
+import os
+import time
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert, text
+
+from app.core.approvals.compiled import get_flow_compilation_cache
+from app.core.approvals.service import ApprovalService
+from app.models.approval import ApprovalRequest
+from tests.helpers import p99_ms
+
+
+def _create_flow(service, tenant_id, user_id, steps: int):
+    flow = service.create_approval_flow(
+        flow_data={
+            "name": "Bench Flow",
+            "flow_type": "sequential",
+            "module": "orders",
+            "conditions": {
+                f"step_{order}": {"amount": {"operator": "lt", "value": 100}}
+                for order in range(2, steps + 1, 2)
+            },
+        },
+        tenant_id=tenant_id,
+        user_id=user_id,
+    )
+    for order in range(1, steps + 1):
+        service.add_approval_step(
+            flow.id,
+            tenant_id,
+            {
+                "step_order": order,
+                "name": f"Step {order}",
+                "approver_type": "role",
+                "approver_role": "manager",
+            },
+        )
+    return flow
+
+
+@pytest.mark.performance
+class TestApprovalsPerformance:
+    """Approval statistics and step evaluation as data grows."""
+
+    def test_stats_query_versus_request_count(self, db_session, test_tenant, test_user):
+        """One grouped query counts every request, past the old 10k row cap."""
+        total = int(os.getenv("APPROVAL_STATS_BENCH_ROWS", "100000"))
+        service = ApprovalService(db=db_session)
+        flow = _create_flow(service, test_tenant.id, test_user.id, steps=1)
+        now = datetime.now(UTC)
+        statuses = ("approved", "rejected", "pending")
+        for start in range(0, total, 5000):
+            db_session.execute(
+                insert(ApprovalRequest),
+                [
+                    {
+                        "id": uuid4(),
+                        "tenant_id": test_tenant.id,
+                        "flow_id": flow.id,
+                        "title": f"Request {i}",
+                        "entity_type": "order",
+                        "entity_id": uuid4(),
+                        "status": statuses[i % 3],
+                        "requested_at": now - timedelta(hours=2),
+                        "completed_at": now - timedelta(seconds=i % 3600),
+                    }
+                    for i in range(start, min(start + 5000, total))
+                ],
+            )
+            db_session.commit()
+        db_session.execute(text("ANALYZE approval_requests"))
+
+        latencies = []
+        for _ in range(20):
+            start = time.perf_counter()
+            stats = service.get_approval_stats(test_tenant.id, include_percentiles=True)
+            latencies.append(time.perf_counter() - start)
+
+        print(
+            f"\nApproval stats over {total:,} requests: "
+            f"p99 {p99_ms(latencies):.2f} ms"
+        )
+        assert stats["total_requests"] == total
+        assert sum(stats["status_counts"].values()) == total
+
+    def test_next_step_evaluation_with_compiled_flows(
+        self, db_session, test_tenant, test_user
+    ):
+        """Compiled flows evaluate steps without reloading them."""
+        service = ApprovalService(db=db_session)
+        flow = _create_flow(service, test_tenant.id, test_user.id, steps=20)
+        request = ApprovalRequest(
+            tenant_id=test_tenant.id,
+            flow_id=flow.id,
+            title="Bench Request",
+            entity_type="order",
+            entity_id=uuid4(),
+            current_step=1,
+            request_metadata={"amount": 50},
+        )
+        engine = service.flow_engine
+        cache = get_flow_compilation_cache()
+
+        uncached_latencies, cached_latencies = [], []
+        for _ in range(200):
+            cache.invalidate(flow.id)
+            start = time.perf_counter()
+            engine.get_next_step(request, flow)
+            uncached_latencies.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            next_step = engine.get_next_step(request, flow)
+            cached_latencies.append(time.perf_counter() - start)
+
+        print(
+            f"\nNext step over 20 steps: reload p99 "
+            f"{p99_ms(uncached_latencies):.3f} ms, "
+            f"compiled p99 {p99_ms(cached_latencies):.3f} ms"
+        )
+        assert next_step.step_order == 3
+        assert p99_ms(cached_latencies) < p99_ms(uncached_latencies)
+
+    def test_bulk_approve_versus_one_by_one(self, db_session, test_tenant, test_user):
+        """Bulk approval beats approving the same number of requests one by one."""
+        size = int(os.getenv("APPROVAL_BULK_BENCH_SIZE", "500"))
+        service = ApprovalService(db=db_session)
+        flow = service.create_approval_flow(
+            flow_data={"name": "Bench", "flow_type": "sequential", "module": "orders"},
+            tenant_id=test_tenant.id,
+            user_id=test_user.id,
+        )
+        for order in (1, 2):
+            service.add_approval_step(
+                flow.id,
+                test_tenant.id,
+                {
+                    "step_order": order,
+                    "name": f"Step {order}",
+                    "approver_type": "user",
+                    "approver_id": test_user.id,
+                },
+            )
+
+        def seed() -> list:
+            ids = [uuid4() for _ in range(size)]
+            db_session.execute(
+                insert(ApprovalRequest),
+                [
+                    {
+                        "id": request_id,
+                        "tenant_id": test_tenant.id,
+                        "flow_id": flow.id,
+                        "title": f"Purchase {request_id.hex[:8]}",
+                        "entity_type": "purchase_order",
+                        "entity_id": uuid4(),
+                        "status": "pending",
+                        "requested_by": test_user.id,
+                    }
+                    for request_id in ids
+                ],
+            )
+            db_session.commit()
+            return ids
+
+        # Previous implementation: one approve_request per request
+        ids = seed()
+        start = time.perf_counter()
+        for request_id in ids:
+            service.approve_request(request_id, test_tenant.id, test_user.id)
+        one_by_one = time.perf_counter() - start
+
+        ids = seed()
+        start = time.perf_counter()
+        result = service.bulk_approve_requests(ids, test_tenant.id, test_user.id)
+        bulk = time.perf_counter() - start
+
+        print(
+            f"\nApproving {size:,} requests: one by one {one_by_one * 1000:.0f} ms, "
+            f"bulk {bulk * 1000:.0f} ms"
+        )
+        assert result.errors == []
+        assert all(request.current_step == 2 for request in result.requests)
+        assert bulk < one_by_one
@@ -0,0 +1,131 @@
+"""Performance tests for audit log ingestion and deep-page reads.
+
+Requires PostgreSQL. The number of audit log rows is set with
+AUDIT_BENCH_ROWS (default 100,000); the partitioned layout is meant for
+installations with around 100M rows, so run it with larger values on a
+dedicated database.
+"""
+
+import os
+import time
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from app.core.audit.writer import AuditLogWriter
+from app.repositories.audit_repository import AuditRepository
+from tests.helpers import p99_ms
+
+
+@pytest.mark.performance
+class TestAuditLogPerformance:
+    """Ingest rate and page latency of the partitioned audit log."""
+
+    def test_buffered_copy_ingest_beats_row_inserts(
+        self, db_session, test_tenant, tmp_path
+    ):
+        """COPY batches ingest far more entries per second than row commits."""
+        total = int(os.getenv("AUDIT_BENCH_ROWS", "100000"))
+        repo = AuditRepository(db_session)
+
+        # Previous pattern: one INSERT and commit per audited request
+        row_count = min(total, 2000)
+        start = time.perf_counter()
+        for i in range(row_count):
+            repo.create_audit_log(
+                user_id=None,
+                tenant_id=test_tenant.id,
+                action="bench.row",
+                details={"i": i},
+            )
+        row_rate = row_count / (time.perf_counter() - start)
+
+        writer = AuditLogWriter(
+            session_factory=sessionmaker(bind=db_session.get_bind()),
+            max_buffer=total + 1,
+            spill_path=str(tmp_path / "audit_spill.jsonl"),
+        )
+        write_latencies = []
+        start = time.perf_counter()
+        for i in range(total):
+            call = time.perf_counter()
+            writer.write(
+                user_id=None,
+                tenant_id=test_tenant.id,
+                action="bench.copy",
+                details={"i": i},
+            )
+            write_latencies.append(time.perf_counter() - call)
+        written = writer.flush()
+        copy_rate = total / (time.perf_counter() - start)
+
+        print(
+            f"\nAudit ingest: {row_rate:,.0f} rows/s with row commits, "
+            f"{copy_rate:,.0f} rows/s buffered with COPY "
+            f"(write() p99 {p99_ms(write_latencies):.3f} ms)"
+        )
+        assert written == total
+        assert copy_rate > row_rate * 5
+
+    def test_keyset_deep_pages_stay_flat(self, db_session, test_tenant):
+        """Keyset pages deep in the log cost about the same as the first page."""
+        total = int(os.getenv("AUDIT_BENCH_ROWS", "100000"))
+        page_size = 50
+        repo = AuditRepository(db_session)
+        start = datetime.now(UTC) - timedelta(days=90)
+        step = timedelta(days=90) / total
+        for offset in range(0, total, 10000):
+            repo.copy_audit_logs(
+                [
+                    {
+                        "id": uuid4(),
+                        "tenant_id": test_tenant.id,
+                        "action": "bench.read",
+                        "details": {"role": "admin" if i % 100 == 0 else "user"},
+                        "created_at": start + step * i,
+                    }
+                    for i in range(offset, min(offset + 10000, total))
+                ]
+            )
+            db_session.commit()
+        db_session.execute(text("ANALYZE audit_logs"))
+
+        deep_skip = total - page_size * 2
+        previous, _ = repo.get_audit_logs(
+            tenant_id=test_tenant.id, skip=deep_skip - page_size, limit=page_size
+        )
+        after = (previous[-1].created_at, previous[-1].id)
+
+        offset_latencies, keyset_latencies, filter_latencies = [], [], []
+        for _ in range(20):
+            call = time.perf_counter()
+            logs, _ = repo.get_audit_logs(
+                tenant_id=test_tenant.id, skip=deep_skip, limit=page_size
+            )
+            offset_latencies.append(time.perf_counter() - call)
+
+            call = time.perf_counter()
+            page = repo.get_audit_logs_after(
+                test_tenant.id, after=after, limit=page_size
+            )
+            keyset_latencies.append(time.perf_counter() - call)
+            assert [log.id for log in page] == [log.id for log in logs]
+
+            call = time.perf_counter()
+            repo.get_audit_logs_after(
+                test_tenant.id,
+                limit=page_size,
+                details_filter={"role": "admin"},
+            )
+            filter_latencies.append(time.perf_counter() - call)
+
+        print(
+            f"\nAudit page {deep_skip // page_size} of {total:,} rows: "
+            f"offset p99 {p99_ms(offset_latencies):.2f} ms, "
+            f"keyset p99 {p99_ms(keyset_latencies):.2f} ms, "
+            f"details filter p99 {p99_ms(filter_latencies):.2f} ms"
+        )
+        assert p99_ms(keyset_latencies) < p99_ms(offset_latencies)
@@ -0,0 +1,143 @@
+"""Performance tests for user calendar listings (organizer and attendee events).
+
+Requires PostgreSQL. The number of events per user is set with
+CALENDAR_BENCH_EVENTS (default 100,000).
+"""
+
+import os
+import statistics
+import time
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from app.models.calendar import Calendar, CalendarEvent, EventAttendee
+from app.repositories.calendar_repository import CalendarRepository
+from tests.helpers import p99_ms
+
+
+def _seed(db_session, tenant_id, user_id, events: int) -> None:
+    calendar = Calendar(
+        tenant_id=tenant_id, owner_id=user_id, name="Bench", calendar_type="user"
+    )
+    db_session.add(calendar)
+    db_session.flush()
+
+    # Half organized by the user, half as attendee; one in ten of the organized
+    # events also lists the user as attendee
+    params = {
+        "tenant_id": tenant_id,
+        "user_id": user_id,
+        "calendar_id": calendar.id,
+        "events": events,
+    }
+    db_session.execute(
+        text("""
+            INSERT INTO calendar_events (id, tenant_id, calendar_id, title,
+                                         start_time, end_time, all_day, status,
+                                         recurrence_type, recurrence_interval,
+                                         read_only, organizer_id,
+                                         created_at, updated_at)
+            SELECT gen_random_uuid(), :tenant_id, :calendar_id, 'Event ' || n,
+                   now() - interval '3 years' + n * interval '15 minutes',
+                   now() - interval '3 years' + n * interval '15 minutes'
+                       + interval '30 minutes',
+                   false, 'scheduled', 'none', 1, false,
+                   CASE WHEN n % 2 = 0 THEN :user_id ELSE NULL END, now(), now()
+            FROM generate_series(1, :events) AS n
+            """),
+        params,
+    )
+    db_session.execute(
+        text("""
+            INSERT INTO event_attendees (id, tenant_id, event_id, user_id, status,
+                                         created_at, updated_at)
+            SELECT gen_random_uuid(), :tenant_id, e.id, :user_id, 'pending',
+                   now(), now()
+            FROM calendar_events e
+            WHERE e.calendar_id = :calendar_id
+              AND (e.organizer_id IS NULL OR random() < 0.1)
+            """),
+        params,
+    )
+    db_session.execute(text("ANALYZE calendar_events, event_attendees"))
+
+
+def _legacy_page(db_session, tenant_id, user_id, start_date, skip, limit) -> list:
+    """Previous listing: both queries fully loaded, merged and sliced in Python."""
+    organizer = db_session.query(CalendarEvent).filter(
+        CalendarEvent.organizer_id == user_id,
+        CalendarEvent.tenant_id == tenant_id,
+        CalendarEvent.start_time >= start_date,
+    )
+    attendee = (
+        db_session.query(CalendarEvent)
+        .join(EventAttendee)
+        .filter(
+            EventAttendee.user_id == user_id,
+            CalendarEvent.tenant_id == tenant_id,
+            CalendarEvent.start_time >= start_date,
+        )
+    )
+    events = {event.id: event for event in organizer.all() + attendee.all()}
+    return sorted(events.values(), key=lambda e: e.start_time)[skip : skip + limit]
+
+
+@pytest.mark.performance
+class TestCalendarEventsPerformance:
+    """User calendar pages and counts with a large event history."""
+
+    def test_user_events_latency(self, db_session, test_tenant, test_user):
+        """UNION pages and counts stay fast with 100k events per user."""
+        events = int(os.getenv("CALENDAR_BENCH_EVENTS", "100000"))
+        repo = CalendarRepository(db_session)
+        _seed(db_session, test_tenant.id, test_user.id, events)
+        start_date = datetime.now(UTC) - timedelta(days=365 * 3)
+
+        def measure(query, runs: int = 30) -> list[float]:
+            latencies = []
+            for _ in range(runs):
+                db_session.expunge_all()
+                start = time.perf_counter()
+                query()
+                latencies.append(time.perf_counter() - start)
+            return latencies
+
+        legacy = measure(
+            lambda: _legacy_page(
+                db_session, test_tenant.id, test_user.id, start_date, 100, 20
+            ),
+            runs=5,
+        )
+        pages = measure(
+            lambda: repo.get_events_by_user(
+                test_user.id, test_tenant.id, start_date, skip=100, limit=20
+            )
+        )
+        last = repo.get_events_by_user(
+            test_user.id, test_tenant.id, start_date, skip=80, limit=20
+        )[-1]
+        keyset = measure(
+            lambda: repo.get_events_by_user(
+                test_user.id,
+                test_tenant.id,
+                start_date,
+                limit=20,
+                after=(last.start_time, last.id),
+            )
+        )
+        counts = measure(
+            lambda: repo.count_events_by_user(test_user.id, test_tenant.id, start_date)
+        )
+
+        print(
+            f"\nUser calendar over {events} events:"
+            f"\n  legacy merge in Python: mean {statistics.mean(legacy) * 1000:.1f}ms"
+            f"\n  UNION page:             p99 {p99_ms(pages):.2f}ms"
+            f"\n  UNION keyset page:      p99 {p99_ms(keyset):.2f}ms"
+            f"\n  UNION count:            p99 {p99_ms(counts):.2f}ms"
+        )
+        assert repo.count_events_by_user(test_user.id, test_tenant.id) == events
+        assert p99_ms(pages) < statistics.mean(legacy) * 1000
+        assert p99_ms(keyset) < 50
@@ -0,0 +1,166 @@
+"""Performance tests for meeting slot search over many participants and rooms.
+
+Requires PostgreSQL. Sizes are set with FREEBUSY_BENCH_USERS (default 50) and
+FREEBUSY_BENCH_ROOMS (default 200).
+"""
+
+import os
+import random
+import statistics
+import time
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import or_
+
+from app.core.calendar.freebusy_service import FreeBusyService
+from app.core.calendar.resource_service import CalendarResourceService
+from app.models.calendar import (
+    Calendar,
+    CalendarEvent,
+    CalendarResource,
+    EventAttendee,
+    EventResource,
+)
+from app.models.user import User
+
+WEEK = datetime(2026, 10, 19, 8, tzinfo=UTC)
+STEP = timedelta(minutes=15)
+DURATION = timedelta(minutes=30)
+
+
+def _seed(db_session, tenant_id, users: int, rooms: int) -> tuple[list, list]:
+    rng = random.Random(42)
+    calendar = Calendar(tenant_id=tenant_id, name="Bench", calendar_type="shared")
+    db_session.add(calendar)
+    db_session.flush()
+
+    def event(organizer_id=None) -> CalendarEvent:
+        start = WEEK + timedelta(days=rng.randrange(5), minutes=15 * rng.randrange(36))
+        return CalendarEvent(
+            id=uuid4(),
+            tenant_id=tenant_id,
+            calendar_id=calendar.id,
+            title="Busy",
+            start_time=start,
+            end_time=start + timedelta(minutes=rng.choice([30, 60, 90])),
+            organizer_id=organizer_id,
+        )
+
+    user_ids, room_ids, rows = [], [], []
+    for n in range(users):
+        user = User(
+            email=f"freebusy-{n}-{uuid4().hex[:8]}@example.com",
+            password_hash="x",
+            full_name=f"Participant {n}",
+            tenant_id=tenant_id,
+            is_active=True,
+        )
+        db_session.add(user)
+        db_session.flush()
+        user_ids.append(user.id)
+        rows.extend(event(user.id) for _ in range(20))
+    for n in range(rooms):
+        room = CalendarResource(
+            tenant_id=tenant_id, name=f"Room {n}", resource_type="room", capacity=100
+        )
+        db_session.add(room)
+        db_session.flush()
+        room_ids.append(room.id)
+        for _ in range(25):
+            booking = event()
+            rows.append(booking)
+            rows.append(
+                EventResource(
+                    tenant_id=tenant_id, event_id=booking.id, resource_id=room.id
+                )
+            )
+    db_session.add_all(rows)
+    db_session.commit()
+    return user_ids, room_ids
+
+
+def _slot_by_slot(db_session, tenant_id, user_ids, room_ids, window_end) -> list:
+    """Previous approach: one COUNT per participant and per room for each slot."""
+    resources = CalendarResourceService(db_session)
+    slots = []
+    start = WEEK
+    while start + DURATION <= window_end and len(slots) < 5:
+        end = start + DURATION
+        busy = any(
+            db_session.query(CalendarEvent)
+            .outerjoin(EventAttendee)
+            .filter(
+                CalendarEvent.tenant_id == tenant_id,
+                or_(
+                    CalendarEvent.organizer_id == user_id,
+                    EventAttendee.user_id == user_id,
+                ),
+                CalendarEvent.start_time < end,
+                CalendarEvent.end_time > start,
+                CalendarEvent.status != "cancelled",
+            )
+            .count()
+            for user_id in user_ids
+        )
+        if not busy:
+            rooms = tuple(
+                room_id
+                for room_id in room_ids
+                if resources.check_resource_availability(room_id, tenant_id, start, end)
+            )
+            if rooms:
+                slots.append((start, end, rooms))
+        start += STEP
+    return slots
+
+
+@pytest.mark.performance
+class TestCalendarFreeBusyPerformance:
+    """First free slots for a large meeting with many candidate rooms."""
+
+    def test_meeting_slot_search(self, db_session, test_tenant):
+        """One busy query per kind and a sweep beat per-slot COUNT queries."""
+        user_ids, room_ids = _seed(
+            db_session,
+            test_tenant.id,
+            int(os.getenv("FREEBUSY_BENCH_USERS", "50")),
+            int(os.getenv("FREEBUSY_BENCH_ROOMS", "200")),
+        )
+        window_end = WEEK + timedelta(days=5, hours=10)
+        service = FreeBusyService(db_session)
+
+        start = time.perf_counter()
+        expected = _slot_by_slot(
+            db_session, test_tenant.id, user_ids, room_ids, window_end
+        )
+        naive_elapsed = time.perf_counter() - start
+
+        latencies = []
+        for _ in range(10):
+            db_session.expunge_all()
+            start = time.perf_counter()
+            slots = service.find_meeting_slots(
+                test_tenant.id,
+                user_ids,
+                WEEK,
+                window_end,
+                DURATION,
+                limit=5,
+                step=STEP,
+                resource_ids=room_ids,
+            )
+            latencies.append(time.perf_counter() - start)
+
+        print(
+            f"\nFirst 5 slots for {len(user_ids)} participants and "
+            f"{len(room_ids)} rooms:"
+            f"\n  COUNT per participant/room/slot: {naive_elapsed * 1000:.0f}ms"
+            f"\n  free/busy sweep:                 median "
+            f"{statistics.median(latencies) * 1000:.1f}ms"
+        )
+        assert [
+            (slot.start_time, slot.end_time, set(slot.resource_ids)) for slot in slots
+        ] == [(start, end, set(rooms)) for start, end, rooms in expected]
+        assert statistics.median(latencies) < naive_elapsed / 10
@@ -0,0 +1,102 @@
+"""Performance tests for expanding recurring calendar events.
+
+Runs in memory (no database): a month view over recurring series that started
+years ago. The number of series is set with CALENDAR_BENCH_SERIES (default 500).
+"""
+
+import os
+import time
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.core.calendar.recurrence import (
+    OccurrenceCache,
+    event_rule,
+    event_zone,
+    iter_event_starts,
+    iter_rule,
+)
+from app.models.calendar import CalendarEvent
+from tests.helpers import p99_ms
+
+RULES = [
+    "FREQ=DAILY",
+    "FREQ=WEEKLY;BYDAY=MO,WE,FR",
+    "FREQ=WEEKLY;INTERVAL=2;BYDAY=TU",
+    "FREQ=MONTHLY;BYDAY=-1FR",
+    "FREQ=MONTHLY;BYMONTHDAY=1,15",
+    "FREQ=YEARLY",
+]
+ZONES = ["UTC", "Europe/Berlin", "America/New_York", "Asia/Tokyo"]
+
+
+def _series(count: int) -> list[CalendarEvent]:
+    origin = datetime(2019, 1, 7, 8, tzinfo=UTC)
+    events = []
+    for n in range(count):
+        start = origin + timedelta(days=n % 700, minutes=15 * (n % 40))
+        events.append(
+            CalendarEvent(
+                id=uuid4(),
+                title=f"Series {n}",
+                start_time=start,
+                end_time=start + timedelta(minutes=30),
+                timezone=ZONES[n % len(ZONES)],
+                recurrence_type="none",
+                recurrence_rule=RULES[n % len(RULES)],
+                recurrence_exdates=[(start + timedelta(days=7)).isoformat()],
+            )
+        )
+    return events
+
+
+def _full_walk(event: CalendarEvent, start: datetime, end: datetime) -> list:
+    """Expansion from DTSTART without skipping ahead to the window."""
+    duration = event.end_time - event.start_time
+    starts = []
+    for occurrence in iter_rule(event_rule(event), event.start_time, event_zone(event)):
+        if occurrence >= end:
+            break
+        if occurrence + duration > start:
+            starts.append(occurrence)
+    return starts
+
+
+@pytest.mark.performance
+class TestCalendarRecurrencePerformance:
+    """Month view over many long-running recurring series."""
+
+    def test_month_view_expansion(self):
+        """Windowed expansion beats a full walk; cached windows are near free."""
+        series = _series(int(os.getenv("CALENDAR_BENCH_SERIES", "500")))
+        window = (datetime(2026, 10, 1, tzinfo=UTC), datetime(2026, 11, 1, tzinfo=UTC))
+
+        def month_view(expand) -> tuple[float, int]:
+            start = time.perf_counter()
+            total = sum(len(expand(event)) for event in series)
+            return time.perf_counter() - start, total
+
+        walk_elapsed, walk_total = month_view(lambda e: _full_walk(e, *window))
+        windowed = [
+            month_view(lambda e: list(iter_event_starts(e, *window))) for _ in range(20)
+        ]
+        cache = OccurrenceCache(maxsize=len(series))
+        cold_elapsed, cold_total = month_view(lambda e: cache.get(e, *window))
+        cached = [month_view(lambda e: cache.get(e, *window)) for _ in range(100)]
+
+        windowed_latencies = [elapsed for elapsed, _ in windowed]
+        cached_latencies = [elapsed for elapsed, _ in cached]
+        print(
+            f"\nMonth view over {len(series)} recurring series ({cold_total} occurrences):"
+            f"\n  full walk from DTSTART: {walk_elapsed * 1000:.1f}ms"
+            f"\n  windowed expansion:     p99 {p99_ms(windowed_latencies):.2f}ms"
+            f"\n  cold cache:             {cold_elapsed * 1000:.2f}ms"
+            f"\n  cached:                 p99 {p99_ms(cached_latencies):.2f}ms"
+        )
+        # Exdates are applied by windowed expansion only
+        assert windowed[0][1] == cold_total <= walk_total
+        assert cache.get_stats()["hits"] == 100 * len(series)
+        assert p99_ms(windowed_latencies) < walk_elapsed * 1000
+        assert p99_ms(cached_latencies) < p99_ms(windowed_latencies)
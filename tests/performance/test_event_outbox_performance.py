@@ -0,0 +1,116 @@
+"""Performance tests for publishing events through the transactional outbox.
+
+Requires PostgreSQL and a running Redis. The number of events is set with
+OUTBOX_BENCH_EVENTS (default 10,000).
+"""
+
+import os
+import statistics
+import time
+from uuid import uuid4
+
+import pytest
+import redis.asyncio as redis
+from sqlalchemy import update
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config_file import get_settings
+from app.core.pubsub.client import RedisStreamsClient
+from app.core.pubsub.models import Event, EventMetadata
+from app.core.pubsub.outbox import OutboxRelay, enqueue_event
+from app.models.event_outbox import EventOutbox
+from tests.helpers import p99_ms
+
+BENCH_STREAM = "bench:outbox"
+
+
+def _redis_url() -> str:
+    settings = get_settings()
+    url = os.getenv("REDIS_URL") or os.getenv("TEST_REDIS_URL") or settings.REDIS_URL
+    # Docker hostname when running outside the compose network
+    return url.replace("redis:6379", "localhost:6379")
+
+
+@pytest.mark.performance
+@pytest.mark.redis
+class TestEventOutboxPerformance:
+    """Write-path latency and relay throughput of the event outbox."""
+
+    @pytest.mark.asyncio
+    async def test_outbox_write_latency_and_drain(
+        self, db_session, test_tenant, redis_available
+    ):
+        """Outbox inserts beat inline XADD per request; the relay drains in bulk."""
+        if not redis_available:
+            pytest.skip("Redis not available")
+
+        total = int(os.getenv("OUTBOX_BENCH_EVENTS", "10000"))
+        metadata = EventMetadata(source="bench", version="1.0")
+        client = redis.from_url(_redis_url(), decode_responses=True)
+
+        try:
+            # Previous pattern: commit, then wait for XADD inside the request
+            inline = []
+            for _ in range(total):
+                start = time.perf_counter()
+                db_session.commit()
+                event = Event(
+                    event_type="bench.created",
+                    entity_type="bench",
+                    entity_id=uuid4(),
+                    tenant_id=test_tenant.id,
+                    metadata=metadata,
+                )
+                await client.xadd(BENCH_STREAM, event.to_redis_dict())
+                inline.append(time.perf_counter() - start)
+
+            outbox = []
+            for _ in range(total):
+                start = time.perf_counter()
+                enqueue_event(
+                    db_session,
+                    event_type="bench.created",
+                    entity_type="bench",
+                    entity_id=uuid4(),
+                    tenant_id=test_tenant.id,
+                    metadata=metadata,
+                )
+                db_session.commit()
+                outbox.append(time.perf_counter() - start)
+
+            db_session.execute(
+                update(EventOutbox)
+                .where(EventOutbox.tenant_id == test_tenant.id)
+                .values(stream=BENCH_STREAM)
+            )
+            db_session.commit()
+
+            relay = OutboxRelay(
+                session_factory=sessionmaker(bind=db_session.get_bind()),
+                client=RedisStreamsClient(redis_url=_redis_url()),
+                batch_size=500,
+            )
+            published = 0
+            start = time.perf_counter()
+            while True:
+                result = await relay.relay_batch()
+                if not result["published"]:
+                    break
+                published += result["published"]
+            drain_elapsed = time.perf_counter() - start
+            await relay.client.close()
+        finally:
+            await client.delete(BENCH_STREAM)
+            await client.aclose()
+
+        print(
+            f"\nEvent publication for {total} write requests:"
+            f"\n  inline XADD: p99 {p99_ms(inline):.2f}ms, "
+            f"mean {statistics.mean(inline) * 1000:.2f}ms"
+            f"\n  outbox:      p99 {p99_ms(outbox):.2f}ms, "
+            f"mean {statistics.mean(outbox) * 1000:.2f}ms"
+            f"\n  relay drain: {published} events in {drain_elapsed:.2f}s "
+            f"({published / drain_elapsed:.0f} events/s)"
+        )
+        assert published == total
+        assert published / drain_elapsed > 1000
@@ -0,0 +1,169 @@
+"""Performance tests for stock on hand queries.
+
+Requires PostgreSQL. The ledger size is set with INVENTORY_BALANCE_BENCH_MOVES
+(default 10,000,000 moves) spread over INVENTORY_BALANCE_BENCH_PRODUCTS
+(default 1,000) products and ten locations in two warehouses.
+"""
+
+import os
+import random
+import time
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import case, func, insert, or_, select, text
+
+from app.modules.inventory.models.inventory import StockMove
+from app.modules.inventory.services.inventory_service import InventoryService
+from app.modules.products.models.product import Product
+from tests.helpers import p99_ms
+
+
+@pytest.mark.performance
+class TestInventoryBalancePerformance:
+    """Balance lookups against summing the move ledger."""
+
+    def test_on_hand_query_versus_ledger_sum(self, db_session, test_tenant):
+        """On hand and warehouse totals read the projection, not the ledger."""
+        total = int(os.getenv("INVENTORY_BALANCE_BENCH_MOVES", "10000000"))
+        product_count = int(os.getenv("INVENTORY_BALANCE_BENCH_PRODUCTS", "1000"))
+        service = InventoryService(db_session)
+        warehouses = [
+            service.create_warehouse(
+                test_tenant.id, {"name": f"Bench {i}", "code": f"BENCH{i}"}
+            )
+            for i in range(2)
+        ]
+        locations = [
+            service.create_location(
+                test_tenant.id,
+                warehouses[i % 2].id,
+                {"name": f"Bin {i}", "code": f"BIN{i}"},
+            )
+            for i in range(10)
+        ]
+        product_ids = [uuid4() for _ in range(product_count)]
+        db_session.execute(
+            insert(Product),
+            [
+                {
+                    "id": product_id,
+                    "tenant_id": test_tenant.id,
+                    "sku": f"BENCH-{product_id.hex[:12]}",
+                    "name": "Bench Product",
+                    "currency": "USD",
+                    "is_active": True,
+                    "track_inventory": True,
+                }
+                for product_id in product_ids
+            ],
+        )
+        db_session.commit()
+
+        # Receipts into every location, then transfers between neighbours
+        params = {
+            "tenant_id": test_tenant.id,
+            "products": [str(product_id) for product_id in product_ids],
+            "locations": [str(location.id) for location in locations],
+        }
+        for start in range(0, total, 500000):
+            db_session.execute(
+                text("""
+                    INSERT INTO stock_moves (
+                        id, tenant_id, product_id, from_location_id,
+                        to_location_id, quantity, unit_cost, move_type, created_at
+                    )
+                    SELECT
+                        gen_random_uuid(),
+                        :tenant_id,
+                        (CAST(:products AS uuid[]))[1 + i % :product_count],
+                        CASE WHEN i % 4 = 3
+                            THEN (CAST(:locations AS uuid[]))[1 + (i / :product_count + 1) % 10]
+                        END,
+                        (CAST(:locations AS uuid[]))[1 + (i / :product_count) % 10],
+                        CASE WHEN i % 4 = 3 THEN 1 ELSE 2 END,
+                        1,
+                        CASE WHEN i % 4 = 3 THEN 'transfer' ELSE 'receipt' END,
+                        now() - make_interval(secs => :total - i)
+                    FROM generate_series(:start, :end) AS i
+                    """),
+                {
+                    **params,
+                    "product_count": product_count,
+                    "total": total,
+                    "start": start,
+                    "end": min(start + 500000, total) - 1,
+                },
+            )
+            db_session.commit()
+        db_session.execute(text("ANALYZE stock_moves"))
+        start = time.perf_counter()
+        service.balances.rebuild(test_tenant.id)
+        rebuild = time.perf_counter() - start
+        db_session.execute(text("ANALYZE stock_balances"))
+
+        def ledger_on_hand(product_id, location_id):
+            return db_session.scalar(
+                select(
+                    func.coalesce(
+                        func.sum(
+                            case(
+                                (
+                                    StockMove.to_location_id == location_id,
+                                    StockMove.quantity,
+                                ),
+                                else_=0,
+                            )
+                            - case(
+                                (
+                                    StockMove.from_location_id == location_id,
+                                    StockMove.quantity,
+                                ),
+                                else_=0,
+                            )
+                        ),
+                        0,
+                    )
+                ).where(
+                    StockMove.tenant_id == test_tenant.id,
+                    StockMove.product_id == product_id,
+                    or_(
+                        StockMove.from_location_id == location_id,
+                        StockMove.to_location_id == location_id,
+                    ),
+                )
+            )
+
+        rng = random.Random(7)
+        ledger_latencies, balance_latencies = [], []
+        for _ in range(100):
+            product_id = rng.choice(product_ids)
+            location_id = rng.choice(locations).id
+
+            start = time.perf_counter()
+            expected = ledger_on_hand(product_id, location_id)
+            ledger_latencies.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            balance = service.balances.get_on_hand(
+                test_tenant.id, product_id, location_id
+            )
+            balance_latencies.append(time.perf_counter() - start)
+            assert (balance.quantity if balance else 0) == expected
+
+        rollup_latencies = []
+        for _ in range(20):
+            start = time.perf_counter()
+            rows = service.balances.get_warehouse_stock(
+                test_tenant.id, warehouse_id=warehouses[0].id, limit=product_count
+            )
+            rollup_latencies.append(time.perf_counter() - start)
+
+        print(
+            f"\nOn hand over {total:,} moves: ledger sum p99 "
+            f"{p99_ms(ledger_latencies):.2f} ms, balance p99 "
+            f"{p99_ms(balance_latencies):.2f} ms; warehouse rollup of "
+            f"{len(rows):,} products p99 {p99_ms(rollup_latencies):.2f} ms; "
+            f"rebuild from ledger {rebuild:.1f} s"
+        )
+        assert p99_ms(balance_latencies) < p99_ms(ledger_latencies)
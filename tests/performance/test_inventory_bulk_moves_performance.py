@@ -0,0 +1,86 @@
+"""Performance tests for bulk stock move imports.
+
+Requires PostgreSQL. The batch size is set with INVENTORY_BULK_BENCH_LINES
+(default 3,000 lines over 100 products and ten locations).
+"""
+
+import os
+import time
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert
+
+from app.modules.inventory.services.inventory_service import InventoryService
+from app.modules.products.models.product import Product
+
+
+@pytest.mark.performance
+class TestInventoryBulkMovesPerformance:
+    """One bulk call against one create_stock_move call per line."""
+
+    def test_bulk_import_throughput(self, db_session, test_tenant, test_user):
+        """The bulk path validates and writes the batch in a fixed number of trips."""
+        total = int(os.getenv("INVENTORY_BULK_BENCH_LINES", "3000"))
+        inventory = InventoryService(db_session)
+        warehouse = inventory.create_warehouse(
+            test_tenant.id, {"name": "Bench", "code": "BENCH"}
+        )
+        locations = [
+            inventory.create_location(
+                test_tenant.id, warehouse.id, {"name": f"Bin {i}", "code": f"BIN{i}"}
+            ).id
+            for i in range(10)
+        ]
+        product_ids = [uuid4() for _ in range(100)]
+        db_session.execute(
+            insert(Product),
+            [
+                {
+                    "id": product_id,
+                    "tenant_id": test_tenant.id,
+                    "sku": f"BENCH-{product_id.hex[:12]}",
+                    "name": "Bench Product",
+                    "currency": "USD",
+                    "is_active": True,
+                    "track_inventory": True,
+                }
+                for product_id in product_ids
+            ],
+        )
+        db_session.commit()
+
+        def lines():
+            return [
+                {
+                    "product_id": product_ids[i % len(product_ids)],
+                    "to_location_id": locations[i % len(locations)],
+                    "quantity": Decimal(5),
+                    "unit_cost": Decimal(1 + i % 7),
+                    "move_type": "receipt",
+                    "reference": f"PO-{i}",
+                }
+                for i in range(total)
+            ]
+
+        start = time.perf_counter()
+        result = inventory.create_stock_moves(test_tenant.id, test_user.id, lines())
+        bulk_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for line in lines():
+            inventory.create_stock_move(test_tenant.id, test_user.id, line)
+        single_time = time.perf_counter() - start
+
+        print(
+            f"\nImport of {total:,} stock move lines: bulk {bulk_time:.2f} s "
+            f"({total / bulk_time:,.0f} lines/s), one by one {single_time:.2f} s "
+            f"({total / single_time:,.0f} lines/s)"
+        )
+        assert len(result.moves) == total
+        assert not result.errors
+        assert len(inventory.list_stock_moves(test_tenant.id, limit=2 * total)) == (
+            2 * total
+        )
+        assert bulk_time < single_time
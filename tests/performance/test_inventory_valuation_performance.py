@@ -0,0 +1,142 @@
+"""Performance tests for point-in-time stock valuation.
+
+Requires PostgreSQL. The ledger size is set with
+INVENTORY_VALUATION_BENCH_MOVES (default 10,000,000 moves over 1,000 products
+and ten locations, one per minute of history).
+"""
+
+import os
+import time
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert, text
+
+from app.core.config_file import get_settings
+from app.modules.inventory.services.costing import FIFO
+from app.modules.inventory.services.inventory_service import InventoryService
+from app.modules.inventory.services.valuation_service import StockValuationService
+from app.modules.products.models.product import Product
+
+
+@pytest.mark.performance
+class TestInventoryValuationPerformance:
+    """Full ledger replays against partitioned and checkpointed ones."""
+
+    def test_as_of_valuation_with_partitions_and_checkpoints(
+        self, db_session, test_tenant, monkeypatch
+    ):
+        """Checkpoints bound the replay to the moves since; partitions split it."""
+        total = int(os.getenv("INVENTORY_VALUATION_BENCH_MOVES", "10000000"))
+        product_count = 1000
+        inventory = InventoryService(db_session)
+        warehouse = inventory.create_warehouse(
+            test_tenant.id, {"name": "Bench", "code": "BENCH"}
+        )
+        locations = [
+            inventory.create_location(
+                test_tenant.id, warehouse.id, {"name": f"Bin {i}", "code": f"BIN{i}"}
+            )
+            for i in range(10)
+        ]
+        product_ids = [uuid4() for _ in range(product_count)]
+        db_session.execute(
+            insert(Product),
+            [
+                {
+                    "id": product_id,
+                    "tenant_id": test_tenant.id,
+                    "sku": f"BENCH-{product_id.hex[:12]}",
+                    "name": "Bench Product",
+                    "currency": "USD",
+                    "is_active": True,
+                    "track_inventory": True,
+                }
+                for product_id in product_ids
+            ],
+        )
+        db_session.commit()
+
+        # Two receipts at rising costs, then a sale and a transfer
+        end = datetime.now(UTC) - timedelta(days=1)
+        begin = end - timedelta(minutes=total)
+        for start in range(0, total, 500000):
+            db_session.execute(
+                text("""
+                    INSERT INTO stock_moves (
+                        id, tenant_id, product_id, from_location_id,
+                        to_location_id, quantity, unit_cost, move_type, created_at
+                    )
+                    SELECT
+                        gen_random_uuid(),
+                        :tenant_id,
+                        (CAST(:products AS uuid[]))[1 + i % :product_count],
+                        CASE WHEN i % 4 >= 2 THEN loc END,
+                        CASE
+                            WHEN i % 4 < 2 THEN loc
+                            WHEN i % 4 = 3
+                            THEN (CAST(:locations AS uuid[]))[1 + (i + 1) % 10]
+                        END,
+                        CASE WHEN i % 4 < 2 THEN 3 ELSE 1 END,
+                        CASE WHEN i % 4 < 2 THEN 1 + (i % 97) / 10.0 END,
+                        CASE WHEN i % 4 < 2 THEN 'receipt' ELSE 'issue' END,
+                        CAST(:begin AS timestamptz) + make_interval(mins => i)
+                    FROM generate_series(:start, :end) AS i,
+                        LATERAL (
+                            SELECT (CAST(:locations AS uuid[]))[
+                                1 + (i / :product_count) % 10
+                            ] AS loc
+                        ) AS l
+                    """),
+                {
+                    "tenant_id": test_tenant.id,
+                    "products": [str(product_id) for product_id in product_ids],
+                    "locations": [str(location.id) for location in locations],
+                    "product_count": product_count,
+                    "begin": begin,
+                    "start": start,
+                    "end": min(start + 500000, total) - 1,
+                },
+            )
+            db_session.commit()
+        db_session.execute(text("ANALYZE stock_moves"))
+
+        service = StockValuationService(db_session)
+        settings = get_settings()
+
+        def timed(**kwargs):
+            start = time.perf_counter()
+            report = service.valuation_as_of(test_tenant.id, end, FIFO, **kwargs)
+            return report, time.perf_counter() - start
+
+        monkeypatch.setattr(settings, "INVENTORY_VALUATION_WORKERS", 1)
+        sequential, sequential_time = timed()
+        monkeypatch.setattr(settings, "INVENTORY_VALUATION_WORKERS", 8)
+        partitioned, partitioned_time = timed()
+        single_product, single_product_time = timed(product_id=product_ids[0])
+
+        start = time.perf_counter()
+        checkpoint = service.create_checkpoint(
+            test_tenant.id, FIFO, as_of=end - timedelta(minutes=total // 100)
+        )
+        checkpoint_time = time.perf_counter() - start
+        checkpointed, checkpointed_time = timed()
+
+        rate = total / sequential_time
+        print(
+            f"\nFIFO valuation over {total:,} moves: one partition "
+            f"{sequential_time:.1f} s ({rate:,.0f} moves/s), 8 partitions "
+            f"{partitioned_time:.1f} s, one product {single_product_time:.2f} s; "
+            f"checkpoint {checkpoint_time:.1f} s, then as-of "
+            f"{checkpointed_time:.2f} s replaying "
+            f"{checkpointed['replayed_moves']:,} moves"
+        )
+        assert sequential["replayed_moves"] == total
+        assert partitioned["lines"] == sequential["lines"]
+        assert checkpointed["lines"] == sequential["lines"]
+        assert single_product["lines"] == [
+            line for line in sequential["lines"] if line["product_id"] == product_ids[0]
+        ]
+        assert checkpoint.move_count + checkpointed["replayed_moves"] == total
+        assert checkpointed_time < sequential_time
@@ -0,0 +1,121 @@
+"""Performance tests for task cache invalidation under load.
+
+Requires a running Redis. The keyspace size is set with
+TASK_CACHE_BENCH_KEYS (default 1,000,000 keys).
+"""
+
+import asyncio
+import os
+import time
+from uuid import uuid4
+
+import pytest
+import redis.asyncio as redis
+
+from app.core.cache.generations import CacheGenerations, tenant_scope
+from app.core.config_file import get_settings
+from tests.helpers import p99_ms
+
+BENCH_PREFIX = "bench:tasks"
+
+
+def _redis_url() -> str:
+    settings = get_settings()
+    url = os.getenv("REDIS_URL") or os.getenv("TEST_REDIS_URL") or settings.REDIS_URL
+    # Docker hostname when running outside the compose network
+    return url.replace("redis:6379", "localhost:6379")
+
+
+async def _populate(client: redis.Redis, tenants: list[str], total: int) -> None:
+    per_tenant = total // len(tenants)
+    for tenant in tenants:
+        for start in range(0, per_tenant, 10_000):
+            async with client.pipeline(transaction=False) as pipe:
+                for n in range(start, min(start + 10_000, per_tenant)):
+                    pipe.setex(f"{BENCH_PREFIX}:visible:{tenant}:{n}", 600, "[]")
+                await pipe.execute()
+
+
+async def _cleanup(client: redis.Redis) -> None:
+    batch = []
+    async for key in client.scan_iter(match=f"{BENCH_PREFIX}:*", count=10_000):
+        batch.append(key)
+        if len(batch) >= 10_000:
+            await client.unlink(*batch)
+            batch.clear()
+    if batch:
+        await client.unlink(*batch)
+
+
+async def _read_latencies(
+    client: redis.Redis, key: str, stop: asyncio.Event
+) -> list[float]:
+    latencies = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        await client.get(key)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+@pytest.mark.performance
+@pytest.mark.redis
+class TestTaskCachePerformance:
+    """Redis read latency while task caches are being invalidated."""
+
+    @pytest.mark.asyncio
+    async def test_invalidation_storm_latency(self, redis_available):
+        """Generation bumps keep p99 reads flat; KEYS scans stall Redis."""
+        if not redis_available:
+            pytest.skip("Redis not available")
+
+        total = int(os.getenv("TASK_CACHE_BENCH_KEYS", "1000000"))
+        invalidations = 20
+        tenants = [str(uuid4()) for _ in range(10)]
+        writer = redis.from_url(_redis_url(), decode_responses=True)
+        reader = redis.from_url(_redis_url(), decode_responses=True)
+        generations = CacheGenerations(BENCH_PREFIX)
+        hot_key = f"{BENCH_PREFIX}:hot"
+
+        async def storm(invalidate) -> tuple[list[float], float]:
+            stop = asyncio.Event()
+            reads = asyncio.create_task(_read_latencies(reader, hot_key, stop))
+            await asyncio.sleep(0.05)
+            start = time.perf_counter()
+            for n in range(invalidations):
+                await invalidate(tenants[n % len(tenants)])
+            elapsed = time.perf_counter() - start
+            stop.set()
+            return await reads, elapsed
+
+        async def invalidate_with_keys(tenant: str) -> None:
+            # Previous pattern; KEYS walks the whole keyspace whatever it matches
+            keys = await writer.keys(f"{BENCH_PREFIX}:visible:{tenant}:*")
+            if keys:
+                await writer.delete(*keys)
+
+        async def invalidate_with_generations(tenant: str) -> None:
+            await generations.bump(writer, [tenant_scope(tenant)])
+
+        try:
+            await writer.set(hot_key, "[]")
+            await _populate(writer, tenants, total)
+
+            keys_latencies, keys_elapsed = await storm(invalidate_with_keys)
+            gen_latencies, gen_elapsed = await storm(invalidate_with_generations)
+        finally:
+            await _cleanup(writer)
+            await reader.aclose()
+            await writer.aclose()
+
+        keys_p99 = p99_ms(keys_latencies)
+        gen_p99 = p99_ms(gen_latencies)
+        print(
+            f"\nInvalidation storm over {total} keys ({invalidations} invalidations):"
+            f"\n  KEYS pattern: p99 GET {keys_p99:.2f}ms, "
+            f"max {max(keys_latencies) * 1000:.1f}ms, total {keys_elapsed:.2f}s"
+            f"\n  generations:  p99 GET {gen_p99:.2f}ms, "
+            f"max {max(gen_latencies) * 1000:.1f}ms, total {gen_elapsed:.4f}s"
+        )
+        assert gen_elapsed < keys_elapsed
+        assert gen_p99 < keys_p99
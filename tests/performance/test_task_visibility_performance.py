@@ -0,0 +1,156 @@
+"""Performance tests for visible task lists read from the task_visibility projection.
+
+Requires PostgreSQL. The data set size is set with TASK_VISIBILITY_BENCH_TASKS
+(default 1,000,000 tasks) and TASK_VISIBILITY_BENCH_USERS (default 10,000 users).
+"""
+
+import os
+import random
+import time
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import and_, insert, or_, text
+from sqlalchemy.orm import aliased
+
+from app.models.task import Task, TaskAssignment
+from app.models.user import User
+from app.repositories.task_repository import TaskRepository
+from tests.helpers import p99_ms
+
+
+def _seed(db_session, tenant_id, users: int, tasks: int) -> list:
+    user_ids = [uuid4() for _ in range(users)]
+    for start in range(0, users, 1000):
+        db_session.execute(
+            insert(User),
+            [
+                {
+                    "id": user_id,
+                    "email": f"test-{user_id.hex}@example.com",
+                    "password_hash": "x",
+                    "tenant_id": tenant_id,
+                }
+                for user_id in user_ids[start : start + 1000]
+            ],
+        )
+
+    # Random creators and assignees; one extra assignment per 5 tasks
+    params = {"tenant_id": tenant_id, "tasks": tasks, "users": users}
+    db_session.execute(
+        text("""
+            WITH u AS (
+                SELECT array_agg(id) AS ids FROM users WHERE tenant_id = :tenant_id
+            )
+            INSERT INTO tasks (id, tenant_id, title, status, priority, all_day,
+                               created_by_id, assigned_to_id, created_at, updated_at)
+            SELECT gen_random_uuid(), :tenant_id, 'Task ' || n,
+                   (ARRAY['todo', 'in_progress', 'done'])[1 + n % 3],
+                   (ARRAY['low', 'medium', 'high'])[1 + n % 3], false,
+                   u.ids[1 + floor(random() * :users)::int],
+                   u.ids[1 + floor(random() * :users)::int],
+                   now() - n * interval '1 second', now()
+            FROM u, generate_series(1, :tasks) AS n
+            """),
+        params,
+    )
+    db_session.execute(
+        text("""
+            WITH u AS (
+                SELECT array_agg(id) AS ids FROM users WHERE tenant_id = :tenant_id
+            )
+            INSERT INTO task_assignments (id, tenant_id, task_id, assigned_to_id,
+                                          created_by_id, assigned_at,
+                                          created_at, updated_at)
+            SELECT gen_random_uuid(), :tenant_id, t.id,
+                   u.ids[1 + floor(random() * :users)::int], t.created_by_id,
+                   now(), now(), now()
+            FROM u, tasks t
+            WHERE t.tenant_id = :tenant_id AND random() < 0.2
+            """),
+        params,
+    )
+    return user_ids
+
+
+def _legacy_page(db_session, tenant_id, user_id, limit: int = 20) -> list:
+    """Previous visibility query: OR over an outer join, then DISTINCT."""
+    assignment = aliased(TaskAssignment)
+    return (
+        db_session.query(Task)
+        .filter(Task.tenant_id == tenant_id)
+        .outerjoin(
+            assignment,
+            and_(
+                assignment.task_id == Task.id,
+                assignment.tenant_id == tenant_id,
+                assignment.assigned_to_id == user_id,
+            ),
+        )
+        .filter(
+            or_(
+                Task.created_by_id == user_id,
+                Task.assigned_to_id == user_id,
+                assignment.id.isnot(None),
+            )
+        )
+        .distinct()
+        .order_by(Task.created_at.desc())
+        .limit(limit)
+        .all()
+    )
+
+
+@pytest.mark.performance
+class TestTaskVisibilityPerformance:
+    """Visible task pages and counts at scale."""
+
+    def test_visible_tasks_latency(self, db_session, test_tenant):
+        """Projection pages and counts stay fast with 1M tasks and 10k users."""
+        tasks = int(os.getenv("TASK_VISIBILITY_BENCH_TASKS", "1000000"))
+        users = int(os.getenv("TASK_VISIBILITY_BENCH_USERS", "10000"))
+        repo = TaskRepository(db_session)
+        user_ids = _seed(db_session, test_tenant.id, users, tasks)
+
+        start = time.perf_counter()
+        rows = repo.visibility.rebuild_tenant(test_tenant.id)
+        rebuild_elapsed = time.perf_counter() - start
+        db_session.execute(text("ANALYZE tasks, task_assignments, task_visibility"))
+
+        sample = random.sample(user_ids, min(200, len(user_ids)))
+
+        def measure(query) -> list[float]:
+            latencies = []
+            for user_id in sample:
+                start = time.perf_counter()
+                query(user_id)
+                latencies.append(time.perf_counter() - start)
+            return latencies
+
+        legacy = measure(
+            lambda user_id: _legacy_page(db_session, test_tenant.id, user_id)
+        )
+        pages = measure(
+            lambda user_id: repo.get_visible_tasks(test_tenant.id, user_id, limit=20)
+        )
+        counts = measure(
+            lambda user_id: repo.count_visible_tasks(test_tenant.id, user_id)
+        )
+        last = repo.get_visible_tasks(test_tenant.id, sample[0], skip=80, limit=20)[-1]
+        keyset = measure(
+            lambda user_id: repo.get_visible_tasks(
+                test_tenant.id, user_id, limit=20, after=(last.created_at, last.id)
+            )
+        )
+
+        print(
+            f"\nVisible tasks over {tasks} tasks / {users} users"
+            f" ({rows} visibility rows, rebuilt in {rebuild_elapsed:.1f}s):"
+            f"\n  legacy OR + DISTINCT page: p99 {p99_ms(legacy):.2f}ms"
+            f"\n  projection page:           p99 {p99_ms(pages):.2f}ms"
+            f"\n  projection keyset page:    p99 {p99_ms(keyset):.2f}ms"
+            f"\n  projection count:          p99 {p99_ms(counts):.2f}ms"
+        )
+        assert p99_ms(pages) < p99_ms(legacy)
+        assert p99_ms(pages) < 50
+        assert p99_ms(counts) < 50
@@ -0,0 +1,117 @@
+"""Performance tests for indexed activity search versus table size.
+
+Requires PostgreSQL with pg_trgm. The largest table size is set with
+TEXT_SEARCH_BENCH_ROWS (default 200,000 activities); latency is measured at
+a quarter, half and all of it.
+"""
+
+import os
+import random
+import time
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert, or_, text
+
+from app.models.activity import Activity
+from app.repositories.activity_repository import ActivityRepository
+from tests.helpers import p99_ms
+
+WORDS = (
+    "invoice order shipment review meeting customer supplier payment refund "
+    "warehouse contract quote follow call email delivery return budget"
+).split()
+
+
+def _seed(db_session, tenant_id, rows: int, offset: int) -> None:
+    now = datetime.now(UTC)
+    rng = random.Random(offset)
+    for start in range(offset, offset + rows, 5000):
+        db_session.execute(
+            insert(Activity),
+            [
+                {
+                    "id": uuid4(),
+                    "tenant_id": tenant_id,
+                    "entity_type": "order",
+                    "entity_id": uuid4(),
+                    "activity_type": "note",
+                    "title": " ".join(rng.choices(WORDS, k=4)),
+                    "description": " ".join(rng.choices(WORDS, k=20)),
+                    "created_at": now - timedelta(seconds=i),
+                    "updated_at": now,
+                }
+                for i in range(start, min(start + 5000, offset + rows))
+            ],
+        )
+        db_session.commit()
+    db_session.execute(text("ANALYZE activities"))
+
+
+@pytest.mark.performance
+class TestTextSearchPerformance:
+    """Search latency of ILIKE scans and indexed text search as tables grow."""
+
+    def test_indexed_search_latency_versus_table_size(self, db_session, test_tenant):
+        """Indexed search stays faster than the ILIKE scan at every size.
+
+        GIN indexes are only read through bitmap scans, so turning those off
+        for the baseline reproduces the unindexed ILIKE search.
+        """
+        total = int(os.getenv("TEXT_SEARCH_BENCH_ROWS", "200000"))
+        repo = ActivityRepository(db_session)
+        # One rare word so matches are few and the scan cost dominates
+        db_session.execute(
+            insert(Activity),
+            [
+                {
+                    "id": uuid4(),
+                    "tenant_id": test_tenant.id,
+                    "entity_type": "order",
+                    "entity_id": uuid4(),
+                    "activity_type": "note",
+                    "title": "Chargeback dispute",
+                    "created_at": datetime.now(UTC),
+                    "updated_at": datetime.now(UTC),
+                }
+            ],
+        )
+
+        seeded = 0
+        for size in (total // 4, total // 2, total):
+            _seed(db_session, test_tenant.id, size - seeded, seeded)
+            seeded = size
+
+            scan_latencies, indexed_latencies = [], []
+            for _ in range(20):
+                # Previous implementation, without the trigram indexes
+                db_session.execute(text("SET LOCAL enable_bitmapscan = off"))
+                start = time.perf_counter()
+                scan = (
+                    db_session.query(Activity)
+                    .filter(Activity.tenant_id == test_tenant.id)
+                    .filter(
+                        or_(
+                            Activity.title.ilike("%chargeback%"),
+                            Activity.description.ilike("%chargeback%"),
+                        )
+                    )
+                    .order_by(Activity.created_at.desc())
+                    .limit(20)
+                    .all()
+                )
+                scan_latencies.append(time.perf_counter() - start)
+                db_session.rollback()
+
+                start = time.perf_counter()
+                results = repo.search(test_tenant.id, "chargeback", limit=20)
+                indexed_latencies.append(time.perf_counter() - start)
+                assert [a.id for a in results] == [a.id for a in scan]
+
+            print(
+                f"\nActivity search over {size:,} rows: "
+                f"ILIKE p99 {p99_ms(scan_latencies):.2f} ms, "
+                f"indexed p99 {p99_ms(indexed_latencies):.2f} ms"
+            )
+            assert p99_ms(indexed_latencies) < p99_ms(scan_latencies)
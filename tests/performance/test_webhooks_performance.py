@@ -0,0 +1,51 @@
+"""Performance tests for outbound webhook delivery."""
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from app.core.integrations.webhook_client import WebhookSender
+from tests.helpers import LocalHTTPServer
+
+
+@pytest.mark.performance
+class TestWebhooksPerformance:
+    """Throughput of webhook fan-out against a local receiver."""
+
+    @pytest.mark.asyncio
+    async def test_pooled_concurrent_delivery_throughput(self):
+        """Pooled, concurrent sends beat a fresh client per sequential delivery."""
+        deliveries = 100
+        server = LocalHTTPServer(delay=0.01)
+        await server.start()
+        payloads = [json.dumps({"n": i}) for i in range(deliveries)]
+        try:
+            # Previous pattern: one client (and connection) per delivery, in order
+            start_time = time.perf_counter()
+            for payload in payloads:
+                async with httpx.AsyncClient(timeout=5) as client:
+                    await client.post(server.url(), content=payload)
+            sequential = deliveries / (time.perf_counter() - start_time)
+            sequential_connections = server.connections
+
+            server.connections = 0
+            sender = WebhookSender(max_connections_per_host=10, timeout=5)
+            start_time = time.perf_counter()
+            await asyncio.gather(
+                *(sender.send(server.url(), payload) for payload in payloads)
+            )
+            pooled = deliveries / (time.perf_counter() - start_time)
+            await sender.aclose()
+        finally:
+            await server.stop()
+
+        print(
+            f"\nWebhook throughput: sequential {sequential:.0f}/s "
+            f"({sequential_connections} connections), pooled {pooled:.0f}/s "
+            f"({server.connections} connections)"
+        )
+        assert server.connections <= 10
+        assert pooled > sequential * 3
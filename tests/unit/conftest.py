@@ -0,0 +1,45 @@
+"""Fixtures shared by the inventory unit tests."""
+
+from uuid import uuid4
+
+import pytest
+
+from app.modules.inventory.services.inventory_service import InventoryService
+from app.modules.products.models.product import Product
+
+
+@pytest.fixture
+def inventory_service(db_session):
+    return InventoryService(db_session)
+
+
+@pytest.fixture
+def product(db_session, test_tenant):
+    product = Product(
+        tenant_id=test_tenant.id,
+        sku=f"SKU-{uuid4().hex[:8]}",
+        name="Test Product",
+        currency="USD",
+        is_active=True,
+        track_inventory=True,
+    )
+    db_session.add(product)
+    db_session.commit()
+    return product
+
+
+@pytest.fixture
+def locations(inventory_service, test_tenant):
+    """Two locations in one warehouse and one in another."""
+    main = inventory_service.create_warehouse(
+        test_tenant.id, {"name": "Main", "code": "MAIN"}
+    )
+    other = inventory_service.create_warehouse(
+        test_tenant.id, {"name": "Other", "code": "OTHER"}
+    )
+    return [
+        inventory_service.create_location(
+            test_tenant.id, warehouse.id, {"name": code, "code": code}
+        )
+        for warehouse, code in ((main, "A"), (main, "B"), (other, "C"))
+    ]
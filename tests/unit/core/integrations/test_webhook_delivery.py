@@ -0,0 +1,235 @@
+"""Unit tests for webhook delivery (sender pool, retries, circuit breakers)."""
+
+import asyncio
+import json
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.core.integrations.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+)
+from app.core.integrations.delivery import WebhookDeliveryDispatcher, compute_backoff
+from app.core.integrations.webhook_client import WebhookSender, sign_payload
+from app.core.integrations.webhooks import WebhookHandler
+from app.models.integration import Webhook, WebhookDelivery, WebhookStatus
+from tests.helpers import LocalHTTPServer
+
+
+@pytest.fixture
+async def http_server():
+    """Start a local webhook receiver stand-in."""
+    server = LocalHTTPServer(statuses={"/fail": 500, "/reject": 400})
+    await server.start()
+    yield server
+    await server.stop()
+
+
+def _webhook(url: str, **kwargs):
+    defaults = {
+        "id": uuid4(),
+        "url": url,
+        "method": "POST",
+        "headers": None,
+        "secret": None,
+        "enabled": True,
+        "max_retries": 3,
+        "retry_delay": 60,
+        "extra_data": None,
+    }
+    defaults.update(kwargs)
+    return SimpleNamespace(**defaults)
+
+
+def _delivery(webhook, payload=None):
+    return SimpleNamespace(
+        id=uuid4(),
+        webhook_id=webhook.id,
+        event_type="product.created",
+        payload=payload or {"sku": "A-1"},
+        status=WebhookStatus.PENDING.value,
+        retry_count=0,
+        next_retry_at=None,
+        response_status=None,
+        response_body=None,
+        error_message=None,
+        sent_at=None,
+    )
+
+
+def test_compute_backoff_grows_and_is_capped():
+    """Delays double per attempt, are capped, and jitter stays in range."""
+    assert compute_backoff(1, 10, 3600, jitter=False) == 10
+    assert compute_backoff(4, 10, 3600, jitter=False) == 80
+    assert compute_backoff(20, 10, 3600, jitter=False) == 3600
+    for _ in range(50):
+        assert 5 <= compute_backoff(3, 10, 3600) <= 40
+
+
+def test_circuit_breaker_opens_and_probes():
+    """The circuit opens after N failures and lets one probe through later."""
+    now = [0.0]
+    breaker = CircuitBreaker(
+        failure_threshold=3, reset_timeout=30, clock=lambda: now[0]
+    )
+
+    for _ in range(2):
+        assert breaker.allow()
+        assert not breaker.record_failure()
+    assert breaker.record_failure()
+    assert not breaker.allow()
+    assert breaker.retry_after() == 30
+
+    now[0] = 31
+    assert breaker.allow()
+    assert not breaker.allow()  # a single probe at a time
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+
+
+@pytest.mark.asyncio
+async def test_sender_reuses_connections_per_host(http_server):
+    """Concurrent sends share keep-alive connections, bounded per host."""
+    sender = WebhookSender(max_connections=50, max_connections_per_host=4, timeout=5)
+    try:
+        responses = await asyncio.gather(
+            *(sender.send(http_server.url(), json.dumps({"n": i})) for i in range(40))
+        )
+    finally:
+        await sender.aclose()
+
+    assert all(response.status_code == 200 for response in responses)
+    assert len(http_server.requests) == 40
+    assert http_server.connections <= 4
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_batches_signs_and_schedules_retries(http_server):
+    """Opt-in receivers get one batched POST; failures are retried later."""
+    sender = WebhookSender(timeout=5)
+    dispatcher = WebhookDeliveryDispatcher(
+        sender=sender, breakers=CircuitBreakerRegistry(5, 60), concurrency=10
+    )
+    batching = _webhook(
+        http_server.url("/batch"),
+        secret="s3cret",
+        extra_data={"batching": {"enabled": True, "max_events": 10}},
+    )
+    failing = _webhook(http_server.url("/fail"))
+    rejecting = _webhook(http_server.url("/reject"))
+    batch = [_delivery(batching, {"n": i}) for i in range(3)]
+    semaphore = asyncio.Semaphore(10)
+    try:
+        batched = await dispatcher._deliver(batching, batch, semaphore)
+        failed = await dispatcher._deliver(failing, [_delivery(failing)], semaphore)
+        rejected = await dispatcher._deliver(
+            rejecting, [_delivery(rejecting)], semaphore
+        )
+    finally:
+        await sender.aclose()
+
+    request = next(r for r in http_server.requests if r["path"] == "/batch")
+    assert [event["payload"] for event in request["body"]["events"]] == [
+        {"n": 0},
+        {"n": 1},
+        {"n": 2},
+    ]
+    assert request["headers"]["x-webhook-signature"] == "sha256=" + sign_payload(
+        json.dumps(request["body"]), "s3cret"
+    )
+
+    now = datetime.now(UTC)
+    assert {dispatcher._apply(d, batching, batched, now) for d in batch} == {"sent"}
+    assert batch[0].status == WebhookStatus.SENT.value
+
+    delivery = _delivery(failing)
+    assert dispatcher._apply(delivery, failing, failed, now) == "retry"
+    assert delivery.retry_count == 1
+    assert delivery.next_retry_at > now
+    delivery.retry_count = failing.max_retries
+    assert dispatcher._apply(delivery, failing, failed, now) == "failed"
+
+    delivery = _delivery(rejecting)
+    assert dispatcher._apply(delivery, rejecting, rejected, now) == "failed"
+    assert delivery.response_status == 400
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_defers_deliveries_while_circuit_open(http_server):
+    """Once an endpoint's circuit opens, deliveries are deferred, not attempted."""
+    sender = WebhookSender(timeout=5)
+    dispatcher = WebhookDeliveryDispatcher(
+        sender=sender, breakers=CircuitBreakerRegistry(2, 60), concurrency=1
+    )
+    failing = _webhook(http_server.url("/fail"))
+    semaphore = asyncio.Semaphore(1)
+    try:
+        outcomes = [
+            await dispatcher._deliver(failing, [_delivery(failing)], semaphore)
+            for _ in range(4)
+        ]
+    finally:
+        await sender.aclose()
+
+    assert len(http_server.requests) == 2
+    assert [outcome.deferred_seconds is not None for outcome in outcomes] == [
+        False,
+        False,
+        True,
+        True,
+    ]
+    delivery = _delivery(failing)
+    assert (
+        dispatcher._apply(delivery, failing, outcomes[-1], datetime.now(UTC))
+        == "deferred"
+    )
+    assert delivery.retry_count == 0
+
+
+@pytest.mark.asyncio
+async def test_queued_deliveries_are_dispatched(db_session, test_tenant, http_server):
+    """trigger_webhook only queues; the dispatcher delivers and records results."""
+    for path in ("/ok", "/fail"):
+        db_session.add(
+            Webhook(
+                tenant_id=test_tenant.id,
+                name=path,
+                url=http_server.url(path),
+                event_type="product.created",
+                retry_delay=1,
+            )
+        )
+    db_session.commit()
+
+    deliveries = await WebhookHandler(db_session).trigger_webhook(
+        test_tenant.id, "product.created", {"sku": "A-1"}
+    )
+    assert {d.status for d in deliveries} == {WebhookStatus.PENDING.value}
+    assert http_server.requests == []
+
+    sender = WebhookSender(timeout=5)
+    dispatcher = WebhookDeliveryDispatcher(
+        session_factory=sessionmaker(bind=db_session.get_bind()), sender=sender
+    )
+    try:
+        result = await dispatcher.dispatch_batch()
+    finally:
+        await sender.aclose()
+
+    assert result["sent"] == 1
+    assert result["retry"] == 1
+    db_session.expire_all()
+    rows = {
+        row.response_status: row
+        for row in db_session.query(WebhookDelivery).filter(
+            WebhookDelivery.tenant_id == test_tenant.id
+        )
+    }
+    assert rows[200].status == WebhookStatus.SENT.value
+    assert rows[500].status == WebhookStatus.PENDING.value
+    assert rows[500].retry_count == 1
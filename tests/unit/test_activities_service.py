@@ -7,6 +7,7 @@
 
 from app.core.activities.service import ActivityService
 from app.core.pubsub import EventPublisher
+from tests.helpers import get_outbox_events
 
 
 @pytest.fixture
@@ -23,9 +24,7 @@ def activity_service(db_session, mock_event_publisher):
     return ActivityService(db=db_session, event_publisher=mock_event_publisher)
 
 
-def test_create_activity(
-    activity_service, test_user, test_tenant, mock_event_publisher
-):
+def test_create_activity(activity_service, test_user, test_tenant, db_session):
     """Test creating an activity."""
     entity_id = uuid4()
     activity = activity_service.create_activity(
@@ -46,8 +45,8 @@ def test_create_activity(
     assert activity.tenant_id == test_tenant.id
     assert activity.user_id == test_user.id
 
-    # Verify event was published
-    assert mock_event_publisher.publish.called
+    # Verify event was stored in the outbox
+    assert get_outbox_events(db_session, test_tenant.id, "activity.created")
 
 
 def test_get_activities(activity_service, test_user, test_tenant):
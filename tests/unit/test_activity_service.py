@@ -8,6 +8,7 @@
 from app.core.activities.service import ActivityService
 from app.core.pubsub import EventPublisher
 from app.models.activity import ActivityType
+from tests.helpers import get_outbox_events
 
 
 @pytest.fixture
@@ -24,9 +25,7 @@ def activity_service(db_session, mock_event_publisher):
     return ActivityService(db_session, event_publisher=mock_event_publisher)
 
 
-def test_create_activity(
-    activity_service, test_user, test_tenant, mock_event_publisher
-):
+def test_create_activity(activity_service, test_user, test_tenant, db_session):
     """Test creating an activity."""
     entity_id = uuid4()
     activity = activity_service.create_activity(
@@ -53,8 +52,8 @@ def test_create_activity(
     # The model uses activity_metadata as the attribute name
     assert activity.activity_metadata == {"priority": "high"}
 
-    # Verify event was published
-    assert mock_event_publisher.publish.called
+    # Verify event was stored in the outbox
+    assert get_outbox_events(db_session, test_tenant.id, "activity.created")
 
 
 def test_get_activities(activity_service, test_user, test_tenant):
@@ -0,0 +1,185 @@
+"""Unit tests for bulk approve and reject."""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from app.core.approvals.service import ApprovalService
+from app.core.pubsub import EventPublisher
+from app.models.approval import ApprovalAction
+from app.models.event_outbox import EventOutbox
+
+
+@pytest.fixture
+def mock_event_publisher():
+    """Create a mock EventPublisher."""
+    publisher = MagicMock(spec=EventPublisher)
+    publisher.publish = AsyncMock(return_value="message-id-123")
+    return publisher
+
+
+@pytest.fixture
+def approval_service(db_session, mock_event_publisher):
+    """Create ApprovalService instance."""
+    return ApprovalService(db=db_session, event_publisher=mock_event_publisher)
+
+
+def _flow(service, tenant_id, user_id, flow_type="sequential", steps=2, **step):
+    flow = service.create_approval_flow(
+        flow_data={"name": "Bulk Flow", "flow_type": flow_type, "module": "orders"},
+        tenant_id=tenant_id,
+        user_id=user_id,
+    )
+    for order in range(1, steps + 1):
+        service.add_approval_step(
+            flow.id,
+            tenant_id,
+            {
+                "step_order": order,
+                "name": f"Step {order}",
+                "approver_type": "user",
+                "approver_id": user_id,
+                **step,
+            },
+        )
+    return flow
+
+
+def _requests(service, flow, tenant_id, user_id, count):
+    return [
+        service.create_approval_request(
+            request_data={
+                "flow_id": flow.id,
+                "title": f"Request {i}",
+                "entity_type": "order",
+                "entity_id": uuid4(),
+            },
+            tenant_id=tenant_id,
+            user_id=user_id,
+        ).id
+        for i in range(count)
+    ]
+
+
+def test_bulk_approve_advances_requests_and_reports_failures(
+    approval_service, db_session, test_tenant, test_user
+):
+    """Valid requests move on; missing and finished ones are reported."""
+    flow = _flow(approval_service, test_tenant.id, test_user.id)
+    request_ids = _requests(approval_service, flow, test_tenant.id, test_user.id, 3)
+    approval_service.reject_request(request_ids[2], test_tenant.id, test_user.id)
+    missing_id = uuid4()
+
+    result = approval_service.bulk_approve_requests(
+        [*request_ids, request_ids[0], missing_id],
+        test_tenant.id,
+        test_user.id,
+        comment="Month end",
+    )
+
+    assert [r.id for r in result.requests] == request_ids[:2]
+    assert all(r.current_step == 2 and r.status == "pending" for r in result.requests)
+    assert result.errors == [
+        {"request_id": str(request_ids[2]), "error": "Approval request is rejected"},
+        {"request_id": str(missing_id), "error": "Approval request not found"},
+    ]
+    actions = (
+        db_session.query(ApprovalAction)
+        .filter(ApprovalAction.request_id.in_(request_ids[:2]))
+        .all()
+    )
+    assert {(a.step_order, a.comment) for a in actions} == {(1, "Month end")}
+    assert len(actions) == 2
+    events = (
+        db_session.query(EventOutbox)
+        .filter(
+            EventOutbox.event_type == "approval.approved",
+            EventOutbox.entity_id.in_(request_ids),
+        )
+        .count()
+    )
+    assert events == 2
+
+    result = approval_service.bulk_approve_requests(
+        request_ids[:2], test_tenant.id, test_user.id
+    )
+    assert [r.status for r in result.requests] == ["approved", "approved"]
+
+
+def test_bulk_approve_rejects_users_who_are_not_approvers(
+    approval_service, test_tenant, test_user
+):
+    """A step assigned to someone else is reported, not approved."""
+    flow = _flow(approval_service, test_tenant.id, test_user.id)
+    request_ids = _requests(approval_service, flow, test_tenant.id, test_user.id, 1)
+
+    result = approval_service.bulk_reject_requests(request_ids, test_tenant.id, uuid4())
+
+    assert result.requests == []
+    assert result.errors[0]["error"] == "User cannot reject this request"
+
+
+def test_bulk_approve_parallel_step_needs_min_approvals(
+    approval_service, test_tenant, test_user
+):
+    """A parallel step stays current until min_approvals distinct users approve."""
+    flow = _flow(
+        approval_service,
+        test_tenant.id,
+        test_user.id,
+        flow_type="parallel",
+        steps=1,
+        min_approvals=2,
+    )
+    request_ids = _requests(approval_service, flow, test_tenant.id, test_user.id, 2)
+
+    result = approval_service.bulk_approve_requests(
+        request_ids, test_tenant.id, test_user.id
+    )
+    assert [r.status for r in result.requests] == ["pending", "pending"]
+
+    # Approving twice does not count the same user twice
+    result = approval_service.bulk_approve_requests(
+        request_ids, test_tenant.id, test_user.id
+    )
+    assert [r.status for r in result.requests] == ["pending", "pending"]
+
+    result = approval_service.bulk_reject_requests(
+        request_ids, test_tenant.id, test_user.id
+    )
+    assert [r.status for r in result.requests] == ["rejected", "rejected"]
+
+
+def test_bulk_approve_query_count_does_not_grow_with_requests(
+    approval_service, db_session, test_tenant, test_user
+):
+    """Approving 20 requests takes as many statements as approving 2.
+
+    A first run warms the compiled flow and notification template caches.
+    """
+    flow = _flow(approval_service, test_tenant.id, test_user.id)
+    statements = []
+
+    def count(*_):
+        statements.append(1)
+
+    engine = db_session.get_bind()
+    counts = []
+    for size in (1, 2, 20):
+        request_ids = _requests(
+            approval_service, flow, test_tenant.id, test_user.id, size
+        )
+        statements.clear()
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            result = approval_service.bulk_approve_requests(
+                request_ids, test_tenant.id, test_user.id
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+        assert len(result.requests) == size
+        counts.append(len(statements))
+
+    assert counts[1] == counts[2]
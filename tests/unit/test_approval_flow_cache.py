@@ -0,0 +1,194 @@
+"""Unit tests for compiled approval flows and SQL approval statistics."""
+
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert
+
+from app.core.approvals.compiled import (
+    FlowCompilationCache,
+    compile_flow,
+    parse_skip_conditions,
+)
+from app.core.approvals.service import ApprovalService
+from app.models.approval import ApprovalFlow, ApprovalRequest, ApprovalStep
+
+
+def _flow(conditions=None) -> ApprovalFlow:
+    return ApprovalFlow(
+        id=uuid4(),
+        tenant_id=uuid4(),
+        name="Flow",
+        flow_type="sequential",
+        module="orders",
+        conditions=conditions,
+        updated_at=datetime.now(UTC),
+    )
+
+
+def _step(flow: ApprovalFlow, order: int, **fields) -> ApprovalStep:
+    return ApprovalStep(
+        id=uuid4(),
+        tenant_id=flow.tenant_id,
+        flow_id=flow.id,
+        step_order=order,
+        name=f"Step {order}",
+        approver_type=fields.pop("approver_type", "user"),
+        **fields,
+    )
+
+
+def test_parse_skip_conditions_ignores_unknown_shapes():
+    """Only step_N entries with known operators or value lists are kept."""
+    parsed = parse_skip_conditions(
+        {
+            "step_2": {
+                "amount": {"operator": "lt", "value": 1000},
+                "channel": {"operator": "like", "value": "web"},
+                "entity_type": ["product"],
+            },
+            "step_02": {"amount": {"operator": "gt", "value": 0}},
+            "rules": [{"field": "amount"}],
+            "logic": "AND",
+        }
+    )
+
+    assert list(parsed) == [2]
+    amount, entity_type = parsed[2]
+    assert amount.holds(500) and not amount.holds(1500)
+    assert not amount.holds(None)
+    assert entity_type.holds("product") and not entity_type.holds("order")
+
+
+def test_compile_flow_orders_steps_and_freezes_them():
+    """Compiled steps are ordered, immutable and carry their skip conditions."""
+    flow = _flow({"step_2": {"amount": {"operator": "lt", "value": 1000}}})
+    steps = [
+        _step(flow, 2, approver_type="role", approver_role="manager"),
+        _step(flow, 1, approver_rule={"type": "amount_based"}),
+    ]
+
+    compiled = compile_flow(flow, steps)
+
+    assert [step.step_order for step in compiled.steps] == [1, 2]
+    assert compiled.step(2).approver_roles == frozenset({"manager"})
+    assert compiled.step(2).approver_role == "manager"
+    assert compiled.step(2).skip_conditions == compiled.skip_conditions[2]
+    assert compiled.step(3) is None
+    with pytest.raises(AttributeError):
+        compiled.step(1).step_order = 5
+    with pytest.raises(TypeError):
+        compiled.step(1).approver_rule["type"] = "department_head"
+
+
+def test_flow_cache_is_keyed_by_flow_version():
+    """A flow is compiled once per updated_at; invalidate drops it."""
+    cache = FlowCompilationCache(maxsize=2)
+    flow = _flow()
+    loads = []
+
+    def load_steps():
+        loads.append(flow.id)
+        return [_step(flow, 1)]
+
+    first = cache.get(flow, load_steps)
+    assert cache.get(flow, load_steps) is first
+    assert len(loads) == 1
+
+    flow.updated_at += timedelta(seconds=1)
+    assert cache.get(flow, load_steps) is not first
+    assert len(loads) == 2
+
+    cache.invalidate(flow.id)
+    cache.get(flow, load_steps)
+    assert len(loads) == 3
+    assert cache.get_stats()["hits"] == 1
+
+
+def test_flow_cache_does_not_keep_flows_without_steps():
+    """Flows are compiled again until they have steps."""
+    cache = FlowCompilationCache(maxsize=2)
+    flow = _flow()
+
+    assert cache.get(flow, list).steps == ()
+    assert cache.get_stats()["size"] == 0
+
+
+def test_step_edits_recompile_the_flow(db_session, test_tenant, test_user):
+    """Adding or updating a step is visible to the next evaluation."""
+    service = ApprovalService(db=db_session)
+    flow = service.create_approval_flow(
+        flow_data={"name": "Flow", "flow_type": "sequential", "module": "orders"},
+        tenant_id=test_tenant.id,
+        user_id=test_user.id,
+    )
+    step = service.add_approval_step(
+        flow.id,
+        test_tenant.id,
+        {
+            "step_order": 1,
+            "name": "Manager",
+            "approver_type": "role",
+            "approver_role": "manager",
+        },
+    )
+    assert service.flow_engine.compiled(flow).step(1).approver_role == "manager"
+    version = flow.updated_at
+
+    service.update_approval_step(
+        step.id, flow.id, {"approver_role": "admin"}, test_tenant.id
+    )
+
+    assert flow.updated_at > version
+    assert service.flow_engine.compiled(flow).step(1).approver_role == "admin"
+
+
+def test_approval_stats_are_aggregated_in_sql(db_session, test_tenant, test_user):
+    """Counts, average and percentiles cover every request of the tenant."""
+    service = ApprovalService(db=db_session)
+    flows = [
+        service.create_approval_flow(
+            flow_data={"name": name, "flow_type": "sequential", "module": "orders"},
+            tenant_id=test_tenant.id,
+            user_id=test_user.id,
+        )
+        for name in ("Orders", "Invoices")
+    ]
+    now = datetime.now(UTC)
+    rows = []
+    for i in range(12):
+        approved = i < 10
+        rows.append(
+            {
+                "id": uuid4(),
+                "tenant_id": test_tenant.id,
+                "flow_id": flows[0 if i < 8 else 1].id,
+                "title": f"Request {i}",
+                "entity_type": "order",
+                "entity_id": uuid4(),
+                "status": "approved" if approved else "pending",
+                "requested_by": test_user.id,
+                "requested_at": now - timedelta(hours=1),
+                "completed_at": (
+                    now - timedelta(hours=1) + timedelta(seconds=60 * (i + 1))
+                    if approved
+                    else None
+                ),
+            }
+        )
+    db_session.execute(insert(ApprovalRequest), rows)
+    db_session.commit()
+
+    stats = service.get_approval_stats(test_tenant.id, include_percentiles=True)
+
+    assert stats["total_requests"] == 12
+    assert stats["status_counts"] == {"approved": 10, "pending": 2}
+    assert stats["avg_approval_time_seconds"] == pytest.approx(330)
+    assert stats["top_flows"] == [
+        {"flow_id": str(flows[0].id), "request_count": 8},
+        {"flow_id": str(flows[1].id), "request_count": 4},
+    ]
+    assert stats["approval_time_percentiles"]["p50"] == pytest.approx(330)
+    assert stats["approval_time_percentiles"]["p99"] == pytest.approx(594.6)
+    assert "approval_time_percentiles" not in service.get_approval_stats(test_tenant.id)
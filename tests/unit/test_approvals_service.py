@@ -7,6 +7,7 @@
 
 from app.core.approvals.service import ApprovalService
 from app.core.pubsub import EventPublisher
+from app.models.event_outbox import EventOutbox
 
 
 @pytest.fixture
@@ -41,9 +42,7 @@ def test_create_approval_flow(approval_service, test_user, test_tenant):
     assert flow.tenant_id == test_tenant.id
 
 
-def test_create_approval_request(
-    approval_service, test_user, test_tenant, mock_event_publisher
-):
+def test_create_approval_request(approval_service, db_session, test_user, test_tenant):
     """Test creating an approval request."""
     # First create a flow
     flow = approval_service.create_approval_flow(
@@ -74,8 +73,16 @@ def test_create_approval_request(
     assert request.entity_id == entity_id
     assert request.status == "pending"
 
-    # Verify event was published
-    assert mock_event_publisher.publish.called
+    # Verify event was stored in the outbox
+    assert (
+        db_session.query(EventOutbox)
+        .filter(
+            EventOutbox.tenant_id == test_tenant.id,
+            EventOutbox.event_type == "approval.requested",
+        )
+        .count()
+        == 1
+    )
 
 
 def test_add_approval_step(approval_service, test_user, test_tenant):
@@ -157,12 +164,13 @@ def test_bulk_approve_requests(
     print(f"User ID: {test_user.id}")
     print(f"Tenant ID: {test_tenant.id}")
 
-    approved_requests = approval_service.bulk_approve_requests(
+    result = approval_service.bulk_approve_requests(
         request_ids=request_ids,
         tenant_id=test_tenant.id,
         user_id=test_user.id,
         comment="Bulk approval test",
     )
+    approved_requests = result.requests
 
     print(f"Approved requests count: {len(approved_requests)}")
     print(f"Approved requests: {approved_requests}")
@@ -170,3 +178,4 @@ def test_bulk_approve_requests(
     assert len(approved_requests) == 3
     for request in approved_requests:
         assert request.status == "approved"
+    assert result.errors == []
@@ -0,0 +1,234 @@
+"""Unit tests for the buffered audit log writer and partition helpers."""
+
+import json
+import os
+from contextlib import nullcontext
+from datetime import UTC, date, datetime, timedelta, timezone
+from uuid import uuid4
+
+from sqlalchemy.orm import sessionmaker
+
+from app.core.audit.partitions import add_months, month_start, partition_name
+from app.core.audit.writer import AuditLogWriter
+from app.core.config_file import get_settings
+from app.repositories.audit_repository import AuditRepository
+from app.services.audit_service import AuditService, encode_cursor
+
+
+def test_partition_month_helpers():
+    """Months wrap across years and partitions are named per UTC month."""
+    assert month_start(date(2026, 3, 17)) == date(2026, 3, 1)
+    # 23:30 on Jan 31 at UTC-3 is already February in UTC
+    late = datetime(2026, 1, 31, 23, 30, tzinfo=timezone(timedelta(hours=-3)))
+    assert month_start(late) == date(2026, 2, 1)
+    assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+    assert partition_name(date(2027, 2, 1)) == "audit_logs_p2027_02"
+
+
+class FailingSession:
+    """Session whose COPY always fails, as when the database is down."""
+
+    def connection(self):
+        raise ConnectionError("database unavailable")
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def test_flush_spills_entries_and_keeps_them_until_written(tmp_path):
+    """Unwritten entries go to the spill file, in order, without duplicates."""
+    spill_path = tmp_path / "audit_spill.jsonl"
+    writer = AuditLogWriter(
+        session_factory=FailingSession,
+        batch_size=2,
+        max_buffer=3,
+        spill_path=str(spill_path),
+    )
+    tenant_id = uuid4()
+
+    for i in range(5):
+        writer.write(user_id=None, tenant_id=tenant_id, action=f"action_{i}")
+    # Over max_buffer: the first four entries were spilled right away
+    assert writer.pending() == 1
+
+    assert writer.flush() == 0
+    assert writer.pending() == 0
+    assert writer.flush() == 0
+
+    lines = spill_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["action"] for line in lines] == [
+        f"action_{i}" for i in range(5)
+    ]
+
+
+def test_flush_writes_spilled_and_buffered_entries(db_session, test_tenant, tmp_path):
+    """Spilled entries are replayed with the buffer and the spill file removed."""
+    spill_path = tmp_path / "audit_spill.jsonl"
+    writer = AuditLogWriter(session_factory=FailingSession, spill_path=str(spill_path))
+    writer.write(
+        user_id=None,
+        tenant_id=test_tenant.id,
+        action="spilled",
+        details={"role": "admin", "at": datetime.now(UTC)},
+    )
+    writer.flush()
+    assert spill_path.exists()
+
+    writer.session_factory = sessionmaker(bind=db_session.get_bind())
+    writer.write(
+        user_id=None,
+        tenant_id=test_tenant.id,
+        action="buffered",
+        user_agent='agent "quoted", with comma',
+    )
+
+    assert writer.flush() == 2
+    assert not spill_path.exists()
+
+    repo = AuditRepository(db_session)
+    logs, total = repo.get_audit_logs(tenant_id=test_tenant.id)
+    assert total == 2
+    assert [log.action for log in logs] == ["buffered", "spilled"]
+    assert logs[0].user_agent == 'agent "quoted", with comma'
+    assert logs[0].details is None
+    assert logs[1].details["role"] == "admin"
+
+    matching, total = repo.get_audit_logs(
+        tenant_id=test_tenant.id, details_filter={"role": "admin"}
+    )
+    assert total == 1
+    assert matching[0].action == "spilled"
+
+
+def test_keyset_pages_follow_offset_order(db_session, test_tenant):
+    """Cursor pages return the same entries as offset pages, newest first."""
+    start = datetime.now(UTC) - timedelta(hours=1)
+    entries = [
+        {
+            "id": uuid4(),
+            "tenant_id": test_tenant.id,
+            "action": f"action_{i}",
+            # Pairs share a timestamp so the id breaks ties
+            "created_at": start + timedelta(seconds=i // 2),
+        }
+        for i in range(7)
+    ]
+    AuditRepository(db_session).copy_audit_logs(entries)
+    db_session.commit()
+
+    service = AuditService(db_session)
+    by_offset, _ = service.get_audit_logs(tenant_id=test_tenant.id, limit=10)
+
+    by_cursor = []
+    cursor = None
+    while True:
+        page = service.get_audit_logs_after(
+            tenant_id=test_tenant.id, cursor=cursor, limit=3
+        )
+        by_cursor.extend(page)
+        if len(page) < 3:
+            break
+        cursor = encode_cursor(page[-1])
+
+    assert [log.id for log in by_cursor] == [log.id for log in by_offset]
+    assert len(by_cursor) == 7
+
+
+class RejectedRowError(Exception):
+    """Database error raised for a value that does not fit its column."""
+
+    pgcode = "22001"
+
+
+class RecordingSession:
+    """Session whose COPY rejects entries with action 'bad'."""
+
+    def __init__(self, written):
+        self.written = written
+        self.pending = []
+
+    def begin_nested(self):
+        return nullcontext()
+
+    def commit(self):
+        self.written.extend(self.pending)
+        self.pending = []
+
+    def rollback(self):
+        self.pending = []
+
+    def close(self):
+        pass
+
+
+def test_rejected_rows_are_dead_lettered_and_the_rest_written(tmp_path, monkeypatch):
+    """A bad row neither blocks the batch nor stays in the spill file."""
+    written = []
+
+    def copy_audit_logs(repository, entries):
+        if any(entry["action"] == "bad" for entry in entries):
+            raise RejectedRowError("value too long")
+        repository.db.pending.extend(entry["action"] for entry in entries)
+        return len(entries)
+
+    monkeypatch.setattr(AuditRepository, "copy_audit_logs", copy_audit_logs)
+    spill_path = tmp_path / "audit_spill.jsonl"
+    writer = AuditLogWriter(
+        session_factory=lambda: RecordingSession(written),
+        batch_size=3,
+        spill_path=str(spill_path),
+    )
+    for action in ("a", "bad", "b", "c"):
+        writer.write(user_id=None, tenant_id=uuid4(), action=action)
+    writer.write(user_id=None, tenant_id=uuid4(), action="d", user_agent="x" * 600)
+
+    assert writer.flush() == 5
+    assert written == ["a", "b", "c", "d"]
+    assert not spill_path.exists()
+    dead = writer.dead_letter_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["action"] for line in dead] == ["bad"]
+    assert writer.dead_letter_path.name == "audit_spill.dead.jsonl"
+
+
+def test_write_cuts_strings_to_column_lengths(tmp_path):
+    """An oversized user agent is truncated instead of failing the COPY."""
+    writer = AuditLogWriter(
+        session_factory=FailingSession, spill_path=str(tmp_path / "spill.jsonl")
+    )
+    writer.write(
+        user_id=None, tenant_id=uuid4(), action="a" * 150, user_agent="x" * 600
+    )
+    writer.flush()
+
+    entry = json.loads((tmp_path / "spill.jsonl").read_text(encoding="utf-8"))
+    assert len(entry["action"]) == 100
+    assert len(entry["user_agent"]) == 500
+
+
+def test_each_process_spills_to_its_own_file(tmp_path, monkeypatch):
+    """The default spill file carries the pid; files of dead processes are adopted."""
+    monkeypatch.setattr(
+        get_settings(), "AUDIT_WRITER_SPILL_PATH", str(tmp_path / "audit_spill.jsonl")
+    )
+    writer = AuditLogWriter(session_factory=FailingSession)
+    assert writer.spill_path == tmp_path / f"audit_spill.{os.getpid()}.jsonl"
+
+    # A process that no longer exists, and the shared file of older versions
+    for name, action in (
+        ("audit_spill.999999999.jsonl", "gone"),
+        ("audit_spill.jsonl", "old"),
+    ):
+        (tmp_path / name).write_text(json.dumps({"action": action}) + "\n")
+    (tmp_path / "audit_spill.999999999.dead.jsonl").write_text("{}\n")
+
+    assert writer.adopt_orphaned_spills() == 2
+    lines = writer.spill_path.read_text(encoding="utf-8").splitlines()
+    assert sorted(json.loads(line)["action"] for line in lines) == ["gone", "old"]
+    assert {path.name for path in tmp_path.iterdir()} == {
+        "audit_spill.999999999.dead.jsonl",
+        f"audit_spill.{os.getpid()}.jsonl",
+    }
@@ -0,0 +1,136 @@
+"""Unit tests for free/busy intervals and meeting slot search."""
+
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from app.core.calendar.freebusy_service import (
+    FreeBusyService,
+    MeetingSlot,
+    find_slots,
+    free_intervals,
+    is_free,
+    merge_intervals,
+)
+from app.core.calendar.resource_service import CalendarResourceService
+from app.core.calendar.service import CalendarService
+
+DAY = datetime(2026, 10, 19, tzinfo=UTC)
+
+
+def at(hours: float) -> datetime:
+    return DAY + timedelta(hours=hours)
+
+
+def test_merge_intervals_joins_overlapping_and_touching():
+    """Overlapping and back-to-back intervals are merged; order does not matter."""
+    merged = merge_intervals(
+        [(at(13), at(14)), (at(9), at(10)), (at(9.5), at(11)), (at(11), at(12))]
+    )
+
+    assert merged == [(at(9), at(12)), (at(13), at(14))]
+
+
+def test_free_intervals_sweeps_all_participants():
+    """Free time is what no participant is busy in, clipped to the window."""
+    alice = [(at(7), at(9)), (at(13), at(14))]
+    bob = [(at(10), at(11)), (at(13.5), at(15)), (at(17), at(20))]
+
+    free = free_intervals([alice, bob], at(8), at(18))
+
+    assert free == [(at(9), at(10)), (at(11), at(13)), (at(15), at(17))]
+
+
+def test_is_free():
+    """A range is free when it does not overlap any busy interval."""
+    busy = [(at(9), at(10)), (at(12), at(13))]
+
+    assert is_free(busy, at(10), at(12))
+    assert is_free(busy, at(13), at(14))
+    assert not is_free(busy, at(9.5), at(11))
+    assert not is_free(busy, at(11), at(12.5))
+    assert not is_free(busy, at(8), at(14))
+
+
+def test_find_slots_on_grid_with_resources():
+    """Slots start on the grid and need a resource free for the whole slot."""
+    people = [[(at(9), at(9.25)), (at(11), at(12))]]
+    room_a, room_b = uuid4(), uuid4()
+    rooms = {
+        room_a: [(at(9), at(10.5))],
+        room_b: [(at(9.5), at(10))],
+    }
+
+    slots = find_slots(
+        people,
+        at(9),
+        at(13),
+        timedelta(minutes=30),
+        limit=4,
+        step=timedelta(minutes=30),
+        resource_busy=rooms,
+    )
+
+    assert slots == [
+        MeetingSlot(at(10), at(10.5), (room_b,)),
+        MeetingSlot(at(10.5), at(11), (room_a, room_b)),
+        MeetingSlot(at(12), at(12.5), (room_a, room_b)),
+        MeetingSlot(at(12.5), at(13), (room_a, room_b)),
+    ]
+
+
+def test_get_busy_includes_attendees_recurrences_and_resources(
+    db_session, test_tenant, test_user
+):
+    """Busy time covers organized, attended and recurring events and bookings."""
+    calendar_service = CalendarService(db=db_session)
+    calendar = calendar_service.create_calendar(
+        calendar_data={"name": "Busy", "calendar_type": "user"},
+        tenant_id=test_tenant.id,
+        owner_id=test_user.id,
+    )
+
+    def event(start, hours=1.0, organizer_id=None, **fields):
+        return calendar_service.create_event(
+            event_data={
+                "calendar_id": calendar.id,
+                "title": "Busy",
+                "start_time": start,
+                "end_time": start + timedelta(hours=hours),
+                **fields,
+            },
+            tenant_id=test_tenant.id,
+            organizer_id=organizer_id,
+        )
+
+    event(at(9), organizer_id=test_user.id)
+    attended = event(at(11))
+    calendar_service.add_attendee(
+        attended.id, test_tenant.id, {"user_id": test_user.id}
+    )
+    declined = event(at(12))
+    calendar_service.add_attendee(
+        declined.id, test_tenant.id, {"user_id": test_user.id, "status": "declined"}
+    )
+    event(
+        at(14) - timedelta(days=7), organizer_id=test_user.id, recurrence_type="weekly"
+    )
+    event(at(16), organizer_id=test_user.id, status="cancelled")
+    room_booking = event(at(10))
+    resources_service = CalendarResourceService(db_session)
+    resource = resources_service.create_resource(
+        {"name": "Room 1", "resource_type": "room"}, test_tenant.id
+    )
+    resources_service.assign_resource_to_event(
+        room_booking.id, resource.id, test_tenant.id
+    )
+
+    users, resources = FreeBusyService(db_session).get_busy(
+        test_tenant.id, at(0), at(24), [test_user.id], [resource.id]
+    )
+
+    assert users[test_user.id] == [
+        (at(9), at(10)),
+        (at(11), at(12)),
+        (at(14), at(15)),
+    ]
+    assert resources[resource.id] == [(at(10), at(11))]
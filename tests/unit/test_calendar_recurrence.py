@@ -0,0 +1,227 @@
+"""Unit tests for recurring calendar event expansion."""
+
+from datetime import UTC, datetime, timedelta
+from itertools import islice
+from uuid import uuid4
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app.core.calendar.recurrence import (
+    OccurrenceCache,
+    is_occurrence,
+    iter_event_starts,
+    iter_rule,
+    parse_rrule,
+)
+from app.models.calendar import CalendarEvent
+
+
+def _event(start: datetime, minutes: int = 60, **fields) -> CalendarEvent:
+    fields.setdefault("recurrence_type", "none")
+    fields.setdefault("recurrence_interval", 1)
+    return CalendarEvent(
+        id=uuid4(),
+        title="Series",
+        start_time=start,
+        end_time=start + timedelta(minutes=minutes),
+        **fields,
+    )
+
+
+def _starts(event: CalendarEvent, start: datetime, end: datetime) -> list[datetime]:
+    return list(iter_event_starts(event, start, end))
+
+
+def test_parse_rrule():
+    """RRULE parts are parsed, with BYDAY ordinals and negative month days."""
+    rule = parse_rrule("RRULE:FREQ=MONTHLY;INTERVAL=2;BYDAY=-1FR,2MO;COUNT=5")
+
+    assert rule.freq == "MONTHLY"
+    assert rule.interval == 2
+    assert rule.count == 5
+    assert rule.by_day == ((-1, 4), (2, 0))
+    assert parse_rrule("FREQ=YEARLY;UNTIL=20301231T000000Z").until == datetime(
+        2030, 12, 31, tzinfo=UTC
+    )
+
+
+@pytest.mark.parametrize(
+    "rule",
+    [
+        "FREQ=HOURLY",
+        "FREQ=WEEKLY;BYSETPOS=1",
+        "FREQ=WEEKLY;BYDAY=1MO",
+        "FREQ=DAILY;COUNT=2;UNTIL=20300101",
+        "FREQ=MONTHLY;BYMONTHDAY=32",
+        "FREQ=DAILY;INTERVAL=0",
+    ],
+)
+def test_parse_rrule_rejects_unsupported_rules(rule):
+    """Invalid and unsupported rules raise ValueError."""
+    with pytest.raises(ValueError):
+        parse_rrule(rule)
+
+
+def test_weekly_byday_in_window():
+    """Weekly rule yields each listed weekday inside the window only."""
+    event = _event(
+        datetime(2026, 1, 5, 9, tzinfo=UTC), recurrence_rule="FREQ=WEEKLY;BYDAY=MO,FR"
+    )
+
+    starts = _starts(
+        event, datetime(2026, 3, 1, tzinfo=UTC), datetime(2026, 3, 15, tzinfo=UTC)
+    )
+
+    assert [start.day for start in starts] == [2, 6, 9, 13]
+
+
+def test_simple_fields_map_to_rule():
+    """The simple recurrence fields expand like the matching RRULE."""
+    start = datetime(2026, 1, 5, 9, tzinfo=UTC)
+    simple = _event(
+        start,
+        recurrence_type="weekly",
+        recurrence_interval=2,
+        recurrence_days_of_week="1,3",
+    )
+    rrule = _event(start, recurrence_rule="FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,WE")
+    window = (start, datetime(2026, 4, 1, tzinfo=UTC))
+
+    assert _starts(simple, *window) == _starts(rrule, *window)
+
+
+def test_monthly_last_friday_with_count():
+    """COUNT bounds the series, counting DTSTART as the first occurrence."""
+    event = _event(
+        datetime(2026, 1, 30, 9, tzinfo=UTC),
+        recurrence_rule="FREQ=MONTHLY;BYDAY=-1FR;COUNT=3",
+    )
+
+    starts = _starts(event, event.start_time, datetime(2027, 1, 1, tzinfo=UTC))
+
+    assert [start.date().isoformat() for start in starts] == [
+        "2026-01-30",
+        "2026-02-27",
+        "2026-03-27",
+    ]
+
+
+def test_monthly_skips_months_without_the_day():
+    """A monthly series on the 31st skips shorter months."""
+    event = _event(datetime(2026, 1, 31, 9, tzinfo=UTC), recurrence_type="monthly")
+
+    starts = _starts(event, event.start_time, datetime(2026, 6, 1, tzinfo=UTC))
+
+    assert [start.month for start in starts] == [1, 3, 5]
+
+
+@pytest.mark.parametrize(
+    ("start", "rule", "expected"),
+    [
+        # DTSTART is always the first instance; dateutil leaves it out when
+        # it does not match the rule, so the expansions below start after it
+        (
+            datetime(2024, 11, 28, 9, tzinfo=UTC),
+            "FREQ=YEARLY;BYMONTHDAY=1,15",
+            ["2024-12-01", "2024-12-15", "2025-01-01", "2025-01-15", "2025-02-01"],
+        ),
+        (
+            datetime(2026, 2, 13, 9, tzinfo=UTC),
+            "FREQ=YEARLY;BYMONTHDAY=13;BYDAY=FR;COUNT=4",
+            ["2026-03-13", "2026-11-13", "2027-08-13"],
+        ),
+        (
+            datetime(2026, 10, 31, 9, tzinfo=UTC),
+            "FREQ=YEARLY;INTERVAL=2;BYMONTHDAY=-1",
+            ["2026-11-30", "2026-12-31", "2028-01-31", "2028-02-29"],
+        ),
+    ],
+)
+def test_yearly_bymonthday_applies_to_every_month(start, rule, expected):
+    """Without BYMONTH, a yearly BYMONTHDAY matches in all twelve months."""
+    event = _event(start, recurrence_rule=rule)
+
+    starts = islice(
+        iter_event_starts(event, start, datetime(2030, 1, 1, tzinfo=UTC)), 6
+    )
+
+    assert [day.date().isoformat() for day in starts][1 : len(expected) + 1] == expected
+
+
+def test_until_and_exdates():
+    """UNTIL ends the series; exdates remove single occurrences or whole days."""
+    start = datetime(2026, 3, 2, 9, tzinfo=UTC)
+    event = _event(
+        start,
+        recurrence_rule="FREQ=DAILY;UNTIL=20260306T090000Z",
+        recurrence_exdates=["2026-03-03T09:00:00+00:00", "2026-03-05"],
+    )
+
+    starts = _starts(event, start, start + timedelta(days=30))
+
+    assert [start.day for start in starts] == [2, 4, 6]
+
+
+def test_wall_clock_time_kept_across_dst():
+    """Occurrences keep their local time when the UTC offset changes."""
+    zone = ZoneInfo("Europe/Berlin")
+    event = _event(
+        datetime(2026, 3, 27, 9, tzinfo=zone),
+        recurrence_type="daily",
+        timezone="Europe/Berlin",
+    )
+
+    starts = _starts(event, event.start_time, event.start_time + timedelta(days=3))
+
+    assert [start.astimezone(zone).hour for start in starts] == [9, 9, 9]
+    assert [start.hour for start in starts] == [8, 8, 7]
+
+
+def test_skip_ahead_matches_full_walk():
+    """Starting near the window yields the same occurrences as walking from DTSTART."""
+    rule = parse_rrule("FREQ=WEEKLY;INTERVAL=3;BYDAY=TU,SA")
+    dtstart = datetime(2015, 6, 6, 18, 30, tzinfo=UTC)
+    zone = ZoneInfo("America/New_York")
+    after = datetime(2026, 10, 1, tzinfo=UTC)
+
+    def first_ten(starts):
+        return list(islice((start for start in starts if start >= after), 10))
+
+    assert first_ten(iter_rule(rule, dtstart, zone, after=after)) == first_ten(
+        iter_rule(rule, dtstart, zone)
+    )
+
+
+def test_impossible_rule_stops():
+    """A rule that never matches yields only DTSTART instead of looping forever."""
+    rule = parse_rrule("FREQ=YEARLY;BYMONTH=2;BYMONTHDAY=30")
+    dtstart = datetime(2026, 1, 1, tzinfo=UTC)
+
+    assert list(iter_rule(rule, dtstart, ZoneInfo("UTC"))) == [dtstart]
+
+
+def test_is_occurrence():
+    """Only starts generated by the rule are occurrences."""
+    event = _event(datetime(2026, 1, 5, 9, tzinfo=UTC), recurrence_type="weekly")
+
+    assert is_occurrence(event, datetime(2026, 2, 2, 9, tzinfo=UTC))
+    assert not is_occurrence(event, datetime(2026, 2, 3, 9, tzinfo=UTC))
+
+
+def test_occurrence_cache_hits_and_invalidates_on_change():
+    """Windows are cached per event version; edits expand the series again."""
+    cache = OccurrenceCache(maxsize=8)
+    event = _event(datetime(2026, 1, 5, 9, tzinfo=UTC), recurrence_type="daily")
+    window = (datetime(2026, 3, 1, tzinfo=UTC), datetime(2026, 4, 1, tzinfo=UTC))
+
+    first = cache.get(event, *window)
+    second = cache.get(event, *window)
+    event.recurrence_exdates = [first[0].isoformat()]
+    third = cache.get(event, *window)
+
+    assert len(first) == 31
+    assert second is first
+    assert third == first[1:]
+    assert cache.get_stats()["hits"] == 1
+    assert cache.get_stats()["misses"] == 2
@@ -2,11 +2,17 @@
 
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
 
 import pytest
+from pydantic import ValidationError
 
 from app.core.calendar.service import CalendarService
+from app.core.exceptions import APIException
 from app.core.pubsub import EventPublisher
+from app.models.user import User
+from app.schemas.calendar import CalendarEventCreate, CalendarEventUpdate
+from tests.helpers import get_outbox_events
 
 
 @pytest.fixture
@@ -23,9 +29,7 @@ def calendar_service(db_session, mock_event_publisher):
     return CalendarService(db=db_session, event_publisher=mock_event_publisher)
 
 
-def test_create_calendar(
-    calendar_service, test_user, test_tenant, mock_event_publisher
-):
+def test_create_calendar(calendar_service, test_user, test_tenant, db_session):
     """Test creating a calendar."""
     calendar = calendar_service.create_calendar(
         calendar_data={
@@ -43,11 +47,11 @@ def test_create_calendar(
     assert calendar.owner_id == test_user.id
     assert calendar.calendar_type == "user"
 
-    # Verify event was published
-    assert mock_event_publisher.publish.called
+    # Verify event was stored in the outbox
+    assert get_outbox_events(db_session, test_tenant.id, "calendar.created")
 
 
-def test_create_event(calendar_service, test_user, test_tenant, mock_event_publisher):
+def test_create_event(calendar_service, test_user, test_tenant, db_session):
     """Test creating a calendar event."""
     # First create a calendar
     calendar = calendar_service.create_calendar(
@@ -78,8 +82,8 @@ def test_create_event(calendar_service, test_user, test_tenant, mock_event_publi
     assert event.calendar_id == calendar.id
     assert event.organizer_id == test_user.id
 
-    # Verify event was published
-    assert mock_event_publisher.publish.called
+    # Verify event was stored in the outbox
+    assert get_outbox_events(db_session, test_tenant.id, "calendar.event_created")
 
 
 def test_get_user_calendars(calendar_service, test_user, test_tenant):
@@ -214,6 +218,39 @@ def test_update_event_rejects_invalid_time_range(
     assert exc_info.value.code == "INVALID_EVENT_DURATION"
 
 
+def test_create_event_rejects_end_before_start(
+    calendar_service, test_user, test_tenant
+):
+    """An event ending before it starts is a 400, not a database error."""
+    start_time = datetime.now(UTC) + timedelta(days=1)
+
+    with pytest.raises(APIException) as exc_info:
+        _create_test_event(
+            calendar_service,
+            test_user,
+            test_tenant,
+            start_time=start_time,
+            end_time=start_time - timedelta(hours=1),
+        )
+
+    assert exc_info.value.code == "INVALID_EVENT_DURATION"
+
+
+def test_event_schemas_reject_end_before_start():
+    """Create needs end after start; update checks it when both are given."""
+    start_time = datetime.now(UTC)
+    with pytest.raises(ValidationError, match="end_time must be after start_time"):
+        CalendarEventCreate(
+            calendar_id=uuid4(),
+            title="Backwards",
+            start_time=start_time,
+            end_time=start_time - timedelta(minutes=1),
+        )
+    with pytest.raises(ValidationError):
+        CalendarEventUpdate(start_time=start_time, end_time=start_time)
+    assert CalendarEventUpdate(end_time=start_time).end_time == start_time
+
+
 def test_resize_event_accepts_valid_end_time(calendar_service, test_user, test_tenant):
     """Test that resize_event succeeds with a valid new_end_time."""
     event = _create_test_event(calendar_service, test_user, test_tenant)
@@ -326,3 +363,126 @@ def test_add_reminder_succeeds_with_valid_data(
     assert reminder is not None
     assert reminder.minutes_before == 30
     assert reminder.reminder_type == "email"
+
+
+def test_get_user_events_pages_organizer_and_attendee_events(
+    calendar_service, test_user, test_tenant, db_session
+):
+    """User events are deduplicated, ordered, keyset-paged and counted once."""
+    other = User(
+        email=f"organizer-{uuid4().hex[:8]}@example.com",
+        password_hash="x",
+        full_name="Organizer",
+        tenant_id=test_tenant.id,
+        is_active=True,
+    )
+    db_session.add(other)
+    db_session.commit()
+
+    start = datetime.now(UTC) + timedelta(days=1)
+
+    def event(organizer, hours: int, attendee=None):
+        created = calendar_service.create_event(
+            event_data={
+                "calendar_id": calendar.id,
+                "title": f"Event {hours}",
+                "start_time": start + timedelta(hours=hours),
+                "end_time": start + timedelta(hours=hours, minutes=30),
+            },
+            tenant_id=test_tenant.id,
+            organizer_id=organizer.id,
+        )
+        if attendee:
+            calendar_service.add_attendee(
+                created.id, test_tenant.id, {"user_id": attendee.id}
+            )
+        return created
+
+    calendar = calendar_service.create_calendar(
+        calendar_data={"name": "Team", "calendar_type": "user"},
+        tenant_id=test_tenant.id,
+        owner_id=test_user.id,
+    )
+    organized = event(test_user, 1)
+    attending = event(other, 2, attendee=test_user)
+    both = event(test_user, 3, attendee=test_user)
+    event(other, 4)
+
+    first = calendar_service.get_user_events(test_user.id, test_tenant.id, limit=2)
+    last = first[-1]
+    second = calendar_service.get_user_events(
+        test_user.id, test_tenant.id, limit=2, after=(last.start_time, last.id)
+    )
+
+    assert [e.id for e in first + second] == [organized.id, attending.id, both.id]
+    assert calendar_service.count_user_events(test_user.id, test_tenant.id) == 3
+    assert (
+        calendar_service.count_user_events(
+            test_user.id, test_tenant.id, start_date=start + timedelta(hours=2)
+        )
+        == 2
+    )
+
+
+def test_move_single_occurrence_creates_override(
+    calendar_service, test_user, test_tenant, db_session
+):
+    """Moving one occurrence stores an override that replaces it in the window."""
+    start = datetime(2026, 3, 2, 9, tzinfo=UTC)
+    series = _create_test_event(
+        calendar_service,
+        test_user,
+        test_tenant,
+        start_time=start,
+        recurrence_type="daily",
+        recurrence_count=5,
+    )
+    standalone = _create_test_event(
+        calendar_service,
+        test_user,
+        test_tenant,
+        start_time=start + timedelta(days=1, hours=3),
+    )
+    moved_from = start + timedelta(days=2)
+
+    override = calendar_service.move_event(
+        series.id,
+        test_tenant.id,
+        moved_from + timedelta(hours=5),
+        occurrence_start=moved_from,
+    )
+    occurrences = calendar_service.get_occurrences(
+        test_tenant.id, start, start + timedelta(days=10), user_id=test_user.id
+    )
+
+    assert override.recurrence_master_id == series.id
+    assert override.recurrence_original_start == moved_from
+    assert calendar_service.get_event(series.id, test_tenant.id).start_time == start
+    assert [o.start_time - start for o in occurrences] == [
+        timedelta(days=0),
+        timedelta(days=1),
+        timedelta(days=1, hours=3),
+        timedelta(days=2, hours=5),
+        timedelta(days=3),
+        timedelta(days=4),
+    ]
+    assert occurrences[2].event.id == standalone.id
+    assert occurrences[3].event.id == override.id
+    assert occurrences[3].master_event_id == series.id
+    assert (
+        list(
+            calendar_service.iter_occurrences(
+                test_tenant.id, start, start + timedelta(days=10), user_id=test_user.id
+            )
+        )
+        == occurrences
+    )
+
+    with pytest.raises(APIException) as exc_info:
+        calendar_service.resize_event(
+            series.id,
+            test_tenant.id,
+            start + timedelta(hours=30),
+            occurrence_start=start + timedelta(hours=1),
+        )
+    assert exc_info.value.code == "INVALID_OCCURRENCE"
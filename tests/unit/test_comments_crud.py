@@ -19,6 +19,7 @@
 from app.models.user import User
 from app.modules.products.models.product import Product
 from tests.conftest import TestingSessionLocal
+from tests.helpers import get_outbox_events
 
 
 @pytest.fixture
@@ -541,7 +542,7 @@ class TestCommentEvents:
     """Test comment-related events."""
 
     def test_comment_added_event(
-        self, task_comment_service, sample_task, sample_user, mock_event_publisher
+        self, task_comment_service, sample_task, sample_user, db
     ):
         """Test that comment_added event is published."""
         # Act
@@ -553,16 +554,16 @@ def test_comment_added_event(
         )
 
         # Assert
-        mock_event_publisher.publish.assert_called_once()
-        call_args = mock_event_publisher.publish.call_args
-        assert call_args.kwargs["event_type"] == "task.comment_added"
-        assert call_args.kwargs["entity_type"] == "task"
-        assert call_args.kwargs["entity_id"] == sample_task.id
-        assert call_args.kwargs["tenant_id"] == sample_task.tenant_id
-        assert call_args.kwargs["user_id"] == sample_user.id
+        events = get_outbox_events(db, sample_task.tenant_id, "task.comment_added")
+        assert len(events) == 1
+        fields = events[0].fields
+        assert fields["entity_type"] == "task"
+        assert fields["entity_id"] == str(sample_task.id)
+        assert fields["tenant_id"] == str(sample_task.tenant_id)
+        assert fields["user_id"] == str(sample_user.id)
 
     def test_comment_updated_event(
-        self, task_comment_service, sample_task, sample_user, mock_event_publisher
+        self, task_comment_service, sample_task, sample_user, db
     ):
         """Test that comment_updated event is published."""
         # Arrange
@@ -573,9 +574,6 @@ def test_comment_updated_event(
             content="Original",
         )
 
-        # Reset mock to capture only update event
-        mock_event_publisher.reset_mock()
-
         # Act
         task_comment_service.update_comment(
             task_id=sample_task.id,
@@ -586,16 +584,16 @@ def test_comment_updated_event(
         )
 
         # Assert
-        mock_event_publisher.publish.assert_called_once()
-        call_args = mock_event_publisher.publish.call_args
-        assert call_args.kwargs["event_type"] == "task.comment_updated"
-        assert call_args.kwargs["entity_type"] == "task"
-        assert call_args.kwargs["entity_id"] == sample_task.id
-        assert call_args.kwargs["tenant_id"] == sample_task.tenant_id
-        assert call_args.kwargs["user_id"] == sample_user.id
+        events = get_outbox_events(db, sample_task.tenant_id, "task.comment_updated")
+        assert len(events) == 1
+        fields = events[0].fields
+        assert fields["entity_type"] == "task"
+        assert fields["entity_id"] == str(sample_task.id)
+        assert fields["tenant_id"] == str(sample_task.tenant_id)
+        assert fields["user_id"] == str(sample_user.id)
 
     def test_comment_deleted_event(
-        self, task_comment_service, sample_task, sample_user, mock_event_publisher
+        self, task_comment_service, sample_task, sample_user, db
     ):
         """Test that comment_deleted event is published."""
         # Arrange
@@ -606,9 +604,6 @@ def test_comment_deleted_event(
             content="To be deleted",
         )
 
-        # Reset mock to capture only delete event
-        mock_event_publisher.reset_mock()
-
         # Act
         task_comment_service.delete_comment(
             task_id=sample_task.id,
@@ -618,13 +613,13 @@ def test_comment_deleted_event(
         )
 
         # Assert
-        mock_event_publisher.publish.assert_called_once()
-        call_args = mock_event_publisher.publish.call_args
-        assert call_args.kwargs["event_type"] == "task.comment_deleted"
-        assert call_args.kwargs["entity_type"] == "task"
-        assert call_args.kwargs["entity_id"] == sample_task.id
-        assert call_args.kwargs["tenant_id"] == sample_task.tenant_id
-        assert call_args.kwargs["user_id"] == sample_user.id
+        events = get_outbox_events(db, sample_task.tenant_id, "task.comment_deleted")
+        assert len(events) == 1
+        fields = events[0].fields
+        assert fields["entity_type"] == "task"
+        assert fields["entity_id"] == str(sample_task.id)
+        assert fields["tenant_id"] == str(sample_task.tenant_id)
+        assert fields["user_id"] == str(sample_user.id)
 
 
 if __name__ == "__main__":
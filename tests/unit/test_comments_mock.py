@@ -192,7 +192,7 @@ def test_add_comment_with_mentions(self, task_comment_service, mock_db):
             ),  # Convert to string to match service behavior
             notification_sent=False,
         )
-        mock_db.add.assert_called_with(mock_mention)
+        mock_db.add.assert_any_call(mock_mention)
 
     def test_update_comment_success(self, task_comment_service, mock_db):
         """Test updating a comment successfully."""
@@ -7,6 +7,7 @@
 
 from app.core.comments.service import CommentService, MentionParser
 from app.core.pubsub import EventPublisher
+from tests.helpers import get_outbox_events
 
 
 @pytest.fixture
@@ -33,7 +34,7 @@ def test_extract_mentions():
     assert len(mentions) == 2
 
 
-def test_create_comment(comment_service, test_user, test_tenant, mock_event_publisher):
+def test_create_comment(comment_service, test_user, test_tenant, db_session):
     """Test creating a comment."""
     entity_id = uuid4()
     comment = comment_service.create_comment(
@@ -52,8 +53,8 @@ def test_create_comment(comment_service, test_user, test_tenant, mock_event_publ
     assert comment.tenant_id == test_tenant.id
     assert comment.created_by == test_user.id
 
-    # Verify event was published
-    assert mock_event_publisher.publish.called
+    # Verify event was stored in the outbox
+    assert get_outbox_events(db_session, test_tenant.id, "comment.created")
 
 
 def test_get_comments_by_entity(comment_service, test_user, test_tenant):
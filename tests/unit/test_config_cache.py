@@ -0,0 +1,138 @@
+"""Unit tests for the two-tier configuration cache."""
+
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.core.config.cache import ConfigCache, handle_config_changed
+from app.core.config.service import ConfigService
+from app.core.pubsub import topics
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the few Redis commands the cache uses."""
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+
+    def mget(self, *keys):
+        return [self.data.get(key) for key in keys]
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    def info(self, section):
+        return {"used_memory_human": "1M"}
+
+
+def _cache(redis_client=None, l1_ttl=60) -> ConfigCache:
+    cache = ConfigCache(enabled=True, ttl=300, l1_ttl=l1_ttl)
+    cache._redis_client = redis_client
+    return cache
+
+
+def test_module_map_loaded_once_per_worker():
+    """The module map is loaded once and then served from process memory."""
+    cache = _cache(FakeRedis())
+    tenant_id = uuid4()
+    loader = MagicMock(return_value={"a": 1, "b": 2})
+
+    for _ in range(5):
+        assert cache.get_module(tenant_id, "products", loader) == {"a": 1, "b": 2}
+
+    assert loader.call_count == 1
+    stats = cache.get_stats()
+    assert (stats["l1_hits"], stats["l1_misses"], stats["l2_misses"]) == (4, 1, 1)
+    assert stats["hit_ratio"] == 0.8
+
+
+def test_other_workers_share_redis_tier():
+    """A second worker's L1 miss is served by Redis, not the database."""
+    redis_client = FakeRedis()
+    tenant_id = uuid4()
+    _cache(redis_client).get_module(tenant_id, "products", lambda: {"a": 1})
+
+    other_worker = _cache(redis_client)
+    loader = MagicMock()
+    assert other_worker.get_module(tenant_id, "products", loader) == {"a": 1}
+    loader.assert_not_called()
+    assert other_worker.get_stats()["l2_hits"] == 1
+
+
+def test_invalidate_module_bumps_version():
+    """Invalidation moves readers to a new version instead of deleting keys."""
+    redis_client = FakeRedis()
+    tenant_id = uuid4()
+    cache = _cache(redis_client)
+    other_worker = _cache(redis_client)
+    cache.get_module(tenant_id, "products", lambda: {"a": 1})
+
+    cache.invalidate_module(tenant_id, "products")
+
+    assert cache.get_module(tenant_id, "products", lambda: {"a": 2}) == {"a": 2}
+    assert other_worker.get_module(tenant_id, "products", MagicMock()) == {"a": 2}
+
+    cache.clear_all()
+    assert cache.get_module(tenant_id, "products", lambda: {"a": 3}) == {"a": 3}
+
+
+def test_load_racing_with_invalidation_is_not_kept():
+    """A map read before a concurrent write is not stored in process memory."""
+    cache = _cache()
+    tenant_id = uuid4()
+
+    def stale_loader():
+        cache.invalidate_local(tenant_id, "products")
+        return {"a": "stale"}
+
+    assert cache.get_module(tenant_id, "products", stale_loader) == {"a": "stale"}
+    assert cache.get_module(tenant_id, "products", lambda: {"a": "new"}) == {"a": "new"}
+
+
+@pytest.mark.asyncio
+async def test_config_changed_event_drops_local_entry():
+    """The RedisEventBus handler drops the module from process memory."""
+    cache = _cache()
+    tenant_id = uuid4()
+    cache.get_module(tenant_id, "products", lambda: {"a": 1})
+
+    with patch("app.core.config.cache.get_config_cache", return_value=cache):
+        await handle_config_changed(
+            topics.CONFIG_CHANGED, {"tenant_id": str(tenant_id), "module": "products"}
+        )
+
+    assert cache.get_stats()["l1_entries"] == 0
+
+
+def test_service_bulk_reads_use_one_lookup():
+    """get_many and get read one cached module map; results are copies."""
+    cache = _cache()
+    tenant_id = uuid4()
+    service = ConfigService(MagicMock(), use_versioning=False)
+    service.cache = cache
+    service.repository = MagicMock()
+    service.repository.get_all_by_module.return_value = [
+        MagicMock(key="general.currency", value="USD"),
+        MagicMock(key="general.flags", value={"beta": True}),
+    ]
+
+    values = service.get_many(
+        tenant_id,
+        "system",
+        ["general.currency", "general.language"],
+        defaults={"general.language": "es"},
+    )
+    flags = service.get(tenant_id, "system", "general.flags")
+    flags["beta"] = False
+
+    assert values == {"general.currency": "USD", "general.language": "es"}
+    assert service.get_module(tenant_id, "system")["general.flags"] == {"beta": True}
+    assert service.repository.get_all_by_module.call_count == 1
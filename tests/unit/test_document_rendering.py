@@ -0,0 +1,109 @@
+"""Unit tests for PDF rendering in the document render pool."""
+
+import io
+import zipfile
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.core.templates.rendering import (
+    DocumentRenderPool,
+    RenderJobRegistry,
+    RenderJobStatus,
+    render_pdf_document,
+)
+from app.core.templates.service import TemplateService
+
+
+@pytest.fixture(scope="module")
+def render_pool():
+    """Start a small render pool shared by the tests of this module."""
+    pool = DocumentRenderPool(max_workers=2, max_pending=4)
+    yield pool
+    pool.shutdown()
+
+
+def test_render_pdf_document():
+    """A template renders to a PDF document."""
+    pdf = render_pdf_document("<h1>Invoice {{ number }}</h1>", {"number": 7})
+
+    assert pdf.startswith(b"%PDF")
+
+
+@pytest.mark.asyncio
+async def test_pool_renders_in_workers(render_pool):
+    """PDFs rendered in worker processes; failures surface as ValueError."""
+    pdf = await render_pool.render_pdf("Hello {{ name }}", {"name": "World"})
+    assert pdf.startswith(b"%PDF")
+
+    with pytest.raises(ValueError):
+        await render_pool.render_pdf("{{ 1 / n }}", {"n": 0})
+
+
+@pytest.mark.asyncio
+async def test_render_many_streams_every_row(render_pool):
+    """Every row yields exactly once, with per-row errors instead of aborting."""
+    rows = [{"n": n} for n in range(10)]
+
+    results = {
+        index: result
+        async for index, result in render_pool.render_many("{{ 10 / n }}", rows)
+    }
+
+    assert sorted(results) == list(range(10))
+    assert isinstance(results[0], ZeroDivisionError)
+    assert all(results[i].startswith(b"%PDF") for i in range(1, 10))
+
+
+def test_job_registry_scopes_jobs_to_tenant():
+    """Jobs are only visible to their tenant and report progress."""
+    registry = RenderJobRegistry(ttl_seconds=60)
+    tenant_id = uuid4()
+    job = registry.create(tenant_id, uuid4(), total=4)
+    job.completed, job.failed = 2, 1
+
+    assert registry.get(job.id, tenant_id) is job
+    assert registry.get(job.id, uuid4()) is None
+    assert job.progress == 0.75
+
+
+@pytest.mark.asyncio
+async def test_render_batch_stores_zip(render_pool):
+    """A batch job renders every row into one stored zip archive."""
+    template = SimpleNamespace(id=uuid4(), name="invoice")
+    version = SimpleNamespace(content="Invoice {{ number }}")
+    uploads = []
+
+    async def upload_file(**kwargs):
+        # The archive is a temporary file, closed once the job finishes
+        uploads.append({**kwargs, "file_content": kwargs["file_content"].read()})
+        return SimpleNamespace(id=uuid4())
+
+    file_service = MagicMock()
+    file_service.upload_file = upload_file
+    service = TemplateService(
+        db=MagicMock(),
+        file_service=file_service,
+        event_publisher=MagicMock(),
+        render_pool=render_pool,
+    )
+    service.repository = MagicMock()
+    service.repository.get_template_by_id.return_value = template
+    service.repository.get_current_version.return_value = version
+    tenant_id = uuid4()
+    job = RenderJobRegistry().create(tenant_id, template.id, total=3)
+
+    await service.render_batch(job, [{"number": n} for n in range(3)], uuid4())
+
+    assert job.status == RenderJobStatus.COMPLETED
+    assert (job.completed, job.failed) == (3, 0)
+    [upload] = uploads
+    assert upload["tenant_id"] == tenant_id
+    with zipfile.ZipFile(io.BytesIO(upload["file_content"])) as archive:
+        assert sorted(archive.namelist()) == [
+            "invoice-00001.pdf",
+            "invoice-00002.pdf",
+            "invoice-00003.pdf",
+        ]
@@ -0,0 +1,175 @@
+"""Unit tests for the transactional event outbox and its relay."""
+
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config_file import get_settings
+from app.core.pubsub.event_helpers import safe_publish_event
+from app.core.pubsub.models import EventMetadata
+from app.core.pubsub.outbox import OutboxRelay, enqueue_event
+from app.models.event_outbox import EventOutbox
+
+
+class FakePipeline:
+    """Records XADD commands and fails on execute when asked to."""
+
+    def __init__(self, published: list, error: Exception | None):
+        self.published = published
+        self.error = error
+        self.commands: list = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def xadd(self, stream, fields):
+        self.commands.append((stream, fields))
+
+    async def execute(self):
+        if self.error:
+            raise self.error
+        self.published.extend(self.commands)
+
+
+class FakeStreamsClient:
+    """Stand-in for RedisStreamsClient with pipelined XADD."""
+
+    def __init__(self, error: Exception | None = None):
+        self.published: list = []
+        self.error = error
+        self.round_trips = 0
+
+    @asynccontextmanager
+    async def connection(self):
+        yield self
+
+    def pipeline(self, transaction: bool = True):
+        self.round_trips += 1
+        return FakePipeline(self.published, self.error)
+
+    async def close(self):
+        pass
+
+
+def _enqueue(db_session, tenant_id, count: int) -> list:
+    entries = [
+        enqueue_event(
+            db_session,
+            event_type="task.created",
+            entity_type="task",
+            entity_id=uuid4(),
+            tenant_id=tenant_id,
+        )
+        for _ in range(count)
+    ]
+    db_session.commit()
+    return entries
+
+
+def _pending(db_session, tenant_id) -> list[EventOutbox]:
+    db_session.expire_all()
+    return (
+        db_session.query(EventOutbox)
+        .filter(EventOutbox.tenant_id == tenant_id)
+        .order_by(EventOutbox.id)
+        .all()
+    )
+
+
+@pytest.mark.asyncio
+async def test_relay_publishes_batches_in_order(db_session, test_tenant):
+    """Pending events are published in id order with one round trip per batch."""
+    entries = _enqueue(db_session, test_tenant.id, 5)
+    client = FakeStreamsClient()
+    relay = OutboxRelay(
+        session_factory=sessionmaker(bind=db_session.get_bind()),
+        client=client,
+        batch_size=3,
+    )
+
+    first = await relay.relay_batch()
+    second = await relay.relay_batch()
+
+    assert first == {"claimed": 3, "published": 3, "failed": 0}
+    assert second == {"claimed": 2, "published": 2, "failed": 0}
+    assert client.round_trips == 2
+    assert [fields["event_id"] for _, fields in client.published] == [
+        str(entry.event_id) for entry in entries
+    ]
+    assert {stream for stream, _ in client.published} == {
+        get_settings().REDIS_STREAM_DOMAIN
+    }
+    assert _pending(db_session, test_tenant.id) == []
+
+
+@pytest.mark.asyncio
+async def test_relay_keeps_events_when_redis_fails(db_session, test_tenant):
+    """A failed batch stays in the outbox with the attempt recorded."""
+    _enqueue(db_session, test_tenant.id, 2)
+    relay = OutboxRelay(
+        session_factory=sessionmaker(bind=db_session.get_bind()),
+        client=FakeStreamsClient(error=RedisConnectionError("down")),
+        batch_size=10,
+    )
+
+    result = await relay.relay_batch()
+
+    assert result == {"claimed": 2, "published": 0, "failed": 2}
+    pending = _pending(db_session, test_tenant.id)
+    assert [entry.attempts for entry in pending] == [1, 1]
+    assert all("down" in entry.last_error for entry in pending)
+
+
+def test_safe_publish_event_with_session_uses_outbox():
+    """With a session the event is stored in the outbox instead of published."""
+    db = MagicMock()
+    publisher = MagicMock()
+    entity_id, tenant_id = uuid4(), uuid4()
+
+    safe_publish_event(
+        event_publisher=publisher,
+        db=db,
+        event_type="product.created",
+        entity_type="product",
+        entity_id=entity_id,
+        tenant_id=tenant_id,
+        metadata=EventMetadata(source="product_service", version="1.0"),
+    )
+
+    publisher.publish.assert_not_called()
+    # Added under a savepoint; the calling service commits it
+    db.begin_nested.assert_called_once()
+    db.commit.assert_not_called()
+    entry = db.add.call_args.args[0]
+    assert isinstance(entry, EventOutbox)
+    assert entry.event_type == "product.created"
+    assert entry.stream == get_settings().REDIS_STREAM_DOMAIN
+    assert entry.fields["entity_id"] == str(entity_id)
+
+
+def test_safe_publish_event_keeps_the_session_when_outbox_fails():
+    """A failed outbox write only undoes its savepoint and does not raise."""
+    db = MagicMock()
+    savepoint = db.begin_nested.return_value
+    savepoint.__exit__.return_value = False
+    db.add.side_effect = RuntimeError("connection lost")
+
+    safe_publish_event(
+        event_publisher=MagicMock(),
+        db=db,
+        event_type="product.created",
+        entity_type="product",
+        entity_id=uuid4(),
+        tenant_id=uuid4(),
+    )
+
+    assert savepoint.__exit__.call_args.args[0] is RuntimeError
+    db.rollback.assert_not_called()
+    db.commit.assert_not_called()
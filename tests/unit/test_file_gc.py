@@ -0,0 +1,214 @@
+"""Unit tests for the deleted-file garbage collector and bulk storage deletes."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+from uuid import UUID
+
+import pytest
+
+from app.core.files.gc import CHECKPOINT_KEY, CHECKPOINT_MODULE, DeletedFileCollector
+from app.core.files.storage import (
+    BaseStorageBackend,
+    LocalStorageBackend,
+    S3StorageBackend,
+)
+from app.repositories.config_repository import ConfigRepository
+from app.repositories.file_repository import FileRepository
+
+
+class FakeS3Client:
+    """In-memory stand-in for the boto3 S3 client."""
+
+    def __init__(self, keys: set[str], failing_keys: set[str] | None = None):
+        self.objects = set(keys)
+        self.failing_keys = failing_keys or set()
+        self.delete_objects_calls = 0
+
+    def delete_objects(self, Bucket: str, Delete: dict) -> dict:  # noqa: N803
+        self.delete_objects_calls += 1
+        assert len(Delete["Objects"]) <= S3StorageBackend.DELETE_OBJECTS_MAX_KEYS
+        errors = []
+        for obj in Delete["Objects"]:
+            key = obj["Key"]
+            if key in self.failing_keys:
+                errors.append({"Key": key, "Code": "AccessDenied", "Message": "denied"})
+            else:
+                self.objects.discard(key)
+        return {"Errors": errors} if errors else {}
+
+
+class SlowStorageBackend(BaseStorageBackend):
+    """Backend without native bulk delete that tracks concurrent deletes."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.deleted: list[str] = []
+
+    async def upload(self, file_content: bytes, path: str) -> str:
+        return path
+
+    async def download(self, path: str) -> bytes:
+        return b""
+
+    async def delete(self, path: str) -> bool:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if path.startswith("broken/"):
+            raise OSError("disk error")
+        self.deleted.append(path)
+        return True
+
+    async def exists(self, path: str) -> bool:
+        return path in self.deleted
+
+    async def get_url(self, path: str) -> str | None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_s3_delete_many_uses_multi_object_delete():
+    """S3 bulk delete sends keys in chunks of DeleteObjects requests."""
+    keys = [f"tenant/file_{i}.pdf" for i in range(2500)]
+    backend = S3StorageBackend(bucket_name="bucket")
+    backend._boto3_client = FakeS3Client(set(keys), failing_keys={"tenant/file_7.pdf"})
+
+    failed = await backend.delete_many(keys, concurrency=2)
+
+    assert failed == ["tenant/file_7.pdf"]
+    assert backend._boto3_client.delete_objects_calls == 3
+    assert backend._boto3_client.objects == {"tenant/file_7.pdf"}
+
+
+@pytest.mark.asyncio
+async def test_local_delete_many_ignores_missing_files(tmp_path):
+    """Local bulk delete removes files and treats missing ones as deleted."""
+    backend = LocalStorageBackend(base_path=str(tmp_path))
+    for name in ("a.txt", "b.txt"):
+        await backend.upload(b"content", f"tenant/{name}")
+
+    failed = await backend.delete_many(
+        ["tenant/a.txt", "tenant/b.txt", "tenant/missing.txt"]
+    )
+
+    assert failed == []
+    assert not await backend.exists("tenant/a.txt")
+    assert not await backend.exists("tenant/b.txt")
+
+
+@pytest.mark.asyncio
+async def test_default_delete_many_is_bounded_and_reports_failures():
+    """Default bulk delete runs deletes concurrently up to the limit."""
+    backend = SlowStorageBackend()
+    paths = [f"ok/{i}" for i in range(20)] + ["broken/1"]
+
+    failed = await backend.delete_many(paths, concurrency=4)
+
+    assert failed == ["broken/1"]
+    assert len(backend.deleted) == 20
+    assert 1 < backend.max_in_flight <= 4
+
+
+def _create_deleted_file(repo, tenant_id, name: str, days_ago: int):
+    """Create a soft-deleted file record with a stored version."""
+    file = repo.create(
+        {
+            "tenant_id": tenant_id,
+            "name": name,
+            "original_name": name,
+            "mime_type": "text/plain",
+            "size": 100,
+            "storage_backend": "local",
+            "storage_path": f"{tenant_id}/{name}",
+            "is_current": False,
+            "deleted_at": datetime.now(UTC) - timedelta(days=days_ago),
+        }
+    )
+    repo.create_version(
+        {
+            "file_id": file.id,
+            "tenant_id": tenant_id,
+            "version_number": 2,
+            "storage_path": f"{tenant_id}/v2_{name}",
+            "storage_backend": "local",
+            "size": 100,
+            "mime_type": "text/plain",
+        }
+    )
+    return file
+
+
+@pytest.mark.asyncio
+async def test_collector_deletes_in_batches(db_session, test_tenant, tmp_path):
+    """Collector removes storage objects and rows across several batches."""
+    repo = FileRepository(db_session)
+    backend = LocalStorageBackend(base_path=str(tmp_path))
+    expired = [
+        _create_deleted_file(repo, test_tenant.id, f"old_{i}.txt", days_ago=40)
+        for i in range(5)
+    ]
+    recent = _create_deleted_file(repo, test_tenant.id, "recent.txt", days_ago=1)
+    for file in [*expired, recent]:
+        await backend.upload(b"data", file.storage_path)
+        await backend.upload(b"data", f"{test_tenant.id}/v2_{file.name}")
+    expired_ids = [file.id for file in expired]
+    recent_id = recent.id
+
+    collector = DeletedFileCollector(
+        db_session, backend, AsyncMock(), batch_size=2, concurrency=4
+    )
+    result = await collector.run(test_tenant.id, retention_days=30)
+
+    assert result["files_count"] == 5
+    assert result["storage_freed"] == 500
+    assert result["objects_deleted"] == 10
+    assert result["batches"] == 3
+    assert result["errors"] == []
+    for file_id in expired_ids:
+        assert repo.get_by_id(file_id, test_tenant.id, current_only=False) is None
+    assert repo.get_by_id(recent_id, test_tenant.id, current_only=False) is not None
+    assert await backend.exists(f"{test_tenant.id}/recent.txt")
+    assert (
+        ConfigRepository(db_session).get(
+            test_tenant.id, CHECKPOINT_MODULE, CHECKPOINT_KEY
+        )
+        is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_collector_resumes_from_checkpoint(db_session, test_tenant, tmp_path):
+    """An interrupted run continues after the checkpointed file ID."""
+    repo = FileRepository(db_session)
+    backend = LocalStorageBackend(base_path=str(tmp_path))
+    files = sorted(
+        (
+            _create_deleted_file(repo, test_tenant.id, f"old_{i}.txt", days_ago=40)
+            for i in range(4)
+        ),
+        key=lambda file: file.id,
+    )
+    file_ids: list[UUID] = [file.id for file in files]
+    ConfigRepository(db_session).create(
+        test_tenant.id,
+        CHECKPOINT_MODULE,
+        CHECKPOINT_KEY,
+        {
+            "retention_days": 30,
+            "cutoff_date": (datetime.now(UTC) - timedelta(days=30)).isoformat(),
+            "last_id": str(file_ids[1]),
+        },
+    )
+
+    collector = DeletedFileCollector(db_session, backend, AsyncMock(), batch_size=10)
+    result = await collector.run(test_tenant.id, retention_days=30)
+
+    assert result["resumed"] is True
+    assert result["files_count"] == 2
+    assert repo.get_by_id(file_ids[0], test_tenant.id, current_only=False)
+    assert repo.get_by_id(file_ids[1], test_tenant.id, current_only=False)
+    assert repo.get_by_id(file_ids[2], test_tenant.id, current_only=False) is None
+    assert repo.get_by_id(file_ids[3], test_tenant.id, current_only=False) is None
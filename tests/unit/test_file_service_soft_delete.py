@@ -1,7 +1,7 @@
 """Unit tests for FileService soft delete functionality."""
 
 from datetime import UTC, datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
 import pytest
@@ -17,6 +17,7 @@ def mock_storage_backend(self):
         """Mock storage backend."""
         backend = AsyncMock()
         backend.delete = AsyncMock()
+        backend.delete_many = AsyncMock(return_value=[])
         return backend
 
     @pytest.fixture
@@ -89,12 +90,7 @@ async def test_cleanup_deleted_files_success(
         )
         db_session.add(version)
         db_session.commit()
-
-        # Mock repository methods to return our test data
-        file_service.repository.get_deleted_files_for_cleanup = MagicMock(
-            return_value=[old_deleted_file]
-        )
-        file_service.repository.get_versions = MagicMock(return_value=[version])
+        file_id = old_deleted_file.id
 
         # Act
         result = await file_service.cleanup_deleted_files(
@@ -105,8 +101,12 @@ async def test_cleanup_deleted_files_success(
         assert result["files_count"] == 1
         assert result["storage_freed"] == 2048
         assert len(result["errors"]) == 0
-        # Verify storage backend was called
-        assert mock_storage_backend.delete.call_count >= 1
+        # Verify file and version objects were deleted in one storage call
+        mock_storage_backend.delete_many.assert_called_once()
+        deleted_paths = mock_storage_backend.delete_many.call_args.args[0]
+        assert set(deleted_paths) == {"/test/old", "/test/old/v1"}
+        # Verify rows were hard-deleted
+        assert repo.get_by_id(file_id, test_tenant.id, current_only=False) is None
         # Verify event was published
         mock_event_publisher.publish.assert_called_once()
 
@@ -138,13 +138,8 @@ async def test_cleanup_deleted_files_with_errors(
         # Store the file ID before any potential deletion
         file_id = old_deleted_file.id
 
-        # Mock storage to raise error
-        mock_storage_backend.delete.side_effect = Exception("Storage error")
-
-        file_service.repository.get_deleted_files_for_cleanup = MagicMock(
-            return_value=[old_deleted_file]
-        )
-        file_service.repository.get_versions = MagicMock(return_value=[])
+        # Mock storage to fail deleting the file
+        mock_storage_backend.delete_many.return_value = ["/test/old"]
 
         # Act
         result = await file_service.cleanup_deleted_files(test_tenant.id, 30)
@@ -154,6 +149,8 @@ async def test_cleanup_deleted_files_with_errors(
         assert result["storage_freed"] == 0
         assert len(result["errors"]) == 1
         assert result["errors"][0]["file_id"] == str(file_id)
+        # Row is kept so the next run can retry it
+        assert repo.get_by_id(file_id, test_tenant.id, current_only=False) is not None
 
     @pytest.mark.asyncio
     async def test_cleanup_deleted_files_uses_config_retention(
@@ -164,17 +161,16 @@ async def test_cleanup_deleted_files_uses_config_retention(
         file_service._storage_config_service.get_file_limits.return_value = {
             "retention_days": 60
         }
-        file_service.repository.get_deleted_files_for_cleanup = MagicMock(
-            return_value=[]
-        )
+        with patch("app.core.files.service.DeletedFileCollector") as mock_collector:
+            mock_collector.return_value.run = AsyncMock(
+                return_value={"files_count": 0, "storage_freed": 0, "errors": []}
+            )
 
-        # Act
-        await file_service.cleanup_deleted_files(test_tenant.id)
+            # Act
+            await file_service.cleanup_deleted_files(test_tenant.id)
 
-        # Assert
-        file_service.repository.get_deleted_files_for_cleanup.assert_called_once_with(
-            test_tenant.id, 60
-        )
+            # Assert
+            mock_collector.return_value.run.assert_called_once_with(test_tenant.id, 60)
 
     @pytest.mark.asyncio
     async def test_restore_file_success(
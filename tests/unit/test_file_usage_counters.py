@@ -0,0 +1,187 @@
+"""Unit tests for precomputed file storage usage counters."""
+
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.core.exceptions import APIException
+from app.core.files.usage import FileUsageService
+from app.models.file import FileUsageScope
+from app.models.folder import Folder
+from app.repositories.file_repository import FileRepository
+
+
+def _create_file(repo, tenant_id, name: str, size: int, **extra):
+    """Create a current file record with its initial version."""
+    file = repo.create(
+        {
+            "tenant_id": tenant_id,
+            "name": name,
+            "original_name": name,
+            "mime_type": extra.pop("mime_type", "text/plain"),
+            "size": size,
+            "storage_backend": "local",
+            "storage_path": f"{tenant_id}/{name}",
+            "is_current": True,
+            **extra,
+        }
+    )
+    repo.create_version(
+        {
+            "file_id": file.id,
+            "tenant_id": tenant_id,
+            "version_number": 1,
+            "storage_path": file.storage_path,
+            "storage_backend": "local",
+            "size": size,
+            "mime_type": file.mime_type,
+        }
+    )
+    return file
+
+
+def test_check_quota_uses_tenant_counter():
+    """Quota checks read the tenant counter instead of scanning files."""
+    tenant_id = uuid4()
+    repository = MagicMock()
+    repository.get_counter.return_value = MagicMock(
+        file_count=3, total_size=900, version_count=3
+    )
+    service = FileUsageService(MagicMock(), repository=repository)
+
+    service.check_quota(tenant_id, 100, quota=1000)
+    service.check_quota(tenant_id, 10_000, quota=None)
+    with pytest.raises(APIException) as exc_info:
+        service.check_quota(tenant_id, 101, quota=1000)
+
+    assert exc_info.value.status_code == 413
+    assert exc_info.value.code == "STORAGE_QUOTA_EXCEEDED"
+    repository.get_counter.assert_called_with(tenant_id, FileUsageScope.TENANT, "")
+
+
+def test_counters_follow_upload_delete_and_restore(db_session, test_tenant):
+    """Counters are updated in the same transaction as the file rows."""
+    repo = FileRepository(db_session)
+    service = FileUsageService(db_session)
+    entity_id = uuid4()
+    pdf = _create_file(
+        repo,
+        test_tenant.id,
+        "a.pdf",
+        300,
+        mime_type="application/pdf",
+        entity_type="product",
+        entity_id=entity_id,
+    )
+    _create_file(repo, test_tenant.id, "b.txt", 200)
+
+    assert service.get_usage(test_tenant.id) == {
+        "file_count": 2,
+        "total_size": 500,
+        "version_count": 2,
+    }
+    assert (
+        service.get_usage(
+            test_tenant.id, FileUsageScope.ENTITY, f"product:{entity_id}"
+        )["total_size"]
+        == 300
+    )
+    assert service.get_distribution(test_tenant.id, FileUsageScope.MIME_TYPE) == {
+        "application/pdf": 1,
+        "text/plain": 1,
+    }
+
+    repo.delete(pdf.id, test_tenant.id)
+    usage = service.get_usage(test_tenant.id)
+    assert (usage["file_count"], usage["total_size"]) == (1, 200)
+    assert service.get_distribution(test_tenant.id, FileUsageScope.ENTITY_TYPE) == {}
+
+    repo.restore(pdf.id, test_tenant.id)
+    usage = service.get_usage(test_tenant.id)
+    assert (usage["file_count"], usage["total_size"]) == (2, 500)
+
+
+def test_reconcile_corrects_drift(db_session, test_tenant):
+    """Reconciliation recomputes counters and drops stale scopes."""
+    repo = FileRepository(db_session)
+    service = FileUsageService(db_session)
+    _create_file(repo, test_tenant.id, "a.txt", 100)
+    _create_file(repo, test_tenant.id, "b.txt", 50)
+
+    # Simulate drift: a lost delta and a counter for a scope with no files
+    repo.usage.apply_deltas(
+        test_tenant.id,
+        {
+            ("tenant", ""): (5, 1000, 0),
+            ("mime_type", "image/png"): (2, 400, 0),
+        },
+    )
+    db_session.commit()
+
+    result = service.reconcile(test_tenant.id)
+
+    assert result["counters_corrected"] == 2
+    assert service.get_usage(test_tenant.id) == {
+        "file_count": 2,
+        "total_size": 150,
+        "version_count": 2,
+    }
+    assert service.get_distribution(test_tenant.id, FileUsageScope.MIME_TYPE) == {
+        "text/plain": 2
+    }
+    assert service.reconcile(test_tenant.id)["counters_corrected"] == 0
+
+
+def test_later_versions_count_towards_storage(db_session, test_tenant):
+    """Versions after the first add their size until the file is hard-deleted."""
+    repo = FileRepository(db_session)
+    service = FileUsageService(db_session)
+    file = _create_file(repo, test_tenant.id, "a.txt", 100)
+    repo.create_version(
+        {
+            "file_id": file.id,
+            "tenant_id": test_tenant.id,
+            "version_number": 2,
+            "storage_path": f"{test_tenant.id}/v2_a.txt",
+            "storage_backend": "local",
+            "size": 40,
+            "mime_type": "text/plain",
+        }
+    )
+
+    usage = service.get_usage(test_tenant.id)
+    assert (usage["total_size"], usage["version_count"]) == (140, 2)
+    assert service.reconcile(test_tenant.id)["counters_corrected"] == 0
+    with pytest.raises(APIException):
+        service.check_quota(test_tenant.id, 61, quota=200)
+
+    repo.delete(file.id, test_tenant.id)
+    assert service.get_usage(test_tenant.id)["total_size"] == 40
+    repo.hard_delete_files([file.id], test_tenant.id)
+    db_session.commit()
+    assert service.get_usage(test_tenant.id) == {
+        "file_count": 0,
+        "total_size": 0,
+        "version_count": 0,
+    }
+
+
+def test_moving_a_file_moves_its_folder_usage(db_session, test_tenant):
+    """The source folder counter drops and the target's grows with the move."""
+    repo = FileRepository(db_session)
+    service = FileUsageService(db_session)
+    source = Folder(tenant_id=test_tenant.id, name="in")
+    target = Folder(tenant_id=test_tenant.id, name="out")
+    db_session.add_all([source, target])
+    db_session.commit()
+    file = _create_file(repo, test_tenant.id, "a.txt", 100, folder_id=source.id)
+
+    repo.update(file.id, test_tenant.id, {"folder_id": target.id})
+
+    assert service.get_distribution(test_tenant.id, FileUsageScope.FOLDER) == {
+        str(target.id): 1
+    }
+    usage = service.get_usage(test_tenant.id, FileUsageScope.FOLDER, str(target.id))
+    assert usage["total_size"] == 100
+    assert service.get_usage(test_tenant.id)["file_count"] == 1
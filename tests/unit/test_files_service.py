@@ -1,10 +1,12 @@
 """Unit tests for FileService."""
 
+import io
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
 
+from app.core.exceptions import APIException
 from app.core.files.service import FileService
 from app.core.files.storage import LocalStorageBackend
 from app.core.pubsub import EventPublisher
@@ -74,6 +76,41 @@ async def test_upload_file(
     assert call_args[1]["event_type"] == "file.uploaded"
 
 
+@pytest.mark.asyncio
+async def test_upload_file_from_file_object(
+    file_service, test_user, test_tenant, mock_storage_backend
+):
+    """A file object is sized by seeking and copied to storage from its start."""
+    content = io.BytesIO(b"zip archive content")
+    content.seek(4)
+    mock_storage_backend.upload_fileobj = AsyncMock(return_value="test/path/a.zip")
+
+    file = await file_service.upload_file(
+        file_content=content,
+        filename="a.zip",
+        entity_type="template",
+        entity_id=uuid4(),
+        tenant_id=test_tenant.id,
+        user_id=test_user.id,
+    )
+
+    assert file.size == len(b"zip archive content")
+    assert file.mime_type == "application/zip"
+    mock_storage_backend.upload.assert_not_called()
+    fileobj, _ = mock_storage_backend.upload_fileobj.await_args.args
+    assert fileobj.read() == b"zip archive content"
+
+
+@pytest.mark.asyncio
+async def test_local_backend_copies_file_objects(tmp_path):
+    """The local backend writes a file object to disk in chunks."""
+    backend = LocalStorageBackend(base_path=str(tmp_path))
+
+    await backend.upload_fileobj(io.BytesIO(b"x" * 100_000), "t/batch.zip")
+
+    assert (tmp_path / "t" / "batch.zip").read_bytes() == b"x" * 100_000
+
+
 @pytest.mark.asyncio
 async def test_download_file(
     file_service, test_user, test_tenant, mock_storage_backend
@@ -175,6 +212,35 @@ async def test_create_file_version(
     assert updated_file.version_number == 2
 
 
+@pytest.mark.asyncio
+async def test_create_file_version_checks_quota(
+    file_service, test_user, test_tenant, mock_storage_backend
+):
+    """A version that would exceed the storage quota is not stored."""
+    file = await file_service.upload_file(
+        file_content=b"x" * 60,
+        filename="test.pdf",
+        entity_type=None,
+        entity_id=None,
+        tenant_id=test_tenant.id,
+        user_id=test_user.id,
+    )
+    mock_storage_backend.upload.reset_mock()
+    file_service._storage_config_service.get_storage_quota = MagicMock(return_value=100)
+
+    with pytest.raises(APIException) as exc_info:
+        await file_service.create_file_version(
+            file_id=file.id,
+            file_content=b"y" * 41,
+            filename="test_v2.pdf",
+            tenant_id=test_tenant.id,
+            user_id=test_user.id,
+        )
+
+    assert exc_info.value.code == "STORAGE_QUOTA_EXCEEDED"
+    mock_storage_backend.upload.assert_not_called()
+
+
 def test_get_file_versions(file_service, test_user, test_tenant):
     """Test getting file versions."""
     # This test would require creating a file with versions first
@@ -10,6 +10,7 @@
     ImportExportService,
 )
 from app.core.pubsub import EventPublisher
+from tests.helpers import get_outbox_events
 
 
 @pytest.fixture
@@ -85,9 +86,7 @@ def test_validate_data(data_importer):
     assert invalid_rows[0]["errors"][0] == "name is required"
 
 
-def test_create_import_job(
-    import_export_service, test_user, test_tenant, mock_event_publisher
-):
+def test_create_import_job(import_export_service, test_user, test_tenant, db_session):
     """Test creating an import job."""
     job = import_export_service.create_import_job(
         job_data={
@@ -104,5 +103,5 @@ def test_create_import_job(
     assert job.tenant_id == test_tenant.id
     assert job.created_by == test_user.id
 
-    # Verify event was published
-    assert mock_event_publisher.publish.called
+    # Verify event was stored in the outbox
+    assert get_outbox_events(db_session, test_tenant.id, "import.started")
@@ -0,0 +1,36 @@
+"""Unit tests for the in-process LRU cache helper."""
+
+from app.core.cache.lru import LRUCache
+
+
+def test_lookup_counts_hits_and_misses():
+    cache = LRUCache[str, int](maxsize=4)
+    assert cache.lookup("a") is None
+    cache.store("a", 1)
+    assert cache.lookup("a") == 1
+    assert cache.get_stats() == {
+        "size": 1,
+        "maxsize": 4,
+        "hits": 1,
+        "misses": 1,
+        "hit_ratio": 0.5,
+    }
+
+
+def test_store_evicts_least_recently_used():
+    cache = LRUCache[str, int](maxsize=2)
+    cache.store("a", 1)
+    cache.store("b", 2)
+    cache.lookup("a")
+    cache.store("c", 3)
+    assert cache.lookup("b") is None
+    assert (cache.lookup("a"), cache.lookup("c")) == (1, 3)
+
+
+def test_discard_drops_matching_keys():
+    cache = LRUCache[tuple[str, int], int](maxsize=8)
+    for key in (("a", 1), ("a", 2), ("b", 1)):
+        cache.store(key, key[1])
+    cache.discard(lambda key: key[0] == "a")
+    assert cache.get_stats()["size"] == 1
+    assert cache.lookup(("b", 1)) == 1
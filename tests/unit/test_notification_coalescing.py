@@ -0,0 +1,94 @@
+"""Unit tests for notification coalescing and digest rendering."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.core.notifications.digest import (
+    NotificationCoalescer,
+    event_family,
+    render_digest,
+)
+from app.core.notifications.service import NotificationService
+from app.models.notification import NotificationQueue, NotificationStatus
+from app.repositories.notification_repository import NotificationRepository
+
+
+def test_event_family_groups_task_deadlines():
+    """Due-soon and overdue events share a family; others stand alone."""
+    assert event_family("task.due_soon") == event_family("task.overdue")
+    assert event_family("task.status_changed") != event_family("task.due_soon")
+    assert event_family("calendar.reminder") == "calendar.reminder"
+
+
+def test_render_digest_lists_items():
+    """The compiled digest templates render the subject and one line per item."""
+    subject, body = render_digest(
+        {
+            "family": "task.deadlines",
+            "title": "Vencimientos de tareas",
+            "count": 2,
+            "items": [
+                {"event_type": "task.due_soon", "summary": "Task A is due"},
+                {"event_type": "task.overdue", "summary": "Task B is overdue"},
+            ],
+        }
+    )
+
+    assert subject == "Vencimientos de tareas (2)"
+    assert "- Task A is due" in body
+    assert "- Task B is overdue" in body
+
+
+@pytest.mark.asyncio
+async def test_coalescer_merges_storm_into_digest(db_session, test_user, test_tenant):
+    """Entries held in a digest window become one pending digest entry."""
+    repo = NotificationRepository(db_session)
+    for event_type in ("task.due_soon", "task.overdue"):
+        repo.create_template(
+            {
+                "tenant_id": test_tenant.id,
+                "name": event_type,
+                "event_type": event_type,
+                "channel": "email",
+                "subject": "{{task_title}}: " + event_type,
+                "body": "{{task_title}}",
+                "is_active": True,
+            }
+        )
+    service = NotificationService(db_session, event_publisher=MagicMock())
+    service.preferences_service = MagicMock()
+    service.preferences_service.get_preference.return_value = {
+        "enabled": True,
+        "channels": ["email"],
+        "window_seconds": 60,
+    }
+    for i in range(5):
+        await service.send(
+            event_type="task.overdue" if i % 2 else "task.due_soon",
+            recipient_id=test_user.id,
+            channels=["email"],
+            data={"task_title": f"Task {i}"},
+            tenant_id=test_tenant.id,
+            deliver=False,
+            coalesce=True,
+        )
+
+    coalescer = NotificationCoalescer(sessionmaker(bind=db_session.get_bind()))
+    assert coalescer.flush_due()["digests"] == 0
+    result = coalescer.flush_due(now=datetime.now(UTC) + timedelta(seconds=61))
+
+    assert result == {"groups": 1, "coalesced": 5, "digests": 1, "released": 0}
+    db_session.expire_all()
+    entries = (
+        db_session.query(NotificationQueue)
+        .filter(NotificationQueue.tenant_id == test_tenant.id)
+        .all()
+    )
+    pending = [e for e in entries if e.status == NotificationStatus.PENDING]
+    assert len(pending) == 1
+    assert pending[0].event_type == "digest.task.deadlines"
+    assert pending[0].data["digest"]["count"] == 5
+    assert sum(1 for e in entries if e.status == NotificationStatus.COALESCED) == 5
@@ -0,0 +1,241 @@
+"""Unit tests for the notification dispatcher, SMTP pool and rate limits."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.core.notifications.dispatcher import NotificationDispatcher
+from app.core.notifications.rate_limit import ChannelRateLimiter, TokenBucket
+from app.core.notifications.service import NotificationService
+from app.core.notifications.smtp_pool import SMTPConnectionPool, build_email_message
+from app.models.notification import NotificationQueue, NotificationStatus
+from app.repositories.notification_repository import NotificationRepository
+
+
+class LocalSMTPServer:
+    """Minimal in-process SMTP server standing in for a real relay."""
+
+    def __init__(self, drop_after: int | None = None):
+        self.messages: list[str] = []
+        self.connections = 0
+        self.drop_after = drop_after
+        self._server: asyncio.Server | None = None
+        self.port = 0
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer) -> None:
+        self.connections += 1
+        handled = 0
+        writer.write(b"220 localhost ESMTP\r\n")
+        try:
+            while line := await reader.readline():
+                command = line.decode().strip().upper()
+                if command.startswith(("EHLO", "HELO")):
+                    writer.write(b"250-localhost\r\n250 8BITMIME\r\n")
+                elif command == "DATA":
+                    writer.write(b"354 End data with <CR><LF>.<CR><LF>\r\n")
+                    await writer.drain()
+                    lines = []
+                    while (data_line := await reader.readline()) != b".\r\n":
+                        lines.append(data_line.decode())
+                    self.messages.append("".join(lines))
+                    handled += 1
+                    writer.write(b"250 OK\r\n")
+                    if self.drop_after and handled >= self.drop_after:
+                        await writer.drain()
+                        break
+                elif command == "QUIT":
+                    writer.write(b"221 Bye\r\n")
+                    await writer.drain()
+                    break
+                else:
+                    writer.write(b"250 OK\r\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+@pytest.fixture
+async def smtp_server():
+    """Start a local SMTP stand-in."""
+    server = LocalSMTPServer()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+def _message(index: int):
+    return build_email_message(
+        "noreply@test.com", f"user{index}@test.com", f"Subject {index}", "Body"
+    )
+
+
+@pytest.mark.asyncio
+async def test_smtp_pool_reuses_connections(smtp_server):
+    """Many messages go out over at most `size` persistent sessions."""
+    pool = SMTPConnectionPool("127.0.0.1", smtp_server.port, size=2, timeout=5)
+
+    await asyncio.gather(*(pool.send(_message(i)) for i in range(20)))
+    await pool.close()
+
+    assert len(smtp_server.messages) == 20
+    assert pool.connections_opened <= 2
+    assert smtp_server.connections <= 2
+
+
+@pytest.mark.asyncio
+async def test_smtp_pool_reconnects_after_disconnect():
+    """A session closed by the server is reopened and the send retried."""
+    server = LocalSMTPServer(drop_after=2)
+    await server.start()
+    pool = SMTPConnectionPool("127.0.0.1", server.port, size=1, timeout=5)
+    try:
+        for i in range(5):
+            await pool.send(_message(i))
+    finally:
+        await pool.close()
+        await server.stop()
+
+    assert len(server.messages) == 5
+    assert pool.connections_opened >= 3
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_smooths_bursts():
+    """After the burst capacity is used, acquisitions wait for refills."""
+    bucket = TokenBucket(rate=50, capacity=1)
+
+    start = time.monotonic()
+    for _ in range(6):
+        await bucket.acquire()
+    elapsed = time.monotonic() - start
+
+    assert elapsed >= 0.09
+
+
+def test_rate_limiter_buckets_per_provider():
+    """Providers get their own buckets; unlimited channels get none."""
+    limiter = ChannelRateLimiter({"email": 10, "sms:twilio": 1})
+
+    assert limiter.get_bucket("email", "smtp").rate == 10
+    assert limiter.get_bucket("sms", "twilio").rate == 1
+    assert limiter.get_bucket("email", "smtp") is not limiter.get_bucket(
+        "email", "other"
+    )
+    assert limiter.get_bucket("in-app") is None
+
+
+@pytest.mark.asyncio
+async def test_dispatch_batch_delivers_pending_entries(
+    db_session, test_user, test_tenant, smtp_server
+):
+    """Pending entries are delivered and marked sent in one batch."""
+    repo = NotificationRepository(db_session)
+    for channel in ("email", "in-app"):
+        repo.create_template(
+            {
+                "tenant_id": test_tenant.id,
+                "name": f"Due soon ({channel})",
+                "event_type": "task.due_soon",
+                "channel": channel,
+                "subject": "Task {{task_title}} is due",
+                "body": "{{task_title}} is due soon",
+                "is_active": True,
+            }
+        )
+    service = NotificationService(db_session, event_publisher=MagicMock())
+    service.preferences_service = MagicMock()
+    service.preferences_service.get_preference.return_value = {
+        "enabled": True,
+        "channels": ["email", "in-app"],
+    }
+    for i in range(3):
+        await service.send(
+            event_type="task.due_soon",
+            recipient_id=test_user.id,
+            channels=["email", "in-app"],
+            data={"task_title": f"Task {i}"},
+            tenant_id=test_tenant.id,
+            deliver=False,
+        )
+
+    publisher = MagicMock()
+    publisher.publish = AsyncMock()
+    dispatcher = NotificationDispatcher(
+        session_factory=sessionmaker(bind=db_session.get_bind()),
+        event_publisher=publisher,
+        smtp_pool=SMTPConnectionPool("127.0.0.1", smtp_server.port, timeout=5),
+        rate_limiter=ChannelRateLimiter({}),
+        batch_size=50,
+    )
+    result = await dispatcher.dispatch_batch()
+    await dispatcher.smtp_pool.close()
+
+    assert result == {"claimed": 6, "sent": 6, "failed": 0}
+    assert len(smtp_server.messages) == 3
+    assert publisher.publish.await_count == 6
+    db_session.expire_all()
+    statuses = {
+        entry.status
+        for entry in db_session.query(NotificationQueue).filter(
+            NotificationQueue.tenant_id == test_tenant.id
+        )
+    }
+    assert statuses == {NotificationStatus.SENT}
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_skips_entries_being_sent_inline(
+    db_session, test_user, test_tenant
+):
+    """A dispatch batch between the insert and the inline send leaves it alone."""
+    NotificationRepository(db_session).create_template(
+        {
+            "tenant_id": test_tenant.id,
+            "name": "Due soon",
+            "event_type": "task.due_soon",
+            "channel": "in-app",
+            "body": "{{task_title}} is due soon",
+            "is_active": True,
+        }
+    )
+    service = NotificationService(db_session, event_publisher=AsyncMock())
+    service.preferences_service = MagicMock()
+    service.preferences_service.get_preference.return_value = {
+        "enabled": True,
+        "channels": ["in-app"],
+    }
+    dispatcher = NotificationDispatcher(
+        session_factory=sessionmaker(bind=db_session.get_bind()),
+        event_publisher=AsyncMock(),
+        rate_limiter=ChannelRateLimiter({}),
+        batch_size=50,
+    )
+    batches = []
+    send_inline = service._send_notification
+
+    async def send_after_dispatch(entry, template, data):
+        batches.append(await dispatcher.dispatch_batch())
+        await send_inline(entry, template, data)
+
+    service._send_notification = send_after_dispatch
+    result = await service.send(
+        event_type="task.due_soon",
+        recipient_id=test_user.id,
+        channels=["in-app"],
+        data={"task_title": "Report"},
+        tenant_id=test_tenant.id,
+    )
+
+    assert batches == [{"claimed": 0, "sent": 0, "failed": 0}]
+    assert [entry["status"] for entry in result] == [NotificationStatus.SENT]
@@ -0,0 +1,63 @@
+"""Unit tests for the compiled notification template cache."""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.core.notifications.service import render_template
+from app.core.notifications.template_cache import NotificationTemplateCache
+
+
+def _template(event_type="task.due_soon", channel="email", body="{{task_title}}"):
+    return SimpleNamespace(
+        id=uuid4(),
+        event_type=event_type,
+        channel=channel,
+        subject="Due: {{task_title}}",
+        body=body,
+    )
+
+
+def test_render_template_keeps_unknown_placeholders():
+    """Known variables are substituted, unknown placeholders left as written."""
+    text = "Task {{task_title}} due {{ due_date }} ({{unknown}})"
+    data = {"task_title": "<Report>", "due_date": "2026-10-20", "extra": 1}
+
+    assert render_template(text, data) == "Task <Report> due 2026-10-20 ({{unknown}})"
+
+
+def test_cache_loads_tenant_once_and_invalidates():
+    """A tenant's templates are loaded once until invalidated."""
+    cache = NotificationTemplateCache(ttl_seconds=60)
+    tenant_id = uuid4()
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return [_template(), _template(channel="sms")]
+
+    email = cache.get(tenant_id, "task.due_soon", "email", loader)
+    sms = cache.get(tenant_id, "task.due_soon", "sms", loader)
+    missing = cache.get(tenant_id, "task.overdue", "email", loader)
+
+    assert email.render_subject({"task_title": "Report"}) == "Due: Report"
+    assert sms.channel == "sms"
+    assert missing is None
+    assert len(loads) == 1
+
+    cache.invalidate(tenant_id)
+    cache.get(tenant_id, "task.due_soon", "email", loader)
+    assert len(loads) == 2
+    assert cache.get_stats()["hits"] == 2
+
+
+def test_cache_skips_invalid_templates():
+    """A template that fails to compile does not hide the tenant's others."""
+    cache = NotificationTemplateCache(ttl_seconds=60)
+    tenant_id = uuid4()
+
+    def loader():
+        return [_template(channel="sms", body="{% if %}"), _template()]
+
+    assert cache.get(tenant_id, "task.due_soon", "sms", loader) is None
+    email = cache.get(tenant_id, "task.due_soon", "email", loader)
+    assert email.render_body({"task_title": "Report"}) == "Report"
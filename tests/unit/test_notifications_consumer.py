@@ -1,13 +1,18 @@
 """Unit tests for NotificationEventConsumer."""
 
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.orm import sessionmaker
 
 from app.core.notifications.consumer import NotificationEventConsumer
+from app.core.notifications.digest import NotificationCoalescer
 from app.core.pubsub import EventConsumer
 from app.core.pubsub.models import Event, EventMetadata
+from app.models.notification import NotificationQueue, NotificationStatus
+from app.repositories.notification_repository import NotificationRepository
 
 
 @pytest.fixture
@@ -122,3 +127,60 @@ async def test_extract_notification_data(notification_consumer):
     assert data["entity_type"] == "product"
     assert data["product_name"] == "Test Product"
     assert data["sku"] == "TEST-001"
+
+
+@pytest.mark.asyncio
+async def test_task_status_changes_become_one_digest(
+    notification_consumer, db_session, test_user, test_tenant
+):
+    """A burst of in-app status changes reaches the user as a single digest."""
+    NotificationRepository(db_session).create_template(
+        {
+            "tenant_id": test_tenant.id,
+            "name": "Status changed",
+            "event_type": "task.status_changed",
+            "channel": "in-app",
+            "body": "{{task_title}}: {{new_status}}",
+            "is_active": True,
+        }
+    )
+    preferences = MagicMock()
+    preferences.get_preference.return_value = {
+        "enabled": True,
+        "channels": ["in-app"],
+        "window_seconds": 60,
+    }
+    notification_consumer.notification_service.preferences_service = preferences
+    for status in ("todo", "in_progress", "review", "done"):
+        await notification_consumer._handle_event(
+            Event(
+                event_type="task.status_changed",
+                entity_type="task",
+                entity_id=uuid4(),
+                tenant_id=test_tenant.id,
+                user_id=test_user.id,
+                metadata=EventMetadata(
+                    source="test",
+                    version="1.0",
+                    additional_data={"task_title": "Report", "new_status": status},
+                ),
+            )
+        )
+
+    result = NotificationCoalescer(sessionmaker(bind=db_session.get_bind())).flush_due(
+        now=datetime.now(UTC) + timedelta(seconds=61)
+    )
+
+    assert result == {"groups": 1, "coalesced": 4, "digests": 1, "released": 0}
+    db_session.expire_all()
+    pending = (
+        db_session.query(NotificationQueue)
+        .filter(
+            NotificationQueue.tenant_id == test_tenant.id,
+            NotificationQueue.status == NotificationStatus.PENDING,
+        )
+        .all()
+    )
+    assert [(entry.event_type, entry.channel) for entry in pending] == [
+        ("digest.task.activity", "in-app")
+    ]
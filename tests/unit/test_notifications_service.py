@@ -344,3 +344,34 @@ async def test_send_webhook_timeout(notification_service):
             await notification_service._send_webhook(
                 "https://webhook.example.com/test", payload
             )
+
+
+@pytest.mark.asyncio
+async def test_send_many_queues_for_all_recipients(
+    notification_service, test_user, test_tenant, test_template
+):
+    """send_many resolves preferences in bulk and queues one entry per recipient."""
+    from uuid import uuid4
+
+    from app.models.notification import NotificationStatus
+
+    other_id = uuid4()
+    notification_service.preferences_service.resolve_preferences = MagicMock(
+        return_value={
+            test_user.id: {"enabled": True, "channels": ["email"]},
+            other_id: {"enabled": False},
+        }
+    )
+
+    result = await notification_service.send_many(
+        event_type="product.created",
+        recipient_ids=[test_user.id, other_id, test_user.id],
+        channels=["email", "sms"],
+        data={"product_name": "Test Product", "sku": "TEST-001"},
+        tenant_id=test_tenant.id,
+    )
+
+    assert len(result) == 1
+    assert result[0]["recipient_id"] == test_user.id
+    assert result[0]["channel"] == "email"
+    assert result[0]["status"] == NotificationStatus.PENDING
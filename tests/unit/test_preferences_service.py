@@ -56,3 +56,42 @@ def test_set_org_preference(preferences_service, test_tenant):
     )
     assert result["key"] == "default_language"
     assert result["value"] == "es"
+
+
+def test_resolve_preferences_for_many_users(
+    preferences_service, db_session, test_user, test_tenant
+):
+    """Batch resolution applies org -> role -> user per user."""
+    from uuid import uuid4
+
+    from app.models.module_role import ModuleRole
+    from app.models.user import User
+
+    other = User(
+        email=f"other-{uuid4().hex[:8]}@example.com",
+        password_hash="x",
+        full_name="Other User",
+        tenant_id=test_tenant.id,
+        is_active=True,
+    )
+    db_session.add(other)
+    db_session.flush()
+    role = ModuleRole(user_id=other.id, module="notifications", role_name="viewer")
+    db_session.add(role)
+    db_session.flush()
+
+    preferences_service.set_org_preference(test_tenant.id, "basic", "language", "es")
+    preferences_service.set_role_preference(
+        role.id, test_tenant.id, "basic", "language", "pt"
+    )
+    preferences_service.set_preference(
+        test_user.id, test_tenant.id, "basic", "language", "en"
+    )
+
+    resolved = preferences_service.resolve_preferences(
+        [test_user.id, other.id, uuid4()], test_tenant.id, "basic", "language"
+    )
+
+    assert resolved[test_user.id] == "en"
+    assert resolved[other.id] == "pt"
+    assert list(resolved.values())[2] == "es"
@@ -0,0 +1,165 @@
+"""Unit tests for the reminder pump."""
+
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy.orm import sessionmaker
+
+from app.core.calendar.service import CalendarService
+from app.core.notifications.reminders import (
+    ReminderPump,
+    event_recipients,
+    task_recipients,
+)
+from app.models.calendar import CalendarEvent, EventAttendee, EventReminder
+from app.models.notification import NotificationQueue
+from app.models.task import Task, TaskAssignment, TaskReminder
+from app.models.user import User
+from app.repositories.notification_repository import NotificationRepository
+from app.repositories.task_repository import TaskRepository
+from tests.helpers import get_outbox_events
+
+
+def test_event_recipients_skip_declined_and_duplicates():
+    """Organizer and attendees with an account who did not decline, once each."""
+    organizer, accepted, declined = uuid4(), uuid4(), uuid4()
+    event = CalendarEvent(
+        organizer_id=organizer,
+        attendees=[
+            EventAttendee(user_id=accepted, status="accepted"),
+            EventAttendee(user_id=declined, status="declined"),
+            EventAttendee(user_id=organizer, status="accepted"),
+            EventAttendee(email="guest@example.com", status="pending"),
+        ],
+    )
+
+    assert event_recipients(event) == [organizer, accepted]
+
+
+def test_task_recipients_fall_back_to_creator():
+    """Assigned users get the reminder; the creator only if nobody is assigned."""
+    creator, assignee, co_assignee = uuid4(), uuid4(), uuid4()
+
+    assert task_recipients(
+        Task(
+            created_by_id=creator,
+            assigned_to_id=assignee,
+            assignments=[TaskAssignment(assigned_to_id=co_assignee)],
+        )
+    ) == [assignee, co_assignee]
+    assert task_recipients(Task(created_by_id=creator, assignments=[])) == [creator]
+
+
+def test_process_batch_queues_due_reminders_once(
+    db_session, test_tenant, test_user, mock_event_publisher
+):
+    """Due reminders are queued per recipient, marked sent and never claimed twice."""
+    now = datetime.now(UTC)
+    attendee = User(
+        email=f"attendee-{uuid4().hex[:8]}@example.com",
+        password_hash="x",
+        full_name="Attendee",
+        tenant_id=test_tenant.id,
+        is_active=True,
+    )
+    db_session.add(attendee)
+    db_session.commit()
+    notifications = NotificationRepository(db_session)
+    for event_type in ("calendar.event_reminder", "task.reminder"):
+        notifications.create_template(
+            {
+                "tenant_id": test_tenant.id,
+                "name": event_type,
+                "event_type": event_type,
+                "channel": "in-app",
+                "body": "Reminder",
+                "is_active": True,
+            }
+        )
+
+    calendar_service = CalendarService(
+        db=db_session, event_publisher=mock_event_publisher
+    )
+    calendar = calendar_service.create_calendar(
+        calendar_data={"name": "Reminders", "calendar_type": "user"},
+        tenant_id=test_tenant.id,
+        owner_id=test_user.id,
+    )
+
+    def event(**fields) -> CalendarEvent:
+        return calendar_service.create_event(
+            event_data={
+                "calendar_id": calendar.id,
+                "title": "Standup",
+                "start_time": now + timedelta(minutes=10),
+                "end_time": now + timedelta(minutes=40),
+                **fields,
+            },
+            tenant_id=test_tenant.id,
+            organizer_id=test_user.id,
+        )
+
+    def reminder(event_id, minutes_before) -> EventReminder:
+        return calendar_service.add_reminder(
+            event_id,
+            test_tenant.id,
+            {"reminder_type": "in_app", "minutes_before": minutes_before},
+        )
+
+    standup = event()
+    calendar_service.add_attendee(
+        standup.id, test_tenant.id, {"user_id": attendee.id, "status": "accepted"}
+    )
+    due = reminder(standup.id, 15)
+    not_due = reminder(standup.id, 5)
+    cancelled = reminder(event(status="cancelled").id, 15)
+
+    tasks = TaskRepository(db_session)
+
+    def task_reminder(**fields) -> TaskReminder:
+        task = tasks.create_task(
+            {
+                "tenant_id": test_tenant.id,
+                "title": "Review",
+                "created_by_id": test_user.id,
+                **fields,
+            }
+        )
+        return tasks.create_reminder(
+            task.id, test_tenant.id, "in_app", now - timedelta(minutes=1)
+        )
+
+    task_due = task_reminder(assigned_to_id=attendee.id)
+    task_done = task_reminder(status="done")
+
+    pump = ReminderPump(
+        session_factory=sessionmaker(bind=db_session.get_bind()), batch_size=1000
+    )
+    first = pump.process_batch()
+    second = pump.process_batch()
+
+    db_session.expire_all()
+    assert first["claimed"] >= 4
+    assert second["claimed"] == 0
+    assert all(db_session.get(EventReminder, r.id).is_sent for r in (due, cancelled))
+    assert not db_session.get(EventReminder, not_due.id).is_sent
+    assert all(db_session.get(TaskReminder, r.id).sent for r in (task_due, task_done))
+    queued = db_session.query(NotificationQueue).filter(
+        NotificationQueue.tenant_id == test_tenant.id
+    )
+    assert sorted((e.event_type, e.recipient_id) for e in queued) == sorted(
+        [
+            ("calendar.event_reminder", test_user.id),
+            ("calendar.event_reminder", attendee.id),
+            ("task.reminder", attendee.id),
+        ]
+    )
+    assert (
+        len(
+            get_outbox_events(
+                db_session, test_tenant.id, "calendar.event_reminder_sent"
+            )
+        )
+        == 1
+    )
+    assert len(get_outbox_events(db_session, test_tenant.id, "task.reminder_sent")) == 1
@@ -0,0 +1,229 @@
+"""Unit tests for the stock balance projection of the move ledger."""
+
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config_file import get_settings
+from app.core.exceptions import APIException
+from app.modules.inventory.models.inventory import StockBalance
+from app.modules.inventory.services.inventory_service import InventoryService
+
+
+def _move(service, tenant_id, user_id, product, quantity, source=None, **fields):
+    return service.create_stock_move(
+        tenant_id,
+        user_id,
+        {
+            "product_id": product.id,
+            "from_location_id": source.id if source else None,
+            "to_location_id": fields.pop("to", None),
+            "quantity": Decimal(quantity),
+            "move_type": fields.pop("move_type", "adjustment"),
+            **fields,
+        },
+    )
+
+
+def test_moves_update_balances_at_moving_average_cost(
+    inventory_service, test_tenant, test_user, product, locations
+):
+    """Receipts add value at cost; issues and transfers take the average."""
+    a, b, c = locations
+    tenant_id, user_id = test_tenant.id, test_user.id
+    _move(inventory_service, tenant_id, user_id, product, 10, to=a.id, unit_cost=2)
+    _move(inventory_service, tenant_id, user_id, product, 10, to=a.id, unit_cost=4)
+    _move(inventory_service, tenant_id, user_id, product, 5, source=a, to=b.id)
+    _move(inventory_service, tenant_id, user_id, product, 3, source=b)
+    _move(inventory_service, tenant_id, user_id, product, 4, source=a, to=c.id)
+
+    balances = inventory_service.balances
+    on_hand = balances.get_on_hand(tenant_id, product.id, a.id)
+    assert (on_hand.quantity, on_hand.value) == (Decimal(11), Decimal(33))
+    on_hand = balances.get_on_hand(tenant_id, product.id, b.id)
+    assert (on_hand.quantity, on_hand.value) == (Decimal(2), Decimal(6))
+    assert on_hand.warehouse_id == a.warehouse_id
+
+    totals = {
+        row["warehouse_id"]: (row["quantity"], row["value"])
+        for row in balances.get_warehouse_stock(tenant_id, product_id=product.id)
+    }
+    assert totals == {
+        a.warehouse_id: (Decimal(13), Decimal(39)),
+        c.warehouse_id: (Decimal(4), Decimal(12)),
+    }
+
+
+def test_moves_cannot_take_more_than_available(
+    inventory_service, test_tenant, test_user, product, locations
+):
+    """Issuing beyond on hand minus reserved is refused and nothing is written."""
+    a, b, _ = locations
+    tenant_id, user_id = test_tenant.id, test_user.id
+    _move(inventory_service, tenant_id, user_id, product, 5, to=a.id, unit_cost=1)
+    inventory_service.balances.reserve(tenant_id, product.id, a.id, Decimal(2))
+
+    with pytest.raises(APIException) as exc_info:
+        _move(inventory_service, tenant_id, user_id, product, 4, source=a, to=b.id)
+    assert exc_info.value.status_code == 409
+    assert exc_info.value.code == "INSUFFICIENT_STOCK"
+
+    assert len(inventory_service.list_stock_moves(tenant_id)) == 1
+    assert inventory_service.balances.get_on_hand(tenant_id, product.id, b.id) is None
+    _move(inventory_service, tenant_id, user_id, product, 3, source=a, to=b.id)
+
+
+def test_negative_stock_allowed_by_setting(
+    inventory_service, test_tenant, test_user, product, locations, monkeypatch
+):
+    """INVENTORY_ALLOW_NEGATIVE_STOCK turns the guard off."""
+    monkeypatch.setattr(get_settings(), "INVENTORY_ALLOW_NEGATIVE_STOCK", True)
+    a = locations[0]
+    _move(inventory_service, test_tenant.id, test_user.id, product, 2, source=a)
+
+    balance = inventory_service.balances.get_on_hand(test_tenant.id, product.id, a.id)
+    assert (balance.quantity, balance.value) == (Decimal(-2), Decimal(0))
+
+
+def test_rebuild_matches_incremental_balances(
+    inventory_service, db_session, test_tenant, test_user, product, locations
+):
+    """Replaying the ledger gives the same balances and keeps reservations."""
+    a, b, c = locations
+    tenant_id, user_id = test_tenant.id, test_user.id
+    _move(inventory_service, tenant_id, user_id, product, 7, to=a.id, unit_cost=3)
+    _move(inventory_service, tenant_id, user_id, product, 3, source=a, to=b.id)
+    _move(inventory_service, tenant_id, user_id, product, -1, source=a, to=b.id)
+    _move(inventory_service, tenant_id, user_id, product, 2, source=b, to=c.id)
+    inventory_service.balances.reserve(tenant_id, product.id, a.id, Decimal(1))
+
+    def snapshot():
+        db_session.expire_all()
+        return {
+            balance.location_id: (balance.quantity, balance.reserved, balance.value)
+            for balance in db_session.query(StockBalance).filter(
+                StockBalance.tenant_id == tenant_id
+            )
+        }
+
+    before = snapshot()
+    assert before[a.id] == (Decimal(5), Decimal(1), Decimal(15))
+    assert inventory_service.balances.rebuild(tenant_id) == 3
+    assert snapshot() == before
+
+
+def test_rebuild_skips_deleted_locations(
+    inventory_service,
+    db_session,
+    monkeypatch,
+    test_tenant,
+    test_user,
+    product,
+    locations,
+):
+    """Positions at locations deleted during or before a rebuild are dropped."""
+    a, b, c = locations
+    tenant_id, user_id = test_tenant.id, test_user.id
+    _move(inventory_service, tenant_id, user_id, product, 6, to=a.id, unit_cost=2)
+    _move(inventory_service, tenant_id, user_id, product, 2, source=a, to=b.id)
+    _move(inventory_service, tenant_id, user_id, product, 1, source=a, to=c.id)
+    inventory_service.delete_location(tenant_id, c.id)
+    db_session.expire_all()
+
+    # Location b goes away between reading the locations and the ledger
+    repository = inventory_service.balances.repository
+    warehouses = repository.get_location_warehouses(tenant_id)
+    del warehouses[b.id]
+    monkeypatch.setattr(
+        repository, "get_location_warehouses", lambda *args, **kwargs: warehouses
+    )
+
+    assert inventory_service.balances.rebuild(tenant_id) == 1
+    db_session.expire_all()
+    balances = db_session.query(StockBalance).filter(
+        StockBalance.tenant_id == tenant_id
+    )
+    assert [(balance.location_id, balance.quantity) for balance in balances] == [
+        (a.id, 3)
+    ]
+
+
+def test_parallel_issues_of_one_sku_never_oversell(
+    db_session, test_tenant, test_user, product, locations
+):
+    """Concurrent moves on the same balance serialize on its row lock."""
+    a, b, _ = locations
+    stock, attempts = 10, 40
+    _move(
+        InventoryService(db_session),
+        test_tenant.id,
+        test_user.id,
+        product,
+        stock,
+        to=a.id,
+        unit_cost=1,
+    )
+    session_factory = sessionmaker(bind=db_session.get_bind())
+    # Read IDs up front: the fixtures' objects belong to the main session
+    tenant_id, user_id = test_tenant.id, test_user.id
+    data = {
+        "product_id": product.id,
+        "from_location_id": a.id,
+        "to_location_id": b.id,
+        "quantity": Decimal(1),
+        "move_type": "transfer",
+    }
+
+    def issue(_):
+        with session_factory() as session:
+            try:
+                InventoryService(session).create_stock_move(tenant_id, user_id, data)
+            except APIException as exc:
+                return exc.code
+            return "ok"
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        outcomes = list(pool.map(issue, range(attempts)))
+
+    assert outcomes.count("ok") == stock
+    assert outcomes.count("INSUFFICIENT_STOCK") == attempts - stock
+    balances = InventoryService(db_session).balances
+    db_session.expire_all()
+    source = balances.get_on_hand(tenant_id, data["product_id"], a.id)
+    destination = balances.get_on_hand(tenant_id, data["product_id"], b.id)
+    assert (source.quantity, source.value) == (0, 0)
+    assert (destination.quantity, destination.value) == (stock, stock)
+
+
+def test_rebuild_does_not_lose_concurrent_moves(
+    db_session, test_tenant, test_user, product, locations
+):
+    """A rebuild waits for moves in flight, and moves wait for the rebuild."""
+    a = locations[0]
+    session_factory = sessionmaker(bind=db_session.get_bind())
+    tenant_id, user_id = test_tenant.id, test_user.id
+    data = {
+        "product_id": product.id,
+        "to_location_id": a.id,
+        "quantity": Decimal(1),
+        "unit_cost": Decimal(2),
+        "move_type": "receipt",
+    }
+
+    def work(index):
+        with session_factory() as session:
+            service = InventoryService(session)
+            if index % 5:
+                service.create_stock_move(tenant_id, user_id, data)
+            else:
+                service.balances.rebuild(tenant_id)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(work, range(50)))
+
+    balance = InventoryService(db_session).balances.get_on_hand(
+        tenant_id, data["product_id"], a.id
+    )
+    assert (balance.quantity, balance.value) == (40, 80)
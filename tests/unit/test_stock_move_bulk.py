@@ -0,0 +1,131 @@
+"""Unit tests for bulk stock move imports."""
+
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from app.core.exceptions import APIException
+from app.models.event_outbox import EventOutbox
+from app.modules.inventory.models.inventory import StockBalance
+from app.modules.inventory.services.inventory_service import PER_LINE
+
+
+def _line(product_id, quantity, source=None, destination=None, unit_cost=None):
+    return {
+        "product_id": product_id,
+        "from_location_id": source,
+        "to_location_id": destination,
+        "quantity": Decimal(quantity),
+        "unit_cost": unit_cost,
+        "move_type": "receipt" if source is None else "transfer",
+        "reference": "PO-1",
+    }
+
+
+def _events(db_session, tenant_id):
+    return (
+        db_session.query(EventOutbox)
+        .filter(
+            EventOutbox.tenant_id == tenant_id,
+            EventOutbox.event_type == "inventory.movements.created",
+        )
+        .all()
+    )
+
+
+def test_per_line_mode_imports_valid_lines_and_reports_the_rest(
+    inventory_service, db_session, test_tenant, test_user, product, locations
+):
+    """Bad lines are listed by index; later lines see earlier ones' stock."""
+    a, b, _ = (location.id for location in locations)
+    lines = [
+        _line(product.id, 10, destination=a, unit_cost=Decimal(2)),
+        _line(product.id, 4, source=a, destination=b),
+        _line(product.id, 1, destination=uuid4()),
+        _line(uuid4(), 1, destination=a),
+        _line(product.id, 0, destination=a),
+        _line(product.id, 20, source=a),
+        _line(product.id, 1, source=b),
+    ]
+
+    result = inventory_service.create_stock_moves(
+        test_tenant.id, test_user.id, lines, mode=PER_LINE
+    )
+
+    assert [move.quantity for move in result.moves] == [10, 4, 1]
+    assert [(error["line"], error["code"]) for error in result.errors] == [
+        (2, "LOCATION_NOT_FOUND"),
+        (3, "PRODUCT_NOT_FOUND"),
+        (4, "INVALID_STOCK_MOVE"),
+        (5, "INSUFFICIENT_STOCK"),
+    ]
+    # One created_at step per line keeps the ledger in line order
+    moves = inventory_service.list_stock_moves(test_tenant.id)
+    assert [move.id for move in reversed(moves)] == [m.id for m in result.moves]
+    balances = inventory_service.balances
+    assert balances.get_on_hand(test_tenant.id, product.id, a).quantity == 6
+    on_hand = balances.get_on_hand(test_tenant.id, product.id, b)
+    assert (on_hand.quantity, on_hand.value) == (3, 6)
+
+    events = _events(db_session, test_tenant.id)
+    assert len(events) == 1
+
+
+def test_all_or_nothing_mode_imports_nothing_when_a_line_fails(
+    inventory_service, db_session, test_tenant, test_user, product, locations
+):
+    """One bad line rejects the batch and lists every bad line."""
+    a, b, _ = (location.id for location in locations)
+    lines = [
+        _line(product.id, 10, destination=a),
+        _line(product.id, 11, source=a, destination=b),
+        _line(product.id, 1, destination=uuid4()),
+    ]
+
+    with pytest.raises(APIException) as exc_info:
+        inventory_service.create_stock_moves(test_tenant.id, test_user.id, lines)
+
+    assert exc_info.value.code == "INVALID_STOCK_MOVES"
+    assert [error["line"] for error in exc_info.value.details["errors"]] == [1, 2]
+    assert inventory_service.list_stock_moves(test_tenant.id) == []
+    assert (
+        db_session.query(StockBalance)
+        .filter(StockBalance.tenant_id == test_tenant.id)
+        .count()
+        == 0
+    )
+    assert _events(db_session, test_tenant.id) == []
+
+
+def test_bulk_query_count_does_not_grow_with_lines(
+    inventory_service, db_session, test_tenant, test_user, product, locations
+):
+    """Validation, balances, inserts and the event take a fixed statement count."""
+    a, b, _ = (location.id for location in locations)
+    statements = []
+
+    def count(*_):
+        statements.append(1)
+
+    engine = db_session.get_bind()
+    counts = []
+    for size in (2, 200):
+        lines = [
+            _line(product.id, 2, destination=a, unit_cost=Decimal(1)),
+            *(_line(product.id, 1, source=a, destination=b) for _ in range(size - 1)),
+        ]
+        lines[0]["quantity"] = Decimal(size)
+        statements.clear()
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            result = inventory_service.create_stock_moves(
+                test_tenant.id, test_user.id, lines
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+        assert len(result.moves) == size
+        counts.append(len(statements))
+
+    assert counts[0] == counts[1]
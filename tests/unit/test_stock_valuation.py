@@ -0,0 +1,235 @@
+"""Unit tests for FIFO and moving-average stock valuation."""
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert
+
+from app.core.config_file import get_settings
+from app.core.exceptions import APIException
+from app.modules.inventory.models.inventory import StockMove
+from app.modules.inventory.services.costing import (
+    AVERAGE,
+    FIFO,
+    FifoPosition,
+    replay,
+)
+from app.modules.inventory.services.inventory_service import InventoryService
+from app.modules.inventory.services.valuation_service import StockValuationService
+from app.modules.products.models.product import Product
+
+PRODUCT = uuid4()
+A, B = uuid4(), uuid4()
+
+
+def _move(quantity, source=None, destination=None, unit_cost=None):
+    return SimpleNamespace(
+        product_id=PRODUCT,
+        from_location_id=source,
+        to_location_id=destination,
+        quantity=Decimal(quantity),
+        unit_cost=None if unit_cost is None else Decimal(unit_cost),
+    )
+
+
+LEDGER = [
+    _move(10, destination=A, unit_cost=2),
+    _move(10, destination=A, unit_cost=4),
+    _move(15, source=A),
+    _move(4, source=A, destination=B),
+]
+
+
+def test_fifo_consumes_oldest_layers_first():
+    """Sales take the oldest cost; transfers carry their layers along."""
+    positions = {}
+    replay(LEDGER[:3], positions, FIFO)
+
+    position = positions[(PRODUCT, A)]
+    assert (position.quantity, position.value, position.cogs) == (5, 20, 40)
+    assert position.layers == [(5, 4)]
+
+    replay(LEDGER[3:], positions, FIFO)
+    assert positions[(PRODUCT, B)].layers == [(4, 4)]
+    assert positions[(PRODUCT, A)].value == 4
+
+
+def test_average_costs_at_the_running_average():
+    """Average cost matches the stock balance projection."""
+    positions = {}
+    replay(LEDGER, positions, AVERAGE)
+
+    assert (positions[(PRODUCT, A)].quantity, positions[(PRODUCT, A)].value) == (
+        1,
+        3,
+    )
+    assert positions[(PRODUCT, A)].cogs == 45
+    assert positions[(PRODUCT, B)].value == 12
+
+
+def test_fifo_shortfall_is_filled_by_the_next_receipt():
+    """Stock issued before it arrives is trued up to the receipt's cost."""
+    position = FifoPosition(layers=[("1", "2")], quantity=1, value=2)
+
+    value, layers = position.issue(Decimal(4))
+    assert value == 8
+    assert layers == [(1, 2), (3, 2)]
+    assert position.quantity == -3
+
+    position.receive(Decimal(5), None, [(Decimal(5), Decimal(3))])
+    assert (position.quantity, position.value, position.cogs) == (2, 6, 3)
+    assert position.layers == [(2, 3)]
+
+
+def _product(db_session, tenant_id):
+    product = Product(
+        tenant_id=tenant_id,
+        sku=f"SKU-{uuid4().hex[:8]}",
+        name="Test Product",
+        currency="USD",
+        is_active=True,
+        track_inventory=True,
+    )
+    db_session.add(product)
+    db_session.commit()
+    return product
+
+
+def _insert_moves(db_session, tenant_id, user_id, product_id, start, moves):
+    """Insert (offset, source, destination, quantity, unit_cost) moves."""
+    db_session.execute(
+        insert(StockMove),
+        [
+            {
+                "id": uuid4(),
+                "tenant_id": tenant_id,
+                "product_id": product_id,
+                "from_location_id": source,
+                "to_location_id": destination,
+                "quantity": Decimal(quantity),
+                "unit_cost": unit_cost,
+                "move_type": "adjustment",
+                "created_by": user_id,
+                "created_at": start + offset,
+            }
+            for offset, source, destination, quantity, unit_cost in moves
+        ],
+    )
+    db_session.commit()
+
+
+@pytest.fixture
+def ledger(db_session, test_tenant, test_user):
+    """Receipts, a transfer and sales on four consecutive days."""
+    service = InventoryService(db_session)
+    warehouse = service.create_warehouse(
+        test_tenant.id, {"name": "Main", "code": "MAIN"}
+    )
+    a, b = (
+        service.create_location(
+            test_tenant.id, warehouse.id, {"name": code, "code": code}
+        )
+        for code in ("A", "B")
+    )
+    product = _product(db_session, test_tenant.id)
+
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    _insert_moves(
+        db_session,
+        test_tenant.id,
+        test_user.id,
+        product.id,
+        start,
+        [
+            (timedelta(days=0), None, a.id, 10, 2),
+            (timedelta(days=1), None, a.id, 10, 4),
+            (timedelta(days=2), a.id, None, 15, None),
+            (timedelta(days=3), a.id, b.id, 4, None),
+        ],
+    )
+    return SimpleNamespace(
+        tenant_id=test_tenant.id,
+        user_id=test_user.id,
+        product_id=product.id,
+        a=a.id,
+        b=b.id,
+        start=start,
+    )
+
+
+def test_valuation_as_of_replays_up_to_the_date(db_session, ledger):
+    """Each date sees only the moves created up to it."""
+    service = StockValuationService(db_session)
+
+    report = service.valuation_as_of(
+        ledger.tenant_id, ledger.start + timedelta(days=1), FIFO
+    )
+    assert report["total_value"] == 60
+    assert [(line["quantity"], line["unit_cost"]) for line in report["lines"]] == [
+        (20, 3)
+    ]
+
+    report = service.valuation_as_of(
+        ledger.tenant_id, ledger.start + timedelta(days=3), FIFO
+    )
+    values = {line["location_id"]: line["value"] for line in report["lines"]}
+    assert values == {ledger.a: 4, ledger.b: 16}
+    assert report["total_cogs"] == 40
+
+    cost = service.cost_of_sales(
+        ledger.tenant_id,
+        ledger.start + timedelta(hours=12),
+        ledger.start + timedelta(days=3),
+        AVERAGE,
+    )
+    assert cost["lines"] == [{"product_id": ledger.product_id, "cogs": 45}]
+
+
+def test_checkpoints_shorten_replays_without_changing_results(
+    db_session, ledger, monkeypatch
+):
+    """A report after a checkpoint only replays the moves since, in parallel."""
+    # A position emptied before the checkpoint prices a later issue at the
+    # cost it last received stock at
+    emptied = _product(db_session, ledger.tenant_id).id
+    _insert_moves(
+        db_session,
+        ledger.tenant_id,
+        ledger.user_id,
+        emptied,
+        ledger.start,
+        [
+            (timedelta(hours=1), None, ledger.a, 10, 5),
+            (timedelta(hours=2), ledger.a, ledger.b, 10, None),
+            (timedelta(days=2), ledger.a, None, 4, None),
+        ],
+    )
+    service = StockValuationService(db_session)
+    as_of = ledger.start + timedelta(days=5)
+    monkeypatch.setattr(get_settings(), "INVENTORY_VALUATION_WORKERS", 1)
+    full = service.valuation_as_of(ledger.tenant_id, as_of, FIFO)
+    assert full["replayed_moves"] == 7
+    assert [
+        (line["value"], line["cogs"])
+        for line in full["lines"]
+        if line["product_id"] == emptied and line["location_id"] == ledger.a
+    ] == [(-20, 20)]
+
+    monkeypatch.setattr(get_settings(), "INVENTORY_VALUATION_WORKERS", 4)
+    checkpoint = service.create_checkpoint(
+        ledger.tenant_id, FIFO, as_of=ledger.start + timedelta(days=1, hours=1)
+    )
+    assert checkpoint.move_count == 4
+    again = service.create_checkpoint(ledger.tenant_id, FIFO, as_of=checkpoint.as_of)
+    assert again.id == checkpoint.id
+
+    report = service.valuation_as_of(ledger.tenant_id, as_of, FIFO)
+    assert report["replayed_moves"] == 3
+    assert report["checkpoint_as_of"] == checkpoint.as_of
+    assert report["lines"] == full["lines"]
+
+    with pytest.raises(APIException):
+        service.create_checkpoint(ledger.tenant_id, FIFO, as_of=datetime.now(UTC))
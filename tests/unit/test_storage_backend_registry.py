@@ -0,0 +1,123 @@
+"""Unit tests for the per-tenant storage backend registry."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.core.files.backend_registry import (
+    StorageBackendRegistry,
+    handle_storage_config_changed,
+    notify_storage_config_changed,
+)
+from app.core.pubsub import topics
+
+
+def test_get_or_create_builds_backend_once_per_tenant():
+    """The factory only runs on a miss; other tenants get their own backend."""
+    registry = StorageBackendRegistry(ttl_seconds=300)
+    tenant_a, tenant_b = uuid4(), uuid4()
+    factory = MagicMock(side_effect=lambda: MagicMock())
+
+    first = registry.get_or_create(tenant_a, factory)
+    second = registry.get_or_create(tenant_a, factory)
+    other = registry.get_or_create(tenant_b, factory)
+
+    assert first is second
+    assert other is not first
+    assert factory.call_count == 2
+    stats = registry.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["tenants"] == 2
+
+
+def test_expired_entry_is_rebuilt():
+    """Entries older than the TTL are rebuilt from configuration."""
+    registry = StorageBackendRegistry(ttl_seconds=0)
+    tenant_id = uuid4()
+    factory = MagicMock(side_effect=lambda: MagicMock())
+
+    registry.get_or_create(tenant_id, factory)
+    registry.get_or_create(tenant_id, factory)
+
+    assert factory.call_count == 2
+
+
+def test_invalidate_drops_tenant_entry():
+    """Invalidating a tenant forces the next lookup to rebuild its backend."""
+    registry = StorageBackendRegistry(ttl_seconds=300)
+    tenant_id = uuid4()
+    factory = MagicMock(side_effect=lambda: MagicMock())
+
+    first = registry.get_or_create(tenant_id, factory)
+    registry.invalidate(tenant_id)
+    second = registry.get_or_create(tenant_id, factory)
+
+    assert first is not second
+    assert factory.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_storage_config_changed_event_invalidates_backend():
+    """The RedisEventBus handler drops the tenant's cached backend."""
+    registry = StorageBackendRegistry(ttl_seconds=300)
+    tenant_id = uuid4()
+    registry.get_or_create(tenant_id, MagicMock)
+
+    with patch(
+        "app.core.files.backend_registry.get_storage_backend_registry",
+        return_value=registry,
+    ):
+        await handle_storage_config_changed(
+            topics.FILE_STORAGE_CONFIG_CHANGED, {"tenant_id": str(tenant_id)}
+        )
+
+    assert registry.get_stats()["tenants"] == 0
+
+
+@pytest.mark.asyncio
+async def test_notify_invalidates_locally_and_publishes():
+    """A config change invalidates this process and is broadcast to others."""
+    registry = StorageBackendRegistry(ttl_seconds=300)
+    tenant_id = uuid4()
+    registry.get_or_create(tenant_id, MagicMock)
+    event_bus = MagicMock()
+    event_bus.publish = AsyncMock()
+
+    with (
+        patch(
+            "app.core.files.backend_registry.get_storage_backend_registry",
+            return_value=registry,
+        ),
+        patch(
+            "app.core.pubsub.get_redis_event_bus",
+            AsyncMock(return_value=event_bus),
+        ),
+    ):
+        notify_storage_config_changed(tenant_id)
+        assert registry.get_stats()["tenants"] == 0
+
+        from app.core.pubsub import invalidation
+
+        for task in list(invalidation._pending_publishes):
+            await task
+
+    event_bus.publish.assert_called_once_with(
+        topics.FILE_STORAGE_CONFIG_CHANGED, {"tenant_id": str(tenant_id)}
+    )
+
+
+def test_notify_without_event_loop_only_invalidates_locally():
+    """Outside an event loop the change is applied locally without publishing."""
+    registry = StorageBackendRegistry(ttl_seconds=300)
+    tenant_id = uuid4()
+    registry.get_or_create(tenant_id, MagicMock)
+
+    with patch(
+        "app.core.files.backend_registry.get_storage_backend_registry",
+        return_value=registry,
+    ):
+        notify_storage_config_changed(tenant_id)
+
+    assert registry.get_stats()["tenants"] == 0
@@ -296,25 +296,53 @@ async def test_test_s3_connection_missing_credentials(self, service):
         assert exc_info.value.code == "MISSING_CREDENTIALS"
 
     def test_get_storage_stats(self, service, mock_db_session):
-        """Test: Obtener estadísticas de almacenamiento."""
+        """Test: Obtener estadísticas de almacenamiento desde los contadores."""
         # Arrange
         tenant_id = uuid4()
 
-        # Mock query results
         mock_query = MagicMock()
         mock_query.filter.return_value = mock_query
-        mock_query.scalar.return_value = 1000  # total_size
-        mock_query.count.return_value = 5  # total_files
+        mock_query.scalar.return_value = 0
+        mock_query.count.return_value = 2  # total_folders
         mock_query.group_by.return_value = mock_query
-        mock_query.all.return_value = [("image/png", 3), ("application/pdf", 2)]
-
+        mock_query.all.return_value = []
         mock_db_session.query.return_value = mock_query
 
+        usage_service = MagicMock()
+        usage_service.get_usage.return_value = {
+            "file_count": 5,
+            "total_size": 1000,
+            "version_count": 7,
+        }
+        usage_service.get_distribution.side_effect = [
+            {"image/png": 3, "application/pdf": 2},
+            {"product": 5},
+        ]
+
         # Act
-        stats = service.get_storage_stats(tenant_id)
+        with patch(
+            "app.core.files.storage_config_service.FileUsageService",
+            return_value=usage_service,
+        ):
+            stats = service.get_storage_stats(tenant_id)
 
         # Assert
-        assert "total_space_used" in stats
-        assert "total_files" in stats
-        assert "total_folders" in stats
-        assert "mime_distribution" in stats
+        assert stats["total_space_used"] == 1000
+        assert stats["total_files"] == 5
+        assert stats["total_versions"] == 7
+        assert stats["total_folders"] == 2
+        assert stats["mime_distribution"] == {"image/png": 3, "application/pdf": 2}
+        assert stats["entity_distribution"] == {"product": 5}
+
+    def test_update_file_limits_invalid_storage_quota(self, service):
+        """Test: Actualizar límites con cuota de almacenamiento inválida."""
+        # Arrange
+        tenant_id = uuid4()
+        limits = {"storage_quota": -1}
+
+        # Act & Assert
+        with pytest.raises(APIException) as exc_info:
+            service.update_file_limits(tenant_id=tenant_id, limits=limits)
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.code == "INVALID_STORAGE_QUOTA"
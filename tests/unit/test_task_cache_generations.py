@@ -0,0 +1,146 @@
+"""Unit tests for generation-counter invalidation of task caches."""
+
+from uuid import uuid4
+
+import pytest
+
+from app.core.cache.generations import CacheGenerations, tenant_scope, user_scope
+from app.core.tasks.cache_invalidation import TaskCacheInvalidationService
+from app.core.tasks.cache_service import TaskCacheService
+
+
+class FakePipeline:
+    """Buffers commands and counts one round trip per execute()."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def incr(self, key):
+        self.commands.append(("incr", key))
+
+    def expire(self, key, ttl):
+        self.commands.append(("expire", key, ttl))
+
+    async def execute(self):
+        self.redis.round_trips += 1
+        results = []
+        for command in self.commands:
+            if command[0] == "incr":
+                results.append(self.redis._incr(command[1]))
+            else:
+                self.redis.ttls[command[1]] = command[2]
+                results.append(True)
+        return results
+
+
+class FakeRedis:
+    """Dict-backed async stand-in for the Redis commands the caches use."""
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+        self.round_trips = 0
+
+    def _incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    async def ping(self):
+        return True
+
+    async def mget(self, keys):
+        self.round_trips += 1
+        return [self.data.get(key) for key in keys]
+
+    async def get(self, key):
+        self.round_trips += 1
+        return self.data.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.round_trips += 1
+        self.data[key] = value
+        self.ttls[key] = ttl
+        return True
+
+    async def keys(self, pattern):
+        raise AssertionError("KEYS must not be used for invalidation")
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+def _service(redis_client) -> TaskCacheService:
+    service = TaskCacheService()
+    service.redis_client = redis_client
+    return service
+
+
+@pytest.mark.asyncio
+async def test_bump_changes_keys_of_dependent_scopes_only():
+    """Bumping a scope changes the keys built from it and nothing else."""
+    redis_client = FakeRedis()
+    generations = CacheGenerations("tasks")
+    tenant_id, alice, bob = uuid4(), uuid4(), uuid4()
+
+    def scopes(user_id):
+        return [tenant_scope(tenant_id), user_scope(tenant_id, user_id)]
+
+    alice_key = await generations.key(redis_client, "a", scopes(alice))
+    bob_key = await generations.key(redis_client, "b", scopes(bob))
+    assert alice_key == "a:g0.0"
+
+    assert await generations.bump(redis_client, [user_scope(tenant_id, alice)]) == 1
+    assert await generations.key(redis_client, "a", scopes(alice)) != alice_key
+    assert await generations.key(redis_client, "b", scopes(bob)) == bob_key
+
+    await generations.bump(redis_client, [tenant_scope(tenant_id)])
+    assert await generations.key(redis_client, "b", scopes(bob)) != bob_key
+    counter = f"tasks:gen:{tenant_scope(tenant_id)}"
+    assert redis_client.ttls[counter] == generations.generation_ttl
+
+
+@pytest.mark.asyncio
+async def test_user_invalidation_drops_cached_agenda():
+    """After invalidating a user, their cached agenda is no longer served."""
+    service = _service(FakeRedis())
+    tenant_id, user_id, other_id = uuid4(), uuid4(), uuid4()
+
+    await service.set_agenda(tenant_id, user_id, {"events": [1]})
+    await service.set_agenda(tenant_id, other_id, {"events": [2]})
+    assert await service.get_agenda(tenant_id, user_id) == {"events": [1]}
+
+    await service.invalidate_user_cache(tenant_id, user_id)
+
+    assert await service.get_agenda(tenant_id, user_id) is None
+    assert await service.get_agenda(tenant_id, other_id) == {"events": [2]}
+
+    await service.invalidate_task_cache(tenant_id)
+    assert await service.get_agenda(tenant_id, other_id) is None
+
+
+@pytest.mark.asyncio
+async def test_bulk_invalidation_is_one_round_trip():
+    """Bulk operations invalidate every user and the tenant in one pipeline."""
+    redis_client = FakeRedis()
+    service = _service(redis_client)
+    invalidation = TaskCacheInvalidationService()
+    invalidation.cache_service = service
+    tenant_id = uuid4()
+    user_ids = [uuid4() for _ in range(50)]
+
+    for user_id in user_ids:
+        await service.set_calendar_sources(tenant_id, user_id, {"sources": []})
+    redis_client.round_trips = 0
+
+    await invalidation.invalidate_on_bulk_operations(tenant_id, user_ids)
+
+    assert redis_client.round_trips == 1
+    for user_id in user_ids:
+        assert await service.get_calendar_sources(tenant_id, user_id) is None
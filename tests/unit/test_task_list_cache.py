@@ -0,0 +1,153 @@
+"""Unit tests for the read-through cache of visible task lists."""
+
+import threading
+import time
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from redis.exceptions import ConnectionError
+
+from app.core.tasks.list_cache import TaskListCache
+from app.schemas.task import TaskResponse
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def incr(self, key):
+        self.commands.append(key)
+
+    def expire(self, key, ttl):
+        pass
+
+    def execute(self):
+        for key in self.commands:
+            self.redis.data[key] = str(int(self.redis.data.get(key, 0)) + 1)
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the sync Redis commands the cache uses."""
+
+    def __init__(self):
+        self.data: dict[str, bytes | str] = {}
+
+    def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+def _task(tenant_id, **kwargs) -> TaskResponse:
+    now = datetime.now(UTC)
+    return TaskResponse(
+        id=uuid4(),
+        tenant_id=tenant_id,
+        title="Review",
+        status="todo",
+        priority="medium",
+        created_by_id=uuid4(),
+        workflow_id=None,
+        workflow_step_id=None,
+        parent_task_id=None,
+        completed_at=None,
+        created_at=now,
+        updated_at=now,
+        **kwargs,
+    )
+
+
+def _page(cache, tenant_id, user_id, loader):
+    return cache.get_page(tenant_id, user_id, None, None, 0, 20, loader)
+
+
+def test_page_is_loaded_once_and_round_trips_dtos():
+    """A cached page is served without the query and equals the loaded DTOs."""
+    cache = TaskListCache(enabled=True, ttl=60, redis_client=FakeRedis())
+    tenant_id, user_id = uuid4(), uuid4()
+    tasks = [_task(tenant_id, metadata={"source": "crm"})]
+    loader = MagicMock(return_value=tasks)
+
+    assert _page(cache, tenant_id, user_id, loader) == tasks
+    assert _page(cache, tenant_id, user_id, loader) == tasks
+    counter = MagicMock(return_value=7)
+    assert cache.get_count(tenant_id, user_id, "todo", None, counter) == 7
+    assert cache.get_count(tenant_id, user_id, "todo", None, counter) == 7
+
+    assert loader.call_count == 1
+    assert counter.call_count == 1
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["hit_ratio"]) == (2, 2, 0.5)
+
+
+def test_invalidation_drops_only_affected_users():
+    """Invalidating a user reloads their lists; other users keep theirs."""
+    cache = TaskListCache(enabled=True, ttl=60, redis_client=FakeRedis())
+    tenant_id, alice, bob = uuid4(), uuid4(), uuid4()
+    loader = MagicMock(return_value=[])
+
+    for user_id in (alice, bob):
+        _page(cache, tenant_id, user_id, loader)
+    assert cache.invalidate(tenant_id, [alice, None]) == 1
+    _page(cache, tenant_id, alice, loader)
+    _page(cache, tenant_id, bob, loader)
+    assert loader.call_count == 3
+
+    cache.invalidate(tenant_id, tenant_wide=True)
+    _page(cache, tenant_id, bob, loader)
+    assert loader.call_count == 4
+
+
+def test_concurrent_misses_share_one_load():
+    """Concurrent misses on the same page run the query once."""
+    cache = TaskListCache(enabled=True, ttl=60, redis_client=FakeRedis())
+    tenant_id, user_id = uuid4(), uuid4()
+    calls = []
+
+    def slow_loader():
+        calls.append(1)
+        time.sleep(0.2)
+        return []
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(_page(cache, tenant_id, user_id, slow_loader))
+        )
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [[]] * 8
+    assert cache.get_stats()["coalesced"] == 7
+
+
+def test_redis_errors_fall_back_to_loader():
+    """When Redis fails, lists are read from the database."""
+    redis_client = FakeRedis()
+    redis_client.mget = MagicMock(side_effect=ConnectionError("down"))
+    cache = TaskListCache(enabled=True, ttl=60, redis_client=redis_client)
+    loader = MagicMock(return_value=[])
+
+    assert _page(cache, uuid4(), uuid4(), loader) == []
+    assert loader.call_count == 1
+    assert cache.get_stats()["errors"] == 1
@@ -0,0 +1,120 @@
+"""Unit tests for the task visibility projection."""
+
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from app.models.task import TaskVisibility
+from app.models.team import Team
+from app.models.user import User
+from app.repositories.task_repository import TaskRepository
+from app.services.team_service import TeamService
+
+
+def _user(db_session, tenant_id) -> User:
+    user = User(
+        email=f"test-{uuid4().hex[:8]}@example.com",
+        password_hash="x",
+        full_name="Test User",
+        tenant_id=tenant_id,
+        is_active=True,
+    )
+    db_session.add(user)
+    db_session.flush()
+    return user
+
+
+def _reasons(db_session, task_id) -> dict:
+    rows = db_session.query(TaskVisibility).filter(TaskVisibility.task_id == task_id)
+    return {row.user_id: row.reason for row in rows}
+
+
+def test_projection_follows_tasks_assignments_and_teams(db_session, test_tenant):
+    """Creator, assignee, assignment and team viewers are kept in sync."""
+    repo = TaskRepository(db_session)
+    creator, assignee, reviewer, member = (
+        _user(db_session, test_tenant.id) for _ in range(4)
+    )
+    team = Team(tenant_id=test_tenant.id, name="Ops")
+    db_session.add(team)
+    db_session.flush()
+    TeamService(db_session).add_team_member(
+        test_tenant.id, team.id, member.id, added_by=creator.id
+    )
+
+    task = repo.create_task(
+        {
+            "tenant_id": test_tenant.id,
+            "title": "Close books",
+            "created_by_id": creator.id,
+            "assigned_to_id": creator.id,
+        }
+    )
+    assert _reasons(db_session, task.id) == {creator.id: "creator"}
+
+    repo.update_task(task.id, test_tenant.id, {"assigned_to_id": assignee.id})
+    assignment = repo.create_assignment(
+        {
+            "tenant_id": test_tenant.id,
+            "task_id": task.id,
+            "assigned_to_id": reviewer.id,
+            "assigned_by_id": creator.id,
+        }
+    )
+    repo.create_assignment(
+        {
+            "tenant_id": test_tenant.id,
+            "task_id": task.id,
+            "assigned_to_group_id": team.id,
+            "assigned_by_id": creator.id,
+        }
+    )
+    assert _reasons(db_session, task.id) == {
+        creator.id: "creator",
+        assignee.id: "assignee",
+        reviewer.id: "assignment",
+        member.id: "team",
+    }
+    assert repo.count_visible_tasks(test_tenant.id, member.id) == 1
+
+    repo.delete_assignment(assignment.id, test_tenant.id)
+    TeamService(db_session).remove_team_member(test_tenant.id, team.id, member.id)
+    assert set(_reasons(db_session, task.id)) == {creator.id, assignee.id}
+
+    repo.update_task(task.id, test_tenant.id, {"status": "done"})
+    assert repo.count_visible_tasks(test_tenant.id, assignee.id, status="done") == 1
+    assert repo.count_visible_tasks(test_tenant.id, assignee.id, status="todo") == 0
+
+    repo.delete_task(task.id, test_tenant.id)
+    assert _reasons(db_session, task.id) == {}
+
+
+def test_keyset_pages_and_rebuild(db_session, test_tenant):
+    """Keyset pages walk tasks newest first; a rebuild restores lost rows."""
+    repo = TaskRepository(db_session)
+    user = _user(db_session, test_tenant.id)
+    start = datetime.now(UTC)
+    tasks = [
+        repo.create_task(
+            {
+                "tenant_id": test_tenant.id,
+                "title": f"Task {n}",
+                "created_by_id": user.id,
+                "created_at": start + timedelta(minutes=n),
+            }
+        )
+        for n in range(5)
+    ]
+
+    first = repo.get_visible_tasks(test_tenant.id, user.id, limit=2)
+    last = first[-1]
+    second = repo.get_visible_tasks(
+        test_tenant.id, user.id, limit=2, after=(last.created_at, last.id)
+    )
+    assert [task.id for task in first + second] == [task.id for task in tasks[:0:-1]]
+
+    db_session.query(TaskVisibility).filter(
+        TaskVisibility.tenant_id == test_tenant.id
+    ).delete()
+    assert repo.count_visible_tasks(test_tenant.id, user.id) == 0
+    assert repo.visibility.rebuild_tenant(test_tenant.id) == 5
+    assert repo.count_visible_tasks(test_tenant.id, user.id) == 5
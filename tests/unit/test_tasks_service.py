@@ -9,6 +9,7 @@
 from app.core.tasks.service import TaskService
 from app.models.task import TaskPriority
 from app.models.task import TaskStatusEnum as TaskStatus
+from tests.helpers import get_outbox_events
 
 
 @pytest.fixture
@@ -26,7 +27,7 @@ def task_service(db_session, mock_event_publisher):
 
 
 @pytest.mark.asyncio
-async def test_create_task(task_service, test_user, test_tenant, mock_event_publisher):
+async def test_create_task(task_service, test_user, test_tenant, db_session):
     """Test creating a task."""
     task = await task_service.create_task(
         title="Test Task",
@@ -44,8 +45,8 @@ async def test_create_task(task_service, test_user, test_tenant, mock_event_publ
     assert task.tenant_id == test_tenant.id
     assert task.created_by_id == test_user.id
 
-    # Verify event was published
-    assert mock_event_publisher.publish.called
+    # Verify event was stored in the outbox
+    assert get_outbox_events(db_session, test_tenant.id, "task.created")
 
 
 @pytest.mark.asyncio
@@ -169,7 +170,7 @@ async def test_update_task_to_done(task_service, test_user, test_tenant):
 
 
 @pytest.mark.asyncio
-async def test_delete_task(task_service, test_user, test_tenant, mock_event_publisher):
+async def test_delete_task(task_service, test_user, test_tenant, db_session):
     """Test deleting a task."""
     # Create a task
     task = await task_service.create_task(
@@ -187,12 +188,8 @@ async def test_delete_task(task_service, test_user, test_tenant, mock_event_publ
     retrieved_task = task_service.get_task(task.id, test_tenant.id)
     assert retrieved_task is None
 
-    # Verify event was published
-    publish_calls = [call for call in mock_event_publisher.publish.call_args_list]
-    delete_calls = [
-        call for call in publish_calls if call[1].get("event_type") == "task.deleted"
-    ]
-    assert len(delete_calls) > 0
+    # Verify event was stored in the outbox
+    assert get_outbox_events(db_session, test_tenant.id, "task.deleted")
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,74 @@
+"""Unit tests for the shared template compilation cache."""
+
+from uuid import uuid4
+
+import pytest
+from jinja2.exceptions import SecurityError
+
+from app.core.templates.compiler import (
+    DOCUMENT,
+    NOTIFICATION,
+    TemplateCompilationCache,
+)
+
+
+def test_same_version_is_compiled_once():
+    """A template is compiled once per version and recompiled when it changes."""
+    cache = TemplateCompilationCache(maxsize=10)
+    template_id = uuid4()
+
+    first = cache.get("Hello {{ name }}", template_id)
+    assert cache.get("Hello {{ name }}", template_id) is first
+    updated = cache.get("Hi {{ name }}", template_id)
+
+    assert updated is not first
+    assert updated.render(name="Ann") == "Hi Ann"
+    assert cache.get_stats()["hits"] == 1
+    assert cache.get_stats()["misses"] == 2
+
+
+def test_least_recently_used_is_evicted():
+    """The cache keeps at most maxsize templates, dropping the least recent."""
+    cache = TemplateCompilationCache(maxsize=2)
+    a = cache.get("a")
+    cache.get("b")
+    cache.get("a")
+    cache.get("c")
+
+    assert cache.get_stats()["size"] == 2
+    assert cache.get("a") is a
+    assert cache.get_stats()["misses"] == 3
+
+
+def test_invalidate_drops_every_version_of_a_template():
+    """Invalidating a template id drops its versions and nothing else."""
+    cache = TemplateCompilationCache(maxsize=10)
+    template_id = uuid4()
+    cache.get("v1", template_id)
+    cache.get("v2", template_id, NOTIFICATION)
+    cache.get("other", uuid4())
+
+    cache.invalidate(template_id)
+
+    assert cache.get_stats()["size"] == 1
+
+
+def test_flavors_escape_and_keep_placeholders():
+    """Documents are HTML-escaped; notifications keep unknown placeholders."""
+    cache = TemplateCompilationCache(maxsize=10)
+    source = "{{ name }} {{ missing }}"
+
+    assert cache.get(source, flavor=DOCUMENT).render(name="<b>") == "&lt;b&gt; "
+    assert (
+        cache.get(source, flavor=NOTIFICATION).render(name="<b>") == "<b> {{missing}}"
+    )
+
+
+def test_templates_run_sandboxed():
+    """Templates cannot reach Python internals or mutate their data."""
+    cache = TemplateCompilationCache(maxsize=10)
+
+    with pytest.raises(SecurityError):
+        cache.get("{{ ''.__class__.__mro__[1].__subclasses__() }}").render()
+    with pytest.raises(SecurityError):
+        cache.get("{{ items.append(1) }}").render(items=[])
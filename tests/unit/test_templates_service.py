@@ -6,6 +6,7 @@
 
 from app.core.pubsub import EventPublisher
 from app.core.templates.service import TemplateRenderer, TemplateService
+from tests.helpers import get_outbox_events
 
 
 @pytest.fixture
@@ -38,9 +39,7 @@ def test_render_template(template_renderer):
     assert rendered == "Hello World!"
 
 
-def test_create_template(
-    template_service, test_user, test_tenant, mock_event_publisher
-):
+def test_create_template(template_service, test_user, test_tenant, db_session):
     """Test creating a template."""
     template = template_service.create_template(
         template_data={
@@ -58,8 +57,8 @@ def test_create_template(
     assert template.content == "Hello {{ name }}!"
     assert template.tenant_id == test_tenant.id
 
-    # Verify event was published
-    assert mock_event_publisher.publish.called
+    # Verify event was stored in the outbox
+    assert get_outbox_events(db_session, test_tenant.id, "template.created")
 
     # Verify initial version was created
     versions = template_service.get_template_versions(template.id, test_tenant.id)
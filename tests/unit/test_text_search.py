@@ -0,0 +1,112 @@
+"""Unit tests for indexed text search over activities, comments and audit logs."""
+
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import insert
+
+from app.models.activity import Activity
+from app.repositories.activity_repository import ActivityRepository
+from app.repositories.audit_repository import AuditRepository
+from app.repositories.comment_repository import CommentRepository
+
+
+def test_activity_search_ranks_word_matches_and_pages_by_keyset(
+    db_session, test_tenant
+):
+    """Word matches rank above substring-only matches; keyset pages agree."""
+    now = datetime.now(UTC)
+    entity_id = uuid4()
+    titles = [
+        "Quarterly review meeting",
+        "Review review: follow up on the review",
+        "Call about previews",  # substring of "review" only
+        "Unrelated call",
+        "Design review",
+    ]
+    db_session.execute(
+        insert(Activity),
+        [
+            {
+                "id": uuid4(),
+                "tenant_id": test_tenant.id,
+                "entity_type": "product",
+                "entity_id": entity_id,
+                "activity_type": "note",
+                "title": title,
+                "created_at": now - timedelta(minutes=i),
+                "updated_at": now,
+            }
+            for i, title in enumerate(titles)
+        ],
+    )
+    db_session.commit()
+    repo = ActivityRepository(db_session)
+
+    ranked = repo.search_ranked(test_tenant.id, "review")
+    assert [activity.title for activity, _ in ranked][0] == titles[1]
+    assert [activity.title for activity, _ in ranked][-1] == "Call about previews"
+    assert ranked[-1][1] == 0
+    assert repo.count_search(test_tenant.id, "review") == 4
+    assert repo.search(test_tenant.id, "review") == [a for a, _ in ranked]
+
+    paged = []
+    after = None
+    while True:
+        page = repo.search_ranked(test_tenant.id, "review", limit=2, after=after)
+        paged.extend(page)
+        if len(page) < 2:
+            break
+        last, rank = page[-1]
+        after = (rank, last.created_at, last.id)
+    assert [a.id for a, _ in paged] == [a.id for a, _ in ranked]
+
+
+def test_comment_search_filters_entity_and_deleted(db_session, test_tenant):
+    """Comment search stays within the entity and skips deleted comments."""
+    entity_id = uuid4()
+    repo = CommentRepository(db_session)
+    for content, target, deleted in (
+        ("Shipping label printed", entity_id, False),
+        ("Shipping delayed again", entity_id, True),
+        ("Shipping on another order", uuid4(), False),
+    ):
+        repo.create_comment(
+            {
+                "tenant_id": test_tenant.id,
+                "entity_type": "order",
+                "entity_id": target,
+                "content": content,
+                "is_deleted": deleted,
+            }
+        )
+
+    results = repo.search_comments(
+        test_tenant.id, "shipping", entity_type="order", entity_id=entity_id
+    )
+
+    assert [comment.content for comment, _ in results] == ["Shipping label printed"]
+    assert repo.count_search_comments(test_tenant.id, "shipping") == 2
+
+
+def test_audit_details_search_matches_words_and_substrings(db_session, test_tenant):
+    """details_search matches string values by word and the JSON text by substring."""
+    repo = AuditRepository(db_session)
+    for details in (
+        {"email": "ana@example.com", "note": "Password reset requested"},
+        {"role_name": "auditor"},
+        None,
+    ):
+        repo.create_audit_log(
+            user_id=None, tenant_id=test_tenant.id, action="update", details=details
+        )
+
+    by_word, total = repo.get_audit_logs(test_tenant.id, details_search="password")
+    assert total == 1
+    assert by_word[0].details["note"] == "Password reset requested"
+
+    # Keys and partial words only match the JSON text
+    _, total = repo.get_audit_logs(test_tenant.id, details_search="role_na")
+    assert total == 1
+    _, total = repo.get_audit_logs(test_tenant.id, details_search="example.c")
+    assert total == 1